@@ -1,3 +1,4 @@
+import argparse
 import csv
 import os
 import re
@@ -22,6 +23,18 @@ time.tzset()
 
 output_folder = os.path.join("woningwaardering", "vera", "referentiedata")
 
+parser = argparse.ArgumentParser(description="Genereer de VERA referentiedata")
+parser.add_argument(
+    "--valideren",
+    action="store_true",
+    help=(
+        "Valideer de referentiedata bij het importeren. Standaard worden de waarden "
+        "met model_construct aangemaakt, zonder validatie en zonder dat pydantic "
+        "voor elke referentiedatasoort een schema hoeft op te bouwen."
+    ),
+)
+args = parser.parse_args()
+
 
 # url = "https://vera-service.azurewebsites.net/api/referentiedata?Version=latest"
 # response = requests.get(url)
@@ -237,7 +250,7 @@ class {{ soort|remove_accents|title }}Referentiedata(Referentiedata):
 
 class {{ soort|remove_accents|title }}(Referentiedatasoort):
 {%- for item in items %}
-    {{ item|normalize_variable_name }} = {{ soort|remove_accents|title }}Referentiedata(
+    {{ item|normalize_variable_name }} = {{ soort|remove_accents|title }}Referentiedata{% if not valideren %}.model_construct{% endif %}(
         code="{{ item['code'] | safe }}",
         naam="{{ item['naam'] | safe }}",
         {%- if item['parent'] | safe %}
@@ -255,26 +268,55 @@ class {{ soort|remove_accents|title }}(Referentiedatasoort):
 
 # Render the soort_folder/<soort>.py template with the grouped data and save to separate files
 for soort, items in grouped_data:
-    rendered_code = soort_template.render(soort=soort, items=items)
+    rendered_code = soort_template.render(
+        soort=soort, items=items, valideren=args.valideren
+    )
     with open(os.path.join(output_folder, f"{soort.lower()}.py"), "w") as file:
         file.write(rendered_code)
 
 # Define the Jinja2 template for soort/__init__.py
 soort_folder_init_template = environment.from_string(
-    """
-{%- for soort in grouped_data -%}
-from .{{ soort[0]|remove_accents|lower }} import (
-    {{ soort[0]|remove_accents|title }},
-    {{ soort[0]|remove_accents|title }}Referentiedata
-)
-{% endfor %}
+    """from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+{%- for soort in grouped_data %}
+    from .{{ soort[0]|remove_accents|lower }} import (
+        {{ soort[0]|remove_accents|title }},
+        {{ soort[0]|remove_accents|title }}Referentiedata,
+    )
+{%- endfor %}
+
+_MODULES = {
+{%- for soort in grouped_data %}
+    "{{ soort[0]|remove_accents|title }}": "{{ soort[0]|remove_accents|lower }}",
+    "{{ soort[0]|remove_accents|title }}Referentiedata": "{{ soort[0]|remove_accents|lower }}",
+{%- endfor %}
+}
+\"\"\"De module waarin elke referentiedatasoort wordt gedefinieerd.\"\"\"
+
+
+# De referentiedatasoorten worden pas bij het eerste gebruik geïmporteerd, zodat
+# `import woningwaardering` alleen de soorten laadt die de waardering gebruikt.
+def __getattr__(name: str) -> Any:
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_MODULES})
+
+
 __all__ = [
 {%- for soort in grouped_data %}
     "{{ soort[0]|remove_accents|title }}",
     "{{ soort[0]|remove_accents|title }}Referentiedata",
 {%- endfor %}
 ]
-
 """
 )
 
@@ -63,6 +63,40 @@ class MergeClassesVisitor(cst.CSTTransformer):
         return updated_node.with_changes(body=new_body)
 
 
+class DeferBuildTransformer(cst.CSTTransformer):
+    """
+    Voegt `defer_build=True` toe aan elke `ConfigDict`, zodat pydantic het schema
+    van een model pas opbouwt bij het eerste gebruik in plaats van bij de import.
+    """
+
+    def leave_Call(self, original_node: cst.Call, updated_node: cst.Call) -> cst.Call:
+        if not (
+            isinstance(updated_node.func, cst.Name)
+            and updated_node.func.value == "ConfigDict"
+        ):
+            return updated_node
+
+        if any(
+            arg.keyword is not None and arg.keyword.value == "defer_build"
+            for arg in updated_node.args
+        ):
+            return updated_node
+
+        return updated_node.with_changes(
+            args=[
+                *updated_node.args,
+                cst.Arg(
+                    keyword=cst.Name("defer_build"),
+                    value=cst.Name("True"),
+                    equal=cst.AssignEqual(
+                        whitespace_before=cst.SimpleWhitespace(""),
+                        whitespace_after=cst.SimpleWhitespace(""),
+                    ),
+                ),
+            ]
+        )
+
+
 uitbreidingen_folder = os.path.join(
     "woningwaardering", "vera", "bvg", "model_uitbreidingen"
 )
@@ -93,6 +127,7 @@ with open(generated_file_path, "r") as generated_file:
     generated_module = cst.parse_module(generated_source)
     merge_classes_visitor = MergeClassesVisitor(classes=uitbreidingen_visitor.classes)
     updated_module = generated_module.visit(merge_classes_visitor)
+    updated_module = updated_module.visit(DeferBuildTransformer())
 
     class_diff = diff_code(generated_source, updated_module.code, 3)
 
@@ -104,6 +104,24 @@ def woningwaardering_resultaat():
     return WoningwaarderingResultatenWoningwaarderingResultaat()
 
 
+def pytest_addoption(parser: pytest.Parser):
+    parser.addoption(
+        "--benchmark",
+        action="store_true",
+        help="Draai ook de tests die doorlooptijden meten en vergelijken.",
+    )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]):
+    # Doorlooptijden zijn afhankelijk van de machine, dus alleen op verzoek
+    if config.getoption("--benchmark"):
+        return
+    overslaan = pytest.mark.skip(reason="benchmark, draai met --benchmark")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(overslaan)
+
+
 def pytest_runtest_makereport(item: pytest.Item, call: pytest.CallInfo):
     # Controleer of de test een exception heeft gegeven
     if call.excinfo is not None:
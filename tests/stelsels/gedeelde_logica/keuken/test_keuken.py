@@ -0,0 +1,75 @@
+from datetime import date
+
+import pytest
+
+from woningwaardering.stelsels.criterium_id import CriteriumId
+from woningwaardering.stelsels.gedeelde_logica import waardeer_keuken
+from woningwaardering.vera.bvg.generated import (
+    BouwkundigElementenBouwkundigElement,
+    EenhedenRuimte,
+)
+from woningwaardering.vera.referentiedata import (
+    Bouwkundigelementdetailsoort,
+    Ruimtedetailsoort,
+    Ruimtesoort,
+    Voorzieningsoort,
+    Woningwaarderingstelsel,
+    Woningwaarderingstelselgroep,
+)
+
+# Samen 7.75 punten aan extra voorzieningen
+EXTRA_VOORZIENINGEN = [
+    Voorzieningsoort.inbouw_kookplaat_inductie,
+    Voorzieningsoort.inbouw_vaatwasmachine,
+    Voorzieningsoort.inbouw_koelkast,
+    Voorzieningsoort.inbouw_oven_elektrisch,
+    Voorzieningsoort.inbouw_magnetron,
+    Voorzieningsoort.inbouw_afzuiginstallatie,
+    Voorzieningsoort.inbouw_vrieskast,
+]
+
+
+@pytest.mark.parametrize(
+    "aanrechtlengte, aftrek",
+    [
+        (1999, -3.75),  # maximaal 4 punten
+        (2000, -0.75),  # maximaal 7 punten
+    ],
+)
+def test_waardeer_keuken_max_punten_extra_voorzieningen(aanrechtlengte, aftrek):
+    ruimte = EenhedenRuimte(
+        id="Space_1",
+        naam="Keuken",
+        soort=Ruimtesoort.vertrek,
+        detail_soort=Ruimtedetailsoort.keuken,
+        oppervlakte=10.0,
+        installaties=EXTRA_VOORZIENINGEN,
+        bouwkundige_elementen=[
+            BouwkundigElementenBouwkundigElement(
+                id="Aanrecht_1",
+                detail_soort=Bouwkundigelementdetailsoort.aanrecht,
+                lengte=aanrechtlengte,
+            )
+        ],
+    )
+
+    punten = {
+        waardering.criterium.id: waardering.punten
+        for waardering in waardeer_keuken(
+            ruimte, Woningwaarderingstelsel.zelfstandige_woonruimten, date(2025, 1, 1)
+        )
+    }
+
+    maximering = str(
+        CriteriumId(
+            stelselgroep=Woningwaarderingstelselgroep.keuken,
+            ruimte_id=ruimte.id,
+            criterium="maximering_extra_voorzieningen",
+        )
+    )
+    assert punten[maximering] == aftrek
+    assert sum(
+        waarde
+        for criterium, waarde in punten.items()
+        if "extra_voorziening" in criterium
+    ) == pytest.approx(7.75 + aftrek)
@@ -0,0 +1,93 @@
+from datetime import date
+
+import pytest
+
+from woningwaardering.stelsels.criterium_id import CriteriumId
+from woningwaardering.stelsels.gedeelde_logica import waardeer_sanitair
+from woningwaardering.vera.bvg.generated import EenhedenRuimte
+from woningwaardering.vera.referentiedata import (
+    Ruimtedetailsoort,
+    Ruimtesoort,
+    Voorzieningsoort,
+    Woningwaarderingstelsel,
+    Woningwaarderingstelselgroep,
+)
+
+
+def _badkamer(*installaties):
+    return EenhedenRuimte(
+        id="Space_1",
+        naam="Badkamer",
+        soort=Ruimtesoort.vertrek,
+        detail_soort=Ruimtedetailsoort.badkamer,
+        oppervlakte=6.0,
+        installaties=[
+            Voorzieningsoort.wastafel,
+            Voorzieningsoort.douche,
+            *installaties,
+        ],
+    )
+
+
+def _punten(
+    ruimte,
+    stelsel=Woningwaarderingstelsel.zelfstandige_woonruimten,
+    peildatum=date(2025, 1, 1),
+):
+    # De punten per criterium, zonder het voorvoegsel van stelselgroep en ruimte
+    voorvoegsel = str(
+        CriteriumId(
+            stelselgroep=Woningwaarderingstelselgroep.sanitair, ruimte_id=ruimte.id
+        )
+    )
+    return {
+        waardering.criterium.id.removeprefix(f"{voorvoegsel}__"): waardering.punten
+        for waardering in waardeer_sanitair(
+            ruimte, Woningwaarderingstelselgroep.sanitair, stelsel, peildatum
+        )
+    }
+
+
+def test_waardeer_sanitair_max_punten_kastruimte():
+    punten = _punten(
+        _badkamer(Voorzieningsoort.kastruimte, Voorzieningsoort.kastruimte)
+    )
+
+    assert punten["kastruimte"] == 1.5
+    assert punten["max_punten_kastruimte"] == -0.75
+
+
+def test_waardeer_sanitair_max_twee_stopcontacten_per_wastafel():
+    punten = _punten(_badkamer(*[Voorzieningsoort.stopcontact_bij_wastafel] * 3))
+
+    assert punten["stopcontact_bij_wastafel"] == 0.75
+    assert punten["max_stopcontact_bij_wastafel"] == -0.25
+
+
+def test_waardeer_sanitair_twee_stopcontacten_per_wastafel():
+    punten = _punten(_badkamer(*[Voorzieningsoort.stopcontact_bij_wastafel] * 2))
+
+    assert punten["stopcontact_bij_wastafel"] == 0.5
+    assert "max_stopcontact_bij_wastafel" not in punten
+
+
+@pytest.mark.parametrize(
+    "stelsel, punten_douche",
+    [
+        (Woningwaarderingstelsel.zelfstandige_woonruimten, 4.0),
+        (Woningwaarderingstelsel.onzelfstandige_woonruimten, 3.0),
+        (Woningwaarderingstelsel.standplaatsen, 3.0),
+        (Woningwaarderingstelsel.woonwagens, 3.0),
+    ],
+    ids=lambda waarde: getattr(waarde, "code", waarde),
+)
+def test_waardeer_sanitair_punten_per_stelsel(stelsel, punten_douche):
+    punten = _punten(_badkamer(), stelsel)
+
+    assert punten["wastafel"] == 1.0
+    assert punten["douche"] == punten_douche
+
+
+def test_waardeer_sanitair_voor_eerste_beleidsboek():
+    with pytest.raises(ValueError, match="peildatum 2024-06-30"):
+        _punten(_badkamer(), peildatum=date(2024, 6, 30))
@@ -0,0 +1,278 @@
+import json
+import warnings
+from collections import Counter
+from copy import deepcopy
+from datetime import date
+
+import pytest
+
+from tests.conftest import DATA_DIR
+from woningwaardering import Woningwaardering
+from woningwaardering.stelsels import ruimte_index as ruimte_index_module
+from woningwaardering.stelsels.gedeelde_logica import waardeer_sanitair
+from woningwaardering.stelsels.ruimte_index import (
+    RuimteIndex,
+    get_ruimte_index,
+    ruimte_gegevens,
+    ruimte_index,
+)
+from woningwaardering.stelsels.utils import (
+    classificeer_ruimte,
+    gedeeld_met_eenheden,
+    gedeeld_met_onzelfstandige_woonruimten,
+)
+from woningwaardering.vera.bvg.generated import (
+    BouwkundigElementenBouwkundigElement,
+    EenhedenEenheid,
+    EenhedenRuimte,
+)
+from woningwaardering.vera.referentiedata import (
+    Bouwkundigelementdetailsoort,
+    Ruimtedetailsoort,
+    Ruimtesoort,
+    Voorzieningsoort,
+    Woningwaarderingstelsel,
+    Woningwaarderingstelselgroep,
+)
+from woningwaardering.vera.utils import (
+    aantal_bouwkundige_elementen,
+    heeft_bouwkundig_element,
+)
+
+INPUT_BESTANDEN = sorted(DATA_DIR.glob("*/input/*.json"))
+
+
+@pytest.mark.parametrize(
+    "pad", INPUT_BESTANDEN, ids=[pad.name for pad in INPUT_BESTANDEN]
+)
+def test_ruimte_index(pad):
+    eenheid = EenhedenEenheid.model_validate_json(pad.read_text())
+    index = RuimteIndex(eenheid)
+
+    for ruimte in eenheid.ruimten or []:
+        gegevens = index.gegevens(ruimte)
+
+        assert gegevens.ruimte is ruimte
+        assert gegevens.classificatie == classificeer_ruimte(ruimte)
+        assert gegevens.gedeeld_met_eenheden == gedeeld_met_eenheden(ruimte)
+        assert gegevens.gedeeld_met_onzelfstandige_woonruimten == (
+            gedeeld_met_onzelfstandige_woonruimten(ruimte)
+        )
+        assert list(gegevens.kasten) == [
+            verbonden_ruimte
+            for verbonden_ruimte in ruimte.verbonden_ruimten or []
+            if verbonden_ruimte.detail_soort == Ruimtedetailsoort.kast
+        ]
+        assert list(index.verbonden_ruimten(ruimte)) == list(
+            ruimte.verbonden_ruimten or []
+        )
+        for verbonden_ruimte in index.verbonden_ruimten(ruimte):
+            assert any(verbonden_ruimte is r for r in eenheid.ruimten)
+        assert gegevens.installaties == Counter(ruimte.installaties or [])
+        for element in ruimte.bouwkundige_elementen or []:
+            assert gegevens.bouwkundige_elementen[element.detail_soort] > 0
+
+    for ruimtesoort in [*Ruimtesoort, None]:
+        assert list(index.ruimten(ruimtesoort)) == [
+            ruimte
+            for ruimte in eenheid.ruimten or []
+            if classificeer_ruimte(ruimte) == ruimtesoort
+        ]
+
+
+def test_ruimte_index_per_waardering(monkeypatch):
+    eenheid = EenhedenEenheid.model_validate_json(INPUT_BESTANDEN[0].read_text())
+    woningwaardering = Woningwaardering(peildatum=date(2025, 1, 1))
+    verwacht = woningwaardering.waardeer(deepcopy(eenheid)).model_dump_json()
+
+    geclassificeerd: Counter[int] = Counter()
+
+    def tel_classificatie(ruimte):
+        geclassificeerd[id(ruimte)] += 1
+        return classificeer_ruimte(ruimte)
+
+    monkeypatch.setattr(ruimte_index_module, "classificeer_ruimte", tel_classificatie)
+
+    resultaat = woningwaardering.waardeer(eenheid)
+
+    assert resultaat.model_dump_json() == verwacht
+    assert geclassificeerd
+    assert max(geclassificeerd.values()) == 1
+    assert get_ruimte_index() is None
+
+
+def test_ruimte_index_classificatie_na_optellen_kasten():
+    # Een kleine slaapkamer wordt pas een vertrek als de oppervlakte van de
+    # verbonden kast erbij is opgeteld
+    data = json.loads(
+        (DATA_DIR / "zelfstandige_woonruimten/input/12006000004.json").read_text()
+    )
+    kast = {
+        "id": "Space_kast",
+        "naam": "Kast",
+        "soort": {"code": "OVR", "naam": "Overige ruimten"},
+        "detailSoort": {"code": "KAS", "naam": "Kast"},
+        "oppervlakte": 1.0,
+    }
+    data["ruimten"].append(kast)
+    data["ruimten"].append(
+        {
+            "id": "Space_extra",
+            "naam": "Slaapkamer",
+            "soort": {"code": "VTK", "naam": "Vertrek"},
+            "detailSoort": {"code": "SLA", "naam": "Slaapkamer"},
+            "oppervlakte": 3.5,
+            "verwarmd": True,
+            "verbondenRuimten": [kast],
+        }
+    )
+    eenheid = EenhedenEenheid.model_validate(data)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        resultaat = Woningwaardering(peildatum=date(2025, 1, 1)).waardeer(eenheid)
+
+    verkoeling_en_verwarming = next(
+        groep
+        for groep in resultaat.groepen or []
+        if groep.criterium_groep
+        and groep.criterium_groep.stelselgroep
+        == Woningwaarderingstelselgroep.verkoeling_en_verwarming
+    )
+    assert verkoeling_en_verwarming.punten == 13.0
+    assert resultaat.punten == 175.0
+
+
+def test_ruimte_index_context():
+    eenheid = EenhedenEenheid.model_validate_json(INPUT_BESTANDEN[0].read_text())
+    ruimte = eenheid.ruimten[0]
+    andere_ruimte = EenhedenRuimte(id="andere_ruimte")
+
+    with ruimte_index(eenheid) as index:
+        assert get_ruimte_index() is index
+        assert RuimteIndex.voor(eenheid) is index
+        assert ruimte_gegevens(ruimte) is index.gegevens(ruimte)
+        assert ruimte_gegevens(andere_ruimte).ruimte is andere_ruimte
+        assert RuimteIndex.voor(deepcopy(eenheid)) is not index
+
+    assert get_ruimte_index() is None
+    assert ruimte_gegevens(ruimte).ruimte is ruimte
+
+
+@pytest.mark.parametrize(
+    "pad",
+    [pad for pad in INPUT_BESTANDEN if "verbondenRuimten" in pad.read_text()],
+    ids=lambda pad: pad.name,
+)
+def test_verbonden_ruimten_alleen_ids(pad):
+    data = json.loads(pad.read_text())
+    for ruimte in data["ruimten"]:
+        if "verbondenRuimten" in ruimte:
+            ruimte["verbondenRuimten"] = [
+                {"id": verbonden_ruimte["id"]}
+                for verbonden_ruimte in ruimte["verbondenRuimten"]
+            ]
+
+    woningwaardering = Woningwaardering(peildatum=date(2025, 1, 1))
+    volledig = woningwaardering.waardeer(
+        EenhedenEenheid.model_validate_json(pad.read_text())
+    )
+    compact = woningwaardering.waardeer(EenhedenEenheid.model_validate(data))
+
+    assert compact.model_dump_json() == volledig.model_dump_json()
+
+
+def test_verbonden_ruimten_dubbel_id():
+    kast = EenhedenRuimte(
+        id="Space_2", detail_soort=Ruimtedetailsoort.kast, oppervlakte=1.0
+    )
+    slaapkamer = EenhedenRuimte(
+        id="Space_1",
+        detail_soort=Ruimtedetailsoort.slaapkamer,
+        verbonden_ruimten=[EenhedenRuimte(id="Space_2"), EenhedenRuimte(id="Space_3")],
+    )
+    eenheid = EenhedenEenheid(
+        ruimten=[
+            slaapkamer,
+            kast,
+            EenhedenRuimte(id="Space_3", detail_soort=Ruimtedetailsoort.kast),
+            EenhedenRuimte(id="Space_3", detail_soort=Ruimtedetailsoort.berging),
+        ]
+    )
+    index = RuimteIndex(eenheid)
+
+    assert index.verbonden_ruimten(slaapkamer, Ruimtedetailsoort.kast) == (kast,)
+    assert index.gegevens(slaapkamer).kasten == (kast,)
+    # een id dat meerdere keren voorkomt wordt niet herleid
+    (_, dubbel) = index.verbonden_ruimten(slaapkamer)
+    assert dubbel is slaapkamer.verbonden_ruimten[1]
+    assert index.verbonden_ruimten(slaapkamer, Ruimtedetailsoort.berging) == ()
+
+
+@pytest.mark.parametrize(
+    "pad",
+    sorted(DATA_DIR.glob("**/input/*.json")),
+    ids=lambda pad: f"{pad.parent.parent.name}/{pad.name}",
+)
+def test_ruimte_gegevens_aantallen(pad):
+    eenheid = EenhedenEenheid.model_validate_json(pad.read_text())
+    index = RuimteIndex(eenheid)
+    detailsoorten = list(Bouwkundigelementdetailsoort)
+
+    for ruimte in eenheid.ruimten or []:
+        gegevens = index.gegevens(ruimte)
+        for detailsoort in detailsoorten:
+            assert gegevens.heeft_bouwkundig_element(
+                detailsoort
+            ) == heeft_bouwkundig_element(ruimte, detailsoort)
+            assert gegevens.aantal_bouwkundige_elementen(
+                detailsoort
+            ) == aantal_bouwkundige_elementen(ruimte, detailsoort)
+
+        for element in ruimte.bouwkundige_elementen or []:
+            if element.detail_soort is None:
+                continue
+            for detailsoort in detailsoorten[:5]:
+                combinatie = (element.detail_soort, detailsoort)
+                assert gegevens.heeft_bouwkundig_element(
+                    *combinatie
+                ) == heeft_bouwkundig_element(ruimte, *combinatie)
+                assert gegevens.aantal_bouwkundige_elementen(
+                    *combinatie
+                ) == aantal_bouwkundige_elementen(ruimte, *combinatie)
+
+        for voorzieningsoort in Voorzieningsoort:
+            assert gegevens.aantal_installaties(voorzieningsoort) == (
+                ruimte.installaties or []
+            ).count(voorzieningsoort)
+
+
+def test_sanitair_past_ruimte_gegevens_niet_aan():
+    ruimte = EenhedenRuimte(
+        id="Space_1",
+        naam="Badkamer",
+        soort=Ruimtesoort.vertrek,
+        detail_soort=Ruimtedetailsoort.badkamer,
+        oppervlakte=6.0,
+        installaties=[Voorzieningsoort.douche, Voorzieningsoort.wastafel],
+        bouwkundige_elementen=[
+            BouwkundigElementenBouwkundigElement(
+                detail_soort=Bouwkundigelementdetailsoort.wastafel
+            )
+        ],
+    )
+    eenheid = EenhedenEenheid(ruimten=[ruimte])
+
+    with ruimte_index(eenheid) as index, warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        list(
+            waardeer_sanitair(
+                ruimte,
+                Woningwaarderingstelselgroep.sanitair,
+                Woningwaarderingstelsel.zelfstandige_woonruimten,
+                date(2025, 1, 1),
+            )
+        )
+        installaties = index.gegevens(ruimte).installaties
+
+    assert installaties == Counter([Voorzieningsoort.douche, Voorzieningsoort.wastafel])
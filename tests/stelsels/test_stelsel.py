@@ -0,0 +1,237 @@
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from decimal import DefaultContext, getcontext
+from threading import Thread
+
+import pytest
+
+from tests.conftest import DATA_DIR
+from woningwaardering import Woningwaardering
+from woningwaardering.stelsels import Stelsel, ZelfstandigeWoonruimten
+from woningwaardering.stelsels.onzelfstandige_woonruimten.onzelfstandige_woonruimten import (
+    OnzelfstandigeWoonruimten,
+)
+from woningwaardering.stelsels.stelselgroep import Stelselgroep
+from woningwaardering.stelsels.utils import REKENCONTEXT, naar_tabel
+from woningwaardering.vera.bvg.generated import (
+    EenhedenEenheid,
+    EenhedenEenheidadres,
+    EenhedenWoonplaats,
+    WoningwaarderingResultatenWoningwaarderingGroep,
+)
+from woningwaardering.vera.referentiedata import (
+    Eenheidmonument,
+    Woningwaarderingstelsel,
+)
+from woningwaardering.verrijking import (
+    MonumentenCache,
+    MonumentenResolver,
+    Verrijking,
+    WoonplaatsResolver,
+)
+
+INPUT_BESTANDEN = sorted(DATA_DIR.glob("*/input/*.json"))
+
+
+@pytest.mark.parametrize("pad", INPUT_BESTANDEN, ids=lambda pad: pad.stem)
+def test_waardeer_zonder_woningwaarderingen(pad):
+    eenheid = EenhedenEenheid.model_validate_json(pad.read_text())
+    woningwaardering = Woningwaardering(peildatum=date(2025, 1, 1))
+
+    volledig = woningwaardering.waardeer(eenheid)
+    samenvatting = woningwaardering.waardeer(eenheid, met_woningwaarderingen=False)
+
+    assert samenvatting.punten == volledig.punten
+    assert samenvatting.opslagpercentage == volledig.opslagpercentage
+    assert samenvatting.maximale_huur == volledig.maximale_huur
+    assert samenvatting.huurprijsopslag == volledig.huurprijsopslag
+    assert (
+        samenvatting.maximale_huur_inclusief_opslag
+        == volledig.maximale_huur_inclusief_opslag
+    )
+
+    assert len(samenvatting.groepen) == len(volledig.groepen)
+    for groep, volledige_groep in zip(samenvatting.groepen, volledig.groepen):
+        assert groep.criterium_groep == volledige_groep.criterium_groep
+        assert groep.punten == volledige_groep.punten
+        assert groep.opslagpercentage == volledige_groep.opslagpercentage
+        assert groep.woningwaarderingen is None
+
+
+@pytest.mark.parametrize("pad", INPUT_BESTANDEN, ids=lambda pad: pad.stem)
+def test_waardeer_wijzigt_eenheid_niet(pad):
+    eenheid = EenhedenEenheid.model_validate_json(pad.read_text())
+    woningwaardering = Woningwaardering(peildatum=date(2025, 1, 1))
+
+    invoer = eenheid.model_dump_json()
+    eerste = woningwaardering.waardeer(eenheid).model_dump_json()
+    tweede = woningwaardering.waardeer(eenheid).model_dump_json()
+
+    assert eerste == tweede
+    assert eenheid.model_dump_json() == invoer
+
+
+def test_waardeer_verrijkt_werkkopie():
+    class VasteMonumentenResolver(MonumentenResolver):
+        def zoek_monumenten(self, bag_identificaties):
+            return {
+                bag_identificatie: [Eenheidmonument.rijksmonument]
+                for bag_identificatie in bag_identificaties
+            }
+
+    class VasteWoonplaatsResolver(WoonplaatsResolver):
+        def zoek_woonplaats(
+            self, postcode, huisnummer, huisletter="", huisnummertoevoeging=""
+        ):
+            return EenhedenWoonplaats(code="3086", naam="ROTTERDAM")
+
+    pad = next(DATA_DIR.glob("onzelfstandige_woonruimten/input/*.json"))
+    eenheid = EenhedenEenheid.model_validate_json(pad.read_text())
+    eenheid.monumenten = None
+    eenheid.adresseerbaar_object_basisregistratie.bag_identificatie = "0599010000000001"
+    eenheid.adres = EenhedenEenheidadres(postcode="3011 AA", huisnummer="1")
+
+    stelsel = OnzelfstandigeWoonruimten(peildatum=date(2025, 1, 1))
+    stelsel.verrijking = Verrijking(
+        monumenten_resolver=VasteMonumentenResolver(),
+        woonplaats_resolver=VasteWoonplaatsResolver(),
+        cache=MonumentenCache(),
+    )
+    invoer = eenheid.model_dump_json()
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        resultaat = stelsel.waardeer(eenheid)
+
+    # de verrijking telt mee in de waardering, maar vult alleen de werkkopie aan
+    assert resultaat.opslagpercentage is not None
+    assert eenheid.model_dump_json() == invoer
+    assert eenheid.monumenten is None
+    assert eenheid.adres.woonplaats is None
+
+
+def test_waardeer_in_threads():
+    eenheden = [
+        EenhedenEenheid.model_validate_json(pad.read_text()) for pad in INPUT_BESTANDEN
+    ]
+    woningwaardering = Woningwaardering(peildatum=date(2025, 1, 1))
+
+    def waardeer(eenheid):
+        return woningwaardering.waardeer(eenheid).model_dump_json()
+
+    verwacht = [waardeer(eenheid) for eenheid in eenheden]
+
+    # Worker threads starten met de standaard Decimal-context, niet die van de
+    # hoofdthread. De waardering stelt daarom zelf de rekencontext in.
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        resultaten = list(executor.map(waardeer, eenheden * 3))
+
+    assert resultaten == verwacht * 3
+
+
+def test_stelselgroep_rekent_met_rekencontext():
+    contexten = []
+
+    class Contextgroep(Stelselgroep):
+        def waardeer(self, eenheid, woningwaardering_resultaat=None):
+            contexten.append(getcontext().copy())
+            return WoningwaarderingResultatenWoningwaarderingGroep()
+
+    def waardeer():
+        Contextgroep(begindatum=date(2024, 7, 1)).waardeer(EenhedenEenheid())
+
+    thread = Thread(target=waardeer)
+    thread.start()
+    thread.join()
+
+    (context,) = contexten
+    assert context.prec == REKENCONTEXT.prec
+    assert context.rounding == REKENCONTEXT.rounding
+    assert getcontext().prec == DefaultContext.prec
+
+
+def test_waardeer_batch():
+    eenheden = [
+        EenhedenEenheid.model_validate_json(pad.read_text()) for pad in INPUT_BESTANDEN
+    ]
+    woningwaardering = Woningwaardering(peildatum=date(2025, 1, 1))
+
+    invoer = [eenheid.model_dump_json() for eenheid in eenheden]
+
+    verwacht = [
+        woningwaardering.waardeer(eenheid).model_dump_json() for eenheid in eenheden
+    ]
+    # elke eenheid komt drie keer voor en wordt dus gelijktijdig gewaardeerd
+    resultaten = woningwaardering.waardeer_batch(eenheden * 3, max_workers=4)
+
+    assert [resultaat.model_dump_json() for resultaat in resultaten] == verwacht * 3
+    assert [eenheid.model_dump_json() for eenheid in eenheden] == invoer
+
+
+def test_stelsel_waardeer_batch():
+    eenheden = [
+        EenhedenEenheid.model_validate_json(pad.read_text())
+        for pad in DATA_DIR.glob("zelfstandige_woonruimten/input/*.json")
+    ]
+    stelsel = ZelfstandigeWoonruimten(peildatum=date(2025, 1, 1))
+
+    verwacht = [
+        stelsel.waardeer(eenheid, met_woningwaarderingen=False).model_dump_json()
+        for eenheid in eenheden
+    ]
+    resultaten = stelsel.waardeer_batch(
+        eenheden, max_workers=4, met_woningwaarderingen=False
+    )
+
+    assert [resultaat.model_dump_json() for resultaat in resultaten] == verwacht
+
+
+def test_waardeer_batch_ongeldig_stelsel():
+    eenheden = [
+        EenhedenEenheid.model_validate_json(INPUT_BESTANDEN[0].read_text()),
+        EenhedenEenheid(id="zonder_stelsel"),
+    ]
+
+    with pytest.raises(ValueError, match="zonder_stelsel"):
+        Woningwaardering(peildatum=date(2025, 1, 1)).waardeer_batch(eenheden)
+
+
+def test_waardeer_batch_fout():
+    class Foutgroep(Stelselgroep):
+        def waardeer(self, eenheid, woningwaardering_resultaat=None):
+            if eenheid.id == "fout":
+                warnings.warn(f"Eenheid ({eenheid.id}): fout", UserWarning)
+            return WoningwaarderingResultatenWoningwaarderingGroep()
+
+    stelsel = Stelsel(
+        stelsel=Woningwaarderingstelsel.zelfstandige_woonruimten,
+        begindatum=date(2024, 7, 1),
+        peildatum=date(2025, 1, 1),
+        stelselgroepen=[Foutgroep],
+    )
+    eenheden = [EenhedenEenheid(id=str(i)) for i in range(10)]
+    eenheden[3] = EenhedenEenheid(id="fout")
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", UserWarning)
+        with pytest.raises(UserWarning, match=r"Eenheid \(fout\)"):
+            stelsel.waardeer_batch(eenheden, verrijk=False)
+
+    assert len(stelsel.waardeer_batch(eenheden[:3], verrijk=False)) == 3
+
+
+def test_naar_tabel_in_threads():
+    woningwaardering = Woningwaardering(peildatum=date(2025, 1, 1))
+    resultaten = [
+        woningwaardering.waardeer(EenhedenEenheid.model_validate_json(pad.read_text()))
+        for pad in INPUT_BESTANDEN
+    ]
+
+    def tabel(resultaat):
+        return naar_tabel(resultaat).get_string()
+
+    verwacht = [tabel(resultaat) for resultaat in resultaten]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        assert list(executor.map(tabel, resultaten * 3)) == verwacht * 3
@@ -0,0 +1,90 @@
+import math
+
+import numpy as np
+import pytest
+
+from woningwaardering.stelsels import afronding
+from woningwaardering.stelsels.utils import rond_af, rond_af_op_kwart
+
+
+def _willekeurige_getallen(decimalen, aantal=20_000, grootte=10_000, seed=0):
+    generator = np.random.default_rng(seed)
+    factor = 10**decimalen
+    waarden = generator.integers(-grootte * factor, grootte * factor, size=aantal)
+    # voeg de randgevallen rond nul en de helften toe
+    randgevallen = np.arange(-2 * factor, 2 * factor + 1)
+    return np.concatenate([waarden, randgevallen]) / factor
+
+
+def _assert_identiek(resultaat, verwacht):
+    assert len(resultaat) == len(verwacht)
+    for waarde, verwachte_waarde in zip(resultaat.tolist(), verwacht):
+        assert waarde == verwachte_waarde
+        assert math.copysign(1, waarde) == math.copysign(1, verwachte_waarde)
+
+
+def test_schaal():
+    np.testing.assert_array_equal(
+        afronding.schaal([0.1, -0.07, 3.25, 12], 2), [10, -7, 325, 1200]
+    )
+    np.testing.assert_array_equal(afronding.schaal([0.125], 3), [125])
+    assert afronding.schaal([], 2).dtype == np.int64
+
+
+@pytest.mark.parametrize(
+    "getallen", [[0.125], [1 / 3], [np.nan], [np.inf], [1e20]], ids=str
+)
+def test_schaal_niet_exact(getallen):
+    with pytest.raises(ValueError, match="niet exact"):
+        afronding.schaal(getallen, 2)
+
+
+@pytest.mark.parametrize("decimalen", [-1, 10])
+def test_ongeldige_decimalen(decimalen):
+    with pytest.raises(ValueError, match="decimalen"):
+        afronding.schaal([1.0], decimalen)
+
+
+def test_rond_af_op_kwart_met_te_weinig_decimalen():
+    with pytest.raises(ValueError, match="twee decimalen"):
+        afronding.rond_af_op_kwart(np.array([1]), 1)
+
+
+def test_rond_af_op_kwart_achtste_naar_boven():
+    waarden = afronding.schaal([0.125, -0.125, 0.375, 0.124, 1.875], 3)
+
+    np.testing.assert_array_equal(
+        afronding.naar_float(afronding.rond_af_op_kwart(waarden, 3), 3),
+        [0.25, -0.25, 0.5, 0.0, 2.0],
+    )
+
+
+@pytest.mark.parametrize(
+    "decimalen, naar_decimalen",
+    [(1, 0), (2, 0), (2, 1), (3, 0), (3, 1), (3, 2), (2, 2), (2, 3)],
+)
+def test_rond_af_gelijk_aan_scalair(decimalen, naar_decimalen):
+    getallen = _willekeurige_getallen(decimalen, seed=decimalen * 10 + naar_decimalen)
+
+    afgerond = afronding.rond_af(
+        afronding.schaal(getallen, decimalen), decimalen, naar_decimalen
+    )
+
+    _assert_identiek(
+        afronding.naar_float(afgerond, decimalen, teken=getallen),
+        [float(rond_af(getal, naar_decimalen)) for getal in getallen.tolist()],
+    )
+
+
+@pytest.mark.parametrize("decimalen", [2, 3])
+def test_rond_af_op_kwart_gelijk_aan_scalair(decimalen):
+    getallen = _willekeurige_getallen(decimalen, seed=decimalen)
+
+    afgerond = afronding.rond_af_op_kwart(
+        afronding.schaal(getallen, decimalen), decimalen
+    )
+
+    _assert_identiek(
+        afronding.naar_float(afgerond, decimalen, teken=getallen),
+        [float(rond_af_op_kwart(getal)) for getal in getallen.tolist()],
+    )
@@ -0,0 +1,237 @@
+import itertools
+import warnings
+from decimal import Decimal
+
+import pytest
+
+from woningwaardering.stelsels.utils import (
+    _compileer_beslistabel,
+    classificeer_ruimte,
+    gedeeld_met_eenheden,
+)
+from woningwaardering.vera.bvg.generated import (
+    BouwkundigElementenBouwkundigElement,
+    EenhedenRuimte,
+    Referentiedata,
+)
+from woningwaardering.vera.referentiedata import (
+    Bouwkundigelementdetailsoort,
+    Ruimtedetailsoort,
+    Ruimtesoort,
+)
+from woningwaardering.vera.utils import heeft_bouwkundig_element
+
+OPPERVLAKTEN = [-1.0, 0.0, 1.99, 2, 2.0, 3.99, 4, 4.0, 5.99, 6.0, 100.0]
+
+
+def _classificeer_ruimte_cascade(ruimte):
+    # De classificatie zoals die vóór de beslistabel was geschreven, als referentie
+    if ruimte.soort == Ruimtesoort.verkeersruimte:
+        return Ruimtesoort.verkeersruimte
+
+    if ruimte.detail_soort in [
+        Ruimtedetailsoort.gemeenschappelijke_parkeerruimte_niet_specifieke_plek,
+        Ruimtedetailsoort.gemeenschappelijke_parkeerruimte_specifieke_plek,
+        Ruimtedetailsoort.open_parkeergarage_niet_specifieke_plek,
+        Ruimtedetailsoort.open_parkeergarage_specifieke_plek,
+        Ruimtedetailsoort.parkeergarage_niet_specifieke_plek,
+        Ruimtedetailsoort.parkeergarage_specifieke_plek,
+    ]:
+        return None
+
+    if (
+        ruimte.detail_soort
+        in [
+            Ruimtedetailsoort.atrium_en_of_patio,
+            Ruimtedetailsoort.gemeenschappelijk_dakterras,
+            Ruimtedetailsoort.achtertuin,
+            Ruimtedetailsoort.balkon,
+            Ruimtedetailsoort.zijtuin,
+            Ruimtedetailsoort.voortuin,
+            Ruimtedetailsoort.dakterras,
+            Ruimtedetailsoort.gemeenschappelijke_tuin,
+            Ruimtedetailsoort.terras,
+            Ruimtedetailsoort.tuin,
+            Ruimtedetailsoort.tuin_rondom,
+            Ruimtedetailsoort.loggia,
+        ]
+        or (
+            ruimte.detail_soort
+            in [
+                Ruimtedetailsoort.carport,
+                Ruimtedetailsoort.parkeervak_auto_buiten_niet_overdekt,
+            ]
+            and not gedeeld_met_eenheden(ruimte)
+        )
+        or (
+            ruimte.detail_soort == Ruimtedetailsoort.parkeerplaats
+            and ruimte.soort == Ruimtesoort.buitenruimte
+            and not gedeeld_met_eenheden(ruimte)
+        )
+    ):
+        return Ruimtesoort.buitenruimte
+
+    if ruimte.detail_soort in [
+        Ruimtedetailsoort.keuken,
+        Ruimtedetailsoort.badkamer,
+        Ruimtedetailsoort.doucheruimte,
+    ]:
+        return Ruimtesoort.vertrek
+
+    if ruimte.detail_soort in [
+        Ruimtedetailsoort.woonkamer,
+        Ruimtedetailsoort.woon_en_of_slaapkamer,
+        Ruimtedetailsoort.woonkamer_en_of_keuken,
+        Ruimtedetailsoort.slaapkamer,
+        Ruimtedetailsoort.badkamer_met_toilet,
+        Ruimtedetailsoort.overig_vertrek,
+        Ruimtedetailsoort.bijkeuken,
+        Ruimtedetailsoort.berging,
+        Ruimtedetailsoort.wasruimte,
+        Ruimtedetailsoort.kelder,
+    ] or (Ruimtedetailsoort.schuur.naam == ruimte.detail_soort.naam):
+        if ruimte.detail_soort == Ruimtedetailsoort.berging:
+            aantal_eenheden = ruimte.gedeeld_met_aantal_eenheden or 1
+            if (
+                Decimal(str(ruimte.oppervlakte)) / Decimal(str(aantal_eenheden))
+            ) >= Decimal("2"):
+                return Ruimtesoort.overige_ruimten
+            return None
+
+        if ruimte.soort == Ruimtesoort.vertrek:
+            if ruimte.oppervlakte >= 4:
+                return Ruimtesoort.vertrek
+            if ruimte.oppervlakte >= 2:
+                return Ruimtesoort.overige_ruimten
+
+        if ruimte.soort == Ruimtesoort.overige_ruimten:
+            if ruimte.oppervlakte >= 2:
+                return Ruimtesoort.overige_ruimten
+
+    if ruimte.detail_soort == Ruimtedetailsoort.toiletruimte:
+        if ruimte.oppervlakte >= 2:
+            return Ruimtesoort.overige_ruimten
+
+    if (
+        ruimte.detail_soort
+        in [
+            Ruimtedetailsoort.garage_inpandig,
+            Ruimtedetailsoort.garage_uitpandig,
+            Ruimtedetailsoort.garagebox,
+            Ruimtedetailsoort.parkeervak_auto_binnen,
+        ]
+        and not gedeeld_met_eenheden(ruimte)
+        or (
+            ruimte.detail_soort == Ruimtedetailsoort.parkeerplaats
+            and ruimte.soort == Ruimtesoort.overige_ruimten
+            and not gedeeld_met_eenheden(ruimte)
+        )
+    ):
+        if ruimte.oppervlakte >= 2.0:
+            return Ruimtesoort.overige_ruimten
+
+    if ruimte.detail_soort == Ruimtedetailsoort.zolder:
+        if ruimte.soort == Ruimtesoort.vertrek:
+            if (
+                heeft_bouwkundig_element(ruimte, Bouwkundigelementdetailsoort.trap)
+                and ruimte.oppervlakte >= 4
+            ):
+                return Ruimtesoort.vertrek
+
+        if ruimte.soort == Ruimtesoort.overige_ruimten:
+            if (
+                heeft_bouwkundig_element(ruimte, Bouwkundigelementdetailsoort.trap)
+                or heeft_bouwkundig_element(
+                    ruimte, Bouwkundigelementdetailsoort.vlizotrap
+                )
+            ) and ruimte.oppervlakte >= 2:
+                return Ruimtesoort.overige_ruimten
+
+    return None
+
+
+def _ruimten(detail_soort, soort):
+    for gedeeld_met_aantal_eenheden, trappen in itertools.product(
+        [None, 1, 2, 3],
+        [
+            [],
+            [Bouwkundigelementdetailsoort.trap],
+            [Bouwkundigelementdetailsoort.vlizotrap],
+            [Bouwkundigelementdetailsoort.vlizotrap, Bouwkundigelementdetailsoort.trap],
+        ],
+    ):
+        ruimte = EenhedenRuimte(
+            id="Space_1",
+            soort=soort,
+            detail_soort=detail_soort,
+            gedeeld_met_aantal_eenheden=gedeeld_met_aantal_eenheden,
+            bouwkundige_elementen=[
+                BouwkundigElementenBouwkundigElement(detail_soort=trap)
+                for trap in trappen
+            ],
+        )
+        for oppervlakte in OPPERVLAKTEN:
+            ruimte.oppervlakte = oppervlakte
+            yield ruimte
+
+
+@pytest.mark.parametrize("soort", list(Ruimtesoort), ids=lambda soort: soort.code)
+def test_classificeer_ruimte_gelijk_aan_cascade(soort):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for detail_soort in Ruimtedetailsoort:
+            for ruimte in _ruimten(detail_soort, soort):
+                assert classificeer_ruimte(ruimte) == _classificeer_ruimte_cascade(
+                    ruimte
+                ), (detail_soort, soort, ruimte)
+
+
+def test_classificeer_ruimte_onbekende_codes():
+    onbekende_detailsoort = Referentiedata(code="ONB", naam="Onbekend")
+    onbekende_soort = Referentiedata(code="ONB", naam="Onbekend")
+
+    for detail_soort, soort in [
+        (onbekende_detailsoort, Ruimtesoort.vertrek),
+        (onbekende_detailsoort, Ruimtesoort.verkeersruimte),
+        (Ruimtedetailsoort.woonkamer, onbekende_soort),
+        (Ruimtedetailsoort.berging, onbekende_soort),
+        (Ruimtedetailsoort.garage_inpandig, onbekende_soort),
+        (Ruimtedetailsoort.balkon, onbekende_soort),
+    ]:
+        for ruimte in _ruimten(detail_soort, soort):
+            assert classificeer_ruimte(ruimte) == _classificeer_ruimte_cascade(ruimte)
+
+
+def test_classificeer_ruimte_niet_te_classificeren_parkeerruimte():
+    ruimte = EenhedenRuimte(
+        id="Space_1",
+        naam="Parkeergarage",
+        soort=Ruimtesoort.overige_ruimten,
+        detail_soort=Ruimtedetailsoort.parkeergarage_specifieke_plek,
+        oppervlakte=12.0,
+    )
+
+    with pytest.warns(UserWarning, match="kan daardoor niet geclassificeerd worden"):
+        assert classificeer_ruimte(ruimte) is None
+
+
+def test_beslistabel_drempels():
+    ruimte = EenhedenRuimte(
+        id="Space_1",
+        soort=Ruimtesoort.vertrek,
+        detail_soort=Ruimtedetailsoort.slaapkamer,
+        oppervlakte=5.0,
+    )
+    sleutel = (
+        Ruimtedetailsoort.slaapkamer.code,
+        Ruimtesoort.vertrek.code,
+        False,
+        None,
+    )
+
+    assert _compileer_beslistabel()[sleutel].classificeer(ruimte) == (
+        Ruimtesoort.vertrek
+    )
+    assert _compileer_beslistabel(minimale_oppervlakte_vertrek=6)[sleutel].classificeer(
+        ruimte
+    ) == (Ruimtesoort.overige_ruimten)
@@ -0,0 +1,28 @@
+from datetime import date
+
+import pytest
+
+from woningwaardering.stelsels.utils import geldig_op
+
+VERSIES = (
+    (date(2024, 7, 1), "2024"),
+    (date(2025, 7, 1), "2025"),
+)
+
+
+@pytest.mark.parametrize(
+    "peildatum,expected",
+    [
+        (date(2024, 7, 1), "2024"),  # Peildatum is begindatum
+        (date(2025, 6, 30), "2024"),  # Peildatum voor de volgende begindatum
+        (date(2025, 7, 1), "2025"),  # Peildatum is de volgende begindatum
+        (date(2030, 1, 1), "2025"),  # Laatste versie blijft gelden
+    ],
+)
+def test_geldig_op(peildatum, expected):
+    assert geldig_op(VERSIES, peildatum) == expected
+
+
+def test_geldig_op_voor_eerste_versie():
+    with pytest.raises(ValueError, match="peildatum 2024-06-30"):
+        geldig_op(VERSIES, date(2024, 6, 30))
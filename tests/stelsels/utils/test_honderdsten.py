@@ -0,0 +1,120 @@
+import math
+import random
+from decimal import Decimal
+
+import pytest
+
+from woningwaardering.stelsels import honderdsten
+from woningwaardering.stelsels.honderdsten import Honderdsten
+from woningwaardering.stelsels.utils import rond_af, rond_af_op_kwart, som, som_op_kwart
+
+
+def _willekeurige_getallen(aantal, decimalen, seed=0):
+    generator = random.Random(seed)
+    return [
+        round(generator.uniform(-500, 500), generator.choice(decimalen))
+        for _ in range(aantal)
+    ]
+
+
+def _identiek(a, b):
+    return a == b and math.copysign(1, a) == math.copysign(1, b)
+
+
+def test_naar_honderdsten():
+    assert honderdsten.naar_honderdsten(0.1) == 10
+    assert honderdsten.naar_honderdsten(3.25) == 325
+    assert honderdsten.naar_honderdsten(-0.07) == -7
+    assert honderdsten.naar_honderdsten(12) == 1200
+    assert honderdsten.naar_honderdsten(Decimal("1.50")) == 150
+    assert honderdsten.naar_honderdsten(Decimal("-2.5")) == -250
+
+    assert honderdsten.naar_honderdsten(0.125) is None
+    assert honderdsten.naar_honderdsten(1 / 3) is None
+    assert honderdsten.naar_honderdsten(Decimal("0.125")) is None
+    assert honderdsten.naar_honderdsten(1e12) is None
+    assert honderdsten.naar_honderdsten(math.inf) is None
+    assert honderdsten.naar_honderdsten(math.nan) is None
+    assert honderdsten.naar_honderdsten(Decimal("NaN")) is None
+
+
+def test_naar_honderdsten_gelijk_aan_decimal():
+    for getal in _willekeurige_getallen(2000, [0, 1, 2]):
+        waarde = honderdsten.naar_honderdsten(getal)
+
+        assert waarde is not None
+        assert Decimal(waarde) / 100 == Decimal(str(getal))
+
+
+def test_rond_af():
+    assert honderdsten.rond_af(Honderdsten(250), 0) == 300
+    assert honderdsten.rond_af(Honderdsten(-250), 0) == -300
+    assert honderdsten.rond_af(Honderdsten(249), 0) == 200
+    assert honderdsten.rond_af(Honderdsten(15), 1) == 20
+    assert honderdsten.rond_af(Honderdsten(-14), 1) == -10
+    assert honderdsten.rond_af(Honderdsten(123), 2) == 123
+
+    with pytest.raises(ValueError):
+        honderdsten.rond_af(Honderdsten(123), 3)
+
+
+@pytest.mark.parametrize("decimalen", [0, 1, 2])
+def test_rond_af_gelijk_aan_decimal(decimalen):
+    for waarde in range(-1000, 1001):
+        verwacht = rond_af(Decimal(waarde) / 100, decimalen)
+        afgerond = honderdsten.rond_af(Honderdsten(waarde), decimalen)
+
+        assert honderdsten.naar_decimal(afgerond, decimalen, waarde < 0).compare_total(
+            verwacht
+        ) == Decimal("0")
+
+
+def test_rond_af_op_kwart_gelijk_aan_decimal():
+    for waarde in range(-1000, 1001):
+        verwacht = rond_af_op_kwart(Decimal(waarde) / 100)
+        afgerond = honderdsten.rond_af_op_kwart(Honderdsten(waarde))
+
+        assert _identiek(
+            honderdsten.naar_float(afgerond, negatief=waarde < 0), float(verwacht)
+        )
+
+
+def test_naar_decimal():
+    assert str(honderdsten.naar_decimal(Honderdsten(325))) == "3.25"
+    assert str(honderdsten.naar_decimal(Honderdsten(-300), decimalen=0)) == "-3"
+    assert str(honderdsten.naar_decimal(Honderdsten(0), 0, negatief=True)) == "-0"
+
+
+@pytest.mark.parametrize(
+    "getallen",
+    [
+        [],
+        [None],
+        [0.1, 0.2, None, 0.3],
+        [-0.1],
+        [0.125, 0.125],
+        [1 / 3, 2 / 3],
+        [1e7, 0.5],
+        _willekeurige_getallen(50, [2], seed=1),
+        _willekeurige_getallen(50, [0, 1, 2, 3], seed=2),
+    ],
+)
+def test_som_gelijk_aan_decimal(getallen):
+    waarden = [getal for getal in getallen if getal is not None]
+
+    assert _identiek(som(getallen), float(sum(Decimal(str(g)) for g in waarden)))
+    assert _identiek(
+        som_op_kwart(getallen),
+        float(rond_af_op_kwart(sum(Decimal(str(g)) for g in waarden))),
+    )
+
+
+def test_som_op_kwart_willekeurig():
+    generator = random.Random(3)
+    for _ in range(2000):
+        getallen = _willekeurige_getallen(
+            generator.randint(0, 12), [0, 1, 2], seed=generator.random()
+        )
+        verwacht = float(rond_af_op_kwart(sum(Decimal(str(g)) for g in getallen)))
+
+        assert _identiek(som_op_kwart(getallen), verwacht)
@@ -0,0 +1,277 @@
+"""Lokale stand-ins voor het Kadaster SPARQL-endpoint en de monumenten-API.
+
+De servers draaien in een achtergrondthread op een vrije poort van 127.0.0.1,
+zodat tests en benchmarks van het I/O-pad zonder netwerktoegang kunnen draaien.
+Latentie en foutkans zijn instelbaar.
+"""
+
+import asyncio
+import json
+import random
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+import requests
+
+from woningwaardering.vera.referentiedata import Eenheidmonument
+from woningwaardering.vera.referentiedata.eenheidmonument import (
+    EenheidmonumentReferentiedata,
+)
+from woningwaardering.verrijking import MonumentenResolver
+from woningwaardering.verrijking.begrenzing import begrens_timeout
+
+_POSTCODE_PATROON = re.compile(r'values \?postcode \{ "([^"]*)" \}')
+_HUISNUMMER_PATROON = re.compile(r"values \?huisnummer \{ (\d+) \}")
+_MONUMENT_NAMEN = {monument.code: monument.naam for monument in Eenheidmonument}
+
+
+class _StubServer(ABC):
+    def __init__(self, latentie: float, foutkans: float, seed: int) -> None:
+        self.latentie = latentie
+        self.foutkans = foutkans
+        self.aantal_verzoeken = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def _verwerk_verzoek(self) -> bool:
+        """Telt het verzoek en geeft True terug als het verzoek moet falen."""
+        with self._lock:
+            self.aantal_verzoeken += 1
+            faalt = self._random.random() < self.foutkans
+        return faalt
+
+    @property
+    @abstractmethod
+    def url(self) -> str:
+        """De basis-URL van de draaiende server."""
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    @abstractmethod
+    def start(self) -> None:
+        """Start de server in een achtergrondthread."""
+
+    @abstractmethod
+    def stop(self) -> None:
+        """Stopt de server."""
+
+
+class _StilleHTTPServer(ThreadingHTTPServer):
+    def handle_error(self, request, client_address) -> None:
+        # een client die na een timeout de verbinding verbreekt is geen fout van de stub
+        pass
+
+
+class StubKadasterServer(_StubServer):
+    """Emuleert het SPARQL-endpoint van het Kadaster met `http.server`.
+
+    Parameters:
+        woonplaatsen (dict[tuple[str, int], tuple[str, str]] | None): Woonplaatscode en -naam
+            per (postcode, huisnummer). Onbekende adressen geven geen resultaat.
+            Zonder woonplaatsen krijgt elk adres Rotterdam.
+        latentie (float): De vertraging per verzoek in seconden.
+        foutkans (float): De kans dat een verzoek met HTTP 503 faalt.
+        seed (int): De seed voor het bepalen van de fouten.
+    """
+
+    def __init__(
+        self,
+        woonplaatsen: dict[tuple[str, int], tuple[str, str]] | None = None,
+        latentie: float = 0.0,
+        foutkans: float = 0.0,
+        seed: int = 0,
+    ) -> None:
+        super().__init__(latentie, foutkans, seed)
+        self.woonplaatsen = woonplaatsen
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:
+                lengte = int(self.headers.get("Content-Length", 0))
+                query = parse_qs(self.rfile.read(lengte).decode())["query"][0]
+                faalt = stub._verwerk_verzoek()
+                time.sleep(stub.latentie)
+
+                if faalt:
+                    self.send_error(503)
+                    return
+
+                postcode = _POSTCODE_PATROON.search(query)
+                huisnummer = _HUISNUMMER_PATROON.search(query)
+                resultaat = []
+                if postcode and huisnummer:
+                    woonplaats = (
+                        ("3086", "Rotterdam")
+                        if stub.woonplaatsen is None
+                        else stub.woonplaatsen.get(
+                            (postcode.group(1), int(huisnummer.group(1)))
+                        )
+                    )
+                    if woonplaats is not None:
+                        resultaat.append(
+                            {"identificatie": woonplaats[0], "naam": woonplaats[1]}
+                        )
+
+                body = json.dumps(resultaat).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args) -> None:
+                pass
+
+        self._server = _StilleHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}/sparql"
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+
+class StubMonumentenServer(_StubServer):
+    """Emuleert een monumenten-API met een `asyncio`-server.
+
+    De server verwacht een POST met als JSON-body `{"bag_identificaties": [...]}` en
+    antwoordt met de monumentale statussen per BAG verblijfsobject id.
+
+    Parameters:
+        monumenten (dict[str, list[str]] | None): De codes van de monumentale statussen
+            per BAG verblijfsobject id. Onbekende ids hebben geen status.
+        latentie (float): De vertraging per verzoek in seconden.
+        foutkans (float): De kans dat een verzoek met HTTP 503 faalt.
+        seed (int): De seed voor het bepalen van de fouten.
+    """
+
+    def __init__(
+        self,
+        monumenten: dict[str, list[str]] | None = None,
+        latentie: float = 0.0,
+        foutkans: float = 0.0,
+        seed: int = 0,
+    ) -> None:
+        super().__init__(latentie, foutkans, seed)
+        self.monumenten = monumenten or {}
+        self._loop = asyncio.new_event_loop()
+        self._server: asyncio.base_events.Server | None = None
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._poort = 0
+
+    async def _verwerk(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                verzoekregel = await reader.readline()
+                if not verzoekregel:
+                    return
+
+                headers = {}
+                while (regel := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    naam, _, waarde = regel.decode().partition(":")
+                    headers[naam.strip().lower()] = waarde.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+
+                faalt = self._verwerk_verzoek()
+                await asyncio.sleep(self.latentie)
+
+                if faalt:
+                    status, antwoord = "503 Service Unavailable", b"{}"
+                else:
+                    bag_identificaties = json.loads(body)["bag_identificaties"]
+                    status = "200 OK"
+                    antwoord = json.dumps(
+                        {
+                            bag_identificatie: [
+                                {"code": code, "naam": _MONUMENT_NAMEN.get(code, code)}
+                                for code in self.monumenten.get(bag_identificatie, [])
+                            ]
+                            for bag_identificatie in bag_identificaties
+                        }
+                    ).encode()
+
+                writer.write(
+                    f"HTTP/1.1 {status}\r\nContent-Type: application/json\r\n"
+                    f"Content-Length: {len(antwoord)}\r\n\r\n".encode()
+                    + antwoord
+                )
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _start_server(self) -> None:
+        self._server = await asyncio.start_server(self._verwerk, "127.0.0.1", 0)
+        self._poort = self._server.sockets[0].getsockname()[1]
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._poort}/monumenten"
+
+    def start(self) -> None:
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self._start_server(), self._loop).result()
+
+    def stop(self) -> None:
+        async def _stop() -> None:
+            assert self._server is not None
+            self._server.close()
+            await self._server.wait_closed()
+
+        asyncio.run_coroutine_threadsafe(_stop(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+
+class StubMonumentenResolver(MonumentenResolver):
+    """Zoekt monumentale statussen op bij een `StubMonumentenServer`.
+
+    Parameters:
+        url (str): De url van de server.
+        timeout (float): De timeout in seconden per verzoek.
+    """
+
+    def __init__(self, url: str, timeout: float = 5) -> None:
+        self.url = url
+        self.timeout = timeout
+        self._sessie = requests.Session()
+
+    def zoek_monumenten(
+        self, bag_identificaties: list[str]
+    ) -> dict[str, list[EenheidmonumentReferentiedata]]:
+        response = self._sessie.post(
+            self.url,
+            json={"bag_identificaties": bag_identificaties},
+            timeout=begrens_timeout(self.timeout),
+        )
+        response.raise_for_status()
+        return {
+            bag_identificatie: [
+                EenheidmonumentReferentiedata(
+                    code=monument["code"], naam=monument["naam"]
+                )
+                for monument in monumenten
+            ]
+            for bag_identificatie, monumenten in response.json().items()
+        }
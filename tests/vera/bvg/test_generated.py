@@ -0,0 +1,56 @@
+import subprocess
+import sys
+
+from pydantic import BaseModel
+
+import woningwaardering.vera.bvg.generated as generated
+
+VERA_MODELLEN = {
+    naam: model
+    for naam, model in vars(generated).items()
+    if isinstance(model, type)
+    and issubclass(model, BaseModel)
+    and model.__module__ == generated.__name__
+}
+
+IMPORT_SCRIPT = """
+import woningwaardering
+import woningwaardering.vera.bvg.generated as generated
+from pydantic import BaseModel
+
+print(
+    " ".join(
+        naam
+        for naam, model in vars(generated).items()
+        if isinstance(model, type)
+        and issubclass(model, BaseModel)
+        and model.__module__ == generated.__name__
+        and model.__pydantic_complete__
+    )
+)
+print(generated.EenhedenEenheid.__pydantic_complete__)
+"""
+
+
+def test_VERA_modellen_defer_build():
+    assert VERA_MODELLEN
+    for naam, model in VERA_MODELLEN.items():
+        assert model.model_config.get("defer_build") is True, naam
+
+
+def test_import_woningwaardering():
+    # in een nieuw proces, zodat de schema's nog niet door andere tests zijn opgebouwd
+    resultaat = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    opgebouwd, eenheid_opgebouwd = resultaat.stdout.splitlines()
+
+    # de schema's van de VERA-modellen worden pas bij het eerste gebruik opgebouwd
+    assert eenheid_opgebouwd == "False"
+    # behalve dat van de criteria, die CriteriumSleutels bij het importeren aanmaakt
+    assert set(opgebouwd.split()) <= {
+        "WoningwaarderingResultatenWoningwaarderingCriterium"
+    }
@@ -0,0 +1,131 @@
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+import woningwaardering.vera.referentiedata as referentiedata
+from woningwaardering.vera.bvg.generated import Referentiedata
+
+IMPORT_SCRIPT = """
+import resource
+import sys
+import time
+
+start = time.perf_counter()
+import woningwaardering
+duur = time.perf_counter() - start
+
+print(duur)
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+print(
+    sum(
+        1
+        for module in sys.modules
+        if module.startswith("woningwaardering.vera.referentiedata.")
+    )
+)
+"""
+
+SCHEMA_SCRIPT = """
+import sys
+
+import woningwaardering
+
+print(
+    sum(
+        1
+        for module in list(sys.modules.values())
+        if module.__name__.startswith("woningwaardering.vera.referentiedata.")
+        for naam, waarde in vars(module).items()
+        if naam.endswith("Referentiedata")
+        and getattr(waarde, "__module__", None) == module.__name__
+        and waarde.__pydantic_complete__
+    )
+)
+"""
+
+
+def test_alle_referentiedatasoorten_beschikbaar():
+    for naam in referentiedata.__all__:
+        waarde = getattr(referentiedata, naam)
+        module = importlib.import_module(
+            f"woningwaardering.vera.referentiedata.{referentiedata._MODULES[naam]}"
+        )
+        assert waarde is getattr(module, naam)
+
+
+def test_from_import():
+    from woningwaardering.vera.referentiedata import (
+        Ruimtedetailsoort,
+        RuimtedetailsoortReferentiedata,
+    )
+
+    assert isinstance(Ruimtedetailsoort.badkamer, RuimtedetailsoortReferentiedata)
+
+
+def test_onbekende_naam():
+    with pytest.raises(AttributeError, match="Onbekend"):
+        referentiedata.Onbekend  # noqa: B018
+
+    with pytest.raises(ImportError):
+        from woningwaardering.vera.referentiedata import Onbekend  # noqa: F401
+
+
+def test_dir():
+    assert set(referentiedata.__all__) <= set(dir(referentiedata))
+
+
+def test_import_woningwaardering_laadt_alleen_gebruikte_referentiedata():
+    # in een nieuw proces, zodat nog geen referentiedata door andere tests is geladen
+    resultaat = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    duur, rss, aantal_modules = resultaat.stdout.splitlines()
+    print(
+        f"import woningwaardering: {float(duur) * 1000:.0f} ms, "
+        f"{int(rss) / 1024:.0f} MB, {aantal_modules} van "
+        f"{len(set(referentiedata._MODULES.values()))} referentiedatamodules geladen"
+    )
+
+    assert int(aantal_modules) < len(set(referentiedata._MODULES.values())) / 4
+
+
+@pytest.mark.parametrize(
+    "naam",
+    [
+        naam
+        for naam in referentiedata.__all__
+        if naam + "Referentiedata" in referentiedata._MODULES
+    ],
+)
+def test_referentiedata_geldig(naam):
+    # de waarden worden zonder validatie aangemaakt, dus hier wordt gecontroleerd
+    # dat ze de validatie zouden doorstaan
+    soort = getattr(referentiedata, naam)
+    referentiedata_klasse = getattr(referentiedata, f"{naam}Referentiedata")
+
+    for waarde in soort:
+        assert isinstance(waarde, referentiedata_klasse)
+        assert waarde.code and waarde.code.strip()
+        assert waarde.parent is None or isinstance(waarde.parent, Referentiedata)
+        gevalideerd = referentiedata_klasse.model_validate(
+            waarde.model_dump(include=waarde.model_fields_set)
+            | ({"parent": waarde.parent} if waarde.parent is not None else {})
+        )
+        assert gevalideerd.model_dump() == waarde.model_dump()
+        assert gevalideerd.model_fields_set == waarde.model_fields_set
+
+
+def test_import_bouwt_geen_schemas_voor_referentiedata():
+    resultaat = subprocess.run(
+        [sys.executable, "-c", SCHEMA_SCRIPT],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert int(resultaat.stdout) == 0
@@ -0,0 +1,182 @@
+import io
+import json
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tests.conftest import DATA_DIR
+from woningwaardering.vera.bvg.generated import (
+    EenheidSleutels,
+    WoningwaarderingResultatenWoningwaarderingResultaat,
+)
+from woningwaardering.vera.exporteren import (
+    KOLOMMEN,
+    CsvExporteur,
+    Kolombuffer,
+    ParquetExporteur,
+    exporteer_csv,
+    exporteer_parquet,
+)
+
+OUTPUT_BESTANDEN = sorted(DATA_DIR.glob("*/output/*.json"))
+
+
+@pytest.fixture(scope="module")
+def resultaten():
+    return [
+        (
+            pad.stem,
+            WoningwaarderingResultatenWoningwaarderingResultaat.model_validate_json(
+                pad.read_text()
+            ),
+        )
+        for pad in OUTPUT_BESTANDEN
+    ]
+
+
+def _rijen_via_json(eenheid_id, resultaat):
+    """De rijen zoals ze uit de JSON-serialisatie van een resultaat volgen."""
+    data = json.loads(resultaat.model_dump_json(by_alias=True, exclude_none=True))
+    rijen = []
+    for groep in data.get("groepen", []):
+        stelselgroep = groep.get("criteriumGroep", {}).get("stelselgroep", {})
+        rijen.append(
+            (
+                eenheid_id,
+                stelselgroep.get("code"),
+                None,
+                None,
+                None,
+                None,
+                None,
+                groep.get("punten"),
+                groep.get("opslagpercentage"),
+            )
+        )
+        for woningwaardering in groep.get("woningwaarderingen", []):
+            criterium = woningwaardering.get("criterium", {})
+            rijen.append(
+                (
+                    eenheid_id,
+                    stelselgroep.get("code"),
+                    criterium.get("id"),
+                    criterium.get("naam"),
+                    criterium.get("bovenliggendeCriterium", {}).get("id"),
+                    woningwaardering.get("aantal"),
+                    criterium.get("meeteenheid", {}).get("code"),
+                    woningwaardering.get("punten"),
+                    woningwaardering.get("opslagpercentage"),
+                )
+            )
+    return rijen
+
+
+def _verwachte_tabel(resultaten, dtypes):
+    buffer = Kolombuffer()
+    for eenheid_id, resultaat in resultaten:
+        buffer.voeg_toe(resultaat, eenheid_id)
+    return pd.DataFrame(buffer.kolommen).astype(dtypes).replace({None: np.nan})
+
+
+def test_kolombuffer(resultaten):
+    buffer = Kolombuffer()
+    verwacht = []
+    for eenheid_id, resultaat in resultaten:
+        buffer.voeg_toe(resultaat, eenheid_id)
+        verwacht.extend(_rijen_via_json(eenheid_id, resultaat))
+
+    assert list(buffer.kolommen) == list(KOLOMMEN)
+    assert len(buffer) == len(verwacht)
+    assert list(buffer.rijen()) == verwacht
+    assert any(bovenliggend for *_, bovenliggend, _, _, _, _ in buffer.rijen())
+
+    buffer.leeg()
+    assert len(buffer) == 0
+
+
+def test_kolombuffer_eenheid_id_uit_resultaat(resultaten):
+    _, resultaat = resultaten[0]
+    resultaat = resultaat.model_copy(update={"eenheid": EenheidSleutels(id="123")})
+
+    buffer = Kolombuffer()
+    buffer.voeg_toe(resultaat)
+
+    assert set(buffer.kolommen["eenheid_id"]) == {"123"}
+
+
+@pytest.mark.parametrize("buffergrootte", [1, 7, 10_000])
+def test_exporteer_csv(resultaten, buffergrootte):
+    bestand = io.StringIO()
+    aantal = exporteer_csv(resultaten, bestand, buffergrootte=buffergrootte)
+
+    bestand.seek(0)
+    tabel = pd.read_csv(bestand, dtype={"eenheid_id": str})
+    assert list(tabel.columns) == list(KOLOMMEN)
+    assert aantal == len(tabel)
+    pd.testing.assert_frame_equal(
+        tabel, _verwachte_tabel(resultaten, tabel.dtypes.to_dict())
+    )
+
+
+def test_csv_exporteur_naar_pad(resultaten, tmp_path):
+    pad = tmp_path / "resultaten.csv"
+    with CsvExporteur(pad, delimiter=";") as exporteur:
+        for eenheid_id, resultaat in resultaten[:2]:
+            exporteur.schrijf(resultaat, eenheid_id)
+
+    regels = pad.read_text(encoding="utf-8").splitlines()
+    assert regels[0] == ";".join(KOLOMMEN)
+    assert len(regels) == exporteur.aantal_rijen + 1
+
+    with pytest.raises(ValueError, match="gesloten"):
+        exporteur.schrijf(resultaten[0][1])
+
+
+def test_exporteur_ongeldige_buffergrootte():
+    with pytest.raises(ValueError, match="buffergrootte"):
+        CsvExporteur(io.StringIO(), buffergrootte=0)
+
+
+def test_exporteer_parquet(resultaten, tmp_path):
+    pytest.importorskip("pyarrow")
+    pad = tmp_path / "resultaten.parquet"
+
+    aantal = exporteer_parquet(resultaten, pad, buffergrootte=50)
+
+    tabel = pd.read_parquet(pad)
+    assert aantal == len(tabel)
+    pd.testing.assert_frame_equal(
+        tabel, _verwachte_tabel(resultaten, tabel.dtypes.to_dict())
+    )
+
+
+def test_parquet_exporteur_zonder_pyarrow(monkeypatch, tmp_path):
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+
+    with pytest.raises(ImportError, match="woningwaardering\\[parquet\\]"):
+        ParquetExporteur(tmp_path / "resultaten.parquet")
+
+
+@pytest.mark.benchmark
+def test_benchmark_exporteer_csv(resultaten):
+    def via_json():
+        rijen = []
+        for eenheid_id, resultaat in resultaten:
+            rijen.extend(_rijen_via_json(eenheid_id, resultaat))
+        pd.DataFrame(rijen, columns=KOLOMMEN).to_csv(io.StringIO(), index=False)
+
+    def via_exporteur():
+        exporteer_csv(resultaten, io.StringIO())
+
+    json_tijd = min(timeit.repeat(via_json, number=5, repeat=5))
+    exporteur_tijd = min(timeit.repeat(via_exporteur, number=5, repeat=5))
+    aantal = 5 * len(resultaten)
+    print(
+        f"via JSON: {json_tijd / aantal * 1e6:.0f} µs, "
+        f"exporteer_csv: {exporteur_tijd / aantal * 1e6:.0f} µs per resultaat"
+    )
+
+    assert exporteur_tijd < json_tijd
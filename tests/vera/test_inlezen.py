@@ -0,0 +1,68 @@
+import timeit
+import warnings
+
+import pytest
+
+from tests.conftest import DATA_DIR
+from woningwaardering.vera.bvg.generated import EenhedenEenheid
+from woningwaardering.vera.inlezen import lees_eenheid, lees_eenheid_json
+
+INPUT_BESTANDEN = sorted(DATA_DIR.glob("*/input/*.json"))
+
+
+@pytest.mark.parametrize(
+    "pad", INPUT_BESTANDEN, ids=[pad.name for pad in INPUT_BESTANDEN]
+)
+def test_lees_eenheid_json(pad):
+    json_data = pad.read_text()
+
+    eenheid = lees_eenheid_json(json_data)
+
+    assert type(eenheid) is EenhedenEenheid
+    assert eenheid == EenhedenEenheid.model_validate_json(json_data)
+    assert eenheid.model_fields_set == (
+        EenhedenEenheid.model_validate_json(json_data).model_fields_set
+    )
+
+
+def test_lees_eenheid_json_validatiefout():
+    json_data = '{"id": "1", "ruimten": [{"id": "r1", "oppervlakte": "groot"}]}'
+
+    with warnings.catch_warnings(record=True) as verwacht:
+        warnings.simplefilter("always")
+        verwachte_eenheid = EenhedenEenheid.model_validate_json(json_data)
+
+    with warnings.catch_warnings(record=True) as gevangen:
+        warnings.simplefilter("always")
+        eenheid = lees_eenheid_json(json_data)
+
+    assert [str(w.message) for w in gevangen] == [str(w.message) for w in verwacht]
+    assert "Validatiefout in attribuut 'ruimten.0.oppervlakte'" in str(
+        gevangen[0].message
+    )
+    assert eenheid == verwachte_eenheid
+    assert eenheid.ruimten[0].oppervlakte is None
+
+
+def test_lees_eenheid():
+    eenheid = lees_eenheid({"id": "1", "ruimten": [{"id": "r1", "oppervlakte": 12}]})
+
+    assert type(eenheid) is EenhedenEenheid
+    assert eenheid.ruimten[0].oppervlakte == 12
+
+
+@pytest.mark.benchmark
+def test_benchmark_lees_eenheid_json():
+    json_data = max(INPUT_BESTANDEN, key=lambda pad: pad.stat().st_size).read_text()
+
+    standaard = min(
+        timeit.repeat(
+            lambda: EenhedenEenheid.model_validate_json(json_data), number=50, repeat=5
+        )
+    )
+    snel = min(timeit.repeat(lambda: lees_eenheid_json(json_data), number=50, repeat=5))
+    print(
+        f"model_validate_json: {standaard / 50 * 1000:.3f} ms, lees_eenheid_json: {snel / 50 * 1000:.3f} ms"
+    )
+
+    assert snel < standaard
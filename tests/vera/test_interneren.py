@@ -0,0 +1,124 @@
+import pytest
+
+from tests.conftest import DATA_DIR
+from woningwaardering.vera.bvg.generated import (
+    BouwkundigElementenBouwkundigElement,
+    EenhedenEenheid,
+    EenhedenRuimte,
+    Referentiedata,
+)
+from woningwaardering.vera.inlezen import lees_eenheid_json
+from woningwaardering.vera.interneren import interneer, interneer_referentiedata
+from woningwaardering.vera.referentiedata import (
+    Bouwkundigelementdetailsoort,
+    Ruimtedetailsoort,
+    Ruimtesoort,
+)
+
+INPUT_BESTANDEN = sorted(DATA_DIR.glob("*/input/*.json"))
+
+
+def test_interneer():
+    badkamer = Referentiedata(code="BAD", naam="Badkamer")
+
+    assert interneer(badkamer, Ruimtedetailsoort) is Ruimtedetailsoort.badkamer
+    assert interneer(badkamer) is not Ruimtedetailsoort.badkamer
+
+
+def test_interneer_afwijkende_naam():
+    badruimte = Referentiedata(code="BAD", naam="Badruimte")
+
+    # een afwijkende naam blijft behouden en wordt niet globaal bewaard
+    assert interneer(badruimte, Ruimtedetailsoort) is badruimte
+
+
+def test_interneer_onveranderlijk():
+    badkamer = interneer(Referentiedata(code="BAD", naam="Badkamer"), Ruimtedetailsoort)
+
+    with pytest.raises(AttributeError):
+        badkamer.naam = "Badruimte"
+    with pytest.raises(AttributeError):
+        badkamer.parent = None
+
+    assert Ruimtedetailsoort.badkamer.naam == "Badkamer"
+    assert Ruimtedetailsoort.badkamer.parent is not None
+
+
+def test_interneer_referentiedata():
+    eenheid = EenhedenEenheid(
+        id="1",
+        ruimten=[
+            EenhedenRuimte(
+                id="r1",
+                soort=Referentiedata(code="VTK", naam="Vertrek"),
+                detail_soort=Referentiedata(code="BAD", naam="Badkamer"),
+                bouwkundige_elementen=[
+                    BouwkundigElementenBouwkundigElement(
+                        id="b1", detail_soort=Referentiedata(code="BAD", naam="Bad")
+                    )
+                ],
+                verbonden_ruimten=[
+                    EenhedenRuimte(
+                        id="r2", soort=Referentiedata(code="VTK", naam="Vertrek")
+                    )
+                ],
+            )
+        ],
+    )
+    verwacht = eenheid.model_copy(deep=True)
+
+    interneer_referentiedata(eenheid)
+
+    ruimte = eenheid.ruimten[0]
+    assert ruimte.soort is Ruimtesoort.vertrek
+    # dezelfde code krijgt per Referentiedatasoort de juiste canonieke instantie
+    assert ruimte.detail_soort is Ruimtedetailsoort.badkamer
+    assert ruimte.bouwkundige_elementen[0].detail_soort is (
+        Bouwkundigelementdetailsoort.bad
+    )
+    assert ruimte.verbonden_ruimten[0].soort is Ruimtesoort.vertrek
+    assert eenheid == verwacht
+    assert eenheid.model_dump_json() == verwacht.model_dump_json()
+
+
+def test_interneer_referentiedata_batch():
+    eenheden = [
+        lees_eenheid_json(pad.read_text(), interneer=False) for pad in INPUT_BESTANDEN
+    ]
+
+    def referentiedata(eenheden):
+        return [
+            ruimte.detail_soort
+            for eenheid in eenheden
+            for ruimte in eenheid.ruimten or []
+            if ruimte.detail_soort is not None
+        ]
+
+    voor = referentiedata(eenheden)
+    for eenheid in eenheden:
+        interneer_referentiedata(eenheid)
+    na = referentiedata(eenheden)
+
+    assert na == voor
+    assert len({id(item) for item in na}) < len({id(item) for item in voor}) / 3
+    assert all(
+        item is Ruimtedetailsoort.van_code(item.code)
+        for item in na
+        if item.naam == getattr(Ruimtedetailsoort.van_code(item.code), "naam", None)
+    )
+
+
+@pytest.mark.parametrize(
+    "pad", INPUT_BESTANDEN[:5], ids=[pad.name for pad in INPUT_BESTANDEN[:5]]
+)
+def test_lees_eenheid_json_interneert(pad):
+    json_data = pad.read_text()
+
+    eenheid = lees_eenheid_json(json_data)
+
+    assert eenheid == EenhedenEenheid.model_validate_json(json_data)
+    assert any(
+        ruimte.soort is soort
+        for ruimte in eenheid.ruimten or []
+        for soort in Ruimtesoort
+    )
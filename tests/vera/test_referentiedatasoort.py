@@ -0,0 +1,68 @@
+import pytest
+
+from woningwaardering.vera.bvg.generated import Referentiedata
+from woningwaardering.vera.referentiedata import (
+    Bouwkundigelementdetailsoort,
+    Ruimtedetailsoort,
+    Ruimtesoort,
+)
+from woningwaardering.vera.referentiedatasoort import Referentiedatasoort
+
+
+def test_van_code():
+    assert Ruimtedetailsoort.van_code("BAD") is Ruimtedetailsoort.badkamer
+    assert Bouwkundigelementdetailsoort.van_code("BAD") is (
+        Bouwkundigelementdetailsoort.bad
+    )
+    assert Ruimtedetailsoort.van_code("ONBEKEND") is None
+    assert Ruimtedetailsoort.van_code(None) is None
+
+
+def test_van_code_alle_waarden():
+    for waarde in Ruimtedetailsoort:
+        assert Ruimtedetailsoort.van_code(waarde.code) is waarde
+
+
+def test_codes():
+    assert Ruimtesoort.codes == frozenset(waarde.code for waarde in Ruimtesoort)
+    assert isinstance(Ruimtesoort.codes, frozenset)
+
+
+def test_kinderen():
+    kinderen = Ruimtedetailsoort.kinderen(Ruimtesoort.buitenruimte)
+
+    assert Ruimtedetailsoort.balkon in kinderen
+    assert Ruimtedetailsoort.badkamer not in kinderen
+    assert set(kinderen) == {
+        waarde
+        for waarde in Ruimtedetailsoort
+        if waarde.parent == Ruimtesoort.buitenruimte
+    }
+    # ook voor een parent die als los object is ingelezen
+    assert Ruimtedetailsoort.kinderen(Referentiedata(code="BTR")) == kinderen
+    assert Ruimtesoort.kinderen(Ruimtesoort.buitenruimte) == ()
+
+
+def test_codegroep():
+    groep = Ruimtedetailsoort.codegroep(
+        Ruimtedetailsoort.keuken, Ruimtedetailsoort.badkamer
+    )
+
+    assert groep == frozenset({"KEU", "BAD"})
+    assert Referentiedata(code="BAD", naam="Badruimte").code in groep
+
+    with pytest.raises(ValueError, match="Ruimtedetailsoort"):
+        Ruimtedetailsoort.codegroep(
+            Ruimtedetailsoort.keuken, Referentiedata(code="ONBEKEND")
+        )
+
+
+def test_nieuwe_referentiedatasoort():
+    class Testsoort(Referentiedatasoort):
+        eerste = Referentiedata(code="A", naam="Eerste")
+        tweede = Referentiedata(code="B", naam="Tweede", parent=eerste)
+
+    assert Testsoort.van_code("B") is Testsoort.tweede
+    assert Testsoort.tweede.name == "tweede"
+    assert Testsoort.kinderen(Testsoort.eerste) == (Testsoort.tweede,)
+    assert Testsoort.codes == frozenset({"A", "B"})
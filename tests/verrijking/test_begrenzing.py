@@ -0,0 +1,188 @@
+import time
+import warnings
+from datetime import timedelta
+
+import pytest
+
+from tests.stubservers import StubKadasterServer
+from woningwaardering.vera.bvg.generated import (
+    EenhedenAdresseerbaarObjectBasisregistratie,
+    EenhedenEenheid,
+    EenhedenEenheidadres,
+    EenhedenWoonplaats,
+)
+from woningwaardering.vera.referentiedata import Woningwaarderingstelsel
+from woningwaardering.verrijking import (
+    KadasterWoonplaatsResolver,
+    MonumentenCache,
+    MonumentenResolver,
+    OpzoekingOvergeslagen,
+    Stroomonderbreker,
+    TijdsbudgetVerstreken,
+    Verrijking,
+    WoonplaatsResolver,
+    get_tijdsbudget,
+    tijdsbudget,
+)
+
+
+def maak_onzelfstandige_eenheid(id, huisnummer):
+    return EenhedenEenheid(
+        id=id,
+        woningwaarderingstelsel=Woningwaarderingstelsel.onzelfstandige_woonruimten,
+        adres=EenhedenEenheidadres(postcode="1011 AB", huisnummer=str(huisnummer)),
+    )
+
+
+def test_Stroomonderbreker():
+    stroomonderbreker = Stroomonderbreker(
+        "test", max_fouten=2, hersteltijd=timedelta(0)
+    )
+
+    assert stroomonderbreker.laat_toe()
+    stroomonderbreker.registreer_fout()
+    assert not stroomonderbreker.is_open
+    stroomonderbreker.registreer_fout()
+
+    # na de hersteltijd wordt precies één proefpoging toegelaten
+    assert stroomonderbreker.laat_toe()
+    assert not stroomonderbreker.laat_toe()
+    stroomonderbreker.registreer_fout()
+
+    assert stroomonderbreker.laat_toe()
+    stroomonderbreker.registreer_succes()
+    assert not stroomonderbreker.is_open
+    assert stroomonderbreker.laat_toe()
+
+    # een door het tijdsbudget afgebroken proefpoging telt niet als fout
+    stroomonderbreker.registreer_fout()
+    stroomonderbreker.registreer_fout()
+    assert stroomonderbreker.laat_toe()
+    stroomonderbreker.registreer_afgebroken()
+    assert stroomonderbreker.laat_toe()
+    stroomonderbreker.registreer_succes()
+
+    stroomonderbreker = Stroomonderbreker("test", max_fouten=1)
+    stroomonderbreker.registreer_fout()
+    assert stroomonderbreker.is_open
+    assert not stroomonderbreker.laat_toe()
+    stroomonderbreker.herstel()
+    assert stroomonderbreker.laat_toe()
+
+
+def test_KadasterWoonplaatsResolver_stroomonderbreker():
+    resolver = KadasterWoonplaatsResolver(
+        endpoint="http://127.0.0.1:9/sparql",
+        timeout=1,
+        stroomonderbreker=Stroomonderbreker("test", max_fouten=2),
+    )
+
+    with warnings.catch_warnings(record=True) as gevangen:
+        warnings.simplefilter("always")
+        for _ in range(2):
+            assert resolver.zoek_woonplaats("1011AB", 105) is None
+
+    berichten = [str(warning.message) for warning in gevangen]
+    assert sum("Fout bij het ophalen" in bericht for bericht in berichten) == 2
+
+    with pytest.raises(
+        OpzoekingOvergeslagen, match="Stroomonderbreker voor test is open"
+    ):
+        resolver.zoek_woonplaats("1011AB", 105)
+
+
+def test_KadasterWoonplaatsResolver_tijdsbudget():
+    resolver = KadasterWoonplaatsResolver(endpoint="http://127.0.0.1:9/sparql")
+
+    with tijdsbudget(timedelta(0)) as budget:
+        assert get_tijdsbudget() is budget
+        with pytest.raises(TijdsbudgetVerstreken):
+            resolver.zoek_woonplaats("1011AB", 105)
+
+    assert get_tijdsbudget() is None
+    assert resolver.stroomonderbreker.laat_toe()
+
+
+def test_KadasterWoonplaatsResolver_begrensde_timeout():
+    with StubKadasterServer(latentie=0.5) as server:
+        resolver = KadasterWoonplaatsResolver(
+            endpoint=server.url,
+            stroomonderbreker=Stroomonderbreker("test", max_fouten=1),
+        )
+
+        with tijdsbudget(timedelta(milliseconds=50)):
+            with pytest.raises(TijdsbudgetVerstreken):
+                resolver.zoek_woonplaats("1011AB", 105)
+
+    # een timeout door het tijdsbudget is geen fout van het endpoint
+    assert not resolver.stroomonderbreker.is_open
+
+
+def test_Verrijking_tijdsbudget():
+    class OnbereikbareMonumentenResolver(MonumentenResolver):
+        def zoek_monumenten(self, bag_identificaties):
+            raise AssertionError("Het tijdsbudget is al verstreken")
+
+    verrijking = Verrijking(
+        monumenten_resolver=OnbereikbareMonumentenResolver(),
+        cache=MonumentenCache(),
+        tijdsbudget=timedelta(0),
+    )
+    eenheid = EenhedenEenheid(
+        id="1",
+        adresseerbaar_object_basisregistratie=EenhedenAdresseerbaarObjectBasisregistratie(
+            bag_identificatie="0363010000000001"
+        ),
+    )
+
+    with pytest.warns(UserWarning, match="1 opzoekingen zijn overgeslagen"):
+        rapport = verrijking.verrijk(eenheid)
+
+    assert rapport.aangevuld == []
+    assert rapport.fouten == ["monumenten: tijdsbudget verstreken"]
+    assert eenheid.monumenten is None
+
+
+def test_Verrijking_tijdsbudget_per_eenheid():
+    class TrageWoonplaatsResolver(WoonplaatsResolver):
+        def zoek_woonplaats(
+            self, postcode, huisnummer, huisletter="", huisnummertoevoeging=""
+        ):
+            time.sleep(0.03)
+            return EenhedenWoonplaats(code="3594", naam="Amsterdam")
+
+    verrijking = Verrijking(
+        monumenten=False,
+        woonplaats_resolver=TrageWoonplaatsResolver(),
+        max_workers=1,
+        tijdsbudget=timedelta(milliseconds=500),
+    )
+    eenheden = [
+        maak_onzelfstandige_eenheid(str(huisnummer), huisnummer)
+        for huisnummer in range(1, 31)
+    ]
+
+    # de batch duurt langer dan het budget, maar elke eenheid krijgt haar eigen budget
+    rapporten = verrijking.verrijk_batch(eenheden)
+
+    assert all(rapport.aangevuld == ["woonplaats"] for rapport in rapporten)
+    assert all(rapport.fouten == [] for rapport in rapporten)
+
+
+def test_Verrijking_stroomonderbreker_open():
+    stroomonderbreker = Stroomonderbreker("test", max_fouten=1)
+    stroomonderbreker.registreer_fout()
+    verrijking = Verrijking(
+        monumenten=False,
+        woonplaats_resolver=KadasterWoonplaatsResolver(
+            endpoint="http://127.0.0.1:9/sparql",
+            stroomonderbreker=stroomonderbreker,
+        ),
+    )
+    eenheid = maak_onzelfstandige_eenheid("1", 105)
+
+    with pytest.warns(UserWarning, match="Stroomonderbreker voor test is open"):
+        rapport = verrijking.verrijk(eenheid)
+
+    assert rapport.aangevuld == []
+    assert rapport.fouten == ["woonplaats: Stroomonderbreker voor test is open"]
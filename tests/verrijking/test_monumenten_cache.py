@@ -0,0 +1,56 @@
+from datetime import timedelta
+
+from woningwaardering.vera.referentiedata import Eenheidmonument
+from woningwaardering.verrijking import MonumentenCache
+
+
+def test_monumenten_cache_positief_en_negatief():
+    cache = MonumentenCache()
+    assert cache.get("0363010000000001") is None
+
+    cache.set("0363010000000001", [Eenheidmonument.rijksmonument])
+    cache.set("0363010000000002", [])
+
+    assert cache.get("0363010000000001") == [Eenheidmonument.rijksmonument]
+    assert cache.get("0363010000000002") == []
+    assert cache.ontbrekend(
+        ["0363010000000001", "0363010000000002", "0363010000000003"]
+    ) == ["0363010000000003"]
+
+
+def test_monumenten_cache_ttl():
+    cache = MonumentenCache(ttl=timedelta(days=1), ttl_negatief=timedelta(seconds=-1))
+    cache.set("0363010000000001", [Eenheidmonument.rijksmonument])
+    cache.set("0363010000000002", [])
+
+    assert cache.get("0363010000000001") is not None
+    assert cache.get("0363010000000002") is None
+    assert cache.verwijder_verlopen() == 1
+    assert cache.ontbrekend(["0363010000000001", "0363010000000002"]) == [
+        "0363010000000002"
+    ]
+
+
+def test_monumenten_cache_sqlite(tmp_path):
+    pad = tmp_path / "monumenten.sqlite"
+    cache = MonumentenCache(pad)
+    cache.set("0363010000000001", [Eenheidmonument.gemeentelijk_monument])
+    cache.set("0363010000000002", [])
+    cache.sluit()
+
+    cache = MonumentenCache(pad)
+    assert cache.get("0363010000000001") == [Eenheidmonument.gemeentelijk_monument]
+    assert cache.get("0363010000000002") == []
+
+    geinvalideerd: list[str | None] = []
+    cache.registreer_invalidatie_hook(geinvalideerd.append)
+    cache.invalideer("0363010000000001")
+    cache.sluit()
+
+    cache = MonumentenCache(pad)
+    assert cache.get("0363010000000001") is None
+    assert cache.get("0363010000000002") == []
+    assert geinvalideerd == ["0363010000000001"]
+
+    cache.invalideer()
+    assert cache.get("0363010000000002") is None
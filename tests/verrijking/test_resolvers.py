@@ -0,0 +1,86 @@
+import warnings
+
+from woningwaardering.stelsels.utils import get_woonplaats
+from woningwaardering.vera.bvg.generated import (
+    EenhedenAdresseerbaarObjectBasisregistratie,
+    EenhedenEenheid,
+    EenhedenEenheidadres,
+)
+from woningwaardering.vera.referentiedata import Eenheidmonument
+from woningwaardering.verrijking import (
+    ExtractMonumentenResolver,
+    ExtractWoonplaatsResolver,
+    MonumentenCache,
+    Verrijking,
+)
+
+
+def test_ExtractWoonplaatsResolver(tmp_path):
+    pad = tmp_path / "woonplaatsen.csv"
+    pad.write_text(
+        "postcode,huisnummer,woonplaatscode,woonplaatsnaam\n"
+        "3071AB,12,3086,Rotterdam\n"
+        "3011 AA,1,3086,Rotterdam\n"
+        "1011AB,105,3594,Amsterdam\n"
+        "1011AB,105,3594,Amsterdam\n"
+        "ONGELDIG,1,3594,Amsterdam\n"
+        "1011AB,12a,3594,Amsterdam\n"
+    )
+    resolver = ExtractWoonplaatsResolver(pad)
+
+    assert len(resolver) == 3
+    assert resolver.zoek_woonplaats("1011AB", 105).naam == "Amsterdam"
+    assert resolver.zoek_woonplaats("3011aa", 1, huisletter="b").code == "3086"
+    assert resolver.zoek_woonplaats("3071AB", 13) is None
+    assert resolver.zoek_woonplaats("ABCDEF", 1) is None
+
+    adres = EenhedenEenheidadres(postcode="3071 AB", huisnummer="12")
+    woonplaats = get_woonplaats(adres, resolver=resolver)
+
+    assert woonplaats is not None and woonplaats.naam == "Rotterdam"
+    assert adres.woonplaats == woonplaats
+
+
+def test_ExtractMonumentenResolver(tmp_path):
+    pad = tmp_path / "monumenten.csv"
+    pad.write_text(
+        "bag_identificatie,code\n"
+        "0599010000000001,RIJ\n"
+        "0599010000000001,STA\n"
+        "0599010000000002,GEM\n"
+        "onbekend,RIJ\n"
+    )
+    resolver = ExtractMonumentenResolver(pad)
+
+    assert len(resolver) == 2
+    assert resolver.zoek_monumenten(
+        ["0599010000000001", "0599010000000002", "0599010000000003"]
+    ) == {
+        "0599010000000001": [
+            Eenheidmonument.rijksmonument,
+            Eenheidmonument.beschermd_stadsgezicht,
+        ],
+        "0599010000000002": [Eenheidmonument.gemeentelijk_monument],
+        "0599010000000003": [],
+    }
+    assert (
+        resolver.zoek_monumenten(["0599010000000001"])["0599010000000001"][0].naam
+        == Eenheidmonument.rijksmonument.naam
+    )
+
+    eenheid = EenhedenEenheid(
+        id="1",
+        adresseerbaar_object_basisregistratie=EenhedenAdresseerbaarObjectBasisregistratie(
+            bag_identificatie="0599010000000002"
+        ),
+    )
+    cache = MonumentenCache()
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        Verrijking(
+            woonplaatsen=False, monumenten_resolver=resolver, cache=cache
+        ).verrijk(eenheid)
+
+    assert eenheid.monumenten == [Eenheidmonument.gemeentelijk_monument]
+    assert cache.get("0599010000000002") == [Eenheidmonument.gemeentelijk_monument]
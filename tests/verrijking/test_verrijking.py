@@ -0,0 +1,202 @@
+import warnings
+from datetime import date
+
+import pytest
+
+from woningwaardering.stelsels.onzelfstandige_woonruimten import PrijsopslagMonumenten
+from woningwaardering.stelsels.utils import update_eenheid_monumenten
+from woningwaardering.vera.bvg.generated import (
+    EenhedenAdresseerbaarObjectBasisregistratie,
+    EenhedenEenheid,
+    EenhedenEenheidadres,
+    EenhedenWoonplaats,
+)
+from woningwaardering.vera.referentiedata import (
+    Eenheidmonument,
+    Woningwaarderingstelsel,
+)
+from woningwaardering.verrijking import (
+    ExtractMonumentenResolver,
+    ExtractWoonplaatsResolver,
+    MonumentenCache,
+    MonumentenResolver,
+    Verrijking,
+    WoonplaatsResolver,
+    get_monumenten_resolver,
+    stel_monumenten_resolver_in,
+)
+
+
+class TellendeMonumentenResolver(MonumentenResolver):
+    def __init__(self):
+        self.aanroepen = []
+
+    def zoek_monumenten(self, bag_identificaties):
+        self.aanroepen.append(list(bag_identificaties))
+        return {"0363010000000001": [Eenheidmonument.rijksmonument]}
+
+
+class TellendeWoonplaatsResolver(WoonplaatsResolver):
+    def __init__(self):
+        self.aanroepen = []
+
+    def zoek_woonplaats(
+        self, postcode, huisnummer, huisletter="", huisnummertoevoeging=""
+    ):
+        self.aanroepen.append((postcode, huisnummer))
+        return EenhedenWoonplaats(code="3594", naam="Amsterdam")
+
+
+def maak_eenheid(id, bag_identificatie=None, **kwargs):
+    return EenhedenEenheid(
+        id=id,
+        adresseerbaar_object_basisregistratie=EenhedenAdresseerbaarObjectBasisregistratie(
+            bag_identificatie=bag_identificatie
+        ),
+        **kwargs,
+    )
+
+
+def test_Verrijking_monumenten():
+    resolver = TellendeMonumentenResolver()
+    cache = MonumentenCache()
+    verrijking = Verrijking(monumenten_resolver=resolver, cache=cache, batchgrootte=1)
+
+    eenheden = [
+        maak_eenheid("1", "0363010000000001"),
+        maak_eenheid("2", "0363010000000001"),
+        maak_eenheid("3", "0363010000000002"),
+        maak_eenheid("4", "0363010000000003", monumenten=[]),
+    ]
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        rapporten = verrijking.verrijk_batch(eenheden)
+
+    assert resolver.aanroepen == [["0363010000000001"], ["0363010000000002"]]
+    assert [rapport.aangevuld for rapport in rapporten] == [
+        ["monumenten"],
+        ["monumenten"],
+        ["monumenten"],
+        [],
+    ]
+    assert eenheden[0].monumenten == [Eenheidmonument.rijksmonument]
+    assert eenheden[1].monumenten == [Eenheidmonument.rijksmonument]
+    assert eenheden[2].monumenten == []
+
+    rapport = verrijking.verrijk(maak_eenheid("5", "0363010000000002"))
+    assert rapport.aangevuld == ["monumenten"]
+    assert len(resolver.aanroepen) == 2
+
+
+def test_Verrijking_monumenten_uit_cache():
+    cache = MonumentenCache()
+    cache.set("0363010000000001", [Eenheidmonument.rijksmonument])
+    resolver = TellendeMonumentenResolver()
+    eenheid = maak_eenheid("1", "0363010000000001")
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        rapport = Verrijking(
+            woonplaatsen=False, monumenten_resolver=resolver, cache=cache
+        ).verrijk(eenheid)
+
+    assert resolver.aanroepen == []
+    assert rapport.aangevuld == ["monumenten"]
+    assert eenheid.monumenten == [Eenheidmonument.rijksmonument]
+
+
+def test_update_eenheid_monumenten_verouderd():
+    resolver = TellendeMonumentenResolver()
+    eenheid = maak_eenheid("1", "0363010000000001")
+
+    with pytest.warns(DeprecationWarning):
+        resultaat = update_eenheid_monumenten(
+            eenheid, cache=MonumentenCache(), resolver=resolver
+        )
+
+    assert resultaat is eenheid
+    assert resolver.aanroepen == [["0363010000000001"]]
+    assert eenheid.monumenten == [Eenheidmonument.rijksmonument]
+
+
+def test_Verrijking_woonplaatsen():
+    resolver = TellendeWoonplaatsResolver()
+    verrijking = Verrijking(
+        monumenten=False, woonplaats_resolver=resolver, max_workers=2
+    )
+
+    eenheden = [
+        maak_eenheid(
+            str(huisnummer),
+            woningwaarderingstelsel=Woningwaarderingstelsel.onzelfstandige_woonruimten,
+            adres=EenhedenEenheidadres(postcode="1011 AB", huisnummer=str(huisnummer)),
+        )
+        for huisnummer in range(1, 5)
+    ]
+    eenheden.append(
+        maak_eenheid(
+            "zelfstandig",
+            woningwaarderingstelsel=Woningwaarderingstelsel.zelfstandige_woonruimten,
+            adres=EenhedenEenheidadres(postcode="1011 AB", huisnummer="5"),
+        )
+    )
+
+    rapporten = verrijking.verrijk_batch(eenheden)
+
+    assert sorted(resolver.aanroepen) == [("1011AB", nummer) for nummer in range(1, 5)]
+    assert [rapport.aangevuld for rapport in rapporten] == [["woonplaats"]] * 4 + [[]]
+    assert all(eenheid.adres.woonplaats.naam == "Amsterdam" for eenheid in eenheden[:4])
+    assert eenheden[4].adres.woonplaats is None
+
+
+def test_Verrijking_leeg_extract(tmp_path, monkeypatch):
+    # een leeg extract mag niet terugvallen op de standaard resolvers met netwerk
+    def geen_standaard_resolver():
+        raise AssertionError("De standaard resolver mag niet worden gebruikt")
+
+    monkeypatch.setattr(
+        "woningwaardering.verrijking.verrijking.get_monumenten_resolver",
+        geen_standaard_resolver,
+    )
+    monkeypatch.setattr(
+        "woningwaardering.verrijking.verrijking.get_woonplaats_resolver",
+        geen_standaard_resolver,
+    )
+    woonplaatsen = tmp_path / "woonplaatsen.csv"
+    woonplaatsen.write_text("postcode,huisnummer,woonplaatscode,woonplaatsnaam\n")
+    monumenten = tmp_path / "monumenten.csv"
+    monumenten.write_text("bag_identificatie,code\n")
+    verrijking = Verrijking(
+        woonplaats_resolver=ExtractWoonplaatsResolver(woonplaatsen),
+        monumenten_resolver=ExtractMonumentenResolver(monumenten),
+        cache=MonumentenCache(),
+    )
+    eenheid = maak_eenheid(
+        "1",
+        "0363010000000001",
+        woningwaarderingstelsel=Woningwaarderingstelsel.onzelfstandige_woonruimten,
+        adres=EenhedenEenheidadres(postcode="1011 AB", huisnummer="1"),
+    )
+
+    verrijking.verrijk(eenheid)
+
+    assert eenheid.monumenten == []
+    assert eenheid.adres.woonplaats is None
+
+
+def test_stelselgroep_zonder_io():
+    class OnbereikbareMonumentenResolver(MonumentenResolver):
+        def zoek_monumenten(self, bag_identificaties):
+            raise AssertionError("Stelselgroepen mogen geen monumenten opzoeken")
+
+    standaard_resolver = get_monumenten_resolver()
+    stel_monumenten_resolver_in(OnbereikbareMonumentenResolver())
+    try:
+        eenheid = maak_eenheid("1", "0363010000000001")
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            PrijsopslagMonumenten(peildatum=date(2025, 1, 1)).waardeer(eenheid)
+        assert eenheid.monumenten is None
+    finally:
+        stel_monumenten_resolver_in(standaard_resolver)
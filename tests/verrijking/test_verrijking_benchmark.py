@@ -0,0 +1,182 @@
+import time
+import warnings
+
+import pytest
+
+from tests.stubservers import (
+    StubKadasterServer,
+    StubMonumentenResolver,
+    StubMonumentenServer,
+)
+from woningwaardering.vera.bvg.generated import (
+    EenhedenAdresseerbaarObjectBasisregistratie,
+    EenhedenEenheid,
+    EenhedenEenheidadres,
+)
+from woningwaardering.vera.referentiedata import (
+    Eenheidmonument,
+    Woningwaarderingstelsel,
+)
+from woningwaardering.verrijking import (
+    KadasterWoonplaatsResolver,
+    MonumentenCache,
+    Stroomonderbreker,
+    Verrijking,
+)
+
+AANTAL_EENHEDEN = 40
+LATENTIE = 0.01
+
+
+def maak_eenheden(aantal: int = AANTAL_EENHEDEN) -> list[EenhedenEenheid]:
+    return [
+        EenhedenEenheid(
+            id=str(nummer),
+            woningwaarderingstelsel=Woningwaarderingstelsel.onzelfstandige_woonruimten,
+            adresseerbaar_object_basisregistratie=EenhedenAdresseerbaarObjectBasisregistratie(
+                bag_identificatie=f"0599010000{nummer:06d}"
+            ),
+            adres=EenhedenEenheidadres(postcode="3071 AB", huisnummer=str(nummer)),
+        )
+        for nummer in range(1, aantal + 1)
+    ]
+
+
+def meet_doorvoer(verrijking: Verrijking, eenheden: list[EenhedenEenheid]) -> float:
+    start = time.perf_counter()
+    verrijking.verrijk_batch(eenheden)
+    duur = time.perf_counter() - start
+    print(
+        f"{len(eenheden)} eenheden in {duur:.3f}s ({len(eenheden) / duur:.0f} eenheden/s)"
+    )
+    return duur
+
+
+@pytest.fixture()
+def kadaster():
+    with StubKadasterServer(latentie=LATENTIE) as server:
+        yield server
+
+
+@pytest.fixture()
+def monumenten():
+    with StubMonumentenServer(
+        monumenten={"0599010000000001": ["RIJ"]}, latentie=LATENTIE
+    ) as server:
+        yield server
+
+
+def test_StubKadasterServer(kadaster):
+    resolver = KadasterWoonplaatsResolver(endpoint=kadaster.url)
+
+    woonplaats = resolver.zoek_woonplaats("3071AB", 12)
+
+    assert woonplaats is not None
+    assert (woonplaats.code, woonplaats.naam) == ("3086", "Rotterdam")
+    assert kadaster.aantal_verzoeken == 1
+
+
+def test_StubMonumentenServer(monumenten):
+    resolver = StubMonumentenResolver(monumenten.url)
+
+    resultaat = resolver.zoek_monumenten(["0599010000000001", "0599010000000002"])
+
+    assert resultaat == {
+        "0599010000000001": [Eenheidmonument.rijksmonument],
+        "0599010000000002": [],
+    }
+    assert monumenten.aantal_verzoeken == 1
+
+
+def test_monumenten_batching_en_caching(monumenten):
+    resolver = StubMonumentenResolver(monumenten.url)
+    eenheden = maak_eenheden()
+
+    # zonder batching en zonder cache: één verzoek per eenheid
+    Verrijking(
+        woonplaatsen=False,
+        monumenten_resolver=resolver,
+        cache=MonumentenCache(),
+        batchgrootte=1,
+    ).verrijk_batch(maak_eenheden())
+    assert monumenten.aantal_verzoeken == AANTAL_EENHEDEN
+
+    # met batching: één verzoek voor de hele batch
+    verrijking = Verrijking(
+        woonplaatsen=False, monumenten_resolver=resolver, cache=MonumentenCache()
+    )
+    rapporten = verrijking.verrijk_batch(eenheden)
+    assert monumenten.aantal_verzoeken == AANTAL_EENHEDEN + 1
+    assert all(rapport.aangevuld == ["monumenten"] for rapport in rapporten)
+    assert eenheden[0].monumenten == [Eenheidmonument.rijksmonument]
+
+    # met een gevulde cache: geen verzoeken meer
+    verrijking.verrijk_batch(maak_eenheden())
+    assert monumenten.aantal_verzoeken == AANTAL_EENHEDEN + 1
+
+
+def test_woonplaatsen_gelijktijdigheid(kadaster):
+    resolver = KadasterWoonplaatsResolver(endpoint=kadaster.url)
+
+    rapporten = Verrijking(
+        monumenten=False, woonplaats_resolver=resolver, max_workers=8
+    ).verrijk_batch(maak_eenheden())
+
+    assert kadaster.aantal_verzoeken == AANTAL_EENHEDEN
+    assert all(rapport.aangevuld == ["woonplaats"] for rapport in rapporten)
+
+
+@pytest.mark.benchmark
+def test_benchmark_monumenten_batching(monumenten):
+    resolver = StubMonumentenResolver(monumenten.url)
+
+    duur_zonder_batching = meet_doorvoer(
+        Verrijking(
+            woonplaatsen=False,
+            monumenten_resolver=resolver,
+            cache=MonumentenCache(),
+            batchgrootte=1,
+        ),
+        maak_eenheden(),
+    )
+    duur_met_batching = meet_doorvoer(
+        Verrijking(
+            woonplaatsen=False, monumenten_resolver=resolver, cache=MonumentenCache()
+        ),
+        maak_eenheden(),
+    )
+
+    assert duur_met_batching < duur_zonder_batching
+
+
+@pytest.mark.benchmark
+def test_benchmark_woonplaatsen_gelijktijdigheid(kadaster):
+    resolver = KadasterWoonplaatsResolver(endpoint=kadaster.url)
+
+    duur_sequentieel = meet_doorvoer(
+        Verrijking(monumenten=False, woonplaats_resolver=resolver, max_workers=1),
+        maak_eenheden(),
+    )
+    duur_gelijktijdig = meet_doorvoer(
+        Verrijking(monumenten=False, woonplaats_resolver=resolver, max_workers=8),
+        maak_eenheden(),
+    )
+
+    assert duur_gelijktijdig < duur_sequentieel
+
+
+def test_woonplaatsen_stroomonderbreker():
+    with StubKadasterServer(latentie=LATENTIE, foutkans=1.0) as kadaster:
+        resolver = KadasterWoonplaatsResolver(
+            endpoint=kadaster.url,
+            stroomonderbreker=Stroomonderbreker("de stub", max_fouten=3),
+        )
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            rapporten = Verrijking(
+                monumenten=False, woonplaats_resolver=resolver, max_workers=1
+            ).verrijk_batch(maak_eenheden())
+
+    # na drie fouten wordt de stub niet meer geraadpleegd
+    assert kadaster.aantal_verzoeken == 3
+    assert not any(rapport.aangevuld for rapport in rapporten)
@@ -3,17 +3,12 @@ import os
 import sys
 import time
 import warnings
-from decimal import BasicContext, setcontext
 from types import TracebackType
 
 from loguru import logger
 
 from woningwaardering._logging import log_userwarning
 
-# Set context for all calculations to avoid rounding errors
-# See https://docs.python.org/3/library/decimal.html#rounding
-setcontext(BasicContext)
-
 default_timezone = "Europe/Amsterdam"
 
 
@@ -1,14 +1,18 @@
 from datetime import date
+from functools import partial
+from typing import Iterable
 
 from woningwaardering.stelsels._dev_utils import DevelopmentContext
 from woningwaardering.stelsels.onzelfstandige_woonruimten.onzelfstandige_woonruimten import (
     OnzelfstandigeWoonruimten,
 )
+from woningwaardering.stelsels.utils import voer_gelijktijdig_uit
 from woningwaardering.stelsels.zelfstandige_woonruimten.zelfstandige_woonruimten import (
     ZelfstandigeWoonruimten,
 )
 from woningwaardering.vera.bvg.generated import (
     EenhedenEenheid,
+    Referentiedata,
     WoningwaarderingResultatenWoningwaarderingResultaat,
 )
 from woningwaardering.vera.referentiedata import (
@@ -34,11 +38,16 @@ class Woningwaardering:
     def waardeer(
         self,
         eenheid: EenhedenEenheid,
+        *,
+        met_woningwaarderingen: bool = True,
     ) -> WoningwaarderingResultatenWoningwaarderingResultaat:
         """Berekent de woningwaardering voor een eenheid door automatisch het juiste stelsel te detecteren.
 
         Parameters:
             eenheid (EenhedenEenheid): De eenheid waarvoor de woningwaardering wordt berekend.
+            met_woningwaarderingen (bool, optional): Of het resultaat de woningwaarderingen per criterium bevat.
+                Met False worden ze na de berekening weggelaten en bevatten de groepen alleen de punten
+                en het opslagpercentage.
 
         Returns:
             WoningwaarderingResultatenWoningwaarderingResultaat: Het resultaat van de woningwaardering.
@@ -46,6 +55,58 @@ class Woningwaardering:
         Raises:
             ValueError: Als het type woonruimte niet kan worden bepaald.
         """
+        return self._stelsel(eenheid).waardeer(
+            eenheid, met_woningwaarderingen=met_woningwaarderingen
+        )
+
+    def waardeer_batch(
+        self,
+        eenheden: Iterable[EenhedenEenheid],
+        *,
+        max_workers: int | None = None,
+        met_woningwaarderingen: bool = True,
+    ) -> list[WoningwaarderingResultatenWoningwaarderingResultaat]:
+        """Berekent de woningwaardering voor een batch eenheden in een pool van threads.
+
+        Het stelsel wordt per woningwaarderingstelsel één keer aangemaakt en door alle
+        eenheden met dat stelsel gedeeld. De eenheden zelf worden niet aangepast, ook
+        niet door de verrijking. Zie `Stelsel.waardeer_batch`.
+
+        Parameters:
+            eenheden (Iterable[EenhedenEenheid]): De eenheden waarvoor de woningwaardering wordt berekend.
+            max_workers (int | None, optional): Het maximale aantal threads.
+                Standaard bepaalt `ThreadPoolExecutor` het aantal.
+            met_woningwaarderingen (bool, optional): Of de resultaten de woningwaarderingen per criterium bevatten.
+
+        Returns:
+            list[WoningwaarderingResultatenWoningwaarderingResultaat]: De resultaten, in de volgorde van de eenheden.
+
+        Raises:
+            ValueError: Als van een eenheid het type woonruimte niet kan worden bepaald.
+                Er wordt dan geen enkele eenheid gewaardeerd.
+        """
+        stelsels: dict[
+            Referentiedata | None, ZelfstandigeWoonruimten | OnzelfstandigeWoonruimten
+        ] = {}
+        taken = []
+        for eenheid in eenheden:
+            # Referentiedata wordt vergeleken op code
+            if eenheid.woningwaarderingstelsel not in stelsels:
+                stelsels[eenheid.woningwaarderingstelsel] = self._stelsel(eenheid)
+            stelsel = stelsels[eenheid.woningwaarderingstelsel]
+            taken.append(
+                partial(
+                    stelsel.waardeer,
+                    eenheid,
+                    met_woningwaarderingen=met_woningwaarderingen,
+                )
+            )
+
+        return voer_gelijktijdig_uit(taken, max_workers=max_workers)
+
+    def _stelsel(
+        self, eenheid: EenhedenEenheid
+    ) -> ZelfstandigeWoonruimten | OnzelfstandigeWoonruimten:
         if (
             eenheid.woningwaarderingstelsel is None
             or eenheid.woningwaarderingstelsel is None
@@ -73,7 +134,7 @@ class Woningwaardering:
         ):
             stelsel = OnzelfstandigeWoonruimten(peildatum=self.peildatum)
 
-        return stelsel.waardeer(eenheid)
+        return stelsel
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -16,6 +16,7 @@ from woningwaardering.vera.bvg.generated import (
     WoningwaarderingResultatenWoningwaarderingGroep,
     WoningwaarderingResultatenWoningwaarderingResultaat,
 )
+from woningwaardering.vera.inlezen import lees_eenheid_json
 
 
 class DevelopmentContext:
@@ -94,7 +95,7 @@ class DevelopmentContext:
     def _load_eenheid(self, eenheid_input: EenhedenEenheid | str) -> EenhedenEenheid:
         if isinstance(eenheid_input, str):
             with open(eenheid_input, "r") as file:
-                return EenhedenEenheid.model_validate_json(file.read())
+                return lees_eenheid_json(file.read())
         return eenheid_input
 
     def waardeer(
@@ -0,0 +1,128 @@
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+# Tot deze grootte heeft een geschaald getal hooguit 15 significante cijfers en is het
+# exact als float weer te geven.
+_GRENS = 10**15
+_MAX_DECIMALEN = 9
+
+
+def _controleer_decimalen(decimalen: int) -> None:
+    if not 0 <= decimalen <= _MAX_DECIMALEN:
+        raise ValueError(
+            f"Het aantal decimalen moet tussen 0 en {_MAX_DECIMALEN} liggen, niet {decimalen}."
+        )
+
+
+def schaal(getallen: ArrayLike, decimalen: int) -> NDArray[np.int64]:
+    """
+    Zet getallen om naar gehele getallen geschaald met 10 ** decimalen.
+
+    Een float wordt geïnterpreteerd zoals `Decimal(str(getal))`, dus 0.1 wordt bij
+    twee decimalen precies 10. De geschaalde getallen kunnen met `rond_af` en
+    `rond_af_op_kwart` in één keer exact worden afgerond.
+
+    Args:
+        getallen (ArrayLike): De getallen.
+        decimalen (int): Het aantal decimalen van de schaal.
+
+    Returns:
+        NDArray[np.int64]: De geschaalde getallen.
+
+    Raises:
+        ValueError: Als een getal niet exact met het aantal decimalen is weer te geven.
+    """
+    _controleer_decimalen(decimalen)
+    waarden = np.asarray(getallen, dtype=np.float64)
+    factor = 10.0**decimalen
+    with np.errstate(invalid="ignore", over="ignore"):
+        geschaald = np.rint(waarden * factor)
+        # Als het geschaalde getal gedeeld door de factor weer exact het getal oplevert,
+        # is de kortste weergave van het getal gelijk aan het geschaalde getal.
+        exact = (geschaald / factor == waarden) & (np.abs(geschaald) < _GRENS)
+    if not np.all(exact):
+        eerste = waarden[~exact].flat[0]
+        raise ValueError(
+            f"{eerste} is niet exact weer te geven met {decimalen} decimalen."
+        )
+    return geschaald.astype(np.int64)
+
+
+def rond_af(
+    waarden: NDArray[np.integer], decimalen: int, naar_decimalen: int
+) -> NDArray[np.int64]:
+    """
+    Rondt geschaalde getallen af op een aantal decimalen met ROUND_HALF_UP, gelijk aan
+    `woningwaardering.stelsels.utils.rond_af`.
+
+    Args:
+        waarden (NDArray[np.integer]): Getallen geschaald met 10 ** decimalen.
+        decimalen (int): Het aantal decimalen van de schaal.
+        naar_decimalen (int): Het aantal decimalen om op af te ronden.
+
+    Returns:
+        NDArray[np.int64]: De afgeronde getallen, in dezelfde schaal.
+    """
+    _controleer_decimalen(decimalen)
+    if naar_decimalen >= decimalen:
+        return np.asarray(waarden, dtype=np.int64)
+    return _rond_af_op_stap(waarden, 10 ** (decimalen - naar_decimalen))
+
+
+def rond_af_op_kwart(waarden: NDArray[np.integer], decimalen: int) -> NDArray[np.int64]:
+    """
+    Rondt geschaalde getallen af op een kwart, gelijk aan
+    `woningwaardering.stelsels.utils.rond_af_op_kwart`.
+
+    Een achtste wordt naar boven afgerond, dus 0,125 wordt 0,25. Om dat exact te
+    kunnen weergeven zijn drie decimalen nodig. Anders dan de scalaire functie, die
+    met 9 significante cijfers deelt, is de afronding ook voor grote getallen met veel
+    decimalen exact.
+
+    Args:
+        waarden (NDArray[np.integer]): Getallen geschaald met 10 ** decimalen.
+        decimalen (int): Het aantal decimalen van de schaal, minimaal 2.
+
+    Returns:
+        NDArray[np.int64]: De afgeronde getallen, in dezelfde schaal.
+
+    Raises:
+        ValueError: Als de schaal minder dan twee decimalen heeft.
+    """
+    _controleer_decimalen(decimalen)
+    if decimalen < 2:
+        raise ValueError("Afronden op een kwart kan alleen vanaf twee decimalen.")
+    return _rond_af_op_stap(waarden, 25 * 10 ** (decimalen - 2))
+
+
+def _rond_af_op_stap(waarden: NDArray[np.integer], stap: int) -> NDArray[np.int64]:
+    # ROUND_HALF_UP rondt de helft af van nul af
+    waarden = np.asarray(waarden, dtype=np.int64)
+    aantal, rest = np.divmod(np.abs(waarden), stap)
+    aantal += 2 * rest >= stap
+    return np.where(waarden < 0, -aantal, aantal) * stap
+
+
+def naar_float(
+    waarden: NDArray[np.integer],
+    decimalen: int,
+    teken: ArrayLike | None = None,
+) -> NDArray[np.float64]:
+    """
+    Zet geschaalde getallen om naar floats, gelijk aan `float` van de overeenkomstige
+    Decimals.
+
+    Args:
+        waarden (NDArray[np.integer]): Getallen geschaald met 10 ** decimalen.
+        decimalen (int): Het aantal decimalen van de schaal.
+        teken (ArrayLike | None): De oorspronkelijke getallen. Een tot nul afgerond
+            negatief getal is in Decimal -0 en wordt dan -0.0.
+
+    Returns:
+        NDArray[np.float64]: De getallen als float.
+    """
+    _controleer_decimalen(decimalen)
+    resultaat = np.asarray(waarden, dtype=np.int64) / 10.0**decimalen
+    if teken is not None:
+        resultaat = np.copysign(resultaat, np.asarray(teken, dtype=np.float64))
+    return resultaat
@@ -5,7 +5,8 @@ from typing import Iterator
 from loguru import logger
 
 from woningwaardering.stelsels.criterium_id import CriteriumId
-from woningwaardering.stelsels.utils import gedeeld_met_eenheden, rond_af
+from woningwaardering.stelsels.ruimte_index import RuimteIndex
+from woningwaardering.stelsels.utils import rond_af
 from woningwaardering.vera.bvg.generated import (
     EenhedenEenheid,
     WoningwaarderingResultatenWoningwaardering,
@@ -21,7 +22,6 @@ from woningwaardering.vera.referentiedata import (
     WoningwaarderingstelselgroepReferentiedata,
     WoningwaarderingstelselReferentiedata,
 )
-from woningwaardering.vera.utils import aantal_bouwkundige_elementen
 
 
 def waardeer_bijzondere_voorzieningen(
@@ -180,10 +180,12 @@ def _aanbelfunctie_met_video_en_audioverbinding(
         WoningwaarderingResultatenWoningwaardering | None: De woningwaardering met 0,25 punt
         als de eenheid een aanbelfunctie met video en audio heeft, anders None.
     """
+    index = RuimteIndex.voor(eenheid)
     if not any(
-        installatie == Voorzieningsoort.aanbelfunctie_met_video_en_audioverbinding
-        for ruimte in (eenheid.ruimten or [])
-        for installatie in (ruimte.installaties or [])
+        index.gegevens(ruimte).aantal_installaties(
+            Voorzieningsoort.aanbelfunctie_met_video_en_audioverbinding
+        )
+        for ruimte in eenheid.ruimten or []
     ):
         logger.debug(
             f"Eenheid ({eenheid.id}) heeft geen aanbelfunctie met video en audioverbinding"
@@ -220,10 +222,11 @@ def _prive_laadpaal(
         WoningwaarderingResultatenWoningwaardering | None: De woningwaardering met 2 punten
         als de eenheid een laadpaal heeft, anders None.
     """
+    index = RuimteIndex.voor(eenheid)
     aantal_laadpalen = sum(
-        aantal_bouwkundige_elementen(ruimte, Bouwkundigelementdetailsoort.laadpaal)
-        for ruimte in eenheid.ruimten or []
-        if not gedeeld_met_eenheden(ruimte)
+        gegevens.aantal_bouwkundige_elementen(Bouwkundigelementdetailsoort.laadpaal)
+        for gegevens in map(index.gegevens, eenheid.ruimten or [])
+        if not gegevens.gedeeld_met_eenheden
     )
 
     if aantal_laadpalen == 0:
@@ -6,6 +6,7 @@ from loguru import logger
 
 from woningwaardering.stelsels import utils
 from woningwaardering.stelsels.criterium_id import CriteriumId
+from woningwaardering.stelsels.ruimte_index import ruimte_gegevens
 from woningwaardering.vera.bvg.generated import (
     EenhedenRuimte,
     Referentiedata,
@@ -17,7 +18,6 @@ from woningwaardering.vera.referentiedata import (
     Ruimtedetailsoort,
     Woningwaarderingstelselgroep,
 )
-from woningwaardering.vera.utils import heeft_bouwkundig_element
 
 parkeertype_punten_mapping: dict[Referentiedata, dict[str, Decimal]] = {
     Ruimtedetailsoort.parkeervak_auto_binnen: {"Type I": Decimal("9.0")},
@@ -110,7 +110,9 @@ def waardeer_gemeenschappelijke_parkeerruimte(
     ) in parkeertype_punten_mapping[ruimte.detail_soort].items():
         criterium = f"{type_parkeeruimte}"
 
-        if heeft_bouwkundig_element(ruimte, Bouwkundigelementdetailsoort.laadpaal):
+        if ruimte_gegevens(ruimte).heeft_bouwkundig_element(
+            Bouwkundigelementdetailsoort.laadpaal
+        ):
             punten += Decimal("2.0")
             criterium += " + laadpaal"
 
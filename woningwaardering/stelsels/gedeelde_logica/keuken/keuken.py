@@ -1,13 +1,17 @@
 import warnings
-from collections import Counter
+from dataclasses import dataclass
+from datetime import date
 from decimal import Decimal
-from typing import Iterator
+from types import MappingProxyType
+from typing import Iterator, Mapping
 
 from loguru import logger
 
 from woningwaardering.stelsels.criterium_id import CriteriumId
+from woningwaardering.stelsels.ruimte_index import ruimte_gegevens
 from woningwaardering.stelsels.utils import (
     gedeeld_met_onzelfstandige_woonruimten,
+    geldig_op,
     rond_af,
 )
 from woningwaardering.vera.bvg.generated import (
@@ -28,10 +32,78 @@ from woningwaardering.vera.referentiedata import (
 from woningwaardering.vera.utils import get_bouwkundige_elementen
 
 
+@dataclass(frozen=True, slots=True)
+class _Keukenpunten:
+    """
+    De punten voor extra keukenvoorzieningen uit één beleidsboek.
+
+    Attributes:
+        extra_voorzieningen (Mapping[Referentiedata, Decimal]): De punten per extra voorziening.
+        max_extra_voorzieningen (Decimal): Het maximum voor de extra voorzieningen.
+        max_extra_voorzieningen_lang_aanrecht (Decimal): Het maximum voor de extra
+            voorzieningen bij een lang aanrecht.
+        aanrechtlengte_lang_aanrecht (Decimal): De totale aanrechtlengte in mm vanaf
+            waar een aanrecht lang is.
+    """
+
+    extra_voorzieningen: Mapping[Referentiedata, Decimal]
+    max_extra_voorzieningen: Decimal
+    max_extra_voorzieningen_lang_aanrecht: Decimal
+    aanrechtlengte_lang_aanrecht: Decimal
+
+
+# De punten per beleidsboek, op begindatum. De waardering gebruikt de tabel die op
+# de peildatum geldt, dus een nieuw beleidsboek is een nieuwe regel in deze tuple.
+# De tabellen worden eenmalig bij de import opgebouwd en tijdens de waardering
+# alleen gelezen.
+_KEUKENPUNTEN: tuple[tuple[date, _Keukenpunten], ...] = (
+    (
+        date(2024, 7, 1),
+        _Keukenpunten(
+            extra_voorzieningen=MappingProxyType(
+                {
+                    Voorzieningsoort.inbouw_afzuiginstallatie: Decimal("0.75"),
+                    Voorzieningsoort.inbouw_kookplaat_inductie: Decimal("1.75"),
+                    Voorzieningsoort.inbouw_kookplaat_keramisch: Decimal("1.0"),
+                    Voorzieningsoort.inbouw_kookplaat_gas: Decimal("0.5"),
+                    Voorzieningsoort.inbouw_koelkast: Decimal("1.0"),
+                    Voorzieningsoort.inbouw_vrieskast: Decimal("0.75"),
+                    Voorzieningsoort.inbouw_oven_elektrisch: Decimal("1.0"),
+                    Voorzieningsoort.inbouw_oven_gas: Decimal("0.5"),
+                    Voorzieningsoort.inbouw_magnetron: Decimal("1.0"),
+                    Voorzieningsoort.inbouw_vaatwasmachine: Decimal("1.5"),
+                    Voorzieningsoort.extra_keukenkastruimte_boven_het_minimum: Decimal(
+                        "0.75"
+                    ),
+                    Voorzieningsoort.eenhandsmengkraan: Decimal("0.25"),
+                    Voorzieningsoort.thermostatische_mengkraan: Decimal("0.5"),
+                    Voorzieningsoort.kokend_waterfunctie: Decimal("0.5"),
+                }
+            ),
+            max_extra_voorzieningen=Decimal("4"),
+            max_extra_voorzieningen_lang_aanrecht=Decimal("7"),
+            aanrechtlengte_lang_aanrecht=Decimal("2000"),
+        ),
+    ),
+)
+
+
 def waardeer_keuken(
     ruimte: EenhedenRuimte,
     stelsel: WoningwaarderingstelselReferentiedata,
+    peildatum: date,
 ) -> Iterator[WoningwaarderingResultatenWoningwaardering]:
+    """
+    Waardeert een keuken met de punten die op de peildatum gelden.
+
+    Args:
+        ruimte (EenhedenRuimte): De ruimte.
+        stelsel (WoningwaarderingstelselReferentiedata): Het woningwaarderingstelsel.
+        peildatum (date): De peildatum van de waardering.
+
+    Yields:
+        WoningwaarderingResultatenWoningwaardering: De waarderingen van de keuken.
+    """
     if not _is_keuken(ruimte):
         logger.debug(
             f"Ruimte '{ruimte.naam}' ({ruimte.id}) telt niet mee voor {Woningwaarderingstelselgroep.keuken.naam}"
@@ -40,7 +112,9 @@ def waardeer_keuken(
 
     yield from _waardeer_aanrecht(ruimte, stelsel)
 
-    yield from _waardeer_extra_voorzieningen(ruimte)
+    yield from _waardeer_extra_voorzieningen(
+        ruimte, geldig_op(_KEUKENPUNTEN, peildatum)
+    )
 
 
 def _is_keuken(ruimte: EenhedenRuimte) -> bool:
@@ -173,12 +247,14 @@ def _waardeer_aanrecht(
 
 def _waardeer_extra_voorzieningen(
     ruimte: EenhedenRuimte,
+    keukenpunten: _Keukenpunten,
 ) -> Iterator[WoningwaarderingResultatenWoningwaardering]:
     """
     Waardeert de extra voorzieningen van een keuken.
 
     Args:
         ruimte (EenhedenRuimte): De keuken waarvan de extra voorzieningen gewaardeerd worden.
+        keukenpunten (_Keukenpunten): De punten uit het geldende beleidsboek.
 
     Yields:
         WoningwaarderingResultatenWoningwaardering: De gewaardeerde extra voorzieningen.
@@ -189,38 +265,16 @@ def _waardeer_extra_voorzieningen(
         if element.detail_soort == Bouwkundigelementdetailsoort.aanrecht
     )
 
-    punten_per_installatie: dict[Referentiedata, float] = {
-        Voorzieningsoort.inbouw_afzuiginstallatie: 0.75,
-        Voorzieningsoort.inbouw_kookplaat_inductie: 1.75,
-        Voorzieningsoort.inbouw_kookplaat_keramisch: 1.0,
-        Voorzieningsoort.inbouw_kookplaat_gas: 0.5,
-        Voorzieningsoort.inbouw_koelkast: 1.0,
-        Voorzieningsoort.inbouw_vrieskast: 0.75,
-        Voorzieningsoort.inbouw_oven_elektrisch: 1.0,
-        Voorzieningsoort.inbouw_oven_gas: 0.5,
-        Voorzieningsoort.inbouw_magnetron: 1.0,
-        Voorzieningsoort.inbouw_vaatwasmachine: 1.5,
-        Voorzieningsoort.extra_keukenkastruimte_boven_het_minimum: 0.75,
-        Voorzieningsoort.eenhandsmengkraan: 0.25,
-        Voorzieningsoort.thermostatische_mengkraan: 0.5,
-        Voorzieningsoort.kokend_waterfunctie: 0.5,
-    }
-
-    voorziening_counts = Counter(
-        voorziening
-        for voorziening in ruimte.installaties or []
-        if voorziening in punten_per_installatie
-    )
-    punten_voor_extra_voorzieningen = sum(
-        Decimal(str(punten_per_installatie[voorziening])) * Decimal(str(count))
-        for voorziening, count in voorziening_counts.items()
-    )
+    punten_voor_extra_voorzieningen = Decimal("0")
+
+    for voorziening, count in ruimte_gegevens(ruimte).installaties.items():
+        punten_per_voorziening = keukenpunten.extra_voorzieningen.get(voorziening)
+        if punten_per_voorziening is None:
+            continue
+
+        punten_voor_voorziening = punten_per_voorziening * count
+        punten_voor_extra_voorzieningen += punten_voor_voorziening
 
-    for voorziening, count in voorziening_counts.items():
-        punten = rond_af(
-            Decimal(str(punten_per_installatie[voorziening])) * Decimal(str(count)),
-            decimalen=2,
-        )
         logger.info(
             f"Ruimte '{ruimte.naam}' ({ruimte.id}): {count}x een '{voorziening.naam}' voor {Woningwaarderingstelselgroep.keuken.naam}."
         )
@@ -238,13 +292,15 @@ def _waardeer_extra_voorzieningen(
                         )
                     ),
                 ),
-                punten=float(punten),
+                punten=float(rond_af(punten_voor_voorziening, decimalen=2)),
                 aantal=count,
             )
         )
 
     max_punten_voorzieningen = (
-        Decimal("7") if totaal_lengte_aanrechten >= Decimal("2000") else Decimal("4")
+        keukenpunten.max_extra_voorzieningen_lang_aanrecht
+        if totaal_lengte_aanrechten >= keukenpunten.aanrechtlengte_lang_aanrecht
+        else keukenpunten.max_extra_voorzieningen
     )
     if punten_voor_extra_voorzieningen > max_punten_voorzieningen:
         aftrek = max_punten_voorzieningen - punten_voor_extra_voorzieningen
@@ -4,8 +4,8 @@ from typing import Iterator
 from loguru import logger
 
 from woningwaardering.stelsels.criterium_id import CriteriumId
+from woningwaardering.stelsels.ruimte_index import ruimte_gegevens
 from woningwaardering.stelsels.utils import (
-    classificeer_ruimte,
     rond_af,
     rond_af_op_kwart,
     voeg_oppervlakte_kasten_toe_aan_ruimte,
@@ -22,19 +22,19 @@ from woningwaardering.vera.referentiedata import (
     Ruimtesoort,
     Woningwaarderingstelselgroep,
 )
-from woningwaardering.vera.utils import heeft_bouwkundig_element
 
 
 def waardeer_oppervlakte_van_overige_ruimte(
     ruimte: EenhedenRuimte,
 ) -> Iterator[WoningwaarderingResultatenWoningwaardering]:
-    if classificeer_ruimte(ruimte) != Ruimtesoort.overige_ruimten:
+    gegevens = ruimte_gegevens(ruimte)
+    if gegevens.classificatie != Ruimtesoort.overige_ruimten:
         logger.debug(
             f"Ruimte '{ruimte.naam}' ({ruimte.id}) telt niet mee voor {Woningwaarderingstelselgroep.oppervlakte_van_overige_ruimten.naam}"
         )
         return
 
-    criterium_naam = voeg_oppervlakte_kasten_toe_aan_ruimte(ruimte)
+    criterium_naam = voeg_oppervlakte_kasten_toe_aan_ruimte(ruimte, gegevens.kasten)
 
     logger.info(
         f"Ruimte '{ruimte.naam}' ({ruimte.id}) van {ruimte.oppervlakte:.2f}m2 telt mee voor {Woningwaarderingstelselgroep.oppervlakte_van_overige_ruimten.naam}"
@@ -61,7 +61,7 @@ def waardeer_oppervlakte_van_overige_ruimte(
         # Note: Op dit moment kan de zolder alleen een
         # Bouwkundigelementdetailsoort.trap (vast) of Bouwkundigelementdetailsoort.vlizotrap (niet vast)
         # hebben vanwege classificeer_ruimte in utils.py.
-        if heeft_bouwkundig_element(ruimte, Bouwkundigelementdetailsoort.vlizotrap):
+        if gegevens.heeft_bouwkundig_element(Bouwkundigelementdetailsoort.vlizotrap):
             logger.info(
                 f"Ruimte '{ruimte.naam}' ({ruimte.id}): maximaal correctie van -5 punten: zolder is niet bereikbaar via een vaste trap."
             )
@@ -4,8 +4,8 @@ from typing import Iterator
 from loguru import logger
 
 from woningwaardering.stelsels.criterium_id import CriteriumId
+from woningwaardering.stelsels.ruimte_index import ruimte_gegevens
 from woningwaardering.stelsels.utils import (
-    classificeer_ruimte,
     rond_af,
     voeg_oppervlakte_kasten_toe_aan_ruimte,
 )
@@ -24,7 +24,8 @@ from woningwaardering.vera.referentiedata import (
 def waardeer_oppervlakte_van_vertrek(
     ruimte: EenhedenRuimte,
 ) -> Iterator[WoningwaarderingResultatenWoningwaardering]:
-    if not classificeer_ruimte(ruimte) == Ruimtesoort.vertrek:
+    gegevens = ruimte_gegevens(ruimte)
+    if not gegevens.classificatie == Ruimtesoort.vertrek:
         logger.debug(
             f"Ruimte '{ruimte.naam}' ({ruimte.id}) telt niet mee voor {Woningwaarderingstelselgroep.oppervlakte_van_vertrekken.naam}"
         )
@@ -37,7 +38,7 @@ def waardeer_oppervlakte_van_vertrek(
         )
         return
 
-    criterium_naam = voeg_oppervlakte_kasten_toe_aan_ruimte(ruimte)
+    criterium_naam = voeg_oppervlakte_kasten_toe_aan_ruimte(ruimte, gegevens.kasten)
 
     logger.info(
         f"Ruimte '{ruimte.naam}' ({ruimte.id}) van {ruimte.oppervlakte:.2f}m2 telt mee voor {Woningwaarderingstelselgroep.oppervlakte_van_vertrekken.naam}"
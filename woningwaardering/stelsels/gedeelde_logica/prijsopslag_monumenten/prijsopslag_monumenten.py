@@ -4,7 +4,6 @@ from datetime import date
 from loguru import logger
 
 from woningwaardering.stelsels.criterium_id import CriteriumId
-from woningwaardering.stelsels.utils import update_eenheid_monumenten
 from woningwaardering.vera.bvg.generated import (
     EenhedenEenheid,
     WoningwaarderingResultatenWoningwaardering,
@@ -217,7 +216,8 @@ def opslag_beschermd_stads_of_dorpsgezicht(
 def check_monumenten_attribuut(eenheid: EenhedenEenheid) -> None:
     """Controleert of het monumenten-attribuut correct is gespecificeerd.
 
-    Geeft een waarschuwing als het attribuut None is en zoekt vervolgens de monumentstatus op basis van de gegevens in de eenheid.
+    Geeft een waarschuwing als het attribuut None is. Het opzoeken van de monumentstatus
+    gebeurt niet hier, maar vooraf in de verrijkingsstap (zie `woningwaardering.verrijking`).
 
     Args:
         eenheid (EenhedenEenheid): De te controleren eenheid
@@ -227,4 +227,3 @@ def check_monumenten_attribuut(eenheid: EenhedenEenheid) -> None:
             f"Eenheid ({eenheid.id}): 'monumenten' is niet gespecificeerd. Indien de eenheid geen monumentstatus heeft, geef dit dan expliciet aan door een lege lijst toe te wijzen aan het 'monumenten'-attribuut.",
             UserWarning,
         )
-        update_eenheid_monumenten(eenheid)
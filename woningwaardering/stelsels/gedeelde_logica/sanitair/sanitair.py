@@ -1,12 +1,16 @@
 import warnings
 from collections import Counter
+from dataclasses import dataclass
+from datetime import date
 from decimal import Decimal
-from typing import Iterator
+from types import MappingProxyType
+from typing import Iterable, Iterator, Mapping
 
 from loguru import logger
 
 from woningwaardering.stelsels.criterium_id import CriteriumId
-from woningwaardering.stelsels.utils import rond_af
+from woningwaardering.stelsels.ruimte_index import ruimte_gegevens
+from woningwaardering.stelsels.utils import geldig_op, rond_af
 from woningwaardering.vera.bvg.generated import (
     EenhedenRuimte,
     Referentiedata,
@@ -22,42 +26,219 @@ from woningwaardering.vera.referentiedata import (
     WoningwaarderingstelselgroepReferentiedata,
     WoningwaarderingstelselReferentiedata,
 )
-from woningwaardering.vera.utils import get_bouwkundige_elementen
+
+
+@dataclass(frozen=True, slots=True)
+class _Sanitairpunten:
+    """
+    De punten voor sanitair uit één beleidsboek.
+
+    Attributes:
+        toilet (Mapping[Referentiedata, Mapping[Referentiedata, Decimal]]): De punten
+            per toiletsoort, per ruimtedetailsoort.
+        sanitair (Mapping[Referentiedata, Mapping[Referentiedata, Decimal]]): De punten
+            per wastafel, bad en douche, per woningwaarderingstelsel.
+        voorzieningen (Mapping[Referentiedata, Decimal]): De punten per extra voorziening.
+        max_kastruimte (Decimal): Het maximum aantal punten voor kastruimte.
+    """
+
+    toilet: Mapping[Referentiedata, Mapping[Referentiedata, Decimal]]
+    sanitair: Mapping[Referentiedata, Mapping[Referentiedata, Decimal]]
+    voorzieningen: Mapping[Referentiedata, Decimal]
+    max_kastruimte: Decimal
+
+
+# De punten per beleidsboek, op begindatum. De waardering gebruikt de tabellen die
+# op de peildatum gelden, dus een nieuw beleidsboek is een nieuwe regel in deze
+# tuple. De tabellen worden eenmalig bij de import opgebouwd en tijdens de
+# waardering alleen gelezen. De waarden zijn als tekst opgegeven, zodat
+# criteriumnamen als "Max 1.0 punt" gelijk blijven.
+_SANITAIRPUNTEN: tuple[tuple[date, _Sanitairpunten], ...] = (
+    (
+        date(2024, 7, 1),
+        _Sanitairpunten(
+            toilet=MappingProxyType(
+                {
+                    Ruimtedetailsoort.toiletruimte: MappingProxyType(
+                        {
+                            Voorzieningsoort.hangend_toilet: Decimal("3.75"),
+                            Voorzieningsoort.staand_toilet: Decimal("3.0"),
+                        }
+                    ),
+                    Ruimtedetailsoort.badkamer: MappingProxyType(
+                        {
+                            Voorzieningsoort.hangend_toilet: Decimal("2.75"),
+                            Voorzieningsoort.staand_toilet: Decimal("2.0"),
+                        }
+                    ),
+                    Ruimtedetailsoort.badkamer_met_toilet: MappingProxyType(
+                        {
+                            Voorzieningsoort.hangend_toilet: Decimal("2.75"),
+                            Voorzieningsoort.staand_toilet: Decimal("2.0"),
+                        }
+                    ),
+                }
+            ),
+            sanitair=MappingProxyType(
+                {
+                    Woningwaarderingstelsel.zelfstandige_woonruimten: MappingProxyType(
+                        {
+                            Voorzieningsoort.wastafel: Decimal("1.0"),
+                            Voorzieningsoort.meerpersoonswastafel: Decimal("1.5"),
+                            Voorzieningsoort.douche: Decimal("4.0"),
+                            Voorzieningsoort.bad: Decimal("6.0"),
+                            Voorzieningsoort.bad_en_douche: Decimal("7.0"),
+                        }
+                    ),
+                    Woningwaarderingstelsel.onzelfstandige_woonruimten: MappingProxyType(
+                        {
+                            Voorzieningsoort.wastafel: Decimal("1.0"),
+                            Voorzieningsoort.meerpersoonswastafel: Decimal("1.5"),
+                            Voorzieningsoort.douche: Decimal("3.0"),
+                            Voorzieningsoort.bad: Decimal("5.0"),
+                            Voorzieningsoort.bad_en_douche: Decimal("6.0"),
+                        }
+                    ),
+                }
+            ),
+            voorzieningen=MappingProxyType(
+                {
+                    Voorzieningsoort.bubbelfunctie_van_het_bad: Decimal("1.5"),
+                    Voorzieningsoort.douchewand: Decimal("1.25"),
+                    Voorzieningsoort.handdoekenradiator: Decimal("0.75"),
+                    Voorzieningsoort.ingebouwd_kastje_met_in_of_opgebouwde_wastafel: Decimal(
+                        "1"
+                    ),
+                    Voorzieningsoort.kastruimte: Decimal("0.75"),
+                    Voorzieningsoort.stopcontact_bij_wastafel: Decimal("0.25"),
+                    Voorzieningsoort.eenhandsmengkraan: Decimal("0.25"),
+                    Voorzieningsoort.thermostatische_mengkraan: Decimal("0.5"),
+                }
+            ),
+            max_kastruimte=Decimal("0.75"),
+        ),
+    ),
+)
+
+# Naast de extra voorzieningen komen deze installaties in een badkamer of
+# doucheruimte in aanmerking voor waardering
+_SANITAIRE_INSTALLATIES = frozenset(
+    {
+        Voorzieningsoort.wastafel,
+        Voorzieningsoort.meerpersoonswastafel,
+        Voorzieningsoort.bad_en_douche,
+        Voorzieningsoort.douche,
+        Voorzieningsoort.bad,
+        Voorzieningsoort.hangend_toilet,
+        Voorzieningsoort.staand_toilet,
+    }
+)
+
+# Backwards compatibiliteit voor bouwkundige elementen die als installatie gelden
+_BOUWKUNDIGE_ELEMENTEN_ALS_INSTALLATIE: tuple[
+    tuple[Referentiedata, Referentiedata], ...
+] = (
+    (Bouwkundigelementdetailsoort.wastafel, Voorzieningsoort.wastafel),
+    (Bouwkundigelementdetailsoort.douche, Voorzieningsoort.douche),
+    (Bouwkundigelementdetailsoort.bad, Voorzieningsoort.bad),
+    (Bouwkundigelementdetailsoort.kast, Voorzieningsoort.kastruimte),
+    (Bouwkundigelementdetailsoort.closetcombinatie, Voorzieningsoort.staand_toilet),
+    (Bouwkundigelementdetailsoort.fontein, Voorzieningsoort.wastafel),
+)
+
+
+def _punten(
+    tabel: Mapping[Referentiedata, Decimal], soort: Referentiedata, aantal: int
+) -> Decimal:
+    """
+    Berekent de punten voor een aantal installaties van een soort uit een puntentabel.
+
+    Args:
+        tabel (Mapping[Referentiedata, Decimal]): De punten per installatie.
+        soort (Referentiedata): De soort installatie.
+        aantal (int): Het aantal installaties.
+
+    Returns:
+        Decimal: De punten, afgerond op twee decimalen.
+    """
+    return rond_af(tabel[soort] * aantal, decimalen=2)
+
+
+def _punten_sanitair(
+    sanitairpunten: _Sanitairpunten,
+    stelsel: WoningwaarderingstelselReferentiedata,
+) -> Mapping[Referentiedata, Decimal]:
+    """
+    Geeft de punten per wastafel, bad en douche voor een woningwaarderingstelsel.
+
+    Alleen zelfstandige woonruimten hebben eigen punten; voor de overige stelsels
+    gelden de punten van onzelfstandige woonruimten.
+
+    Args:
+        sanitairpunten (_Sanitairpunten): De punten uit het geldende beleidsboek.
+        stelsel (WoningwaarderingstelselReferentiedata): Het woningwaarderingstelsel.
+
+    Returns:
+        Mapping[Referentiedata, Decimal]: De punten per voorzieningsoort.
+    """
+    return sanitairpunten.sanitair.get(
+        stelsel,
+        sanitairpunten.sanitair[Woningwaarderingstelsel.onzelfstandige_woonruimten],
+    )
+
+
+def _totaal_punten(
+    woningwaarderingen: Iterable[WoningwaarderingResultatenWoningwaardering],
+) -> Decimal:
+    return sum(
+        (
+            Decimal(str(woningwaardering.punten))
+            for woningwaardering in woningwaarderingen
+            if woningwaardering.punten is not None
+        ),
+        Decimal("0"),
+    )
 
 
 def waardeer_sanitair(
     ruimte: EenhedenRuimte,
     stelselgroep: WoningwaarderingstelselgroepReferentiedata,
     stelsel: WoningwaarderingstelselReferentiedata,
+    peildatum: date,
 ) -> Iterator[WoningwaarderingResultatenWoningwaardering]:
+    """
+    Waardeert het sanitair van een ruimte met de punten die op de peildatum gelden.
+
+    Args:
+        ruimte (EenhedenRuimte): De ruimte.
+        stelselgroep (WoningwaarderingstelselgroepReferentiedata): De stelselgroep.
+        stelsel (WoningwaarderingstelselReferentiedata): Het woningwaarderingstelsel.
+        peildatum (date): De peildatum van de waardering.
+
+    Yields:
+        WoningwaarderingResultatenWoningwaardering: De waarderingen van het sanitair.
+    """
     if ruimte.detail_soort is None:
         warnings.warn(f"Ruimte '{ruimte.naam}' ({ruimte.id}) heeft geen detailsoort.")
         return
 
-    _bouwkundige_elementen_naar_installaties(ruimte)
+    sanitairpunten = geldig_op(_SANITAIRPUNTEN, peildatum)
+    installaties = _bouwkundige_elementen_naar_installaties(ruimte)
 
-    yield from _waardeer_toiletten(ruimte)
+    yield from _waardeer_toiletten(ruimte, installaties, sanitairpunten)
 
-    yield from _waardeer_wastafels(ruimte, stelsel)
+    yield from _waardeer_wastafels(ruimte, installaties, sanitairpunten, stelsel)
 
-    baden_en_douches_waarderingen = list(_waardeer_baden_en_douches(ruimte, stelsel))
-    totaal_punten_bad_en_douche = Decimal(
-        sum(
-            Decimal(str(woningwaardering.punten))
-            for woningwaardering in baden_en_douches_waarderingen
-            if woningwaardering.punten is not None
-        )
+    baden_en_douches_waarderingen = list(
+        _waardeer_baden_en_douches(ruimte, installaties, sanitairpunten, stelsel)
     )
+    totaal_punten_bad_en_douche = _totaal_punten(baden_en_douches_waarderingen)
     yield from baden_en_douches_waarderingen
 
-    voorziening_waarderingen = list(_waardeer_installaties(ruimte, stelsel))
-    totaal_punten_voorzieningen = Decimal(
-        sum(
-            Decimal(str(woningwaardering.punten))
-            for woningwaardering in voorziening_waarderingen
-            if woningwaardering.punten is not None
-        )
+    voorziening_waarderingen = list(
+        _waardeer_installaties(ruimte, installaties, sanitairpunten)
     )
+    totaal_punten_voorzieningen = _totaal_punten(voorziening_waarderingen)
     yield from voorziening_waarderingen
 
     maximering = min(
@@ -85,51 +266,43 @@ def waardeer_sanitair(
         )
 
 
-def _bouwkundige_elementen_naar_installaties(ruimte: EenhedenRuimte) -> None:
-    ruimte.installaties = ruimte.installaties or []
-    # Backwards compatibiliteit voor bouwkundige elementen
-    for bouwkundigelementdetailsoort, voorzieningsoort in {
-        Bouwkundigelementdetailsoort.wastafel: Voorzieningsoort.wastafel,
-        Bouwkundigelementdetailsoort.douche: Voorzieningsoort.douche,
-        Bouwkundigelementdetailsoort.bad: Voorzieningsoort.bad,
-        Bouwkundigelementdetailsoort.kast: Voorzieningsoort.kastruimte,
-        Bouwkundigelementdetailsoort.closetcombinatie: Voorzieningsoort.staand_toilet,
-        Bouwkundigelementdetailsoort.fontein: Voorzieningsoort.wastafel,
-    }.items():
-        bouwkundige_elementen = list(
-            get_bouwkundige_elementen(ruimte, bouwkundigelementdetailsoort)
-        )
-        if bouwkundige_elementen:
+def _bouwkundige_elementen_naar_installaties(
+    ruimte: EenhedenRuimte,
+) -> Counter[Referentiedata]:
+    """
+    Telt de installaties van een ruimte, inclusief de bouwkundige elementen die als
+    installatie worden gewaardeerd. De aantallen komen uit de ruimte-index; de ruimte
+    en de index worden niet aangepast.
+
+    Args:
+        ruimte (EenhedenRuimte): De ruimte.
+
+    Returns:
+        Counter[Referentiedata]: Het aantal installaties per voorzieningsoort.
+    """
+    gegevens = ruimte_gegevens(ruimte)
+    installaties = gegevens.installaties.copy()
+    for (
+        bouwkundigelementdetailsoort,
+        voorzieningsoort,
+    ) in _BOUWKUNDIGE_ELEMENTEN_ALS_INSTALLATIE:
+        aantal = gegevens.aantal_bouwkundige_elementen(bouwkundigelementdetailsoort)
+        if aantal > 0:
             warnings.warn(
                 f"Ruimte '{ruimte.naam}' ({ruimte.id}) heeft een {bouwkundigelementdetailsoort.naam} als bouwkundig element. Dit dient als `Voorzieningsoort` '{voorzieningsoort}' op de ruimte onder `installaties` gespecificeerd te worden."
             )
             logger.info(
                 f"Ruimte '{ruimte.naam}' ({ruimte.id}): {bouwkundigelementdetailsoort.naam} wordt als {voorzieningsoort.naam} toegevoegd aan installaties"
             )
-            ruimte.installaties.extend(
-                [voorzieningsoort for _ in bouwkundige_elementen]
-            )
+            installaties[voorzieningsoort] += aantal
+    return installaties
 
 
 def _waardeer_toiletten(
     ruimte: EenhedenRuimte,
+    installaties: Counter[Referentiedata],
+    sanitairpunten: _Sanitairpunten,
 ) -> Iterator[WoningwaarderingResultatenWoningwaardering]:
-    installaties = Counter([installatie for installatie in ruimte.installaties or []])
-    mapping_toilet: dict[Referentiedata, dict[Referentiedata, float]] = {
-        Ruimtedetailsoort.toiletruimte: {
-            Voorzieningsoort.hangend_toilet: 3.75,
-            Voorzieningsoort.staand_toilet: 3.0,
-        },
-        Ruimtedetailsoort.badkamer: {
-            Voorzieningsoort.hangend_toilet: 2.75,
-            Voorzieningsoort.staand_toilet: 2.0,
-        },
-        Ruimtedetailsoort.badkamer_met_toilet: {
-            Voorzieningsoort.hangend_toilet: 2.75,
-            Voorzieningsoort.staand_toilet: 2.0,
-        },
-    }
-
     # Toiletten buiten toiletruimten en badkamers komen niet in aanmerking voor waardering.
     if ruimte.detail_soort in [
         Ruimtedetailsoort.toiletruimte,
@@ -159,12 +332,10 @@ def _waardeer_toiletten(
                         ),
                     ),
                     punten=float(
-                        rond_af(
-                            Decimal(
-                                str(mapping_toilet[ruimte.detail_soort][toiletsoort])
-                            )
-                            * Decimal(str(aantal_toiletten)),
-                            decimalen=2,
+                        _punten(
+                            sanitairpunten.toilet[ruimte.detail_soort],
+                            toiletsoort,
+                            aantal_toiletten,
                         )
                     ),
                     aantal=aantal_toiletten,
@@ -172,19 +343,12 @@ def _waardeer_toiletten(
 
 
 def _waardeer_wastafels(
-    ruimte: EenhedenRuimte, stelsel: WoningwaarderingstelselReferentiedata
+    ruimte: EenhedenRuimte,
+    installaties: Counter[Referentiedata],
+    sanitairpunten: _Sanitairpunten,
+    stelsel: WoningwaarderingstelselReferentiedata,
 ) -> Iterator[WoningwaarderingResultatenWoningwaardering]:
-    zelfstandige_woonruimte = (
-        stelsel == Woningwaarderingstelsel.zelfstandige_woonruimten
-    )
-    installaties = Counter([installatie for installatie in ruimte.installaties or []])
-    punten_sanitair = {
-        Voorzieningsoort.wastafel: 1.0,
-        Voorzieningsoort.meerpersoonswastafel: 1.5,
-        Voorzieningsoort.douche: 4.0 if zelfstandige_woonruimte else 3.0,
-        Voorzieningsoort.bad: 6.0 if zelfstandige_woonruimte else 5.0,
-        Voorzieningsoort.bad_en_douche: 7.0 if zelfstandige_woonruimte else 6.0,
-    }
+    punten_sanitair = _punten_sanitair(sanitairpunten, stelsel)
 
     totaal_aantal_wastafels = 0
 
@@ -229,7 +393,7 @@ def _waardeer_wastafels(
 
         totaal_aantal_wastafels += aantal_wastafels
 
-        punten_per_wastafel = Decimal(str(punten_sanitair[wastafelsoort]))
+        punten_per_wastafel = punten_sanitair[wastafelsoort]
 
         punten_voor_wastafels = rond_af(
             Decimal(str(aantal_wastafels + aantal_spoelbakken)) * punten_per_wastafel,
@@ -318,29 +482,20 @@ def _waardeer_wastafels(
 
 
 def _waardeer_baden_en_douches(
-    ruimte: EenhedenRuimte, stelsel: WoningwaarderingstelselReferentiedata
+    ruimte: EenhedenRuimte,
+    installaties: Counter[Referentiedata],
+    sanitairpunten: _Sanitairpunten,
+    stelsel: WoningwaarderingstelselReferentiedata,
 ) -> Iterator[WoningwaarderingResultatenWoningwaardering]:
-    installaties = Counter([installatie for installatie in ruimte.installaties or []])
-    zelfstandige_woonruimte = (
-        stelsel == Woningwaarderingstelsel.zelfstandige_woonruimten
-    )
-    punten_sanitair = {
-        Voorzieningsoort.wastafel: 1.0,
-        Voorzieningsoort.meerpersoonswastafel: 1.5,
-        Voorzieningsoort.douche: 4.0 if zelfstandige_woonruimte else 3.0,
-        Voorzieningsoort.bad: 6.0 if zelfstandige_woonruimte else 5.0,
-        Voorzieningsoort.bad_en_douche: 7.0 if zelfstandige_woonruimte else 6.0,
-    }
+    punten_sanitair = _punten_sanitair(sanitairpunten, stelsel)
     aantal_douches = installaties[Voorzieningsoort.douche]
     aantal_baden = installaties[Voorzieningsoort.bad]
 
     aantal_bad_en_douches = min(aantal_douches, aantal_baden)
 
     if aantal_bad_en_douches > 0:
-        punten = rond_af(
-            Decimal(str(aantal_bad_en_douches))
-            * Decimal(str(punten_sanitair[Voorzieningsoort.bad_en_douche])),
-            decimalen=2,
+        punten = _punten(
+            punten_sanitair, Voorzieningsoort.bad_en_douche, aantal_bad_en_douches
         )
         logger.info(
             f"Ruimte '{ruimte.naam}' ({ruimte.id}): {aantal_bad_en_douches}x een {Voorzieningsoort.bad_en_douche.naam} voor {Woningwaarderingstelselgroep.sanitair.naam}"
@@ -368,10 +523,7 @@ def _waardeer_baden_en_douches(
     ]:
         aantal = installaties[voorzieningsoort] - aantal_bad_en_douches
         if aantal > 0:
-            punten = rond_af(
-                Decimal(str(aantal)) * Decimal(str(punten_sanitair[voorzieningsoort])),
-                2,
-            )
+            punten = _punten(punten_sanitair, voorzieningsoort, aantal)
             logger.info(
                 f"Ruimte '{ruimte.naam}' ({ruimte.id}): {aantal}x een {voorzieningsoort.naam} voor {Woningwaarderingstelselgroep.sanitair.naam}"
             )
@@ -394,20 +546,10 @@ def _waardeer_baden_en_douches(
 
 
 def _waardeer_installaties(
-    ruimte: EenhedenRuimte, stelsel: WoningwaarderingstelselReferentiedata
+    ruimte: EenhedenRuimte,
+    installaties: Counter[Referentiedata],
+    sanitairpunten: _Sanitairpunten,
 ) -> Iterator[WoningwaarderingResultatenWoningwaardering]:
-    installaties = Counter([installatie for installatie in ruimte.installaties or []])
-    punten_voorzieningen: dict[Referentiedata, float] = {
-        Voorzieningsoort.bubbelfunctie_van_het_bad: 1.5,
-        Voorzieningsoort.douchewand: 1.25,
-        Voorzieningsoort.handdoekenradiator: 0.75,
-        Voorzieningsoort.ingebouwd_kastje_met_in_of_opgebouwde_wastafel: 1,
-        Voorzieningsoort.kastruimte: 0.75,
-        Voorzieningsoort.stopcontact_bij_wastafel: 0.25,
-        Voorzieningsoort.eenhandsmengkraan: 0.25,
-        Voorzieningsoort.thermostatische_mengkraan: 0.5,
-    }
-
     totaal_punten_voorzieningen = Decimal("0")
 
     totaal_aantal_wastafels = (
@@ -438,31 +580,17 @@ def _waardeer_installaties(
             )
         elif totaal_aantal_wastafels > 0 and bad_en_of_douche_aanwezig:
             for installatie, aantal in installaties.items():
-                if installatie not in (
-                    set(punten_voorzieningen)
-                    | {
-                        Voorzieningsoort.wastafel,
-                        Voorzieningsoort.meerpersoonswastafel,
-                        Voorzieningsoort.bad_en_douche,
-                        Voorzieningsoort.douche,
-                        Voorzieningsoort.bad,
-                    }
-                    | {
-                        Voorzieningsoort.hangend_toilet,
-                        Voorzieningsoort.staand_toilet,
-                    }
+                if (
+                    installatie not in sanitairpunten.voorzieningen
+                    and installatie not in _SANITAIRE_INSTALLATIES
                 ):
                     logger.debug(
                         f"Installatie {installatie.naam} komt niet in aanmerking voor waardering"
                     )
                     continue
 
-                if installatie in punten_voorzieningen:
-                    punten = rond_af(
-                        Decimal(str(aantal))
-                        * Decimal(str(punten_voorzieningen[installatie])),
-                        decimalen=2,
-                    )
+                if installatie in sanitairpunten.voorzieningen:
+                    punten = _punten(sanitairpunten.voorzieningen, installatie, aantal)
 
                     totaal_punten_voorzieningen += punten
 
@@ -487,7 +615,7 @@ def _waardeer_installaties(
                     )
 
                     if installatie == Voorzieningsoort.kastruimte:
-                        maximum = Decimal("0.75")
+                        maximum = sanitairpunten.max_kastruimte
                         correctie = min(maximum - punten, Decimal("0"))
                         if correctie < 0:
                             totaal_punten_voorzieningen += correctie
@@ -511,8 +639,8 @@ def _waardeer_installaties(
                     if installatie == Voorzieningsoort.stopcontact_bij_wastafel:
                         correctie_aantal = (totaal_aantal_wastafels * 2) - aantal
                         correctie = min(
-                            Decimal(str(correctie_aantal))
-                            * Decimal(punten_voorzieningen[installatie]),
+                            correctie_aantal
+                            * sanitairpunten.voorzieningen[installatie],
                             Decimal("0"),
                         )
                         if correctie < 0:
@@ -6,7 +6,7 @@ from woningwaardering.stelsels.criterium_id import CriteriumId
 from woningwaardering.stelsels.criteriumsleutels import (
     CriteriumSleutels,
 )
-from woningwaardering.stelsels.utils import classificeer_ruimte
+from woningwaardering.stelsels.ruimte_index import ruimte_gegevens
 from woningwaardering.vera.bvg.generated import (
     EenhedenRuimte,
     WoningwaarderingCriteriumSleutels,
@@ -19,7 +19,6 @@ from woningwaardering.vera.referentiedata import (
     Ruimtesoort,
     Woningwaarderingstelselgroep,
 )
-from woningwaardering.vera.utils import heeft_bouwkundig_element
 
 
 def waardeer_verkoeling_en_verwarming(
@@ -47,7 +46,7 @@ def _waardeer_verwarmde_overige_ruimte(
         if not ruimte.verwarmd:
             continue
 
-        ruimtesoort = classificeer_ruimte(ruimte)
+        ruimtesoort = ruimte_gegevens(ruimte).classificatie
         if ruimtesoort in (
             Ruimtesoort.overige_ruimten,
             Ruimtesoort.verkeersruimte,
@@ -116,7 +115,7 @@ def _waardeer_verkoeld_en_of_verwarmd_vertrek(
             continue
 
         punten = 2
-        ruimtesoort = classificeer_ruimte(ruimte)
+        ruimtesoort = ruimte_gegevens(ruimte).classificatie
         if ruimtesoort == Ruimtesoort.vertrek:
             if ruimte.verkoeld:
                 totaal_punten_verkoeld_en_verwarmd += 1
@@ -211,8 +210,8 @@ def _waardeer_open_keuken(
                     Ruimtedetailsoort.woon_en_of_slaapkamer,
                     Ruimtedetailsoort.slaapkamer,
                 ]
-                and heeft_bouwkundig_element(
-                    ruimte, Bouwkundigelementdetailsoort.aanrecht
+                and ruimte_gegevens(ruimte).heeft_bouwkundig_element(
+                    Bouwkundigelementdetailsoort.aanrecht
                 )
             )
         ):
@@ -0,0 +1,158 @@
+from decimal import Decimal
+from typing import Iterable, NewType
+
+Honderdsten = NewType("Honderdsten", int)
+"""Een getal als geheel aantal honderdsten, bijvoorbeeld 3,25 punten als 325."""
+
+# Tot deze grootte zijn som en afronding in honderdsten gelijk aan die met Decimal
+# in de BasicContext, die met 9 significante cijfers rekent.
+_GRENS = 10**9
+
+
+def naar_honderdsten(getal: float | int | Decimal) -> Honderdsten | None:
+    """
+    Zet een getal exact om naar honderdsten.
+
+    Een float wordt geïnterpreteerd zoals `Decimal(str(getal))`, dus 0.1 is precies
+    10 honderdsten.
+
+    Args:
+        getal (float | int | Decimal): Het getal.
+
+    Returns:
+        Honderdsten | None: Het getal in honderdsten, of None als het getal niet
+            exact in honderdsten is uit te drukken.
+    """
+    if isinstance(getal, Decimal):
+        if not getal.is_finite():
+            return None
+        geschaald = getal.scaleb(2)
+        if geschaald != geschaald.to_integral_value() or abs(geschaald) >= _GRENS:
+            return None
+        return Honderdsten(int(geschaald))
+
+    try:
+        waarde = round(getal * 100)
+    except (OverflowError, ValueError):
+        return None
+    # Als waarde / 100 weer precies het getal oplevert, is de kortste weergave van het
+    # getal (en dus Decimal(str(getal))) gelijk aan waarde honderdsten.
+    if abs(waarde) >= _GRENS or waarde / 100 != getal:
+        return None
+    return Honderdsten(waarde)
+
+
+def som(getallen: Iterable[float | int | Decimal]) -> Honderdsten | None:
+    """
+    Telt getallen exact op in honderdsten.
+
+    Args:
+        getallen (Iterable[float | int | Decimal]): De getallen.
+
+    Returns:
+        Honderdsten | None: De som in honderdsten, of None als een van de getallen of
+            de som niet exact in honderdsten is uit te drukken.
+    """
+    totaal = 0
+    for getal in getallen:
+        if isinstance(getal, float):
+            # gelijk aan naar_honderdsten, zonder functieaanroep voor de gewone floats
+            try:
+                waarde = round(getal * 100)
+            except (OverflowError, ValueError):
+                return None
+            if waarde / 100 != getal or abs(waarde) >= _GRENS:
+                return None
+            totaal += waarde
+        elif (omgezet := naar_honderdsten(getal)) is not None:
+            totaal += omgezet
+        else:
+            return None
+    if abs(totaal) >= _GRENS:
+        return None
+    return Honderdsten(totaal)
+
+
+def rond_af(waarde: Honderdsten, decimalen: int) -> Honderdsten:
+    """
+    Rondt honderdsten af op 0, 1 of 2 decimalen met ROUND_HALF_UP, gelijk aan
+    `woningwaardering.stelsels.utils.rond_af`.
+
+    Args:
+        waarde (Honderdsten): De waarde.
+        decimalen (int): Het aantal decimalen.
+
+    Returns:
+        Honderdsten: De afgeronde waarde.
+
+    Raises:
+        ValueError: Als het aantal decimalen niet 0, 1 of 2 is.
+    """
+    if decimalen not in (0, 1, 2):
+        raise ValueError(
+            "Honderdsten kunnen alleen op 0, 1 of 2 decimalen worden afgerond."
+        )
+    stap = 10 ** (2 - decimalen)
+    return _rond_af_op_stap(waarde, stap)
+
+
+def rond_af_op_kwart(waarde: Honderdsten) -> Honderdsten:
+    """
+    Rondt honderdsten af op een kwart, gelijk aan
+    `woningwaardering.stelsels.utils.rond_af_op_kwart`.
+
+    Args:
+        waarde (Honderdsten): De waarde.
+
+    Returns:
+        Honderdsten: De op een kwart afgeronde waarde.
+    """
+    return _rond_af_op_stap(waarde, 25)
+
+
+def _rond_af_op_stap(waarde: int, stap: int) -> Honderdsten:
+    # ROUND_HALF_UP rondt de helft af van nul af
+    aantal, rest = divmod(abs(waarde), stap)
+    if 2 * rest >= stap:
+        aantal += 1
+    return Honderdsten(aantal * stap if waarde >= 0 else -aantal * stap)
+
+
+def naar_float(waarde: Honderdsten, negatief: bool = False) -> float:
+    """
+    Zet honderdsten om naar een float, gelijk aan `float` van de overeenkomstige
+    Decimal.
+
+    Args:
+        waarde (Honderdsten): De waarde.
+        negatief (bool): Of de waarde is ontstaan uit een negatief getal. Een tot nul
+            afgerond negatief getal is in Decimal -0, en wordt dan -0.0.
+
+    Returns:
+        float: De waarde als float.
+    """
+    if waarde == 0 and negatief:
+        return -0.0
+    return waarde / 100
+
+
+def naar_decimal(
+    waarde: Honderdsten, decimalen: int = 2, negatief: bool = False
+) -> Decimal:
+    """
+    Zet honderdsten om naar een Decimal, gelijk aan de Decimal die
+    `woningwaardering.stelsels.utils.rond_af` met hetzelfde aantal decimalen geeft.
+
+    Args:
+        waarde (Honderdsten): De waarde, afgerond op het aantal decimalen.
+        decimalen (int): Het aantal decimalen van de Decimal.
+        negatief (bool): Of de waarde is ontstaan uit een negatief getal. Een tot nul
+            afgerond negatief getal wordt dan -0.
+
+    Returns:
+        Decimal: De waarde als Decimal.
+    """
+    resultaat = Decimal(abs(waarde) // 10 ** (2 - decimalen)).scaleb(-decimalen)
+    if waarde < 0 or (waarde == 0 and negatief):
+        return resultaat.copy_negate()
+    return resultaat
@@ -63,18 +63,13 @@ class Aftrekpunten(Stelselgroep):
                 aftrekpunten_oppervlakte_vertrekken
             )
 
-        punten = utils.rond_af_op_kwart(
-            sum(
-                Decimal(str(woningwaardering.punten))
-                for woningwaardering in woningwaardering_groep.woningwaarderingen or []
-                if woningwaardering.punten is not None
-                and woningwaardering.criterium is not None
-                and woningwaardering.criterium.bovenliggende_criterium is None
-            )
+        woningwaardering_groep.punten = utils.som_op_kwart(
+            woningwaardering.punten
+            for woningwaardering in woningwaardering_groep.woningwaarderingen or []
+            if woningwaardering.criterium is not None
+            and woningwaardering.criterium.bovenliggende_criterium is None
         )
 
-        woningwaardering_groep.punten = float(punten)
-
         logger.info(
             f"Eenheid ({eenheid.id}) krijgt in totaal {woningwaardering_groep.punten} punten voor {self.stelselgroep.naam}"
         )
@@ -1,5 +1,4 @@
 from datetime import date
-from decimal import Decimal
 
 from loguru import logger
 
@@ -62,16 +61,11 @@ class BijzondereVoorzieningen(Stelselgroep):
             )
         )
 
-        punten = utils.rond_af_op_kwart(
-            sum(
-                Decimal(str(woningwaardering.punten))
-                for woningwaardering in woningwaardering_groep.woningwaarderingen or []
-                if woningwaardering.punten is not None
-            ),
+        woningwaardering_groep.punten = utils.som_op_kwart(
+            woningwaardering.punten
+            for woningwaardering in woningwaardering_groep.woningwaarderingen or []
         )
 
-        woningwaardering_groep.punten = float(punten)
-
         logger.info(
             f"Eenheid ({eenheid.id}) krijgt in totaal {woningwaardering_groep.punten} punten voor {self.stelselgroep.naam}"
         )
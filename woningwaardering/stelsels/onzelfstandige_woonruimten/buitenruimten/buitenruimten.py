@@ -9,12 +9,8 @@ from loguru import logger
 from woningwaardering.stelsels import utils
 from woningwaardering.stelsels._dev_utils import DevelopmentContext
 from woningwaardering.stelsels.criterium_id import CriteriumId, GedeeldMetSoort
+from woningwaardering.stelsels.ruimte_index import RuimteIndex, ruimte_gegevens
 from woningwaardering.stelsels.stelselgroep import Stelselgroep
-from woningwaardering.stelsels.utils import (
-    classificeer_ruimte,
-    gedeeld_met_eenheden,
-    gedeeld_met_onzelfstandige_woonruimten,
-)
 from woningwaardering.vera.bvg.generated import (
     EenhedenEenheid,
     EenhedenRuimte,
@@ -226,14 +222,11 @@ class Buitenruimten(Stelselgroep):
                 )
                 woningwaardering_groep.woningwaarderingen.append(woningwaardering)
 
-        woningwaardering_groep.punten = float(
-            sum(
-                Decimal(str(woningwaardering.punten))
-                for woningwaardering in woningwaardering_groep.woningwaarderingen or []
-                if woningwaardering.punten is not None
-                and woningwaardering.criterium is not None
-                and woningwaardering.criterium.bovenliggende_criterium is None
-            )
+        woningwaardering_groep.punten = utils.som(
+            woningwaardering.punten
+            for woningwaardering in woningwaardering_groep.woningwaarderingen or []
+            if woningwaardering.criterium is not None
+            and woningwaardering.criterium.bovenliggende_criterium is None
         )
 
         if geen_buitenruimten := self._geen_buitenruimten(woningwaardering_groep):
@@ -350,7 +343,8 @@ class Buitenruimten(Stelselgroep):
         Yields:
             WoningwaarderingResultatenWoningwaardering: Punten voor de buitenruimte.
         """
-        if classificeer_ruimte(ruimte) == Ruimtesoort.buitenruimte or (
+        gegevens = ruimte_gegevens(ruimte)
+        if gegevens.classificatie == Ruimtesoort.buitenruimte or (
             ruimte.detail_soort
             in [
                 Ruimtedetailsoort.stalling_extern,
@@ -363,7 +357,7 @@ class Buitenruimten(Stelselgroep):
                     UserWarning,
                 )
                 return
-            if gedeeld_met_eenheden(ruimte):
+            if gegevens.gedeeld_met_eenheden:
                 # Gemeenschappelijke buitenruimten hebben een minimumafmeting van 2 m x 1,5 m, 1,5 m (hoogte, lengte, breedte)
                 if not (ruimte.lengte and ruimte.breedte):
                     warnings.warn(
@@ -383,7 +377,7 @@ class Buitenruimten(Stelselgroep):
             if (
                 ruimte.detail_soort
                 == Ruimtedetailsoort.parkeerplaats  # parkeerplaats heeft als ruimtesoort buitenruimte
-                and gedeeld_met_eenheden(ruimte)
+                and gegevens.gedeeld_met_eenheden
             ):
                 logger.debug(
                     f"Ruimte '{ruimte.naam}' ({ruimte.id}) is een gedeelde parkeerplaats en telt daarom niet mee voor {self.stelselgroep.naam}."
@@ -398,7 +392,7 @@ class Buitenruimten(Stelselgroep):
                 WoningwaarderingResultatenWoningwaarderingCriterium(
                     meeteenheid=Meeteenheid.vierkante_meter_m2,
                     naam=ruimte.naam
-                    if not gedeeld_met_eenheden(ruimte)
+                    if not gegevens.gedeeld_met_eenheden
                     else f"{ruimte.naam}",
                     id=str(
                         CriteriumId(
@@ -415,7 +409,7 @@ class Buitenruimten(Stelselgroep):
             )
             # Voor privé-buitenruimten worden in ieder geval 2 punten toegekend en vervolgens per vierkante meter 0,75 punt.
             # De in ieder geval 2 punten worden verderop toegevoegd.
-            if gedeeld_met_onzelfstandige_woonruimten(ruimte):
+            if gegevens.gedeeld_met_onzelfstandige_woonruimten:
                 woningwaardering.punten = float(
                     Decimal(str(ruimte.oppervlakte))
                     * Decimal("0.75")
@@ -449,11 +443,11 @@ class Buitenruimten(Stelselgroep):
             WoningwaarderingResultatenWoningwaardering | None: Woningwaardering met 2 punten als er privé buitenruimten aanwezig zijn.
         """
         # 2 punten bij de aanwezigheid van privé buitenruimten
+        index = RuimteIndex.voor(eenheid)
         if woningwaardering_groep.woningwaarderingen and any(
-            classificeer_ruimte(ruimte) == Ruimtesoort.buitenruimte
-            and not gedeeld_met_eenheden(ruimte)
-            and not gedeeld_met_onzelfstandige_woonruimten(ruimte)
-            for ruimte in eenheid.ruimten or []
+            not gegevens.gedeeld_met_eenheden
+            and not gegevens.gedeeld_met_onzelfstandige_woonruimten
+            for gegevens in map(index.gegevens, index.ruimten(Ruimtesoort.buitenruimte))
         ):
             woningwaardering = WoningwaarderingResultatenWoningwaardering()
             woningwaardering.criterium = (
@@ -14,8 +14,8 @@ from woningwaardering.stelsels.gedeelde_logica.energieprestatie import (
     get_energieprestatievergoeding,
     monument_correctie,
 )
+from woningwaardering.stelsels.ruimte_index import RuimteIndex
 from woningwaardering.stelsels.stelselgroep import Stelselgroep
-from woningwaardering.stelsels.utils import classificeer_ruimte
 from woningwaardering.vera.bvg.generated import (
     EenhedenEenheid,
     EenhedenEnergieprestatie,
@@ -93,7 +93,6 @@ class Energieprestatie(Stelselgroep):
                 f"Eenheid ({eenheid.id}): 'monumenten' is niet gespecificeerd. Indien de eenheid geen monumentstatus heeft, geef dit dan expliciet aan door een lege lijst toe te wijzen aan het 'monumenten'-attribuut.",
                 UserWarning,
             )
-            eenheid = utils.update_eenheid_monumenten(eenheid)
 
         oppervlakte_van_vertrekken = self._oppervlakte_vertrekken(eenheid)
 
@@ -154,20 +153,11 @@ class Energieprestatie(Stelselgroep):
                 monument_correctie_waardering
             )
 
-        punten_totaal = Decimal(
-            utils.rond_af_op_kwart(
-                sum(
-                    Decimal(str(woningwaardering.punten))
-                    for woningwaardering in (
-                        woningwaardering_groep.woningwaarderingen or []
-                    )
-                    if woningwaardering.punten is not None
-                )
-            )
+        woningwaardering_groep.punten = utils.som_op_kwart(
+            woningwaardering.punten
+            for woningwaardering in woningwaardering_groep.woningwaarderingen or []
         )
 
-        woningwaardering_groep.punten = float(punten_totaal)
-
         logger.info(
             f"Eenheid ({eenheid.id}) krijgt in totaal {woningwaardering_groep.punten} punten voor {self.stelselgroep.naam}"
         )
@@ -329,6 +319,7 @@ class Energieprestatie(Stelselgroep):
             Decimal
         )
 
+        index = RuimteIndex.voor(eenheid)
         for ruimte in eenheid.ruimten or []:
             if ruimte.oppervlakte is None:
                 warnings.warn(
@@ -337,7 +328,7 @@ class Energieprestatie(Stelselgroep):
                 )
                 continue
 
-            if classificeer_ruimte(ruimte) == Ruimtesoort.vertrek:
+            if index.gegevens(ruimte).classificatie == Ruimtesoort.vertrek:
                 oppervlakte_gedeeld_met_counter[
                     ruimte.gedeeld_met_aantal_onzelfstandige_woonruimten or 1
                 ] += utils.rond_af(
@@ -154,18 +154,13 @@ class GemeenschappelijkeBinnenruimtenGedeeldMetMeerdereAdressen(Stelselgroep):
                     )
                 )
 
-        punten = utils.rond_af_op_kwart(
-            sum(
-                Decimal(str(woningwaardering.punten))
-                for woningwaardering in woningwaardering_groep.woningwaarderingen or []
-                if woningwaardering.punten is not None
-                and woningwaardering.criterium
-                and woningwaardering.criterium.bovenliggende_criterium is None
-            )
+        woningwaardering_groep.punten = utils.som_op_kwart(
+            woningwaardering.punten
+            for woningwaardering in woningwaardering_groep.woningwaarderingen or []
+            if woningwaardering.criterium
+            and woningwaardering.criterium.bovenliggende_criterium is None
         )
 
-        woningwaardering_groep.punten = float(punten)
-
         logger.info(
             f"Eenheid {eenheid.id} krijgt in totaal {woningwaardering_groep.punten} punten voor {self.stelselgroep.naam}"
         )
@@ -381,7 +376,7 @@ class GemeenschappelijkeBinnenruimtenGedeeldMetMeerdereAdressen(Stelselgroep):
         woningwaarderingen: list[WoningwaarderingResultatenWoningwaardering] = []
         woningwaarderingen_met_ruimten = list(
             OnzelfstandigeWoonruimtenSanitair.genereer_woningwaarderingen(
-                ruimten, self.stelselgroep
+                ruimten, self.stelselgroep, self.peildatum
             )
         )
 
@@ -452,7 +447,7 @@ class GemeenschappelijkeBinnenruimtenGedeeldMetMeerdereAdressen(Stelselgroep):
             )
             aantal_eenheden = ruimte.gedeeld_met_aantal_eenheden or 1
 
-            waarderingen = list(waardeer_keuken(ruimte, self.stelsel))
+            waarderingen = list(waardeer_keuken(ruimte, self.stelsel, self.peildatum))
             for waardering in waarderingen:
                 if waardering.criterium is None:
                     logger.warning(
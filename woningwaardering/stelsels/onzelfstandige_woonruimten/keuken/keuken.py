@@ -64,7 +64,9 @@ class Keuken(Stelselgroep):
         ]
 
         for ruimte in ruimten or []:
-            woningwaarderingen = list(waardeer_keuken(ruimte, self.stelsel))
+            woningwaarderingen = list(
+                waardeer_keuken(ruimte, self.stelsel, self.peildatum)
+            )
 
             # houd bij of de ruimte gedeeld is met andere onzelfstandige woonruimten zodat later de punten kunnen worden gedeeld
             for woningwaardering in woningwaarderingen:
@@ -136,14 +138,11 @@ class Keuken(Stelselgroep):
             )
             woningwaardering_groep.woningwaarderingen.append(woningwaardering)
 
-        woningwaardering_groep.punten = float(
-            sum(
-                Decimal(str(woningwaardering.punten))
-                for woningwaardering in woningwaardering_groep.woningwaarderingen or []
-                if woningwaardering.punten is not None
-                and woningwaardering.criterium is not None
-                and woningwaardering.criterium.bovenliggende_criterium is None
-            )
+        woningwaardering_groep.punten = utils.som(
+            woningwaardering.punten
+            for woningwaardering in woningwaardering_groep.woningwaarderingen or []
+            if woningwaardering.criterium is not None
+            and woningwaardering.criterium.bovenliggende_criterium is None
         )
 
         logger.info(
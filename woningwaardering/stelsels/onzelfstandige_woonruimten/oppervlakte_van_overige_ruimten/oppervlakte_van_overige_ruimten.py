@@ -147,19 +147,11 @@ class OppervlakteVanOverigeRuimten(Stelselgroep):
         # voeg de correcties als laatste toe
         woningwaardering_groep.woningwaarderingen.extend(woningwaardering_correcties)
 
-        punten = float(
-            utils.rond_af_op_kwart(
-                sum(
-                    Decimal(str(woningwaardering.punten))
-                    for woningwaardering in woningwaardering_groep.woningwaarderingen
-                    or []
-                    if woningwaardering.punten is not None
-                )
-            )
+        woningwaardering_groep.punten = utils.som_op_kwart(
+            woningwaardering.punten
+            for woningwaardering in woningwaardering_groep.woningwaarderingen or []
         )
 
-        woningwaardering_groep.punten = punten
-
         logger.info(
             f"Eenheid ({eenheid.id}) krijgt in totaal {woningwaardering_groep.punten} punten voor {self.stelselgroep.naam}"
         )
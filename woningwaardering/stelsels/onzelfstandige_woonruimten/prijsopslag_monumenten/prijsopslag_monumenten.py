@@ -1,9 +1,9 @@
 from datetime import date
-from decimal import Decimal
 from typing import Iterator
 
 from loguru import logger
 
+from woningwaardering.stelsels import utils
 from woningwaardering.stelsels._dev_utils import DevelopmentContext
 from woningwaardering.stelsels.gedeelde_logica.prijsopslag_monumenten import (
     check_monumenten_attribuut,
@@ -60,25 +60,15 @@ class PrijsopslagMonumenten(Stelselgroep):
             if woningwaardering is not None
         )
 
-        opslagpercentage = Decimal(
-            sum(
-                Decimal(str(woningwaardering.opslagpercentage))
-                for woningwaardering in woningwaardering_groep.woningwaarderingen or []
-                if woningwaardering.opslagpercentage is not None
-            )
+        woningwaardering_groep.opslagpercentage = utils.som(
+            woningwaardering.opslagpercentage
+            for woningwaardering in woningwaardering_groep.woningwaarderingen or []
         )
-
-        woningwaardering_groep.opslagpercentage = float(opslagpercentage)
-        punten = Decimal(
-            sum(
-                Decimal(str(woningwaardering.punten))
-                for woningwaardering in woningwaardering_groep.woningwaarderingen or []
-                if woningwaardering.punten is not None
-            )
+        woningwaardering_groep.punten = utils.som(
+            woningwaardering.punten
+            for woningwaardering in woningwaardering_groep.woningwaarderingen or []
         )
 
-        woningwaardering_groep.punten = float(punten)
-
         logger.info(
             f"Eenheid ({eenheid.id}) krijgt in totaal {woningwaardering_groep.punten} punten voor {self.stelselgroep.naam}"
         )
@@ -212,7 +212,7 @@ class PuntenVoorDeWozWaarde(Stelselgroep):
             )
         )
 
-        woonplaats = utils.get_woonplaats(adres)
+        woonplaats = adres.woonplaats
 
         if woonplaats is None or woonplaats.code is None:
             warnings.warn(
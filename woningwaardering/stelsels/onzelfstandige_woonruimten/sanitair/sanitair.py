@@ -64,7 +64,9 @@ class Sanitair(Stelselgroep):
         ]
 
         waarderingen_met_ruimten = list(
-            Sanitair.genereer_woningwaarderingen(ruimten, self.stelselgroep)
+            Sanitair.genereer_woningwaarderingen(
+                ruimten, self.stelselgroep, self.peildatum
+            )
         )
 
         waarderingen_met_totalen = list(self._maak_totalen(waarderingen_met_ruimten))
@@ -72,14 +74,11 @@ class Sanitair(Stelselgroep):
         woningwaardering_groep.woningwaarderingen.extend(waarderingen_met_totalen)
 
         # er is hier al op kwart afgerond
-        woningwaardering_groep.punten = float(
-            sum(
-                Decimal(str(woningwaardering.punten))
-                for woningwaardering in woningwaardering_groep.woningwaarderingen or []
-                if woningwaardering.punten is not None
-                and woningwaardering.criterium is not None
-                and woningwaardering.criterium.bovenliggende_criterium is None
-            )
+        woningwaardering_groep.punten = utils.som(
+            woningwaardering.punten
+            for woningwaardering in woningwaardering_groep.woningwaarderingen or []
+            if woningwaardering.criterium is not None
+            and woningwaardering.criterium.bovenliggende_criterium is None
         )
 
         logger.info(
@@ -92,6 +91,7 @@ class Sanitair(Stelselgroep):
     def genereer_woningwaarderingen(
         ruimten: list[EenhedenRuimte],
         stelselgroep: WoningwaarderingstelselgroepReferentiedata,
+        peildatum: date,
     ) -> Iterator[
         tuple[EenhedenRuimte, list[WoningwaarderingResultatenWoningwaardering]]
     ]:
@@ -112,6 +112,7 @@ class Sanitair(Stelselgroep):
                     ruimte,
                     stelselgroep,
                     Woningwaarderingstelsel.onzelfstandige_woonruimten,
+                    peildatum,
                 )
             )
             # zoek het maximum aantal wastafels in een ruimte m.u.v. badkamer
@@ -0,0 +1,352 @@
+from __future__ import annotations
+
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterator, Mapping
+
+from woningwaardering.stelsels.utils import (
+    classificeer_ruimte,
+    gedeeld_met_eenheden,
+    gedeeld_met_onzelfstandige_woonruimten,
+)
+from woningwaardering.vera.bvg.generated import (
+    EenhedenEenheid,
+    EenhedenRuimte,
+    Referentiedata,
+)
+from woningwaardering.vera.referentiedata import (
+    Ruimtedetailsoort,
+    RuimtesoortReferentiedata,
+)
+
+
+@dataclass(slots=True, eq=False)
+class RuimteGegevens:
+    """Afgeleide gegevens van een ruimte die door meerdere stelselgroepen worden gebruikt.
+
+    De classificatie wordt pas bepaald als die voor het eerst wordt opgevraagd en
+    daarna bewaard, zodat eventuele waarschuwingen op hetzelfde moment optreden als
+    zonder index. De classificatie hangt af van de oppervlakte, die tijdens de
+    waardering kan toenemen doordat kasten erbij worden opgeteld. Na zo'n wijziging
+    wordt de classificatie opnieuw bepaald.
+
+    Attributes:
+        ruimte (EenhedenRuimte): De ruimte.
+        gedeeld_met_eenheden (bool): Of de ruimte gedeeld wordt met twee of meer eenheden.
+        gedeeld_met_onzelfstandige_woonruimten (bool): Of de ruimte gedeeld wordt met twee
+            of meer onzelfstandige woonruimten.
+        verbonden_ruimten (tuple[EenhedenRuimte, ...]): De verbonden ruimten.
+        installaties (Counter[Referentiedata]): Het aantal installaties per soort. Niet
+            aanpassen; maak een kopie om aantallen aan te vullen.
+        bouwkundige_elementen (Counter[Referentiedata]): Het aantal bouwkundige elementen
+            per detailsoort. Niet aanpassen.
+    """
+
+    ruimte: EenhedenRuimte
+    gedeeld_met_eenheden: bool
+    gedeeld_met_onzelfstandige_woonruimten: bool
+    verbonden_ruimten: tuple[EenhedenRuimte, ...]
+    installaties: Counter[Referentiedata]
+    bouwkundige_elementen: Counter[Referentiedata]
+    _verbonden_per_detailsoort: dict[str | None, tuple[EenhedenRuimte, ...]] = field(
+        default_factory=dict, repr=False
+    )
+    _classificatie: RuimtesoortReferentiedata | None = field(default=None, repr=False)
+    _geclassificeerd: bool = field(default=False, repr=False)
+    _geclassificeerd_bij_oppervlakte: float | None = field(default=None, repr=False)
+
+    @classmethod
+    def van(
+        cls,
+        ruimte: EenhedenRuimte,
+        ruimten_per_id: Mapping[str, EenhedenRuimte] | None = None,
+    ) -> RuimteGegevens:
+        """
+        Bepaalt de gegevens van een ruimte.
+
+        Een verbonden ruimte wordt via haar id opgezocht in `ruimten_per_id`, zodat de
+        gegevens van de ruimte uit de eenheid worden gebruikt in plaats van die van de
+        geneste kopie. Daardoor volstaat in de invoer een verbonden ruimte met alleen
+        een id, bijvoorbeeld `"verbondenRuimten": [{"id": "Space_2"}]`. Een verbonden
+        ruimte die niet gevonden wordt, wordt gebruikt zoals die is opgegeven.
+
+        Args:
+            ruimte (EenhedenRuimte): De ruimte.
+            ruimten_per_id (Mapping[str, EenhedenRuimte] | None, optional): De ruimten
+                van de eenheid per id.
+
+        Returns:
+            RuimteGegevens: De gegevens van de ruimte.
+        """
+        ruimten_per_id = ruimten_per_id or {}
+        verbonden_ruimten = tuple(
+            ruimten_per_id.get(verbonden_ruimte.id, verbonden_ruimte)
+            if verbonden_ruimte.id is not None
+            else verbonden_ruimte
+            for verbonden_ruimte in ruimte.verbonden_ruimten or []
+        )
+        verbonden_per_detailsoort: dict[str | None, list[EenhedenRuimte]] = {}
+        for verbonden_ruimte in verbonden_ruimten:
+            verbonden_per_detailsoort.setdefault(
+                verbonden_ruimte.detail_soort.code
+                if verbonden_ruimte.detail_soort is not None
+                else None,
+                [],
+            ).append(verbonden_ruimte)
+
+        return cls(
+            ruimte=ruimte,
+            gedeeld_met_eenheden=gedeeld_met_eenheden(ruimte),
+            gedeeld_met_onzelfstandige_woonruimten=gedeeld_met_onzelfstandige_woonruimten(
+                ruimte
+            ),
+            verbonden_ruimten=verbonden_ruimten,
+            installaties=Counter(ruimte.installaties or []),
+            bouwkundige_elementen=Counter(
+                element.detail_soort
+                for element in ruimte.bouwkundige_elementen or []
+                if element.detail_soort is not None
+            ),
+            _verbonden_per_detailsoort={
+                code: tuple(ruimten)
+                for code, ruimten in verbonden_per_detailsoort.items()
+            },
+        )
+
+    def verbonden(
+        self, detailsoort: Referentiedata | None = None
+    ) -> tuple[EenhedenRuimte, ...]:
+        """
+        Geeft de verbonden ruimten, eventueel alleen die met een detailsoort.
+
+        Args:
+            detailsoort (Referentiedata | None, optional): De detailsoort van de
+                verbonden ruimten. Standaard worden alle verbonden ruimten gegeven.
+
+        Returns:
+            tuple[EenhedenRuimte, ...]: De verbonden ruimten, in de volgorde van de invoer.
+        """
+        if detailsoort is None:
+            return self.verbonden_ruimten
+        return self._verbonden_per_detailsoort.get(detailsoort.code, ())
+
+    @property
+    def kasten(self) -> tuple[EenhedenRuimte, ...]:
+        """De verbonden ruimten met detailsoort kast."""
+        return self.verbonden(Ruimtedetailsoort.kast)
+
+    def heeft_bouwkundig_element(self, *detailsoorten: Referentiedata) -> bool:
+        """
+        Controleert of de ruimte bouwkundige elementen van alle detailsoorten heeft,
+        zoals `vera.utils.heeft_bouwkundig_element`.
+
+        Args:
+            *detailsoorten (Referentiedata): De detailsoorten van de bouwkundige elementen.
+
+        Returns:
+            bool: True als de ruimte alle opgegeven bouwkundige elementen heeft.
+        """
+        return all(
+            self.bouwkundige_elementen[detailsoort] > 0 for detailsoort in detailsoorten
+        )
+
+    def aantal_bouwkundige_elementen(self, *detailsoorten: Referentiedata) -> int:
+        """
+        Telt de bouwkundige elementen van de detailsoorten, zoals
+        `vera.utils.aantal_bouwkundige_elementen`.
+
+        Args:
+            *detailsoorten (Referentiedata): De detailsoorten van de bouwkundige elementen.
+
+        Returns:
+            int: Het kleinste aantal van de opgegeven detailsoorten.
+        """
+        return min(
+            (self.bouwkundige_elementen[detailsoort] for detailsoort in detailsoorten),
+            default=0,
+        )
+
+    def aantal_installaties(self, installatie: Referentiedata) -> int:
+        """
+        Telt het aantal installaties van een soort in de ruimte.
+
+        Args:
+            installatie (Referentiedata): De soort installatie.
+
+        Returns:
+            int: Het aantal installaties van deze soort.
+        """
+        return self.installaties[installatie]
+
+    @property
+    def classificatie(self) -> RuimtesoortReferentiedata | None:
+        """De classificatie van de ruimte volgens `classificeer_ruimte`."""
+        oppervlakte = self.ruimte.oppervlakte
+        if not self._geclassificeerd or (
+            self._geclassificeerd_bij_oppervlakte != oppervlakte
+        ):
+            self._classificatie = classificeer_ruimte(self.ruimte)
+            self._geclassificeerd = True
+            self._geclassificeerd_bij_oppervlakte = oppervlakte
+        return self._classificatie
+
+
+class RuimteIndex:
+    """Index van de ruimten van één eenheid, die per waardering eenmaal wordt opgebouwd.
+
+    `Stelsel.waardeer` bouwt de index voordat de stelselgroepen worden gewaardeerd. Alle
+    stelselgroepen lezen daarna de classificatie, de gedeelde status, de verbonden
+    ruimten en de aantallen installaties en bouwkundige elementen van een ruimte uit
+    dezelfde index. Verbonden ruimten worden via hun id herleid tot de ruimten van de
+    eenheid.
+
+    Parameters:
+        eenheid (EenhedenEenheid): De eenheid waarvan de ruimten worden geïndexeerd.
+    """
+
+    def __init__(self, eenheid: EenhedenEenheid) -> None:
+        self.eenheid = eenheid
+        ruimten = eenheid.ruimten or []
+
+        # Een verbonden ruimte wordt alleen herleid als haar id uniek is binnen de
+        # eenheid. Ruimten kunnen gelijke of ontbrekende ids hebben.
+        ids = Counter(ruimte.id for ruimte in ruimten if ruimte.id is not None)
+        self._ruimten_per_id = {
+            ruimte.id: ruimte
+            for ruimte in ruimten
+            if ruimte.id is not None and ids[ruimte.id] == 1
+        }
+
+        # De index houdt de ruimten vast, dus hun id() blijft geldig zolang de index
+        # bestaat.
+        self._gegevens = {
+            id(ruimte): RuimteGegevens.van(ruimte, self._ruimten_per_id)
+            for ruimte in ruimten
+        }
+
+    @classmethod
+    def voor(cls, eenheid: EenhedenEenheid) -> RuimteIndex:
+        """
+        Geeft de index van de eenheid die wordt gewaardeerd, of een nieuwe index als
+        de eenheid buiten `Stelsel.waardeer` wordt gewaardeerd.
+
+        Args:
+            eenheid (EenhedenEenheid): De eenheid.
+
+        Returns:
+            RuimteIndex: De index van de eenheid.
+        """
+        index = _ruimte_index.get()
+        if index is not None and index.eenheid is eenheid:
+            return index
+        return cls(eenheid)
+
+    def gegevens(self, ruimte: EenhedenRuimte) -> RuimteGegevens:
+        """
+        Geeft de gegevens van een ruimte.
+
+        Args:
+            ruimte (EenhedenRuimte): De ruimte.
+
+        Returns:
+            RuimteGegevens: De gegevens uit de index, of nieuw bepaalde gegevens als de
+                ruimte niet tot de eenheid behoort.
+        """
+        gegevens = self._gegevens.get(id(ruimte))
+        if gegevens is None:
+            return RuimteGegevens.van(ruimte, self._ruimten_per_id)
+        return gegevens
+
+    def verbonden_ruimten(
+        self, ruimte: EenhedenRuimte, detailsoort: Referentiedata | None = None
+    ) -> tuple[EenhedenRuimte, ...]:
+        """
+        Geeft de ruimten van de eenheid die met een ruimte verbonden zijn.
+
+        Args:
+            ruimte (EenhedenRuimte): De ruimte.
+            detailsoort (Referentiedata | None, optional): De detailsoort van de
+                verbonden ruimten. Standaard worden alle verbonden ruimten gegeven.
+
+        Returns:
+            tuple[EenhedenRuimte, ...]: De verbonden ruimten, in de volgorde van de invoer.
+        """
+        return self.gegevens(ruimte).verbonden(detailsoort)
+
+    def ruimten(
+        self, ruimtesoort: RuimtesoortReferentiedata | None
+    ) -> tuple[EenhedenRuimte, ...]:
+        """
+        Geeft de ruimten met een classificatie, in de volgorde van de eenheid.
+
+        Args:
+            ruimtesoort (RuimtesoortReferentiedata | None): De classificatie, of None
+                voor de ruimten die niet geclassificeerd kunnen worden.
+
+        Returns:
+            tuple[EenhedenRuimte, ...]: De ruimten met deze classificatie.
+        """
+        # Niet bewaard: de classificatie van een ruimte kan tijdens de waardering
+        # veranderen, zie `RuimteGegevens`
+        code = ruimtesoort.code if ruimtesoort is not None else None
+        return tuple(
+            gegevens.ruimte
+            for gegevens in self._gegevens.values()
+            if (
+                gegevens.classificatie.code
+                if gegevens.classificatie is not None
+                else None
+            )
+            == code
+        )
+
+
+_ruimte_index: ContextVar[RuimteIndex | None] = ContextVar("ruimte_index", default=None)
+
+
+def get_ruimte_index() -> RuimteIndex | None:
+    """
+    Geeft de ruimte-index van de eenheid die in de huidige context wordt gewaardeerd.
+
+    Returns:
+        RuimteIndex | None: De index, of None buiten een waardering.
+    """
+    return _ruimte_index.get()
+
+
+@contextmanager
+def ruimte_index(eenheid: EenhedenEenheid) -> Iterator[RuimteIndex]:
+    """
+    Bouwt de ruimte-index van een eenheid en stelt die in binnen het with-blok.
+
+    Args:
+        eenheid (EenhedenEenheid): De eenheid die wordt gewaardeerd.
+
+    Yields:
+        RuimteIndex: De index van de eenheid.
+    """
+    index = RuimteIndex(eenheid)
+    token = _ruimte_index.set(index)
+    try:
+        yield index
+    finally:
+        _ruimte_index.reset(token)
+
+
+def ruimte_gegevens(ruimte: EenhedenRuimte) -> RuimteGegevens:
+    """
+    Geeft de gegevens van een ruimte uit de ruimte-index in de huidige context.
+
+    Args:
+        ruimte (EenhedenRuimte): De ruimte.
+
+    Returns:
+        RuimteGegevens: De gegevens van de ruimte. Buiten een waardering worden de
+            gegevens nieuw bepaald.
+    """
+    index = _ruimte_index.get()
+    if index is None:
+        return RuimteGegevens.van(ruimte)
+    return index.gegevens(ruimte)
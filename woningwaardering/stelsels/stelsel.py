@@ -1,18 +1,25 @@
 from datetime import date
 from decimal import Decimal
+from functools import partial
 from importlib.resources import files
+from typing import Iterable
 
 import pandas as pd
 from loguru import logger
 
+from woningwaardering.stelsels import honderdsten
+from woningwaardering.stelsels.ruimte_index import ruimte_index
 from woningwaardering.stelsels.stelselgroep import (
     Stelselgroep,
 )
 from woningwaardering.stelsels.utils import (
     is_geldig,
+    met_rekencontext,
     normaliseer_ruimte_namen,
     rond_af,
     rond_af_op_kwart,
+    voer_gelijktijdig_uit,
+    werkkopie,
 )
 from woningwaardering.vera.bvg.generated import (
     EenhedenEenheid,
@@ -22,6 +29,7 @@ from woningwaardering.vera.referentiedata import (
     WoningwaarderingstelselgroepReferentiedata,
     WoningwaarderingstelselReferentiedata,
 )
+from woningwaardering.verrijking import Verrijking
 
 
 class Stelsel:
@@ -34,6 +42,9 @@ class Stelsel:
         peildatum (date, optional): De peildatum voor de waardering.
             Standaard is de huidige datum.
         stelselgroepen (list[type[Stelselgroep]] | None, optional): De stelselgroepen die worden berekend.
+        verrijking (Verrijking | None, optional): De verrijking waarmee ontbrekende gegevens
+            worden aangevuld voordat de stelselgroepen worden berekend.
+            Standaard wordt een verrijking met de standaardinstellingen gebruikt.
 
     Raises:
         ValueError: Als het stelsel niet geldig is op de peildatum.
@@ -46,6 +57,7 @@ class Stelsel:
         einddatum: date = date.max,
         peildatum: date = date.today(),
         stelselgroepen: list[type[Stelselgroep]] | None = None,
+        verrijking: Verrijking | None = None,
     ) -> None:
         self.stelsel = stelsel
         logger.info(f"Stelsel {stelsel.naam} wordt gebruikt.")
@@ -58,6 +70,7 @@ class Stelsel:
         self.stelselgroepen = [
             stelselgroep(peildatum) for stelselgroep in stelselgroepen or []
         ]
+        self.verrijking = verrijking or Verrijking()
         self.df_maximale_huur = pd.read_csv(
             str(
                 files("woningwaardering").joinpath(
@@ -66,22 +79,38 @@ class Stelsel:
             )
         )
 
+    @met_rekencontext
     def waardeer(
         self,
         eenheid: EenhedenEenheid,
         *,
         negeer_stelselgroep: WoningwaarderingstelselgroepReferentiedata | None = None,
+        verrijk: bool = True,
+        met_woningwaarderingen: bool = True,
     ) -> WoningwaarderingResultatenWoningwaarderingResultaat:
         """Berekent de woningwaardering voor een stelsel.
 
         Parameters:
             eenheid (EenhedenEenheid): De eenheid waarvoor de woningwaardering wordt berekend.
             negeer_stelselgroep (WoningwaarderingstelselgroepReferentiedata | None, optional): Een stelselgroep die moet worden overgeslagen.
+            verrijk (bool, optional): Of ontbrekende gegevens eerst worden aangevuld met de verrijking van het stelsel.
+                Gebruik False als de eenheid al vooraf is verrijkt, bijvoorbeeld in een batch met `verrijk_eenheden`.
+            met_woningwaarderingen (bool, optional): Of het resultaat de woningwaarderingen per criterium bevat.
+                Met False worden de woningwaarderingen na de berekening uit de groepen weggelaten, zodat die
+                alleen de punten en het opslagpercentage bevatten. De berekening zelf is gelijk; alleen het
+                resultaat is veel kleiner, bijvoorbeeld om op te slaan bij het screenen van grote aantallen eenheden.
 
         Returns:
             WoningwaarderingResultatenWoningwaarderingResultaat: Het bijgewerkte resultaat van de woningwaardering.
         """
 
+        # De verrijking en de waardering passen de werkkopie aan; de eenheid van de
+        # aanroeper blijft ongewijzigd
+        eenheid = werkkopie(eenheid)
+
+        if verrijk:
+            self.verrijking.verrijk(eenheid)
+
         normaliseer_ruimte_namen(eenheid)
 
         resultaat = WoningwaarderingResultatenWoningwaarderingResultaat()
@@ -89,14 +118,17 @@ class Stelsel:
 
         resultaat.groepen = []
 
-        for stelselgroep in self.stelselgroepen:
-            if (
-                negeer_stelselgroep is not None
-                and stelselgroep.stelselgroep == negeer_stelselgroep
-            ):
-                continue
+        # De stelselgroepen lezen de classificatie en andere afgeleide gegevens van
+        # de ruimten uit één index per eenheid
+        with ruimte_index(eenheid):
+            for stelselgroep in self.stelselgroepen:
+                if (
+                    negeer_stelselgroep is not None
+                    and stelselgroep.stelselgroep == negeer_stelselgroep
+                ):
+                    continue
 
-            resultaat.groepen.append(stelselgroep.waardeer(eenheid, resultaat))
+                resultaat.groepen.append(stelselgroep.waardeer(eenheid, resultaat))
 
         resultaat.punten = float(Stelsel.bereken_puntentotaal(resultaat))
 
@@ -124,8 +156,63 @@ class Stelsel:
             maximale_huur + huurprijsopslag
         )
 
+        # De woningwaarderingen worden pas na alle stelselgroepen weggelaten, omdat
+        # sommige stelselgroepen de woningwaarderingen van andere groepen gebruiken.
+        if not met_woningwaarderingen:
+            for woningwaardering_groep in resultaat.groepen:
+                woningwaardering_groep.woningwaarderingen = None
+
         return resultaat
 
+    def waardeer_batch(
+        self,
+        eenheden: Iterable[EenhedenEenheid],
+        *,
+        max_workers: int | None = None,
+        negeer_stelselgroep: WoningwaarderingstelselgroepReferentiedata | None = None,
+        verrijk: bool = True,
+        met_woningwaarderingen: bool = True,
+    ) -> list[WoningwaarderingResultatenWoningwaarderingResultaat]:
+        """Berekent de woningwaardering voor een batch eenheden in een pool van threads.
+
+        Alle threads gebruiken dit stelsel. `waardeer` bewaart geen gegevens tussen
+        aanroepen en verrijkt en waardeert een werkkopie van de eenheid, dus
+        eenheden kunnen gelijktijdig worden gewaardeerd, ook als dezelfde eenheid
+        meer dan eens in de batch voorkomt. Elke eenheid wordt in dezelfde taak
+        verrijkt en gewaardeerd, zodat het opzoeken van gegevens voor de ene
+        eenheid gelijk loopt met de waardering van een andere. De aangevulde
+        gegevens komen niet in de eenheden zelf; verrijk daarvoor vooraf met
+        `verrijk_eenheden` en geef `verrijk=False` mee.
+
+        Parameters:
+            eenheden (Iterable[EenhedenEenheid]): De eenheden waarvoor de woningwaardering wordt berekend.
+            max_workers (int | None, optional): Het maximale aantal threads.
+                Standaard bepaalt `ThreadPoolExecutor` het aantal.
+            negeer_stelselgroep (WoningwaarderingstelselgroepReferentiedata | None, optional): Een stelselgroep die moet worden overgeslagen.
+            verrijk (bool, optional): Of ontbrekende gegevens eerst worden aangevuld met de verrijking van het stelsel.
+            met_woningwaarderingen (bool, optional): Of de resultaten de woningwaarderingen per criterium bevatten.
+
+        Returns:
+            list[WoningwaarderingResultatenWoningwaarderingResultaat]: De resultaten, in de volgorde van de eenheden.
+
+        Raises:
+            Exception: De fout van de eerste eenheid waarvan de waardering mislukt,
+                bijvoorbeeld een `UserWarning` als het warning filter op "error" staat.
+        """
+        return voer_gelijktijdig_uit(
+            (
+                partial(
+                    self.waardeer,
+                    eenheid,
+                    negeer_stelselgroep=negeer_stelselgroep,
+                    verrijk=verrijk,
+                    met_woningwaarderingen=met_woningwaarderingen,
+                )
+                for eenheid in eenheden
+            ),
+            max_workers=max_workers,
+        )
+
     @staticmethod
     def bereken_puntentotaal(
         resultaat: WoningwaarderingResultatenWoningwaarderingResultaat,
@@ -136,19 +223,31 @@ class Stelsel:
         # dan 0,5 punten wordt afgerond naar beneden op hele punten. In de
         # eindsaldering zitten ook de punten voor eventuele gemeenschappelijke ruimten
         # en voorzieningen.
-        return rond_af(
-            sum(
-                # De waardering in punten wordt per rubriek na saldering afgerond op
-                # 0,25 punt waarbij een achtste (1/8) punt naar boven wordt afgerond.
-                # Dat wil zeggen dat 0,125 wordt afgerond naar 0,25. Een kwartpunt is
-                # de kleinst werkbare waardering binnen het woningwaarderingsstelsel
-                # voor een afzonderlijke rubriek.
-                rond_af_op_kwart(woningwaardering_groep.punten)
-                for woningwaardering_groep in resultaat.groepen or []
-                if woningwaardering_groep.punten is not None
-            ),
-            decimalen=0,
-        )
+        punten = [
+            woningwaardering_groep.punten
+            for woningwaardering_groep in resultaat.groepen or []
+            if woningwaardering_groep.punten is not None
+        ]
+        # De waardering in punten wordt per rubriek na saldering afgerond op
+        # 0,25 punt waarbij een achtste (1/8) punt naar boven wordt afgerond.
+        # Dat wil zeggen dat 0,125 wordt afgerond naar 0,25. Een kwartpunt is
+        # de kleinst werkbare waardering binnen het woningwaarderingsstelsel
+        # voor een afzonderlijke rubriek.
+        groepen_in_honderdsten = [honderdsten.naar_honderdsten(p) for p in punten]
+        if all(groep is not None for groep in groepen_in_honderdsten):
+            totaal = honderdsten.Honderdsten(
+                sum(
+                    honderdsten.rond_af_op_kwart(groep)
+                    for groep in groepen_in_honderdsten
+                    if groep is not None
+                )
+            )
+            return honderdsten.naar_decimal(
+                honderdsten.rond_af(totaal, decimalen=0),
+                decimalen=0,
+                negatief=totaal < 0,
+            )
+        return rond_af(sum(rond_af_op_kwart(p) for p in punten), decimalen=0)
 
     def bereken_maximale_huur(
         self, resultaat: WoningwaarderingResultatenWoningwaarderingResultaat
@@ -1,10 +1,10 @@
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from datetime import date
-from typing import Iterator
+from typing import Any, Iterator
 
 from woningwaardering.stelsels.criteriumsleutels import CriteriumSleutels
-from woningwaardering.stelsels.utils import is_geldig
+from woningwaardering.stelsels.utils import is_geldig, met_rekencontext
 from woningwaardering.vera.bvg.generated import (
     EenhedenEenheid,
     WoningwaarderingResultatenWoningwaardering,
@@ -18,6 +18,13 @@ from woningwaardering.vera.referentiedata import (
 
 
 class Stelselgroep(ABC):
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Een stelselgroep kan ook los worden gewaardeerd, daarom rekent de waardeer
+        # van elke stelselgroep zelf met de rekencontext.
+        if "waardeer" in cls.__dict__:
+            setattr(cls, "waardeer", met_rekencontext(cls.__dict__["waardeer"]))
+
     @property
     def stelsel(self) -> WoningwaarderingstelselReferentiedata:
         return self._stelsel
@@ -1,18 +1,30 @@
-import asyncio
+import contextvars
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import date, datetime, time
-from decimal import ROUND_HALF_UP, Decimal
+from decimal import ROUND_HALF_UP, BasicContext, Context, Decimal, localcontext
 from functools import wraps
 from importlib.resources import files
-from typing import Any, Callable, Counter, Iterator, List, Tuple
+from typing import (
+    Any,
+    Callable,
+    Counter,
+    Iterable,
+    Iterator,
+    List,
+    ParamSpec,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
 
 import pandas as pd
-import requests
 from dateutil.relativedelta import relativedelta
 from loguru import logger
 from prettytable import PrettyTable
 
-from woningwaardering.stelsels import utils
+from woningwaardering.stelsels import honderdsten, utils
 from woningwaardering.vera.bvg.generated import (
     EenhedenEenheid,
     EenhedenEenheidadres,
@@ -31,14 +43,21 @@ from woningwaardering.vera.referentiedata import (
     Ruimtesoort,
     RuimtesoortReferentiedata,
 )
-from woningwaardering.vera.referentiedata.eenheidmonument import (
-    EenheidmonumentReferentiedata,
-)
 from woningwaardering.vera.utils import heeft_bouwkundig_element
+from woningwaardering.verrijking.monumenten_cache import MonumentenCache
+from woningwaardering.verrijking.resolvers import (
+    MonumentenResolver,
+    WoonplaatsResolver,
+    get_woonplaats_resolver,
+)
 
-index: int = 0  # nodig voor mypy voor de global index voor de tabel
+P = ParamSpec("P")
+R = TypeVar("R")
+V = TypeVar("V")
 
-KADASTER_SPARQL_ENDPOINT = "https://data.kkg.kadaster.nl/service/sparql"
+# Alle berekeningen gebruiken deze context om afrondingsverschillen te voorkomen.
+# Zie https://docs.python.org/3/library/decimal.html#rounding
+REKENCONTEXT: Context = BasicContext
 
 
 def is_geldig(
@@ -60,22 +79,44 @@ def is_geldig(
     return begindatum <= peildatum <= einddatum
 
 
+def geldig_op(versies: Sequence[Tuple[date, V]], peildatum: date) -> V:
+    """
+    Kiest uit versies met een begindatum de versie die op de peildatum geldt.
+
+    Parameters:
+        versies (Sequence[Tuple[date, V]]): De versies, oplopend op begindatum.
+        peildatum (date): De peildatum.
+
+    Returns:
+        V: De versie met de laatste begindatum op of vóór de peildatum.
+
+    Raises:
+        ValueError: Als er op de peildatum nog geen versie geldt.
+    """
+    for begindatum, versie in reversed(versies):
+        if begindatum <= peildatum:
+            return versie
+    raise ValueError(f"Geen versie geldig op peildatum {peildatum}")
+
+
 def _voeg_onderliggende_woningwaarderingen_toe(
     table: PrettyTable,
     stelselgroep_naam: str,
     woningwaardering: WoningwaarderingResultatenWoningwaardering,
     woningwaarderingen: list[WoningwaarderingResultatenWoningwaardering],
     aantal_waarderingen: int,
+    index: int,
     indent: int = 0,
-) -> None:
+) -> int:
     """
     Voeg de onderliggende woningwaarderingen toe aan de tabel.
-    """
 
-    global index
+    Returns:
+        int: Het aantal rijen van de stelselgroep na het toevoegen.
+    """
 
     if not woningwaardering.criterium or not woningwaardering.criterium.id:
-        return
+        return index
 
     onderliggende_woningwaarderingen = [
         onderliggende_woningwaardering
@@ -109,15 +150,18 @@ def _voeg_onderliggende_woningwaarderingen_toe(
                 divider=index == aantal_waarderingen,
             )
 
-        _voeg_onderliggende_woningwaarderingen_toe(
+        index = _voeg_onderliggende_woningwaarderingen_toe(
             table,
             stelselgroep_naam,
             onderliggende_woningwaardering,
             woningwaarderingen,
             aantal_waarderingen=aantal_waarderingen,
+            index=index,
             indent=indent + 1,
         )
 
+    return index
+
 
 def naar_tabel(
     woningwaardering_resultaat: (
@@ -183,7 +227,6 @@ def naar_tabel(
         )
         woningwaarderingen = woningwaardering_groep.woningwaarderingen or []
         aantal_waarderingen = len(woningwaarderingen)
-        global index
         index = 0
 
         for woningwaardering in [
@@ -216,13 +259,14 @@ def naar_tabel(
                     divider=index == aantal_waarderingen,
                 )
 
-                _voeg_onderliggende_woningwaarderingen_toe(
+                index = _voeg_onderliggende_woningwaarderingen_toe(
                     table,
                     stelselgroep_naam,
                     woningwaardering,
                     woningwaarderingen,
                     indent=1,
                     aantal_waarderingen=aantal_waarderingen,
+                    index=index,
                 )
 
         aantallen = [
@@ -429,6 +473,61 @@ def energieprestatie_met_geldig_label(
     return None
 
 
+def met_rekencontext(func: Callable[P, R]) -> Callable[P, R]:
+    """
+    Voert een functie uit met de `REKENCONTEXT` als Decimal-context.
+
+    Een Decimal-context geldt per thread. Door de context per aanroep in te stellen
+    rekent een waardering in elke thread met dezelfde precisie en afronding.
+
+    Args:
+        func (Callable[P, R]): De functie.
+
+    Returns:
+        Callable[P, R]: De functie, uitgevoerd met de `REKENCONTEXT`.
+    """
+
+    @wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        with localcontext(REKENCONTEXT):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def voer_gelijktijdig_uit(
+    taken: Iterable[Callable[[], R]], max_workers: int | None = None
+) -> list[R]:
+    """
+    Voert taken gelijktijdig uit in een pool van threads.
+
+    Elke taak draait in een kopie van de context van de aanroeper, zodat
+    instellingen in ContextVars, zoals een tijdsbudget, ook in de threads gelden.
+
+    Args:
+        taken (Iterable[Callable[[], R]]): De taken.
+        max_workers (int | None, optional): Het maximale aantal threads.
+            Standaard bepaalt `ThreadPoolExecutor` het aantal.
+
+    Returns:
+        list[R]: De resultaten, in de volgorde van de taken.
+
+    Raises:
+        Exception: De fout van de eerste taak die mislukt, in de volgorde van de taken.
+            Taken die dan nog niet zijn gestart worden niet meer uitgevoerd.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(contextvars.copy_context().run, taak) for taak in taken
+        ]
+        try:
+            return [future.result() for future in futures]
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+
 def rond_af(
     getal: float | None | Decimal, decimalen: int, rounding: str | None = ROUND_HALF_UP
 ) -> Decimal:
@@ -472,80 +571,111 @@ def rond_af_op_kwart(getal: float | None | Decimal) -> Decimal:
     ) * kwart
 
 
-def update_eenheid_monumenten(eenheid: EenhedenEenheid) -> EenhedenEenheid:
+def som(getallen: Iterable[float | None]) -> float:
     """
-    Voegt monumentale statussen toe aan een eenheid d.m.v. aanroepen API's.
+    Telt getallen exact op, gelijk aan `float(sum(Decimal(str(getal)) ...))`.
+
+    Zolang alle getallen exact in honderdsten zijn uit te drukken wordt in gehele
+    honderdsten gerekend, anders met Decimal.
 
     Args:
-        eenheid (EenhedenEenheid): De eenheid waarvoor de monumentale status wordt opgehaald
+        getallen (Iterable[float | None]): De getallen. None wordt overgeslagen.
 
     Returns:
-        EenhedenEenheid: De met monumentale statussen bijgewerkte eenheid
+        float: De som.
     """
-    try:
-        from monumenten import MonumentenClient
+    waarden = [getal for getal in getallen if getal is not None]
+    totaal = honderdsten.som(waarden)
+    if totaal is None:
+        return float(sum(Decimal(str(getal)) for getal in waarden))
+    return honderdsten.naar_float(totaal)
 
-        has_monumenten = True
-    except ImportError:
-        has_monumenten = False
-        warnings.warn(
-            "Package 'monumenten' is niet geïnstalleerd. Monumentale status wordt niet automatisch bijgewerkt. "
-            "Installeer met: pip install woningwaardering[monumenten]",
-            UserWarning,
-        )
-        return eenheid
 
-    if not has_monumenten:
-        return eenheid
+def som_op_kwart(getallen: Iterable[float | None]) -> float:
+    """
+    Telt getallen exact op en rondt de som af op een kwart, gelijk aan
+    `float(rond_af_op_kwart(sum(Decimal(str(getal)) ...)))`.
 
-    eenheid.monumenten = eenheid.monumenten or []
-    try:
-        if (
-            eenheid.adresseerbaar_object_basisregistratie is None
-            or eenheid.adresseerbaar_object_basisregistratie.bag_identificatie is None
-        ):
-            logger.warning(f"Eenheid ({eenheid.id}): Geen bag_identificatie gevonden")
-            return eenheid
+    Zolang alle getallen exact in honderdsten zijn uit te drukken wordt in gehele
+    honderdsten gerekend, anders met Decimal.
 
-        logger.debug(
-            f"Eenheid ({eenheid.id}): Monumentale statussen worden opgehaald voor eenheid met bag_identificatie {eenheid.adresseerbaar_object_basisregistratie.bag_identificatie}"
-        )
-        bag_verblijfsobject_ids = [
-            eenheid.adresseerbaar_object_basisregistratie.bag_identificatie
-        ]
+    Args:
+        getallen (Iterable[float | None]): De getallen. None wordt overgeslagen.
 
-        async def _get_monuments() -> Any:
-            async with MonumentenClient() as client:
-                return await client.process_from_list(
-                    bag_verblijfsobject_ids,
-                    to_vera=True,
-                )
+    Returns:
+        float: De op een kwart afgeronde som.
+    """
+    waarden = [getal for getal in getallen if getal is not None]
+    totaal = honderdsten.som(waarden)
+    if totaal is None:
+        return float(rond_af_op_kwart(sum(Decimal(str(getal)) for getal in waarden)))
+    return honderdsten.naar_float(
+        honderdsten.rond_af_op_kwart(totaal), negatief=totaal < 0
+    )
 
-        # Voer de async context manager uit in een synchrone context
-        monumenten = asyncio.run(_get_monuments()).get(
-            eenheid.adresseerbaar_object_basisregistratie.bag_identificatie, []
-        )
 
-        if monumenten:
-            logger.info(
-                f"Eenheid ({eenheid.id}): Monumentale statussen gevonden: {', '.join(monument['naam'] for monument in monumenten)}"
-            )
-            eenheid.monumenten = [
-                EenheidmonumentReferentiedata(
-                    code=monument["code"], naam=monument["naam"]
-                )
-                for monument in monumenten
-            ]
-        else:
-            logger.debug(f"Eenheid ({eenheid.id}): Geen monumentale statussen gevonden")
-    except Exception as e:
-        warnings.warn(
-            f"Monumentale statussen konden niet worden opgehaald m.b.v. API: {e}",
-            UserWarning,
-        )
+def update_eenheid_monumenten(
+    eenheid: EenhedenEenheid,
+    cache: MonumentenCache | None = None,
+    resolver: MonumentenResolver | None = None,
+) -> EenhedenEenheid:
+    """
+    Voegt monumentale statussen toe aan een eenheid.
+
+    Verouderd: gebruik `Verrijking(woonplaatsen=False).verrijk(eenheid)` uit
+    `woningwaardering.verrijking`. Net als bij `Verrijking` worden alleen ontbrekende
+    monumentale statussen opgehaald.
+
+    Args:
+        eenheid (EenhedenEenheid): De eenheid waarvoor de monumentale status wordt opgehaald
+        cache (MonumentenCache | None, optional): De te gebruiken cache.
+            Standaard wordt de cache van `get_monumenten_cache` gebruikt.
+        resolver (MonumentenResolver | None, optional): De resolver waarmee de statussen
+            worden opgezocht. Standaard wordt de resolver van `get_monumenten_resolver` gebruikt.
+
+    Returns:
+        EenhedenEenheid: De met monumentale statussen bijgewerkte eenheid
+    """
+    warnings.warn(
+        "update_eenheid_monumenten is verouderd, gebruik Verrijking uit woningwaardering.verrijking",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+    # woningwaardering.verrijking importeert deze module
+    from woningwaardering.verrijking import Verrijking
+
+    Verrijking(woonplaatsen=False, monumenten_resolver=resolver, cache=cache).verrijk(
+        eenheid
+    )
     return eenheid
 
 
+def werkkopie(eenheid: EenhedenEenheid) -> EenhedenEenheid:
+    """
+    Maakt een werkkopie van een eenheid voor de waardering.
+
+    De verrijking vult monumentale statussen en de woonplaats van het adres aan en
+    de waardering nummert dubbele ruimtenamen en telt de oppervlakte en inhoud van
+    kasten op bij de ruimte. Dat gebeurt op de werkkopie, zodat de eenheid zelf
+    ongewijzigd blijft en herhaald of gelijktijdig gewaardeerd kan worden zonder
+    `deepcopy`. Alleen de eenheid, haar adres en haar ruimten worden ondiep
+    gekopieerd, alle andere gegevens worden gedeeld en mogen tijdens de waardering
+    niet worden aangepast.
+
+    Args:
+        eenheid (EenhedenEenheid): De te waarderen eenheid.
+
+    Returns:
+        EenhedenEenheid: De werkkopie van de eenheid.
+    """
+    update: dict[str, Any] = {}
+    if eenheid.adres is not None:
+        update["adres"] = eenheid.adres.model_copy()
+    if eenheid.ruimten is not None:
+        update["ruimten"] = [ruimte.model_copy() for ruimte in eenheid.ruimten]
+    return eenheid.model_copy(update=update)
+
+
 def normaliseer_ruimte_namen(eenheid: EenhedenEenheid) -> None:
     for ruimte in eenheid.ruimten or []:
         if not ruimte.naam:
@@ -584,10 +714,330 @@ def _classificeer_ruimte_dec(
 
 
 # @_classificeer_ruimte_dec
+_NIET_TE_CLASSIFICEREN_PARKEERRUIMTEN = Ruimtedetailsoort.codegroep(
+    # onderstaande parkeergelegenden worden binnenkort vervangen: https://github.com/Aedes-datastandaarden/vera-referentiedata/issues/110#issuecomment-2190641829
+    Ruimtedetailsoort.gemeenschappelijke_parkeerruimte_niet_specifieke_plek,
+    Ruimtedetailsoort.gemeenschappelijke_parkeerruimte_specifieke_plek,
+    Ruimtedetailsoort.open_parkeergarage_niet_specifieke_plek,
+    Ruimtedetailsoort.open_parkeergarage_specifieke_plek,
+    Ruimtedetailsoort.parkeergarage_niet_specifieke_plek,
+    Ruimtedetailsoort.parkeergarage_specifieke_plek,
+)
+
+# deze ruimten zijn sowieso buitenruimten
+_BUITENRUIMTEN = Ruimtedetailsoort.codegroep(
+    Ruimtedetailsoort.atrium_en_of_patio,
+    Ruimtedetailsoort.gemeenschappelijk_dakterras,
+    Ruimtedetailsoort.achtertuin,
+    Ruimtedetailsoort.balkon,
+    Ruimtedetailsoort.zijtuin,
+    Ruimtedetailsoort.voortuin,
+    Ruimtedetailsoort.dakterras,
+    Ruimtedetailsoort.gemeenschappelijke_tuin,
+    Ruimtedetailsoort.terras,
+    Ruimtedetailsoort.tuin,
+    Ruimtedetailsoort.tuin_rondom,
+    Ruimtedetailsoort.loggia,
+)
+
+_PARKEERPLAATSEN_BUITEN = Ruimtedetailsoort.codegroep(
+    Ruimtedetailsoort.carport,
+    Ruimtedetailsoort.parkeervak_auto_buiten_niet_overdekt,
+)
+
+_ALTIJD_VERTREK = Ruimtedetailsoort.codegroep(
+    Ruimtedetailsoort.keuken,
+    Ruimtedetailsoort.badkamer,
+    Ruimtedetailsoort.doucheruimte,
+)
+
+_VERTREK_OF_OVERIGE_RUIMTE = Ruimtedetailsoort.codegroep(
+    Ruimtedetailsoort.woonkamer,
+    Ruimtedetailsoort.woon_en_of_slaapkamer,
+    Ruimtedetailsoort.woonkamer_en_of_keuken,
+    Ruimtedetailsoort.slaapkamer,
+    Ruimtedetailsoort.badkamer_met_toilet,
+    Ruimtedetailsoort.overig_vertrek,
+    Ruimtedetailsoort.bijkeuken,
+    Ruimtedetailsoort.berging,
+    Ruimtedetailsoort.wasruimte,
+    Ruimtedetailsoort.kelder,
+    # Ruimtedetailsoort.schuur,
+)
+
+_GARAGES = Ruimtedetailsoort.codegroep(
+    Ruimtedetailsoort.garage_inpandig,
+    Ruimtedetailsoort.garage_uitpandig,
+    Ruimtedetailsoort.garagebox,
+    Ruimtedetailsoort.parkeervak_auto_binnen,
+)
+
+
+_TRAP_RELEVANT = Ruimtedetailsoort.codegroep(Ruimtedetailsoort.zolder)
+
+_VASTE_TRAP = Bouwkundigelementdetailsoort.trap.code
+_VLIZOTRAP = Bouwkundigelementdetailsoort.vlizotrap.code
+
+_Beslissleutel = Tuple[str | None, str | None, bool, str | None]
+
+
+@dataclass(frozen=True, slots=True)
+class _Classificatieregel:
+    """
+    Een regel in de beslistabel van `classificeer_ruimte`.
+
+    Een ruimte valt onder de eerste regel waarvan alle voorwaarden gelden. Een
+    voorwaarde die None is, geldt altijd.
+
+    Attributes:
+        detailsoorten (frozenset[str] | None): De codes van de ruimtedetailsoorten.
+        soorten (frozenset[str] | None): De codes van de ruimtesoorten.
+        gedeeld (bool | None): Of de ruimte gedeeld is met twee of meer eenheden.
+        trappen (frozenset[str | None] | None): De codes van de trappen in de ruimte,
+            met None voor een ruimte zonder trap.
+        uitkomst (RuimtesoortReferentiedata | None): De classificatie als de regel geen
+            drempels heeft.
+        drempels (tuple[tuple[float, RuimtesoortReferentiedata], ...]): Aflopende
+            minimale oppervlakten met de bijbehorende classificatie.
+        per_eenheid (bool): Of de drempels gelden voor de oppervlakte gedeeld door het
+            aantal eenheden.
+        waarschuwing (str | None): Waarschuwing bij het toepassen van de regel.
+        toelichting (str | None): Logmelding als een drempel wordt gehaald.
+        toelichting_zonder (str | None): Logmelding als geen drempel wordt gehaald.
+    """
+
+    detailsoorten: frozenset[str] | None = None
+    soorten: frozenset[str] | None = None
+    gedeeld: bool | None = None
+    trappen: frozenset[str | None] | None = None
+    uitkomst: RuimtesoortReferentiedata | None = None
+    drempels: tuple[tuple[float, RuimtesoortReferentiedata], ...] = ()
+    per_eenheid: bool = False
+    waarschuwing: str | None = None
+    toelichting: str | None = None
+    toelichting_zonder: str | None = None
+
+    def geldt_voor(self, sleutel: _Beslissleutel) -> bool:
+        detailsoort, soort, gedeeld, trap = sleutel
+        return (
+            (self.detailsoorten is None or detailsoort in self.detailsoorten)
+            and (self.soorten is None or soort in self.soorten)
+            and (self.gedeeld is None or gedeeld == self.gedeeld)
+            and (self.trappen is None or trap in self.trappen)
+        )
+
+    def classificeer(self, ruimte: EenhedenRuimte) -> RuimtesoortReferentiedata | None:
+        if self.waarschuwing is not None:
+            warnings.warn(self.waarschuwing.format(ruimte=ruimte), UserWarning)
+
+        if not self.drempels:
+            if self.toelichting_zonder is not None:
+                logger.info(self.toelichting_zonder.format(ruimte=ruimte))
+            return self.uitkomst
+
+        oppervlakte: float | Decimal = ruimte.oppervlakte or 0.0
+        if self.per_eenheid:
+            aantal_eenheden = ruimte.gedeeld_met_aantal_eenheden or 1
+            oppervlakte = Decimal(str(ruimte.oppervlakte)) / Decimal(
+                str(aantal_eenheden)
+            )
+
+        for drempel, ruimtesoort in self.drempels:
+            if oppervlakte >= drempel:
+                if self.toelichting is not None:
+                    logger.info(self.toelichting.format(ruimte=ruimte))
+                return ruimtesoort
+
+        if self.toelichting_zonder is not None:
+            logger.info(self.toelichting_zonder.format(ruimte=ruimte))
+        return None
+
+
+_GEEN_CLASSIFICATIE = _Classificatieregel()
+
+
+def _classificatieregels(
+    minimale_oppervlakte_vertrek: float,
+    minimale_oppervlakte_overige_ruimte: float,
+) -> tuple[_Classificatieregel, ...]:
+    vertrek_of_overige_ruimte = (
+        _VERTREK_OF_OVERIGE_RUIMTE
+        | Ruimtedetailsoort.codegroep(Ruimtedetailsoort.schuur)
+    )
+    vertrek = Ruimtesoort.codegroep(Ruimtesoort.vertrek)
+    overige_ruimten = Ruimtesoort.codegroep(Ruimtesoort.overige_ruimten)
+    parkeerplaats = Ruimtedetailsoort.codegroep(Ruimtedetailsoort.parkeerplaats)
+    zolder = Ruimtedetailsoort.codegroep(Ruimtedetailsoort.zolder)
+
+    return (
+        _Classificatieregel(
+            soorten=Ruimtesoort.codegroep(Ruimtesoort.verkeersruimte),
+            uitkomst=Ruimtesoort.verkeersruimte,
+        ),
+        _Classificatieregel(
+            detailsoorten=_NIET_TE_CLASSIFICEREN_PARKEERRUIMTEN,
+            waarschuwing=(
+                "Ruimte '{ruimte.naam}' ({ruimte.id}) heeft als ruimtedetailsoort {ruimte.detail_soort} en kan daardoor niet geclassificeerd worden. "
+                f"Gebruik voor parkeerplaatsen: {Ruimtedetailsoort.carport}, {Ruimtedetailsoort.parkeervak_auto_buiten_niet_overdekt} of {Ruimtedetailsoort.parkeervak_auto_binnen}"
+            ),
+        ),
+        _Classificatieregel(
+            detailsoorten=_BUITENRUIMTEN,
+            uitkomst=Ruimtesoort.buitenruimte,
+        ),
+        # privé parkeerplaatsen buiten zijn privé buitenruimten
+        _Classificatieregel(
+            detailsoorten=_PARKEERPLAATSEN_BUITEN,
+            gedeeld=False,
+            uitkomst=Ruimtesoort.buitenruimte,
+        ),
+        _Classificatieregel(
+            detailsoorten=parkeerplaats,
+            soorten=Ruimtesoort.codegroep(Ruimtesoort.buitenruimte),
+            gedeeld=False,
+            uitkomst=Ruimtesoort.buitenruimte,
+        ),
+        # Keuken, badkamer en doucheruimte worden altijd gewaardeerd als vertrek
+        _Classificatieregel(
+            detailsoorten=_ALTIJD_VERTREK,
+            uitkomst=Ruimtesoort.vertrek,
+        ),
+        # Een berging is een overige ruimte als de oppervlakte per eenheid minstens
+        # 2m2 is, ook als de berging gedeeld wordt
+        _Classificatieregel(
+            detailsoorten=Ruimtedetailsoort.codegroep(Ruimtedetailsoort.berging),
+            drempels=(
+                (minimale_oppervlakte_overige_ruimte, Ruimtesoort.overige_ruimten),
+            ),
+            per_eenheid=True,
+        ),
+        _Classificatieregel(
+            detailsoorten=vertrek_of_overige_ruimte,
+            soorten=vertrek,
+            drempels=(
+                (minimale_oppervlakte_vertrek, Ruimtesoort.vertrek),
+                (minimale_oppervlakte_overige_ruimte, Ruimtesoort.overige_ruimten),
+            ),
+        ),
+        _Classificatieregel(
+            detailsoorten=vertrek_of_overige_ruimte,
+            soorten=overige_ruimten,
+            drempels=(
+                (minimale_oppervlakte_overige_ruimte, Ruimtesoort.overige_ruimten),
+            ),
+        ),
+        # een toiletruimte mag alleen als overige ruimte gewaardeerd worden
+        _Classificatieregel(
+            detailsoorten=Ruimtedetailsoort.codegroep(Ruimtedetailsoort.toiletruimte),
+            drempels=(
+                (minimale_oppervlakte_overige_ruimte, Ruimtesoort.overige_ruimten),
+            ),
+        ),
+        # garages moeten privé zijn om gecategoriseerd te worden als overige ruimte
+        _Classificatieregel(
+            detailsoorten=_GARAGES,
+            gedeeld=False,
+            drempels=(
+                (minimale_oppervlakte_overige_ruimte, Ruimtesoort.overige_ruimten),
+            ),
+        ),
+        _Classificatieregel(
+            detailsoorten=parkeerplaats,
+            soorten=overige_ruimten,
+            gedeeld=False,
+            drempels=(
+                (minimale_oppervlakte_overige_ruimte, Ruimtesoort.overige_ruimten),
+            ),
+        ),
+        _Classificatieregel(
+            detailsoorten=zolder,
+            soorten=vertrek,
+            trappen=frozenset({_VASTE_TRAP}),
+            drempels=((minimale_oppervlakte_vertrek, Ruimtesoort.vertrek),),
+            toelichting=f"Ruimte '{{ruimte.naam}}' ({{ruimte.id}}) heeft een vaste trap: Ruimte wordt gewaardeerd als {Ruimtesoort.vertrek.naam}.",
+            toelichting_zonder="Ruimte '{ruimte.naam}' ({ruimte.id}) heeft geen vaste trap gevonden: Ruimte wordt niet gewaardeerd als {ruimte.soort.naam}.",
+        ),
+        _Classificatieregel(
+            detailsoorten=zolder,
+            soorten=vertrek,
+            toelichting_zonder="Ruimte '{ruimte.naam}' ({ruimte.id}) heeft geen vaste trap gevonden: Ruimte wordt niet gewaardeerd als {ruimte.soort.naam}.",
+        ),
+        _Classificatieregel(
+            detailsoorten=zolder,
+            soorten=overige_ruimten,
+            trappen=frozenset({_VASTE_TRAP, _VLIZOTRAP}),
+            drempels=(
+                (minimale_oppervlakte_overige_ruimte, Ruimtesoort.overige_ruimten),
+            ),
+            toelichting=f"Ruimte '{{ruimte.naam}}' ({{ruimte.id}}) heeft een trap: Ruimte wordt gewaardeerd als {Ruimtesoort.overige_ruimten.naam}.",
+            toelichting_zonder=f"Ruimte '{{ruimte.naam}}' ({{ruimte.id}}) heeft geen trap: Ruimte wordt niet gewaardeerd als {Ruimtesoort.overige_ruimten.naam}.",
+        ),
+        _Classificatieregel(
+            detailsoorten=zolder,
+            soorten=overige_ruimten,
+            toelichting_zonder=f"Ruimte '{{ruimte.naam}}' ({{ruimte.id}}) heeft geen trap: Ruimte wordt niet gewaardeerd als {Ruimtesoort.overige_ruimten.naam}.",
+        ),
+    )
+
+
+def _compileer_beslistabel(
+    minimale_oppervlakte_vertrek: float = 4,
+    minimale_oppervlakte_overige_ruimte: float = 2,
+) -> dict[_Beslissleutel, _Classificatieregel]:
+    """
+    Compileert de classificatieregels tot een beslistabel met de eerste geldende regel
+    voor elke combinatie van detailsoort, soort, gedeeld en trap.
+
+    Onbekende codes van detailsoort en soort zijn opgenomen als None.
+
+    Args:
+        minimale_oppervlakte_vertrek (float): De minimale oppervlakte van een vertrek.
+        minimale_oppervlakte_overige_ruimte (float): De minimale oppervlakte van een
+            overige ruimte.
+
+    Returns:
+        dict[_Beslissleutel, _Classificatieregel]: De beslistabel.
+    """
+    regels = _classificatieregels(
+        minimale_oppervlakte_vertrek, minimale_oppervlakte_overige_ruimte
+    )
+    beslistabel: dict[_Beslissleutel, _Classificatieregel] = {}
+    for detailsoort in [*Ruimtedetailsoort.codes, None]:
+        trappen = (
+            (None, _VASTE_TRAP, _VLIZOTRAP)
+            if detailsoort in _TRAP_RELEVANT
+            else (None,)
+        )
+        for soort in [*Ruimtesoort.codes, None]:
+            for gedeeld in (False, True):
+                for trap in trappen:
+                    sleutel = (detailsoort, soort, gedeeld, trap)
+                    beslistabel[sleutel] = next(
+                        (regel for regel in regels if regel.geldt_voor(sleutel)),
+                        _GEEN_CLASSIFICATIE,
+                    )
+    return beslistabel
+
+
+_BESLISTABEL = _compileer_beslistabel()
+
+
+def _trap(ruimte: EenhedenRuimte) -> str | None:
+    if heeft_bouwkundig_element(ruimte, Bouwkundigelementdetailsoort.trap):
+        return _VASTE_TRAP
+    if heeft_bouwkundig_element(ruimte, Bouwkundigelementdetailsoort.vlizotrap):
+        return _VLIZOTRAP
+    return None
+
+
 def classificeer_ruimte(ruimte: EenhedenRuimte) -> RuimtesoortReferentiedata | None:
     """
     Classificeert de ruimte volgens het Woningwaarderingstelsel
 
+    De classificatie wordt opgezocht in een beslistabel op detailsoort, soort,
+    gedeelde status en trap, waarna alleen de oppervlakte nog met de drempels van de
+    gevonden regel wordt vergeleken.
+
     Args:
         ruimte (EenhedenRuimte): De ruimte die geclassificeerd moet worden.
 
@@ -611,166 +1061,36 @@ def classificeer_ruimte(ruimte: EenhedenRuimte) -> RuimtesoortReferentiedata | N
         warnings.warn(warning_msg, UserWarning)
         return None
 
-    if ruimte.soort == Ruimtesoort.verkeersruimte:
-        return Ruimtesoort.verkeersruimte
-
-    if ruimte.detail_soort in [
-        # onderstaande parkeergelegenden worden binnenkort vervangen: https://github.com/Aedes-datastandaarden/vera-referentiedata/issues/110#issuecomment-2190641829
-        Ruimtedetailsoort.gemeenschappelijke_parkeerruimte_niet_specifieke_plek,
-        Ruimtedetailsoort.gemeenschappelijke_parkeerruimte_specifieke_plek,
-        Ruimtedetailsoort.open_parkeergarage_niet_specifieke_plek,
-        Ruimtedetailsoort.open_parkeergarage_specifieke_plek,
-        Ruimtedetailsoort.parkeergarage_niet_specifieke_plek,
-        Ruimtedetailsoort.parkeergarage_specifieke_plek,
-    ]:
-        warning_msg = f"Ruimte '{ruimte.naam}' ({ruimte.id}) heeft als ruimtedetailsoort {ruimte.detail_soort} en kan daardoor niet geclassificeerd worden. Gebruik voor parkeerplaatsen: {Ruimtedetailsoort.carport}, {Ruimtedetailsoort.parkeervak_auto_buiten_niet_overdekt} of {Ruimtedetailsoort.parkeervak_auto_binnen}"
-        warnings.warn(warning_msg, UserWarning)
-        return None
-
-    if (
-        ruimte.detail_soort
-        in [  # deze ruimten zijn sowieso buitenruimten
-            Ruimtedetailsoort.atrium_en_of_patio,
-            Ruimtedetailsoort.gemeenschappelijk_dakterras,
-            Ruimtedetailsoort.achtertuin,
-            Ruimtedetailsoort.balkon,
-            Ruimtedetailsoort.zijtuin,
-            Ruimtedetailsoort.voortuin,
-            Ruimtedetailsoort.dakterras,
-            Ruimtedetailsoort.gemeenschappelijke_tuin,
-            Ruimtedetailsoort.terras,
-            Ruimtedetailsoort.tuin,
-            Ruimtedetailsoort.tuin_rondom,
-            Ruimtedetailsoort.loggia,
-        ]
-        or (  # privé parkeerplaatsen buiten zijn privé buitenruimten
-            ruimte.detail_soort
-            in [
-                Ruimtedetailsoort.carport,
-                Ruimtedetailsoort.parkeervak_auto_buiten_niet_overdekt,
-            ]
-            and not gedeeld_met_eenheden(ruimte)
-        )
-        or (
-            ruimte.detail_soort == Ruimtedetailsoort.parkeerplaats
-            and ruimte.soort == Ruimtesoort.buitenruimte
-            and not gedeeld_met_eenheden(ruimte)
-        )
-    ):
-        return Ruimtesoort.buitenruimte
-
-    # Keuken, badkamer en doucheruimte worden altijd gewaardeerd als vertrek
-    if ruimte.detail_soort in [
-        Ruimtedetailsoort.keuken,
-        Ruimtedetailsoort.badkamer,
-        Ruimtedetailsoort.doucheruimte,
-    ]:
-        return Ruimtesoort.vertrek
-
-    if ruimte.detail_soort in [
-        Ruimtedetailsoort.woonkamer,
-        Ruimtedetailsoort.woon_en_of_slaapkamer,
-        Ruimtedetailsoort.woonkamer_en_of_keuken,
-        Ruimtedetailsoort.slaapkamer,
-        Ruimtedetailsoort.badkamer_met_toilet,
-        Ruimtedetailsoort.overig_vertrek,
-        Ruimtedetailsoort.bijkeuken,
-        Ruimtedetailsoort.berging,
-        Ruimtedetailsoort.wasruimte,
-        Ruimtedetailsoort.kelder,
-        # Ruimtedetailsoort.schuur,
-    ] or (
-        Ruimtedetailsoort.schuur.naam == ruimte.detail_soort.naam
-    ):  # Schacht en schuur hebben dezelfde code
-        if (
-            ruimte.detail_soort == Ruimtedetailsoort.berging
-            and Ruimtesoort.overige_ruimten
-        ):
-            aantal_eenheden = ruimte.gedeeld_met_aantal_eenheden or 1
-            if (
-                Decimal(str(ruimte.oppervlakte)) / Decimal(str(aantal_eenheden))
-            ) >= Decimal("2"):
-                return Ruimtesoort.overige_ruimten
-            else:
-                return None
-
-        if ruimte.soort == Ruimtesoort.vertrek:
-            if ruimte.oppervlakte >= 4:
-                return Ruimtesoort.vertrek
-            if ruimte.oppervlakte >= 2:
-                return Ruimtesoort.overige_ruimten
-
-        if ruimte.soort == Ruimtesoort.overige_ruimten:
-            if ruimte.oppervlakte >= 2:
-                return Ruimtesoort.overige_ruimten
-
-    if ruimte.detail_soort == Ruimtedetailsoort.toiletruimte:
-        # mag alleen als overige ruimte gewaardeerd worden
-        if ruimte.oppervlakte >= 2:
-            return Ruimtesoort.overige_ruimten
-
-    if (
-        ruimte.detail_soort
-        in [
-            Ruimtedetailsoort.garage_inpandig,
-            Ruimtedetailsoort.garage_uitpandig,
-            Ruimtedetailsoort.garagebox,
-            Ruimtedetailsoort.parkeervak_auto_binnen,
+    detailsoort = ruimte.detail_soort.code
+    soort = ruimte.soort.code
+    gedeeld = gedeeld_met_eenheden(ruimte)
+    trap = _trap(ruimte) if detailsoort in _TRAP_RELEVANT else None
+
+    regel = _BESLISTABEL.get((detailsoort, soort, gedeeld, trap))
+    if regel is None:
+        # een onbekende code valt onder geen enkele regel met die code
+        regel = _BESLISTABEL[
+            (
+                detailsoort if detailsoort in Ruimtedetailsoort.codes else None,
+                soort if soort in Ruimtesoort.codes else None,
+                gedeeld,
+                trap,
+            )
         ]
-        and not gedeeld_met_eenheden(
-            ruimte
-        )  # garages moeten privé zijn om gecategoriseerd te worden als overige ruimte
-        or (
-            ruimte.detail_soort == Ruimtedetailsoort.parkeerplaats
-            and ruimte.soort == Ruimtesoort.overige_ruimten
-            and not gedeeld_met_eenheden(ruimte)
-        )
-    ):
-        if ruimte.oppervlakte >= 2.0:
-            return Ruimtesoort.overige_ruimten
-
-    if ruimte.detail_soort == Ruimtedetailsoort.zolder:
-        if ruimte.soort == Ruimtesoort.vertrek:
-            if (
-                heeft_bouwkundig_element(ruimte, Bouwkundigelementdetailsoort.trap)
-                and ruimte.oppervlakte >= 4
-            ):
-                logger.info(
-                    f"Ruimte '{ruimte.naam}' ({ruimte.id}) heeft een vaste trap: Ruimte wordt gewaardeerd als {Ruimtesoort.vertrek.naam}."
-                )
-                return Ruimtesoort.vertrek
-
-            else:
-                logger.info(
-                    f"Ruimte '{ruimte.naam}' ({ruimte.id}) heeft geen vaste trap gevonden: Ruimte wordt niet gewaardeerd als {ruimte.soort.naam}."
-                )
-
-        if ruimte.soort == Ruimtesoort.overige_ruimten:
-            if (
-                heeft_bouwkundig_element(ruimte, Bouwkundigelementdetailsoort.trap)
-                or heeft_bouwkundig_element(
-                    ruimte, Bouwkundigelementdetailsoort.vlizotrap
-                )
-            ) and ruimte.oppervlakte >= 2:
-                logger.info(
-                    f"Ruimte '{ruimte.naam}' ({ruimte.id}) heeft een trap: Ruimte wordt gewaardeerd als {Ruimtesoort.overige_ruimten.naam}."
-                )
-                return Ruimtesoort.overige_ruimten
-
-            else:
-                logger.info(
-                    f"Ruimte '{ruimte.naam}' ({ruimte.id}) heeft geen trap: Ruimte wordt niet gewaardeerd als {Ruimtesoort.overige_ruimten.naam}."
-                )
 
-    return None
+    return regel.classificeer(ruimte)
 
 
-def voeg_oppervlakte_kasten_toe_aan_ruimte(ruimte: EenhedenRuimte) -> str:
+def voeg_oppervlakte_kasten_toe_aan_ruimte(
+    ruimte: EenhedenRuimte, kasten: Sequence[EenhedenRuimte] | None = None
+) -> str:
     """
     Deze functie voegt de oppervlakte van kasten toe aan een ruimte en retourneert de naam van de ruimte inclusief het aantal kasten.
 
     Args:
         ruimte (EenhedenRuimte): De ruimte waar kasten aan toegevoegd moeten worden.
+        kasten (Sequence[EenhedenRuimte] | None, optional): De kasten van de ruimte, bijvoorbeeld uit de ruimte-index.
+            Standaard worden de kasten bepaald uit de verbonden ruimten.
 
     Returns:
         str: De naam van de ruimte inclusief het aantal toegevoegde kasten.
@@ -798,12 +1118,16 @@ def voeg_oppervlakte_kasten_toe_aan_ruimte(ruimte: EenhedenRuimte) -> str:
         Ruimtedetailsoort.entree,
         Ruimtedetailsoort.gang,
     ]:
-        ruimte_kasten = [
-            verbonden_ruimte
-            for verbonden_ruimte in ruimte.verbonden_ruimten or []
-            if verbonden_ruimte.detail_soort is not None
-            and verbonden_ruimte.detail_soort == Ruimtedetailsoort.kast
-        ]
+        ruimte_kasten = (
+            list(kasten)
+            if kasten is not None
+            else [
+                verbonden_ruimte
+                for verbonden_ruimte in ruimte.verbonden_ruimten or []
+                if verbonden_ruimte.detail_soort is not None
+                and verbonden_ruimte.detail_soort == Ruimtedetailsoort.kast
+            ]
+        )
 
         aantal_ruimte_kasten = len(ruimte_kasten)
 
@@ -893,64 +1217,24 @@ def gedeeld_met_onzelfstandige_woonruimten(
     )
 
 
-WOONPLAATS_QUERY_TEMPLATE = """
-prefix sor: <https://data.kkg.kadaster.nl/sor/model/def/>
-prefix nen3610: <https://data.kkg.kadaster.nl/nen3610/model/def/>
-prefix skos: <http://www.w3.org/2004/02/skos/core#>
-
-select ?identificatie ?naam
-where {{
-  values ?postcode {{ "{postcode}" }}
-  values ?huisnummer {{ {huisnummer} }}
-  values ?huisnummertoevoeging {{ "{huisnummertoevoeging}" }}
-  values ?huisletter {{ "{huisletter}" }}
-
-  ?adres a sor:Nummeraanduiding;
-         sor:postcode ?postcode;
-         sor:ligtAan/sor:ligtIn ?woonplaats;
-         sor:huisnummer ?adresHuisnummer.
-
-  ?woonplaats sor:geregistreerdMet/nen3610:identificatie ?identificatie;
-              skos:prefLabel ?naam.
-
-  optional
-  {{
-    ?adres sor:huisnummer ?adresHuisnummer.
-  }}
-  optional
-  {{
-    ?adres sor:huisnummertoevoeging ?adresHuisnummertoevoeging.
-  }}
-  optional
-  {{
-    ?adres sor:huisletter ?adresHuisletter.
-  }}
-  FILTER(
-    (!BOUND(?adresHuisnummer) && ?huisnummer = "") ||
-    (?adresHuisnummer = ?huisnummer)
-  )
-  FILTER(
-    (!BOUND(?adresHuisletter) && ?huisletter = "") ||
-    (lcase(?adresHuisletter) = lcase(?huisletter))
-  )
-  FILTER(
-    (!BOUND(?adresHuisnummertoevoeging) && ?huisnummertoevoeging = "") ||
-    (lcase(?adresHuisnummertoevoeging) = lcase(?huisnummertoevoeging))
-  )
-}}
-"""
-
-
-def get_woonplaats(adres: EenhedenEenheidadres) -> EenhedenWoonplaats | None:
+def get_woonplaats(
+    adres: EenhedenEenheidadres, resolver: WoonplaatsResolver | None = None
+) -> EenhedenWoonplaats | None:
     """
     Haalt de woonplaats op voor een gegeven adres.
 
     Args:
         adres (EenhedenEenheidadres): Adres met woonplaats met woonplaatscode of postcode, huisnummer en optioneel huisletter en huisnummertoevoeging.
+        resolver (WoonplaatsResolver | None, optional): De resolver waarmee de woonplaats wordt opgezocht.
+            Standaard wordt de resolver van `get_woonplaats_resolver` gebruikt.
 
     Returns:
         EenhedenWoonplaats | None: de woonplaats,
                                of None als de gegevens niet gevonden kunnen worden.
+
+    Raises:
+        OpzoekingOvergeslagen: Als de resolver de opzoeking overslaat, bijvoorbeeld
+            omdat het tijdsbudget op is of de stroomonderbreker open is.
     """
     if (
         adres.woonplaats is not None
@@ -962,8 +1246,11 @@ def get_woonplaats(adres: EenhedenEenheidadres) -> EenhedenWoonplaats | None:
     if not adres.postcode or not adres.huisnummer:
         return None
 
+    if resolver is None:
+        resolver = get_woonplaats_resolver()
+
     logger.info(
-        f"Adres {adres} bevat geen woonplaats met woonplaatscode. Woonplaats wordt opgehaald via het Kadaster"
+        f"Adres {adres} bevat geen woonplaats met woonplaatscode. Woonplaats wordt opgehaald via {type(resolver).__name__}"
     )
 
     if not adres.huisnummer.isnumeric():
@@ -971,28 +1258,16 @@ def get_woonplaats(adres: EenhedenEenheidadres) -> EenhedenWoonplaats | None:
             f'Huisnummer "{adres.huisnummer}" moet numeriek zijn. Maak gebruik van de attributen huisnummer, huisnummerToevoeging en huisletter voor de nummeraanduiding.'
         )
 
-    query = WOONPLAATS_QUERY_TEMPLATE.format(
+    woonplaats = resolver.zoek_woonplaats(
         postcode=adres.postcode.replace(" ", ""),
         huisnummer=int(adres.huisnummer),
         huisletter=adres.huisletter or "",
         huisnummertoevoeging=adres.huisnummer_toevoeging or "",
     )
-    request_data = {"query": query, "format": "json"}
-
-    try:
-        response = requests.post(KADASTER_SPARQL_ENDPOINT, data=request_data, timeout=5)
-        response.raise_for_status()
-        result = response.json()
 
-        if isinstance(result, list) and len(result) == 1:
-            adres.woonplaats = EenhedenWoonplaats(
-                code=result[0]["identificatie"], naam=result[0]["naam"]
-            )
-            return adres.woonplaats
-        return None
-    except requests.RequestException as e:
-        warnings.warn(f"Fout bij het ophalen van woonplaatsdata: {e}, UserWarning")
-        return None
+    if woonplaats is not None:
+        adres.woonplaats = woonplaats
+    return woonplaats
 
 
 def get_corop_voor_woonplaats(woonplaats_code: str) -> dict[str, str] | None:
@@ -13,11 +13,8 @@ from woningwaardering.stelsels.criterium_id import (
     CriteriumId,
     GedeeldMetSoort,
 )
+from woningwaardering.stelsels.ruimte_index import RuimteIndex, ruimte_gegevens
 from woningwaardering.stelsels.stelselgroep import Stelselgroep
-from woningwaardering.stelsels.utils import (
-    classificeer_ruimte,
-    gedeeld_met_eenheden,
-)
 from woningwaardering.vera.bvg.generated import (
     EenhedenEenheid,
     EenhedenRuimte,
@@ -114,14 +111,11 @@ class Buitenruimten(Stelselgroep):
             woningwaardering.aantal = float(aantal)
             woningwaardering_groep.woningwaarderingen.append(woningwaardering)
 
-        woningwaardering_groep.punten = float(
-            sum(
-                Decimal(str(woningwaardering.punten))
-                for woningwaardering in woningwaardering_groep.woningwaarderingen or []
-                if woningwaardering.punten is not None
-                and woningwaardering.criterium is not None
-                and woningwaardering.criterium.bovenliggende_criterium is None
-            )
+        woningwaardering_groep.punten = utils.som(
+            woningwaardering.punten
+            for woningwaardering in woningwaardering_groep.woningwaarderingen or []
+            if woningwaardering.criterium is not None
+            and woningwaardering.criterium.bovenliggende_criterium is None
         )
 
         # maximaal 15 punten
@@ -175,7 +169,7 @@ class Buitenruimten(Stelselgroep):
     def _punten_voor_buitenruimte(
         self, ruimte: EenhedenRuimte
     ) -> Iterator[WoningwaarderingResultatenWoningwaardering]:
-        if classificeer_ruimte(ruimte) == Ruimtesoort.buitenruimte:
+        if ruimte_gegevens(ruimte).classificatie == Ruimtesoort.buitenruimte:
             if not ruimte.oppervlakte:
                 warnings.warn(
                     f"Ruimte '{ruimte.naam}' ({ruimte.id}) heeft geen oppervlakte",
@@ -289,10 +283,9 @@ class Buitenruimten(Stelselgroep):
         eenheid: EenhedenEenheid,
         woningwaardering_groep: WoningwaarderingResultatenWoningwaarderingGroep,
     ) -> WoningwaarderingResultatenWoningwaardering | None:
-        if not any(
-            classificeer_ruimte(ruimte) == Ruimtesoort.buitenruimte
-            for ruimte in eenheid.ruimten or []
-        ):
+        index = RuimteIndex.voor(eenheid)
+        buitenruimten = index.ruimten(Ruimtesoort.buitenruimte)
+        if not buitenruimten:
             logger.info(
                 f"Eenheid ({eenheid.id}) heeft geen buitenruimten of loggia. Vijf minpunten voor geen buitenruimten toegepast."
             )
@@ -313,9 +306,7 @@ class Buitenruimten(Stelselgroep):
 
         # 2 punten bij de aanwezigheid van privé buitenruimten
         elif woningwaardering_groep.woningwaarderingen and any(
-            classificeer_ruimte(ruimte) == Ruimtesoort.buitenruimte
-            and not gedeeld_met_eenheden(ruimte)
-            for ruimte in eenheid.ruimten or []
+            not index.gegevens(ruimte).gedeeld_met_eenheden for ruimte in buitenruimten
         ):
             logger.info(
                 f"Eenheid ({eenheid.id}): privé buitenruimten aanwezig. 2 punten worden toegekend."
@@ -230,7 +230,6 @@ class Energieprestatie(Stelselgroep):
                 f"Eenheid ({eenheid.id}): 'monumenten' is niet gespecificeerd. Indien de eenheid geen monumentstatus heeft, geef dit dan expliciet aan door een lege lijst toe te wijzen aan het 'monumenten'-attribuut.",
                 UserWarning,
             )
-            eenheid = utils.update_eenheid_monumenten(eenheid)
 
         pandsoort = (
             Pandsoort.meergezinswoning
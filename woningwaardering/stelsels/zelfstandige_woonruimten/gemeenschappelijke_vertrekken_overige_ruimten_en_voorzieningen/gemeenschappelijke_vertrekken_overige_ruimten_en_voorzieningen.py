@@ -14,10 +14,8 @@ from woningwaardering.stelsels.gedeelde_logica import (
     waardeer_sanitair,
     waardeer_verkoeling_en_verwarming,
 )
+from woningwaardering.stelsels.ruimte_index import RuimteIndex
 from woningwaardering.stelsels.stelselgroep import Stelselgroep
-from woningwaardering.stelsels.utils import (
-    classificeer_ruimte,
-)
 from woningwaardering.vera.bvg.generated import (
     EenhedenEenheid,
     EenhedenRuimte,
@@ -91,10 +89,11 @@ class GemeenschappelijkeVertrekkenOverigeRuimtenEnVoorzieningen(Stelselgroep):
                 )
             )
         else:
+            index = RuimteIndex.voor(eenheid)
             gedeelde_ruimten = [
                 ruimte
                 for ruimte in eenheid.ruimten or []
-                if utils.gedeeld_met_eenheden(ruimte)
+                if index.gegevens(ruimte).gedeeld_met_eenheden
             ]
 
             oppervlakte_berekeningen = {
@@ -106,7 +105,7 @@ class GemeenschappelijkeVertrekkenOverigeRuimtenEnVoorzieningen(Stelselgroep):
                 if ruimte.detail_soort is None:
                     continue
 
-                ruimtesoort = classificeer_ruimte(ruimte)
+                ruimtesoort = index.gegevens(ruimte).classificatie
                 if ruimtesoort is None:
                     continue
 
@@ -149,7 +148,9 @@ class GemeenschappelijkeVertrekkenOverigeRuimtenEnVoorzieningen(Stelselgroep):
                 )
 
                 # waarderingen voor de keuken van gedeelde ruimten
-                keuken_waarderingen = list(waardeer_keuken(ruimte, self.stelsel))
+                keuken_waarderingen = list(
+                    waardeer_keuken(ruimte, self.stelsel, self.peildatum)
+                )
                 woningwaardering_groep.woningwaarderingen.extend(
                     self._deel_woningwaarderingen_door_aantal_eenheden(
                         ruimte, keuken_waarderingen
@@ -158,7 +159,9 @@ class GemeenschappelijkeVertrekkenOverigeRuimtenEnVoorzieningen(Stelselgroep):
 
                 # waarderingen voor sanitair van gedeelde ruimten
                 sanitair_waarderingen = list(
-                    waardeer_sanitair(ruimte, self.stelselgroep, self.stelsel)
+                    waardeer_sanitair(
+                        ruimte, self.stelselgroep, self.stelsel, self.peildatum
+                    )
                 )
                 woningwaardering_groep.woningwaarderingen.extend(
                     self._deel_woningwaarderingen_door_aantal_eenheden(
@@ -178,16 +181,11 @@ class GemeenschappelijkeVertrekkenOverigeRuimtenEnVoorzieningen(Stelselgroep):
                     )
                 )
 
-        punten = utils.rond_af_op_kwart(
-            sum(
-                Decimal(str(woningwaardering.punten))
-                for woningwaardering in woningwaardering_groep.woningwaarderingen or []
-                if woningwaardering.punten is not None
-            ),
+        woningwaardering_groep.punten = utils.som_op_kwart(
+            woningwaardering.punten
+            for woningwaardering in woningwaardering_groep.woningwaarderingen or []
         )
 
-        woningwaardering_groep.punten = float(punten)
-
         logger.info(
             f"Eenheid ({eenheid.id}) krijgt in totaal {woningwaardering_groep.punten} punten voor {self.stelselgroep.naam}"
         )
@@ -1,6 +1,5 @@
 import warnings
 from datetime import date
-from decimal import Decimal
 
 from loguru import logger
 
@@ -53,7 +52,9 @@ class Keuken(Stelselgroep):
         woningwaardering_groep.woningwaarderingen.extend(
             woningwaardering
             for ruimte in eenheid.ruimten or []
-            for woningwaardering in waardeer_keuken(ruimte, self.stelsel)
+            for woningwaardering in waardeer_keuken(
+                ruimte, self.stelsel, self.peildatum
+            )
         )
 
         if not woningwaardering_groep.woningwaarderingen:
@@ -62,14 +63,10 @@ class Keuken(Stelselgroep):
                 UserWarning,
             )
 
-        totaal_punten = utils.rond_af_op_kwart(
-            sum(
-                Decimal(str(woningwaardering.punten))
-                for woningwaardering in woningwaardering_groep.woningwaarderingen or []
-                if woningwaardering.punten is not None
-            ),
+        woningwaardering_groep.punten = utils.som_op_kwart(
+            woningwaardering.punten
+            for woningwaardering in woningwaardering_groep.woningwaarderingen or []
         )
-        woningwaardering_groep.punten = float(totaal_punten)
 
         logger.info(
             f"Eenheid ({eenheid.id}) krijgt in totaal {woningwaardering_groep.punten} punten voor {self.stelselgroep.naam}"
@@ -1,10 +1,10 @@
 from datetime import date
-from decimal import Decimal
 from typing import Iterator
 
 from dateutil.relativedelta import relativedelta
 from loguru import logger
 
+from woningwaardering.stelsels import utils
 from woningwaardering.stelsels._dev_utils import DevelopmentContext
 from woningwaardering.stelsels.criterium_id import CriteriumId
 from woningwaardering.stelsels.gedeelde_logica.prijsopslag_monumenten import (
@@ -66,22 +66,16 @@ class PrijsopslagMonumentenEnNieuwbouw(Stelselgroep):
             if woningwaardering is not None
         )
 
-        opslagpercentage = float(
-            sum(
-                Decimal(str(woningwaardering.opslagpercentage))
-                for woningwaardering in woningwaardering_groep.woningwaarderingen or []
-                if woningwaardering.opslagpercentage is not None
-            )
+        opslagpercentage = utils.som(
+            woningwaardering.opslagpercentage
+            for woningwaardering in woningwaardering_groep.woningwaarderingen or []
         )
 
         woningwaardering_groep.opslagpercentage = opslagpercentage
 
-        punten = float(
-            sum(
-                Decimal(str(woningwaardering.punten))
-                for woningwaardering in woningwaardering_groep.woningwaarderingen or []
-                if woningwaardering.punten is not None
-            )
+        punten = utils.som(
+            woningwaardering.punten
+            for woningwaardering in woningwaardering_groep.woningwaarderingen or []
         )
 
         if opslagpercentage > 0:
@@ -1,5 +1,4 @@
 from datetime import date
-from decimal import Decimal
 
 from loguru import logger
 
@@ -57,17 +56,15 @@ class Sanitair(Stelselgroep):
 
         for ruimte in ruimten:
             woningwaardering_groep.woningwaarderingen.extend(
-                waardeer_sanitair(ruimte, self.stelselgroep, self.stelsel)
+                waardeer_sanitair(
+                    ruimte, self.stelselgroep, self.stelsel, self.peildatum
+                )
             )
 
-        totaal_punten = utils.rond_af_op_kwart(
-            sum(
-                Decimal(str(woningwaardering.punten))
-                for woningwaardering in woningwaardering_groep.woningwaarderingen or []
-                if woningwaardering.punten is not None
-            ),
+        woningwaardering_groep.punten = utils.som_op_kwart(
+            woningwaardering.punten
+            for woningwaardering in woningwaardering_groep.woningwaarderingen or []
         )
-        woningwaardering_groep.punten = float(totaal_punten)
 
         logger.info(
             f"Eenheid ({eenheid.id}) krijgt in totaal {woningwaardering_groep.punten} punten voor {self.stelselgroep.naam}"
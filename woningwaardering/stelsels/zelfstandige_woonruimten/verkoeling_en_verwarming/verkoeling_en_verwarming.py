@@ -1,5 +1,4 @@
 from datetime import date
-from decimal import Decimal
 
 from loguru import logger
 
@@ -64,21 +63,13 @@ class VerkoelingEnVerwarming(Stelselgroep):
             self.criteriumsleutel_resultaten(woningwaardering_groep)
         )
 
-        punten = utils.rond_af_op_kwart(
-            Decimal(
-                sum(
-                    Decimal(str(woningwaardering.punten))
-                    for woningwaardering in woningwaardering_groep.woningwaarderingen
-                    or []
-                    if woningwaardering.punten is not None
-                    and woningwaardering.criterium is not None
-                    and woningwaardering.criterium.bovenliggende_criterium is None
-                )
-            )
+        woningwaardering_groep.punten = utils.som_op_kwart(
+            woningwaardering.punten
+            for woningwaardering in woningwaardering_groep.woningwaarderingen or []
+            if woningwaardering.criterium is not None
+            and woningwaardering.criterium.bovenliggende_criterium is None
         )
 
-        woningwaardering_groep.punten = float(punten)
-
         logger.info(
             f"Eenheid ({eenheid.id}) krijgt in totaal {woningwaardering_groep.punten} punten voor {self.stelselgroep.naam}"
         )
@@ -28,6 +28,7 @@ from pydantic import (
 class GebouwSleutels(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -60,6 +61,7 @@ class GebouwSleutels(BaseModel):
 class Referentiedata(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     code: Optional[str] = None
     """
@@ -89,6 +91,15 @@ class Referentiedata(BaseModel):
             )
         return value
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        # waarden van een Referentiedatasoort worden gedeeld, onder meer door het
+        # interneren van ingelezen eenheden, en zijn daarom onveranderlijk
+        if self._name and name in type(self).model_fields:
+            raise AttributeError(
+                f"{self._name} is een waarde van een Referentiedatasoort en kan niet worden gewijzigd."
+            )
+        super().__setattr__(name, value)
+
     def __eq__(self, other: object) -> bool:
         if isinstance(other, Referentiedata):
             return self.code == other.code
@@ -104,6 +115,7 @@ class Referentiedata(BaseModel):
 class ClusterSleutels(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -140,6 +152,7 @@ class ClusterSleutels(BaseModel):
 class EenheidSleutels(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -172,6 +185,7 @@ class EenheidSleutels(BaseModel):
 class OvereenkomstSleutels(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -208,6 +222,7 @@ class OvereenkomstSleutels(BaseModel):
 class ContactgegevenSleutels(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -248,6 +263,7 @@ class ContactgegevenSleutels(BaseModel):
 class RelatierolSleutels(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -280,6 +296,7 @@ class RelatierolSleutels(BaseModel):
 class BouwkundigElementenRelatierol(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -312,6 +329,7 @@ class BouwkundigElementenRelatierol(BaseModel):
 class CollectiefObjectSleutels(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -344,6 +362,7 @@ class CollectiefObjectSleutels(BaseModel):
 class ConditiemetingSleutels(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -376,6 +395,7 @@ class ConditiemetingSleutels(BaseModel):
 class GarantieSleutels(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -408,6 +428,7 @@ class GarantieSleutels(BaseModel):
 class ClustersEenheid(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -448,6 +469,7 @@ class ClustersEenheid(BaseModel):
 class ClustersGeometrieBasis(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     soort: Optional[Referentiedata] = None
     """
@@ -458,6 +480,7 @@ class ClustersGeometrieBasis(BaseModel):
 class ClustersPunt(ClustersGeometrieBasis):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     breedtegraad: Optional[float] = None
     """
@@ -472,6 +495,7 @@ class ClustersPunt(ClustersGeometrieBasis):
 class ClustersRelatierol(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -512,6 +536,7 @@ class ClustersRelatierol(BaseModel):
 class EenhedenAdresBasis(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -574,6 +599,7 @@ class EenhedenAdresBasis(BaseModel):
 class AdresSleutels(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -606,6 +632,7 @@ class AdresSleutels(BaseModel):
 class GeometrieSleutels(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -642,6 +669,7 @@ class GeometrieSleutels(BaseModel):
 class EenhedenBagPand(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -694,6 +722,7 @@ class EenhedenBagPand(BaseModel):
 class EenhedenBuurt(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -730,6 +759,7 @@ class EenhedenBuurt(BaseModel):
 class EenhedenCluster(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -770,6 +800,7 @@ class EenhedenCluster(BaseModel):
 class EenhedenEenheidcriterium(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -826,6 +857,7 @@ class EenhedenEenheidcriterium(BaseModel):
 class EenhedenEenheidVoorwaarden(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -900,6 +932,7 @@ class EenhedenEenheidVoorwaarden(BaseModel):
 class EenhedenEnergieprestatie(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -964,6 +997,7 @@ class EenhedenEnergieprestatie(BaseModel):
 class EenhedenGemeente(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -1008,6 +1042,7 @@ class EenhedenGemeente(BaseModel):
 class EenhedenGeometrieBasis(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     soort: Optional[Referentiedata] = None
     """
@@ -1018,6 +1053,7 @@ class EenhedenGeometrieBasis(BaseModel):
 class EenhedenMarktwaarde(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -1092,6 +1128,7 @@ class EenhedenMarktwaarde(BaseModel):
 class EenhedenOppervlakte(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -1124,6 +1161,7 @@ class EenhedenOppervlakte(BaseModel):
 class EenhedenPand(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -1164,6 +1202,7 @@ class EenhedenPand(BaseModel):
 class EenhedenPrijscomponent(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -1230,6 +1269,7 @@ class EenhedenPrijscomponent(BaseModel):
 class EenhedenPunt(EenhedenGeometrieBasis):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     breedtegraad: Optional[float] = None
     """
@@ -1244,6 +1284,7 @@ class EenhedenPunt(EenhedenGeometrieBasis):
 class EenhedenRelatierol(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -1284,6 +1325,7 @@ class EenhedenRelatierol(BaseModel):
 class EenhedenRenovatie(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -1328,6 +1370,7 @@ class EenhedenRenovatie(BaseModel):
 class EenhedenRuimte(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -1449,6 +1492,7 @@ class EenhedenRuimte(BaseModel):
 class EenhedenStadsdeel(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -1485,6 +1529,7 @@ class EenhedenStadsdeel(BaseModel):
 class EenhedenVertrek(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -1537,6 +1582,7 @@ class EenhedenVertrek(BaseModel):
 class EenhedenWijk(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -1577,6 +1623,7 @@ class EenhedenWijk(BaseModel):
 class EenhedenWoonplaats(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -1613,6 +1660,7 @@ class EenhedenWoonplaats(BaseModel):
 class EenhedenWozEenheid(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -1655,6 +1703,7 @@ class EenhedenWozEenheid(BaseModel):
 class WoningwaarderingCriteriumSleutels(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -1687,6 +1736,7 @@ class WoningwaarderingCriteriumSleutels(BaseModel):
 class WoningwaarderingResultatenWoningwaarderingCriteriumGroep(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -1735,6 +1785,7 @@ class WoningwaarderingResultatenWoningwaarderingCriteriumGroep(BaseModel):
 class ExtraAttribuut(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     naam: Optional[str] = None
     """
@@ -1749,6 +1800,7 @@ class ExtraAttribuut(BaseModel):
 class InformatieobjectSleutels(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -1781,6 +1833,7 @@ class InformatieobjectSleutels(BaseModel):
 class ZaakobjectSleutels(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -1803,6 +1856,7 @@ class ZaakobjectSleutels(BaseModel):
 class Sturingslabel(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     soort: Optional[Referentiedata] = None
     """
@@ -1825,6 +1879,7 @@ class Sturingslabel(BaseModel):
 class Foutbericht(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     code: Optional[str] = None
     """
@@ -1839,6 +1894,7 @@ class Foutbericht(BaseModel):
 class TijdstipBericht(RootModel[AwareDatetime]):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     root: AwareDatetime
 
@@ -1846,6 +1902,7 @@ class TijdstipBericht(RootModel[AwareDatetime]):
 class Referentienummer(RootModel[str]):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     root: str
 
@@ -1853,6 +1910,7 @@ class Referentienummer(RootModel[str]):
 class ZenderOrganisatie(RootModel[str]):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     root: str
 
@@ -1860,6 +1918,7 @@ class ZenderOrganisatie(RootModel[str]):
 class ZenderAdministratie(RootModel[str]):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     root: str
 
@@ -1867,6 +1926,7 @@ class ZenderAdministratie(RootModel[str]):
 class Aantal(RootModel[int]):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     root: int
 
@@ -1874,6 +1934,7 @@ class Aantal(RootModel[int]):
 class AantalPerPagina(RootModel[int]):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     root: int
 
@@ -1881,6 +1942,7 @@ class AantalPerPagina(RootModel[int]):
 class Paginanummer(RootModel[int]):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     root: int
 
@@ -1888,6 +1950,7 @@ class Paginanummer(RootModel[int]):
 class Cursor(RootModel[str]):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     root: str
 
@@ -1895,6 +1958,7 @@ class Cursor(RootModel[str]):
 class PeiltijdstipMaterieel(RootModel[AwareDatetime]):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     root: AwareDatetime
 
@@ -1902,6 +1966,7 @@ class PeiltijdstipMaterieel(RootModel[AwareDatetime]):
 class PandSleutels(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -1938,6 +2003,7 @@ class PandSleutels(BaseModel):
 class RelatieSleutels(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -1982,6 +2048,7 @@ class RelatieSleutels(BaseModel):
 class ClustersRelatieBasis(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -2030,6 +2097,7 @@ class ClustersRelatieBasis(BaseModel):
 class EenhedenAdresseerbaarObjectBasisregistratie(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -2116,6 +2184,7 @@ class EenhedenAdresseerbaarObjectBasisregistratie(BaseModel):
 class EenhedenBeleidswaarde(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -2198,6 +2267,7 @@ class EenhedenBeleidswaarde(BaseModel):
 class EenhedenRelatieBasis(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -2246,6 +2316,7 @@ class EenhedenRelatieBasis(BaseModel):
 class WoningwaarderingResultatenWoningwaarderingCriterium(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -2296,6 +2367,7 @@ class WoningwaarderingResultatenWoningwaarderingCriterium(BaseModel):
 class Informatieobject(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -2456,6 +2528,7 @@ class Informatieobject(BaseModel):
 class BouwkundigElementenBouwdeel(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -2504,6 +2577,7 @@ class BouwkundigElementenBouwdeel(BaseModel):
 class BouwkundigElementenRelatieBasis(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -2556,6 +2630,7 @@ class BouwkundigElementenRelatieBasis(BaseModel):
 class ClustersNatuurlijkPersoon(ClustersRelatieBasis):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     aanhef: Optional[str] = None
     """
@@ -2594,6 +2669,7 @@ class ClustersNatuurlijkPersoon(ClustersRelatieBasis):
 class ClustersRechtspersoon(ClustersRelatieBasis):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     kvk_nummer: Optional[str] = Field(default=None, alias="kvkNummer")
     """
@@ -2622,6 +2698,7 @@ class ClustersRechtspersoon(ClustersRelatieBasis):
 class EenhedenEenheidadres(EenhedenAdresBasis):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     buurt: Optional[EenhedenBuurt] = None
     """
@@ -2652,6 +2729,7 @@ class EenhedenEenheidadres(EenhedenAdresBasis):
 class EenhedenNatuurlijkPersoon(EenhedenRelatieBasis):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     aanhef: Optional[str] = None
     """
@@ -2690,6 +2768,7 @@ class EenhedenNatuurlijkPersoon(EenhedenRelatieBasis):
 class EenhedenRechtspersoon(EenhedenRelatieBasis):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     kvk_nummer: Optional[str] = Field(default=None, alias="kvkNummer")
     """
@@ -2718,6 +2797,7 @@ class EenhedenRechtspersoon(EenhedenRelatieBasis):
 class WoningwaarderingResultatenWoningwaardering(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -2783,6 +2863,7 @@ class WoningwaarderingResultatenWoningwaardering(BaseModel):
 class WoningwaarderingResultatenWoningwaarderingGroep(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -2844,6 +2925,7 @@ class WoningwaarderingResultatenWoningwaarderingGroep(BaseModel):
 class WoningwaarderingResultatenWoningwaarderingResultaat(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -2920,6 +3002,7 @@ class WoningwaarderingResultatenWoningwaarderingResultaat(BaseModel):
 class BerichtBasis(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     extra_attributen: Optional[list[ExtraAttribuut]] = Field(
         default=None, alias="extra-attributen"
@@ -2940,6 +3023,7 @@ class BerichtBasis(BaseModel):
 class BouwkundigElementenRechtspersoonBasis(BouwkundigElementenRelatieBasis):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     globaal_locatienummer: Optional[str] = Field(
         default=None, alias="globaalLocatienummer"
@@ -2969,12 +3053,14 @@ class BouwkundigElementenRechtspersoon(BouwkundigElementenRechtspersoonBasis):
     pass
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
 
 
 class ClustersCluster(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -3065,6 +3151,7 @@ class ClustersCluster(BaseModel):
 class EenhedenEenheid(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -3451,12 +3538,14 @@ class WoningwaarderingResultatenWoningwaarderingResultaatbericht(
     pass
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
 
 
 class BouwkundigElementenGarantie(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -3505,6 +3594,7 @@ class BouwkundigElementenGarantie(BaseModel):
 class BouwkundigElementenOnderhoudsleverancier(BouwkundigElementenRechtspersoonBasis):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     specialisme: Optional[Referentiedata] = None
     """
@@ -3516,6 +3606,7 @@ class ClustersClusterbericht(ClustersCluster, BerichtBasis):
     pass
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
 
 
@@ -3523,12 +3614,14 @@ class EenhedenEenheidbericht(EenhedenEenheid, BerichtBasis):
     pass
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
 
 
 class BouwkundigElementenBouwkundigElement(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
     id: Optional[str] = None
     """
@@ -3684,4 +3777,5 @@ class BouwkundigElementenBouwkundigElementbericht(
     pass
     model_config = ConfigDict(
         populate_by_name=True,
+        defer_build=True,
     )
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Any, Optional
 
 from pydantic import Field, field_validator
 
@@ -26,6 +26,15 @@ class _Referentiedata(Referentiedata):
             )
         return value
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        # waarden van een Referentiedatasoort worden gedeeld, onder meer door het
+        # interneren van ingelezen eenheden, en zijn daarom onveranderlijk
+        if self._name and name in type(self).model_fields:
+            raise AttributeError(
+                f"{self._name} is een waarde van een Referentiedatasoort en kan niet worden gewijzigd."
+            )
+        super().__setattr__(name, value)
+
     def __eq__(self, other: object) -> bool:
         if isinstance(other, Referentiedata):
             return self.code == other.code
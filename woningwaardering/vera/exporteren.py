@@ -0,0 +1,370 @@
+import csv
+import os
+from abc import ABC, abstractmethod
+from types import TracebackType
+from typing import IO, Any, Iterable
+
+from woningwaardering.vera.bvg.generated import (
+    WoningwaarderingResultatenWoningwaarderingResultaat,
+)
+
+KOLOMMEN: tuple[str, ...] = (
+    "eenheid_id",
+    "stelselgroep",
+    "criterium_id",
+    "criterium_naam",
+    "bovenliggende_criterium_id",
+    "aantal",
+    "meeteenheid",
+    "punten",
+    "opslagpercentage",
+)
+"""De kolommen van een geëxporteerde resultatentabel, in deze volgorde."""
+
+_TEKSTKOLOMMEN = frozenset(
+    (
+        "eenheid_id",
+        "stelselgroep",
+        "criterium_id",
+        "criterium_naam",
+        "bovenliggende_criterium_id",
+        "meeteenheid",
+    )
+)
+
+Bestand = str | os.PathLike[str] | IO[Any]
+
+
+class Kolombuffer:
+    """
+    Verzamelt woningwaarderingresultaten als kolommen met één rij per criterium.
+
+    Per stelselgroep is er daarnaast een rij zonder criterium, met de punten en het
+    opslagpercentage van de hele groep. De waarden worden rechtstreeks uit de
+    resultaatmodellen gelezen, zonder tussenstap via JSON. De kolommen kunnen
+    direct worden gebruikt voor bijvoorbeeld `pandas.DataFrame(buffer.kolommen)`.
+
+    Attributes:
+        kolommen (dict[str, list[Any]]): De waarden per kolom, met de namen uit
+            `KOLOMMEN`.
+    """
+
+    def __init__(self) -> None:
+        self.kolommen: dict[str, list[Any]] = {kolom: [] for kolom in KOLOMMEN}
+
+    def __len__(self) -> int:
+        return len(self.kolommen["eenheid_id"])
+
+    def voeg_toe(
+        self,
+        resultaat: WoningwaarderingResultatenWoningwaarderingResultaat,
+        eenheid_id: str | None = None,
+    ) -> None:
+        """
+        Voegt de groepen en criteria van een resultaat toe aan de kolommen.
+
+        Args:
+            resultaat (WoningwaarderingResultatenWoningwaarderingResultaat): Het
+                resultaat van de woningwaardering.
+            eenheid_id (str | None): Het id van de gewaardeerde eenheid. Als dit None
+                is, wordt het id uit `resultaat.eenheid` gebruikt, indien aanwezig.
+        """
+        if eenheid_id is None and resultaat.eenheid is not None:
+            eenheid_id = resultaat.eenheid.id
+
+        eenheid_ids = self.kolommen["eenheid_id"]
+        stelselgroepen = self.kolommen["stelselgroep"]
+        criterium_ids = self.kolommen["criterium_id"]
+        criterium_namen = self.kolommen["criterium_naam"]
+        bovenliggende_criterium_ids = self.kolommen["bovenliggende_criterium_id"]
+        aantallen = self.kolommen["aantal"]
+        meeteenheden = self.kolommen["meeteenheid"]
+        punten = self.kolommen["punten"]
+        opslagpercentages = self.kolommen["opslagpercentage"]
+
+        for groep in resultaat.groepen or []:
+            criterium_groep = groep.criterium_groep
+            stelselgroep = (
+                criterium_groep.stelselgroep.code
+                if criterium_groep is not None
+                and criterium_groep.stelselgroep is not None
+                else None
+            )
+
+            eenheid_ids.append(eenheid_id)
+            stelselgroepen.append(stelselgroep)
+            criterium_ids.append(None)
+            criterium_namen.append(None)
+            bovenliggende_criterium_ids.append(None)
+            aantallen.append(None)
+            meeteenheden.append(None)
+            punten.append(groep.punten)
+            opslagpercentages.append(groep.opslagpercentage)
+
+            for woningwaardering in groep.woningwaarderingen or []:
+                criterium = woningwaardering.criterium
+                eenheid_ids.append(eenheid_id)
+                stelselgroepen.append(stelselgroep)
+                if criterium is None:
+                    criterium_ids.append(None)
+                    criterium_namen.append(None)
+                    bovenliggende_criterium_ids.append(None)
+                    meeteenheden.append(None)
+                else:
+                    criterium_ids.append(criterium.id)
+                    criterium_namen.append(criterium.naam)
+                    bovenliggende_criterium_ids.append(
+                        criterium.bovenliggende_criterium.id
+                        if criterium.bovenliggende_criterium is not None
+                        else None
+                    )
+                    meeteenheden.append(
+                        criterium.meeteenheid.code
+                        if criterium.meeteenheid is not None
+                        else None
+                    )
+                aantallen.append(woningwaardering.aantal)
+                punten.append(woningwaardering.punten)
+                opslagpercentages.append(woningwaardering.opslagpercentage)
+
+    def rijen(self) -> Iterable[tuple[Any, ...]]:
+        """
+        Geeft de rijen van de buffer, met de waarden in de volgorde van `KOLOMMEN`.
+
+        Returns:
+            Iterable[tuple[Any, ...]]: De rijen.
+        """
+        return zip(*(self.kolommen[kolom] for kolom in KOLOMMEN))
+
+    def leeg(self) -> None:
+        """Verwijdert alle rijen uit de buffer."""
+        for waarden in self.kolommen.values():
+            waarden.clear()
+
+
+class ResultatenExporteur(ABC):
+    """
+    Schrijft woningwaarderingresultaten in tabelvorm naar een bestand.
+
+    Resultaten worden verzameld in een `Kolombuffer` en per `buffergrootte` rijen
+    weggeschreven, zodat grote aantallen eenheden niet tegelijk in het geheugen
+    hoeven te staan. Gebruik de exporteur als context manager, of roep `sluit` aan
+    om de laatste rijen weg te schrijven.
+
+    Args:
+        bestand (str | os.PathLike[str] | IO[Any]): Het pad of het geopende bestand
+            waar naartoe wordt geschreven.
+        buffergrootte (int): Het aantal rijen dat wordt verzameld voordat ze worden
+            weggeschreven.
+
+    Raises:
+        ValueError: Als de buffergrootte kleiner is dan 1.
+    """
+
+    def __init__(self, bestand: Bestand, buffergrootte: int = 10_000) -> None:
+        if buffergrootte < 1:
+            raise ValueError("De buffergrootte moet minimaal 1 zijn.")
+        self.bestand = bestand
+        self.buffergrootte = buffergrootte
+        self.buffer = Kolombuffer()
+        self.aantal_rijen = 0
+        self._gesloten = False
+
+    def __enter__(self) -> "ResultatenExporteur":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.sluit()
+
+    def schrijf(
+        self,
+        resultaat: WoningwaarderingResultatenWoningwaarderingResultaat,
+        eenheid_id: str | None = None,
+    ) -> None:
+        """
+        Voegt een resultaat toe aan de export.
+
+        Args:
+            resultaat (WoningwaarderingResultatenWoningwaarderingResultaat): Het
+                resultaat van de woningwaardering.
+            eenheid_id (str | None): Het id van de gewaardeerde eenheid.
+
+        Raises:
+            ValueError: Als de exporteur al gesloten is.
+        """
+        if self._gesloten:
+            raise ValueError("De exporteur is al gesloten.")
+        self.buffer.voeg_toe(resultaat, eenheid_id)
+        if len(self.buffer) >= self.buffergrootte:
+            self._leeg_buffer()
+
+    def sluit(self) -> None:
+        """Schrijft de resterende rijen weg en sluit het bestand."""
+        if self._gesloten:
+            return
+        self._leeg_buffer()
+        self._sluit()
+        self._gesloten = True
+
+    def _leeg_buffer(self) -> None:
+        if len(self.buffer) == 0:
+            return
+        self.aantal_rijen += len(self.buffer)
+        self._schrijf_buffer()
+        self.buffer.leeg()
+
+    @abstractmethod
+    def _schrijf_buffer(self) -> None:
+        """Schrijft de rijen in de buffer weg."""
+
+    @abstractmethod
+    def _sluit(self) -> None:
+        """Sluit het bestand."""
+
+
+class CsvExporteur(ResultatenExporteur):
+    """
+    Schrijft woningwaarderingresultaten naar een CSV-bestand met een kopregel met de
+    namen uit `KOLOMMEN`. Een ontbrekende waarde wordt een leeg veld.
+
+    Args:
+        bestand (str | os.PathLike[str] | IO[Any]): Het pad of het in tekstmodus
+            geopende bestand waar naartoe wordt geschreven. Een bestand dat als pad
+            wordt opgegeven, wordt bij het sluiten ook gesloten.
+        buffergrootte (int): Het aantal rijen dat wordt verzameld voordat ze worden
+            weggeschreven.
+        **opties: Extra argumenten voor `csv.writer`, zoals `delimiter`.
+    """
+
+    def __init__(
+        self, bestand: Bestand, buffergrootte: int = 10_000, **opties: Any
+    ) -> None:
+        super().__init__(bestand, buffergrootte)
+        if isinstance(bestand, (str, os.PathLike)):
+            self._bestand: IO[Any] = open(bestand, "w", newline="", encoding="utf-8")
+            self._eigen_bestand = True
+        else:
+            self._bestand = bestand
+            self._eigen_bestand = False
+        self._writer = csv.writer(self._bestand, **opties)
+        self._writer.writerow(KOLOMMEN)
+
+    def _schrijf_buffer(self) -> None:
+        self._writer.writerows(self.buffer.rijen())
+
+    def _sluit(self) -> None:
+        if self._eigen_bestand:
+            self._bestand.close()
+        else:
+            self._bestand.flush()
+
+
+class ParquetExporteur(ResultatenExporteur):
+    """
+    Schrijft woningwaarderingresultaten naar een Parquet-bestand, met één row group
+    per gevulde buffer.
+
+    Hiervoor is de package 'pyarrow' nodig. Installeer met:
+    `pip install woningwaardering[parquet]`.
+
+    Args:
+        bestand (str | os.PathLike[str] | IO[Any]): Het pad of het in binaire modus
+            geopende bestand waar naartoe wordt geschreven.
+        buffergrootte (int): Het aantal rijen dat wordt verzameld voordat ze worden
+            weggeschreven.
+
+    Raises:
+        ImportError: Als 'pyarrow' niet is geïnstalleerd.
+    """
+
+    def __init__(self, bestand: Bestand, buffergrootte: int = 10_000) -> None:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError(
+                "Package 'pyarrow' is niet geïnstalleerd. Installeer met: "
+                "pip install woningwaardering[parquet]"
+            ) from e
+
+        super().__init__(bestand, buffergrootte)
+        self._pa = pa
+        self._schema = pa.schema(
+            [
+                (kolom, pa.string() if kolom in _TEKSTKOLOMMEN else pa.float64())
+                for kolom in KOLOMMEN
+            ]
+        )
+        self._writer = pq.ParquetWriter(bestand, self._schema)
+
+    def _schrijf_buffer(self) -> None:
+        self._writer.write_table(
+            self._pa.Table.from_pydict(self.buffer.kolommen, schema=self._schema)
+        )
+
+    def _sluit(self) -> None:
+        self._writer.close()
+
+
+def exporteer_csv(
+    resultaten: Iterable[
+        tuple[str | None, WoningwaarderingResultatenWoningwaarderingResultaat]
+    ],
+    bestand: Bestand,
+    buffergrootte: int = 10_000,
+    **opties: Any,
+) -> int:
+    """
+    Schrijft woningwaarderingresultaten naar een CSV-bestand (zie `CsvExporteur`).
+
+    Args:
+        resultaten (Iterable[tuple[str | None, WoningwaarderingResultatenWoningwaarderingResultaat]]):
+            Paren van een eenheid id en het resultaat van die eenheid. Dit kan ook een
+            generator zijn die de eenheden pas tijdens het schrijven waardeert.
+        bestand (str | os.PathLike[str] | IO[Any]): Het pad of het geopende bestand.
+        buffergrootte (int): Het aantal rijen dat wordt verzameld voordat ze worden
+            weggeschreven.
+        **opties: Extra argumenten voor `csv.writer`, zoals `delimiter`.
+
+    Returns:
+        int: Het aantal geschreven rijen, zonder de kopregel.
+    """
+    with CsvExporteur(bestand, buffergrootte, **opties) as exporteur:
+        for eenheid_id, resultaat in resultaten:
+            exporteur.schrijf(resultaat, eenheid_id)
+    return exporteur.aantal_rijen
+
+
+def exporteer_parquet(
+    resultaten: Iterable[
+        tuple[str | None, WoningwaarderingResultatenWoningwaarderingResultaat]
+    ],
+    bestand: Bestand,
+    buffergrootte: int = 10_000,
+) -> int:
+    """
+    Schrijft woningwaarderingresultaten naar een Parquet-bestand (zie
+    `ParquetExporteur`).
+
+    Args:
+        resultaten (Iterable[tuple[str | None, WoningwaarderingResultatenWoningwaarderingResultaat]]):
+            Paren van een eenheid id en het resultaat van die eenheid.
+        bestand (str | os.PathLike[str] | IO[Any]): Het pad of het geopende bestand.
+        buffergrootte (int): Het aantal rijen dat wordt verzameld voordat ze worden
+            weggeschreven.
+
+    Returns:
+        int: Het aantal geschreven rijen.
+
+    Raises:
+        ImportError: Als 'pyarrow' niet is geïnstalleerd.
+    """
+    with ParquetExporteur(bestand, buffergrootte) as exporteur:
+        for eenheid_id, resultaat in resultaten:
+            exporteur.schrijf(resultaat, eenheid_id)
+    return exporteur.aantal_rijen
@@ -0,0 +1,92 @@
+from functools import cache
+from typing import Any
+
+from pydantic import BaseModel, ValidationError, create_model
+
+from woningwaardering.vera.bvg.generated import EenhedenEenheid
+from woningwaardering.vera.interneren import interneer_referentiedata
+
+
+@cache
+def _eenheid_model_zonder_waarschuwingen() -> type[BaseModel]:
+    """
+    Maakt een model met dezelfde velden als EenhedenEenheid, maar zonder de
+    wrap-validator `warning_bij_validatiefout` op elk veld.
+
+    De geneste VERA-modellen worden ongewijzigd hergebruikt.
+    """
+    velden: dict[str, Any] = {
+        naam: (veld.annotation, veld)
+        for naam, veld in EenhedenEenheid.model_fields.items()
+    }
+    return create_model(
+        "_EenhedenEenheidZonderWaarschuwingen",
+        __config__=EenhedenEenheid.model_config,
+        **velden,
+    )
+
+
+def _naar_eenheid(model: BaseModel) -> EenhedenEenheid:
+    # De velden zijn al gevalideerd, dus model_construct volstaat.
+    return EenhedenEenheid.model_construct(
+        _fields_set=model.model_fields_set, **model.__dict__
+    )
+
+
+def lees_eenheid_json(
+    json_data: str | bytes, interneer: bool = True
+) -> EenhedenEenheid:
+    """
+    Leest een eenheid in vanuit JSON.
+
+    Goedgevormde invoer wordt eerst gevalideerd zonder de wrap-validator die
+    validatiefouten omzet in waarschuwingen. Alleen als die validatie faalt, wordt
+    de invoer opnieuw gevalideerd met `EenhedenEenheid.model_validate_json`, zodat
+    dezelfde waarschuwingen worden gegeven en foutieve attributen worden weggelaten.
+
+    Standaard wordt de referentiedata in de eenheid geïnterneerd met
+    `interneer_referentiedata`, zodat bijvoorbeeld elke badkamer naar
+    `Ruimtedetailsoort.badkamer` verwijst.
+
+    Args:
+        json_data (str | bytes): De eenheid als JSON.
+        interneer (bool): Interneer de referentiedata. Standaard True.
+
+    Returns:
+        EenhedenEenheid: De ingelezen eenheid.
+    """
+    eenheid: EenhedenEenheid
+    try:
+        model = _eenheid_model_zonder_waarschuwingen().model_validate_json(json_data)
+    except ValidationError:
+        eenheid = EenhedenEenheid.model_validate_json(json_data)
+    else:
+        eenheid = _naar_eenheid(model)
+
+    if interneer:
+        interneer_referentiedata(eenheid)
+    return eenheid
+
+
+def lees_eenheid(data: dict[str, Any], interneer: bool = True) -> EenhedenEenheid:
+    """
+    Leest een eenheid in vanuit een dictionary, zoals `lees_eenheid_json`.
+
+    Args:
+        data (dict[str, Any]): De eenheid als dictionary.
+        interneer (bool): Interneer de referentiedata. Standaard True.
+
+    Returns:
+        EenhedenEenheid: De ingelezen eenheid.
+    """
+    eenheid: EenhedenEenheid
+    try:
+        model = _eenheid_model_zonder_waarschuwingen().model_validate(data)
+    except ValidationError:
+        eenheid = EenhedenEenheid.model_validate(data)
+    else:
+        eenheid = _naar_eenheid(model)
+
+    if interneer:
+        interneer_referentiedata(eenheid)
+    return eenheid
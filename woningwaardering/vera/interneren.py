@@ -0,0 +1,198 @@
+import types
+from functools import cache
+from inspect import isclass
+from typing import Any, Literal, NamedTuple, Union, get_args, get_origin, get_type_hints
+
+from pydantic import BaseModel
+
+from woningwaardering.vera.bvg.generated import (
+    BouwkundigElementenBouwkundigElement,
+    EenhedenEenheid,
+    EenhedenEnergieprestatie,
+    EenhedenOppervlakte,
+    EenhedenPand,
+    EenhedenRuimte,
+    Referentiedata,
+)
+from woningwaardering.vera.referentiedata import (
+    Bouwkundigelementdetailsoort,
+    Bouwkundigelementsoort,
+    Doelgroep,
+    Eenheiddetailsoort,
+    Eenheidmonument,
+    Eenheidsoort,
+    Energielabel,
+    Energieprestatiesoort,
+    Energieprestatiestatus,
+    Installatiesoort,
+    Oppervlaktesoort,
+    Pandsoort,
+    Ruimtedetailsoort,
+    Ruimteligging,
+    Ruimtesoort,
+    Woningwaarderingstelsel,
+)
+from woningwaardering.vera.referentiedatasoort import Referentiedatasoort
+
+REFERENTIEDATASOORTEN: dict[tuple[type[BaseModel], str], type[Referentiedatasoort]] = {
+    (EenhedenEenheid, "soort"): Eenheidsoort,
+    (EenhedenEenheid, "detail_soort"): Eenheiddetailsoort,
+    (EenhedenEenheid, "doelgroep"): Doelgroep,
+    (EenhedenEenheid, "monumenten"): Eenheidmonument,
+    (EenhedenEenheid, "woningwaarderingstelsel"): Woningwaarderingstelsel,
+    (EenhedenRuimte, "soort"): Ruimtesoort,
+    (EenhedenRuimte, "detail_soort"): Ruimtedetailsoort,
+    (EenhedenRuimte, "ligging"): Ruimteligging,
+    (EenhedenRuimte, "installaties"): Installatiesoort,
+    (BouwkundigElementenBouwkundigElement, "soort"): Bouwkundigelementsoort,
+    (
+        BouwkundigElementenBouwkundigElement,
+        "detail_soort",
+    ): Bouwkundigelementdetailsoort,
+    (EenhedenEnergieprestatie, "soort"): Energieprestatiesoort,
+    (EenhedenEnergieprestatie, "status"): Energieprestatiestatus,
+    (EenhedenEnergieprestatie, "label"): Energielabel,
+    (EenhedenOppervlakte, "soort"): Oppervlaktesoort,
+    (EenhedenPand, "soort"): Pandsoort,
+}
+"""De Referentiedatasoort van de velden van de VERA-modellen die de waardering gebruikt."""
+
+_Vorm = Literal["referentiedata", "referentiedatalijst", "model", "modellijst"]
+
+
+class _Veld(NamedTuple):
+    naam: str
+    vorm: _Vorm
+    soort: type[Referentiedatasoort] | None
+
+
+def interneer(
+    referentiedata: Referentiedata, soort: type[Referentiedatasoort] | None = None
+) -> Referentiedata:
+    """
+    Geeft de canonieke instantie voor een Referentiedata object.
+
+    Als de code en naam overeenkomen met een waarde van de Referentiedatasoort, is dat
+    de waarde uit de Referentiedatasoort, zoals `Ruimtedetailsoort.badkamer`. Die
+    waarden zijn onveranderlijk, zodat ze veilig gedeeld kunnen worden. Anders wordt
+    het object zelf teruggegeven, zodat een afwijkende naam behouden blijft.
+
+    Args:
+        referentiedata (Referentiedata): Het Referentiedata object.
+        soort (type[Referentiedatasoort] | None): De Referentiedatasoort van het veld
+            waarin de referentiedata staat, of None als die onbekend is.
+
+    Returns:
+        Referentiedata: De canonieke instantie.
+    """
+    if soort is not None:
+        waarde = soort.van_code(referentiedata.code)
+        if waarde is not None and waarde.naam == referentiedata.naam:
+            return waarde
+    return referentiedata
+
+
+def _veldtypen(annotatie: Any) -> tuple[list[Any], bool]:
+    """Geeft de mogelijke typen van een veld en of het veld een lijst is."""
+    if get_origin(annotatie) in (Union, types.UnionType):
+        argumenten = [arg for arg in get_args(annotatie) if arg is not type(None)]
+        if len(argumenten) == 1:
+            annotatie = argumenten[0]
+    lijst = get_origin(annotatie) is list
+    if lijst:
+        (annotatie,) = get_args(annotatie)
+    if get_origin(annotatie) in (Union, types.UnionType):
+        return [arg for arg in get_args(annotatie) if arg is not type(None)], lijst
+    return [annotatie], lijst
+
+
+def _is_model(type_: Any) -> bool:
+    return (
+        isclass(type_)
+        and issubclass(type_, BaseModel)
+        and not issubclass(type_, Referentiedata)
+        and "root" not in type_.model_fields
+    )
+
+
+@cache
+def _velden(model: type[BaseModel]) -> tuple[_Veld, ...]:
+    """
+    De velden van een model met Referentiedata waarvan de soort bekend is, en de
+    velden met geneste modellen die zulke velden bevatten.
+    """
+    # Sommige annotaties van de gegenereerde modellen zijn nog forward references.
+    annotaties = get_type_hints(model)
+    velden = []
+    for naam, veld in model.model_fields.items():
+        typen, lijst = _veldtypen(annotaties.get(naam, veld.annotation))
+        soort = next(
+            (
+                REFERENTIEDATASOORTEN[basis, naam]
+                for basis in model.__mro__
+                if (basis, naam) in REFERENTIEDATASOORTEN
+            ),
+            None,
+        )
+        if soort is not None:
+            velden.append(
+                _Veld(naam, "referentiedatalijst" if lijst else "referentiedata", soort)
+            )
+        elif all(_is_model(type_) for type_ in typen) and any(
+            _bevat_referentiedatasoorten(type_) for type_ in typen
+        ):
+            velden.append(_Veld(naam, "modellijst" if lijst else "model", None))
+    return tuple(velden)
+
+
+def _bevat_referentiedatasoorten(
+    model: type[BaseModel], bezocht: frozenset[type[BaseModel]] = frozenset()
+) -> bool:
+    """Of een model, direct of via geneste modellen, velden uit REFERENTIEDATASOORTEN heeft."""
+    if any(basis is model for basis, _ in REFERENTIEDATASOORTEN):
+        return True
+    bezocht = bezocht | {model}
+    annotaties = get_type_hints(model)
+    for naam, veld in model.model_fields.items():
+        typen, _ = _veldtypen(annotaties.get(naam, veld.annotation))
+        for type_ in typen:
+            if (
+                _is_model(type_)
+                and type_ not in bezocht
+                and _bevat_referentiedatasoorten(type_, bezocht)
+            ):
+                return True
+    return False
+
+
+def interneer_referentiedata(model: BaseModel) -> None:
+    """
+    Vervangt alle Referentiedata in een model en de geneste modellen door de
+    canonieke instanties (zie `interneer`).
+
+    Na het interneren verwijzen bijvoorbeeld alle badkamers in een batch eenheden
+    naar `Ruimtedetailsoort.badkamer`. Dat bespaart geheugen bij grote aantallen
+    eenheden en maakt vergelijkingen op identiteit mogelijk. Gelijkheid en hashes
+    veranderen niet, want die zijn gebaseerd op de code.
+
+    Args:
+        model (BaseModel): Het model, bijvoorbeeld een EenhedenEenheid, dat in place
+            wordt aangepast.
+    """
+    waarden = model.__dict__
+    for naam, vorm, soort in _velden(type(model)):
+        waarde = waarden.get(naam)
+        if waarde is None:
+            continue
+        if vorm == "referentiedata":
+            waarden[naam] = interneer(waarde, soort)
+        elif vorm == "referentiedatalijst":
+            waarden[naam] = [
+                item if item is None else interneer(item, soort) for item in waarde
+            ]
+        elif vorm == "model":
+            interneer_referentiedata(waarde)
+        else:
+            for item in waarde:
+                if item is not None:
+                    interneer_referentiedata(item)
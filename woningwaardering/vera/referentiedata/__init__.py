@@ -1,462 +1,1287 @@
-from .aanbiedingdetailstatus import (
-    Aanbiedingdetailstatus,
-    AanbiedingdetailstatusReferentiedata,
-)
-from .aanbiedingstatus import Aanbiedingstatus, AanbiedingstatusReferentiedata
-from .aanvullendedoelgroep import (
-    Aanvullendedoelgroep,
-    AanvullendedoelgroepReferentiedata,
-)
-from .accountstatus import Accountstatus, AccountstatusReferentiedata
-from .adressoort import Adressoort, AdressoortReferentiedata
-from .afletterstatus import Afletterstatus, AfletterstatusReferentiedata
-from .afrekenwijzesoort import Afrekenwijzesoort, AfrekenwijzesoortReferentiedata
-from .afspraakstatus import Afspraakstatus, AfspraakstatusReferentiedata
-from .afspraakverzoeksoort import (
-    Afspraakverzoeksoort,
-    AfspraakverzoeksoortReferentiedata,
-)
-from .afwezigheidsoort import Afwezigheidsoort, AfwezigheidsoortReferentiedata
-from .aktesoort import Aktesoort, AktesoortReferentiedata
-from .authentiekgegevenbron import (
-    Authentiekgegevenbron,
-    AuthentiekgegevenbronReferentiedata,
-)
-from .authentiekgegevensoort import (
-    Authentiekgegevensoort,
-    AuthentiekgegevensoortReferentiedata,
-)
-from .authentiekgegevenstatus import (
-    Authentiekgegevenstatus,
-    AuthentiekgegevenstatusReferentiedata,
-)
-from .bedrijfsoort import Bedrijfsoort, BedrijfsoortReferentiedata
-from .begrotingversie import Begrotingversie, BegrotingversieReferentiedata
-from .bestemming import Bestemming, BestemmingReferentiedata
-from .betaalgegevensoort import Betaalgegevensoort, BetaalgegevensoortReferentiedata
-from .betaalwijzedeelsoort import (
-    Betaalwijzedeelsoort,
-    BetaalwijzedeelsoortReferentiedata,
-)
-from .betaalwijzesoort import Betaalwijzesoort, BetaalwijzesoortReferentiedata
-from .betalingsregelingeindereden import (
-    Betalingsregelingeindereden,
-    BetalingsregelingeinderedenReferentiedata,
-)
-from .betalingsregelingstatus import (
-    Betalingsregelingstatus,
-    BetalingsregelingstatusReferentiedata,
-)
-from .boekingdetailsoort import Boekingdetailsoort, BoekingdetailsoortReferentiedata
-from .boekingsoort import Boekingsoort, BoekingsoortReferentiedata
-from .boekingstatus import Boekingstatus, BoekingstatusReferentiedata
-from .boekjaarperiodesoort import (
-    Boekjaarperiodesoort,
-    BoekjaarperiodesoortReferentiedata,
-)
-from .boekjaarperiodestatus import (
-    Boekjaarperiodestatus,
-    BoekjaarperiodestatusReferentiedata,
-)
-from .boekjaarstatus import Boekjaarstatus, BoekjaarstatusReferentiedata
-from .bouwkundigelementdetailsoort import (
-    Bouwkundigelementdetailsoort,
-    BouwkundigelementdetailsoortReferentiedata,
-)
-from .bouwkundigelementplaatsing import (
-    Bouwkundigelementplaatsing,
-    BouwkundigelementplaatsingReferentiedata,
-)
-from .bouwkundigelementsoort import (
-    Bouwkundigelementsoort,
-    BouwkundigelementsoortReferentiedata,
-)
-from .brandwerendheidscore import (
-    Brandwerendheidscore,
-    BrandwerendheidscoreReferentiedata,
-)
-from .btw import Btw, BtwReferentiedata
-from .btwaangiftestatus import Btwaangiftestatus, BtwaangiftestatusReferentiedata
-from .burgerlijkestaat import Burgerlijkestaat, BurgerlijkestaatReferentiedata
-from .clustersoort import Clustersoort, ClustersoortReferentiedata
-from .collectiefobjectsoort import (
-    Collectiefobjectsoort,
-    CollectiefobjectsoortReferentiedata,
-)
-from .communicatiekanaal import Communicatiekanaal, CommunicatiekanaalReferentiedata
-from .communicatierichting import (
-    Communicatierichting,
-    CommunicatierichtingReferentiedata,
-)
-from .communicatievoorkeursoort import (
-    Communicatievoorkeursoort,
-    CommunicatievoorkeursoortReferentiedata,
-)
-from .conditiescore import Conditiescore, ConditiescoreReferentiedata
-from .contactgegevendetailsoort import (
-    Contactgegevendetailsoort,
-    ContactgegevendetailsoortReferentiedata,
-)
-from .contactgegevensoort import Contactgegevensoort, ContactgegevensoortReferentiedata
-from .contactgegevenstatus import (
-    Contactgegevenstatus,
-    ContactgegevenstatusReferentiedata,
-)
-from .contactgegevenvoorkeur import (
-    Contactgegevenvoorkeur,
-    ContactgegevenvoorkeurReferentiedata,
-)
-from .crediteursoort import Crediteursoort, CrediteursoortReferentiedata
-from .crediteurstatus import Crediteurstatus, CrediteurstatusReferentiedata
-from .dagdeel import Dagdeel, DagdeelReferentiedata
-from .debiteursoort import Debiteursoort, DebiteursoortReferentiedata
-from .debiteurstatus import Debiteurstatus, DebiteurstatusReferentiedata
-from .defectlocatie import Defectlocatie, DefectlocatieReferentiedata
-from .defectoorzaak import Defectoorzaak, DefectoorzaakReferentiedata
-from .defectsoort import Defectsoort, DefectsoortReferentiedata
-from .defectstatus import Defectstatus, DefectstatusReferentiedata
-from .doelgroep import Doelgroep, DoelgroepReferentiedata
-from .eenheidcriteriasoort import (
-    Eenheidcriteriasoort,
-    EenheidcriteriasoortReferentiedata,
-)
-from .eenheidcriteriumdetailsoort import (
-    Eenheidcriteriumdetailsoort,
-    EenheidcriteriumdetailsoortReferentiedata,
-)
-from .eenheidcriteriumsoort import (
-    Eenheidcriteriumsoort,
-    EenheidcriteriumsoortReferentiedata,
-)
-from .eenheidcriteriumtoepassing import (
-    Eenheidcriteriumtoepassing,
-    EenheidcriteriumtoepassingReferentiedata,
-)
-from .eenheiddetailsoort import Eenheiddetailsoort, EenheiddetailsoortReferentiedata
-from .eenheiddetailstatus import Eenheiddetailstatus, EenheiddetailstatusReferentiedata
-from .eenheidenergievoorziening import (
-    Eenheidenergievoorziening,
-    EenheidenergievoorzieningReferentiedata,
-)
-from .eenheidinterieur import Eenheidinterieur, EenheidinterieurReferentiedata
-from .eenheidisolatie import Eenheidisolatie, EenheidisolatieReferentiedata
-from .eenheidklimaatbeheersing import (
-    Eenheidklimaatbeheersing,
-    EenheidklimaatbeheersingReferentiedata,
-)
-from .eenheidklimaatbeheersingsoort import (
-    Eenheidklimaatbeheersingsoort,
-    EenheidklimaatbeheersingsoortReferentiedata,
-)
-from .eenheidligging import Eenheidligging, EenheidliggingReferentiedata
-from .eenheidmonument import Eenheidmonument, EenheidmonumentReferentiedata
-from .eenheidprijsconditie import (
-    Eenheidprijsconditie,
-    EenheidprijsconditieReferentiedata,
-)
-from .eenheidsanitair import Eenheidsanitair, EenheidsanitairReferentiedata
-from .eenheidsoort import Eenheidsoort, EenheidsoortReferentiedata
-from .eenheidstatus import Eenheidstatus, EenheidstatusReferentiedata
-from .eindedetailreden import Eindedetailreden, EindedetailredenReferentiedata
-from .eindereden import Eindereden, EinderedenReferentiedata
-from .energielabel import Energielabel, EnergielabelReferentiedata
-from .energieprestatiesoort import (
-    Energieprestatiesoort,
-    EnergieprestatiesoortReferentiedata,
-)
-from .energieprestatiestatus import (
-    Energieprestatiestatus,
-    EnergieprestatiestatusReferentiedata,
-)
-from .energieprestatievergoedingsoort import (
-    Energieprestatievergoedingsoort,
-    EnergieprestatievergoedingsoortReferentiedata,
-)
-from .externeincassosoort import Externeincassosoort, ExterneincassosoortReferentiedata
-from .externeincassostatus import (
-    Externeincassostatus,
-    ExterneincassostatusReferentiedata,
-)
-from .factuurbetaalwijze import Factuurbetaalwijze, FactuurbetaalwijzeReferentiedata
-from .factuursoort import Factuursoort, FactuursoortReferentiedata
-from .gebeurtenissoort import Gebeurtenissoort, GebeurtenissoortReferentiedata
-from .geometriesoort import Geometriesoort, GeometriesoortReferentiedata
-from .geslacht import Geslacht, GeslachtReferentiedata
-from .grootboekmutatieherkomst import (
-    Grootboekmutatieherkomst,
-    GrootboekmutatieherkomstReferentiedata,
-)
-from .grootboekrekeningsoort import (
-    Grootboekrekeningsoort,
-    GrootboekrekeningsoortReferentiedata,
-)
-from .grootboekrekeningstatus import (
-    Grootboekrekeningstatus,
-    GrootboekrekeningstatusReferentiedata,
-)
-from .huurgeschilsoort import Huurgeschilsoort, HuurgeschilsoortReferentiedata
-from .huurgeschilstatus import Huurgeschilstatus, HuurgeschilstatusReferentiedata
-from .huurklasse import Huurklasse, HuurklasseReferentiedata
-from .huuropzeggingstatus import Huuropzeggingstatus, HuuropzeggingstatusReferentiedata
-from .incassomoment import Incassomoment, IncassomomentReferentiedata
-from .inexploitatiereden import Inexploitatiereden, InexploitatieredenReferentiedata
-from .informatieobjectdetailsoort import (
-    Informatieobjectdetailsoort,
-    InformatieobjectdetailsoortReferentiedata,
-)
-from .informatieobjectsoort import (
-    Informatieobjectsoort,
-    InformatieobjectsoortReferentiedata,
-)
-from .inkomensbron import Inkomensbron, InkomensbronReferentiedata
-from .inkomenssoort import Inkomenssoort, InkomenssoortReferentiedata
-from .inkomensverklaringsoort import (
-    Inkomensverklaringsoort,
-    InkomensverklaringsoortReferentiedata,
-)
-from .inkoopfactuurstatus import Inkoopfactuurstatus, InkoopfactuurstatusReferentiedata
-from .inkoopopdrachtregelsoort import (
-    Inkoopopdrachtregelsoort,
-    InkoopopdrachtregelsoortReferentiedata,
-)
-from .inschrijvingherkomst import (
-    Inschrijvingherkomst,
-    InschrijvingherkomstReferentiedata,
-)
-from .inspectierapportsoort import (
-    Inspectierapportsoort,
-    InspectierapportsoortReferentiedata,
-)
-from .inspectierapportstatus import (
-    Inspectierapportstatus,
-    InspectierapportstatusReferentiedata,
-)
-from .installatiesoort import Installatiesoort, InstallatiesoortReferentiedata
-from .kandidaatdetailstatus import (
-    Kandidaatdetailstatus,
-    KandidaatdetailstatusReferentiedata,
-)
-from .kandidaatstatus import Kandidaatstatus, KandidaatstatusReferentiedata
-from .kwaliteitsmetingverzoeksoort import (
-    Kwaliteitsmetingverzoeksoort,
-    KwaliteitsmetingverzoeksoortReferentiedata,
-)
-from .kwaliteitsniveau import Kwaliteitsniveau, KwaliteitsniveauReferentiedata
-from .leningaflosvorm import Leningaflosvorm, LeningaflosvormReferentiedata
-from .leningdetailsoort import Leningdetailsoort, LeningdetailsoortReferentiedata
-from .leningsoort import Leningsoort, LeningsoortReferentiedata
-from .maatschappelijklabel import (
-    Maatschappelijklabel,
-    MaatschappelijklabelReferentiedata,
-)
-from .machtigingsoort import Machtigingsoort, MachtigingsoortReferentiedata
-from .materiaaldetailsoort import (
-    Materiaaldetailsoort,
-    MateriaaldetailsoortReferentiedata,
-)
-from .materiaalsoort import Materiaalsoort, MateriaalsoortReferentiedata
-from .medewerkerbudgetsoort import (
-    Medewerkerbudgetsoort,
-    MedewerkerbudgetsoortReferentiedata,
-)
-from .medewerkerrol import Medewerkerrol, MedewerkerrolReferentiedata
-from .medewerkersoort import Medewerkersoort, MedewerkersoortReferentiedata
-from .meeteenheid import Meeteenheid, MeeteenheidReferentiedata
-from .onderhoudsbestedingsoort import (
-    Onderhoudsbestedingsoort,
-    OnderhoudsbestedingsoortReferentiedata,
-)
-from .onderhoudslabel import Onderhoudslabel, OnderhoudslabelReferentiedata
-from .onderhoudsoort import Onderhoudsoort, OnderhoudsoortReferentiedata
-from .onderhoudsorderstatus import (
-    Onderhoudsorderstatus,
-    OnderhoudsorderstatusReferentiedata,
-)
-from .onderhoudspecialisme import (
-    Onderhoudspecialisme,
-    OnderhoudspecialismeReferentiedata,
-)
-from .onderhoudstaakdetailstatus import (
-    Onderhoudstaakdetailstatus,
-    OnderhoudstaakdetailstatusReferentiedata,
-)
-from .onderhoudstaakstatus import (
-    Onderhoudstaakstatus,
-    OnderhoudstaakstatusReferentiedata,
-)
-from .onderhoudsverzoekstatus import (
-    Onderhoudsverzoekstatus,
-    OnderhoudsverzoekstatusReferentiedata,
-)
-from .opleidingsniveau import Opleidingsniveau, OpleidingsniveauReferentiedata
-from .oppervlaktesoort import Oppervlaktesoort, OppervlaktesoortReferentiedata
-from .opzegtermijn import Opzegtermijn, OpzegtermijnReferentiedata
-from .organisatievorm import Organisatievorm, OrganisatievormReferentiedata
-from .overeenkomstdetailsoort import (
-    Overeenkomstdetailsoort,
-    OvereenkomstdetailsoortReferentiedata,
-)
-from .overeenkomstkoppelingdetailstatus import (
-    Overeenkomstkoppelingdetailstatus,
-    OvereenkomstkoppelingdetailstatusReferentiedata,
-)
-from .overeenkomstkoppelingstatus import (
-    Overeenkomstkoppelingstatus,
-    OvereenkomstkoppelingstatusReferentiedata,
-)
-from .overeenkomstsoort import Overeenkomstsoort, OvereenkomstsoortReferentiedata
-from .overeenkomststatus import Overeenkomststatus, OvereenkomststatusReferentiedata
-from .pandsoort import Pandsoort, PandsoortReferentiedata
-from .passendheiddetailsoort import (
-    Passendheiddetailsoort,
-    PassendheiddetailsoortReferentiedata,
-)
-from .passendheidssoort import Passendheidssoort, PassendheidssoortReferentiedata
-from .personelefunctiesoort import (
-    Personelefunctiesoort,
-    PersonelefunctiesoortReferentiedata,
-)
-from .prestatieafspraak import Prestatieafspraak, PrestatieafspraakReferentiedata
-from .prijsaanpassingsoort import (
-    Prijsaanpassingsoort,
-    PrijsaanpassingsoortReferentiedata,
-)
-from .prijscomponentdetailsoort import (
-    Prijscomponentdetailsoort,
-    PrijscomponentdetailsoortReferentiedata,
-)
-from .prijscomponentsoort import Prijscomponentsoort, PrijscomponentsoortReferentiedata
-from .prijscomponentsubsidiesoort import (
-    Prijscomponentsubsidiesoort,
-    PrijscomponentsubsidiesoortReferentiedata,
-)
-from .prijscomponentwijzigingsreden import (
-    Prijscomponentwijzigingsreden,
-    PrijscomponentwijzigingsredenReferentiedata,
-)
-from .projectbudgetregelregelsoort import (
-    Projectbudgetregelregelsoort,
-    ProjectbudgetregelregelsoortReferentiedata,
-)
-from .projectbudgetregelsoort import (
-    Projectbudgetregelsoort,
-    ProjectbudgetregelsoortReferentiedata,
-)
-from .projectbudgetregelstatus import (
-    Projectbudgetregelstatus,
-    ProjectbudgetregelstatusReferentiedata,
-)
-from .projectfasebesluitstatus import (
-    Projectfasebesluitstatus,
-    ProjectfasebesluitstatusReferentiedata,
-)
-from .projectsoort import Projectsoort, ProjectsoortReferentiedata
-from .projectstatus import Projectstatus, ProjectstatusReferentiedata
-from .provincie import Provincie, ProvincieReferentiedata
-from .publicatiedetailmodel import (
-    Publicatiedetailmodel,
-    PublicatiedetailmodelReferentiedata,
-)
-from .publicatiedetailstatus import (
-    Publicatiedetailstatus,
-    PublicatiedetailstatusReferentiedata,
-)
-from .publicatieintakevorm import (
-    Publicatieintakevorm,
-    PublicatieintakevormReferentiedata,
-)
-from .publicatiemodel import Publicatiemodel, PublicatiemodelReferentiedata
-from .publicatiestatus import Publicatiestatus, PublicatiestatusReferentiedata
-from .puntenberekeningsoort import (
-    Puntenberekeningsoort,
-    PuntenberekeningsoortReferentiedata,
-)
-from .puntenmutatiesoort import Puntenmutatiesoort, PuntenmutatiesoortReferentiedata
-from .reclamatiesoort import Reclamatiesoort, ReclamatiesoortReferentiedata
-from .reclamatiestatus import Reclamatiestatus, ReclamatiestatusReferentiedata
-from .redenontbinding import Redenontbinding, RedenontbindingReferentiedata
-from .redenopzegging import Redenopzegging, RedenopzeggingReferentiedata
-from .redenvernietiging import Redenvernietiging, RedenvernietigingReferentiedata
-from .regiesoort import Regiesoort, RegiesoortReferentiedata
-from .relatieadressoort import Relatieadressoort, RelatieadressoortReferentiedata
-from .relatiedetailsoort import Relatiedetailsoort, RelatiedetailsoortReferentiedata
-from .relatierolsoort import Relatierolsoort, RelatierolsoortReferentiedata
-from .relatiesoort import Relatiesoort, RelatiesoortReferentiedata
-from .relatiestatus import Relatiestatus, RelatiestatusReferentiedata
-from .rentesoort import Rentesoort, RentesoortReferentiedata
-from .ruimtedetailsoort import Ruimtedetailsoort, RuimtedetailsoortReferentiedata
-from .ruimteligging import Ruimteligging, RuimteliggingReferentiedata
-from .ruimtesoort import Ruimtesoort, RuimtesoortReferentiedata
-from .sanctiesoort import Sanctiesoort, SanctiesoortReferentiedata
-from .sanctiestatus import Sanctiestatus, SanctiestatusReferentiedata
-from .signaleringdetailsoort import (
-    Signaleringdetailsoort,
-    SignaleringdetailsoortReferentiedata,
-)
-from .signaleringsoort import Signaleringsoort, SignaleringsoortReferentiedata
-from .signaleringstatus import Signaleringstatus, SignaleringstatusReferentiedata
-from .taal import Taal, TaalReferentiedata
-from .tijdsbestedingdetailsoort import (
-    Tijdsbestedingdetailsoort,
-    TijdsbestedingdetailsoortReferentiedata,
-)
-from .tijdsbestedingsoort import Tijdsbestedingsoort, TijdsbestedingsoortReferentiedata
-from .tijdseenheid import Tijdseenheid, TijdseenheidReferentiedata
-from .toegankelijkheidslabel import (
-    Toegankelijkheidslabel,
-    ToegankelijkheidslabelReferentiedata,
-)
-from .uitexploitatiereden import Uitexploitatiereden, UitexploitatieredenReferentiedata
-from .uitvoerendesoort import Uitvoerendesoort, UitvoerendesoortReferentiedata
-from .vacaturesoort import Vacaturesoort, VacaturesoortReferentiedata
-from .verantwoordingconsolidatie import (
-    Verantwoordingconsolidatie,
-    VerantwoordingconsolidatieReferentiedata,
-)
-from .verantwoordingregime import (
-    Verantwoordingregime,
-    VerantwoordingregimeReferentiedata,
-)
-from .verbijzonderingsoort import (
-    Verbijzonderingsoort,
-    VerbijzonderingsoortReferentiedata,
-)
-from .verbijzonderingstatus import (
-    Verbijzonderingstatus,
-    VerbijzonderingstatusReferentiedata,
-)
-from .verrekeningsoort import Verrekeningsoort, VerrekeningsoortReferentiedata
-from .vertrouwelijkheid import Vertrouwelijkheid, VertrouwelijkheidReferentiedata
-from .voorrangdetailsoort import Voorrangdetailsoort, VoorrangdetailsoortReferentiedata
-from .voorrangsoort import Voorrangsoort, VoorrangsoortReferentiedata
-from .voorzieningsoort import Voorzieningsoort, VoorzieningsoortReferentiedata
-from .vragenlijstregelherkomst import (
-    Vragenlijstregelherkomst,
-    VragenlijstregelherkomstReferentiedata,
-)
-from .vragenlijstregelonderwerpsoort import (
-    Vragenlijstregelonderwerpsoort,
-    VragenlijstregelonderwerpsoortReferentiedata,
-)
-from .woningwaarderingstelsel import (
-    Woningwaarderingstelsel,
-    WoningwaarderingstelselReferentiedata,
-)
-from .woningwaarderingstelselgroep import (
-    Woningwaarderingstelselgroep,
-    WoningwaarderingstelselgroepReferentiedata,
-)
-from .woonsituatiesoort import Woonsituatiesoort, WoonsituatiesoortReferentiedata
-from .woonvorm import Woonvorm, WoonvormReferentiedata
-from .zaakobjectsoort import Zaakobjectsoort, ZaakobjectsoortReferentiedata
-from .zaakrol import Zaakrol, ZaakrolReferentiedata
-from .zaakstatussoort import Zaakstatussoort, ZaakstatussoortReferentiedata
-from .zaaktypedetailsoort import Zaaktypedetailsoort, ZaaktypedetailsoortReferentiedata
-from .zaaktypesoort import Zaaktypesoort, ZaaktypesoortReferentiedata
-from .zekerheidverpandingsoort import (
-    Zekerheidverpandingsoort,
-    ZekerheidverpandingsoortReferentiedata,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .aanbiedingdetailstatus import (
+        Aanbiedingdetailstatus,
+        AanbiedingdetailstatusReferentiedata,
+    )
+    from .aanbiedingstatus import (
+        Aanbiedingstatus,
+        AanbiedingstatusReferentiedata,
+    )
+    from .aanvullendedoelgroep import (
+        Aanvullendedoelgroep,
+        AanvullendedoelgroepReferentiedata,
+    )
+    from .accountstatus import (
+        Accountstatus,
+        AccountstatusReferentiedata,
+    )
+    from .adressoort import (
+        Adressoort,
+        AdressoortReferentiedata,
+    )
+    from .afletterstatus import (
+        Afletterstatus,
+        AfletterstatusReferentiedata,
+    )
+    from .afrekenwijzesoort import (
+        Afrekenwijzesoort,
+        AfrekenwijzesoortReferentiedata,
+    )
+    from .afspraakstatus import (
+        Afspraakstatus,
+        AfspraakstatusReferentiedata,
+    )
+    from .afspraakverzoeksoort import (
+        Afspraakverzoeksoort,
+        AfspraakverzoeksoortReferentiedata,
+    )
+    from .afwezigheidsoort import (
+        Afwezigheidsoort,
+        AfwezigheidsoortReferentiedata,
+    )
+    from .aktesoort import (
+        Aktesoort,
+        AktesoortReferentiedata,
+    )
+    from .authentiekgegevenbron import (
+        Authentiekgegevenbron,
+        AuthentiekgegevenbronReferentiedata,
+    )
+    from .authentiekgegevensoort import (
+        Authentiekgegevensoort,
+        AuthentiekgegevensoortReferentiedata,
+    )
+    from .authentiekgegevenstatus import (
+        Authentiekgegevenstatus,
+        AuthentiekgegevenstatusReferentiedata,
+    )
+    from .bedrijfsoort import (
+        Bedrijfsoort,
+        BedrijfsoortReferentiedata,
+    )
+    from .begrotingversie import (
+        Begrotingversie,
+        BegrotingversieReferentiedata,
+    )
+    from .bestemming import (
+        Bestemming,
+        BestemmingReferentiedata,
+    )
+    from .betaalgegevensoort import (
+        Betaalgegevensoort,
+        BetaalgegevensoortReferentiedata,
+    )
+    from .betaalwijzedeelsoort import (
+        Betaalwijzedeelsoort,
+        BetaalwijzedeelsoortReferentiedata,
+    )
+    from .betaalwijzesoort import (
+        Betaalwijzesoort,
+        BetaalwijzesoortReferentiedata,
+    )
+    from .betalingsregelingeindereden import (
+        Betalingsregelingeindereden,
+        BetalingsregelingeinderedenReferentiedata,
+    )
+    from .betalingsregelingstatus import (
+        Betalingsregelingstatus,
+        BetalingsregelingstatusReferentiedata,
+    )
+    from .boekingdetailsoort import (
+        Boekingdetailsoort,
+        BoekingdetailsoortReferentiedata,
+    )
+    from .boekingsoort import (
+        Boekingsoort,
+        BoekingsoortReferentiedata,
+    )
+    from .boekingstatus import (
+        Boekingstatus,
+        BoekingstatusReferentiedata,
+    )
+    from .boekjaarperiodesoort import (
+        Boekjaarperiodesoort,
+        BoekjaarperiodesoortReferentiedata,
+    )
+    from .boekjaarperiodestatus import (
+        Boekjaarperiodestatus,
+        BoekjaarperiodestatusReferentiedata,
+    )
+    from .boekjaarstatus import (
+        Boekjaarstatus,
+        BoekjaarstatusReferentiedata,
+    )
+    from .bouwkundigelementdetailsoort import (
+        Bouwkundigelementdetailsoort,
+        BouwkundigelementdetailsoortReferentiedata,
+    )
+    from .bouwkundigelementplaatsing import (
+        Bouwkundigelementplaatsing,
+        BouwkundigelementplaatsingReferentiedata,
+    )
+    from .bouwkundigelementsoort import (
+        Bouwkundigelementsoort,
+        BouwkundigelementsoortReferentiedata,
+    )
+    from .brandwerendheidscore import (
+        Brandwerendheidscore,
+        BrandwerendheidscoreReferentiedata,
+    )
+    from .btw import (
+        Btw,
+        BtwReferentiedata,
+    )
+    from .btwaangiftestatus import (
+        Btwaangiftestatus,
+        BtwaangiftestatusReferentiedata,
+    )
+    from .burgerlijkestaat import (
+        Burgerlijkestaat,
+        BurgerlijkestaatReferentiedata,
+    )
+    from .clustersoort import (
+        Clustersoort,
+        ClustersoortReferentiedata,
+    )
+    from .collectiefobjectsoort import (
+        Collectiefobjectsoort,
+        CollectiefobjectsoortReferentiedata,
+    )
+    from .communicatiekanaal import (
+        Communicatiekanaal,
+        CommunicatiekanaalReferentiedata,
+    )
+    from .communicatierichting import (
+        Communicatierichting,
+        CommunicatierichtingReferentiedata,
+    )
+    from .communicatievoorkeursoort import (
+        Communicatievoorkeursoort,
+        CommunicatievoorkeursoortReferentiedata,
+    )
+    from .conditiescore import (
+        Conditiescore,
+        ConditiescoreReferentiedata,
+    )
+    from .contactgegevendetailsoort import (
+        Contactgegevendetailsoort,
+        ContactgegevendetailsoortReferentiedata,
+    )
+    from .contactgegevensoort import (
+        Contactgegevensoort,
+        ContactgegevensoortReferentiedata,
+    )
+    from .contactgegevenstatus import (
+        Contactgegevenstatus,
+        ContactgegevenstatusReferentiedata,
+    )
+    from .contactgegevenvoorkeur import (
+        Contactgegevenvoorkeur,
+        ContactgegevenvoorkeurReferentiedata,
+    )
+    from .crediteursoort import (
+        Crediteursoort,
+        CrediteursoortReferentiedata,
+    )
+    from .crediteurstatus import (
+        Crediteurstatus,
+        CrediteurstatusReferentiedata,
+    )
+    from .dagdeel import (
+        Dagdeel,
+        DagdeelReferentiedata,
+    )
+    from .debiteursoort import (
+        Debiteursoort,
+        DebiteursoortReferentiedata,
+    )
+    from .debiteurstatus import (
+        Debiteurstatus,
+        DebiteurstatusReferentiedata,
+    )
+    from .defectlocatie import (
+        Defectlocatie,
+        DefectlocatieReferentiedata,
+    )
+    from .defectoorzaak import (
+        Defectoorzaak,
+        DefectoorzaakReferentiedata,
+    )
+    from .defectsoort import (
+        Defectsoort,
+        DefectsoortReferentiedata,
+    )
+    from .defectstatus import (
+        Defectstatus,
+        DefectstatusReferentiedata,
+    )
+    from .doelgroep import (
+        Doelgroep,
+        DoelgroepReferentiedata,
+    )
+    from .eenheidcriteriasoort import (
+        Eenheidcriteriasoort,
+        EenheidcriteriasoortReferentiedata,
+    )
+    from .eenheidcriteriumdetailsoort import (
+        Eenheidcriteriumdetailsoort,
+        EenheidcriteriumdetailsoortReferentiedata,
+    )
+    from .eenheidcriteriumsoort import (
+        Eenheidcriteriumsoort,
+        EenheidcriteriumsoortReferentiedata,
+    )
+    from .eenheidcriteriumtoepassing import (
+        Eenheidcriteriumtoepassing,
+        EenheidcriteriumtoepassingReferentiedata,
+    )
+    from .eenheiddetailsoort import (
+        Eenheiddetailsoort,
+        EenheiddetailsoortReferentiedata,
+    )
+    from .eenheiddetailstatus import (
+        Eenheiddetailstatus,
+        EenheiddetailstatusReferentiedata,
+    )
+    from .eenheidenergievoorziening import (
+        Eenheidenergievoorziening,
+        EenheidenergievoorzieningReferentiedata,
+    )
+    from .eenheidinterieur import (
+        Eenheidinterieur,
+        EenheidinterieurReferentiedata,
+    )
+    from .eenheidisolatie import (
+        Eenheidisolatie,
+        EenheidisolatieReferentiedata,
+    )
+    from .eenheidklimaatbeheersing import (
+        Eenheidklimaatbeheersing,
+        EenheidklimaatbeheersingReferentiedata,
+    )
+    from .eenheidklimaatbeheersingsoort import (
+        Eenheidklimaatbeheersingsoort,
+        EenheidklimaatbeheersingsoortReferentiedata,
+    )
+    from .eenheidligging import (
+        Eenheidligging,
+        EenheidliggingReferentiedata,
+    )
+    from .eenheidmonument import (
+        Eenheidmonument,
+        EenheidmonumentReferentiedata,
+    )
+    from .eenheidprijsconditie import (
+        Eenheidprijsconditie,
+        EenheidprijsconditieReferentiedata,
+    )
+    from .eenheidsanitair import (
+        Eenheidsanitair,
+        EenheidsanitairReferentiedata,
+    )
+    from .eenheidsoort import (
+        Eenheidsoort,
+        EenheidsoortReferentiedata,
+    )
+    from .eenheidstatus import (
+        Eenheidstatus,
+        EenheidstatusReferentiedata,
+    )
+    from .eindedetailreden import (
+        Eindedetailreden,
+        EindedetailredenReferentiedata,
+    )
+    from .eindereden import (
+        Eindereden,
+        EinderedenReferentiedata,
+    )
+    from .energielabel import (
+        Energielabel,
+        EnergielabelReferentiedata,
+    )
+    from .energieprestatiesoort import (
+        Energieprestatiesoort,
+        EnergieprestatiesoortReferentiedata,
+    )
+    from .energieprestatiestatus import (
+        Energieprestatiestatus,
+        EnergieprestatiestatusReferentiedata,
+    )
+    from .energieprestatievergoedingsoort import (
+        Energieprestatievergoedingsoort,
+        EnergieprestatievergoedingsoortReferentiedata,
+    )
+    from .externeincassosoort import (
+        Externeincassosoort,
+        ExterneincassosoortReferentiedata,
+    )
+    from .externeincassostatus import (
+        Externeincassostatus,
+        ExterneincassostatusReferentiedata,
+    )
+    from .factuurbetaalwijze import (
+        Factuurbetaalwijze,
+        FactuurbetaalwijzeReferentiedata,
+    )
+    from .factuursoort import (
+        Factuursoort,
+        FactuursoortReferentiedata,
+    )
+    from .gebeurtenissoort import (
+        Gebeurtenissoort,
+        GebeurtenissoortReferentiedata,
+    )
+    from .geometriesoort import (
+        Geometriesoort,
+        GeometriesoortReferentiedata,
+    )
+    from .geslacht import (
+        Geslacht,
+        GeslachtReferentiedata,
+    )
+    from .grootboekmutatieherkomst import (
+        Grootboekmutatieherkomst,
+        GrootboekmutatieherkomstReferentiedata,
+    )
+    from .grootboekrekeningsoort import (
+        Grootboekrekeningsoort,
+        GrootboekrekeningsoortReferentiedata,
+    )
+    from .grootboekrekeningstatus import (
+        Grootboekrekeningstatus,
+        GrootboekrekeningstatusReferentiedata,
+    )
+    from .huurgeschilsoort import (
+        Huurgeschilsoort,
+        HuurgeschilsoortReferentiedata,
+    )
+    from .huurgeschilstatus import (
+        Huurgeschilstatus,
+        HuurgeschilstatusReferentiedata,
+    )
+    from .huurklasse import (
+        Huurklasse,
+        HuurklasseReferentiedata,
+    )
+    from .huuropzeggingstatus import (
+        Huuropzeggingstatus,
+        HuuropzeggingstatusReferentiedata,
+    )
+    from .incassomoment import (
+        Incassomoment,
+        IncassomomentReferentiedata,
+    )
+    from .inexploitatiereden import (
+        Inexploitatiereden,
+        InexploitatieredenReferentiedata,
+    )
+    from .informatieobjectdetailsoort import (
+        Informatieobjectdetailsoort,
+        InformatieobjectdetailsoortReferentiedata,
+    )
+    from .informatieobjectsoort import (
+        Informatieobjectsoort,
+        InformatieobjectsoortReferentiedata,
+    )
+    from .inkomensbron import (
+        Inkomensbron,
+        InkomensbronReferentiedata,
+    )
+    from .inkomenssoort import (
+        Inkomenssoort,
+        InkomenssoortReferentiedata,
+    )
+    from .inkomensverklaringsoort import (
+        Inkomensverklaringsoort,
+        InkomensverklaringsoortReferentiedata,
+    )
+    from .inkoopfactuurstatus import (
+        Inkoopfactuurstatus,
+        InkoopfactuurstatusReferentiedata,
+    )
+    from .inkoopopdrachtregelsoort import (
+        Inkoopopdrachtregelsoort,
+        InkoopopdrachtregelsoortReferentiedata,
+    )
+    from .inschrijvingherkomst import (
+        Inschrijvingherkomst,
+        InschrijvingherkomstReferentiedata,
+    )
+    from .inspectierapportsoort import (
+        Inspectierapportsoort,
+        InspectierapportsoortReferentiedata,
+    )
+    from .inspectierapportstatus import (
+        Inspectierapportstatus,
+        InspectierapportstatusReferentiedata,
+    )
+    from .installatiesoort import (
+        Installatiesoort,
+        InstallatiesoortReferentiedata,
+    )
+    from .kandidaatdetailstatus import (
+        Kandidaatdetailstatus,
+        KandidaatdetailstatusReferentiedata,
+    )
+    from .kandidaatstatus import (
+        Kandidaatstatus,
+        KandidaatstatusReferentiedata,
+    )
+    from .kwaliteitsmetingverzoeksoort import (
+        Kwaliteitsmetingverzoeksoort,
+        KwaliteitsmetingverzoeksoortReferentiedata,
+    )
+    from .kwaliteitsniveau import (
+        Kwaliteitsniveau,
+        KwaliteitsniveauReferentiedata,
+    )
+    from .leningaflosvorm import (
+        Leningaflosvorm,
+        LeningaflosvormReferentiedata,
+    )
+    from .leningdetailsoort import (
+        Leningdetailsoort,
+        LeningdetailsoortReferentiedata,
+    )
+    from .leningsoort import (
+        Leningsoort,
+        LeningsoortReferentiedata,
+    )
+    from .maatschappelijklabel import (
+        Maatschappelijklabel,
+        MaatschappelijklabelReferentiedata,
+    )
+    from .machtigingsoort import (
+        Machtigingsoort,
+        MachtigingsoortReferentiedata,
+    )
+    from .materiaaldetailsoort import (
+        Materiaaldetailsoort,
+        MateriaaldetailsoortReferentiedata,
+    )
+    from .materiaalsoort import (
+        Materiaalsoort,
+        MateriaalsoortReferentiedata,
+    )
+    from .medewerkerbudgetsoort import (
+        Medewerkerbudgetsoort,
+        MedewerkerbudgetsoortReferentiedata,
+    )
+    from .medewerkerrol import (
+        Medewerkerrol,
+        MedewerkerrolReferentiedata,
+    )
+    from .medewerkersoort import (
+        Medewerkersoort,
+        MedewerkersoortReferentiedata,
+    )
+    from .meeteenheid import (
+        Meeteenheid,
+        MeeteenheidReferentiedata,
+    )
+    from .onderhoudsbestedingsoort import (
+        Onderhoudsbestedingsoort,
+        OnderhoudsbestedingsoortReferentiedata,
+    )
+    from .onderhoudslabel import (
+        Onderhoudslabel,
+        OnderhoudslabelReferentiedata,
+    )
+    from .onderhoudsoort import (
+        Onderhoudsoort,
+        OnderhoudsoortReferentiedata,
+    )
+    from .onderhoudsorderstatus import (
+        Onderhoudsorderstatus,
+        OnderhoudsorderstatusReferentiedata,
+    )
+    from .onderhoudspecialisme import (
+        Onderhoudspecialisme,
+        OnderhoudspecialismeReferentiedata,
+    )
+    from .onderhoudstaakdetailstatus import (
+        Onderhoudstaakdetailstatus,
+        OnderhoudstaakdetailstatusReferentiedata,
+    )
+    from .onderhoudstaakstatus import (
+        Onderhoudstaakstatus,
+        OnderhoudstaakstatusReferentiedata,
+    )
+    from .onderhoudsverzoekstatus import (
+        Onderhoudsverzoekstatus,
+        OnderhoudsverzoekstatusReferentiedata,
+    )
+    from .opleidingsniveau import (
+        Opleidingsniveau,
+        OpleidingsniveauReferentiedata,
+    )
+    from .oppervlaktesoort import (
+        Oppervlaktesoort,
+        OppervlaktesoortReferentiedata,
+    )
+    from .opzegtermijn import (
+        Opzegtermijn,
+        OpzegtermijnReferentiedata,
+    )
+    from .organisatievorm import (
+        Organisatievorm,
+        OrganisatievormReferentiedata,
+    )
+    from .overeenkomstdetailsoort import (
+        Overeenkomstdetailsoort,
+        OvereenkomstdetailsoortReferentiedata,
+    )
+    from .overeenkomstkoppelingdetailstatus import (
+        Overeenkomstkoppelingdetailstatus,
+        OvereenkomstkoppelingdetailstatusReferentiedata,
+    )
+    from .overeenkomstkoppelingstatus import (
+        Overeenkomstkoppelingstatus,
+        OvereenkomstkoppelingstatusReferentiedata,
+    )
+    from .overeenkomstsoort import (
+        Overeenkomstsoort,
+        OvereenkomstsoortReferentiedata,
+    )
+    from .overeenkomststatus import (
+        Overeenkomststatus,
+        OvereenkomststatusReferentiedata,
+    )
+    from .pandsoort import (
+        Pandsoort,
+        PandsoortReferentiedata,
+    )
+    from .passendheiddetailsoort import (
+        Passendheiddetailsoort,
+        PassendheiddetailsoortReferentiedata,
+    )
+    from .passendheidssoort import (
+        Passendheidssoort,
+        PassendheidssoortReferentiedata,
+    )
+    from .personelefunctiesoort import (
+        Personelefunctiesoort,
+        PersonelefunctiesoortReferentiedata,
+    )
+    from .prestatieafspraak import (
+        Prestatieafspraak,
+        PrestatieafspraakReferentiedata,
+    )
+    from .prijsaanpassingsoort import (
+        Prijsaanpassingsoort,
+        PrijsaanpassingsoortReferentiedata,
+    )
+    from .prijscomponentdetailsoort import (
+        Prijscomponentdetailsoort,
+        PrijscomponentdetailsoortReferentiedata,
+    )
+    from .prijscomponentsoort import (
+        Prijscomponentsoort,
+        PrijscomponentsoortReferentiedata,
+    )
+    from .prijscomponentsubsidiesoort import (
+        Prijscomponentsubsidiesoort,
+        PrijscomponentsubsidiesoortReferentiedata,
+    )
+    from .prijscomponentwijzigingsreden import (
+        Prijscomponentwijzigingsreden,
+        PrijscomponentwijzigingsredenReferentiedata,
+    )
+    from .projectbudgetregelregelsoort import (
+        Projectbudgetregelregelsoort,
+        ProjectbudgetregelregelsoortReferentiedata,
+    )
+    from .projectbudgetregelsoort import (
+        Projectbudgetregelsoort,
+        ProjectbudgetregelsoortReferentiedata,
+    )
+    from .projectbudgetregelstatus import (
+        Projectbudgetregelstatus,
+        ProjectbudgetregelstatusReferentiedata,
+    )
+    from .projectfasebesluitstatus import (
+        Projectfasebesluitstatus,
+        ProjectfasebesluitstatusReferentiedata,
+    )
+    from .projectsoort import (
+        Projectsoort,
+        ProjectsoortReferentiedata,
+    )
+    from .projectstatus import (
+        Projectstatus,
+        ProjectstatusReferentiedata,
+    )
+    from .provincie import (
+        Provincie,
+        ProvincieReferentiedata,
+    )
+    from .publicatiedetailmodel import (
+        Publicatiedetailmodel,
+        PublicatiedetailmodelReferentiedata,
+    )
+    from .publicatiedetailstatus import (
+        Publicatiedetailstatus,
+        PublicatiedetailstatusReferentiedata,
+    )
+    from .publicatieintakevorm import (
+        Publicatieintakevorm,
+        PublicatieintakevormReferentiedata,
+    )
+    from .publicatiemodel import (
+        Publicatiemodel,
+        PublicatiemodelReferentiedata,
+    )
+    from .publicatiestatus import (
+        Publicatiestatus,
+        PublicatiestatusReferentiedata,
+    )
+    from .puntenberekeningsoort import (
+        Puntenberekeningsoort,
+        PuntenberekeningsoortReferentiedata,
+    )
+    from .puntenmutatiesoort import (
+        Puntenmutatiesoort,
+        PuntenmutatiesoortReferentiedata,
+    )
+    from .reclamatiesoort import (
+        Reclamatiesoort,
+        ReclamatiesoortReferentiedata,
+    )
+    from .reclamatiestatus import (
+        Reclamatiestatus,
+        ReclamatiestatusReferentiedata,
+    )
+    from .redenontbinding import (
+        Redenontbinding,
+        RedenontbindingReferentiedata,
+    )
+    from .redenopzegging import (
+        Redenopzegging,
+        RedenopzeggingReferentiedata,
+    )
+    from .redenvernietiging import (
+        Redenvernietiging,
+        RedenvernietigingReferentiedata,
+    )
+    from .regiesoort import (
+        Regiesoort,
+        RegiesoortReferentiedata,
+    )
+    from .relatieadressoort import (
+        Relatieadressoort,
+        RelatieadressoortReferentiedata,
+    )
+    from .relatiedetailsoort import (
+        Relatiedetailsoort,
+        RelatiedetailsoortReferentiedata,
+    )
+    from .relatierolsoort import (
+        Relatierolsoort,
+        RelatierolsoortReferentiedata,
+    )
+    from .relatiesoort import (
+        Relatiesoort,
+        RelatiesoortReferentiedata,
+    )
+    from .relatiestatus import (
+        Relatiestatus,
+        RelatiestatusReferentiedata,
+    )
+    from .rentesoort import (
+        Rentesoort,
+        RentesoortReferentiedata,
+    )
+    from .ruimtedetailsoort import (
+        Ruimtedetailsoort,
+        RuimtedetailsoortReferentiedata,
+    )
+    from .ruimteligging import (
+        Ruimteligging,
+        RuimteliggingReferentiedata,
+    )
+    from .ruimtesoort import (
+        Ruimtesoort,
+        RuimtesoortReferentiedata,
+    )
+    from .sanctiesoort import (
+        Sanctiesoort,
+        SanctiesoortReferentiedata,
+    )
+    from .sanctiestatus import (
+        Sanctiestatus,
+        SanctiestatusReferentiedata,
+    )
+    from .signaleringdetailsoort import (
+        Signaleringdetailsoort,
+        SignaleringdetailsoortReferentiedata,
+    )
+    from .signaleringsoort import (
+        Signaleringsoort,
+        SignaleringsoortReferentiedata,
+    )
+    from .signaleringstatus import (
+        Signaleringstatus,
+        SignaleringstatusReferentiedata,
+    )
+    from .taal import (
+        Taal,
+        TaalReferentiedata,
+    )
+    from .tijdsbestedingdetailsoort import (
+        Tijdsbestedingdetailsoort,
+        TijdsbestedingdetailsoortReferentiedata,
+    )
+    from .tijdsbestedingsoort import (
+        Tijdsbestedingsoort,
+        TijdsbestedingsoortReferentiedata,
+    )
+    from .tijdseenheid import (
+        Tijdseenheid,
+        TijdseenheidReferentiedata,
+    )
+    from .toegankelijkheidslabel import (
+        Toegankelijkheidslabel,
+        ToegankelijkheidslabelReferentiedata,
+    )
+    from .uitexploitatiereden import (
+        Uitexploitatiereden,
+        UitexploitatieredenReferentiedata,
+    )
+    from .uitvoerendesoort import (
+        Uitvoerendesoort,
+        UitvoerendesoortReferentiedata,
+    )
+    from .vacaturesoort import (
+        Vacaturesoort,
+        VacaturesoortReferentiedata,
+    )
+    from .verantwoordingconsolidatie import (
+        Verantwoordingconsolidatie,
+        VerantwoordingconsolidatieReferentiedata,
+    )
+    from .verantwoordingregime import (
+        Verantwoordingregime,
+        VerantwoordingregimeReferentiedata,
+    )
+    from .verbijzonderingsoort import (
+        Verbijzonderingsoort,
+        VerbijzonderingsoortReferentiedata,
+    )
+    from .verbijzonderingstatus import (
+        Verbijzonderingstatus,
+        VerbijzonderingstatusReferentiedata,
+    )
+    from .verrekeningsoort import (
+        Verrekeningsoort,
+        VerrekeningsoortReferentiedata,
+    )
+    from .vertrouwelijkheid import (
+        Vertrouwelijkheid,
+        VertrouwelijkheidReferentiedata,
+    )
+    from .voorrangdetailsoort import (
+        Voorrangdetailsoort,
+        VoorrangdetailsoortReferentiedata,
+    )
+    from .voorrangsoort import (
+        Voorrangsoort,
+        VoorrangsoortReferentiedata,
+    )
+    from .voorzieningsoort import (
+        Voorzieningsoort,
+        VoorzieningsoortReferentiedata,
+    )
+    from .vragenlijstregelherkomst import (
+        Vragenlijstregelherkomst,
+        VragenlijstregelherkomstReferentiedata,
+    )
+    from .vragenlijstregelonderwerpsoort import (
+        Vragenlijstregelonderwerpsoort,
+        VragenlijstregelonderwerpsoortReferentiedata,
+    )
+    from .woningwaarderingstelsel import (
+        Woningwaarderingstelsel,
+        WoningwaarderingstelselReferentiedata,
+    )
+    from .woningwaarderingstelselgroep import (
+        Woningwaarderingstelselgroep,
+        WoningwaarderingstelselgroepReferentiedata,
+    )
+    from .woonsituatiesoort import (
+        Woonsituatiesoort,
+        WoonsituatiesoortReferentiedata,
+    )
+    from .woonvorm import (
+        Woonvorm,
+        WoonvormReferentiedata,
+    )
+    from .zaakobjectsoort import (
+        Zaakobjectsoort,
+        ZaakobjectsoortReferentiedata,
+    )
+    from .zaakrol import (
+        Zaakrol,
+        ZaakrolReferentiedata,
+    )
+    from .zaakstatussoort import (
+        Zaakstatussoort,
+        ZaakstatussoortReferentiedata,
+    )
+    from .zaaktypedetailsoort import (
+        Zaaktypedetailsoort,
+        ZaaktypedetailsoortReferentiedata,
+    )
+    from .zaaktypesoort import (
+        Zaaktypesoort,
+        ZaaktypesoortReferentiedata,
+    )
+    from .zekerheidverpandingsoort import (
+        Zekerheidverpandingsoort,
+        ZekerheidverpandingsoortReferentiedata,
+    )
+
+_MODULES = {
+    "Aanbiedingdetailstatus": "aanbiedingdetailstatus",
+    "AanbiedingdetailstatusReferentiedata": "aanbiedingdetailstatus",
+    "Aanbiedingstatus": "aanbiedingstatus",
+    "AanbiedingstatusReferentiedata": "aanbiedingstatus",
+    "Aanvullendedoelgroep": "aanvullendedoelgroep",
+    "AanvullendedoelgroepReferentiedata": "aanvullendedoelgroep",
+    "Accountstatus": "accountstatus",
+    "AccountstatusReferentiedata": "accountstatus",
+    "Adressoort": "adressoort",
+    "AdressoortReferentiedata": "adressoort",
+    "Afletterstatus": "afletterstatus",
+    "AfletterstatusReferentiedata": "afletterstatus",
+    "Afrekenwijzesoort": "afrekenwijzesoort",
+    "AfrekenwijzesoortReferentiedata": "afrekenwijzesoort",
+    "Afspraakstatus": "afspraakstatus",
+    "AfspraakstatusReferentiedata": "afspraakstatus",
+    "Afspraakverzoeksoort": "afspraakverzoeksoort",
+    "AfspraakverzoeksoortReferentiedata": "afspraakverzoeksoort",
+    "Afwezigheidsoort": "afwezigheidsoort",
+    "AfwezigheidsoortReferentiedata": "afwezigheidsoort",
+    "Aktesoort": "aktesoort",
+    "AktesoortReferentiedata": "aktesoort",
+    "Authentiekgegevenbron": "authentiekgegevenbron",
+    "AuthentiekgegevenbronReferentiedata": "authentiekgegevenbron",
+    "Authentiekgegevensoort": "authentiekgegevensoort",
+    "AuthentiekgegevensoortReferentiedata": "authentiekgegevensoort",
+    "Authentiekgegevenstatus": "authentiekgegevenstatus",
+    "AuthentiekgegevenstatusReferentiedata": "authentiekgegevenstatus",
+    "Bedrijfsoort": "bedrijfsoort",
+    "BedrijfsoortReferentiedata": "bedrijfsoort",
+    "Begrotingversie": "begrotingversie",
+    "BegrotingversieReferentiedata": "begrotingversie",
+    "Bestemming": "bestemming",
+    "BestemmingReferentiedata": "bestemming",
+    "Betaalgegevensoort": "betaalgegevensoort",
+    "BetaalgegevensoortReferentiedata": "betaalgegevensoort",
+    "Betaalwijzedeelsoort": "betaalwijzedeelsoort",
+    "BetaalwijzedeelsoortReferentiedata": "betaalwijzedeelsoort",
+    "Betaalwijzesoort": "betaalwijzesoort",
+    "BetaalwijzesoortReferentiedata": "betaalwijzesoort",
+    "Betalingsregelingeindereden": "betalingsregelingeindereden",
+    "BetalingsregelingeinderedenReferentiedata": "betalingsregelingeindereden",
+    "Betalingsregelingstatus": "betalingsregelingstatus",
+    "BetalingsregelingstatusReferentiedata": "betalingsregelingstatus",
+    "Boekingdetailsoort": "boekingdetailsoort",
+    "BoekingdetailsoortReferentiedata": "boekingdetailsoort",
+    "Boekingsoort": "boekingsoort",
+    "BoekingsoortReferentiedata": "boekingsoort",
+    "Boekingstatus": "boekingstatus",
+    "BoekingstatusReferentiedata": "boekingstatus",
+    "Boekjaarperiodesoort": "boekjaarperiodesoort",
+    "BoekjaarperiodesoortReferentiedata": "boekjaarperiodesoort",
+    "Boekjaarperiodestatus": "boekjaarperiodestatus",
+    "BoekjaarperiodestatusReferentiedata": "boekjaarperiodestatus",
+    "Boekjaarstatus": "boekjaarstatus",
+    "BoekjaarstatusReferentiedata": "boekjaarstatus",
+    "Bouwkundigelementdetailsoort": "bouwkundigelementdetailsoort",
+    "BouwkundigelementdetailsoortReferentiedata": "bouwkundigelementdetailsoort",
+    "Bouwkundigelementplaatsing": "bouwkundigelementplaatsing",
+    "BouwkundigelementplaatsingReferentiedata": "bouwkundigelementplaatsing",
+    "Bouwkundigelementsoort": "bouwkundigelementsoort",
+    "BouwkundigelementsoortReferentiedata": "bouwkundigelementsoort",
+    "Brandwerendheidscore": "brandwerendheidscore",
+    "BrandwerendheidscoreReferentiedata": "brandwerendheidscore",
+    "Btw": "btw",
+    "BtwReferentiedata": "btw",
+    "Btwaangiftestatus": "btwaangiftestatus",
+    "BtwaangiftestatusReferentiedata": "btwaangiftestatus",
+    "Burgerlijkestaat": "burgerlijkestaat",
+    "BurgerlijkestaatReferentiedata": "burgerlijkestaat",
+    "Clustersoort": "clustersoort",
+    "ClustersoortReferentiedata": "clustersoort",
+    "Collectiefobjectsoort": "collectiefobjectsoort",
+    "CollectiefobjectsoortReferentiedata": "collectiefobjectsoort",
+    "Communicatiekanaal": "communicatiekanaal",
+    "CommunicatiekanaalReferentiedata": "communicatiekanaal",
+    "Communicatierichting": "communicatierichting",
+    "CommunicatierichtingReferentiedata": "communicatierichting",
+    "Communicatievoorkeursoort": "communicatievoorkeursoort",
+    "CommunicatievoorkeursoortReferentiedata": "communicatievoorkeursoort",
+    "Conditiescore": "conditiescore",
+    "ConditiescoreReferentiedata": "conditiescore",
+    "Contactgegevendetailsoort": "contactgegevendetailsoort",
+    "ContactgegevendetailsoortReferentiedata": "contactgegevendetailsoort",
+    "Contactgegevensoort": "contactgegevensoort",
+    "ContactgegevensoortReferentiedata": "contactgegevensoort",
+    "Contactgegevenstatus": "contactgegevenstatus",
+    "ContactgegevenstatusReferentiedata": "contactgegevenstatus",
+    "Contactgegevenvoorkeur": "contactgegevenvoorkeur",
+    "ContactgegevenvoorkeurReferentiedata": "contactgegevenvoorkeur",
+    "Crediteursoort": "crediteursoort",
+    "CrediteursoortReferentiedata": "crediteursoort",
+    "Crediteurstatus": "crediteurstatus",
+    "CrediteurstatusReferentiedata": "crediteurstatus",
+    "Dagdeel": "dagdeel",
+    "DagdeelReferentiedata": "dagdeel",
+    "Debiteursoort": "debiteursoort",
+    "DebiteursoortReferentiedata": "debiteursoort",
+    "Debiteurstatus": "debiteurstatus",
+    "DebiteurstatusReferentiedata": "debiteurstatus",
+    "Defectlocatie": "defectlocatie",
+    "DefectlocatieReferentiedata": "defectlocatie",
+    "Defectoorzaak": "defectoorzaak",
+    "DefectoorzaakReferentiedata": "defectoorzaak",
+    "Defectsoort": "defectsoort",
+    "DefectsoortReferentiedata": "defectsoort",
+    "Defectstatus": "defectstatus",
+    "DefectstatusReferentiedata": "defectstatus",
+    "Doelgroep": "doelgroep",
+    "DoelgroepReferentiedata": "doelgroep",
+    "Eenheidcriteriasoort": "eenheidcriteriasoort",
+    "EenheidcriteriasoortReferentiedata": "eenheidcriteriasoort",
+    "Eenheidcriteriumdetailsoort": "eenheidcriteriumdetailsoort",
+    "EenheidcriteriumdetailsoortReferentiedata": "eenheidcriteriumdetailsoort",
+    "Eenheidcriteriumsoort": "eenheidcriteriumsoort",
+    "EenheidcriteriumsoortReferentiedata": "eenheidcriteriumsoort",
+    "Eenheidcriteriumtoepassing": "eenheidcriteriumtoepassing",
+    "EenheidcriteriumtoepassingReferentiedata": "eenheidcriteriumtoepassing",
+    "Eenheiddetailsoort": "eenheiddetailsoort",
+    "EenheiddetailsoortReferentiedata": "eenheiddetailsoort",
+    "Eenheiddetailstatus": "eenheiddetailstatus",
+    "EenheiddetailstatusReferentiedata": "eenheiddetailstatus",
+    "Eenheidenergievoorziening": "eenheidenergievoorziening",
+    "EenheidenergievoorzieningReferentiedata": "eenheidenergievoorziening",
+    "Eenheidinterieur": "eenheidinterieur",
+    "EenheidinterieurReferentiedata": "eenheidinterieur",
+    "Eenheidisolatie": "eenheidisolatie",
+    "EenheidisolatieReferentiedata": "eenheidisolatie",
+    "Eenheidklimaatbeheersing": "eenheidklimaatbeheersing",
+    "EenheidklimaatbeheersingReferentiedata": "eenheidklimaatbeheersing",
+    "Eenheidklimaatbeheersingsoort": "eenheidklimaatbeheersingsoort",
+    "EenheidklimaatbeheersingsoortReferentiedata": "eenheidklimaatbeheersingsoort",
+    "Eenheidligging": "eenheidligging",
+    "EenheidliggingReferentiedata": "eenheidligging",
+    "Eenheidmonument": "eenheidmonument",
+    "EenheidmonumentReferentiedata": "eenheidmonument",
+    "Eenheidprijsconditie": "eenheidprijsconditie",
+    "EenheidprijsconditieReferentiedata": "eenheidprijsconditie",
+    "Eenheidsanitair": "eenheidsanitair",
+    "EenheidsanitairReferentiedata": "eenheidsanitair",
+    "Eenheidsoort": "eenheidsoort",
+    "EenheidsoortReferentiedata": "eenheidsoort",
+    "Eenheidstatus": "eenheidstatus",
+    "EenheidstatusReferentiedata": "eenheidstatus",
+    "Eindedetailreden": "eindedetailreden",
+    "EindedetailredenReferentiedata": "eindedetailreden",
+    "Eindereden": "eindereden",
+    "EinderedenReferentiedata": "eindereden",
+    "Energielabel": "energielabel",
+    "EnergielabelReferentiedata": "energielabel",
+    "Energieprestatiesoort": "energieprestatiesoort",
+    "EnergieprestatiesoortReferentiedata": "energieprestatiesoort",
+    "Energieprestatiestatus": "energieprestatiestatus",
+    "EnergieprestatiestatusReferentiedata": "energieprestatiestatus",
+    "Energieprestatievergoedingsoort": "energieprestatievergoedingsoort",
+    "EnergieprestatievergoedingsoortReferentiedata": "energieprestatievergoedingsoort",
+    "Externeincassosoort": "externeincassosoort",
+    "ExterneincassosoortReferentiedata": "externeincassosoort",
+    "Externeincassostatus": "externeincassostatus",
+    "ExterneincassostatusReferentiedata": "externeincassostatus",
+    "Factuurbetaalwijze": "factuurbetaalwijze",
+    "FactuurbetaalwijzeReferentiedata": "factuurbetaalwijze",
+    "Factuursoort": "factuursoort",
+    "FactuursoortReferentiedata": "factuursoort",
+    "Gebeurtenissoort": "gebeurtenissoort",
+    "GebeurtenissoortReferentiedata": "gebeurtenissoort",
+    "Geometriesoort": "geometriesoort",
+    "GeometriesoortReferentiedata": "geometriesoort",
+    "Geslacht": "geslacht",
+    "GeslachtReferentiedata": "geslacht",
+    "Grootboekmutatieherkomst": "grootboekmutatieherkomst",
+    "GrootboekmutatieherkomstReferentiedata": "grootboekmutatieherkomst",
+    "Grootboekrekeningsoort": "grootboekrekeningsoort",
+    "GrootboekrekeningsoortReferentiedata": "grootboekrekeningsoort",
+    "Grootboekrekeningstatus": "grootboekrekeningstatus",
+    "GrootboekrekeningstatusReferentiedata": "grootboekrekeningstatus",
+    "Huurgeschilsoort": "huurgeschilsoort",
+    "HuurgeschilsoortReferentiedata": "huurgeschilsoort",
+    "Huurgeschilstatus": "huurgeschilstatus",
+    "HuurgeschilstatusReferentiedata": "huurgeschilstatus",
+    "Huurklasse": "huurklasse",
+    "HuurklasseReferentiedata": "huurklasse",
+    "Huuropzeggingstatus": "huuropzeggingstatus",
+    "HuuropzeggingstatusReferentiedata": "huuropzeggingstatus",
+    "Incassomoment": "incassomoment",
+    "IncassomomentReferentiedata": "incassomoment",
+    "Inexploitatiereden": "inexploitatiereden",
+    "InexploitatieredenReferentiedata": "inexploitatiereden",
+    "Informatieobjectdetailsoort": "informatieobjectdetailsoort",
+    "InformatieobjectdetailsoortReferentiedata": "informatieobjectdetailsoort",
+    "Informatieobjectsoort": "informatieobjectsoort",
+    "InformatieobjectsoortReferentiedata": "informatieobjectsoort",
+    "Inkomensbron": "inkomensbron",
+    "InkomensbronReferentiedata": "inkomensbron",
+    "Inkomenssoort": "inkomenssoort",
+    "InkomenssoortReferentiedata": "inkomenssoort",
+    "Inkomensverklaringsoort": "inkomensverklaringsoort",
+    "InkomensverklaringsoortReferentiedata": "inkomensverklaringsoort",
+    "Inkoopfactuurstatus": "inkoopfactuurstatus",
+    "InkoopfactuurstatusReferentiedata": "inkoopfactuurstatus",
+    "Inkoopopdrachtregelsoort": "inkoopopdrachtregelsoort",
+    "InkoopopdrachtregelsoortReferentiedata": "inkoopopdrachtregelsoort",
+    "Inschrijvingherkomst": "inschrijvingherkomst",
+    "InschrijvingherkomstReferentiedata": "inschrijvingherkomst",
+    "Inspectierapportsoort": "inspectierapportsoort",
+    "InspectierapportsoortReferentiedata": "inspectierapportsoort",
+    "Inspectierapportstatus": "inspectierapportstatus",
+    "InspectierapportstatusReferentiedata": "inspectierapportstatus",
+    "Installatiesoort": "installatiesoort",
+    "InstallatiesoortReferentiedata": "installatiesoort",
+    "Kandidaatdetailstatus": "kandidaatdetailstatus",
+    "KandidaatdetailstatusReferentiedata": "kandidaatdetailstatus",
+    "Kandidaatstatus": "kandidaatstatus",
+    "KandidaatstatusReferentiedata": "kandidaatstatus",
+    "Kwaliteitsmetingverzoeksoort": "kwaliteitsmetingverzoeksoort",
+    "KwaliteitsmetingverzoeksoortReferentiedata": "kwaliteitsmetingverzoeksoort",
+    "Kwaliteitsniveau": "kwaliteitsniveau",
+    "KwaliteitsniveauReferentiedata": "kwaliteitsniveau",
+    "Leningaflosvorm": "leningaflosvorm",
+    "LeningaflosvormReferentiedata": "leningaflosvorm",
+    "Leningdetailsoort": "leningdetailsoort",
+    "LeningdetailsoortReferentiedata": "leningdetailsoort",
+    "Leningsoort": "leningsoort",
+    "LeningsoortReferentiedata": "leningsoort",
+    "Maatschappelijklabel": "maatschappelijklabel",
+    "MaatschappelijklabelReferentiedata": "maatschappelijklabel",
+    "Machtigingsoort": "machtigingsoort",
+    "MachtigingsoortReferentiedata": "machtigingsoort",
+    "Materiaaldetailsoort": "materiaaldetailsoort",
+    "MateriaaldetailsoortReferentiedata": "materiaaldetailsoort",
+    "Materiaalsoort": "materiaalsoort",
+    "MateriaalsoortReferentiedata": "materiaalsoort",
+    "Medewerkerbudgetsoort": "medewerkerbudgetsoort",
+    "MedewerkerbudgetsoortReferentiedata": "medewerkerbudgetsoort",
+    "Medewerkerrol": "medewerkerrol",
+    "MedewerkerrolReferentiedata": "medewerkerrol",
+    "Medewerkersoort": "medewerkersoort",
+    "MedewerkersoortReferentiedata": "medewerkersoort",
+    "Meeteenheid": "meeteenheid",
+    "MeeteenheidReferentiedata": "meeteenheid",
+    "Onderhoudsbestedingsoort": "onderhoudsbestedingsoort",
+    "OnderhoudsbestedingsoortReferentiedata": "onderhoudsbestedingsoort",
+    "Onderhoudslabel": "onderhoudslabel",
+    "OnderhoudslabelReferentiedata": "onderhoudslabel",
+    "Onderhoudsoort": "onderhoudsoort",
+    "OnderhoudsoortReferentiedata": "onderhoudsoort",
+    "Onderhoudsorderstatus": "onderhoudsorderstatus",
+    "OnderhoudsorderstatusReferentiedata": "onderhoudsorderstatus",
+    "Onderhoudspecialisme": "onderhoudspecialisme",
+    "OnderhoudspecialismeReferentiedata": "onderhoudspecialisme",
+    "Onderhoudstaakdetailstatus": "onderhoudstaakdetailstatus",
+    "OnderhoudstaakdetailstatusReferentiedata": "onderhoudstaakdetailstatus",
+    "Onderhoudstaakstatus": "onderhoudstaakstatus",
+    "OnderhoudstaakstatusReferentiedata": "onderhoudstaakstatus",
+    "Onderhoudsverzoekstatus": "onderhoudsverzoekstatus",
+    "OnderhoudsverzoekstatusReferentiedata": "onderhoudsverzoekstatus",
+    "Opleidingsniveau": "opleidingsniveau",
+    "OpleidingsniveauReferentiedata": "opleidingsniveau",
+    "Oppervlaktesoort": "oppervlaktesoort",
+    "OppervlaktesoortReferentiedata": "oppervlaktesoort",
+    "Opzegtermijn": "opzegtermijn",
+    "OpzegtermijnReferentiedata": "opzegtermijn",
+    "Organisatievorm": "organisatievorm",
+    "OrganisatievormReferentiedata": "organisatievorm",
+    "Overeenkomstdetailsoort": "overeenkomstdetailsoort",
+    "OvereenkomstdetailsoortReferentiedata": "overeenkomstdetailsoort",
+    "Overeenkomstkoppelingdetailstatus": "overeenkomstkoppelingdetailstatus",
+    "OvereenkomstkoppelingdetailstatusReferentiedata": "overeenkomstkoppelingdetailstatus",
+    "Overeenkomstkoppelingstatus": "overeenkomstkoppelingstatus",
+    "OvereenkomstkoppelingstatusReferentiedata": "overeenkomstkoppelingstatus",
+    "Overeenkomstsoort": "overeenkomstsoort",
+    "OvereenkomstsoortReferentiedata": "overeenkomstsoort",
+    "Overeenkomststatus": "overeenkomststatus",
+    "OvereenkomststatusReferentiedata": "overeenkomststatus",
+    "Pandsoort": "pandsoort",
+    "PandsoortReferentiedata": "pandsoort",
+    "Passendheiddetailsoort": "passendheiddetailsoort",
+    "PassendheiddetailsoortReferentiedata": "passendheiddetailsoort",
+    "Passendheidssoort": "passendheidssoort",
+    "PassendheidssoortReferentiedata": "passendheidssoort",
+    "Personelefunctiesoort": "personelefunctiesoort",
+    "PersonelefunctiesoortReferentiedata": "personelefunctiesoort",
+    "Prestatieafspraak": "prestatieafspraak",
+    "PrestatieafspraakReferentiedata": "prestatieafspraak",
+    "Prijsaanpassingsoort": "prijsaanpassingsoort",
+    "PrijsaanpassingsoortReferentiedata": "prijsaanpassingsoort",
+    "Prijscomponentdetailsoort": "prijscomponentdetailsoort",
+    "PrijscomponentdetailsoortReferentiedata": "prijscomponentdetailsoort",
+    "Prijscomponentsoort": "prijscomponentsoort",
+    "PrijscomponentsoortReferentiedata": "prijscomponentsoort",
+    "Prijscomponentsubsidiesoort": "prijscomponentsubsidiesoort",
+    "PrijscomponentsubsidiesoortReferentiedata": "prijscomponentsubsidiesoort",
+    "Prijscomponentwijzigingsreden": "prijscomponentwijzigingsreden",
+    "PrijscomponentwijzigingsredenReferentiedata": "prijscomponentwijzigingsreden",
+    "Projectbudgetregelregelsoort": "projectbudgetregelregelsoort",
+    "ProjectbudgetregelregelsoortReferentiedata": "projectbudgetregelregelsoort",
+    "Projectbudgetregelsoort": "projectbudgetregelsoort",
+    "ProjectbudgetregelsoortReferentiedata": "projectbudgetregelsoort",
+    "Projectbudgetregelstatus": "projectbudgetregelstatus",
+    "ProjectbudgetregelstatusReferentiedata": "projectbudgetregelstatus",
+    "Projectfasebesluitstatus": "projectfasebesluitstatus",
+    "ProjectfasebesluitstatusReferentiedata": "projectfasebesluitstatus",
+    "Projectsoort": "projectsoort",
+    "ProjectsoortReferentiedata": "projectsoort",
+    "Projectstatus": "projectstatus",
+    "ProjectstatusReferentiedata": "projectstatus",
+    "Provincie": "provincie",
+    "ProvincieReferentiedata": "provincie",
+    "Publicatiedetailmodel": "publicatiedetailmodel",
+    "PublicatiedetailmodelReferentiedata": "publicatiedetailmodel",
+    "Publicatiedetailstatus": "publicatiedetailstatus",
+    "PublicatiedetailstatusReferentiedata": "publicatiedetailstatus",
+    "Publicatieintakevorm": "publicatieintakevorm",
+    "PublicatieintakevormReferentiedata": "publicatieintakevorm",
+    "Publicatiemodel": "publicatiemodel",
+    "PublicatiemodelReferentiedata": "publicatiemodel",
+    "Publicatiestatus": "publicatiestatus",
+    "PublicatiestatusReferentiedata": "publicatiestatus",
+    "Puntenberekeningsoort": "puntenberekeningsoort",
+    "PuntenberekeningsoortReferentiedata": "puntenberekeningsoort",
+    "Puntenmutatiesoort": "puntenmutatiesoort",
+    "PuntenmutatiesoortReferentiedata": "puntenmutatiesoort",
+    "Reclamatiesoort": "reclamatiesoort",
+    "ReclamatiesoortReferentiedata": "reclamatiesoort",
+    "Reclamatiestatus": "reclamatiestatus",
+    "ReclamatiestatusReferentiedata": "reclamatiestatus",
+    "Redenontbinding": "redenontbinding",
+    "RedenontbindingReferentiedata": "redenontbinding",
+    "Redenopzegging": "redenopzegging",
+    "RedenopzeggingReferentiedata": "redenopzegging",
+    "Redenvernietiging": "redenvernietiging",
+    "RedenvernietigingReferentiedata": "redenvernietiging",
+    "Regiesoort": "regiesoort",
+    "RegiesoortReferentiedata": "regiesoort",
+    "Relatieadressoort": "relatieadressoort",
+    "RelatieadressoortReferentiedata": "relatieadressoort",
+    "Relatiedetailsoort": "relatiedetailsoort",
+    "RelatiedetailsoortReferentiedata": "relatiedetailsoort",
+    "Relatierolsoort": "relatierolsoort",
+    "RelatierolsoortReferentiedata": "relatierolsoort",
+    "Relatiesoort": "relatiesoort",
+    "RelatiesoortReferentiedata": "relatiesoort",
+    "Relatiestatus": "relatiestatus",
+    "RelatiestatusReferentiedata": "relatiestatus",
+    "Rentesoort": "rentesoort",
+    "RentesoortReferentiedata": "rentesoort",
+    "Ruimtedetailsoort": "ruimtedetailsoort",
+    "RuimtedetailsoortReferentiedata": "ruimtedetailsoort",
+    "Ruimteligging": "ruimteligging",
+    "RuimteliggingReferentiedata": "ruimteligging",
+    "Ruimtesoort": "ruimtesoort",
+    "RuimtesoortReferentiedata": "ruimtesoort",
+    "Sanctiesoort": "sanctiesoort",
+    "SanctiesoortReferentiedata": "sanctiesoort",
+    "Sanctiestatus": "sanctiestatus",
+    "SanctiestatusReferentiedata": "sanctiestatus",
+    "Signaleringdetailsoort": "signaleringdetailsoort",
+    "SignaleringdetailsoortReferentiedata": "signaleringdetailsoort",
+    "Signaleringsoort": "signaleringsoort",
+    "SignaleringsoortReferentiedata": "signaleringsoort",
+    "Signaleringstatus": "signaleringstatus",
+    "SignaleringstatusReferentiedata": "signaleringstatus",
+    "Taal": "taal",
+    "TaalReferentiedata": "taal",
+    "Tijdsbestedingdetailsoort": "tijdsbestedingdetailsoort",
+    "TijdsbestedingdetailsoortReferentiedata": "tijdsbestedingdetailsoort",
+    "Tijdsbestedingsoort": "tijdsbestedingsoort",
+    "TijdsbestedingsoortReferentiedata": "tijdsbestedingsoort",
+    "Tijdseenheid": "tijdseenheid",
+    "TijdseenheidReferentiedata": "tijdseenheid",
+    "Toegankelijkheidslabel": "toegankelijkheidslabel",
+    "ToegankelijkheidslabelReferentiedata": "toegankelijkheidslabel",
+    "Uitexploitatiereden": "uitexploitatiereden",
+    "UitexploitatieredenReferentiedata": "uitexploitatiereden",
+    "Uitvoerendesoort": "uitvoerendesoort",
+    "UitvoerendesoortReferentiedata": "uitvoerendesoort",
+    "Vacaturesoort": "vacaturesoort",
+    "VacaturesoortReferentiedata": "vacaturesoort",
+    "Verantwoordingconsolidatie": "verantwoordingconsolidatie",
+    "VerantwoordingconsolidatieReferentiedata": "verantwoordingconsolidatie",
+    "Verantwoordingregime": "verantwoordingregime",
+    "VerantwoordingregimeReferentiedata": "verantwoordingregime",
+    "Verbijzonderingsoort": "verbijzonderingsoort",
+    "VerbijzonderingsoortReferentiedata": "verbijzonderingsoort",
+    "Verbijzonderingstatus": "verbijzonderingstatus",
+    "VerbijzonderingstatusReferentiedata": "verbijzonderingstatus",
+    "Verrekeningsoort": "verrekeningsoort",
+    "VerrekeningsoortReferentiedata": "verrekeningsoort",
+    "Vertrouwelijkheid": "vertrouwelijkheid",
+    "VertrouwelijkheidReferentiedata": "vertrouwelijkheid",
+    "Voorrangdetailsoort": "voorrangdetailsoort",
+    "VoorrangdetailsoortReferentiedata": "voorrangdetailsoort",
+    "Voorrangsoort": "voorrangsoort",
+    "VoorrangsoortReferentiedata": "voorrangsoort",
+    "Voorzieningsoort": "voorzieningsoort",
+    "VoorzieningsoortReferentiedata": "voorzieningsoort",
+    "Vragenlijstregelherkomst": "vragenlijstregelherkomst",
+    "VragenlijstregelherkomstReferentiedata": "vragenlijstregelherkomst",
+    "Vragenlijstregelonderwerpsoort": "vragenlijstregelonderwerpsoort",
+    "VragenlijstregelonderwerpsoortReferentiedata": "vragenlijstregelonderwerpsoort",
+    "Woningwaarderingstelsel": "woningwaarderingstelsel",
+    "WoningwaarderingstelselReferentiedata": "woningwaarderingstelsel",
+    "Woningwaarderingstelselgroep": "woningwaarderingstelselgroep",
+    "WoningwaarderingstelselgroepReferentiedata": "woningwaarderingstelselgroep",
+    "Woonsituatiesoort": "woonsituatiesoort",
+    "WoonsituatiesoortReferentiedata": "woonsituatiesoort",
+    "Woonvorm": "woonvorm",
+    "WoonvormReferentiedata": "woonvorm",
+    "Zaakobjectsoort": "zaakobjectsoort",
+    "ZaakobjectsoortReferentiedata": "zaakobjectsoort",
+    "Zaakrol": "zaakrol",
+    "ZaakrolReferentiedata": "zaakrol",
+    "Zaakstatussoort": "zaakstatussoort",
+    "ZaakstatussoortReferentiedata": "zaakstatussoort",
+    "Zaaktypedetailsoort": "zaaktypedetailsoort",
+    "ZaaktypedetailsoortReferentiedata": "zaaktypedetailsoort",
+    "Zaaktypesoort": "zaaktypesoort",
+    "ZaaktypesoortReferentiedata": "zaaktypesoort",
+    "Zekerheidverpandingsoort": "zekerheidverpandingsoort",
+    "ZekerheidverpandingsoortReferentiedata": "zekerheidverpandingsoort",
+}
+"""De module waarin elke referentiedatasoort wordt gedefinieerd."""
+
+
+# De referentiedatasoorten worden pas bij het eerste gebruik geïmporteerd, zodat
+# `import woningwaardering` alleen de soorten laadt die de waardering gebruikt.
+def __getattr__(name: str) -> Any:
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_MODULES})
+
 
 __all__ = [
     "Aanbiedingdetailstatus",
@@ -10,7 +10,7 @@ class AanbiedingdetailstatusReferentiedata(Referentiedata):
 
 
 class Aanbiedingdetailstatus(Referentiedatasoort):
-    andere_woning_geaccepteerd = AanbiedingdetailstatusReferentiedata(
+    andere_woning_geaccepteerd = AanbiedingdetailstatusReferentiedata.model_construct(
         code="AND",
         naam="Andere woning geaccepteerd",
         parent=Aanbiedingstatus.ingetrokken,
@@ -20,7 +20,7 @@ class Aanbiedingdetailstatus(Referentiedatasoort):
     geaccepteerd.
     """
 
-    anderen_krijgen_voorrang = AanbiedingdetailstatusReferentiedata(
+    anderen_krijgen_voorrang = AanbiedingdetailstatusReferentiedata.model_construct(
         code="ANV",
         naam="Anderen krijgen voorrang",
         parent=Aanbiedingstatus.geweigerd,
@@ -31,7 +31,7 @@ class Aanbiedingdetailstatus(Referentiedatasoort):
     sociaal-economische kenmerken. Conform Artikel 9 (WBMGP).
     """
 
-    buitenruimte_bevalt_niet = AanbiedingdetailstatusReferentiedata(
+    buitenruimte_bevalt_niet = AanbiedingdetailstatusReferentiedata.model_construct(
         code="BUI",
         naam="Buitenruimte bevalt niet",
         parent=Aanbiedingstatus.geweigerd,
@@ -41,7 +41,7 @@ class Aanbiedingdetailstatus(Referentiedatasoort):
     voldoet.
     """
 
-    cooptatie_mislukt = AanbiedingdetailstatusReferentiedata(
+    cooptatie_mislukt = AanbiedingdetailstatusReferentiedata.model_construct(
         code="COO",
         naam="Cooptatie mislukt",
         parent=Aanbiedingstatus.ingetrokken,
@@ -51,7 +51,7 @@ class Aanbiedingdetailstatus(Referentiedatasoort):
     selectieprocedure van de zittende bewoners op basis van het recht van coöptatie.
     """
 
-    documenten_niet_aangeleverd = AanbiedingdetailstatusReferentiedata(
+    documenten_niet_aangeleverd = AanbiedingdetailstatusReferentiedata.model_construct(
         code="DOC",
         naam="Documenten niet aangeleverd",
         parent=Aanbiedingstatus.ingetrokken,
@@ -61,7 +61,7 @@ class Aanbiedingdetailstatus(Referentiedatasoort):
     aangeleverd.
     """
 
-    documenten_niet_akkoord = AanbiedingdetailstatusReferentiedata(
+    documenten_niet_akkoord = AanbiedingdetailstatusReferentiedata.model_construct(
         code="DON",
         naam="Documenten niet akkoord",
         parent=Aanbiedingstatus.ingetrokken,
@@ -71,7 +71,7 @@ class Aanbiedingdetailstatus(Referentiedatasoort):
     niet voldoen.
     """
 
-    geen_belangstelling_meer = AanbiedingdetailstatusReferentiedata(
+    geen_belangstelling_meer = AanbiedingdetailstatusReferentiedata.model_construct(
         code="GEE",
         naam="Geen belangstelling meer",
         parent=Aanbiedingstatus.geweigerd,
@@ -81,7 +81,7 @@ class Aanbiedingdetailstatus(Referentiedatasoort):
     belangstelling meer heeft.
     """
 
-    gegevens_onjuist = AanbiedingdetailstatusReferentiedata(
+    gegevens_onjuist = AanbiedingdetailstatusReferentiedata.model_construct(
         code="GEG",
         naam="Gegevens onjuist",
         parent=Aanbiedingstatus.ingetrokken,
@@ -91,10 +91,12 @@ class Aanbiedingdetailstatus(Referentiedatasoort):
     niet voldoen.
     """
 
-    geen_recht_op_huisvestingsvergunning = AanbiedingdetailstatusReferentiedata(
-        code="GER",
-        naam="Geen recht op huisvestingsvergunning",
-        parent=Aanbiedingstatus.geweigerd,
+    geen_recht_op_huisvestingsvergunning = (
+        AanbiedingdetailstatusReferentiedata.model_construct(
+            code="GER",
+            naam="Geen recht op huisvestingsvergunning",
+            parent=Aanbiedingstatus.geweigerd,
+        )
     )
     """
     De huisvestingsvergoeding is niet verleend door een gegrond vermoeden dat het
@@ -104,7 +106,7 @@ class Aanbiedingdetailstatus(Referentiedatasoort):
     Conform artikel 10 (WBMGP).
     """
 
-    huurprijs_te_hoog = AanbiedingdetailstatusReferentiedata(
+    huurprijs_te_hoog = AanbiedingdetailstatusReferentiedata.model_construct(
         code="HUU",
         naam="Huurprijs te hoog",
         parent=Aanbiedingstatus.geweigerd,
@@ -113,7 +115,7 @@ class Aanbiedingdetailstatus(Referentiedatasoort):
     Een aanbieding is geweigerd, met als aangegeven reden dat de huurprijs te hoog is.
     """
 
-    inkomen_te_hoog = AanbiedingdetailstatusReferentiedata(
+    inkomen_te_hoog = AanbiedingdetailstatusReferentiedata.model_construct(
         code="INH",
         naam="Inkomen te hoog",
         parent=Aanbiedingstatus.ingetrokken,
@@ -123,7 +125,7 @@ class Aanbiedingdetailstatus(Referentiedatasoort):
     is vastgesteld dat het inkomen van de kandidaat te hoog is.
     """
 
-    inkomen_te_laag = AanbiedingdetailstatusReferentiedata(
+    inkomen_te_laag = AanbiedingdetailstatusReferentiedata.model_construct(
         code="INL",
         naam="Inkomen te laag",
         parent=Aanbiedingstatus.ingetrokken,
@@ -133,7 +135,7 @@ class Aanbiedingdetailstatus(Referentiedatasoort):
     is vastgesteld dat het inkomen van de kandidaat te laag is.
     """
 
-    niet_verschenen_bij_afspraak = AanbiedingdetailstatusReferentiedata(
+    niet_verschenen_bij_afspraak = AanbiedingdetailstatusReferentiedata.model_construct(
         code="NIE",
         naam="Niet verschenen bij afspraak",
         parent=Aanbiedingstatus.ingetrokken,
@@ -143,7 +145,7 @@ class Aanbiedingdetailstatus(Referentiedatasoort):
     afspraak.
     """
 
-    ongeschikt_als_huurder = AanbiedingdetailstatusReferentiedata(
+    ongeschikt_als_huurder = AanbiedingdetailstatusReferentiedata.model_construct(
         code="ONG",
         naam="Ongeschikt als huurder",
         parent=Aanbiedingstatus.ingetrokken,
@@ -153,7 +155,7 @@ class Aanbiedingdetailstatus(Referentiedatasoort):
     huurder.
     """
 
-    onterecht_aangeboden = AanbiedingdetailstatusReferentiedata(
+    onterecht_aangeboden = AanbiedingdetailstatusReferentiedata.model_construct(
         code="ONT",
         naam="Onterecht aangeboden",
         parent=Aanbiedingstatus.ingetrokken,
@@ -162,17 +164,19 @@ class Aanbiedingdetailstatus(Referentiedatasoort):
     Een aanbieding is ingetrokken, omdat de eenheid ten onrechte is aangeboden.
     """
 
-    parkeer_bergingruimte_onvoldoende = AanbiedingdetailstatusReferentiedata(
-        code="PAO",
-        naam="Parkeer, bergingruimte onvoldoende",
-        parent=Aanbiedingstatus.geweigerd,
+    parkeer_bergingruimte_onvoldoende = (
+        AanbiedingdetailstatusReferentiedata.model_construct(
+            code="PAO",
+            naam="Parkeer, bergingruimte onvoldoende",
+            parent=Aanbiedingstatus.geweigerd,
+        )
     )
     """
     Een aanbieding is geweigerd, met als aangegeven reden dat de parkeer en/of
     bergruimte niet voldoet.
     """
 
-    persoonlijke_omstandigheden = AanbiedingdetailstatusReferentiedata(
+    persoonlijke_omstandigheden = AanbiedingdetailstatusReferentiedata.model_construct(
         code="PER",
         naam="Persoonlijke omstandigheden",
         parent=Aanbiedingstatus.geweigerd,
@@ -181,7 +185,7 @@ class Aanbiedingdetailstatus(Referentiedatasoort):
     Een aanbieding is geweigerd, met als aangegeven reden persoonlijke omstandigheden.
     """
 
-    reactietermijn_verlopen = AanbiedingdetailstatusReferentiedata(
+    reactietermijn_verlopen = AanbiedingdetailstatusReferentiedata.model_construct(
         code="REA",
         naam="Reactietermijn verlopen",
         parent=Aanbiedingstatus.ingetrokken,
@@ -191,7 +195,7 @@ class Aanbiedingdetailstatus(Referentiedatasoort):
     heeft gereageerd.
     """
 
-    toewijzing_andere_kandidaat = AanbiedingdetailstatusReferentiedata(
+    toewijzing_andere_kandidaat = AanbiedingdetailstatusReferentiedata.model_construct(
         code="TOE",
         naam="Toewijzing andere kandidaat",
         parent=Aanbiedingstatus.ingetrokken,
@@ -201,7 +205,7 @@ class Aanbiedingdetailstatus(Referentiedatasoort):
     kandidaat.
     """
 
-    woning_bevalt_niet = AanbiedingdetailstatusReferentiedata(
+    woning_bevalt_niet = AanbiedingdetailstatusReferentiedata.model_construct(
         code="WBN",
         naam="Woning bevalt niet",
         parent=Aanbiedingstatus.geweigerd,
@@ -210,7 +214,7 @@ class Aanbiedingdetailstatus(Referentiedatasoort):
     Een aanbieding is geweigerd, met als aangegeven reden dat de woning niet voldoet.
     """
 
-    woningkwaliteit_bevalt_niet = AanbiedingdetailstatusReferentiedata(
+    woningkwaliteit_bevalt_niet = AanbiedingdetailstatusReferentiedata.model_construct(
         code="WKN",
         naam="Woningkwaliteit bevalt niet",
         parent=Aanbiedingstatus.geweigerd,
@@ -220,7 +224,7 @@ class Aanbiedingdetailstatus(Referentiedatasoort):
     niet voldoet.
     """
 
-    woonomgeving_bevalt_niet = AanbiedingdetailstatusReferentiedata(
+    woonomgeving_bevalt_niet = AanbiedingdetailstatusReferentiedata.model_construct(
         code="WOB",
         naam="Woonomgeving bevalt niet",
         parent=Aanbiedingstatus.geweigerd,
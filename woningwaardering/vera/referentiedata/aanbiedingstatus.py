@@ -7,7 +7,7 @@ class AanbiedingstatusReferentiedata(Referentiedata):
 
 
 class Aanbiedingstatus(Referentiedatasoort):
-    aangeboden = AanbiedingstatusReferentiedata(
+    aangeboden = AanbiedingstatusReferentiedata.model_construct(
         code="AAN",
         naam="Aangeboden",
     )
@@ -15,7 +15,7 @@ class Aanbiedingstatus(Referentiedatasoort):
     Er is aanbieding gedaan aan een of meer kandidaten.
     """
 
-    geweigerd = AanbiedingstatusReferentiedata(
+    geweigerd = AanbiedingstatusReferentiedata.model_construct(
         code="GEW",
         naam="Geweigerd",
     )
@@ -23,7 +23,7 @@ class Aanbiedingstatus(Referentiedatasoort):
     Een kandidaat heeft een verstrekte aanbieding afgewezen.
     """
 
-    ingetrokken = AanbiedingstatusReferentiedata(
+    ingetrokken = AanbiedingstatusReferentiedata.model_construct(
         code="ING",
         naam="Ingetrokken",
     )
@@ -31,7 +31,7 @@ class Aanbiedingstatus(Referentiedatasoort):
     Een aan een kandidaat verstrekte aanbieding is ingetrokken.
     """
 
-    toegewezen = AanbiedingstatusReferentiedata(
+    toegewezen = AanbiedingstatusReferentiedata.model_construct(
         code="TOE",
         naam="Toegewezen",
     )
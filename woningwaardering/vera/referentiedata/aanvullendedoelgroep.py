@@ -10,7 +10,7 @@ class AanvullendedoelgroepReferentiedata(Referentiedata):
 
 
 class Aanvullendedoelgroep(Referentiedatasoort):
-    buitenlandse_studenten = AanvullendedoelgroepReferentiedata(
+    buitenlandse_studenten = AanvullendedoelgroepReferentiedata.model_construct(
         code="BSTU",
         naam="Buitenlandse studenten",
         parent=Doelgroep.studenten,
@@ -20,7 +20,7 @@ class Aanvullendedoelgroep(Referentiedatasoort):
     student aan een instelling voor hoger of wetenschappelijk onderwijs
     """
 
-    ex_dak_en_thuislozen = AanvullendedoelgroepReferentiedata(
+    ex_dak_en_thuislozen = AanvullendedoelgroepReferentiedata.model_construct(
         code="DAK",
         naam="ex-dak- en thuislozen",
     )
@@ -30,7 +30,7 @@ class Aanvullendedoelgroep(Referentiedatasoort):
     """
 
     personen_met_een_geringe_ergonomische_beperking = (
-        AanvullendedoelgroepReferentiedata(
+        AanvullendedoelgroepReferentiedata.model_construct(
             code="GEB",
             naam="Personen met een Geringe Ergonomische Beperking",
         )
@@ -40,7 +40,7 @@ class Aanvullendedoelgroep(Referentiedatasoort):
     GEB-woningen genoemd.
     """
 
-    ex_gedetineerden = AanvullendedoelgroepReferentiedata(
+    ex_gedetineerden = AanvullendedoelgroepReferentiedata.model_construct(
         code="GED",
         naam="ex-gedetineerden",
     )
@@ -49,7 +49,7 @@ class Aanvullendedoelgroep(Referentiedatasoort):
     (behoefte aan) begeleiding.
     """
 
-    ggz_patienten = AanvullendedoelgroepReferentiedata(
+    ggz_patienten = AanvullendedoelgroepReferentiedata.model_construct(
         code="GGZ",
         naam="GGZ-Patiënten",
     )
@@ -58,7 +58,7 @@ class Aanvullendedoelgroep(Referentiedatasoort):
     bij en/of begeleid door een GGZ instelling.
     """
 
-    kunstenaars = AanvullendedoelgroepReferentiedata(
+    kunstenaars = AanvullendedoelgroepReferentiedata.model_construct(
         code="KUN",
         naam="Kunstenaars",
     )
@@ -68,7 +68,7 @@ class Aanvullendedoelgroep(Referentiedatasoort):
     beschikbaar).
     """
 
-    lichamelijk_beperkten = AanvullendedoelgroepReferentiedata(
+    lichamelijk_beperkten = AanvullendedoelgroepReferentiedata.model_construct(
         code="LIC",
         naam="Lichamelijk beperkten",
     )
@@ -77,7 +77,7 @@ class Aanvullendedoelgroep(Referentiedatasoort):
     (motorisch, zintuigelijk en/of chronisch fysiologisch van aard).
     """
 
-    psychiatrische_patienten = AanvullendedoelgroepReferentiedata(
+    psychiatrische_patienten = AanvullendedoelgroepReferentiedata.model_construct(
         code="PSY",
         naam="(ex-) psychiatrische patiënten",
     )
@@ -86,7 +86,7 @@ class Aanvullendedoelgroep(Referentiedatasoort):
     eventueel met (behoefte aan) begeleiding.
     """
 
-    skaeve_huse = AanvullendedoelgroepReferentiedata(
+    skaeve_huse = AanvullendedoelgroepReferentiedata.model_construct(
         code="SKA",
         naam="Skaeve Huse",
     )
@@ -95,7 +95,7 @@ class Aanvullendedoelgroep(Referentiedatasoort):
     Dit zijn bijvoorbeeld moeilijk te huisvesten drank- of drugsverslaafden.
     """
 
-    statushouders = AanvullendedoelgroepReferentiedata(
+    statushouders = AanvullendedoelgroepReferentiedata.model_construct(
         code="STH",
         naam="Statushouders",
     )
@@ -104,7 +104,7 @@ class Aanvullendedoelgroep(Referentiedatasoort):
     (statushouder of vergunninghouder)
     """
 
-    verstandelijk_beperkten = AanvullendedoelgroepReferentiedata(
+    verstandelijk_beperkten = AanvullendedoelgroepReferentiedata.model_construct(
         code="VBE",
         naam="Verstandelijk beperkten",
     )
@@ -112,7 +112,7 @@ class Aanvullendedoelgroep(Referentiedatasoort):
     Woonuimte is bestemd voor en/of huurder heeft een verstandelijke beperking.
     """
 
-    verslaafden = AanvullendedoelgroepReferentiedata(
+    verslaafden = AanvullendedoelgroepReferentiedata.model_construct(
         code="VER",
         naam="(ex)-verslaafden",
     )
@@ -121,7 +121,7 @@ class Aanvullendedoelgroep(Referentiedatasoort):
     (behoefte aan) begeleiding.
     """
 
-    zorgindicatie = AanvullendedoelgroepReferentiedata(
+    zorgindicatie = AanvullendedoelgroepReferentiedata.model_construct(
         code="ZIN",
         naam="Zorgindicatie",
     )
@@ -7,7 +7,7 @@ class AccountstatusReferentiedata(Referentiedata):
 
 
 class Accountstatus(Referentiedatasoort):
-    beeindigd = AccountstatusReferentiedata(
+    beeindigd = AccountstatusReferentiedata.model_construct(
         code="BEE",
         naam="Beëindigd",
     )
@@ -15,7 +15,7 @@ class Accountstatus(Referentiedatasoort):
     Het account is beeïndigd.
     """
 
-    geactiveerd = AccountstatusReferentiedata(
+    geactiveerd = AccountstatusReferentiedata.model_construct(
         code="GEA",
         naam="Geactiveerd",
     )
@@ -23,7 +23,7 @@ class Accountstatus(Referentiedatasoort):
     Het account is geactiveerd.
     """
 
-    geblokkeerd = AccountstatusReferentiedata(
+    geblokkeerd = AccountstatusReferentiedata.model_construct(
         code="GEB",
         naam="Geblokkeerd",
     )
@@ -32,7 +32,7 @@ class Accountstatus(Referentiedatasoort):
     wachtwoord.
     """
 
-    geregistreerd = AccountstatusReferentiedata(
+    geregistreerd = AccountstatusReferentiedata.model_construct(
         code="GER",
         naam="Geregistreerd",
     )
@@ -7,7 +7,7 @@ class AdressoortReferentiedata(Referentiedata):
 
 
 class Adressoort(Referentiedatasoort):
-    buitenlands_adres = AdressoortReferentiedata(
+    buitenlands_adres = AdressoortReferentiedata.model_construct(
         code="BUI",
         naam="Buitenlands adres",
     )
@@ -15,7 +15,7 @@ class Adressoort(Referentiedatasoort):
     Een buitenlands adres.
     """
 
-    eenheid_adres = AdressoortReferentiedata(
+    eenheid_adres = AdressoortReferentiedata.model_construct(
         code="EEN",
         naam="Eenheid adres",
     )
@@ -23,7 +23,7 @@ class Adressoort(Referentiedatasoort):
     De adresgegevens van een eenheid, ook wel woonadres
     """
 
-    postadres = AdressoortReferentiedata(
+    postadres = AdressoortReferentiedata.model_construct(
         code="POS",
         naam="Postadres",
     )
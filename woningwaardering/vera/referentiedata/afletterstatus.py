@@ -7,7 +7,7 @@ class AfletterstatusReferentiedata(Referentiedata):
 
 
 class Afletterstatus(Referentiedatasoort):
-    deels_afgeletterd = AfletterstatusReferentiedata(
+    deels_afgeletterd = AfletterstatusReferentiedata.model_construct(
         code="DEE",
         naam="Deels afgeletterd",
     )
@@ -19,7 +19,7 @@ class Afletterstatus(Referentiedatasoort):
     worden.
     """
 
-    niet_afgeletterd = AfletterstatusReferentiedata(
+    niet_afgeletterd = AfletterstatusReferentiedata.model_construct(
         code="NIE",
         naam="Niet afgeletterd",
     )
@@ -29,7 +29,7 @@ class Afletterstatus(Referentiedatasoort):
     niet gekoppeld is aan een vordering.
     """
 
-    volledig_afgeletterd = AfletterstatusReferentiedata(
+    volledig_afgeletterd = AfletterstatusReferentiedata.model_construct(
         code="VOL",
         naam="Volledig afgeletterd",
     )
@@ -7,7 +7,7 @@ class AfrekenwijzesoortReferentiedata(Referentiedata):
 
 
 class Afrekenwijzesoort(Referentiedatasoort):
-    afkoop = AfrekenwijzesoortReferentiedata(
+    afkoop = AfrekenwijzesoortReferentiedata.model_construct(
         code="AFK",
         naam="Afkoop",
     )
@@ -16,7 +16,7 @@ class Afrekenwijzesoort(Referentiedatasoort):
     totaalniveau.
     """
 
-    garantie = AfrekenwijzesoortReferentiedata(
+    garantie = AfrekenwijzesoortReferentiedata.model_construct(
         code="GAR",
         naam="Garantie",
     )
@@ -25,7 +25,7 @@ class Afrekenwijzesoort(Referentiedatasoort):
     vallen
     """
 
-    nacalculatie_eenheidsprijzen = AfrekenwijzesoortReferentiedata(
+    nacalculatie_eenheidsprijzen = AfrekenwijzesoortReferentiedata.model_construct(
         code="NCE",
         naam="Nacalculatie eenheidsprijzen",
     )
@@ -34,7 +34,7 @@ class Afrekenwijzesoort(Referentiedatasoort):
     Bij bestedingsoort kan hier gebruik gemaakt worden van de soort Vaste taakprijs
     """
 
-    nacalculatie_regie = AfrekenwijzesoortReferentiedata(
+    nacalculatie_regie = AfrekenwijzesoortReferentiedata.model_construct(
         code="NCR",
         naam="Nacalculatie regie",
     )
@@ -43,7 +43,7 @@ class Afrekenwijzesoort(Referentiedatasoort):
     (arbeidstijd, reistijd, materiaal)
     """
 
-    vaste_prijs = AfrekenwijzesoortReferentiedata(
+    vaste_prijs = AfrekenwijzesoortReferentiedata.model_construct(
         code="VPR",
         naam="Vaste prijs",
     )
@@ -7,7 +7,7 @@ class AfspraakstatusReferentiedata(Referentiedata):
 
 
 class Afspraakstatus(Referentiedatasoort):
-    aangevraagd = AfspraakstatusReferentiedata(
+    aangevraagd = AfspraakstatusReferentiedata.model_construct(
         code="AAN",
         naam="Aangevraagd",
     )
@@ -16,7 +16,7 @@ class Afspraakstatus(Referentiedatasoort):
     voorkeur bloktijd zijn opgegeven.
     """
 
-    afgerond = AfspraakstatusReferentiedata(
+    afgerond = AfspraakstatusReferentiedata.model_construct(
         code="AFG",
         naam="Afgerond",
     )
@@ -24,7 +24,7 @@ class Afspraakstatus(Referentiedatasoort):
     De afspraak heeft plaatsgevonden.
     """
 
-    geannuleerd = AfspraakstatusReferentiedata(
+    geannuleerd = AfspraakstatusReferentiedata.model_construct(
         code="ANN",
         naam="Geannuleerd",
     )
@@ -32,7 +32,7 @@ class Afspraakstatus(Referentiedatasoort):
     De afspraak is geannuleerd.
     """
 
-    gepland = AfspraakstatusReferentiedata(
+    gepland = AfspraakstatusReferentiedata.model_construct(
         code="GEP",
         naam="Gepland",
     )
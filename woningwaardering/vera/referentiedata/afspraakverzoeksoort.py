@@ -7,7 +7,7 @@ class AfspraakverzoeksoortReferentiedata(Referentiedata):
 
 
 class Afspraakverzoeksoort(Referentiedatasoort):
-    eindinspectie = AfspraakverzoeksoortReferentiedata(
+    eindinspectie = AfspraakverzoeksoortReferentiedata.model_construct(
         code="EIN",
         naam="Eindinspectie",
     )
@@ -16,7 +16,7 @@ class Afspraakverzoeksoort(Referentiedatasoort):
     de ontvangst van een huuropzegging.
     """
 
-    voorinspectie = AfspraakverzoeksoortReferentiedata(
+    voorinspectie = AfspraakverzoeksoortReferentiedata.model_construct(
         code="VOO",
         naam="Voorinspectie",
     )
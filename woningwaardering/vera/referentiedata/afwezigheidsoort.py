@@ -7,57 +7,57 @@ class AfwezigheidsoortReferentiedata(Referentiedata):
 
 
 class Afwezigheidsoort(Referentiedatasoort):
-    adoptieverlof = AfwezigheidsoortReferentiedata(
+    adoptieverlof = AfwezigheidsoortReferentiedata.model_construct(
         code="ADO",
         naam="Adoptieverlof",
     )
 
-    bijzonder_verlof = AfwezigheidsoortReferentiedata(
+    bijzonder_verlof = AfwezigheidsoortReferentiedata.model_construct(
         code="BIJ",
         naam="Bijzonder verlof",
     )
 
-    calamiteitenverlof = AfwezigheidsoortReferentiedata(
+    calamiteitenverlof = AfwezigheidsoortReferentiedata.model_construct(
         code="CAL",
         naam="Calamiteitenverlof",
     )
 
-    geschorst = AfwezigheidsoortReferentiedata(
+    geschorst = AfwezigheidsoortReferentiedata.model_construct(
         code="GES",
         naam="Geschorst",
     )
 
-    non_actief = AfwezigheidsoortReferentiedata(
+    non_actief = AfwezigheidsoortReferentiedata.model_construct(
         code="NON",
         naam="Non-actief",
     )
 
-    onbetaald_verlof = AfwezigheidsoortReferentiedata(
+    onbetaald_verlof = AfwezigheidsoortReferentiedata.model_construct(
         code="ONB",
         naam="Onbetaald verlof",
     )
 
-    ouderschapsverlof = AfwezigheidsoortReferentiedata(
+    ouderschapsverlof = AfwezigheidsoortReferentiedata.model_construct(
         code="OUD",
         naam="Ouderschapsverlof",
     )
 
-    verlof_regulier = AfwezigheidsoortReferentiedata(
+    verlof_regulier = AfwezigheidsoortReferentiedata.model_construct(
         code="VER",
         naam="Verlof (regulier)",
     )
 
-    ziek = AfwezigheidsoortReferentiedata(
+    ziek = AfwezigheidsoortReferentiedata.model_construct(
         code="ZIE",
         naam="Ziek",
     )
 
-    zorgverlof = AfwezigheidsoortReferentiedata(
+    zorgverlof = AfwezigheidsoortReferentiedata.model_construct(
         code="ZOR",
         naam="Zorgverlof",
     )
 
-    zwangerschapsverlof = AfwezigheidsoortReferentiedata(
+    zwangerschapsverlof = AfwezigheidsoortReferentiedata.model_construct(
         code="ZWA",
         naam="Zwangerschapsverlof",
     )
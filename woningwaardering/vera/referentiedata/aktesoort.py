@@ -7,7 +7,7 @@ class AktesoortReferentiedata(Referentiedata):
 
 
 class Aktesoort(Referentiedatasoort):
-    notariele_akte = AktesoortReferentiedata(
+    notariele_akte = AktesoortReferentiedata.model_construct(
         code="NOT",
         naam="Notariële akte",
     )
@@ -15,7 +15,7 @@ class Aktesoort(Referentiedatasoort):
     Akte vastgelegd bij de notaris.
     """
 
-    onderhandse_akte = AktesoortReferentiedata(
+    onderhandse_akte = AktesoortReferentiedata.model_construct(
         code="OND",
         naam="Onderhandse akte",
     )
@@ -7,7 +7,7 @@ class AuthentiekgegevenbronReferentiedata(Referentiedata):
 
 
 class Authentiekgegevenbron(Referentiedatasoort):
-    klantcontact = AuthentiekgegevenbronReferentiedata(
+    klantcontact = AuthentiekgegevenbronReferentiedata.model_construct(
         code="KLA",
         naam="Klantcontact",
     )
@@ -15,7 +15,7 @@ class Authentiekgegevenbron(Referentiedatasoort):
     Gegevens zijn aangeleverd via de balie of klantcontactcentrum.
     """
 
-    bvbsn = AuthentiekgegevenbronReferentiedata(
+    bvbsn = AuthentiekgegevenbronReferentiedata.model_construct(
         code="BSN",
         naam="BvBSN",
     )
@@ -23,7 +23,7 @@ class Authentiekgegevenbron(Referentiedatasoort):
     Gegevens zijn gedeeld vanuit de basisvoorziening burgerservicenummer
     """
 
-    dienst_uitvoering_onderwijs = AuthentiekgegevenbronReferentiedata(
+    dienst_uitvoering_onderwijs = AuthentiekgegevenbronReferentiedata.model_construct(
         code="DUO",
         naam="Dienst uitvoering onderwijs",
     )
@@ -31,7 +31,7 @@ class Authentiekgegevenbron(Referentiedatasoort):
     Gegevens zijn gedeeld vanuit DUO.
     """
 
-    inkomensregistratieformulier = AuthentiekgegevenbronReferentiedata(
+    inkomensregistratieformulier = AuthentiekgegevenbronReferentiedata.model_construct(
         code="IRF",
         naam="Inkomensregistratieformulier",
     )
@@ -39,7 +39,7 @@ class Authentiekgegevenbron(Referentiedatasoort):
     Gegevens zijn gedeeld vanuit het Inkomensregistratieformulier.
     """
 
-    mijn_overheid = AuthentiekgegevenbronReferentiedata(
+    mijn_overheid = AuthentiekgegevenbronReferentiedata.model_construct(
         code="MIJ",
         naam="Mijn Overheid",
     )
@@ -47,7 +47,7 @@ class Authentiekgegevenbron(Referentiedatasoort):
     Gegevens zijn gedeeld vanuit Mijn Overheid.
     """
 
-    qii = AuthentiekgegevenbronReferentiedata(
+    qii = AuthentiekgegevenbronReferentiedata.model_construct(
         code="QII",
         naam="Qii",
     )
@@ -55,7 +55,7 @@ class Authentiekgegevenbron(Referentiedatasoort):
     Gegevens zijn gedeeld vanuit Qii.
     """
 
-    uwv = AuthentiekgegevenbronReferentiedata(
+    uwv = AuthentiekgegevenbronReferentiedata.model_construct(
         code="UWV",
         naam="UWV",
     )
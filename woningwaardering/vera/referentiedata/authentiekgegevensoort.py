@@ -7,7 +7,7 @@ class AuthentiekgegevensoortReferentiedata(Referentiedata):
 
 
 class Authentiekgegevensoort(Referentiedatasoort):
-    actueel_inkomen = AuthentiekgegevensoortReferentiedata(
+    actueel_inkomen = AuthentiekgegevensoortReferentiedata.model_construct(
         code="AIN",
         naam="Actueel inkomen",
     )
@@ -15,7 +15,7 @@ class Authentiekgegevensoort(Referentiedatasoort):
     Actueel inkomen voor als iemands inkomenssituatie is veranderd.
     """
 
-    digitale_identiteit = AuthentiekgegevensoortReferentiedata(
+    digitale_identiteit = AuthentiekgegevensoortReferentiedata.model_construct(
         code="DID",
         naam="Digitale identiteit",
     )
@@ -23,7 +23,7 @@ class Authentiekgegevensoort(Referentiedatasoort):
     Versleuteld BSN nummer.
     """
 
-    geregistreerd_inkomen = AuthentiekgegevensoortReferentiedata(
+    geregistreerd_inkomen = AuthentiekgegevensoortReferentiedata.model_construct(
         code="GIN",
         naam="Geregistreerd inkomen",
     )
@@ -31,7 +31,7 @@ class Authentiekgegevensoort(Referentiedatasoort):
     Geregistreerde inkomen.
     """
 
-    huidhoudsamenstelling = AuthentiekgegevensoortReferentiedata(
+    huidhoudsamenstelling = AuthentiekgegevensoortReferentiedata.model_construct(
         code="HUI",
         naam="Huidhoudsamenstelling",
     )
@@ -39,7 +39,7 @@ class Authentiekgegevensoort(Referentiedatasoort):
     Huidhoudsamenstelling uit BRP.
     """
 
-    naam_adres_woonplaats = AuthentiekgegevensoortReferentiedata(
+    naam_adres_woonplaats = AuthentiekgegevensoortReferentiedata.model_construct(
         code="NAW",
         naam="Naam Adres Woonplaats",
     )
@@ -47,7 +47,7 @@ class Authentiekgegevensoort(Referentiedatasoort):
     NAW gegevens van een natuurlijke persoon.
     """
 
-    opleiding = AuthentiekgegevensoortReferentiedata(
+    opleiding = AuthentiekgegevensoortReferentiedata.model_construct(
         code="OPL",
         naam="Opleiding",
     )
@@ -55,7 +55,7 @@ class Authentiekgegevensoort(Referentiedatasoort):
     Opleiding en studennummer.
     """
 
-    werkgevers = AuthentiekgegevensoortReferentiedata(
+    werkgevers = AuthentiekgegevensoortReferentiedata.model_construct(
         code="WER",
         naam="Werkgevers",
     )
@@ -63,7 +63,7 @@ class Authentiekgegevensoort(Referentiedatasoort):
     Actuele werkgevers.
     """
 
-    woongeschiedenis = AuthentiekgegevensoortReferentiedata(
+    woongeschiedenis = AuthentiekgegevensoortReferentiedata.model_construct(
         code="WOO",
         naam="Woongeschiedenis",
     )
@@ -7,7 +7,7 @@ class AuthentiekgegevenstatusReferentiedata(Referentiedata):
 
 
 class Authentiekgegevenstatus(Referentiedatasoort):
-    gevalideerd = AuthentiekgegevenstatusReferentiedata(
+    gevalideerd = AuthentiekgegevenstatusReferentiedata.model_construct(
         code="GEV",
         naam="Gevalideerd",
     )
@@ -15,7 +15,7 @@ class Authentiekgegevenstatus(Referentiedatasoort):
     Gegevens zijn gevalideerd door de bron.
     """
 
-    vervallen = AuthentiekgegevenstatusReferentiedata(
+    vervallen = AuthentiekgegevenstatusReferentiedata.model_construct(
         code="VER",
         naam="Vervallen",
     )
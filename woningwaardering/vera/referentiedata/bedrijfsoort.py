@@ -7,7 +7,7 @@ class BedrijfsoortReferentiedata(Referentiedata):
 
 
 class Bedrijfsoort(Referentiedatasoort):
-    bouwbedrijf = BedrijfsoortReferentiedata(
+    bouwbedrijf = BedrijfsoortReferentiedata.model_construct(
         code="BOU",
         naam="Bouwbedrijf",
     )
@@ -15,7 +15,7 @@ class Bedrijfsoort(Referentiedatasoort):
     Financieel bedrijf dat zich bezighoudt met bouwactiviteiten.
     """
 
-    monumenten = BedrijfsoortReferentiedata(
+    monumenten = BedrijfsoortReferentiedata.model_construct(
         code="MON",
         naam="Monumenten",
     )
@@ -24,7 +24,7 @@ class Bedrijfsoort(Referentiedatasoort):
     monumenten status.
     """
 
-    onderhoudsbedrijf = BedrijfsoortReferentiedata(
+    onderhoudsbedrijf = BedrijfsoortReferentiedata.model_construct(
         code="OND",
         naam="Onderhoudsbedrijf",
     )
@@ -32,7 +32,7 @@ class Bedrijfsoort(Referentiedatasoort):
     Financieel bedrijf dat zich bezighoudt met onderhoudsactiviteiten.
     """
 
-    projectontwikkeling = BedrijfsoortReferentiedata(
+    projectontwikkeling = BedrijfsoortReferentiedata.model_construct(
         code="PRO",
         naam="Projectontwikkeling",
     )
@@ -40,7 +40,7 @@ class Bedrijfsoort(Referentiedatasoort):
     Financieel bedrijf dat zich bezighoudt met projectontwikkeling.
     """
 
-    servicebedrijf = BedrijfsoortReferentiedata(
+    servicebedrijf = BedrijfsoortReferentiedata.model_construct(
         code="SER",
         naam="Servicebedrijf",
     )
@@ -48,7 +48,7 @@ class Bedrijfsoort(Referentiedatasoort):
     Financieel bedrijf dat zich bezighoudt met het verlenen van diensten.
     """
 
-    toegelaten_instelling = BedrijfsoortReferentiedata(
+    toegelaten_instelling = BedrijfsoortReferentiedata.model_construct(
         code="TI",
         naam="Toegelaten instelling",
     )
@@ -57,7 +57,7 @@ class Bedrijfsoort(Referentiedatasoort):
     toegelaten instelling volgens de Woningwet.
     """
 
-    vereniging_van_eigenaren = BedrijfsoortReferentiedata(
+    vereniging_van_eigenaren = BedrijfsoortReferentiedata.model_construct(
         code="VVE",
         naam="Vereniging van Eigenaren",
     )
@@ -67,7 +67,7 @@ class Bedrijfsoort(Referentiedatasoort):
     cluster heeft verkocht.
     """
 
-    wijkontwikkelingsmaatschappij = BedrijfsoortReferentiedata(
+    wijkontwikkelingsmaatschappij = BedrijfsoortReferentiedata.model_construct(
         code="WOM",
         naam="Wijkontwikkelingsmaatschappij",
     )
@@ -77,7 +77,7 @@ class Bedrijfsoort(Referentiedatasoort):
     groot is voor één partij (bijvoorbeeld een woningcorporatie).
     """
 
-    woonwagenzaken = BedrijfsoortReferentiedata(
+    woonwagenzaken = BedrijfsoortReferentiedata.model_construct(
         code="WWA",
         naam="Woonwagenzaken",
     )
@@ -7,7 +7,7 @@ class BegrotingversieReferentiedata(Referentiedata):
 
 
 class Begrotingversie(Referentiedatasoort):
-    actueel_budget = BegrotingversieReferentiedata(
+    actueel_budget = BegrotingversieReferentiedata.model_construct(
         code="ACB",
         naam="Actueel budget",
     )
@@ -16,7 +16,7 @@ class Begrotingversie(Referentiedatasoort):
     periode.
     """
 
-    mutatie_budget = BegrotingversieReferentiedata(
+    mutatie_budget = BegrotingversieReferentiedata.model_construct(
         code="MUB",
         naam="Mutatie budget",
     )
@@ -24,7 +24,7 @@ class Begrotingversie(Referentiedatasoort):
     Gewijzigd bedrag van een budgetregel voor een jaar of periode.
     """
 
-    oorspronkelijk_budget = BegrotingversieReferentiedata(
+    oorspronkelijk_budget = BegrotingversieReferentiedata.model_construct(
         code="OOB",
         naam="Oorspronkelijk budget",
     )
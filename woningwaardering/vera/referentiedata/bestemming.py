@@ -7,7 +7,7 @@ class BestemmingReferentiedata(Referentiedata):
 
 
 class Bestemming(Referentiedatasoort):
-    huur = BestemmingReferentiedata(
+    huur = BestemmingReferentiedata.model_construct(
         code="HUU",
         naam="Huur",
     )
@@ -15,7 +15,7 @@ class Bestemming(Referentiedatasoort):
     Eenheid is bestemd voor verhuur bij mutatie.
     """
 
-    koop = BestemmingReferentiedata(
+    koop = BestemmingReferentiedata.model_construct(
         code="KOO",
         naam="Koop",
     )
@@ -23,7 +23,7 @@ class Bestemming(Referentiedatasoort):
     Eenheid is bestemd voor verkoop bij mutatie.
     """
 
-    sloop = BestemmingReferentiedata(
+    sloop = BestemmingReferentiedata.model_construct(
         code="SLO",
         naam="Sloop",
     )
@@ -7,7 +7,7 @@ class BetaalgegevensoortReferentiedata(Referentiedata):
 
 
 class Betaalgegevensoort(Referentiedatasoort):
-    bankrekening = BetaalgegevensoortReferentiedata(
+    bankrekening = BetaalgegevensoortReferentiedata.model_construct(
         code="BAN",
         naam="Bankrekening",
     )
@@ -16,7 +16,7 @@ class Betaalgegevensoort(Referentiedatasoort):
     bankrekening.
     """
 
-    creditcard = BetaalgegevensoortReferentiedata(
+    creditcard = BetaalgegevensoortReferentiedata.model_construct(
         code="CRE",
         naam="Creditcard",
     )
@@ -25,7 +25,7 @@ class Betaalgegevensoort(Referentiedatasoort):
     card.
     """
 
-    paypal_account = BetaalgegevensoortReferentiedata(
+    paypal_account = BetaalgegevensoortReferentiedata.model_construct(
         code="PAY",
         naam="Paypal account",
     )
@@ -34,7 +34,7 @@ class Betaalgegevensoort(Referentiedatasoort):
     account.
     """
 
-    transfermate = BetaalgegevensoortReferentiedata(
+    transfermate = BetaalgegevensoortReferentiedata.model_construct(
         code="TRA",
         naam="TransferMate",
     )
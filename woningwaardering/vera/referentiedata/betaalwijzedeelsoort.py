@@ -7,7 +7,7 @@ class BetaalwijzedeelsoortReferentiedata(Referentiedata):
 
 
 class Betaalwijzedeelsoort(Referentiedatasoort):
-    maximaal_bedrag = BetaalwijzedeelsoortReferentiedata(
+    maximaal_bedrag = BetaalwijzedeelsoortReferentiedata.model_construct(
         code="MAX",
         naam="Maximaal bedrag",
     )
@@ -16,7 +16,7 @@ class Betaalwijzedeelsoort(Referentiedatasoort):
     de ouders van de student dragen maximaal EUR 300 bij aan de huur.
     """
 
-    percentage = BetaalwijzedeelsoortReferentiedata(
+    percentage = BetaalwijzedeelsoortReferentiedata.model_construct(
         code="PER",
         naam="Percentage",
     )
@@ -25,7 +25,7 @@ class Betaalwijzedeelsoort(Referentiedatasoort):
     stel waarbij beiden de helft van de huur betalen.
     """
 
-    restant_bedrag = BetaalwijzedeelsoortReferentiedata(
+    restant_bedrag = BetaalwijzedeelsoortReferentiedata.model_construct(
         code="RES",
         naam="Restant bedrag",
     )
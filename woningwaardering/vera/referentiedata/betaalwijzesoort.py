@@ -7,7 +7,7 @@ class BetaalwijzesoortReferentiedata(Referentiedata):
 
 
 class Betaalwijzesoort(Referentiedatasoort):
-    handmatige_overboeking = BetaalwijzesoortReferentiedata(
+    handmatige_overboeking = BetaalwijzesoortReferentiedata.model_construct(
         code="HND",
         naam="Handmatige overboeking",
     )
@@ -16,7 +16,7 @@ class Betaalwijzesoort(Referentiedatasoort):
     betaalverzoek of via een PIN-betaling.
     """
 
-    incasso = BetaalwijzesoortReferentiedata(
+    incasso = BetaalwijzesoortReferentiedata.model_construct(
         code="INC",
         naam="Incasso",
     )
@@ -7,7 +7,7 @@ class BetalingsregelingeinderedenReferentiedata(Referentiedata):
 
 
 class Betalingsregelingeindereden(Referentiedatasoort):
-    afbetaald = BetalingsregelingeinderedenReferentiedata(
+    afbetaald = BetalingsregelingeinderedenReferentiedata.model_construct(
         code="AFB",
         naam="Afbetaald",
     )
@@ -15,7 +15,7 @@ class Betalingsregelingeindereden(Referentiedatasoort):
     De betalingsregeling is beëindigd omdat deze is afbetaald.
     """
 
-    oninbaar = BetalingsregelingeinderedenReferentiedata(
+    oninbaar = BetalingsregelingeinderedenReferentiedata.model_construct(
         code="ONI",
         naam="Oninbaar",
     )
@@ -23,7 +23,7 @@ class Betalingsregelingeindereden(Referentiedatasoort):
     De betalingsregeling is beëindigd omdat deze oninbaar is gebleken.
     """
 
-    restschuld_gesaneerd = BetalingsregelingeinderedenReferentiedata(
+    restschuld_gesaneerd = BetalingsregelingeinderedenReferentiedata.model_construct(
         code="SAN",
         naam="Restschuld gesaneerd",
     )
@@ -31,7 +31,7 @@ class Betalingsregelingeindereden(Referentiedatasoort):
     De betalingsregeling is beëindigd omdat de restschuld is gesaneerd.
     """
 
-    regeling_voldoet_niet = BetalingsregelingeinderedenReferentiedata(
+    regeling_voldoet_niet = BetalingsregelingeinderedenReferentiedata.model_construct(
         code="VOL",
         naam="Regeling voldoet niet",
     )
@@ -7,7 +7,7 @@ class BetalingsregelingstatusReferentiedata(Referentiedata):
 
 
 class Betalingsregelingstatus(Referentiedatasoort):
-    aangevraagd = BetalingsregelingstatusReferentiedata(
+    aangevraagd = BetalingsregelingstatusReferentiedata.model_construct(
         code="AAN",
         naam="Aangevraagd",
     )
@@ -15,7 +15,7 @@ class Betalingsregelingstatus(Referentiedatasoort):
     Ook wel aangemaakt.
     """
 
-    actief = BetalingsregelingstatusReferentiedata(
+    actief = BetalingsregelingstatusReferentiedata.model_construct(
         code="ACT",
         naam="Actief",
     )
@@ -23,7 +23,7 @@ class Betalingsregelingstatus(Referentiedatasoort):
     Toegekende betalingsregeling die loopt.
     """
 
-    geannuleerd = BetalingsregelingstatusReferentiedata(
+    geannuleerd = BetalingsregelingstatusReferentiedata.model_construct(
         code="ANN",
         naam="Geannuleerd",
     )
@@ -31,7 +31,7 @@ class Betalingsregelingstatus(Referentiedatasoort):
     Tussentijds gestopte regeling.
     """
 
-    beeindigd = BetalingsregelingstatusReferentiedata(
+    beeindigd = BetalingsregelingstatusReferentiedata.model_construct(
         code="BEE",
         naam="Beëindigd",
     )
@@ -39,7 +39,7 @@ class Betalingsregelingstatus(Referentiedatasoort):
     Ook wel afgerond. Alle betalingsverplichtingen zijn voldaan.
     """
 
-    bevroren = BetalingsregelingstatusReferentiedata(
+    bevroren = BetalingsregelingstatusReferentiedata.model_construct(
         code="BEV",
         naam="Bevroren",
     )
@@ -7,7 +7,7 @@ class BoekingdetailsoortReferentiedata(Referentiedata):
 
 
 class Boekingdetailsoort(Referentiedatasoort):
-    aanmaning = BoekingdetailsoortReferentiedata(
+    aanmaning = BoekingdetailsoortReferentiedata.model_construct(
         code="AAN",
         naam="Aanmaning",
     )
@@ -17,7 +17,7 @@ class Boekingdetailsoort(Referentiedatasoort):
     daarvan.
     """
 
-    afboeking = BoekingdetailsoortReferentiedata(
+    afboeking = BoekingdetailsoortReferentiedata.model_construct(
         code="AFB",
         naam="Afboeking",
     )
@@ -25,7 +25,7 @@ class Boekingdetailsoort(Referentiedatasoort):
     Boeking voor afboeken van het totale saldo van een openstaande vordering.
     """
 
-    bank = BoekingdetailsoortReferentiedata(
+    bank = BoekingdetailsoortReferentiedata.model_construct(
         code="BAN",
         naam="Bank",
     )
@@ -34,7 +34,7 @@ class Boekingdetailsoort(Referentiedatasoort):
     uitgevoerd.
     """
 
-    betalingsregeling = BoekingdetailsoortReferentiedata(
+    betalingsregeling = BoekingdetailsoortReferentiedata.model_construct(
         code="BET",
         naam="Betalingsregeling",
     )
@@ -43,7 +43,7 @@ class Boekingdetailsoort(Referentiedatasoort):
     voor een of meer openstaande vorderingen.
     """
 
-    borg = BoekingdetailsoortReferentiedata(
+    borg = BoekingdetailsoortReferentiedata.model_construct(
         code="BOR",
         naam="Borg",
     )
@@ -53,7 +53,7 @@ class Boekingdetailsoort(Referentiedatasoort):
     ontvangst of uitbetaling daarvan.
     """
 
-    betalingsregelingtermijn = BoekingdetailsoortReferentiedata(
+    betalingsregelingtermijn = BoekingdetailsoortReferentiedata.model_construct(
         code="BRT",
         naam="Betalingsregelingtermijn",
     )
@@ -62,7 +62,7 @@ class Boekingdetailsoort(Referentiedatasoort):
     met een huurder of debiteur afgesproken betalingsregeling.
     """
 
-    creditnota = BoekingdetailsoortReferentiedata(
+    creditnota = BoekingdetailsoortReferentiedata.model_construct(
         code="CRE",
         naam="Creditnota",
     )
@@ -70,7 +70,7 @@ class Boekingdetailsoort(Referentiedatasoort):
     Boeking voor het geheel of gedeeltelijk corrigeren van een debiteurenfactuur.
     """
 
-    eindafrekening = BoekingdetailsoortReferentiedata(
+    eindafrekening = BoekingdetailsoortReferentiedata.model_construct(
         code="EIN",
         naam="Eindafrekening",
     )
@@ -80,7 +80,7 @@ class Boekingdetailsoort(Referentiedatasoort):
     daarvan.
     """
 
-    eerste_verhuurnota = BoekingdetailsoortReferentiedata(
+    eerste_verhuurnota = BoekingdetailsoortReferentiedata.model_construct(
         code="EVN",
         naam="Eerste verhuurnota",
     )
@@ -89,7 +89,7 @@ class Boekingdetailsoort(Referentiedatasoort):
     voor een nieuwe huurder, dan wel de ontvangst naar aanleiding daarvan.
     """
 
-    factuur = BoekingdetailsoortReferentiedata(
+    factuur = BoekingdetailsoortReferentiedata.model_construct(
         code="FAC",
         naam="Factuur",
     )
@@ -99,7 +99,7 @@ class Boekingdetailsoort(Referentiedatasoort):
     aanleiding daarvan.
     """
 
-    prolongatie = BoekingdetailsoortReferentiedata(
+    prolongatie = BoekingdetailsoortReferentiedata.model_construct(
         code="PRO",
         naam="Prolongatie",
     )
@@ -108,7 +108,7 @@ class Boekingdetailsoort(Referentiedatasoort):
     huurprolongatie.
     """
 
-    storno = BoekingdetailsoortReferentiedata(
+    storno = BoekingdetailsoortReferentiedata.model_construct(
         code="STO",
         naam="Storno",
     )
@@ -117,7 +117,7 @@ class Boekingdetailsoort(Referentiedatasoort):
     of doordat deze niet kan worden uitgevoerd door de bank.
     """
 
-    terugbetaling = BoekingdetailsoortReferentiedata(
+    terugbetaling = BoekingdetailsoortReferentiedata.model_construct(
         code="TER",
         naam="Terugbetaling",
     )
@@ -126,7 +126,7 @@ class Boekingdetailsoort(Referentiedatasoort):
     betaald bedrag.
     """
 
-    voucher = BoekingdetailsoortReferentiedata(
+    voucher = BoekingdetailsoortReferentiedata.model_construct(
         code="VOU",
         naam="Voucher",
     )
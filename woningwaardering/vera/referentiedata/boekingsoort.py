@@ -7,7 +7,7 @@ class BoekingsoortReferentiedata(Referentiedata):
 
 
 class Boekingsoort(Referentiedatasoort):
-    belastingen_en_premies_sv = BoekingsoortReferentiedata(
+    belastingen_en_premies_sv = BoekingsoortReferentiedata.model_construct(
         code="BEP",
         naam="Belastingen en premies SV",
     )
@@ -17,7 +17,7 @@ class Boekingsoort(Referentiedatasoort):
     onderhoudsfacturen.
     """
 
-    budget = BoekingsoortReferentiedata(
+    budget = BoekingsoortReferentiedata.model_construct(
         code="BUD",
         naam="Budget",
     )
@@ -25,7 +25,7 @@ class Boekingsoort(Referentiedatasoort):
     Boeking voor opvoer of wijziging van een budget of budgetregel
     """
 
-    memoriaal = BoekingsoortReferentiedata(
+    memoriaal = BoekingsoortReferentiedata.model_construct(
         code="MEM",
         naam="Memoriaal",
     )
@@ -34,7 +34,7 @@ class Boekingsoort(Referentiedatasoort):
     boekingen, meestal van soort VOR.
     """
 
-    onderhoud = BoekingsoortReferentiedata(
+    onderhoud = BoekingsoortReferentiedata.model_construct(
         code="OHD",
         naam="Onderhoud",
     )
@@ -42,7 +42,7 @@ class Boekingsoort(Referentiedatasoort):
     Boeking ten behoeve van of voortkomend uit de onderhoudsadministratie.
     """
 
-    ontvangst = BoekingsoortReferentiedata(
+    ontvangst = BoekingsoortReferentiedata.model_construct(
         code="ONT",
         naam="Ontvangst",
     )
@@ -52,7 +52,7 @@ class Boekingsoort(Referentiedatasoort):
     eindafrekening.
     """
 
-    projecten = BoekingsoortReferentiedata(
+    projecten = BoekingsoortReferentiedata.model_construct(
         code="PRJ",
         naam="Projecten",
     )
@@ -60,7 +60,7 @@ class Boekingsoort(Referentiedatasoort):
     Boeking ten behoeve van of voortkomend uit de projectadministratie.
     """
 
-    salaris = BoekingsoortReferentiedata(
+    salaris = BoekingsoortReferentiedata.model_construct(
         code="SAL",
         naam="Salaris",
     )
@@ -68,7 +68,7 @@ class Boekingsoort(Referentiedatasoort):
     Boeking ten behoeve van of voortkomend uit de salarisadministratie.
     """
 
-    servicekosten = BoekingsoortReferentiedata(
+    servicekosten = BoekingsoortReferentiedata.model_construct(
         code="SKS",
         naam="Servicekosten",
     )
@@ -76,7 +76,7 @@ class Boekingsoort(Referentiedatasoort):
     Boeking ten behoeve van of voortkomend uit de servicekostenadministratie.
     """
 
-    uitbetaling = BoekingsoortReferentiedata(
+    uitbetaling = BoekingsoortReferentiedata.model_construct(
         code="UIT",
         naam="Uitbetaling",
     )
@@ -85,7 +85,7 @@ class Boekingsoort(Referentiedatasoort):
     boekingen, zoals een vordering, borg of eindafrekening.
     """
 
-    vordering = BoekingsoortReferentiedata(
+    vordering = BoekingsoortReferentiedata.model_construct(
         code="VOR",
         naam="Vordering",
     )
@@ -7,7 +7,7 @@ class BoekingstatusReferentiedata(Referentiedata):
 
 
 class Boekingstatus(Referentiedatasoort):
-    gefiatteerd = BoekingstatusReferentiedata(
+    gefiatteerd = BoekingstatusReferentiedata.model_construct(
         code="FIA",
         naam="Gefiatteerd",
     )
@@ -15,7 +15,7 @@ class Boekingstatus(Referentiedatasoort):
     Boeking is definitief en niet meer wijzigbaar.
     """
 
-    historisch = BoekingstatusReferentiedata(
+    historisch = BoekingstatusReferentiedata.model_construct(
         code="HIS",
         naam="Historisch",
     )
@@ -23,7 +23,7 @@ class Boekingstatus(Referentiedatasoort):
     Boeking is onderdeel van een afgesloten administratieve periode of boekjaar.
     """
 
-    voorlopig = BoekingstatusReferentiedata(
+    voorlopig = BoekingstatusReferentiedata.model_construct(
         code="VRL",
         naam="Voorlopig",
     )
@@ -7,7 +7,7 @@ class BoekjaarperiodesoortReferentiedata(Referentiedata):
 
 
 class Boekjaarperiodesoort(Referentiedatasoort):
-    boekjaarperiodesoort_4_weken = BoekjaarperiodesoortReferentiedata(
+    boekjaarperiodesoort_4_weken = BoekjaarperiodesoortReferentiedata.model_construct(
         code="4WE",
         naam="4-weken",
     )
@@ -15,7 +15,7 @@ class Boekjaarperiodesoort(Referentiedatasoort):
     Deel van een kalenderjaar met een vaste duur van 4 aaneengesloten kalenderweken.
     """
 
-    halfjaar = BoekjaarperiodesoortReferentiedata(
+    halfjaar = BoekjaarperiodesoortReferentiedata.model_construct(
         code="HLJ",
         naam="Halfjaar",
     )
@@ -23,7 +23,7 @@ class Boekjaarperiodesoort(Referentiedatasoort):
     Deel van een kalenderjaar met een vaste duur van 6 aaneengesloten kalendermaanden.
     """
 
-    jaar = BoekjaarperiodesoortReferentiedata(
+    jaar = BoekjaarperiodesoortReferentiedata.model_construct(
         code="JAR",
         naam="Jaar",
     )
@@ -31,7 +31,7 @@ class Boekjaarperiodesoort(Referentiedatasoort):
     Periode die uitgaat van een kalenderjaar.
     """
 
-    kwartaal = BoekjaarperiodesoortReferentiedata(
+    kwartaal = BoekjaarperiodesoortReferentiedata.model_construct(
         code="KWA",
         naam="Kwartaal",
     )
@@ -39,7 +39,7 @@ class Boekjaarperiodesoort(Referentiedatasoort):
     Deel van een kalenderjaar met een vaste duur van 3 aaneengesloten kalandermaanden.
     """
 
-    maand = BoekjaarperiodesoortReferentiedata(
+    maand = BoekjaarperiodesoortReferentiedata.model_construct(
         code="MAA",
         naam="Maand",
     )
@@ -47,7 +47,7 @@ class Boekjaarperiodesoort(Referentiedatasoort):
     Deel van een kalenderjaar met een vaste duur van 1 kalendermaand.
     """
 
-    tertiaal = BoekjaarperiodesoortReferentiedata(
+    tertiaal = BoekjaarperiodesoortReferentiedata.model_construct(
         code="TER",
         naam="Tertiaal",
     )
@@ -55,7 +55,7 @@ class Boekjaarperiodesoort(Referentiedatasoort):
     Deel van een kalenderjaar met een vaste duur van 4 aaneengesloten kalandermaanden.
     """
 
-    week = BoekjaarperiodesoortReferentiedata(
+    week = BoekjaarperiodesoortReferentiedata.model_construct(
         code="WEE",
         naam="Week",
     )
@@ -7,7 +7,7 @@ class BoekjaarperiodestatusReferentiedata(Referentiedata):
 
 
 class Boekjaarperiodestatus(Referentiedatasoort):
-    gesloten_periode = BoekjaarperiodestatusReferentiedata(
+    gesloten_periode = BoekjaarperiodestatusReferentiedata.model_construct(
         code="GSP",
         naam="Gesloten periode",
     )
@@ -15,7 +15,7 @@ class Boekjaarperiodestatus(Referentiedatasoort):
     Periode waarin gegevens niet meer kunnen worden gewijzigd, tiegevoegd of verwijderd.
     """
 
-    open_periode = BoekjaarperiodestatusReferentiedata(
+    open_periode = BoekjaarperiodestatusReferentiedata.model_construct(
         code="OPP",
         naam="Open periode",
     )
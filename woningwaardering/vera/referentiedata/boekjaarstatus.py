@@ -7,22 +7,22 @@ class BoekjaarstatusReferentiedata(Referentiedata):
 
 
 class Boekjaarstatus(Referentiedatasoort):
-    gesloten = BoekjaarstatusReferentiedata(
+    gesloten = BoekjaarstatusReferentiedata.model_construct(
         code="GES",
         naam="Gesloten",
     )
 
-    huidig = BoekjaarstatusReferentiedata(
+    huidig = BoekjaarstatusReferentiedata.model_construct(
         code="HUD",
         naam="Huidig",
     )
 
-    open = BoekjaarstatusReferentiedata(
+    open = BoekjaarstatusReferentiedata.model_construct(
         code="OPN",
         naam="Open",
     )
 
-    vorig = BoekjaarstatusReferentiedata(
+    vorig = BoekjaarstatusReferentiedata.model_construct(
         code="VRG",
         naam="Vorig",
     )
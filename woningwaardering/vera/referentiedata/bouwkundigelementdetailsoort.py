@@ -10,7 +10,7 @@ class BouwkundigelementdetailsoortReferentiedata(Referentiedata):
 
 
 class Bouwkundigelementdetailsoort(Referentiedatasoort):
-    aanrecht = BouwkundigelementdetailsoortReferentiedata(
+    aanrecht = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="AAN",
         naam="Aanrecht",
         parent=Bouwkundigelementsoort.voorziening,
@@ -20,7 +20,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     voedsel. Relatie met IFC codering (IfcFurniture)
     """
 
-    afdekker = BouwkundigelementdetailsoortReferentiedata(
+    afdekker = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="AFD",
         naam="Afdekker",
         parent=Bouwkundigelementsoort.voorziening,
@@ -30,7 +30,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     weersinvloeden. Relatie met IFC codering (IfcCovering.ROOFING)
     """
 
-    armatuur = BouwkundigelementdetailsoortReferentiedata(
+    armatuur = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="ARM",
         naam="Armatuur",
         parent=Bouwkundigelementsoort.voorziening,
@@ -40,7 +40,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     Relatie met IFC codering (IfcLightFixture)
     """
 
-    bad = BouwkundigelementdetailsoortReferentiedata(
+    bad = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="BAD",
         naam="Bad",
         parent=Bouwkundigelementsoort.voorziening,
@@ -50,7 +50,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     codering (IfcSanitaryTerminal.BATH)
     """
 
-    balk = BouwkundigelementdetailsoortReferentiedata(
+    balk = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="BLK",
         naam="Balk",
         parent=Bouwkundigelementsoort.voorziening,
@@ -60,7 +60,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     codering (IfcBeam.BEAM)
     """
 
-    balkon = BouwkundigelementdetailsoortReferentiedata(
+    balkon = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="BKO",
         naam="Balkon",
         parent=Bouwkundigelementsoort.voorziening,
@@ -70,7 +70,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     codering (IfcSlab.FLOOR)
     """
 
-    balustrade = BouwkundigelementdetailsoortReferentiedata(
+    balustrade = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="BLU",
         naam="Balustrade",
         parent=Bouwkundigelementsoort.voorziening,
@@ -80,7 +80,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     codering (IfcRailing.BALUSTRADE)
     """
 
-    beglazing = BouwkundigelementdetailsoortReferentiedata(
+    beglazing = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="BEG",
         naam="Beglazing",
         parent=Bouwkundigelementsoort.voorziening,
@@ -90,7 +90,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     IFC codering (IfcWindow.WINDOW)
     """
 
-    boeiboord = BouwkundigelementdetailsoortReferentiedata(
+    boeiboord = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="BOE",
         naam="Boeiboord",
         parent=Bouwkundigelementsoort.voorziening,
@@ -100,7 +100,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     codering (IfcPlate.SHEET)
     """
 
-    boiler = BouwkundigelementdetailsoortReferentiedata(
+    boiler = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="BOI",
         naam="Boiler",
         parent=Bouwkundigelementsoort.voorziening,
@@ -110,7 +110,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     (IfcBoiler)
     """
 
-    borstwering = BouwkundigelementdetailsoortReferentiedata(
+    borstwering = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="BOR",
         naam="Borstwering",
         parent=Bouwkundigelementsoort.voorziening,
@@ -120,7 +120,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     (IfcWall.PARAPET)
     """
 
-    brandblusser = BouwkundigelementdetailsoortReferentiedata(
+    brandblusser = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="BRA",
         naam="Brandblusser",
         parent=Bouwkundigelementsoort.voorziening,
@@ -130,7 +130,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     (IfcFurniture)
     """
 
-    brandmeldinstallatie = BouwkundigelementdetailsoortReferentiedata(
+    brandmeldinstallatie = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="BME",
         naam="Brandmeldinstallatie",
         parent=Bouwkundigelementsoort.voorziening,
@@ -140,7 +140,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     (IfcSystem.FIREPROTECTION)
     """
 
-    closetcombinatie = BouwkundigelementdetailsoortReferentiedata(
+    closetcombinatie = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="CLO",
         naam="Closetcombinatie",
         parent=Bouwkundigelementsoort.voorziening,
@@ -150,7 +150,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     codering (IfcSanitaryTerminal.TOILETPAN)
     """
 
-    console = BouwkundigelementdetailsoortReferentiedata(
+    console = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="CON",
         naam="Console",
         parent=Bouwkundigelementsoort.voorziening,
@@ -160,7 +160,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     (IfcBeam.T-BEAM)
     """
 
-    dak = BouwkundigelementdetailsoortReferentiedata(
+    dak = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="DAK",
         naam="Dak",
         parent=Bouwkundigelementsoort.voorziening,
@@ -170,7 +170,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     codering (IfcRoof)
     """
 
-    dakkapel = BouwkundigelementdetailsoortReferentiedata(
+    dakkapel = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="DKA",
         naam="Dakkapel",
         parent=Bouwkundigelementsoort.voorziening,
@@ -180,7 +180,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     (IfcRoof)
     """
 
-    dakraam = BouwkundigelementdetailsoortReferentiedata(
+    dakraam = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="DRA",
         naam="Dakraam",
         parent=Bouwkundigelementsoort.voorziening,
@@ -190,7 +190,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     (IfcWindow.SKYLIGHT)
     """
 
-    dakrand = BouwkundigelementdetailsoortReferentiedata(
+    dakrand = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="DRN",
         naam="Dakrand",
         parent=Bouwkundigelementsoort.voorziening,
@@ -200,7 +200,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     codering (IfcRoof)
     """
 
-    deur = BouwkundigelementdetailsoortReferentiedata(
+    deur = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="DEU",
         naam="Deur",
         parent=Bouwkundigelementsoort.voorziening,
@@ -210,7 +210,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     (IfcDoor.DOOR)
     """
 
-    deurdranger = BouwkundigelementdetailsoortReferentiedata(
+    deurdranger = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="DDR",
         naam="Deurdranger",
         parent=Bouwkundigelementsoort.voorziening,
@@ -220,7 +220,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     (IfcBuildingElementProxy)
     """
 
-    dorpel = BouwkundigelementdetailsoortReferentiedata(
+    dorpel = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="DOR",
         naam="Dorpel",
         parent=Bouwkundigelementsoort.voorziening,
@@ -230,7 +230,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     codering (IfcMember)
     """
 
-    douche = BouwkundigelementdetailsoortReferentiedata(
+    douche = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="DOU",
         naam="Douche",
         parent=Bouwkundigelementsoort.voorziening,
@@ -240,7 +240,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     codering (IfcSanitaryTerminal.SHOWER)
     """
 
-    expansievat = BouwkundigelementdetailsoortReferentiedata(
+    expansievat = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="EXP",
         naam="Expansievat",
         parent=Bouwkundigelementsoort.voorziening,
@@ -250,7 +250,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     IFC codering (IfcTank.EXPANSION)
     """
 
-    fontein = BouwkundigelementdetailsoortReferentiedata(
+    fontein = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="FON",
         naam="Fontein",
         parent=Bouwkundigelementsoort.voorziening,
@@ -260,7 +260,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     codering (IfcSanitaryTerminal.SINK)
     """
 
-    galerij = BouwkundigelementdetailsoortReferentiedata(
+    galerij = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="GAL",
         naam="Galerij",
         parent=Bouwkundigelementsoort.voorziening,
@@ -270,7 +270,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     (IfcSlab)
     """
 
-    garagedeur = BouwkundigelementdetailsoortReferentiedata(
+    garagedeur = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="GAR",
         naam="Garagedeur",
         parent=Bouwkundigelementsoort.voorziening,
@@ -280,7 +280,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     (IfcDoor.DOOR)
     """
 
-    goot = BouwkundigelementdetailsoortReferentiedata(
+    goot = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="GOO",
         naam="Goot",
         parent=Bouwkundigelementsoort.voorziening,
@@ -290,7 +290,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     (IfcPipeSegment.GUTTER)
     """
 
-    handmelder = BouwkundigelementdetailsoortReferentiedata(
+    handmelder = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="HAN",
         naam="Handmelder",
         parent=Bouwkundigelementsoort.voorziening,
@@ -300,7 +300,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     (IfcAlarm.MANUALPULLBOX)
     """
 
-    hek = BouwkundigelementdetailsoortReferentiedata(
+    hek = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="HEK",
         naam="Hek",
         parent=Bouwkundigelementsoort.voorziening,
@@ -310,7 +310,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     (IfcRailing)
     """
 
-    hellingbaan = BouwkundigelementdetailsoortReferentiedata(
+    hellingbaan = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="HEL",
         naam="Hellingbaan",
         parent=Bouwkundigelementsoort.voorziening,
@@ -320,7 +320,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     (IfcRamp)
     """
 
-    hemelwaterafvoer = BouwkundigelementdetailsoortReferentiedata(
+    hemelwaterafvoer = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="HEM",
         naam="Hemelwaterafvoer",
         parent=Bouwkundigelementsoort.voorziening,
@@ -330,7 +330,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     codering (IfcPipeSegment)
     """
 
-    isolatie = BouwkundigelementdetailsoortReferentiedata(
+    isolatie = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="ISO",
         naam="Isolatie",
         parent=Bouwkundigelementsoort.voorziening,
@@ -340,7 +340,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     codering (IfcCovering.INSULATION)
     """
 
-    kanteldeur = BouwkundigelementdetailsoortReferentiedata(
+    kanteldeur = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="KAN",
         naam="Kanteldeur",
         parent=Bouwkundigelementsoort.voorziening,
@@ -350,7 +350,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     (IfcDoor.DOOR)
     """
 
-    kast = BouwkundigelementdetailsoortReferentiedata(
+    kast = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="KAS",
         naam="Kast",
         parent=Bouwkundigelementsoort.voorziening,
@@ -359,7 +359,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     Opbergmeubel met deuren of laden. Relatie met IFC codering (IfcFurniture.SHELF)
     """
 
-    ketel = BouwkundigelementdetailsoortReferentiedata(
+    ketel = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="KET",
         naam="Ketel",
         parent=Bouwkundigelementsoort.voorziening,
@@ -369,7 +369,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     (IfcBoiler)
     """
 
-    kolom = BouwkundigelementdetailsoortReferentiedata(
+    kolom = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="KOL",
         naam="Kolom",
         parent=Bouwkundigelementsoort.voorziening,
@@ -378,7 +378,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     Verticaal steunelement in constructies. Relatie met IFC codering (IfcColumn.COLUMN)
     """
 
-    kozijn = BouwkundigelementdetailsoortReferentiedata(
+    kozijn = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="KOZ",
         naam="Kozijn",
         parent=Bouwkundigelementsoort.voorziening,
@@ -387,7 +387,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     Omlijsting waarin deur of raam bevestigd is. Relatie met IFC codering (IfcWindow)
     """
 
-    laadpaal = BouwkundigelementdetailsoortReferentiedata(
+    laadpaal = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="LAA",
         naam="Laadpaal",
         parent=Bouwkundigelementsoort.voorziening,
@@ -399,7 +399,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     laadtijdbeheer en energiebeheer. Relatie met IFC codering (IfcFlowTerminal)
     """
 
-    leuning = BouwkundigelementdetailsoortReferentiedata(
+    leuning = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="LEU",
         naam="Leuning",
         parent=Bouwkundigelementsoort.voorziening,
@@ -409,7 +409,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     (IfcRailing.HANDRAIL)
     """
 
-    lichtkoepel = BouwkundigelementdetailsoortReferentiedata(
+    lichtkoepel = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="LIC",
         naam="Lichtkoepel",
         parent=Bouwkundigelementsoort.voorziening,
@@ -419,7 +419,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     (IfcWindow.LIGHTDOME)
     """
 
-    lichtstraat = BouwkundigelementdetailsoortReferentiedata(
+    lichtstraat = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="LST",
         naam="Lichtstraat",
         parent=Bouwkundigelementsoort.voorziening,
@@ -429,7 +429,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     codering (IfcWindow.LIGHTDOME)
     """
 
-    lift = BouwkundigelementdetailsoortReferentiedata(
+    lift = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="LIF",
         naam="Lift",
         parent=Bouwkundigelementsoort.voorziening,
@@ -439,7 +439,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     (IfcTransportElement.ELEVATOR)
     """
 
-    luchtbehandelingskast = BouwkundigelementdetailsoortReferentiedata(
+    luchtbehandelingskast = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="LUC",
         naam="Luchtbehandelingskast",
         parent=Bouwkundigelementsoort.voorziening,
@@ -449,7 +449,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     (IfcUnitaryEquipment)
     """
 
-    luifel = BouwkundigelementdetailsoortReferentiedata(
+    luifel = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="LFE",
         naam="Luifel",
         parent=Bouwkundigelementsoort.voorziening,
@@ -459,7 +459,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     (IfcRoof)
     """
 
-    luik = BouwkundigelementdetailsoortReferentiedata(
+    luik = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="LUI",
         naam="Luik",
         parent=Bouwkundigelementsoort.voorziening,
@@ -469,7 +469,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     (IfcDoor.TRAPDOOR)
     """
 
-    meldsirene = BouwkundigelementdetailsoortReferentiedata(
+    meldsirene = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="MEL",
         naam="Meldsirene",
         parent=Bouwkundigelementsoort.voorziening,
@@ -479,7 +479,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     (IfcAlarm.SIREN)
     """
 
-    nvo = BouwkundigelementdetailsoortReferentiedata(
+    nvo = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="NVO",
         naam="NVO",
         parent=Bouwkundigelementsoort.voorziening,
@@ -488,7 +488,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     Niet van toepassing, specificeer term. Relatie met IFC codering (IfcSpace.SPACE)
     """
 
-    paneel = BouwkundigelementdetailsoortReferentiedata(
+    paneel = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="PAN",
         naam="Paneel",
         parent=Bouwkundigelementsoort.voorziening,
@@ -498,7 +498,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     (IfcPlate.SHEET)
     """
 
-    plafond = BouwkundigelementdetailsoortReferentiedata(
+    plafond = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="PLA",
         naam="Plafond",
         parent=Bouwkundigelementsoort.voorziening,
@@ -508,7 +508,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     (IfcCovering.CEILING)
     """
 
-    postkast = BouwkundigelementdetailsoortReferentiedata(
+    postkast = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="POS",
         naam="Postkast",
         parent=Bouwkundigelementsoort.voorziening,
@@ -517,7 +517,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     Kast voor ontvangst van poststukken. Relatie met IFC codering (IfcFurniture)
     """
 
-    privacyscherm = BouwkundigelementdetailsoortReferentiedata(
+    privacyscherm = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="PRI",
         naam="Privacyscherm",
         parent=Bouwkundigelementsoort.voorziening,
@@ -527,7 +527,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     (IfcFurniture)
     """
 
-    raam = BouwkundigelementdetailsoortReferentiedata(
+    raam = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="RAA",
         naam="Raam",
         parent=Bouwkundigelementsoort.voorziening,
@@ -537,7 +537,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     (IfcWindow.WINDOW)
     """
 
-    radiator = BouwkundigelementdetailsoortReferentiedata(
+    radiator = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="RAD",
         naam="Radiator",
         parent=Bouwkundigelementsoort.voorziening,
@@ -547,7 +547,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     (IfcSpaceHeater.RADIATOR)
     """
 
-    rookmelder = BouwkundigelementdetailsoortReferentiedata(
+    rookmelder = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="ROO",
         naam="Rookmelder",
         parent=Bouwkundigelementsoort.voorziening,
@@ -557,7 +557,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     IFC codering (IfcSensor.SMOKESENSOR)
     """
 
-    rooster = BouwkundigelementdetailsoortReferentiedata(
+    rooster = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="RST",
         naam="Rooster",
         parent=Bouwkundigelementsoort.voorziening,
@@ -567,7 +567,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     (IfcAirTerminal.GRILLE)
     """
 
-    schoorsteen = BouwkundigelementdetailsoortReferentiedata(
+    schoorsteen = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="SST",
         naam="Schoorsteen",
         parent=Bouwkundigelementsoort.voorziening,
@@ -577,7 +577,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     (IfcChimney)
     """
 
-    schuifdeur = BouwkundigelementdetailsoortReferentiedata(
+    schuifdeur = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="SDE",
         naam="Schuifdeur",
         parent=Bouwkundigelementsoort.voorziening,
@@ -587,7 +587,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     (IfcDoor.DOOR)
     """
 
-    schuifpui = BouwkundigelementdetailsoortReferentiedata(
+    schuifpui = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="SPU",
         naam="Schuifpui",
         parent=Bouwkundigelementsoort.voorziening,
@@ -597,7 +597,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     (IfcWindow.WINDOW)
     """
 
-    trap = BouwkundigelementdetailsoortReferentiedata(
+    trap = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="TRA",
         naam="Trap",
         parent=Bouwkundigelementsoort.voorziening,
@@ -607,7 +607,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     (IfcStair)
     """
 
-    traplift = BouwkundigelementdetailsoortReferentiedata(
+    traplift = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="TLI",
         naam="Traplift",
         parent=Bouwkundigelementsoort.voorziening,
@@ -617,7 +617,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     codering (IfcTransportElement)
     """
 
-    urinoir = BouwkundigelementdetailsoortReferentiedata(
+    urinoir = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="URI",
         naam="Urinoir",
         parent=Bouwkundigelementsoort.voorziening,
@@ -627,7 +627,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     (IfcSanitaryTerminal.URINAL)
     """
 
-    ventilatiekap = BouwkundigelementdetailsoortReferentiedata(
+    ventilatiekap = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="VEN",
         naam="Ventilatiekap",
         parent=Bouwkundigelementsoort.voorziening,
@@ -637,7 +637,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     (IfcStackTerminal.COWL)
     """
 
-    ventilatierooster = BouwkundigelementdetailsoortReferentiedata(
+    ventilatierooster = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="VRO",
         naam="Ventilatierooster",
         parent=Bouwkundigelementsoort.voorziening,
@@ -647,7 +647,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     (IfcAirTerminal.DIFFUSER)
     """
 
-    vliesgevel = BouwkundigelementdetailsoortReferentiedata(
+    vliesgevel = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="VLI",
         naam="Vliesgevel",
         parent=Bouwkundigelementsoort.voorziening,
@@ -657,7 +657,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     (IfcCurtainWall)
     """
 
-    vlizotrap = BouwkundigelementdetailsoortReferentiedata(
+    vlizotrap = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="VTR",
         naam="Vlizotrap",
         parent=Bouwkundigelementsoort.voorziening,
@@ -666,7 +666,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     Opvouwbare trap naar zolder of vliering. Relatie met IFC codering (IfcStair)
     """
 
-    vloer = BouwkundigelementdetailsoortReferentiedata(
+    vloer = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="VLO",
         naam="Vloer",
         parent=Bouwkundigelementsoort.voorziening,
@@ -676,7 +676,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     codering (IfcSlab.FLOOR)
     """
 
-    wand = BouwkundigelementdetailsoortReferentiedata(
+    wand = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="WAN",
         naam="Wand",
         parent=Bouwkundigelementsoort.voorziening,
@@ -686,7 +686,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     (IfcWallStandardCase)
     """
 
-    warmtepomp = BouwkundigelementdetailsoortReferentiedata(
+    warmtepomp = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="WAR",
         naam="Warmtepomp",
         parent=Bouwkundigelementsoort.voorziening,
@@ -696,17 +696,19 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     (IfcPump)
     """
 
-    warmteterugwinning_apparaat = BouwkundigelementdetailsoortReferentiedata(
-        code="WTE",
-        naam="Warmteterugwinning apparaat",
-        parent=Bouwkundigelementsoort.voorziening,
+    warmteterugwinning_apparaat = (
+        BouwkundigelementdetailsoortReferentiedata.model_construct(
+            code="WTE",
+            naam="Warmteterugwinning apparaat",
+            parent=Bouwkundigelementsoort.voorziening,
+        )
     )
     """
     Systeem dat warmte uit afvoerlucht hergebruikt voor energie-efficiëntie. Relatie met
     IFC codering (IfcAirToAirHeatRecovery)
     """
 
-    wastafel = BouwkundigelementdetailsoortReferentiedata(
+    wastafel = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="WAS",
         naam="Wastafel",
         parent=Bouwkundigelementsoort.voorziening,
@@ -716,7 +718,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     (IfcSanitaryTerminal.WASHHANDBASIN)
     """
 
-    zonnepaneel = BouwkundigelementdetailsoortReferentiedata(
+    zonnepaneel = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="ZPA",
         naam="Zonnepaneel",
         parent=Bouwkundigelementsoort.voorziening,
@@ -726,7 +728,7 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     (IfcSolarDevice)
     """
 
-    zonwering = BouwkundigelementdetailsoortReferentiedata(
+    zonwering = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="ZON",
         naam="Zonwering",
         parent=Bouwkundigelementsoort.voorziening,
@@ -736,176 +738,184 @@ class Bouwkundigelementdetailsoort(Referentiedatasoort):
     codering (IfcShadingDevice)
     """
 
-    afvoer = BouwkundigelementdetailsoortReferentiedata(
+    afvoer = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="AFV",
         naam="Afvoer",
         parent=Bouwkundigelementsoort.voorziening,
     )
 
-    balustrades_en_leuningen = BouwkundigelementdetailsoortReferentiedata(
-        code="BAL",
-        naam="Balustrades en leuningen",
-        parent=Bouwkundigelementsoort.voorziening,
+    balustrades_en_leuningen = (
+        BouwkundigelementdetailsoortReferentiedata.model_construct(
+            code="BAL",
+            naam="Balustrades en leuningen",
+            parent=Bouwkundigelementsoort.voorziening,
+        )
     )
 
-    beveiliging = BouwkundigelementdetailsoortReferentiedata(
+    beveiliging = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="BEV",
         naam="Beveiliging",
         parent=Bouwkundigelementsoort.voorziening,
     )
 
-    binnenwandafwerking = BouwkundigelementdetailsoortReferentiedata(
+    binnenwandafwerking = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="BIA",
         naam="Binnenwandafwerking",
         parent=Bouwkundigelementsoort.voorziening,
     )
 
-    bidet = BouwkundigelementdetailsoortReferentiedata(
+    bidet = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="BID",
         naam="Bidet",
         parent=Bouwkundigelementsoort.voorziening,
     )
 
-    binnenwanden = BouwkundigelementdetailsoortReferentiedata(
+    binnenwanden = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="BIN",
         naam="Binnenwanden",
         parent=Bouwkundigelementsoort.voorziening,
     )
 
-    binnenwandopeningen = BouwkundigelementdetailsoortReferentiedata(
+    binnenwandopeningen = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="BIW",
         naam="Binnenwandopeningen",
         parent=Bouwkundigelementsoort.voorziening,
     )
 
-    buitenwandafwerking = BouwkundigelementdetailsoortReferentiedata(
+    buitenwandafwerking = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="BUA",
         naam="Buitenwandafwerking",
         parent=Bouwkundigelementsoort.voorziening,
     )
 
-    buitenwanden = BouwkundigelementdetailsoortReferentiedata(
+    buitenwanden = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="BUI",
         naam="Buitenwanden",
         parent=Bouwkundigelementsoort.voorziening,
     )
 
-    buitenwandopeningen = BouwkundigelementdetailsoortReferentiedata(
+    buitenwandopeningen = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="BUW",
         naam="Buitenwandopeningen",
         parent=Bouwkundigelementsoort.voorziening,
     )
 
-    communicatie = BouwkundigelementdetailsoortReferentiedata(
+    communicatie = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="COM",
         naam="Communicatie",
         parent=Bouwkundigelementsoort.voorziening,
     )
 
-    dakbedekking = BouwkundigelementdetailsoortReferentiedata(
+    dakbedekking = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="DBE",
         naam="Dakbedekking",
         parent=Bouwkundigelementsoort.voorziening,
     )
 
-    dakopeningen = BouwkundigelementdetailsoortReferentiedata(
+    dakopeningen = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="DOP",
         naam="Dakopeningen",
         parent=Bouwkundigelementsoort.voorziening,
     )
 
-    elektra = BouwkundigelementdetailsoortReferentiedata(
+    elektra = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="ELE",
         naam="Elektra",
         parent=Bouwkundigelementsoort.voorziening,
     )
 
-    gas = BouwkundigelementdetailsoortReferentiedata(
+    gas = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="GAS",
         naam="Gas",
         parent=Bouwkundigelementsoort.voorziening,
     )
 
-    keukenvoorzieningen = BouwkundigelementdetailsoortReferentiedata(
+    keukenvoorzieningen = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="KEU",
         naam="Keukenvoorzieningen",
         parent=Bouwkundigelementsoort.voorziening,
     )
 
-    lavet = BouwkundigelementdetailsoortReferentiedata(
+    lavet = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="LAV",
         naam="Lavet",
         parent=Bouwkundigelementsoort.voorziening,
     )
 
-    losse_opslaginventaris = BouwkundigelementdetailsoortReferentiedata(
+    losse_opslaginventaris = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="LOS",
         naam="Losse opslaginventaris",
         parent=Bouwkundigelementsoort.voorziening,
     )
 
-    plafondafwerking = BouwkundigelementdetailsoortReferentiedata(
+    plafondafwerking = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="PAF",
         naam="Plafondafwerking",
         parent=Bouwkundigelementsoort.voorziening,
     )
 
-    sanitaire_voorzieningen = BouwkundigelementdetailsoortReferentiedata(
-        code="SAN",
-        naam="Sanitaire voorzieningen",
-        parent=Bouwkundigelementsoort.voorziening,
+    sanitaire_voorzieningen = (
+        BouwkundigelementdetailsoortReferentiedata.model_construct(
+            code="SAN",
+            naam="Sanitaire voorzieningen",
+            parent=Bouwkundigelementsoort.voorziening,
+        )
     )
 
-    schilderwerk = BouwkundigelementdetailsoortReferentiedata(
+    schilderwerk = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="SCH",
         naam="Schilderwerk",
         parent=Bouwkundigelementsoort.voorziening,
     )
 
-    terrein = BouwkundigelementdetailsoortReferentiedata(
+    terrein = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="TER",
         naam="Terrein",
         parent=Bouwkundigelementsoort.voorziening,
     )
 
-    trap_en_hellingafwerking = BouwkundigelementdetailsoortReferentiedata(
-        code="THA",
-        naam="Trap- en hellingafwerking",
-        parent=Bouwkundigelementsoort.voorziening,
+    trap_en_hellingafwerking = (
+        BouwkundigelementdetailsoortReferentiedata.model_construct(
+            code="THA",
+            naam="Trap- en hellingafwerking",
+            parent=Bouwkundigelementsoort.voorziening,
+        )
     )
 
-    vloerafwerking = BouwkundigelementdetailsoortReferentiedata(
+    vloerafwerking = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="VAF",
         naam="Vloerafwerking",
         parent=Bouwkundigelementsoort.voorziening,
     )
 
-    verwarmingsonderdelen = BouwkundigelementdetailsoortReferentiedata(
+    verwarmingsonderdelen = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="VEO",
         naam="Verwarmingsonderdelen",
         parent=Bouwkundigelementsoort.voorziening,
     )
 
-    verlichting = BouwkundigelementdetailsoortReferentiedata(
+    verlichting = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="VER",
         naam="Verlichting",
         parent=Bouwkundigelementsoort.voorziening,
     )
 
-    vloeropeningen = BouwkundigelementdetailsoortReferentiedata(
+    vloeropeningen = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="VOP",
         naam="Vloeropeningen",
         parent=Bouwkundigelementsoort.voorziening,
     )
 
-    verwarmingstoestellen = BouwkundigelementdetailsoortReferentiedata(
+    verwarmingstoestellen = BouwkundigelementdetailsoortReferentiedata.model_construct(
         code="VTO",
         naam="Verwarmingstoestellen",
         parent=Bouwkundigelementsoort.voorziening,
     )
 
-    waterleiding_en_of_hoofdkraan = BouwkundigelementdetailsoortReferentiedata(
-        code="WAT",
-        naam="Waterleiding/hoofdkraan",
-        parent=Bouwkundigelementsoort.voorziening,
+    waterleiding_en_of_hoofdkraan = (
+        BouwkundigelementdetailsoortReferentiedata.model_construct(
+            code="WAT",
+            naam="Waterleiding/hoofdkraan",
+            parent=Bouwkundigelementsoort.voorziening,
+        )
     )
@@ -7,15 +7,17 @@ class BouwkundigelementplaatsingReferentiedata(Referentiedata):
 
 
 class Bouwkundigelementplaatsing(Referentiedatasoort):
-    individuele_wmo_voorziening = BouwkundigelementplaatsingReferentiedata(
-        code="IWV",
-        naam="Individuele WMO voorziening",
+    individuele_wmo_voorziening = (
+        BouwkundigelementplaatsingReferentiedata.model_construct(
+            code="IWV",
+            naam="Individuele WMO voorziening",
+        )
     )
     """
     Het bouwkundig element is aangebracht als individuele WMO voorziening.
     """
 
-    overig = BouwkundigelementplaatsingReferentiedata(
+    overig = BouwkundigelementplaatsingReferentiedata.model_construct(
         code="OVE",
         naam="Overig",
     )
@@ -24,18 +26,22 @@ class Bouwkundigelementplaatsing(Referentiedatasoort):
     (ZAV, WMO) valt.
     """
 
-    wet_maatschappelijke_ondersteuning = BouwkundigelementplaatsingReferentiedata(
-        code="WMO",
-        naam="Wet maatschappelijke ondersteuning",
+    wet_maatschappelijke_ondersteuning = (
+        BouwkundigelementplaatsingReferentiedata.model_construct(
+            code="WMO",
+            naam="Wet maatschappelijke ondersteuning",
+        )
     )
     """
     Het bouwkundig element is aangebracht onder de voorwaarden van de Wet
     Maatschappelijke Ondersteuning.
     """
 
-    zelf_aangebrachte_voorziening = BouwkundigelementplaatsingReferentiedata(
-        code="ZAV",
-        naam="Zelf aangebrachte voorziening",
+    zelf_aangebrachte_voorziening = (
+        BouwkundigelementplaatsingReferentiedata.model_construct(
+            code="ZAV",
+            naam="Zelf aangebrachte voorziening",
+        )
     )
     """
     Het bouwkundig element is aangebracht als zelf aangebrachte voorziening.
@@ -7,22 +7,22 @@ class BouwkundigelementsoortReferentiedata(Referentiedata):
 
 
 class Bouwkundigelementsoort(Referentiedatasoort):
-    overig = BouwkundigelementsoortReferentiedata(
+    overig = BouwkundigelementsoortReferentiedata.model_construct(
         code="OVE",
         naam="Overig",
     )
 
-    verwarming = BouwkundigelementsoortReferentiedata(
+    verwarming = BouwkundigelementsoortReferentiedata.model_construct(
         code="VER",
         naam="Verwarming",
     )
 
-    voorziening = BouwkundigelementsoortReferentiedata(
+    voorziening = BouwkundigelementsoortReferentiedata.model_construct(
         code="VOO",
         naam="Voorziening",
     )
 
-    warmwater = BouwkundigelementsoortReferentiedata(
+    warmwater = BouwkundigelementsoortReferentiedata.model_construct(
         code="WAT",
         naam="Warmwater",
     )
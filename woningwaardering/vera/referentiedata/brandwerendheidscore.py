@@ -7,81 +7,101 @@ class BrandwerendheidscoreReferentiedata(Referentiedata):
 
 
 class Brandwerendheidscore(Referentiedatasoort):
-    brandwerendheidscore_15_minuten = BrandwerendheidscoreReferentiedata(
-        code="15",
-        naam="15 minuten",
+    brandwerendheidscore_15_minuten = (
+        BrandwerendheidscoreReferentiedata.model_construct(
+            code="15",
+            naam="15 minuten",
+        )
     )
     """
     15 minuten brandwerendheid (Aedes ILS)
     """
 
-    brandwerendheidscore_20_minuten = BrandwerendheidscoreReferentiedata(
-        code="20",
-        naam="20 minuten",
+    brandwerendheidscore_20_minuten = (
+        BrandwerendheidscoreReferentiedata.model_construct(
+            code="20",
+            naam="20 minuten",
+        )
     )
     """
     20 minuten brandwerendheid (Aedes ILS)
     """
 
-    brandwerendheidscore_30_minuten = BrandwerendheidscoreReferentiedata(
-        code="30",
-        naam="30 minuten",
+    brandwerendheidscore_30_minuten = (
+        BrandwerendheidscoreReferentiedata.model_construct(
+            code="30",
+            naam="30 minuten",
+        )
     )
     """
     30 minuten brandwerendheid (Aedes ILS)
     """
 
-    brandwerendheidscore_45_minuten = BrandwerendheidscoreReferentiedata(
-        code="45",
-        naam="45 minuten",
+    brandwerendheidscore_45_minuten = (
+        BrandwerendheidscoreReferentiedata.model_construct(
+            code="45",
+            naam="45 minuten",
+        )
     )
     """
     45 minuten brandwerendheid (Aedes ILS)
     """
 
-    brandwerendheidscore_60_minuten = BrandwerendheidscoreReferentiedata(
-        code="60",
-        naam="60 minuten",
+    brandwerendheidscore_60_minuten = (
+        BrandwerendheidscoreReferentiedata.model_construct(
+            code="60",
+            naam="60 minuten",
+        )
     )
     """
     60 minuten brandwerendheid (Aedes ILS)
     """
 
-    brandwerendheidscore_90_minuten = BrandwerendheidscoreReferentiedata(
-        code="90",
-        naam="90 minuten",
+    brandwerendheidscore_90_minuten = (
+        BrandwerendheidscoreReferentiedata.model_construct(
+            code="90",
+            naam="90 minuten",
+        )
     )
     """
     90 minuten brandwerendheid (Aedes ILS)
     """
 
-    brandwerendheidscore_120_minuten = BrandwerendheidscoreReferentiedata(
-        code="120",
-        naam="120 minuten",
+    brandwerendheidscore_120_minuten = (
+        BrandwerendheidscoreReferentiedata.model_construct(
+            code="120",
+            naam="120 minuten",
+        )
     )
     """
     120 minuten brandwerendheid (Aedes ILS)
     """
 
-    brandwerendheidscore_180_minuten = BrandwerendheidscoreReferentiedata(
-        code="180",
-        naam="180 minuten",
+    brandwerendheidscore_180_minuten = (
+        BrandwerendheidscoreReferentiedata.model_construct(
+            code="180",
+            naam="180 minuten",
+        )
     )
     """
     180 minuten brandwerendheid (Aedes ILS)
     """
 
-    brandwerendheidscore_240_minuten = BrandwerendheidscoreReferentiedata(
-        code="240",
-        naam="240 minuten",
+    brandwerendheidscore_240_minuten = (
+        BrandwerendheidscoreReferentiedata.model_construct(
+            code="240",
+            naam="240 minuten",
+        )
     )
     """
     240 minuten brandwerendheid (Aedes ILS)
     """
 
-    brandwerendheidscore_360_minuten = BrandwerendheidscoreReferentiedata(
-        code="360",
-        naam="360 minuten",
+    brandwerendheidscore_360_minuten = (
+        BrandwerendheidscoreReferentiedata.model_construct(
+            code="360",
+            naam="360 minuten",
+        )
     )
     """
     360 minuten brandwerendheid (Aedes ILS)
@@ -7,7 +7,7 @@ class BtwReferentiedata(Referentiedata):
 
 
 class Btw(Referentiedatasoort):
-    algemeen = BtwReferentiedata(
+    algemeen = BtwReferentiedata.model_construct(
         code="ALG",
         naam="Algemeen",
     )
@@ -16,7 +16,7 @@ class Btw(Referentiedatasoort):
     toepassing. Dit tarief wordt ook wel 'Hoog' genoemd.
     """
 
-    nul = BtwReferentiedata(
+    nul = BtwReferentiedata.model_construct(
         code="NUL",
         naam="Nul",
     )
@@ -25,7 +25,7 @@ class Btw(Referentiedatasoort):
     toepassing.
     """
 
-    verlaagd = BtwReferentiedata(
+    verlaagd = BtwReferentiedata.model_construct(
         code="VER",
         naam="Verlaagd",
     )
@@ -34,7 +34,7 @@ class Btw(Referentiedatasoort):
     toepassing.
     """
 
-    vrijstelling = BtwReferentiedata(
+    vrijstelling = BtwReferentiedata.model_construct(
         code="VRI",
         naam="Vrijstelling",
     )
@@ -7,17 +7,17 @@ class BtwaangiftestatusReferentiedata(Referentiedata):
 
 
 class Btwaangiftestatus(Referentiedatasoort):
-    definitief = BtwaangiftestatusReferentiedata(
+    definitief = BtwaangiftestatusReferentiedata.model_construct(
         code="DEF",
         naam="Definitief",
     )
 
-    in_behandeling = BtwaangiftestatusReferentiedata(
+    in_behandeling = BtwaangiftestatusReferentiedata.model_construct(
         code="IBH",
         naam="In behandeling",
     )
 
-    voorlopig = BtwaangiftestatusReferentiedata(
+    voorlopig = BtwaangiftestatusReferentiedata.model_construct(
         code="VRL",
         naam="Voorlopig",
     )
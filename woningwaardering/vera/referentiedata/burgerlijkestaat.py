@@ -7,22 +7,22 @@ class BurgerlijkestaatReferentiedata(Referentiedata):
 
 
 class Burgerlijkestaat(Referentiedatasoort):
-    achtergebleven_partner = BurgerlijkestaatReferentiedata(
+    achtergebleven_partner = BurgerlijkestaatReferentiedata.model_construct(
         code="ACH",
         naam="Achtergebleven partner",
     )
 
-    gehuwd = BurgerlijkestaatReferentiedata(
+    gehuwd = BurgerlijkestaatReferentiedata.model_construct(
         code="GEH",
         naam="Gehuwd",
     )
 
-    gescheiden = BurgerlijkestaatReferentiedata(
+    gescheiden = BurgerlijkestaatReferentiedata.model_construct(
         code="GES",
         naam="Gescheiden",
     )
 
-    ongehuwd = BurgerlijkestaatReferentiedata(
+    ongehuwd = BurgerlijkestaatReferentiedata.model_construct(
         code="ONG",
         naam="Ongehuwd",
     )
@@ -30,12 +30,12 @@ class Burgerlijkestaat(Referentiedatasoort):
     En nooit gehuwd of partnerschap
     """
 
-    partnerschap_beeindigd = BurgerlijkestaatReferentiedata(
+    partnerschap_beeindigd = BurgerlijkestaatReferentiedata.model_construct(
         code="PAB",
         naam="Partnerschap beëindigd",
     )
 
-    partnerschap = BurgerlijkestaatReferentiedata(
+    partnerschap = BurgerlijkestaatReferentiedata.model_construct(
         code="PAR",
         naam="Partnerschap",
     )
@@ -43,7 +43,7 @@ class Burgerlijkestaat(Referentiedatasoort):
     Geregistreerd partnerschap
     """
 
-    samenwonend = BurgerlijkestaatReferentiedata(
+    samenwonend = BurgerlijkestaatReferentiedata.model_construct(
         code="SAM",
         naam="Samenwonend",
     )
@@ -51,7 +51,7 @@ class Burgerlijkestaat(Referentiedatasoort):
     Langdurig huishouden voerend
     """
 
-    weduwe_en_of_weduwnaar = BurgerlijkestaatReferentiedata(
+    weduwe_en_of_weduwnaar = BurgerlijkestaatReferentiedata.model_construct(
         code="WED",
         naam="Weduwe/weduwnaar",
     )
@@ -7,7 +7,7 @@ class ClustersoortReferentiedata(Referentiedata):
 
 
 class Clustersoort(Referentiedatasoort):
-    buurt = ClustersoortReferentiedata(
+    buurt = ClustersoortReferentiedata.model_construct(
         code="BUU",
         naam="Buurt",
     )
@@ -15,27 +15,27 @@ class Clustersoort(Referentiedatasoort):
     Cluster van eenheden die samen een buurt vormen, anders dan de officiële CBS-buurt
     """
 
-    financieel = ClustersoortReferentiedata(
+    financieel = ClustersoortReferentiedata.model_construct(
         code="FIN",
         naam="Financieel",
     )
 
-    markt = ClustersoortReferentiedata(
+    markt = ClustersoortReferentiedata.model_construct(
         code="MAR",
         naam="Markt",
     )
 
-    onderhoud = ClustersoortReferentiedata(
+    onderhoud = ClustersoortReferentiedata.model_construct(
         code="OND",
         naam="Onderhoud",
     )
 
-    project = ClustersoortReferentiedata(
+    project = ClustersoortReferentiedata.model_construct(
         code="PRO",
         naam="Project",
     )
 
-    rayon = ClustersoortReferentiedata(
+    rayon = ClustersoortReferentiedata.model_construct(
         code="RAY",
         naam="Rayon",
     )
@@ -44,7 +44,7 @@ class Clustersoort(Referentiedatasoort):
     organisatorische eenheid, vormen
     """
 
-    servicekosten = ClustersoortReferentiedata(
+    servicekosten = ClustersoortReferentiedata.model_construct(
         code="SER",
         naam="Servicekosten",
     )
@@ -52,7 +52,7 @@ class Clustersoort(Referentiedatasoort):
     Cluster van eenheden t.b.v. afrekening servicekosten
     """
 
-    verbruikskosten = ClustersoortReferentiedata(
+    verbruikskosten = ClustersoortReferentiedata.model_construct(
         code="STO",
         naam="Verbruikskosten",
     )
@@ -61,17 +61,17 @@ class Clustersoort(Referentiedatasoort):
     warmte.
     """
 
-    strategisch = ClustersoortReferentiedata(
+    strategisch = ClustersoortReferentiedata.model_construct(
         code="STR",
         naam="Strategisch",
     )
 
-    vereniging_van_eigenaars = ClustersoortReferentiedata(
+    vereniging_van_eigenaars = ClustersoortReferentiedata.model_construct(
         code="VVE",
         naam="Vereniging van Eigenaars",
     )
 
-    wijk = ClustersoortReferentiedata(
+    wijk = ClustersoortReferentiedata.model_construct(
         code="WIJ",
         naam="Wijk",
     )
@@ -79,7 +79,7 @@ class Clustersoort(Referentiedatasoort):
     Cluster van eenheden die samen een wijk vormen, anders dan de officiële CBS-wijk
     """
 
-    waardering = ClustersoortReferentiedata(
+    waardering = ClustersoortReferentiedata.model_construct(
         code="WRD",
         naam="Waardering",
     )
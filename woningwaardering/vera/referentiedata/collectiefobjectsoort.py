@@ -7,12 +7,12 @@ class CollectiefobjectsoortReferentiedata(Referentiedata):
 
 
 class Collectiefobjectsoort(Referentiedatasoort):
-    achterpad = CollectiefobjectsoortReferentiedata(
+    achterpad = CollectiefobjectsoortReferentiedata.model_construct(
         code="APD",
         naam="Achterpad",
     )
 
-    casco = CollectiefobjectsoortReferentiedata(
+    casco = CollectiefobjectsoortReferentiedata.model_construct(
         code="CAS",
         naam="Casco",
     )
@@ -20,52 +20,54 @@ class Collectiefobjectsoort(Referentiedatasoort):
     Gevel e.d.
     """
 
-    centrale_hal = CollectiefobjectsoortReferentiedata(
+    centrale_hal = CollectiefobjectsoortReferentiedata.model_construct(
         code="CEH",
         naam="Centrale hal",
     )
 
-    dak = CollectiefobjectsoortReferentiedata(
+    dak = CollectiefobjectsoortReferentiedata.model_construct(
         code="DAK",
         naam="Dak",
     )
 
-    galerij = CollectiefobjectsoortReferentiedata(
+    galerij = CollectiefobjectsoortReferentiedata.model_construct(
         code="GAL",
         naam="Galerij",
     )
 
-    lift = CollectiefobjectsoortReferentiedata(
+    lift = CollectiefobjectsoortReferentiedata.model_construct(
         code="LIF",
         naam="Lift",
     )
 
-    onderdoorgang = CollectiefobjectsoortReferentiedata(
+    onderdoorgang = CollectiefobjectsoortReferentiedata.model_construct(
         code="ONG",
         naam="Onderdoorgang",
     )
 
-    parkeergarage = CollectiefobjectsoortReferentiedata(
+    parkeergarage = CollectiefobjectsoortReferentiedata.model_construct(
         code="PAG",
         naam="Parkeergarage",
     )
 
-    recreatie_en_of_ontmoetingsruimte = CollectiefobjectsoortReferentiedata(
-        code="ROR",
-        naam="Recreatie-/ontmoetingsruimte",
+    recreatie_en_of_ontmoetingsruimte = (
+        CollectiefobjectsoortReferentiedata.model_construct(
+            code="ROR",
+            naam="Recreatie-/ontmoetingsruimte",
+        )
     )
 
-    speelplaats = CollectiefobjectsoortReferentiedata(
+    speelplaats = CollectiefobjectsoortReferentiedata.model_construct(
         code="SPP",
         naam="Speelplaats",
     )
 
-    stortkoker = CollectiefobjectsoortReferentiedata(
+    stortkoker = CollectiefobjectsoortReferentiedata.model_construct(
         code="STK",
         naam="Stortkoker",
     )
 
-    terrein = CollectiefobjectsoortReferentiedata(
+    terrein = CollectiefobjectsoortReferentiedata.model_construct(
         code="TER",
         naam="Terrein",
     )
@@ -73,17 +75,17 @@ class Collectiefobjectsoort(Referentiedatasoort):
     Parkeerterrein, buitenterrein
     """
 
-    trappenhuis = CollectiefobjectsoortReferentiedata(
+    trappenhuis = CollectiefobjectsoortReferentiedata.model_construct(
         code="TRH",
         naam="Trappenhuis",
     )
 
-    technische_ruimte = CollectiefobjectsoortReferentiedata(
+    technische_ruimte = CollectiefobjectsoortReferentiedata.model_construct(
         code="TRU",
         naam="Technische ruimte",
     )
 
-    tuin = CollectiefobjectsoortReferentiedata(
+    tuin = CollectiefobjectsoortReferentiedata.model_construct(
         code="TUI",
         naam="Tuin",
     )
@@ -91,7 +93,7 @@ class Collectiefobjectsoort(Referentiedatasoort):
     Gemeenschappelijke tuin
     """
 
-    gemeenschappelijke_badkamer = CollectiefobjectsoortReferentiedata(
+    gemeenschappelijke_badkamer = CollectiefobjectsoortReferentiedata.model_construct(
         code="BDK",
         naam="Gemeenschappelijke badkamer",
     )
@@ -99,7 +101,7 @@ class Collectiefobjectsoort(Referentiedatasoort):
     Gemeenschappelijke badkamer
     """
 
-    gemeenschappelijk_balkon = CollectiefobjectsoortReferentiedata(
+    gemeenschappelijk_balkon = CollectiefobjectsoortReferentiedata.model_construct(
         code="BAL",
         naam="Gemeenschappelijk balkon",
     )
@@ -107,7 +109,7 @@ class Collectiefobjectsoort(Referentiedatasoort):
     Gemeenschappelijk balkon
     """
 
-    gemeenschappelijke_berging = CollectiefobjectsoortReferentiedata(
+    gemeenschappelijke_berging = CollectiefobjectsoortReferentiedata.model_construct(
         code="BER",
         naam="Gemeenschappelijke berging",
     )
@@ -115,15 +117,17 @@ class Collectiefobjectsoort(Referentiedatasoort):
     Gemeenschappelijke berging of berginsgsgang
     """
 
-    gemeenschappelijke_fietsenstalling = CollectiefobjectsoortReferentiedata(
-        code="FTS",
-        naam="Gemeenschappelijke fietsenstalling",
+    gemeenschappelijke_fietsenstalling = (
+        CollectiefobjectsoortReferentiedata.model_construct(
+            code="FTS",
+            naam="Gemeenschappelijke fietsenstalling",
+        )
     )
     """
     Gemeenschappelijke fietsenstalling
     """
 
-    gemeenschappeijke_keuken = CollectiefobjectsoortReferentiedata(
+    gemeenschappeijke_keuken = CollectiefobjectsoortReferentiedata.model_construct(
         code="KEU",
         naam="Gemeenschappeijke keuken",
     )
@@ -131,7 +135,7 @@ class Collectiefobjectsoort(Referentiedatasoort):
     Gemeenschappelijke keuken
     """
 
-    gemeenschappelijke_toilet = CollectiefobjectsoortReferentiedata(
+    gemeenschappelijke_toilet = CollectiefobjectsoortReferentiedata.model_construct(
         code="TOI",
         naam="Gemeenschappelijke toilet",
     )
@@ -139,7 +143,7 @@ class Collectiefobjectsoort(Referentiedatasoort):
     Gemeenschappelijk toilet
     """
 
-    wasruimte = CollectiefobjectsoortReferentiedata(
+    wasruimte = CollectiefobjectsoortReferentiedata.model_construct(
         code="WAS",
         naam="Wasruimte",
     )
@@ -7,47 +7,47 @@ class CommunicatiekanaalReferentiedata(Referentiedata):
 
 
 class Communicatiekanaal(Referentiedatasoort):
-    whatsapp = CommunicatiekanaalReferentiedata(
+    whatsapp = CommunicatiekanaalReferentiedata.model_construct(
         code="APP",
         naam="Whatsapp",
     )
 
-    balie = CommunicatiekanaalReferentiedata(
+    balie = CommunicatiekanaalReferentiedata.model_construct(
         code="BAL",
         naam="Balie",
     )
 
-    huisbezoek = CommunicatiekanaalReferentiedata(
+    huisbezoek = CommunicatiekanaalReferentiedata.model_construct(
         code="BEZ",
         naam="Huisbezoek",
     )
 
-    brief = CommunicatiekanaalReferentiedata(
+    brief = CommunicatiekanaalReferentiedata.model_construct(
         code="BRI",
         naam="Brief",
     )
 
-    e_mail = CommunicatiekanaalReferentiedata(
+    e_mail = CommunicatiekanaalReferentiedata.model_construct(
         code="EMA",
         naam="E-mail",
     )
 
-    inspectie = CommunicatiekanaalReferentiedata(
+    inspectie = CommunicatiekanaalReferentiedata.model_construct(
         code="INS",
         naam="Inspectie",
     )
 
-    internet_en_of_klantportaal = CommunicatiekanaalReferentiedata(
+    internet_en_of_klantportaal = CommunicatiekanaalReferentiedata.model_construct(
         code="INT",
         naam="Internet / klantportaal",
     )
 
-    sms = CommunicatiekanaalReferentiedata(
+    sms = CommunicatiekanaalReferentiedata.model_construct(
         code="SMS",
         naam="SMS",
     )
 
-    telefoon = CommunicatiekanaalReferentiedata(
+    telefoon = CommunicatiekanaalReferentiedata.model_construct(
         code="TEL",
         naam="Telefoon",
     )
@@ -7,12 +7,12 @@ class CommunicatierichtingReferentiedata(Referentiedata):
 
 
 class Communicatierichting(Referentiedatasoort):
-    inkomend = CommunicatierichtingReferentiedata(
+    inkomend = CommunicatierichtingReferentiedata.model_construct(
         code="INK",
         naam="Inkomend",
     )
 
-    uitgaand = CommunicatierichtingReferentiedata(
+    uitgaand = CommunicatierichtingReferentiedata.model_construct(
         code="UIT",
         naam="Uitgaand",
     )
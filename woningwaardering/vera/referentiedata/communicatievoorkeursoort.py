@@ -7,7 +7,7 @@ class CommunicatievoorkeursoortReferentiedata(Referentiedata):
 
 
 class Communicatievoorkeursoort(Referentiedatasoort):
-    klantcontact = CommunicatievoorkeursoortReferentiedata(
+    klantcontact = CommunicatievoorkeursoortReferentiedata.model_construct(
         code="KLA",
         naam="Klantcontact",
     )
@@ -15,7 +15,7 @@ class Communicatievoorkeursoort(Referentiedatasoort):
     Direct contact voor ondersteuning, vragen, of klachten
     """
 
-    nieuwsbrief = CommunicatievoorkeursoortReferentiedata(
+    nieuwsbrief = CommunicatievoorkeursoortReferentiedata.model_construct(
         code="NIE",
         naam="Nieuwsbrief",
     )
@@ -24,7 +24,7 @@ class Communicatievoorkeursoort(Referentiedatasoort):
     huurders
     """
 
-    kennisgeving = CommunicatievoorkeursoortReferentiedata(
+    kennisgeving = CommunicatievoorkeursoortReferentiedata.model_construct(
         code="KEN",
         naam="Kennisgeving",
     )
@@ -33,7 +33,7 @@ class Communicatievoorkeursoort(Referentiedatasoort):
     beleidswijzigingen, etc.
     """
 
-    formele_communicatie = CommunicatievoorkeursoortReferentiedata(
+    formele_communicatie = CommunicatievoorkeursoortReferentiedata.model_construct(
         code="FOR",
         naam="Formele communicatie",
     )
@@ -42,7 +42,7 @@ class Communicatievoorkeursoort(Referentiedatasoort):
     betalingsherrinneringen, informatie over huurverhogingen
     """
 
-    overige_communicatie = CommunicatievoorkeursoortReferentiedata(
+    overige_communicatie = CommunicatievoorkeursoortReferentiedata.model_construct(
         code="OVE",
         naam="Overige communicatie",
     )
@@ -7,7 +7,7 @@ class ConditiescoreReferentiedata(Referentiedata):
 
 
 class Conditiescore(Referentiedatasoort):
-    uitstekende_conditie = ConditiescoreReferentiedata(
+    uitstekende_conditie = ConditiescoreReferentiedata.model_construct(
         code="1",
         naam="Uitstekende conditie",
     )
@@ -15,7 +15,7 @@ class Conditiescore(Referentiedatasoort):
     Incidenteel geringe gebreken. (Conditiescore 1 van NEN 2767)
     """
 
-    goede_conditie = ConditiescoreReferentiedata(
+    goede_conditie = ConditiescoreReferentiedata.model_construct(
         code="2",
         naam="Goede conditie",
     )
@@ -23,7 +23,7 @@ class Conditiescore(Referentiedatasoort):
     Incidenteel beginnende veroudering. (Conditiescore 2 van NEN 2767)
     """
 
-    redelijke_conditie = ConditiescoreReferentiedata(
+    redelijke_conditie = ConditiescoreReferentiedata.model_construct(
         code="3",
         naam="Redelijke conditie",
     )
@@ -32,7 +32,7 @@ class Conditiescore(Referentiedatasoort):
     niet in gevaar. (Conditiescore 3 van NEN 2767)
     """
 
-    matige_conditie = ConditiescoreReferentiedata(
+    matige_conditie = ConditiescoreReferentiedata.model_construct(
         code="4",
         naam="Matige conditie",
     )
@@ -41,7 +41,7 @@ class Conditiescore(Referentiedatasoort):
     (Conditiescore 4 van NEN 2767)
     """
 
-    slechte_conditie = ConditiescoreReferentiedata(
+    slechte_conditie = ConditiescoreReferentiedata.model_construct(
         code="5",
         naam="Slechte conditie",
     )
@@ -49,7 +49,7 @@ class Conditiescore(Referentiedatasoort):
     De veroudering is onomkeerbaar. (Conditiescore 5 van NEN 2767)
     """
 
-    zeer_slechte_conditie = ConditiescoreReferentiedata(
+    zeer_slechte_conditie = ConditiescoreReferentiedata.model_construct(
         code="6",
         naam="Zeer slechte conditie",
     )
@@ -7,17 +7,17 @@ class ContactgegevendetailsoortReferentiedata(Referentiedata):
 
 
 class Contactgegevendetailsoort(Referentiedatasoort):
-    in_case_of_emergency = ContactgegevendetailsoortReferentiedata(
+    in_case_of_emergency = ContactgegevendetailsoortReferentiedata.model_construct(
         code="ICE",
         naam="In case of emergency",
     )
 
-    prive = ContactgegevendetailsoortReferentiedata(
+    prive = ContactgegevendetailsoortReferentiedata.model_construct(
         code="PRI",
         naam="Privé",
     )
 
-    zakelijk = ContactgegevendetailsoortReferentiedata(
+    zakelijk = ContactgegevendetailsoortReferentiedata.model_construct(
         code="ZAK",
         naam="Zakelijk",
     )
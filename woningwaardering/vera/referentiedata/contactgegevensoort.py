@@ -7,17 +7,17 @@ class ContactgegevensoortReferentiedata(Referentiedata):
 
 
 class Contactgegevensoort(Referentiedatasoort):
-    e_mail = ContactgegevensoortReferentiedata(
+    e_mail = ContactgegevensoortReferentiedata.model_construct(
         code="EMA",
         naam="E-mail",
     )
 
-    fax = ContactgegevensoortReferentiedata(
+    fax = ContactgegevensoortReferentiedata.model_construct(
         code="FAX",
         naam="Fax",
     )
 
-    mobiele_telefoon = ContactgegevensoortReferentiedata(
+    mobiele_telefoon = ContactgegevensoortReferentiedata.model_construct(
         code="MOB",
         naam="Mobiele telefoon",
     )
@@ -25,22 +25,22 @@ class Contactgegevensoort(Referentiedatasoort):
     Mobiel telefoonnummer, ook geschikt voor SMS
     """
 
-    pager = ContactgegevensoortReferentiedata(
+    pager = ContactgegevensoortReferentiedata.model_construct(
         code="PAG",
         naam="Pager",
     )
 
-    post = ContactgegevensoortReferentiedata(
+    post = ContactgegevensoortReferentiedata.model_construct(
         code="POS",
         naam="Post",
     )
 
-    social_media = ContactgegevensoortReferentiedata(
+    social_media = ContactgegevensoortReferentiedata.model_construct(
         code="SOC",
         naam="Social media",
     )
 
-    telefoon = ContactgegevensoortReferentiedata(
+    telefoon = ContactgegevensoortReferentiedata.model_construct(
         code="TEL",
         naam="Telefoon",
     )
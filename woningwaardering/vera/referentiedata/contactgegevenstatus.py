@@ -7,7 +7,7 @@ class ContactgegevenstatusReferentiedata(Referentiedata):
 
 
 class Contactgegevenstatus(Referentiedatasoort):
-    aangemaakt = ContactgegevenstatusReferentiedata(
+    aangemaakt = ContactgegevenstatusReferentiedata.model_construct(
         code="AAN",
         naam="Aangemaakt",
     )
@@ -15,7 +15,7 @@ class Contactgegevenstatus(Referentiedatasoort):
     Het contactgegeven is aangemaakt.
     """
 
-    gevalideerd = ContactgegevenstatusReferentiedata(
+    gevalideerd = ContactgegevenstatusReferentiedata.model_construct(
         code="GEV",
         naam="Gevalideerd",
     )
@@ -23,7 +23,7 @@ class Contactgegevenstatus(Referentiedatasoort):
     Het contactgeggeven is gevalideerd via een mail, sms etc.
     """
 
-    ongeldig = ContactgegevenstatusReferentiedata(
+    ongeldig = ContactgegevenstatusReferentiedata.model_construct(
         code="ONG",
         naam="Ongeldig",
     )
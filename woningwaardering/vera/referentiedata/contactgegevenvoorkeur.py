@@ -7,12 +7,12 @@ class ContactgegevenvoorkeurReferentiedata(Referentiedata):
 
 
 class Contactgegevenvoorkeur(Referentiedatasoort):
-    eerste = ContactgegevenvoorkeurReferentiedata(
+    eerste = ContactgegevenvoorkeurReferentiedata.model_construct(
         code="EER",
         naam="Eerste",
     )
 
-    tweede = ContactgegevenvoorkeurReferentiedata(
+    tweede = ContactgegevenvoorkeurReferentiedata.model_construct(
         code="TWE",
         naam="Tweede",
     )
@@ -7,7 +7,7 @@ class CrediteursoortReferentiedata(Referentiedata):
 
 
 class Crediteursoort(Referentiedatasoort):
-    crediteur_gemeente = CrediteursoortReferentiedata(
+    crediteur_gemeente = CrediteursoortReferentiedata.model_construct(
         code="CGM",
         naam="Crediteur gemeente",
     )
@@ -21,7 +21,7 @@ class Crediteursoort(Referentiedatasoort):
     goederen of diensten.
     """
 
-    crediteur_leningen_kredietinstelling = CrediteursoortReferentiedata(
+    crediteur_leningen_kredietinstelling = CrediteursoortReferentiedata.model_construct(
         code="CKI",
         naam="Crediteur leningen kredietinstelling",
     )
@@ -35,7 +35,7 @@ class Crediteursoort(Referentiedatasoort):
     voorwaarden van de leningsovereenkomst die tussen beide partijen is gesloten.
     """
 
-    crediteur_leningen_overheid = CrediteursoortReferentiedata(
+    crediteur_leningen_overheid = CrediteursoortReferentiedata.model_construct(
         code="CLO",
         naam="Crediteur leningen overheid",
     )
@@ -50,7 +50,7 @@ class Crediteursoort(Referentiedatasoort):
     te dekken.
     """
 
-    crediteur_overheid = CrediteursoortReferentiedata(
+    crediteur_overheid = CrediteursoortReferentiedata.model_construct(
         code="COH",
         naam="Crediteur overheid",
     )
@@ -64,7 +64,7 @@ class Crediteursoort(Referentiedatasoort):
     moment terug te betalen.
     """
 
-    handelscrediteur = CrediteursoortReferentiedata(
+    handelscrediteur = CrediteursoortReferentiedata.model_construct(
         code="HCR",
         naam="Handelscrediteur",
     )
@@ -7,12 +7,12 @@ class CrediteurstatusReferentiedata(Referentiedata):
 
 
 class Crediteurstatus(Referentiedatasoort):
-    actief = CrediteurstatusReferentiedata(
+    actief = CrediteurstatusReferentiedata.model_construct(
         code="ACT",
         naam="Actief",
     )
 
-    alleen_voor_betalen = CrediteurstatusReferentiedata(
+    alleen_voor_betalen = CrediteurstatusReferentiedata.model_construct(
         code="BET",
         naam="Alleen voor betalen",
     )
@@ -20,7 +20,7 @@ class Crediteurstatus(Referentiedatasoort):
     Korting
     """
 
-    geblokkeerd = CrediteurstatusReferentiedata(
+    geblokkeerd = CrediteurstatusReferentiedata.model_construct(
         code="GEB",
         naam="Geblokkeerd",
     )
@@ -28,7 +28,7 @@ class Crediteurstatus(Referentiedatasoort):
     Toeslag
     """
 
-    voorlopig = CrediteurstatusReferentiedata(
+    voorlopig = CrediteurstatusReferentiedata.model_construct(
         code="VRL",
         naam="Voorlopig",
     )
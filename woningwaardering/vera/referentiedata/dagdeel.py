@@ -7,7 +7,7 @@ class DagdeelReferentiedata(Referentiedata):
 
 
 class Dagdeel(Referentiedatasoort):
-    avond = DagdeelReferentiedata(
+    avond = DagdeelReferentiedata.model_construct(
         code="AVO",
         naam="Avond",
     )
@@ -15,7 +15,7 @@ class Dagdeel(Referentiedatasoort):
     Tussen 18 en 24 uur.
     """
 
-    middag = DagdeelReferentiedata(
+    middag = DagdeelReferentiedata.model_construct(
         code="MID",
         naam="Middag",
     )
@@ -23,7 +23,7 @@ class Dagdeel(Referentiedatasoort):
     Tussen 12 en 18 uur.
     """
 
-    ochtend = DagdeelReferentiedata(
+    ochtend = DagdeelReferentiedata.model_construct(
         code="OCH",
         naam="Ochtend",
     )
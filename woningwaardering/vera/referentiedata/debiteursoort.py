@@ -7,22 +7,22 @@ class DebiteursoortReferentiedata(Referentiedata):
 
 
 class Debiteursoort(Referentiedatasoort):
-    debiteur_gemeente = DebiteursoortReferentiedata(
+    debiteur_gemeente = DebiteursoortReferentiedata.model_construct(
         code="DGM",
         naam="Debiteur gemeente",
     )
 
-    debiteur_overheid = DebiteursoortReferentiedata(
+    debiteur_overheid = DebiteursoortReferentiedata.model_construct(
         code="DOH",
         naam="Debiteur overheid",
     )
 
-    huurdebiteur = DebiteursoortReferentiedata(
+    huurdebiteur = DebiteursoortReferentiedata.model_construct(
         code="HUU",
         naam="Huurdebiteur",
     )
 
-    overige_debiteur = DebiteursoortReferentiedata(
+    overige_debiteur = DebiteursoortReferentiedata.model_construct(
         code="OVE",
         naam="Overige debiteur",
     )
@@ -7,22 +7,22 @@ class DebiteurstatusReferentiedata(Referentiedata):
 
 
 class Debiteurstatus(Referentiedatasoort):
-    actief = DebiteurstatusReferentiedata(
+    actief = DebiteurstatusReferentiedata.model_construct(
         code="ACT",
         naam="Actief",
     )
 
-    alleen_voor_betalen = DebiteurstatusReferentiedata(
+    alleen_voor_betalen = DebiteurstatusReferentiedata.model_construct(
         code="BET",
         naam="Alleen voor betalen",
     )
 
-    geblokkeerd = DebiteurstatusReferentiedata(
+    geblokkeerd = DebiteurstatusReferentiedata.model_construct(
         code="GEB",
         naam="Geblokkeerd",
     )
 
-    voorlopig = DebiteurstatusReferentiedata(
+    voorlopig = DebiteurstatusReferentiedata.model_construct(
         code="VRL",
         naam="Voorlopig",
     )
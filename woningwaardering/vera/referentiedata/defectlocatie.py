@@ -7,102 +7,102 @@ class DefectlocatieReferentiedata(Referentiedata):
 
 
 class Defectlocatie(Referentiedatasoort):
-    airco_en_of_koelinstallatie = DefectlocatieReferentiedata(
+    airco_en_of_koelinstallatie = DefectlocatieReferentiedata.model_construct(
         code="AIR",
         naam="Airco/koelinstallatie",
     )
 
-    badkamer_en_of_doucheruimte = DefectlocatieReferentiedata(
+    badkamer_en_of_doucheruimte = DefectlocatieReferentiedata.model_construct(
         code="BAD",
         naam="Badkamer / doucheruimte",
     )
 
-    balkon = DefectlocatieReferentiedata(
+    balkon = DefectlocatieReferentiedata.model_construct(
         code="BAL",
         naam="Balkon",
     )
 
-    bergingsruimte = DefectlocatieReferentiedata(
+    bergingsruimte = DefectlocatieReferentiedata.model_construct(
         code="BER",
         naam="Bergingsruimte",
     )
 
-    bijkeuken = DefectlocatieReferentiedata(
+    bijkeuken = DefectlocatieReferentiedata.model_construct(
         code="BIJ",
         naam="Bijkeuken",
     )
 
-    buitengevel = DefectlocatieReferentiedata(
+    buitengevel = DefectlocatieReferentiedata.model_construct(
         code="BUI",
         naam="Buitengevel",
     )
 
-    containerruimte = DefectlocatieReferentiedata(
+    containerruimte = DefectlocatieReferentiedata.model_construct(
         code="CON",
         naam="Containerruimte",
     )
 
-    dak = DefectlocatieReferentiedata(
+    dak = DefectlocatieReferentiedata.model_construct(
         code="DAK",
         naam="Dak",
     )
 
-    dakterras = DefectlocatieReferentiedata(
+    dakterras = DefectlocatieReferentiedata.model_construct(
         code="DTE",
         naam="Dakterras",
     )
 
-    entreehal_en_of_ingang = DefectlocatieReferentiedata(
+    entreehal_en_of_ingang = DefectlocatieReferentiedata.model_construct(
         code="ENT",
         naam="Entreehal / Ingang",
     )
 
-    fietsenstalling = DefectlocatieReferentiedata(
+    fietsenstalling = DefectlocatieReferentiedata.model_construct(
         code="FIE",
         naam="Fietsenstalling",
     )
 
-    galerij_en_of_galerijgang = DefectlocatieReferentiedata(
+    galerij_en_of_galerijgang = DefectlocatieReferentiedata.model_construct(
         code="GAL",
         naam="Galerij / galerijgang",
     )
 
-    gangkast_en_of_trapkast = DefectlocatieReferentiedata(
+    gangkast_en_of_trapkast = DefectlocatieReferentiedata.model_construct(
         code="GAN",
         naam="Gangkast / trapkast",
     )
 
-    garage_perceelgebonden_en_of_carport = DefectlocatieReferentiedata(
+    garage_perceelgebonden_en_of_carport = DefectlocatieReferentiedata.model_construct(
         code="GAR",
         naam="Garage (perceelgebonden) / carport",
     )
 
-    hal_en_of_gang_individueel = DefectlocatieReferentiedata(
+    hal_en_of_gang_individueel = DefectlocatieReferentiedata.model_construct(
         code="HAL",
         naam="Hal / gang individueel",
     )
 
-    kelder = DefectlocatieReferentiedata(
+    kelder = DefectlocatieReferentiedata.model_construct(
         code="KEL",
         naam="Kelder",
     )
 
-    keuken = DefectlocatieReferentiedata(
+    keuken = DefectlocatieReferentiedata.model_construct(
         code="KEU",
         naam="Keuken",
     )
 
-    kruipruimte = DefectlocatieReferentiedata(
+    kruipruimte = DefectlocatieReferentiedata.model_construct(
         code="KRU",
         naam="Kruipruimte",
     )
 
-    lift = DefectlocatieReferentiedata(
+    lift = DefectlocatieReferentiedata.model_construct(
         code="LIF",
         naam="Lift",
     )
 
-    overige_ruimte = DefectlocatieReferentiedata(
+    overige_ruimte = DefectlocatieReferentiedata.model_construct(
         code="OVE",
         naam="Overige ruimte",
     )
@@ -110,92 +110,92 @@ class Defectlocatie(Referentiedatasoort):
     Overige locaties die niet onder één van de andere defectlocaties vallen
     """
 
-    overloop = DefectlocatieReferentiedata(
+    overloop = DefectlocatieReferentiedata.model_construct(
         code="OVL",
         naam="Overloop",
     )
 
-    pad_en_of_brandgang = DefectlocatieReferentiedata(
+    pad_en_of_brandgang = DefectlocatieReferentiedata.model_construct(
         code="PAD",
         naam="Pad / brandgang",
     )
 
-    pantry = DefectlocatieReferentiedata(
+    pantry = DefectlocatieReferentiedata.model_construct(
         code="PAN",
         naam="Pantry",
     )
 
-    parkeerplaats = DefectlocatieReferentiedata(
+    parkeerplaats = DefectlocatieReferentiedata.model_construct(
         code="PAR",
         naam="Parkeerplaats",
     )
 
-    trappenhuis_en_of_portiek = DefectlocatieReferentiedata(
+    trappenhuis_en_of_portiek = DefectlocatieReferentiedata.model_construct(
         code="POR",
         naam="Trappenhuis / Portiek",
     )
 
-    schuur = DefectlocatieReferentiedata(
+    schuur = DefectlocatieReferentiedata.model_construct(
         code="SCH",
         naam="Schuur",
     )
 
-    scootmobielruimte = DefectlocatieReferentiedata(
+    scootmobielruimte = DefectlocatieReferentiedata.model_construct(
         code="SCO",
         naam="Scootmobielruimte",
     )
 
-    slaapkamer = DefectlocatieReferentiedata(
+    slaapkamer = DefectlocatieReferentiedata.model_construct(
         code="SLA",
         naam="Slaapkamer",
     )
 
-    toiletruimte = DefectlocatieReferentiedata(
+    toiletruimte = DefectlocatieReferentiedata.model_construct(
         code="TOI",
         naam="Toiletruimte",
     )
 
-    trap = DefectlocatieReferentiedata(
+    trap = DefectlocatieReferentiedata.model_construct(
         code="TRA",
         naam="Trap",
     )
 
-    technische_ruimte_collectief = DefectlocatieReferentiedata(
+    technische_ruimte_collectief = DefectlocatieReferentiedata.model_construct(
         code="TRC",
         naam="Technische ruimte (collectief)",
     )
 
-    technische_ruimte_individueel = DefectlocatieReferentiedata(
+    technische_ruimte_individueel = DefectlocatieReferentiedata.model_construct(
         code="TRI",
         naam="Technische ruimte (individueel)",
     )
 
-    tuin = DefectlocatieReferentiedata(
+    tuin = DefectlocatieReferentiedata.model_construct(
         code="TUI",
         naam="Tuin",
     )
 
-    voertuigingang = DefectlocatieReferentiedata(
+    voertuigingang = DefectlocatieReferentiedata.model_construct(
         code="VOE",
         naam="Voertuigingang",
     )
 
-    woonkamer = DefectlocatieReferentiedata(
+    woonkamer = DefectlocatieReferentiedata.model_construct(
         code="WOO",
         naam="Woonkamer",
     )
 
-    wasruimte_collectief = DefectlocatieReferentiedata(
+    wasruimte_collectief = DefectlocatieReferentiedata.model_construct(
         code="WRC",
         naam="Wasruimte collectief",
     )
 
-    wasruimte_individueel = DefectlocatieReferentiedata(
+    wasruimte_individueel = DefectlocatieReferentiedata.model_construct(
         code="WRI",
         naam="Wasruimte individueel",
     )
 
-    zolder_en_of_vliering = DefectlocatieReferentiedata(
+    zolder_en_of_vliering = DefectlocatieReferentiedata.model_construct(
         code="ZOL",
         naam="Zolder / vliering",
     )
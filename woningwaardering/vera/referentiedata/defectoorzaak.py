@@ -7,7 +7,7 @@ class DefectoorzaakReferentiedata(Referentiedata):
 
 
 class Defectoorzaak(Referentiedatasoort):
-    bewonersopdracht_en_of_gedrag = DefectoorzaakReferentiedata(
+    bewonersopdracht_en_of_gedrag = DefectoorzaakReferentiedata.model_construct(
         code="BEW",
         naam="Bewonersopdracht/gedrag",
     )
@@ -16,7 +16,7 @@ class Defectoorzaak(Referentiedatasoort):
     Ketenstandaard: oorzaakcode HUU - Huurder
     """
 
-    schade_door_brand = DefectoorzaakReferentiedata(
+    schade_door_brand = DefectoorzaakReferentiedata.model_construct(
         code="BRA",
         naam="Schade door brand",
     )
@@ -24,7 +24,7 @@ class Defectoorzaak(Referentiedatasoort):
     Defect is veroorzaakt door brand. (bijv. keukenbrand).
     """
 
-    ouderdom = DefectoorzaakReferentiedata(
+    ouderdom = DefectoorzaakReferentiedata.model_construct(
         code="OUD",
         naam="Ouderdom",
     )
@@ -33,7 +33,7 @@ class Defectoorzaak(Referentiedatasoort):
     hangt scheef). Relatie met Ketenstandaard: oorzaakcode OUD - Ouderdom
     """
 
-    normale_slijtage = DefectoorzaakReferentiedata(
+    normale_slijtage = DefectoorzaakReferentiedata.model_construct(
         code="SLT",
         naam="Normale slijtage",
     )
@@ -42,7 +42,7 @@ class Defectoorzaak(Referentiedatasoort):
     element). Relatie met Ketenstandaard: oorzaakcode SLT - Slijtage
     """
 
-    slecht_opgeleverd = DefectoorzaakReferentiedata(
+    slecht_opgeleverd = DefectoorzaakReferentiedata.model_construct(
         code="SOP",
         naam="Slecht opgeleverd",
     )
@@ -51,7 +51,7 @@ class Defectoorzaak(Referentiedatasoort):
     (bijv. kraan lekt van nieuwe keuken).
     """
 
-    schade_door_storm = DefectoorzaakReferentiedata(
+    schade_door_storm = DefectoorzaakReferentiedata.model_construct(
         code="STO",
         naam="Schade door storm",
     )
@@ -60,7 +60,7 @@ class Defectoorzaak(Referentiedatasoort):
     storm).
     """
 
-    schade_door_vandalisme = DefectoorzaakReferentiedata(
+    schade_door_vandalisme = DefectoorzaakReferentiedata.model_construct(
         code="VAN",
         naam="Schade door vandalisme",
     )
@@ -68,7 +68,7 @@ class Defectoorzaak(Referentiedatasoort):
     Defect is veroorzaakt door vandalisme. (bijv. graffiti op gevel).
     """
 
-    verzoek_van_de_vastgoedeigenaar = DefectoorzaakReferentiedata(
+    verzoek_van_de_vastgoedeigenaar = DefectoorzaakReferentiedata.model_construct(
         code="VGE",
         naam="Verzoek van de vastgoedeigenaar",
     )
@@ -76,7 +76,7 @@ class Defectoorzaak(Referentiedatasoort):
     Vastgoedeigenaar heeft expliciet verzoek gedaan om het defect op te lossen.
     """
 
-    schade_door_water = DefectoorzaakReferentiedata(
+    schade_door_water = DefectoorzaakReferentiedata.model_construct(
         code="WAT",
         naam="Schade door water",
     )
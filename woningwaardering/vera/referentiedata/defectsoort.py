@@ -7,37 +7,37 @@ class DefectsoortReferentiedata(Referentiedata):
 
 
 class Defectsoort(Referentiedatasoort):
-    beklad = DefectsoortReferentiedata(
+    beklad = DefectsoortReferentiedata.model_construct(
         code="BEK",
         naam="Beklad",
     )
 
-    betonrot = DefectsoortReferentiedata(
+    betonrot = DefectsoortReferentiedata.model_construct(
         code="BET",
         naam="Betonrot",
     )
 
-    bevroren = DefectsoortReferentiedata(
+    bevroren = DefectsoortReferentiedata.model_construct(
         code="BEV",
         naam="Bevroren",
     )
 
-    bijen = DefectsoortReferentiedata(
+    bijen = DefectsoortReferentiedata.model_construct(
         code="BIJ",
         naam="Bijen",
     )
 
-    blijft_branden = DefectsoortReferentiedata(
+    blijft_branden = DefectsoortReferentiedata.model_construct(
         code="BLI",
         naam="Blijft branden",
     )
 
-    boktorren = DefectsoortReferentiedata(
+    boktorren = DefectsoortReferentiedata.model_construct(
         code="BOK",
         naam="Boktorren",
     )
 
-    breuk_en_of_scheur = DefectsoortReferentiedata(
+    breuk_en_of_scheur = DefectsoortReferentiedata.model_construct(
         code="BRE",
         naam="Breuk / scheur",
     )
@@ -45,42 +45,42 @@ class Defectsoort(Referentiedatasoort):
     Voor glasbruik: gebruik GLA
     """
 
-    beschadigd_omvang_onbenoemd = DefectsoortReferentiedata(
+    beschadigd_omvang_onbenoemd = DefectsoortReferentiedata.model_construct(
         code="BS0",
         naam="Beschadigd (omvang onbenoemd)",
     )
 
-    beschadigd_1m2 = DefectsoortReferentiedata(
+    beschadigd_1m2 = DefectsoortReferentiedata.model_construct(
         code="BS1",
         naam="Beschadigd < 1m2",
     )
 
-    beschadigd_1_5_m2 = DefectsoortReferentiedata(
+    beschadigd_1_5_m2 = DefectsoortReferentiedata.model_construct(
         code="BS2",
         naam="Beschadigd 1-5 m2",
     )
 
-    beschadigd_5_m2 = DefectsoortReferentiedata(
+    beschadigd_5_m2 = DefectsoortReferentiedata.model_construct(
         code="BS3",
         naam="Beschadigd >5 m2",
     )
 
-    defect_en_of_onderdeel_defect = DefectsoortReferentiedata(
+    defect_en_of_onderdeel_defect = DefectsoortReferentiedata.model_construct(
         code="DEF",
         naam="Defect / onderdeel defect",
     )
 
-    doorboord = DefectsoortReferentiedata(
+    doorboord = DefectsoortReferentiedata.model_construct(
         code="DOO",
         naam="Doorboord",
     )
 
-    druppelt = DefectsoortReferentiedata(
+    druppelt = DefectsoortReferentiedata.model_construct(
         code="DRP",
         naam="Druppelt",
     )
 
-    waterdruk_te_laag = DefectsoortReferentiedata(
+    waterdruk_te_laag = DefectsoortReferentiedata.model_construct(
         code="DRU",
         naam="Waterdruk te laag",
     )
@@ -88,112 +88,112 @@ class Defectsoort(Referentiedatasoort):
     Installatie moet worden bijgevuld/ontlucht
     """
 
-    gaslucht_en_of_gaslek = DefectsoortReferentiedata(
+    gaslucht_en_of_gaslek = DefectsoortReferentiedata.model_construct(
         code="GAS",
         naam="Gaslucht/gaslek",
     )
 
-    maakt_vreemd_geluid = DefectsoortReferentiedata(
+    maakt_vreemd_geluid = DefectsoortReferentiedata.model_construct(
         code="GEL",
         naam="Maakt vreemd geluid",
     )
 
-    gezwollen = DefectsoortReferentiedata(
+    gezwollen = DefectsoortReferentiedata.model_construct(
         code="GEZ",
         naam="Gezwollen",
     )
 
-    glasbreuk = DefectsoortReferentiedata(
+    glasbreuk = DefectsoortReferentiedata.model_construct(
         code="GLA",
         naam="Glasbreuk",
     )
 
-    houtrot = DefectsoortReferentiedata(
+    houtrot = DefectsoortReferentiedata.model_construct(
         code="HOR",
         naam="Houtrot",
     )
 
-    houtwormen = DefectsoortReferentiedata(
+    houtwormen = DefectsoortReferentiedata.model_construct(
         code="HOW",
         naam="Houtwormen",
     )
 
-    inbraakschade = DefectsoortReferentiedata(
+    inbraakschade = DefectsoortReferentiedata.model_construct(
         code="INB",
         naam="Inbraakschade",
     )
 
-    verkalkt = DefectsoortReferentiedata(
+    verkalkt = DefectsoortReferentiedata.model_construct(
         code="KAL",
         naam="Verkalkt",
     )
 
-    kevers = DefectsoortReferentiedata(
+    kevers = DefectsoortReferentiedata.model_construct(
         code="KEV",
         naam="Kevers",
     )
 
-    kakkerlakken = DefectsoortReferentiedata(
+    kakkerlakken = DefectsoortReferentiedata.model_construct(
         code="KKL",
         naam="Kakkerlakken",
     )
 
-    klemt_en_of_opent_niet = DefectsoortReferentiedata(
+    klemt_en_of_opent_niet = DefectsoortReferentiedata.model_construct(
         code="KLE",
         naam="Klemt / opent niet",
     )
 
-    knippert = DefectsoortReferentiedata(
+    knippert = DefectsoortReferentiedata.model_construct(
         code="KNI",
         naam="Knippert",
     )
 
-    lekt = DefectsoortReferentiedata(
+    lekt = DefectsoortReferentiedata.model_construct(
         code="LEK",
         naam="Lekt",
     )
 
-    loopt_door = DefectsoortReferentiedata(
+    loopt_door = DefectsoortReferentiedata.model_construct(
         code="LOO",
         naam="Loopt door",
     )
 
-    zit_los_en_of_onderdeel_zit_los = DefectsoortReferentiedata(
+    zit_los_en_of_onderdeel_zit_los = DefectsoortReferentiedata.model_construct(
         code="LOS",
         naam="Zit los / onderdeel zit los",
     )
 
-    mieren = DefectsoortReferentiedata(
+    mieren = DefectsoortReferentiedata.model_construct(
         code="MIE",
         naam="Mieren",
     )
 
-    muizen = DefectsoortReferentiedata(
+    muizen = DefectsoortReferentiedata.model_construct(
         code="MUI",
         naam="Muizen",
     )
 
-    onvoldoende_afzuiging = DefectsoortReferentiedata(
+    onvoldoende_afzuiging = DefectsoortReferentiedata.model_construct(
         code="ONA",
         naam="Onvoldoende afzuiging",
     )
 
-    onvoldoende_kracht = DefectsoortReferentiedata(
+    onvoldoende_kracht = DefectsoortReferentiedata.model_construct(
         code="ONK",
         naam="Onvoldoende kracht",
     )
 
-    ontbreekt_en_of_onderdeel_ontbreekt = DefectsoortReferentiedata(
+    ontbreekt_en_of_onderdeel_ontbreekt = DefectsoortReferentiedata.model_construct(
         code="ONT",
         naam="Ontbreekt / onderdeel ontbreekt",
     )
 
-    ontzet = DefectsoortReferentiedata(
+    ontzet = DefectsoortReferentiedata.model_construct(
         code="ONZ",
         naam="Ontzet",
     )
 
-    overig = DefectsoortReferentiedata(
+    overig = DefectsoortReferentiedata.model_construct(
         code="OVE",
         naam="Overig",
     )
@@ -201,152 +201,152 @@ class Defectsoort(Referentiedatasoort):
     Overige soorten die niet onder één van de andere defectsoorten vallen
     """
 
-    personen_ingesloten = DefectsoortReferentiedata(
+    personen_ingesloten = DefectsoortReferentiedata.model_construct(
         code="PER",
         naam="Personen ingesloten",
     )
 
-    ratten = DefectsoortReferentiedata(
+    ratten = DefectsoortReferentiedata.model_construct(
         code="RAT",
         naam="Ratten",
     )
 
-    roest = DefectsoortReferentiedata(
+    roest = DefectsoortReferentiedata.model_construct(
         code="ROE",
         naam="Roest",
     )
 
-    sleutel_afgebroken = DefectsoortReferentiedata(
+    sleutel_afgebroken = DefectsoortReferentiedata.model_construct(
         code="SAF",
         naam="Sleutel afgebroken",
     )
 
-    schimmel = DefectsoortReferentiedata(
+    schimmel = DefectsoortReferentiedata.model_construct(
         code="SCH",
         naam="Schimmel",
     )
 
-    slot_defect = DefectsoortReferentiedata(
+    slot_defect = DefectsoortReferentiedata.model_construct(
         code="SDE",
         naam="Slot defect",
     )
 
-    sleutel_kwijt = DefectsoortReferentiedata(
+    sleutel_kwijt = DefectsoortReferentiedata.model_construct(
         code="SKW",
         naam="Sleutel kwijt",
     )
 
-    sluit_niet = DefectsoortReferentiedata(
+    sluit_niet = DefectsoortReferentiedata.model_construct(
         code="SLU",
         naam="Sluit niet",
     )
 
-    spraak_en_of_video_slecht = DefectsoortReferentiedata(
+    spraak_en_of_video_slecht = DefectsoortReferentiedata.model_construct(
         code="SPR",
         naam="Spraak/video slecht",
     )
 
-    staat_stil = DefectsoortReferentiedata(
+    staat_stil = DefectsoortReferentiedata.model_construct(
         code="STA",
         naam="Staat stil",
     )
 
-    stinkt = DefectsoortReferentiedata(
+    stinkt = DefectsoortReferentiedata.model_construct(
         code="STI",
         naam="Stinkt",
     )
 
-    storing = DefectsoortReferentiedata(
+    storing = DefectsoortReferentiedata.model_construct(
         code="STO",
         naam="Storing",
     )
 
-    onjuiste_temperatuur = DefectsoortReferentiedata(
+    onjuiste_temperatuur = DefectsoortReferentiedata.model_construct(
         code="TEM",
         naam="Onjuiste temperatuur",
     )
 
-    tijdschakelklok_werkt_niet = DefectsoortReferentiedata(
+    tijdschakelklok_werkt_niet = DefectsoortReferentiedata.model_construct(
         code="TIJ",
         naam="Tijdschakelklok werkt niet",
     )
 
-    tocht = DefectsoortReferentiedata(
+    tocht = DefectsoortReferentiedata.model_construct(
         code="TOC",
         naam="Tocht",
     )
 
-    verf_laat_los_binnen = DefectsoortReferentiedata(
+    verf_laat_los_binnen = DefectsoortReferentiedata.model_construct(
         code="VBI",
         naam="Verf laat los (binnen)",
     )
 
-    verf_laat_los_buiten = DefectsoortReferentiedata(
+    verf_laat_los_buiten = DefectsoortReferentiedata.model_construct(
         code="VBU",
         naam="Verf laat los (buiten)",
     )
 
-    vlooien = DefectsoortReferentiedata(
+    vlooien = DefectsoortReferentiedata.model_construct(
         code="VLO",
         naam="Vlooien",
     )
 
-    vochtig_en_of_nat = DefectsoortReferentiedata(
+    vochtig_en_of_nat = DefectsoortReferentiedata.model_construct(
         code="VOC",
         naam="Vochtig / nat",
     )
 
-    vogelnest = DefectsoortReferentiedata(
+    vogelnest = DefectsoortReferentiedata.model_construct(
         code="VOG",
         naam="Vogelnest",
     )
 
-    is_vol = DefectsoortReferentiedata(
+    is_vol = DefectsoortReferentiedata.model_construct(
         code="VOL",
         naam="Is vol",
     )
 
-    verstopt_hoogte_onbenoemd = DefectsoortReferentiedata(
+    verstopt_hoogte_onbenoemd = DefectsoortReferentiedata.model_construct(
         code="VS0",
         naam="Verstopt (hoogte onbenoemd)",
     )
 
-    verstopt_lager_dan_7_5_meter = DefectsoortReferentiedata(
+    verstopt_lager_dan_7_5_meter = DefectsoortReferentiedata.model_construct(
         code="VS1",
         naam="Verstopt (lager dan 7,5 meter)",
     )
 
-    verstopt_hoger_dan_7_5_meter = DefectsoortReferentiedata(
+    verstopt_hoger_dan_7_5_meter = DefectsoortReferentiedata.model_construct(
         code="VS2",
         naam="Verstopt (hoger dan 7,5 meter)",
     )
 
-    verschoven = DefectsoortReferentiedata(
+    verschoven = DefectsoortReferentiedata.model_construct(
         code="VSC",
         naam="Verschoven",
     )
 
-    verlichting_werkt_niet = DefectsoortReferentiedata(
+    verlichting_werkt_niet = DefectsoortReferentiedata.model_construct(
         code="VWE",
         naam="Verlichting werkt niet",
     )
 
-    verzakt = DefectsoortReferentiedata(
+    verzakt = DefectsoortReferentiedata.model_construct(
         code="VZT",
         naam="Verzakt",
     )
 
-    wandluizen = DefectsoortReferentiedata(
+    wandluizen = DefectsoortReferentiedata.model_construct(
         code="WAN",
         naam="Wandluizen",
     )
 
-    wespen = DefectsoortReferentiedata(
+    wespen = DefectsoortReferentiedata.model_construct(
         code="WES",
         naam="Wespen",
     )
 
-    zilvervisjes = DefectsoortReferentiedata(
+    zilvervisjes = DefectsoortReferentiedata.model_construct(
         code="ZIL",
         naam="Zilvervisjes",
     )
@@ -7,12 +7,12 @@ class DefectstatusReferentiedata(Referentiedata):
 
 
 class Defectstatus(Referentiedatasoort):
-    geinspecteerd = DefectstatusReferentiedata(
+    geinspecteerd = DefectstatusReferentiedata.model_construct(
         code="INS",
         naam="Geinspecteerd",
     )
 
-    gemeld = DefectstatusReferentiedata(
+    gemeld = DefectstatusReferentiedata.model_construct(
         code="MEL",
         naam="Gemeld",
     )
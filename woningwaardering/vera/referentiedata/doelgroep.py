@@ -7,7 +7,7 @@ class DoelgroepReferentiedata(Referentiedata):
 
 
 class Doelgroep(Referentiedatasoort):
-    persoon = DoelgroepReferentiedata(
+    persoon = DoelgroepReferentiedata.model_construct(
         code="EEN",
         naam="Persoon",
     )
@@ -15,7 +15,7 @@ class Doelgroep(Referentiedatasoort):
     Woonruimte is bestemd voor en/of huurder vormt een eenpersoonshuishouden
     """
 
-    gezin = DoelgroepReferentiedata(
+    gezin = DoelgroepReferentiedata.model_construct(
         code="GEZ",
         naam="Gezin",
     )
@@ -24,7 +24,7 @@ class Doelgroep(Referentiedatasoort):
     verzorging en opvoeding van één of meer kinderen.
     """
 
-    huishouden_zonder_kinderen = DoelgroepReferentiedata(
+    huishouden_zonder_kinderen = DoelgroepReferentiedata.model_construct(
         code="HZO",
         naam="Huishouden zonder kinderen",
     )
@@ -34,7 +34,7 @@ class Doelgroep(Referentiedatasoort):
     verzorgen.
     """
 
-    jongeren = DoelgroepReferentiedata(
+    jongeren = DoelgroepReferentiedata.model_construct(
         code="JON",
         naam="Jongeren",
     )
@@ -43,7 +43,7 @@ class Doelgroep(Referentiedatasoort):
     specifieke maximum leeftijd
     """
 
-    senioren = DoelgroepReferentiedata(
+    senioren = DoelgroepReferentiedata.model_construct(
         code="SEN",
         naam="Senioren",
     )
@@ -52,7 +52,7 @@ class Doelgroep(Referentiedatasoort):
     specifieke minimum leeftijd
     """
 
-    starter = DoelgroepReferentiedata(
+    starter = DoelgroepReferentiedata.model_construct(
         code="STA",
         naam="Starter",
     )
@@ -60,7 +60,7 @@ class Doelgroep(Referentiedatasoort):
     Woonruimte is bestemd voor en/of huurder betreft een starter op de woningmarkt
     """
 
-    studenten = DoelgroepReferentiedata(
+    studenten = DoelgroepReferentiedata.model_construct(
         code="STU",
         naam="Studenten",
     )
@@ -69,7 +69,7 @@ class Doelgroep(Referentiedatasoort):
     studiefinanciering, studeert voltijds of gaat promoveren).
     """
 
-    zorg = DoelgroepReferentiedata(
+    zorg = DoelgroepReferentiedata.model_construct(
         code="ZOR",
         naam="Zorg",
     )
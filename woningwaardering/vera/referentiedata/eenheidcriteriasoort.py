@@ -7,7 +7,7 @@ class EenheidcriteriasoortReferentiedata(Referentiedata):
 
 
 class Eenheidcriteriasoort(Referentiedatasoort):
-    selectie = EenheidcriteriasoortReferentiedata(
+    selectie = EenheidcriteriasoortReferentiedata.model_construct(
         code="SEL",
         naam="Selectie",
     )
@@ -16,7 +16,7 @@ class Eenheidcriteriasoort(Referentiedatasoort):
     de eenheid te bepalen.
     """
 
-    sortering = EenheidcriteriasoortReferentiedata(
+    sortering = EenheidcriteriasoortReferentiedata.model_construct(
         code="SOR",
         naam="Sortering",
     )
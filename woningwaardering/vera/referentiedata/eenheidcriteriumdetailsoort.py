@@ -10,7 +10,7 @@ class EenheidcriteriumdetailsoortReferentiedata(Referentiedata):
 
 
 class Eenheidcriteriumdetailsoort(Referentiedatasoort):
-    beroep = EenheidcriteriumdetailsoortReferentiedata(
+    beroep = EenheidcriteriumdetailsoortReferentiedata.model_construct(
         code="BER",
         naam="Beroep",
         parent=Eenheidcriteriumsoort.urgentie,
@@ -19,7 +19,7 @@ class Eenheidcriteriumdetailsoort(Referentiedatasoort):
     Urgentie wegens een bijzonder beroep in de regio onderwijs, zorg of politie
     """
 
-    dakloos = EenheidcriteriumdetailsoortReferentiedata(
+    dakloos = EenheidcriteriumdetailsoortReferentiedata.model_construct(
         code="DAK",
         naam="(Bijna) dakloos",
         parent=Eenheidcriteriumsoort.urgentie,
@@ -28,7 +28,7 @@ class Eenheidcriteriumdetailsoort(Referentiedatasoort):
     dakloos / calamiteit /brand onbewoonbaar / uitzetting / terugkeer uit buitenland
     """
 
-    doelgroep = EenheidcriteriumdetailsoortReferentiedata(
+    doelgroep = EenheidcriteriumdetailsoortReferentiedata.model_construct(
         code="DOE",
         naam="Doelgroep",
         parent=Eenheidcriteriumsoort.groep,
@@ -37,7 +37,7 @@ class Eenheidcriteriumdetailsoort(Referentiedatasoort):
     Behoren tot een doelgroep. Bijv. gezin, student, senioren etc.
     """
 
-    gedupeerd = EenheidcriteriumdetailsoortReferentiedata(
+    gedupeerd = EenheidcriteriumdetailsoortReferentiedata.model_construct(
         code="DUP",
         naam="Gedupeerd",
         parent=Eenheidcriteriumsoort.urgentie,
@@ -46,7 +46,7 @@ class Eenheidcriteriumdetailsoort(Referentiedatasoort):
     Urgentie wegens dupering van woningzoekende bij woningaanbieding
     """
 
-    economisch = EenheidcriteriumdetailsoortReferentiedata(
+    economisch = EenheidcriteriumdetailsoortReferentiedata.model_construct(
         code="ECO",
         naam="Economisch",
         parent=Eenheidcriteriumsoort.binding,
@@ -55,7 +55,7 @@ class Eenheidcriteriumdetailsoort(Referentiedatasoort):
     Economische binding
     """
 
-    ex_gedetineerd = EenheidcriteriumdetailsoortReferentiedata(
+    ex_gedetineerd = EenheidcriteriumdetailsoortReferentiedata.model_construct(
         code="EXD",
         naam="ex-gedetineerd",
         parent=Eenheidcriteriumsoort.urgentie,
@@ -64,7 +64,7 @@ class Eenheidcriteriumdetailsoort(Referentiedatasoort):
     Urgentie wegens het vrijkomen uit detentie
     """
 
-    financieel = EenheidcriteriumdetailsoortReferentiedata(
+    financieel = EenheidcriteriumdetailsoortReferentiedata.model_construct(
         code="FIN",
         naam="Financieel",
         parent=Eenheidcriteriumsoort.urgentie,
@@ -73,7 +73,7 @@ class Eenheidcriteriumdetailsoort(Referentiedatasoort):
     Urgentie wegens financiele problemen
     """
 
-    gelijkvloers = EenheidcriteriumdetailsoortReferentiedata(
+    gelijkvloers = EenheidcriteriumdetailsoortReferentiedata.model_construct(
         code="GEL",
         naam="Gelijkvloers",
         parent=Eenheidcriteriumsoort.indicatie,
@@ -82,16 +82,18 @@ class Eenheidcriteriumdetailsoort(Referentiedatasoort):
     Indicatie voor een gelijkvloerse woning
     """
 
-    geweld_bedreiging_en_of_overlast = EenheidcriteriumdetailsoortReferentiedata(
-        code="GEW",
-        naam="Geweld bedreiging / overlast",
-        parent=Eenheidcriteriumsoort.urgentie,
+    geweld_bedreiging_en_of_overlast = (
+        EenheidcriteriumdetailsoortReferentiedata.model_construct(
+            code="GEW",
+            naam="Geweld bedreiging / overlast",
+            parent=Eenheidcriteriumsoort.urgentie,
+        )
     )
     """
     Urgentie wegens overlast uit de omgeving of bedreiging.
     """
 
-    herhuisvesting = EenheidcriteriumdetailsoortReferentiedata(
+    herhuisvesting = EenheidcriteriumdetailsoortReferentiedata.model_construct(
         code="HUI",
         naam="Herhuisvesting",
         parent=Eenheidcriteriumsoort.urgentie,
@@ -100,7 +102,7 @@ class Eenheidcriteriumdetailsoort(Referentiedatasoort):
     Urgentie wegens (langdurige) renovatie, nieuwbouw of sloop
     """
 
-    kern = EenheidcriteriumdetailsoortReferentiedata(
+    kern = EenheidcriteriumdetailsoortReferentiedata.model_construct(
         code="KRN",
         naam="Kern",
         parent=Eenheidcriteriumsoort.binding,
@@ -109,7 +111,7 @@ class Eenheidcriteriumdetailsoort(Referentiedatasoort):
     Kernbinding
     """
 
-    maatschappelijk = EenheidcriteriumdetailsoortReferentiedata(
+    maatschappelijk = EenheidcriteriumdetailsoortReferentiedata.model_construct(
         code="MAA",
         naam="Maatschappelijk",
         parent=Eenheidcriteriumsoort.binding,
@@ -118,7 +120,7 @@ class Eenheidcriteriumdetailsoort(Referentiedatasoort):
     Maatschappelijke binding
     """
 
-    mantelzorg = EenheidcriteriumdetailsoortReferentiedata(
+    mantelzorg = EenheidcriteriumdetailsoortReferentiedata.model_construct(
         code="MAN",
         naam="Mantelzorg",
         parent=Eenheidcriteriumsoort.urgentie,
@@ -127,7 +129,7 @@ class Eenheidcriteriumdetailsoort(Referentiedatasoort):
     Urgentie wegens het ontvangen of geven van mantelzorg
     """
 
-    medisch = EenheidcriteriumdetailsoortReferentiedata(
+    medisch = EenheidcriteriumdetailsoortReferentiedata.model_construct(
         code="MED",
         naam="Medisch",
         parent=Eenheidcriteriumsoort.urgentie,
@@ -136,7 +138,7 @@ class Eenheidcriteriumdetailsoort(Referentiedatasoort):
     Urgentie voor een aangepaste woning op medische gronden
     """
 
-    regio = EenheidcriteriumdetailsoortReferentiedata(
+    regio = EenheidcriteriumdetailsoortReferentiedata.model_construct(
         code="REG",
         naam="Regio",
         parent=Eenheidcriteriumsoort.binding,
@@ -145,7 +147,7 @@ class Eenheidcriteriumdetailsoort(Referentiedatasoort):
     Regionale of regio binding
     """
 
-    relationeel = EenheidcriteriumdetailsoortReferentiedata(
+    relationeel = EenheidcriteriumdetailsoortReferentiedata.model_construct(
         code="REL",
         naam="Relationeel",
         parent=Eenheidcriteriumsoort.urgentie,
@@ -154,7 +156,7 @@ class Eenheidcriteriumdetailsoort(Referentiedatasoort):
     Echtscheiding / verbroken relatie / gezinsproblemen /zwangerschap
     """
 
-    rollatorgeschikt = EenheidcriteriumdetailsoortReferentiedata(
+    rollatorgeschikt = EenheidcriteriumdetailsoortReferentiedata.model_construct(
         code="ROL",
         naam="Rollatorgeschikt",
         parent=Eenheidcriteriumsoort.indicatie,
@@ -163,7 +165,7 @@ class Eenheidcriteriumdetailsoort(Referentiedatasoort):
     Indicatie voor een rollatorgeschikte woning
     """
 
-    rolstoelgeschikt = EenheidcriteriumdetailsoortReferentiedata(
+    rolstoelgeschikt = EenheidcriteriumdetailsoortReferentiedata.model_construct(
         code="RST",
         naam="Rolstoelgeschikt",
         parent=Eenheidcriteriumsoort.indicatie,
@@ -172,7 +174,7 @@ class Eenheidcriteriumdetailsoort(Referentiedatasoort):
     Indicatie voor een rolstoelgeschikte woning
     """
 
-    servicewoning = EenheidcriteriumdetailsoortReferentiedata(
+    servicewoning = EenheidcriteriumdetailsoortReferentiedata.model_construct(
         code="SER",
         naam="Servicewoning",
         parent=Eenheidcriteriumsoort.indicatie,
@@ -181,7 +183,7 @@ class Eenheidcriteriumdetailsoort(Referentiedatasoort):
     Woningen bij een zorginstelling of verpleegcentrum.
     """
 
-    sociaal = EenheidcriteriumdetailsoortReferentiedata(
+    sociaal = EenheidcriteriumdetailsoortReferentiedata.model_construct(
         code="SOC",
         naam="Sociaal",
         parent=Eenheidcriteriumsoort.urgentie,
@@ -191,7 +193,7 @@ class Eenheidcriteriumdetailsoort(Referentiedatasoort):
     gezinsleden.
     """
 
-    statushouder = EenheidcriteriumdetailsoortReferentiedata(
+    statushouder = EenheidcriteriumdetailsoortReferentiedata.model_construct(
         code="STA",
         naam="Statushouder",
         parent=Eenheidcriteriumsoort.urgentie,
@@ -200,10 +202,12 @@ class Eenheidcriteriumdetailsoort(Referentiedatasoort):
     Urgentie wegens het verkrijgen van een verblijfsstatus
     """
 
-    uitstroom_maatschappelijke_instelling = EenheidcriteriumdetailsoortReferentiedata(
-        code="UIT",
-        naam="Uitstroom maatschappelijke instelling",
-        parent=Eenheidcriteriumsoort.urgentie,
+    uitstroom_maatschappelijke_instelling = (
+        EenheidcriteriumdetailsoortReferentiedata.model_construct(
+            code="UIT",
+            naam="Uitstroom maatschappelijke instelling",
+            parent=Eenheidcriteriumsoort.urgentie,
+        )
     )
     """
     Urgentie wegens het uitstromen bij een maatschappelijke instelling
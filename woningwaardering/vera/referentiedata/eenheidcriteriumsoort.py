@@ -7,7 +7,7 @@ class EenheidcriteriumsoortReferentiedata(Referentiedata):
 
 
 class Eenheidcriteriumsoort(Referentiedatasoort):
-    binding = EenheidcriteriumsoortReferentiedata(
+    binding = EenheidcriteriumsoortReferentiedata.model_construct(
         code="BIN",
         naam="Binding",
     )
@@ -17,7 +17,7 @@ class Eenheidcriteriumsoort(Referentiedatasoort):
     werken, lokaal voor mensen die in de gemeente wonen.
     """
 
-    groep = EenheidcriteriumsoortReferentiedata(
+    groep = EenheidcriteriumsoortReferentiedata.model_construct(
         code="GRO",
         naam="Groep",
     )
@@ -26,7 +26,7 @@ class Eenheidcriteriumsoort(Referentiedatasoort):
     binding, urgentie of indicatie van toepassing is.
     """
 
-    indicatie = EenheidcriteriumsoortReferentiedata(
+    indicatie = EenheidcriteriumsoortReferentiedata.model_construct(
         code="IND",
         naam="Indicatie",
     )
@@ -34,7 +34,7 @@ class Eenheidcriteriumsoort(Referentiedatasoort):
     Er is voorrang voor woningzoekenden met een (medische) indicatie.21-04-2023
     """
 
-    urgentie = EenheidcriteriumsoortReferentiedata(
+    urgentie = EenheidcriteriumsoortReferentiedata.model_construct(
         code="URG",
         naam="Urgentie",
     )
@@ -7,7 +7,7 @@ class EenheidcriteriumtoepassingReferentiedata(Referentiedata):
 
 
 class Eenheidcriteriumtoepassing(Referentiedatasoort):
-    selectie = EenheidcriteriumtoepassingReferentiedata(
+    selectie = EenheidcriteriumtoepassingReferentiedata.model_construct(
         code="SEL",
         naam="Selectie",
     )
@@ -16,7 +16,7 @@ class Eenheidcriteriumtoepassing(Referentiedatasoort):
     de eenheid te bepalen.
     """
 
-    sortering = EenheidcriteriumtoepassingReferentiedata(
+    sortering = EenheidcriteriumtoepassingReferentiedata.model_construct(
         code="SOR",
         naam="Sortering",
     )
@@ -10,13 +10,13 @@ class EenheiddetailsoortReferentiedata(Referentiedata):
 
 
 class Eenheiddetailsoort(Referentiedatasoort):
-    antenne_opstelplaats = EenheiddetailsoortReferentiedata(
+    antenne_opstelplaats = EenheiddetailsoortReferentiedata.model_construct(
         code="ANT",
         naam="Antenne-opstelplaats",
         parent=Eenheidsoort.overig,
     )
 
-    atelierruimte = EenheiddetailsoortReferentiedata(
+    atelierruimte = EenheiddetailsoortReferentiedata.model_construct(
         code="ATE",
         naam="Atelierruimte",
         parent=Eenheidsoort.bedrijfsruimte,
@@ -25,7 +25,7 @@ class Eenheiddetailsoort(Referentiedatasoort):
     Een atelier is een werkplaats, in het bijzonder die van een beeldend kunstenaar.
     """
 
-    basisschool = EenheiddetailsoortReferentiedata(
+    basisschool = EenheiddetailsoortReferentiedata.model_construct(
         code="BAS",
         naam="Basisschool",
         parent=Eenheidsoort.maatschappelijk_vastgoed,
@@ -34,7 +34,7 @@ class Eenheiddetailsoort(Referentiedatasoort):
     Basisschool conform: art. 49 lid 2a
     """
 
-    benedenwoning = EenheiddetailsoortReferentiedata(
+    benedenwoning = EenheiddetailsoortReferentiedata.model_construct(
         code="BEN",
         naam="Benedenwoning",
         parent=Eenheidsoort.woonruimte,
@@ -45,7 +45,7 @@ class Eenheiddetailsoort(Referentiedatasoort):
     bouwlagen. (Voor marktwaarde bepaling: MGW-meergezinswoning)
     """
 
-    berging = EenheiddetailsoortReferentiedata(
+    berging = EenheiddetailsoortReferentiedata.model_construct(
         code="BER",
         naam="Berging",
         parent=Eenheidsoort.overig,
@@ -56,7 +56,7 @@ class Eenheiddetailsoort(Referentiedatasoort):
     berghokken of bijgebouwen.
     """
 
-    bibliotheek = EenheiddetailsoortReferentiedata(
+    bibliotheek = EenheiddetailsoortReferentiedata.model_construct(
         code="BIB",
         naam="Bibliotheek",
         parent=Eenheidsoort.maatschappelijk_vastgoed,
@@ -65,7 +65,7 @@ class Eenheiddetailsoort(Referentiedatasoort):
     Dorps- of wijkbibliotheek
     """
 
-    bijeenkomstruimte = EenheiddetailsoortReferentiedata(
+    bijeenkomstruimte = EenheiddetailsoortReferentiedata.model_construct(
         code="BIJ",
         naam="Bijeenkomstruimte",
         parent=Eenheidsoort.maatschappelijk_vastgoed,
@@ -77,7 +77,7 @@ class Eenheiddetailsoort(Referentiedatasoort):
     kinderopvang kan de eenheiddetailsoort Kinderopvanglocatie worden gebruikt.
     """
 
-    bouwkavel = EenheiddetailsoortReferentiedata(
+    bouwkavel = EenheiddetailsoortReferentiedata.model_construct(
         code="BOU",
         naam="Bouwkavel",
         parent=Eenheidsoort.overig,
@@ -87,7 +87,7 @@ class Eenheiddetailsoort(Referentiedatasoort):
     zelfstandige, bij elkaar behorende bebouwing is toegestaan.
     """
 
-    bovenwoning = EenheiddetailsoortReferentiedata(
+    bovenwoning = EenheiddetailsoortReferentiedata.model_construct(
         code="BOV",
         naam="Bovenwoning",
         parent=Eenheidsoort.woonruimte,
@@ -101,7 +101,7 @@ class Eenheiddetailsoort(Referentiedatasoort):
     MGW-meergezinswoning)
     """
 
-    brede_school = EenheiddetailsoortReferentiedata(
+    brede_school = EenheiddetailsoortReferentiedata.model_construct(
         code="BRE",
         naam="Brede school",
         parent=Eenheidsoort.maatschappelijk_vastgoed,
@@ -111,7 +111,7 @@ class Eenheiddetailsoort(Referentiedatasoort):
     opvang, buurtsporthal, en -complex (zogeheten multifunctionele accommodaties)
     """
 
-    buurthuis = EenheiddetailsoortReferentiedata(
+    buurthuis = EenheiddetailsoortReferentiedata.model_construct(
         code="BUU",
         naam="Buurthuis",
         parent=Eenheidsoort.maatschappelijk_vastgoed,
@@ -121,7 +121,7 @@ class Eenheiddetailsoort(Referentiedatasoort):
     werk in en voor de buurt
     """
 
-    centrum_voor_jeugd_en_gezin = EenheiddetailsoortReferentiedata(
+    centrum_voor_jeugd_en_gezin = EenheiddetailsoortReferentiedata.model_construct(
         code="CJG",
         naam="Centrum voor Jeugd en Gezin",
         parent=Eenheidsoort.maatschappelijk_vastgoed,
@@ -130,7 +130,7 @@ class Eenheiddetailsoort(Referentiedatasoort):
     Centrum voor jeugd en gezin conform: art. 49 lid 2a
     """
 
-    corridorflat = EenheiddetailsoortReferentiedata(
+    corridorflat = EenheiddetailsoortReferentiedata.model_construct(
         code="COR",
         naam="Corridorflat",
         parent=Eenheidsoort.woonruimte,
@@ -141,7 +141,7 @@ class Eenheiddetailsoort(Referentiedatasoort):
     etage. (Voor marktwaarde bepaling: MGW-meergezinswoning)
     """
 
-    cultuur_ruimte = EenheiddetailsoortReferentiedata(
+    cultuur_ruimte = EenheiddetailsoortReferentiedata.model_construct(
         code="CUL",
         naam="Cultuur ruimte",
         parent=Eenheidsoort.maatschappelijk_vastgoed,
@@ -150,7 +150,7 @@ class Eenheiddetailsoort(Referentiedatasoort):
     Ruimten voor kleinschalige culturele activiteiten
     """
 
-    dagbestedingsruimte = EenheiddetailsoortReferentiedata(
+    dagbestedingsruimte = EenheiddetailsoortReferentiedata.model_construct(
         code="DAG",
         naam="Dagbestedingsruimte",
         parent=Eenheidsoort.maatschappelijk_vastgoed,
@@ -160,7 +160,7 @@ class Eenheiddetailsoort(Referentiedatasoort):
     zorginfrastructuur, die inpandig in een woonzorggebouw zijn gelegen
     """
 
-    eindwoning = EenheiddetailsoortReferentiedata(
+    eindwoning = EenheiddetailsoortReferentiedata.model_construct(
         code="EIN",
         naam="Eindwoning",
         parent=Eenheidsoort.woonruimte,
@@ -172,7 +172,7 @@ class Eenheiddetailsoort(Referentiedatasoort):
     marktwaarde bepaling: EGW-eengezinswoning)
     """
 
-    erfpachtkavel = EenheiddetailsoortReferentiedata(
+    erfpachtkavel = EenheiddetailsoortReferentiedata.model_construct(
         code="EPK",
         naam="Erfpachtkavel",
         parent=Eenheidsoort.overig,
@@ -181,13 +181,15 @@ class Eenheiddetailsoort(Referentiedatasoort):
     Kavels die gepacht zijn danwel verpacht worden
     """
 
-    fietsparkeerplaats_en_of_stalling = EenheiddetailsoortReferentiedata(
-        code="FIE",
-        naam="Fietsparkeerplaats/stalling",
-        parent=Eenheidsoort.overig,
+    fietsparkeerplaats_en_of_stalling = (
+        EenheiddetailsoortReferentiedata.model_construct(
+            code="FIE",
+            naam="Fietsparkeerplaats/stalling",
+            parent=Eenheidsoort.overig,
+        )
     )
 
-    galerijflat = EenheiddetailsoortReferentiedata(
+    galerijflat = EenheiddetailsoortReferentiedata.model_construct(
         code="GAL",
         naam="Galerijflat",
         parent=Eenheidsoort.woonruimte,
@@ -198,7 +200,7 @@ class Eenheiddetailsoort(Referentiedatasoort):
     woningen boven elkaar. (Voor marktwaarde bepaling: MGW-meergezinswoning)
     """
 
-    garage = EenheiddetailsoortReferentiedata(
+    garage = EenheiddetailsoortReferentiedata.model_construct(
         code="GAR",
         naam="Garage",
         parent=Eenheidsoort.parkeergelegenheid,
@@ -208,7 +210,7 @@ class Eenheiddetailsoort(Referentiedatasoort):
     op meer dan twee wielen.
     """
 
-    gemeenschapscentrum = EenheiddetailsoortReferentiedata(
+    gemeenschapscentrum = EenheiddetailsoortReferentiedata.model_construct(
         code="GEM",
         naam="Gemeenschapscentrum",
         parent=Eenheidsoort.maatschappelijk_vastgoed,
@@ -219,10 +221,12 @@ class Eenheiddetailsoort(Referentiedatasoort):
     lokale bevolking en met bijzondere aandacht voor de culturele diversiteit.
     """
 
-    geschakelde_twee_onder_een_kapwoning = EenheiddetailsoortReferentiedata(
-        code="GTW",
-        naam="Geschakelde Twee-onder-een-kapwoning",
-        parent=Eenheidsoort.woonruimte,
+    geschakelde_twee_onder_een_kapwoning = (
+        EenheiddetailsoortReferentiedata.model_construct(
+            code="GTW",
+            naam="Geschakelde Twee-onder-een-kapwoning",
+            parent=Eenheidsoort.woonruimte,
+        )
     )
     """
     Een geschakelde 2-onder-1-kapwoning is een 2-onder-1-kapwoning waarbij de muren van
@@ -232,7 +236,7 @@ class Eenheiddetailsoort(Referentiedatasoort):
     EGW-eengezinswoning)
     """
 
-    geschakelde_woning = EenheiddetailsoortReferentiedata(
+    geschakelde_woning = EenheiddetailsoortReferentiedata.model_construct(
         code="GWO",
         naam="Geschakelde woning",
         parent=Eenheidsoort.woonruimte,
@@ -243,7 +247,7 @@ class Eenheiddetailsoort(Referentiedatasoort):
     marktwaarde bepaling: EGW-eengezinswoning)
     """
 
-    half_vrijstaande_woning = EenheiddetailsoortReferentiedata(
+    half_vrijstaande_woning = EenheiddetailsoortReferentiedata.model_construct(
         code="HAL",
         naam="Half vrijstaande woning",
         parent=Eenheidsoort.woonruimte,
@@ -256,7 +260,7 @@ class Eenheiddetailsoort(Referentiedatasoort):
     2-onder-1-kapwoning). (Voor marktwaarde bepaling: EGW-eengezinswoning)
     """
 
-    herenhuis = EenheiddetailsoortReferentiedata(
+    herenhuis = EenheiddetailsoortReferentiedata.model_construct(
         code="HER",
         naam="Herenhuis",
         parent=Eenheidsoort.woonruimte,
@@ -269,7 +273,7 @@ class Eenheiddetailsoort(Referentiedatasoort):
     beter uitgevoerde nieuwbouwwoning aangeduid.
     """
 
-    hoekwoning = EenheiddetailsoortReferentiedata(
+    hoekwoning = EenheiddetailsoortReferentiedata.model_construct(
         code="HOE",
         naam="Hoekwoning",
         parent=Eenheidsoort.woonruimte,
@@ -281,13 +285,13 @@ class Eenheiddetailsoort(Referentiedatasoort):
     bepaling: EGW-eengezinswoning)
     """
 
-    horeca = EenheiddetailsoortReferentiedata(
+    horeca = EenheiddetailsoortReferentiedata.model_construct(
         code="HOR",
         naam="Horeca",
         parent=Eenheidsoort.bedrijfsruimte,
     )
 
-    hospice = EenheiddetailsoortReferentiedata(
+    hospice = EenheiddetailsoortReferentiedata.model_construct(
         code="HOS",
         naam="Hospice",
         parent=Eenheidsoort.maatschappelijk_vastgoed,
@@ -296,7 +300,7 @@ class Eenheiddetailsoort(Referentiedatasoort):
     Woongelegenheid voor personen die niet meer kunnen genezen.
     """
 
-    jongerencentrum = EenheiddetailsoortReferentiedata(
+    jongerencentrum = EenheiddetailsoortReferentiedata.model_construct(
         code="JON",
         naam="Jongerencentrum",
         parent=Eenheidsoort.maatschappelijk_vastgoed,
@@ -305,7 +309,7 @@ class Eenheiddetailsoort(Referentiedatasoort):
     Jongerencentrum, mits zonder horecavoorziening
     """
 
-    kamer = EenheiddetailsoortReferentiedata(
+    kamer = EenheiddetailsoortReferentiedata.model_construct(
         code="KAM",
         naam="Kamer",
         parent=Eenheidsoort.woonruimte,
@@ -315,7 +319,7 @@ class Eenheiddetailsoort(Referentiedatasoort):
     toilet met de bewoners van andere woningen/kamers.
     """
 
-    kantoorruimte = EenheiddetailsoortReferentiedata(
+    kantoorruimte = EenheiddetailsoortReferentiedata.model_construct(
         code="KAN",
         naam="Kantoorruimte",
         parent=Eenheidsoort.bedrijfsruimte,
@@ -325,7 +329,7 @@ class Eenheiddetailsoort(Referentiedatasoort):
     kantoorruimte van een toegelaten instelling eenheiddetailssoort KTI.
     """
 
-    kangoeroewoning = EenheiddetailsoortReferentiedata(
+    kangoeroewoning = EenheiddetailsoortReferentiedata.model_construct(
         code="KNG",
         naam="Kangoeroewoning",
         parent=Eenheidsoort.woonruimte,
@@ -339,7 +343,7 @@ class Eenheiddetailsoort(Referentiedatasoort):
     woonkamer.
     """
 
-    kinderopvanglocatie = EenheiddetailsoortReferentiedata(
+    kinderopvanglocatie = EenheiddetailsoortReferentiedata.model_construct(
         code="KIN",
         naam="Kinderopvanglocatie",
         parent=Eenheidsoort.bedrijfsruimte,
@@ -349,17 +353,19 @@ class Eenheiddetailsoort(Referentiedatasoort):
     24-uursopvang (Bouwbesluit 2012)
     """
 
-    kantoorruimte_van_toegelaten_instelling = EenheiddetailsoortReferentiedata(
-        code="KTI",
-        naam="Kantoorruimte van toegelaten instelling",
-        parent=Eenheidsoort.maatschappelijk_vastgoed,
+    kantoorruimte_van_toegelaten_instelling = (
+        EenheiddetailsoortReferentiedata.model_construct(
+            code="KTI",
+            naam="Kantoorruimte van toegelaten instelling",
+            parent=Eenheidsoort.maatschappelijk_vastgoed,
+        )
     )
     """
     Kantoorruimte van toegelaten instelling, als zodanig vallend onder Maatschappelijk
     vastgoed (MOG).
     """
 
-    lichamelijk_beperkten_instelling = EenheiddetailsoortReferentiedata(
+    lichamelijk_beperkten_instelling = EenheiddetailsoortReferentiedata.model_construct(
         code="LGI",
         naam="Lichamelijk beperkten instelling",
         parent=Eenheidsoort.intramuraal_zorgvastgoed,
@@ -368,7 +374,7 @@ class Eenheiddetailsoort(Referentiedatasoort):
     Instelling voor mensen met een lichamelijke beperking.
     """
 
-    ligplaats = EenheiddetailsoortReferentiedata(
+    ligplaats = EenheiddetailsoortReferentiedata.model_construct(
         code="LIG",
         naam="Ligplaats",
         parent=Eenheidsoort.overig,
@@ -380,17 +386,19 @@ class Eenheiddetailsoort(Referentiedatasoort):
     bedrijfsmatige of recreatieve doeleinden geschikt vaartuig.
     """
 
-    lichamelijk_en_geestelijk_beperkten_instelling = EenheiddetailsoortReferentiedata(
-        code="LVG",
-        naam="Lichamelijk en geestelijk beperkten instelling",
-        parent=Eenheidsoort.intramuraal_zorgvastgoed,
+    lichamelijk_en_geestelijk_beperkten_instelling = (
+        EenheiddetailsoortReferentiedata.model_construct(
+            code="LVG",
+            naam="Lichamelijk en geestelijk beperkten instelling",
+            parent=Eenheidsoort.intramuraal_zorgvastgoed,
+        )
     )
     """
     Instelling voor mensen met een lichamelijke en/of verstandelijke beperking.
     """
 
     maatschappelijk_werkruimte_wijk_en_of_buurtgericht = (
-        EenheiddetailsoortReferentiedata(
+        EenheiddetailsoortReferentiedata.model_construct(
             code="MAA",
             naam="Maatschappelijk werkruimte wijk-/buurtgericht",
             parent=Eenheidsoort.maatschappelijk_vastgoed,
@@ -401,7 +409,7 @@ class Eenheiddetailsoort(Referentiedatasoort):
     verenigingen
     """
 
-    maisonette = EenheiddetailsoortReferentiedata(
+    maisonette = EenheiddetailsoortReferentiedata.model_construct(
         code="MAI",
         naam="Maisonette",
         parent=Eenheidsoort.woonruimte,
@@ -413,7 +421,7 @@ class Eenheiddetailsoort(Referentiedatasoort):
     (Voor marktwaarde bepaling: MGW-meergezinswoning)
     """
 
-    multifunctionele_centrum = EenheiddetailsoortReferentiedata(
+    multifunctionele_centrum = EenheiddetailsoortReferentiedata.model_construct(
         code="MUL",
         naam="Multifunctionele centrum",
         parent=Eenheidsoort.maatschappelijk_vastgoed,
@@ -423,7 +431,7 @@ class Eenheiddetailsoort(Referentiedatasoort):
     """
 
     maatschappelijk_werkruimte_niet_wijk_of_buurtgericht = (
-        EenheiddetailsoortReferentiedata(
+        EenheiddetailsoortReferentiedata.model_construct(
             code="MWR",
             naam="Maatschappelijk werkruimte niet-wijk- of buurtgericht",
             parent=Eenheidsoort.maatschappelijk_vastgoed,
@@ -434,7 +442,7 @@ class Eenheiddetailsoort(Referentiedatasoort):
     of verenigingen
     """
 
-    opvangcentrum = EenheiddetailsoortReferentiedata(
+    opvangcentrum = EenheiddetailsoortReferentiedata.model_construct(
         code="OPV",
         naam="Opvangcentrum",
         parent=Eenheidsoort.maatschappelijk_vastgoed,
@@ -444,7 +452,7 @@ class Eenheiddetailsoort(Referentiedatasoort):
     thuislozen en verslaafden)
     """
 
-    parkeerplaats_motor = EenheiddetailsoortReferentiedata(
+    parkeerplaats_motor = EenheiddetailsoortReferentiedata.model_construct(
         code="PAM",
         naam="Parkeerplaats motor",
         parent=Eenheidsoort.parkeergelegenheid,
@@ -455,13 +463,13 @@ class Eenheiddetailsoort(Referentiedatasoort):
     (abonnement e.d.) valt niet onder de definitie.
     """
 
-    parkeerplaats_overdekt = EenheiddetailsoortReferentiedata(
+    parkeerplaats_overdekt = EenheiddetailsoortReferentiedata.model_construct(
         code="PAO",
         naam="Parkeerplaats overdekt",
         parent=Eenheidsoort.parkeergelegenheid,
     )
 
-    parkeerplaats_auto = EenheiddetailsoortReferentiedata(
+    parkeerplaats_auto = EenheiddetailsoortReferentiedata.model_construct(
         code="PAR",
         naam="Parkeerplaats auto",
         parent=Eenheidsoort.parkeergelegenheid,
@@ -472,7 +480,7 @@ class Eenheiddetailsoort(Referentiedatasoort):
     (abonnement e.d.) valt niet onder de definitie.
     """
 
-    portiekflat = EenheiddetailsoortReferentiedata(
+    portiekflat = EenheiddetailsoortReferentiedata.model_construct(
         code="POF",
         naam="Portiekflat",
         parent=Eenheidsoort.woonruimte,
@@ -483,7 +491,7 @@ class Eenheiddetailsoort(Referentiedatasoort):
     portiek. (Voor marktwaarde bepaling: MGW-meergezinswoning)
     """
 
-    portiekwoning = EenheiddetailsoortReferentiedata(
+    portiekwoning = EenheiddetailsoortReferentiedata.model_construct(
         code="POW",
         naam="Portiekwoning",
         parent=Eenheidsoort.woonruimte,
@@ -496,7 +504,7 @@ class Eenheiddetailsoort(Referentiedatasoort):
     bordessen. (Voor marktwaarde bepaling: MGW-meergezinswoning )
     """
 
-    praktijkruimte = EenheiddetailsoortReferentiedata(
+    praktijkruimte = EenheiddetailsoortReferentiedata.model_construct(
         code="PRA",
         naam="Praktijkruimte",
         parent=Eenheidsoort.bedrijfsruimte,
@@ -506,7 +514,7 @@ class Eenheiddetailsoort(Referentiedatasoort):
     toilet) en behandelkamer.
     """
 
-    praktijkwoning = EenheiddetailsoortReferentiedata(
+    praktijkwoning = EenheiddetailsoortReferentiedata.model_construct(
         code="PRW",
         naam="Praktijkwoning",
         parent=Eenheidsoort.woonruimte,
@@ -516,7 +524,7 @@ class Eenheiddetailsoort(Referentiedatasoort):
     beroep aan huis (tandarts, huisarts, fysio, atelier, e.d.).
     """
 
-    psychische_zorginstelling = EenheiddetailsoortReferentiedata(
+    psychische_zorginstelling = EenheiddetailsoortReferentiedata.model_construct(
         code="PZI",
         naam="Psychische zorginstelling",
         parent=Eenheidsoort.intramuraal_zorgvastgoed,
@@ -525,7 +533,7 @@ class Eenheiddetailsoort(Referentiedatasoort):
     Instelling voor psychische zorg
     """
 
-    recreatiewoning = EenheiddetailsoortReferentiedata(
+    recreatiewoning = EenheiddetailsoortReferentiedata.model_construct(
         code="REC",
         naam="Recreatiewoning",
         parent=Eenheidsoort.recreatiebestemming,
@@ -534,7 +542,7 @@ class Eenheiddetailsoort(Referentiedatasoort):
     Woning met een recreatiebestemming en niet bedoeld voor permanente bewoning.
     """
 
-    recreatiezaal = EenheiddetailsoortReferentiedata(
+    recreatiezaal = EenheiddetailsoortReferentiedata.model_construct(
         code="REZ",
         naam="Recreatiezaal",
         parent=Eenheidsoort.maatschappelijk_vastgoed,
@@ -544,7 +552,7 @@ class Eenheiddetailsoort(Referentiedatasoort):
     wooncomplex.
     """
 
-    schoolgebouw = EenheiddetailsoortReferentiedata(
+    schoolgebouw = EenheiddetailsoortReferentiedata.model_construct(
         code="SCH",
         naam="Schoolgebouw",
         parent=Eenheidsoort.maatschappelijk_vastgoed,
@@ -553,13 +561,13 @@ class Eenheiddetailsoort(Referentiedatasoort):
     Vmbo-mbo-scholen, vwo-scholen, schoolgebouwen voor speciaal onderwijs.
     """
 
-    scootmobielplek = EenheiddetailsoortReferentiedata(
+    scootmobielplek = EenheiddetailsoortReferentiedata.model_construct(
         code="SCO",
         naam="Scootmobielplek",
         parent=Eenheidsoort.parkeergelegenheid,
     )
 
-    steunpunt = EenheiddetailsoortReferentiedata(
+    steunpunt = EenheiddetailsoortReferentiedata.model_construct(
         code="STP",
         naam="Steunpunt",
         parent=Eenheidsoort.maatschappelijk_vastgoed,
@@ -569,7 +577,7 @@ class Eenheiddetailsoort(Referentiedatasoort):
     problemen
     """
 
-    tijdelijke_woning = EenheiddetailsoortReferentiedata(
+    tijdelijke_woning = EenheiddetailsoortReferentiedata.model_construct(
         code="TIJ",
         naam="Tijdelijke woning",
         parent=Eenheidsoort.woonruimte,
@@ -580,7 +588,7 @@ class Eenheiddetailsoort(Referentiedatasoort):
     duplexwoningen.
     """
 
-    tiny_house = EenheiddetailsoortReferentiedata(
+    tiny_house = EenheiddetailsoortReferentiedata.model_construct(
         code="TIN",
         naam="Tiny house",
         parent=Eenheidsoort.woonruimte,
@@ -591,7 +599,7 @@ class Eenheiddetailsoort(Referentiedatasoort):
     een (tijdelijke) fundering of op wielen.
     """
 
-    tussenwoning = EenheiddetailsoortReferentiedata(
+    tussenwoning = EenheiddetailsoortReferentiedata.model_construct(
         code="TUS",
         naam="Tussenwoning",
         parent=Eenheidsoort.woonruimte,
@@ -604,7 +612,7 @@ class Eenheiddetailsoort(Referentiedatasoort):
     marktwaarde bepaling: EGW-eengezinswoning)
     """
 
-    twee_onder_een_kapwoning = EenheiddetailsoortReferentiedata(
+    twee_onder_een_kapwoning = EenheiddetailsoortReferentiedata.model_construct(
         code="TWE",
         naam="Twee-onder-een-kapwoning",
         parent=Eenheidsoort.woonruimte,
@@ -619,7 +627,7 @@ class Eenheiddetailsoort(Referentiedatasoort):
     bepaling: EGW-eengezinswoning).
     """
 
-    veiligheidshuis = EenheiddetailsoortReferentiedata(
+    veiligheidshuis = EenheiddetailsoortReferentiedata.model_construct(
         code="VEI",
         naam="Veiligheidshuis",
         parent=Eenheidsoort.maatschappelijk_vastgoed,
@@ -630,16 +638,18 @@ class Eenheiddetailsoort(Referentiedatasoort):
     huiselijk geweld en criminaliteit.
     """
 
-    verstandelijk_gehandicapten_instelling = EenheiddetailsoortReferentiedata(
-        code="VGI",
-        naam="Verstandelijk gehandicapten instelling",
-        parent=Eenheidsoort.intramuraal_zorgvastgoed,
+    verstandelijk_gehandicapten_instelling = (
+        EenheiddetailsoortReferentiedata.model_construct(
+            code="VGI",
+            naam="Verstandelijk gehandicapten instelling",
+            parent=Eenheidsoort.intramuraal_zorgvastgoed,
+        )
     )
     """
     Instelling voor mensen met een verstandelijke beperking.
     """
 
-    volkstuin = EenheiddetailsoortReferentiedata(
+    volkstuin = EenheiddetailsoortReferentiedata.model_construct(
         code="VOL",
         naam="Volkstuin",
         parent=Eenheidsoort.overig,
@@ -648,7 +658,7 @@ class Eenheiddetailsoort(Referentiedatasoort):
     Gehuurd stukje grond waarop je planten, groenten en fruit kunt laten groeien
     """
 
-    verpleeghuis = EenheiddetailsoortReferentiedata(
+    verpleeghuis = EenheiddetailsoortReferentiedata.model_construct(
         code="VPL",
         naam="Verpleeghuis",
         parent=Eenheidsoort.intramuraal_zorgvastgoed,
@@ -659,7 +669,7 @@ class Eenheiddetailsoort(Referentiedatasoort):
     in het verzorgingshuis niet (voldoende) kunnen krijgen
     """
 
-    vrijstaande_woning = EenheiddetailsoortReferentiedata(
+    vrijstaande_woning = EenheiddetailsoortReferentiedata.model_construct(
         code="VRI",
         naam="Vrijstaande woning",
         parent=Eenheidsoort.woonruimte,
@@ -669,7 +679,7 @@ class Eenheiddetailsoort(Referentiedatasoort):
     aanwezige andere objecten. (Voor marktwaarde bepaling: EGW-eengezinswoning)
     """
 
-    verzorgingshuis = EenheiddetailsoortReferentiedata(
+    verzorgingshuis = EenheiddetailsoortReferentiedata.model_construct(
         code="VZO",
         naam="Verzorgingshuis",
         parent=Eenheidsoort.intramuraal_zorgvastgoed,
@@ -680,7 +690,7 @@ class Eenheiddetailsoort(Referentiedatasoort):
     ook niet met hulp van naasten, mantelzorg of thuiszorg.
     """
 
-    waterwoning = EenheiddetailsoortReferentiedata(
+    waterwoning = EenheiddetailsoortReferentiedata.model_construct(
         code="WAT",
         naam="Waterwoning",
         parent=Eenheidsoort.woonruimte,
@@ -692,17 +702,19 @@ class Eenheiddetailsoort(Referentiedatasoort):
     bepaling: EGW-eengezinswoning)
     """
 
-    welzijnswerkruimte_wijk_en_of_buurtgericht = EenheiddetailsoortReferentiedata(
-        code="WEL",
-        naam="Welzijnswerkruimte wijk-/buurtgericht",
-        parent=Eenheidsoort.maatschappelijk_vastgoed,
+    welzijnswerkruimte_wijk_en_of_buurtgericht = (
+        EenheiddetailsoortReferentiedata.model_construct(
+            code="WEL",
+            naam="Welzijnswerkruimte wijk-/buurtgericht",
+            parent=Eenheidsoort.maatschappelijk_vastgoed,
+        )
     )
     """
     Ruimte voor op de buurt of wijk gerichte activiteiten op het gebied van welzijnswerk
     door stichtingen of verenigingen
     """
 
-    centrum_voor_werk = EenheiddetailsoortReferentiedata(
+    centrum_voor_werk = EenheiddetailsoortReferentiedata.model_construct(
         code="WER",
         naam="Centrum voor werk",
         parent=Eenheidsoort.maatschappelijk_vastgoed,
@@ -711,19 +723,19 @@ class Eenheiddetailsoort(Referentiedatasoort):
     Centrum voor werk(gelegenheid) en/of bevordering van bedrijvigheid in de wijk
     """
 
-    wijksportvoorziening = EenheiddetailsoortReferentiedata(
+    wijksportvoorziening = EenheiddetailsoortReferentiedata.model_construct(
         code="WIJ",
         naam="Wijksportvoorziening",
         parent=Eenheidsoort.maatschappelijk_vastgoed,
     )
 
-    winkelruimte = EenheiddetailsoortReferentiedata(
+    winkelruimte = EenheiddetailsoortReferentiedata.model_construct(
         code="WIR",
         naam="Winkelruimte",
         parent=Eenheidsoort.bedrijfsruimte,
     )
 
-    woonboot = EenheiddetailsoortReferentiedata(
+    woonboot = EenheiddetailsoortReferentiedata.model_construct(
         code="WOB",
         naam="Woonboot",
         parent=Eenheidsoort.woonruimte,
@@ -734,7 +746,7 @@ class Eenheiddetailsoort(Referentiedatasoort):
     met walaansluiting en niet direct geschikt om als vervoermiddel te gebruiken.
     """
 
-    woonwagen = EenheiddetailsoortReferentiedata(
+    woonwagen = EenheiddetailsoortReferentiedata.model_construct(
         code="WOW",
         naam="Woonwagen",
         parent=Eenheidsoort.woonruimte,
@@ -748,7 +760,7 @@ class Eenheiddetailsoort(Referentiedatasoort):
     verkeersregels en verkeerstekens is vereist.
     """
 
-    woon_en_of_winkelpand = EenheiddetailsoortReferentiedata(
+    woon_en_of_winkelpand = EenheiddetailsoortReferentiedata.model_construct(
         code="WWI",
         naam="Woon-/Winkelpand",
         parent=Eenheidsoort.bedrijfsruimte,
@@ -764,7 +776,7 @@ class Eenheiddetailsoort(Referentiedatasoort):
     onderling bereikbaar.
     """
 
-    woonwagenstandplaats = EenheiddetailsoortReferentiedata(
+    woonwagenstandplaats = EenheiddetailsoortReferentiedata.model_construct(
         code="WWP",
         naam="Woonwagenstandplaats",
         parent=Eenheidsoort.overig,
@@ -778,23 +790,25 @@ class Eenheiddetailsoort(Referentiedatasoort):
     recreatieve standplaats door de eigenaar van het terrein.
     """
 
-    welzijnswerkruimte_niet_wijk_of_buurtgericht = EenheiddetailsoortReferentiedata(
-        code="WWR",
-        naam="Welzijnswerkruimte niet-wijk- of buurtgericht",
-        parent=Eenheidsoort.maatschappelijk_vastgoed,
+    welzijnswerkruimte_niet_wijk_of_buurtgericht = (
+        EenheiddetailsoortReferentiedata.model_construct(
+            code="WWR",
+            naam="Welzijnswerkruimte niet-wijk- of buurtgericht",
+            parent=Eenheidsoort.maatschappelijk_vastgoed,
+        )
     )
     """
     Ruimten voor niet op de buurt of wijk gerichte activiteiten op het gebied van
     welzijnswerk door stichtingen of verenigingen
     """
 
-    ziekenhuis = EenheiddetailsoortReferentiedata(
+    ziekenhuis = EenheiddetailsoortReferentiedata.model_construct(
         code="ZIE",
         naam="Ziekenhuis",
         parent=Eenheidsoort.intramuraal_zorgvastgoed,
     )
 
-    zorgsteunpunt = EenheiddetailsoortReferentiedata(
+    zorgsteunpunt = EenheiddetailsoortReferentiedata.model_construct(
         code="ZST",
         naam="Zorgsteunpunt",
         parent=Eenheidsoort.maatschappelijk_vastgoed,
@@ -10,7 +10,7 @@ class EenheiddetailstatusReferentiedata(Referentiedata):
 
 
 class Eenheiddetailstatus(Referentiedatasoort):
-    verhuurd_antikraak = EenheiddetailstatusReferentiedata(
+    verhuurd_antikraak = EenheiddetailstatusReferentiedata.model_construct(
         code="ANT",
         naam="Verhuurd antikraak",
         parent=Eenheidstatus.verhuurd,
@@ -19,7 +19,7 @@ class Eenheiddetailstatus(Referentiedatasoort):
     De eenheid wordt verhuurd onder de voorwaarden van anti-kraak
     """
 
-    bouwplannen = EenheiddetailstatusReferentiedata(
+    bouwplannen = EenheiddetailstatusReferentiedata.model_construct(
         code="BOU",
         naam="Bouwplannen",
         parent=Eenheidstatus.in_ontwikkeling,
@@ -28,7 +28,7 @@ class Eenheiddetailstatus(Referentiedatasoort):
     Eenheid is in ontwikkeling, nog in de planfase
     """
 
-    bruikleen = EenheiddetailstatusReferentiedata(
+    bruikleen = EenheiddetailstatusReferentiedata.model_construct(
         code="BRU",
         naam="Bruikleen",
         parent=Eenheidstatus.verhuurd,
@@ -37,17 +37,19 @@ class Eenheiddetailstatus(Referentiedatasoort):
     De eenheid wordt verhuurd onder een bruikleen constructie
     """
 
-    wacht_op_energie_prestatie_advies = EenheiddetailstatusReferentiedata(
-        code="EPA",
-        naam="Wacht op Energie Prestatie Advies",
-        parent=Eenheidstatus.leegstand,
+    wacht_op_energie_prestatie_advies = (
+        EenheiddetailstatusReferentiedata.model_construct(
+            code="EPA",
+            naam="Wacht op Energie Prestatie Advies",
+            parent=Eenheidstatus.leegstand,
+        )
     )
     """
     Frictieleegstand, ontstaan doordat er nog gewacht wordt op de afgifte van een EPA
     label
     """
 
-    mutatie = EenheiddetailstatusReferentiedata(
+    mutatie = EenheiddetailstatusReferentiedata.model_construct(
         code="MUT",
         naam="Mutatie",
         parent=Eenheidstatus.leegstand,
@@ -58,10 +60,12 @@ class Eenheiddetailstatus(Referentiedatasoort):
     woning plaatsvindt.
     """
 
-    wacht_op_nieuwe_huurder_niet_regulier = EenheiddetailstatusReferentiedata(
-        code="NIB",
-        naam="Wacht op nieuwe huurder - niet-regulier",
-        parent=Eenheidstatus.leegstand,
+    wacht_op_nieuwe_huurder_niet_regulier = (
+        EenheiddetailstatusReferentiedata.model_construct(
+            code="NIB",
+            naam="Wacht op nieuwe huurder - niet-regulier",
+            parent=Eenheidstatus.leegstand,
+        )
     )
     """
     Frictieleegstand, ontstaan doordat er nog geen nieuwe huurder is gevonden, waarbij
@@ -71,7 +75,7 @@ class Eenheiddetailstatus(Referentiedatasoort):
     totdat de overeenkomst met een nieuwe, niet-reguliere, huurder ingaat.
     """
 
-    nieuwbouw = EenheiddetailstatusReferentiedata(
+    nieuwbouw = EenheiddetailstatusReferentiedata.model_construct(
         code="NIE",
         naam="Nieuwbouw",
         parent=Eenheidstatus.in_ontwikkeling,
@@ -80,10 +84,12 @@ class Eenheiddetailstatus(Referentiedatasoort):
     Eenheid is in ontwikkeling, realisatie-/bouwfase is gestart
     """
 
-    wacht_op_nieuwe_huurder_regulier = EenheiddetailstatusReferentiedata(
-        code="NIH",
-        naam="Wacht op nieuwe huurder - regulier",
-        parent=Eenheidstatus.leegstand,
+    wacht_op_nieuwe_huurder_regulier = (
+        EenheiddetailstatusReferentiedata.model_construct(
+            code="NIH",
+            naam="Wacht op nieuwe huurder - regulier",
+            parent=Eenheidstatus.leegstand,
+        )
     )
     """
     Frictieleegstand, ontstaan doordat er nog geen nieuwe huurder is gevonden, zonder
@@ -93,7 +99,7 @@ class Eenheiddetailstatus(Referentiedatasoort):
     overeenkomst met een nieuwe huurder ingaat.
     """
 
-    oplevering = EenheiddetailstatusReferentiedata(
+    oplevering = EenheiddetailstatusReferentiedata.model_construct(
         code="OPL",
         naam="Oplevering",
         parent=Eenheidstatus.in_ontwikkeling,
@@ -102,7 +108,7 @@ class Eenheiddetailstatus(Referentiedatasoort):
     Eenheid is in ontwikkeling, klaar voor oplevering
     """
 
-    verhuurd_permanent = EenheiddetailstatusReferentiedata(
+    verhuurd_permanent = EenheiddetailstatusReferentiedata.model_construct(
         code="PER",
         naam="Verhuurd permanent",
         parent=Eenheidstatus.verhuurd,
@@ -111,7 +117,7 @@ class Eenheiddetailstatus(Referentiedatasoort):
     Doorlopend contract of voor onbepaalde tijd.
     """
 
-    projectleegstand = EenheiddetailstatusReferentiedata(
+    projectleegstand = EenheiddetailstatusReferentiedata.model_construct(
         code="PRO",
         naam="Projectleegstand",
         parent=Eenheidstatus.leegstand,
@@ -121,7 +127,7 @@ class Eenheiddetailstatus(Referentiedatasoort):
     waarbij de eenheid niet uit exploitatie wordt genomen
     """
 
-    structurele_leegstand = EenheiddetailstatusReferentiedata(
+    structurele_leegstand = EenheiddetailstatusReferentiedata.model_construct(
         code="STR",
         naam="Structurele leegstand",
         parent=Eenheidstatus.leegstand,
@@ -131,7 +137,7 @@ class Eenheiddetailstatus(Referentiedatasoort):
     aansluiten
     """
 
-    verhuurd_tijdelijk = EenheiddetailstatusReferentiedata(
+    verhuurd_tijdelijk = EenheiddetailstatusReferentiedata.model_construct(
         code="TIJD",
         naam="Verhuurd tijdelijk",
         parent=Eenheidstatus.verhuurd,
@@ -141,7 +147,7 @@ class Eenheiddetailstatus(Referentiedatasoort):
     constructie)
     """
 
-    verkoop = EenheiddetailstatusReferentiedata(
+    verkoop = EenheiddetailstatusReferentiedata.model_construct(
         code="VEK",
         naam="Verkoop",
         parent=Eenheidstatus.leegstand,
@@ -151,7 +157,7 @@ class Eenheiddetailstatus(Referentiedatasoort):
     exploitatie is.
     """
 
-    vergunning_verleend = EenheiddetailstatusReferentiedata(
+    vergunning_verleend = EenheiddetailstatusReferentiedata.model_construct(
         code="VER",
         naam="Vergunning verleend",
         parent=Eenheidstatus.in_ontwikkeling,
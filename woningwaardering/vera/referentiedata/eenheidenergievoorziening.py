@@ -7,7 +7,7 @@ class EenheidenergievoorzieningReferentiedata(Referentiedata):
 
 
 class Eenheidenergievoorziening(Referentiedatasoort):
-    gasloze_eenheid = EenheidenergievoorzieningReferentiedata(
+    gasloze_eenheid = EenheidenergievoorzieningReferentiedata.model_construct(
         code="GLO",
         naam="Gasloze eenheid",
     )
@@ -15,7 +15,7 @@ class Eenheidenergievoorziening(Referentiedatasoort):
     Kenmerk om aan te geven dat de eenheid géén gasaansluiting heeft
     """
 
-    nul_op_de_meter_eenheid = EenheidenergievoorzieningReferentiedata(
+    nul_op_de_meter_eenheid = EenheidenergievoorzieningReferentiedata.model_construct(
         code="NOM",
         naam="Nul-op-de-meter eenheid",
     )
@@ -23,7 +23,7 @@ class Eenheidenergievoorziening(Referentiedatasoort):
     De eenheid voldoet aan de criteria voor nul-op-de-meter
     """
 
-    oplaadpunt = EenheidenergievoorzieningReferentiedata(
+    oplaadpunt = EenheidenergievoorzieningReferentiedata.model_construct(
         code="OPL",
         naam="Oplaadpunt",
     )
@@ -31,7 +31,7 @@ class Eenheidenergievoorziening(Referentiedatasoort):
     Oplaadpunt voor auto
     """
 
-    oplaadpunt_scootmobiel = EenheidenergievoorzieningReferentiedata(
+    oplaadpunt_scootmobiel = EenheidenergievoorzieningReferentiedata.model_construct(
         code="OPS",
         naam="Oplaadpunt scootmobiel",
     )
@@ -41,7 +41,7 @@ class Eenheidenergievoorziening(Referentiedatasoort):
     Eenheiddetailsoort Scootmobielplek
     """
 
-    zonnepanelen = EenheidenergievoorzieningReferentiedata(
+    zonnepanelen = EenheidenergievoorzieningReferentiedata.model_construct(
         code="ZON",
         naam="Zonnepanelen",
     )
@@ -7,27 +7,27 @@ class EenheidinterieurReferentiedata(Referentiedata):
 
 
 class Eenheidinterieur(Referentiedatasoort):
-    gemeubileerd = EenheidinterieurReferentiedata(
+    gemeubileerd = EenheidinterieurReferentiedata.model_construct(
         code="GEM",
         naam="Gemeubileerd",
     )
 
-    gestoffeerd = EenheidinterieurReferentiedata(
+    gestoffeerd = EenheidinterieurReferentiedata.model_construct(
         code="GES",
         naam="Gestoffeerd",
     )
 
-    houten_vloer = EenheidinterieurReferentiedata(
+    houten_vloer = EenheidinterieurReferentiedata.model_construct(
         code="HOU",
         naam="Houten vloer",
     )
 
-    laminaat = EenheidinterieurReferentiedata(
+    laminaat = EenheidinterieurReferentiedata.model_construct(
         code="LAM",
         naam="Laminaat",
     )
 
-    plavuizen = EenheidinterieurReferentiedata(
+    plavuizen = EenheidinterieurReferentiedata.model_construct(
         code="PLA",
         naam="Plavuizen",
     )
@@ -35,7 +35,7 @@ class Eenheidinterieur(Referentiedatasoort):
     Plavuizen of tegels
     """
 
-    pvc_vloer = EenheidinterieurReferentiedata(
+    pvc_vloer = EenheidinterieurReferentiedata.model_construct(
         code="PVC",
         naam="Pvc vloer",
     )
@@ -45,12 +45,12 @@ class Eenheidinterieur(Referentiedatasoort):
     en veelzijdigheid.
     """
 
-    vloerbedekking = EenheidinterieurReferentiedata(
+    vloerbedekking = EenheidinterieurReferentiedata.model_construct(
         code="VLB",
         naam="Vloerbedekking",
     )
 
-    zelf_inrichten = EenheidinterieurReferentiedata(
+    zelf_inrichten = EenheidinterieurReferentiedata.model_construct(
         code="ZEL",
         naam="Zelf inrichten",
     )
@@ -7,12 +7,12 @@ class EenheidisolatieReferentiedata(Referentiedata):
 
 
 class Eenheidisolatie(Referentiedatasoort):
-    dakisolatie = EenheidisolatieReferentiedata(
+    dakisolatie = EenheidisolatieReferentiedata.model_construct(
         code="DAK",
         naam="Dakisolatie",
     )
 
-    normaal_dubbelglas = EenheidisolatieReferentiedata(
+    normaal_dubbelglas = EenheidisolatieReferentiedata.model_construct(
         code="DGL",
         naam="Normaal dubbelglas",
     )
@@ -20,7 +20,7 @@ class Eenheidisolatie(Referentiedatasoort):
     Dubbel glas waarbij de spouw tussen de glasplaten is gevuld met droge lucht.
     """
 
-    hr_glas = EenheidisolatieReferentiedata(
+    hr_glas = EenheidisolatieReferentiedata.model_construct(
         code="HR",
         naam="HR-glas",
     )
@@ -29,7 +29,7 @@ class Eenheidisolatie(Referentiedatasoort):
     droge lucht.
     """
 
-    hr1 = EenheidisolatieReferentiedata(
+    hr1 = EenheidisolatieReferentiedata.model_construct(
         code="HR1",
         naam="HR+ glas",
     )
@@ -38,7 +38,7 @@ class Eenheidisolatie(Referentiedatasoort):
     spouw.
     """
 
-    hr2 = EenheidisolatieReferentiedata(
+    hr2 = EenheidisolatieReferentiedata.model_construct(
         code="HR2",
         naam="HR++ glas",
     )
@@ -46,7 +46,7 @@ class Eenheidisolatie(Referentiedatasoort):
     Dit is dubbelglas heeft een spouw die gevuld is met gas, meestal argon.
     """
 
-    hr3 = EenheidisolatieReferentiedata(
+    hr3 = EenheidisolatieReferentiedata.model_construct(
         code="HR3",
         naam="HR+++ glas",
     )
@@ -54,7 +54,7 @@ class Eenheidisolatie(Referentiedatasoort):
     Dit is driedubbel glas met twee spouwen gevuld met gas.
     """
 
-    eco_bouw = EenheidisolatieReferentiedata(
+    eco_bouw = EenheidisolatieReferentiedata.model_construct(
         code="ECO",
         naam="Eco-bouw",
     )
@@ -62,12 +62,12 @@ class Eenheidisolatie(Referentiedatasoort):
     Ecologische, duurzame bouw
     """
 
-    gedeeltelijk_dubbel_glas = EenheidisolatieReferentiedata(
+    gedeeltelijk_dubbel_glas = EenheidisolatieReferentiedata.model_construct(
         code="GDG",
         naam="Gedeeltelijk dubbel glas",
     )
 
-    toekomstklaar = EenheidisolatieReferentiedata(
+    toekomstklaar = EenheidisolatieReferentiedata.model_construct(
         code="TOE",
         naam="Toekomstklaar",
     )
@@ -76,7 +76,7 @@ class Eenheidisolatie(Referentiedatasoort):
     derwerpen/wetten-en-regels-gebouwen/standaard-streefwaarden-woningisolatie
     """
 
-    vergaand_geisoleerd = EenheidisolatieReferentiedata(
+    vergaand_geisoleerd = EenheidisolatieReferentiedata.model_construct(
         code="VER",
         naam="Vergaand geïsoleerd",
     )
@@ -86,9 +86,11 @@ class Eenheidisolatie(Referentiedatasoort):
     bron.
     """
 
-    gereed_voor_aansluiting_op_mt_warmtenet = EenheidisolatieReferentiedata(
-        code="GER",
-        naam="Gereed voor aansluiting op MT-warmtenet",
+    gereed_voor_aansluiting_op_mt_warmtenet = (
+        EenheidisolatieReferentiedata.model_construct(
+            code="GER",
+            naam="Gereed voor aansluiting op MT-warmtenet",
+        )
     )
     """
     Woning die qua isolatie geschikt is voor aansluiting op een MT-warmtenet en waarbij
@@ -96,17 +98,17 @@ class Eenheidisolatie(Referentiedatasoort):
     MT-warmtenet of een HT-net dat op termijn naar MT gaat.
     """
 
-    muurisolatie = EenheidisolatieReferentiedata(
+    muurisolatie = EenheidisolatieReferentiedata.model_construct(
         code="MUU",
         naam="Muurisolatie",
     )
 
-    vloerisolatie = EenheidisolatieReferentiedata(
+    vloerisolatie = EenheidisolatieReferentiedata.model_construct(
         code="VLO",
         naam="Vloerisolatie",
     )
 
-    volledig_geisoleerd = EenheidisolatieReferentiedata(
+    volledig_geisoleerd = EenheidisolatieReferentiedata.model_construct(
         code="VOL",
         naam="Volledig geïsoleerd",
     )
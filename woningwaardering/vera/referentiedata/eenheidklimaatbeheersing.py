@@ -10,7 +10,7 @@ class EenheidklimaatbeheersingReferentiedata(Referentiedata):
 
 
 class Eenheidklimaatbeheersing(Referentiedatasoort):
-    airco = EenheidklimaatbeheersingReferentiedata(
+    airco = EenheidklimaatbeheersingReferentiedata.model_construct(
         code="AIR",
         naam="Airco",
     )
@@ -22,7 +22,7 @@ class Eenheidklimaatbeheersing(Referentiedatasoort):
     handhaven. Dit kan zowel individueel als collectief georganiseerd zijn.
     """
 
-    blokverwarming = EenheidklimaatbeheersingReferentiedata(
+    blokverwarming = EenheidklimaatbeheersingReferentiedata.model_construct(
         code="BLO",
         naam="Blokverwarming",
         parent=Eenheidklimaatbeheersingsoort.collectief,
@@ -35,7 +35,7 @@ class Eenheidklimaatbeheersing(Referentiedatasoort):
     verwarmen.
     """
 
-    centrale_verwarming = EenheidklimaatbeheersingReferentiedata(
+    centrale_verwarming = EenheidklimaatbeheersingReferentiedata.model_construct(
         code="CEV",
         naam="Centrale verwarming",
     )
@@ -48,7 +48,7 @@ class Eenheidklimaatbeheersing(Referentiedatasoort):
     georganiseerd zijn.
     """
 
-    gaskachels = EenheidklimaatbeheersingReferentiedata(
+    gaskachels = EenheidklimaatbeheersingReferentiedata.model_construct(
         code="GAS",
         naam="Gaskachels",
         parent=Eenheidklimaatbeheersingsoort.individueel,
@@ -59,7 +59,7 @@ class Eenheidklimaatbeheersing(Referentiedatasoort):
     omgevingstemperatuur wordt verhoogd voor comfort in een ruimte.
     """
 
-    houtkachel = EenheidklimaatbeheersingReferentiedata(
+    houtkachel = EenheidklimaatbeheersingReferentiedata.model_construct(
         code="HKA",
         naam="Houtkachel",
         parent=Eenheidklimaatbeheersingsoort.individueel,
@@ -70,7 +70,7 @@ class Eenheidklimaatbeheersing(Referentiedatasoort):
     ruimte wordt verwarmd voor comfort.
     """
 
-    muurverwarming = EenheidklimaatbeheersingReferentiedata(
+    muurverwarming = EenheidklimaatbeheersingReferentiedata.model_construct(
         code="MUU",
         naam="Muurverwarming",
         parent=Eenheidklimaatbeheersingsoort.individueel,
@@ -81,7 +81,7 @@ class Eenheidklimaatbeheersing(Referentiedatasoort):
     waardoor de muren warmte afgeven en de ruimte gelijkmatig verwarmen.
     """
 
-    mechanische_ventilatie = EenheidklimaatbeheersingReferentiedata(
+    mechanische_ventilatie = EenheidklimaatbeheersingReferentiedata.model_construct(
         code="MVE",
         naam="Mechanische ventilatie",
     )
@@ -92,7 +92,7 @@ class Eenheidklimaatbeheersing(Referentiedatasoort):
     kan zowel individueel als collectief georganiseerd zijn.
     """
 
-    open_haard = EenheidklimaatbeheersingReferentiedata(
+    open_haard = EenheidklimaatbeheersingReferentiedata.model_construct(
         code="OHA",
         naam="Open haard",
         parent=Eenheidklimaatbeheersingsoort.individueel,
@@ -103,7 +103,7 @@ class Eenheidklimaatbeheersing(Referentiedatasoort):
     kookmogelijkheden.
     """
 
-    stadsverwarming = EenheidklimaatbeheersingReferentiedata(
+    stadsverwarming = EenheidklimaatbeheersingReferentiedata.model_construct(
         code="STV",
         naam="Stadsverwarming",
         parent=Eenheidklimaatbeheersingsoort.collectief,
@@ -116,12 +116,12 @@ class Eenheidklimaatbeheersing(Referentiedatasoort):
     industriële processen, wat bijdraagt aan energie-efficiëntie.
     """
 
-    onverwarmd = EenheidklimaatbeheersingReferentiedata(
+    onverwarmd = EenheidklimaatbeheersingReferentiedata.model_construct(
         code="ONV",
         naam="Onverwarmd",
     )
 
-    vloerverwarming = EenheidklimaatbeheersingReferentiedata(
+    vloerverwarming = EenheidklimaatbeheersingReferentiedata.model_construct(
         code="VLV",
         naam="Vloerverwarming",
         parent=Eenheidklimaatbeheersingsoort.individueel,
@@ -132,7 +132,7 @@ class Eenheidklimaatbeheersing(Referentiedatasoort):
     vloer wordt verwarmd en de warmte gelijkmatig wordt verspreid in de ruimte.
     """
 
-    volledig_elektrisch = EenheidklimaatbeheersingReferentiedata(
+    volledig_elektrisch = EenheidklimaatbeheersingReferentiedata.model_construct(
         code="VOL",
         naam="Volledig Elektrisch",
         parent=Eenheidklimaatbeheersingsoort.individueel,
@@ -141,7 +141,7 @@ class Eenheidklimaatbeheersing(Referentiedatasoort):
     Volledig elektrische klimaatbeheersing
     """
 
-    warmtepomp_cv = EenheidklimaatbeheersingReferentiedata(
+    warmtepomp_cv = EenheidklimaatbeheersingReferentiedata.model_construct(
         code="WAC",
         naam="Warmtepomp CV",
     )
@@ -150,7 +150,7 @@ class Eenheidklimaatbeheersing(Referentiedatasoort):
     waterpomp genoemd. Dit kan zowel individueel als collectief georganiseerd zijn.
     """
 
-    warmtepomp = EenheidklimaatbeheersingReferentiedata(
+    warmtepomp = EenheidklimaatbeheersingReferentiedata.model_construct(
         code="WAR",
         naam="Warmtepomp",
     )
@@ -159,9 +159,11 @@ class Eenheidklimaatbeheersing(Referentiedatasoort):
     individueel als collectief georganiseerd zijn.
     """
 
-    warmte_koudeopslaginstallatie = EenheidklimaatbeheersingReferentiedata(
-        code="WKO",
-        naam="Warmte- koudeopslaginstallatie",
+    warmte_koudeopslaginstallatie = (
+        EenheidklimaatbeheersingReferentiedata.model_construct(
+            code="WKO",
+            naam="Warmte- koudeopslaginstallatie",
+        )
     )
     """
     Een warmte-koudeopslaginstallatie (WKO) is een duurzaam verwarmingssysteem dat
@@ -170,7 +172,7 @@ class Eenheidklimaatbeheersing(Referentiedatasoort):
     (bodem-)waterpomp Dit kan zowel individueel als collectief georganiseerd zijn.
     """
 
-    warmteterugwinsysteem = EenheidklimaatbeheersingReferentiedata(
+    warmteterugwinsysteem = EenheidklimaatbeheersingReferentiedata.model_construct(
         code="WTW",
         naam="Warmteterugwinsysteem",
     )
@@ -7,12 +7,12 @@ class EenheidklimaatbeheersingsoortReferentiedata(Referentiedata):
 
 
 class Eenheidklimaatbeheersingsoort(Referentiedatasoort):
-    individueel = EenheidklimaatbeheersingsoortReferentiedata(
+    individueel = EenheidklimaatbeheersingsoortReferentiedata.model_construct(
         code="IND",
         naam="Individueel",
     )
 
-    collectief = EenheidklimaatbeheersingsoortReferentiedata(
+    collectief = EenheidklimaatbeheersingsoortReferentiedata.model_construct(
         code="COL",
         naam="Collectief",
     )
@@ -7,72 +7,72 @@ class EenheidliggingReferentiedata(Referentiedata):
 
 
 class Eenheidligging(Referentiedatasoort):
-    buiten_bebouwde_kom = EenheidliggingReferentiedata(
+    buiten_bebouwde_kom = EenheidliggingReferentiedata.model_construct(
         code="BBK",
         naam="Buiten bebouwde kom",
     )
 
-    beschutte_ligging = EenheidliggingReferentiedata(
+    beschutte_ligging = EenheidliggingReferentiedata.model_construct(
         code="BES",
         naam="Beschutte ligging",
     )
 
-    in_bosrijke_omgeving = EenheidliggingReferentiedata(
+    in_bosrijke_omgeving = EenheidliggingReferentiedata.model_construct(
         code="BOS",
         naam="In bosrijke omgeving",
     )
 
-    aan_bosrand = EenheidliggingReferentiedata(
+    aan_bosrand = EenheidliggingReferentiedata.model_construct(
         code="BRA",
         naam="Aan bosrand",
     )
 
-    in_centrum = EenheidliggingReferentiedata(
+    in_centrum = EenheidliggingReferentiedata.model_construct(
         code="CEN",
         naam="In centrum",
     )
 
-    aan_drukke_weg = EenheidliggingReferentiedata(
+    aan_drukke_weg = EenheidliggingReferentiedata.model_construct(
         code="DRU",
         naam="Aan drukke weg",
     )
 
-    landelijk_gelegen = EenheidliggingReferentiedata(
+    landelijk_gelegen = EenheidliggingReferentiedata.model_construct(
         code="LAN",
         naam="Landelijk gelegen",
     )
 
-    open_ligging = EenheidliggingReferentiedata(
+    open_ligging = EenheidliggingReferentiedata.model_construct(
         code="OPE",
         naam="Open ligging",
     )
 
-    aan_park = EenheidliggingReferentiedata(
+    aan_park = EenheidliggingReferentiedata.model_construct(
         code="PAR",
         naam="Aan park",
     )
 
-    aan_rustige_weg = EenheidliggingReferentiedata(
+    aan_rustige_weg = EenheidliggingReferentiedata.model_construct(
         code="RUS",
         naam="Aan rustige weg",
     )
 
-    aan_vaarwater = EenheidliggingReferentiedata(
+    aan_vaarwater = EenheidliggingReferentiedata.model_construct(
         code="VAA",
         naam="Aan vaarwater",
     )
 
-    vrij_uitzicht = EenheidliggingReferentiedata(
+    vrij_uitzicht = EenheidliggingReferentiedata.model_construct(
         code="VRI",
         naam="Vrij uitzicht",
     )
 
-    aan_water = EenheidliggingReferentiedata(
+    aan_water = EenheidliggingReferentiedata.model_construct(
         code="WAT",
         naam="Aan water",
     )
 
-    in_woonwijk = EenheidliggingReferentiedata(
+    in_woonwijk = EenheidliggingReferentiedata.model_construct(
         code="WOO",
         naam="In woonwijk",
     )
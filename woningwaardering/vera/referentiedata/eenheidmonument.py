@@ -7,7 +7,7 @@ class EenheidmonumentReferentiedata(Referentiedata):
 
 
 class Eenheidmonument(Referentiedatasoort):
-    beschermd_dorpsgezicht = EenheidmonumentReferentiedata(
+    beschermd_dorpsgezicht = EenheidmonumentReferentiedata.model_construct(
         code="DOR",
         naam="Beschermd dorpsgezicht",
     )
@@ -20,7 +20,7 @@ class Eenheidmonument(Referentiedatasoort):
     vergunning nodig.
     """
 
-    gemeentelijk_monument = EenheidmonumentReferentiedata(
+    gemeentelijk_monument = EenheidmonumentReferentiedata.model_construct(
         code="GEM",
         naam="Gemeentelijk monument",
     )
@@ -30,7 +30,7 @@ class Eenheidmonument(Referentiedatasoort):
     plaatselijk of regionaal belang is.
     """
 
-    provinciaal_monument = EenheidmonumentReferentiedata(
+    provinciaal_monument = EenheidmonumentReferentiedata.model_construct(
         code="PRO",
         naam="Provinciaal monument",
     )
@@ -44,7 +44,7 @@ class Eenheidmonument(Referentiedatasoort):
     hebben aangewezen.
     """
 
-    rijksmonument = EenheidmonumentReferentiedata(
+    rijksmonument = EenheidmonumentReferentiedata.model_construct(
         code="RIJ",
         naam="Rijksmonument",
     )
@@ -54,7 +54,7 @@ class Eenheidmonument(Referentiedatasoort):
     monument.
     """
 
-    beschermd_stadsgezicht = EenheidmonumentReferentiedata(
+    beschermd_stadsgezicht = EenheidmonumentReferentiedata.model_construct(
         code="STA",
         naam="Beschermd stadsgezicht",
     )
@@ -67,7 +67,7 @@ class Eenheidmonument(Referentiedatasoort):
     vergunning nodig.
     """
 
-    werelderfgoed = EenheidmonumentReferentiedata(
+    werelderfgoed = EenheidmonumentReferentiedata.model_construct(
         code="WER",
         naam="Werelderfgoed",
     )
@@ -7,7 +7,7 @@ class EenheidprijsconditieReferentiedata(Referentiedata):
 
 
 class Eenheidprijsconditie(Referentiedatasoort):
-    exclusief_servicekosten = EenheidprijsconditieReferentiedata(
+    exclusief_servicekosten = EenheidprijsconditieReferentiedata.model_construct(
         code="ESE",
         naam="Exclusief servicekosten",
     )
@@ -15,7 +15,7 @@ class Eenheidprijsconditie(Referentiedatasoort):
     De vraagprijs is exclusief servicekosten.
     """
 
-    inclusief_servicekosten = EenheidprijsconditieReferentiedata(
+    inclusief_servicekosten = EenheidprijsconditieReferentiedata.model_construct(
         code="ISE",
         naam="Inclusief servicekosten",
     )
@@ -23,7 +23,7 @@ class Eenheidprijsconditie(Referentiedatasoort):
     De vraagprijs is inclusief servicekosten.
     """
 
-    inclusief_stookkosten = EenheidprijsconditieReferentiedata(
+    inclusief_stookkosten = EenheidprijsconditieReferentiedata.model_construct(
         code="IST",
         naam="Inclusief stookkosten",
     )
@@ -31,7 +31,7 @@ class Eenheidprijsconditie(Referentiedatasoort):
     De vraagprijs is inclusief kosten (voorschot) voor de verwarming van het vastgoed.
     """
 
-    kosten_koper = EenheidprijsconditieReferentiedata(
+    kosten_koper = EenheidprijsconditieReferentiedata.model_construct(
         code="KKO",
         naam="Kosten Koper",
     )
@@ -40,7 +40,7 @@ class Eenheidprijsconditie(Referentiedatasoort):
     onroerend goed overdracht zijn voor de koper.
     """
 
-    vrij_op_naam = EenheidprijsconditieReferentiedata(
+    vrij_op_naam = EenheidprijsconditieReferentiedata.model_construct(
         code="VON",
         naam="Vrij op naam",
     )
@@ -7,17 +7,17 @@ class EenheidsanitairReferentiedata(Referentiedata):
 
 
 class Eenheidsanitair(Referentiedatasoort):
-    ligbad = EenheidsanitairReferentiedata(
+    ligbad = EenheidsanitairReferentiedata.model_construct(
         code="BAD",
         naam="Ligbad",
     )
 
-    aparte_douche = EenheidsanitairReferentiedata(
+    aparte_douche = EenheidsanitairReferentiedata.model_construct(
         code="DOU",
         naam="Aparte douche",
     )
 
-    apart_toilet = EenheidsanitairReferentiedata(
+    apart_toilet = EenheidsanitairReferentiedata.model_construct(
         code="TOI",
         naam="Apart toilet",
     )
@@ -7,7 +7,7 @@ class EenheidsoortReferentiedata(Referentiedata):
 
 
 class Eenheidsoort(Referentiedatasoort):
-    bedrijfsruimte = EenheidsoortReferentiedata(
+    bedrijfsruimte = EenheidsoortReferentiedata.model_construct(
         code="BED",
         naam="Bedrijfsruimte",
     )
@@ -15,7 +15,7 @@ class Eenheidsoort(Referentiedatasoort):
     Bedrijfsruimte en winkels
     """
 
-    intramuraal_zorgvastgoed = EenheidsoortReferentiedata(
+    intramuraal_zorgvastgoed = EenheidsoortReferentiedata.model_construct(
         code="INT",
         naam="Intramuraal zorgvastgoed",
     )
@@ -28,7 +28,7 @@ class Eenheidsoort(Referentiedatasoort):
     gehandicapten of instelling voor cliënten met langdurige psychische problemen.
     """
 
-    maatschappelijk_vastgoed = EenheidsoortReferentiedata(
+    maatschappelijk_vastgoed = EenheidsoortReferentiedata.model_construct(
         code="MOG",
         naam="Maatschappelijk vastgoed",
     )
@@ -38,7 +38,7 @@ class Eenheidsoort(Referentiedatasoort):
     buurtcentra, scholen en bibliotheken.
     """
 
-    overig = EenheidsoortReferentiedata(
+    overig = EenheidsoortReferentiedata.model_construct(
         code="OVE",
         naam="Overig",
     )
@@ -46,7 +46,7 @@ class Eenheidsoort(Referentiedatasoort):
     Restcategorie voor ligplaatsen, bergingen, bouwkavels, plantsoenen etc.
     """
 
-    parkeergelegenheid = EenheidsoortReferentiedata(
+    parkeergelegenheid = EenheidsoortReferentiedata.model_construct(
         code="PAR",
         naam="Parkeergelegenheid",
     )
@@ -54,7 +54,7 @@ class Eenheidsoort(Referentiedatasoort):
     Parkeergelegenheden, Garage, parkeerplaatsen individueel of collectief
     """
 
-    recreatiebestemming = EenheidsoortReferentiedata(
+    recreatiebestemming = EenheidsoortReferentiedata.model_construct(
         code="REC",
         naam="Recreatiebestemming",
     )
@@ -62,7 +62,7 @@ class Eenheidsoort(Referentiedatasoort):
     Vastgoed voor recreatief gebruik (lokale regelgeving) zoals Recreatiewoningen
     """
 
-    woonruimte = EenheidsoortReferentiedata(
+    woonruimte = EenheidsoortReferentiedata.model_construct(
         code="WOO",
         naam="Woonruimte",
     )
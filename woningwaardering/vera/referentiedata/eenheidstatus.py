@@ -7,7 +7,7 @@ class EenheidstatusReferentiedata(Referentiedata):
 
 
 class Eenheidstatus(Referentiedatasoort):
-    administratief = EenheidstatusReferentiedata(
+    administratief = EenheidstatusReferentiedata.model_construct(
         code="ADM",
         naam="Administratief",
     )
@@ -17,7 +17,7 @@ class Eenheidstatus(Referentiedatasoort):
     corporatie
     """
 
-    leegstand = EenheidstatusReferentiedata(
+    leegstand = EenheidstatusReferentiedata.model_construct(
         code="LEE",
         naam="Leegstand",
     )
@@ -27,7 +27,7 @@ class Eenheidstatus(Referentiedatasoort):
     gereed is voor verhuur
     """
 
-    in_ontwikkeling = EenheidstatusReferentiedata(
+    in_ontwikkeling = EenheidstatusReferentiedata.model_construct(
         code="ONT",
         naam="In ontwikkeling",
     )
@@ -37,7 +37,7 @@ class Eenheidstatus(Referentiedatasoort):
     ontwikkelingsproces de eenheid zich bevindt
     """
 
-    uit_exploitatie = EenheidstatusReferentiedata(
+    uit_exploitatie = EenheidstatusReferentiedata.model_construct(
         code="UIT",
         naam="Uit exploitatie",
     )
@@ -47,7 +47,7 @@ class Eenheidstatus(Referentiedatasoort):
     exploitatie is.
     """
 
-    verhuurd = EenheidstatusReferentiedata(
+    verhuurd = EenheidstatusReferentiedata.model_construct(
         code="VEH",
         naam="Verhuurd",
     )
@@ -10,7 +10,7 @@ class EindedetailredenReferentiedata(Referentiedata):
 
 
 class Eindedetailreden(Referentiedatasoort):
-    faillissement = EindedetailredenReferentiedata(
+    faillissement = EindedetailredenReferentiedata.model_construct(
         code="FAI",
         naam="Faillissement",
         parent=Eindereden.ontbinding,
@@ -19,7 +19,7 @@ class Eindedetailreden(Referentiedatasoort):
     Een overeenkomst is beëindigd wegens faillissement
     """
 
-    noorderzon = EindedetailredenReferentiedata(
+    noorderzon = EindedetailredenReferentiedata.model_construct(
         code="NOO",
         naam="Noorderzon",
         parent=Eindereden.ontbinding,
@@ -29,7 +29,7 @@ class Eindedetailreden(Referentiedatasoort):
     vertrokken
     """
 
-    ontruiming = EindedetailredenReferentiedata(
+    ontruiming = EindedetailredenReferentiedata.model_construct(
         code="ONT",
         naam="Ontruiming",
         parent=Eindereden.ontbinding,
@@ -38,7 +38,7 @@ class Eindedetailreden(Referentiedatasoort):
     Een overeenkomst is beëindigd omdat de woning is ontruimd
     """
 
-    overlijden = EindedetailredenReferentiedata(
+    overlijden = EindedetailredenReferentiedata.model_construct(
         code="OVE",
         naam="Overlijden",
         parent=Eindereden.ontbinding,
@@ -47,7 +47,7 @@ class Eindedetailreden(Referentiedatasoort):
     Een overeenkomst is beëindigd wegens overlijden
     """
 
-    regulier = EindedetailredenReferentiedata(
+    regulier = EindedetailredenReferentiedata.model_construct(
         code="REG",
         naam="Regulier",
         parent=Eindereden.opzegging,
@@ -57,7 +57,7 @@ class Eindedetailreden(Referentiedatasoort):
     reden is niet bekend.
     """
 
-    terugkoop = EindedetailredenReferentiedata(
+    terugkoop = EindedetailredenReferentiedata.model_construct(
         code="TER",
         naam="Terugkoop",
         parent=Eindereden.opzegging,
@@ -66,7 +66,7 @@ class Eindedetailreden(Referentiedatasoort):
     Een overeenkomst is beëindigd wegens terugkoop
     """
 
-    verkoop = EindedetailredenReferentiedata(
+    verkoop = EindedetailredenReferentiedata.model_construct(
         code="VER",
         naam="Verkoop",
         parent=Eindereden.opzegging,
@@ -75,7 +75,7 @@ class Eindedetailreden(Referentiedatasoort):
     Een overeenkomst is beëindigd wegens verkoop
     """
 
-    wijziging_tenaamstelling = EindedetailredenReferentiedata(
+    wijziging_tenaamstelling = EindedetailredenReferentiedata.model_construct(
         code="WIJ",
         naam="Wijziging tenaamstelling",
         parent=Eindereden.opzegging,
@@ -85,7 +85,7 @@ class Eindedetailreden(Referentiedatasoort):
     door een nieuwe overeenkomst)
     """
 
-    woningruil = EindedetailredenReferentiedata(
+    woningruil = EindedetailredenReferentiedata.model_construct(
         code="WON",
         naam="Woningruil",
         parent=Eindereden.opzegging,
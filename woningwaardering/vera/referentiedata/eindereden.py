@@ -7,7 +7,7 @@ class EinderedenReferentiedata(Referentiedata):
 
 
 class Eindereden(Referentiedatasoort):
-    ontbinding = EinderedenReferentiedata(
+    ontbinding = EinderedenReferentiedata.model_construct(
         code="ONT",
         naam="Ontbinding",
     )
@@ -16,7 +16,7 @@ class Eindereden(Referentiedatasoort):
     de overeenkomst niet nakomt.
     """
 
-    opzegging = EinderedenReferentiedata(
+    opzegging = EinderedenReferentiedata.model_construct(
         code="OPZ",
         naam="Opzegging",
     )
@@ -26,7 +26,7 @@ class Eindereden(Referentiedatasoort):
     of een arbeidsovereenkomst.
     """
 
-    vernietiging = EinderedenReferentiedata(
+    vernietiging = EinderedenReferentiedata.model_construct(
         code="VER",
         naam="Vernietiging",
     )
@@ -7,57 +7,57 @@ class EnergielabelReferentiedata(Referentiedata):
 
 
 class Energielabel(Referentiedatasoort):
-    a = EnergielabelReferentiedata(
+    a = EnergielabelReferentiedata.model_construct(
         code="A",
         naam="A",
     )
 
-    ap = EnergielabelReferentiedata(
+    ap = EnergielabelReferentiedata.model_construct(
         code="AP",
         naam="A+",
     )
 
-    ap3 = EnergielabelReferentiedata(
+    ap3 = EnergielabelReferentiedata.model_construct(
         code="AP3",
         naam="A+++",
     )
 
-    ap4 = EnergielabelReferentiedata(
+    ap4 = EnergielabelReferentiedata.model_construct(
         code="AP4",
         naam="A++++",
     )
 
-    app = EnergielabelReferentiedata(
+    app = EnergielabelReferentiedata.model_construct(
         code="APP",
         naam="A++",
     )
 
-    b = EnergielabelReferentiedata(
+    b = EnergielabelReferentiedata.model_construct(
         code="B",
         naam="B",
     )
 
-    c = EnergielabelReferentiedata(
+    c = EnergielabelReferentiedata.model_construct(
         code="C",
         naam="C",
     )
 
-    d = EnergielabelReferentiedata(
+    d = EnergielabelReferentiedata.model_construct(
         code="D",
         naam="D",
     )
 
-    e = EnergielabelReferentiedata(
+    e = EnergielabelReferentiedata.model_construct(
         code="E",
         naam="E",
     )
 
-    f = EnergielabelReferentiedata(
+    f = EnergielabelReferentiedata.model_construct(
         code="F",
         naam="F",
     )
 
-    g = EnergielabelReferentiedata(
+    g = EnergielabelReferentiedata.model_construct(
         code="G",
         naam="G",
     )
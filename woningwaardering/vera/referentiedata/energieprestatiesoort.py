@@ -7,7 +7,7 @@ class EnergieprestatiesoortReferentiedata(Referentiedata):
 
 
 class Energieprestatiesoort(Referentiedatasoort):
-    compactheid = EnergieprestatiesoortReferentiedata(
+    compactheid = EnergieprestatiesoortReferentiedata.model_construct(
         code="COM",
         naam="Compactheid",
     )
@@ -19,7 +19,7 @@ class Energieprestatiesoort(Referentiedatasoort):
     ls-gebouwen/standaard-streefwaarden-woningisolatie)
     """
 
-    energie_index = EnergieprestatiesoortReferentiedata(
+    energie_index = EnergieprestatiesoortReferentiedata.model_construct(
         code="EI",
         naam="Energie-index",
     )
@@ -30,9 +30,11 @@ class Energieprestatiesoort(Referentiedatasoort):
     afgeleid op basis van een tabel met bandbreedtes voor de energie-index.
     """
 
-    primair_energieverbruik_woningbouw = EnergieprestatiesoortReferentiedata(
-        code="EP2",
-        naam="Primair energieverbruik - woningbouw",
+    primair_energieverbruik_woningbouw = (
+        EnergieprestatiesoortReferentiedata.model_construct(
+            code="EP2",
+            naam="Primair energieverbruik - woningbouw",
+        )
     )
     """
     Het conform NTA8800 berekende jaarlijkse primair (gebouwgebonden) energiegebruik in
@@ -45,9 +47,11 @@ class Energieprestatiesoort(Referentiedatasoort):
     (EPV).
     """
 
-    opgewekte_duurzame_elektriciteit = EnergieprestatiesoortReferentiedata(
-        code="OPG",
-        naam="Opgewekte duurzame elektriciteit",
+    opgewekte_duurzame_elektriciteit = (
+        EnergieprestatiesoortReferentiedata.model_construct(
+            code="OPG",
+            naam="Opgewekte duurzame elektriciteit",
+        )
     )
     """
     De totale jaarlijkse hoeveelheid opgewekte hoeveelheid duurzame energie door
@@ -57,7 +61,7 @@ class Energieprestatiesoort(Referentiedatasoort):
     energieprestatievergoeding (EPV).
     """
 
-    voorlopig_energielabel = EnergieprestatiesoortReferentiedata(
+    voorlopig_energielabel = EnergieprestatiesoortReferentiedata.model_construct(
         code="VEL",
         naam="Voorlopig energielabel",
     )
@@ -68,9 +72,11 @@ class Energieprestatiesoort(Referentiedatasoort):
     horen.
     """
 
-    warmtebehoefte_ruimteverwarming = EnergieprestatiesoortReferentiedata(
-        code="WAR",
-        naam="Warmtebehoefte ruimteverwarming",
+    warmtebehoefte_ruimteverwarming = (
+        EnergieprestatiesoortReferentiedata.model_construct(
+            code="WAR",
+            naam="Warmtebehoefte ruimteverwarming",
+        )
     )
     """
     De volgens de NTA8800 berekende warmtebehoefte voor ruimteverwarming, gegeven het
@@ -7,7 +7,7 @@ class EnergieprestatiestatusReferentiedata(Referentiedata):
 
 
 class Energieprestatiestatus(Referentiedatasoort):
-    definitief = EnergieprestatiestatusReferentiedata(
+    definitief = EnergieprestatiestatusReferentiedata.model_construct(
         code="DEF",
         naam="Definitief",
     )
@@ -16,7 +16,7 @@ class Energieprestatiestatus(Referentiedatasoort):
     energieprestatie, wat leidt tot een officieel geldig label.
     """
 
-    voorlopig = EnergieprestatiestatusReferentiedata(
+    voorlopig = EnergieprestatiestatusReferentiedata.model_construct(
         code="VOO",
         naam="Voorlopig",
     )
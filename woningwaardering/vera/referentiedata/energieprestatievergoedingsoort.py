@@ -7,7 +7,7 @@ class EnergieprestatievergoedingsoortReferentiedata(Referentiedata):
 
 
 class Energieprestatievergoedingsoort(Referentiedatasoort):
-    epv_basis = EnergieprestatievergoedingsoortReferentiedata(
+    epv_basis = EnergieprestatievergoedingsoortReferentiedata.model_construct(
         code="BAS",
         naam="EPV Basis",
     )
@@ -17,7 +17,7 @@ class Energieprestatievergoedingsoort(Referentiedatasoort):
     energie levert voor het volledige gebouwgebonden deel (MGW).
     """
 
-    epv_hoogwaardig = EnergieprestatievergoedingsoortReferentiedata(
+    epv_hoogwaardig = EnergieprestatievergoedingsoortReferentiedata.model_construct(
         code="HOO",
         naam="EPV Hoogwaardig",
     )
@@ -7,12 +7,12 @@ class ExterneincassosoortReferentiedata(Referentiedata):
 
 
 class Externeincassosoort(Referentiedatasoort):
-    deurwaarder = ExterneincassosoortReferentiedata(
+    deurwaarder = ExterneincassosoortReferentiedata.model_construct(
         code="DEU",
         naam="Deurwaarder",
     )
 
-    incassobureau = ExterneincassosoortReferentiedata(
+    incassobureau = ExterneincassosoortReferentiedata.model_construct(
         code="INC",
         naam="Incassobureau",
     )
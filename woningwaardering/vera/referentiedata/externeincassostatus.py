@@ -7,17 +7,17 @@ class ExterneincassostatusReferentiedata(Referentiedata):
 
 
 class Externeincassostatus(Referentiedatasoort):
-    actief = ExterneincassostatusReferentiedata(
+    actief = ExterneincassostatusReferentiedata.model_construct(
         code="ACT",
         naam="Actief",
     )
 
-    beeindigd = ExterneincassostatusReferentiedata(
+    beeindigd = ExterneincassostatusReferentiedata.model_construct(
         code="EIN",
         naam="Beëindigd",
     )
 
-    nieuw = ExterneincassostatusReferentiedata(
+    nieuw = ExterneincassostatusReferentiedata.model_construct(
         code="NIE",
         naam="Nieuw",
     )
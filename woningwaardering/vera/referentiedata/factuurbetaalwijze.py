@@ -7,7 +7,7 @@ class FactuurbetaalwijzeReferentiedata(Referentiedata):
 
 
 class Factuurbetaalwijze(Referentiedatasoort):
-    automatische_incasso = FactuurbetaalwijzeReferentiedata(
+    automatische_incasso = FactuurbetaalwijzeReferentiedata.model_construct(
         code="AIN",
         naam="Automatische incasso",
     )
@@ -15,7 +15,7 @@ class Factuurbetaalwijze(Referentiedatasoort):
     Factuur wordt voldaan middels automatische incasso betaling.
     """
 
-    contant = FactuurbetaalwijzeReferentiedata(
+    contant = FactuurbetaalwijzeReferentiedata.model_construct(
         code="CNT",
         naam="Contant",
     )
@@ -23,7 +23,7 @@ class Factuurbetaalwijze(Referentiedatasoort):
     Factuur word voldaan middels contante betaling
     """
 
-    op_rekening = FactuurbetaalwijzeReferentiedata(
+    op_rekening = FactuurbetaalwijzeReferentiedata.model_construct(
         code="ORN",
         naam="Op rekening",
     )
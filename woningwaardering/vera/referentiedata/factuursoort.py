@@ -7,7 +7,7 @@ class FactuursoortReferentiedata(Referentiedata):
 
 
 class Factuursoort(Referentiedatasoort):
-    credit_factuur_extern = FactuursoortReferentiedata(
+    credit_factuur_extern = FactuursoortReferentiedata.model_construct(
         code="CEX",
         naam="Credit factuur extern",
     )
@@ -15,7 +15,7 @@ class Factuursoort(Referentiedatasoort):
     Credit factuur extern
     """
 
-    credit_factuur_intern = FactuursoortReferentiedata(
+    credit_factuur_intern = FactuursoortReferentiedata.model_construct(
         code="CIF",
         naam="Credit factuur intern",
     )
@@ -23,7 +23,7 @@ class Factuursoort(Referentiedatasoort):
     Credit factuur intern
     """
 
-    debet_factuur_extern = FactuursoortReferentiedata(
+    debet_factuur_extern = FactuursoortReferentiedata.model_construct(
         code="DEX",
         naam="Debet factuur extern",
     )
@@ -31,7 +31,7 @@ class Factuursoort(Referentiedatasoort):
     Debet factuur extern
     """
 
-    debet_factuur_intern = FactuursoortReferentiedata(
+    debet_factuur_intern = FactuursoortReferentiedata.model_construct(
         code="DIF",
         naam="Debet factuur intern",
     )
@@ -7,7 +7,7 @@ class GebeurtenissoortReferentiedata(Referentiedata):
 
 
 class Gebeurtenissoort(Referentiedatasoort):
-    begin_situatiepunten = GebeurtenissoortReferentiedata(
+    begin_situatiepunten = GebeurtenissoortReferentiedata.model_construct(
         code="BSI",
         naam="Begin situatiepunten",
     )
@@ -15,7 +15,7 @@ class Gebeurtenissoort(Referentiedatasoort):
     Begin situatiepunten
     """
 
-    begin_startpunten = GebeurtenissoortReferentiedata(
+    begin_startpunten = GebeurtenissoortReferentiedata.model_construct(
         code="BST",
         naam="Begin startpunten",
     )
@@ -23,7 +23,7 @@ class Gebeurtenissoort(Referentiedatasoort):
     Begin startpunten
     """
 
-    gewijzigde_inschrijving = GebeurtenissoortReferentiedata(
+    gewijzigde_inschrijving = GebeurtenissoortReferentiedata.model_construct(
         code="GEW",
         naam="Gewijzigde inschrijving",
     )
@@ -31,7 +31,7 @@ class Gebeurtenissoort(Referentiedatasoort):
     Gewijzigde inschrijving
     """
 
-    gewijzigde_startpunten = GebeurtenissoortReferentiedata(
+    gewijzigde_startpunten = GebeurtenissoortReferentiedata.model_construct(
         code="GSA",
         naam="Gewijzigde startpunten",
     )
@@ -39,7 +39,7 @@ class Gebeurtenissoort(Referentiedatasoort):
     Gewijzigde startpunten
     """
 
-    gewijzigde_situatiepunten = GebeurtenissoortReferentiedata(
+    gewijzigde_situatiepunten = GebeurtenissoortReferentiedata.model_construct(
         code="GSI",
         naam="Gewijzigde situatiepunten",
     )
@@ -47,7 +47,7 @@ class Gebeurtenissoort(Referentiedatasoort):
     Gewijzigde situatiepunten
     """
 
-    intrekken_no_show = GebeurtenissoortReferentiedata(
+    intrekken_no_show = GebeurtenissoortReferentiedata.model_construct(
         code="INS",
         naam="Intrekken no-show",
     )
@@ -55,7 +55,7 @@ class Gebeurtenissoort(Referentiedatasoort):
     Intrekken gebeurtenis niet aanwezig op bevestigde bezichtiging (No-show)
     """
 
-    intrekken_reactie = GebeurtenissoortReferentiedata(
+    intrekken_reactie = GebeurtenissoortReferentiedata.model_construct(
         code="IRE",
         naam="Intrekken reactie",
     )
@@ -63,7 +63,7 @@ class Gebeurtenissoort(Referentiedatasoort):
     Intrekken reactie met puntenopbouw
     """
 
-    intrekken_toewijzing = GebeurtenissoortReferentiedata(
+    intrekken_toewijzing = GebeurtenissoortReferentiedata.model_construct(
         code="ITO",
         naam="Intrekken toewijzing",
     )
@@ -71,23 +71,27 @@ class Gebeurtenissoort(Referentiedatasoort):
     Intrekken toewijzing van de eenheid.
     """
 
-    intrekken_weigering_als_hoogste_acceptant = GebeurtenissoortReferentiedata(
-        code="IWH",
-        naam="Intrekken weigering als hoogste acceptant",
+    intrekken_weigering_als_hoogste_acceptant = (
+        GebeurtenissoortReferentiedata.model_construct(
+            code="IWH",
+            naam="Intrekken weigering als hoogste acceptant",
+        )
     )
     """
     Intrekken weigering als hoogste acceptant
     """
 
-    intrekken_weigering_niet_als_hoogste_acceptant = GebeurtenissoortReferentiedata(
-        code="IWN",
-        naam="Intrekken weigering niet als hoogste acceptant",
+    intrekken_weigering_niet_als_hoogste_acceptant = (
+        GebeurtenissoortReferentiedata.model_construct(
+            code="IWN",
+            naam="Intrekken weigering niet als hoogste acceptant",
+        )
     )
     """
     Intrekken weigering niet als hoogste acceptant
     """
 
-    nieuwe_inschrijving = GebeurtenissoortReferentiedata(
+    nieuwe_inschrijving = GebeurtenissoortReferentiedata.model_construct(
         code="NIE",
         naam="Nieuwe inschrijving",
     )
@@ -95,7 +99,7 @@ class Gebeurtenissoort(Referentiedatasoort):
     Nieuwe inschrijving
     """
 
-    no_show = GebeurtenissoortReferentiedata(
+    no_show = GebeurtenissoortReferentiedata.model_construct(
         code="NOS",
         naam="No-show",
     )
@@ -103,7 +107,7 @@ class Gebeurtenissoort(Referentiedatasoort):
     Niet aanwezig op bevestigde bezichtiging
     """
 
-    reactie = GebeurtenissoortReferentiedata(
+    reactie = GebeurtenissoortReferentiedata.model_construct(
         code="REA",
         naam="Reactie",
     )
@@ -111,7 +115,7 @@ class Gebeurtenissoort(Referentiedatasoort):
     Reactie met puntenopbouw
     """
 
-    toewijzing = GebeurtenissoortReferentiedata(
+    toewijzing = GebeurtenissoortReferentiedata.model_construct(
         code="TOE",
         naam="Toewijzing",
     )
@@ -119,7 +123,7 @@ class Gebeurtenissoort(Referentiedatasoort):
     Toewijzing
     """
 
-    weigering_als_hoogste_acceptant = GebeurtenissoortReferentiedata(
+    weigering_als_hoogste_acceptant = GebeurtenissoortReferentiedata.model_construct(
         code="WEI",
         naam="Weigering als hoogste acceptant",
     )
@@ -127,9 +131,11 @@ class Gebeurtenissoort(Referentiedatasoort):
     Weigering als hoogste acceptant
     """
 
-    weigering_niet_als_hoogste_acceptant = GebeurtenissoortReferentiedata(
-        code="WEN",
-        naam="Weigering niet als hoogste acceptant",
+    weigering_niet_als_hoogste_acceptant = (
+        GebeurtenissoortReferentiedata.model_construct(
+            code="WEN",
+            naam="Weigering niet als hoogste acceptant",
+        )
     )
     """
     Weigering niet als hoogste acceptant
@@ -7,7 +7,7 @@ class GeometriesoortReferentiedata(Referentiedata):
 
 
 class Geometriesoort(Referentiedatasoort):
-    omtrek = GeometriesoortReferentiedata(
+    omtrek = GeometriesoortReferentiedata.model_construct(
         code="OMT",
         naam="Omtrek",
     )
@@ -15,7 +15,7 @@ class Geometriesoort(Referentiedatasoort):
     De geocoördinaten van de omtrek van een object
     """
 
-    punt = GeometriesoortReferentiedata(
+    punt = GeometriesoortReferentiedata.model_construct(
         code="PUN",
         naam="Punt",
     )
@@ -7,7 +7,7 @@ class GeslachtReferentiedata(Referentiedata):
 
 
 class Geslacht(Referentiedatasoort):
-    mannelijk = GeslachtReferentiedata(
+    mannelijk = GeslachtReferentiedata.model_construct(
         code="M",
         naam="Mannelijk",
     )
@@ -15,7 +15,7 @@ class Geslacht(Referentiedatasoort):
     Mannelijk geslacht
     """
 
-    onbekend = GeslachtReferentiedata(
+    onbekend = GeslachtReferentiedata.model_construct(
         code="O",
         naam="Onbekend",
     )
@@ -23,7 +23,7 @@ class Geslacht(Referentiedatasoort):
     Manier om genderneutraal aan te duiden of wanneer geslacht niet ter zake doet.
     """
 
-    vrouwelijk = GeslachtReferentiedata(
+    vrouwelijk = GeslachtReferentiedata.model_construct(
         code="V",
         naam="Vrouwelijk",
     )
@@ -7,7 +7,7 @@ class GrootboekmutatieherkomstReferentiedata(Referentiedata):
 
 
 class Grootboekmutatieherkomst(Referentiedatasoort):
-    activa_administratie = GrootboekmutatieherkomstReferentiedata(
+    activa_administratie = GrootboekmutatieherkomstReferentiedata.model_construct(
         code="ACT",
         naam="Activa-administratie",
     )
@@ -15,7 +15,7 @@ class Grootboekmutatieherkomst(Referentiedatasoort):
     Een boeking in de activa (sub-)administratie
     """
 
-    batch = GrootboekmutatieherkomstReferentiedata(
+    batch = GrootboekmutatieherkomstReferentiedata.model_construct(
         code="BAT",
         naam="Batch",
     )
@@ -24,7 +24,7 @@ class Grootboekmutatieherkomst(Referentiedatasoort):
     elektronisch wordt verstuurd naar de bank
     """
 
-    beginbalans = GrootboekmutatieherkomstReferentiedata(
+    beginbalans = GrootboekmutatieherkomstReferentiedata.model_construct(
         code="BEG",
         naam="Beginbalans",
     )
@@ -32,12 +32,12 @@ class Grootboekmutatieherkomst(Referentiedatasoort):
     Een boeking van het eindsaldo van een balansrekening uit een voorgaand boekjaar
     """
 
-    berekening = GrootboekmutatieherkomstReferentiedata(
+    berekening = GrootboekmutatieherkomstReferentiedata.model_construct(
         code="BER",
         naam="Berekening",
     )
 
-    bank = GrootboekmutatieherkomstReferentiedata(
+    bank = GrootboekmutatieherkomstReferentiedata.model_construct(
         code="BNK",
         naam="Bank",
     )
@@ -45,7 +45,7 @@ class Grootboekmutatieherkomst(Referentiedatasoort):
     Een boeking in de bank (sub-)administratie
     """
 
-    crediteuren = GrootboekmutatieherkomstReferentiedata(
+    crediteuren = GrootboekmutatieherkomstReferentiedata.model_construct(
         code="CRE",
         naam="Crediteuren",
     )
@@ -53,7 +53,7 @@ class Grootboekmutatieherkomst(Referentiedatasoort):
     Een boeking van een schuld in de crediteuren (sub-)administratie
     """
 
-    debiteuren = GrootboekmutatieherkomstReferentiedata(
+    debiteuren = GrootboekmutatieherkomstReferentiedata.model_construct(
         code="DEB",
         naam="Debiteuren",
     )
@@ -61,7 +61,7 @@ class Grootboekmutatieherkomst(Referentiedatasoort):
     Een boeking van een vordering in de debiteuren (sub-)administratie
     """
 
-    huuradministratie = GrootboekmutatieherkomstReferentiedata(
+    huuradministratie = GrootboekmutatieherkomstReferentiedata.model_construct(
         code="HUU",
         naam="Huuradministratie",
     )
@@ -69,7 +69,7 @@ class Grootboekmutatieherkomst(Referentiedatasoort):
     Een boeking in de huur (sub-)administratie
     """
 
-    inkoopadministratie = GrootboekmutatieherkomstReferentiedata(
+    inkoopadministratie = GrootboekmutatieherkomstReferentiedata.model_construct(
         code="INK",
         naam="Inkoopadministratie",
     )
@@ -77,7 +77,7 @@ class Grootboekmutatieherkomst(Referentiedatasoort):
     Een boeking in de inkoop (sub-)administratie
     """
 
-    kas = GrootboekmutatieherkomstReferentiedata(
+    kas = GrootboekmutatieherkomstReferentiedata.model_construct(
         code="KAS",
         naam="Kas",
     )
@@ -85,7 +85,7 @@ class Grootboekmutatieherkomst(Referentiedatasoort):
     Een boeking in de kas (sub-)administratie
     """
 
-    leningenadministratie = GrootboekmutatieherkomstReferentiedata(
+    leningenadministratie = GrootboekmutatieherkomstReferentiedata.model_construct(
         code="LEN",
         naam="Leningenadministratie",
     )
@@ -93,7 +93,7 @@ class Grootboekmutatieherkomst(Referentiedatasoort):
     Een boeking in de leningen (sub-)administratie
     """
 
-    memoriaal = GrootboekmutatieherkomstReferentiedata(
+    memoriaal = GrootboekmutatieherkomstReferentiedata.model_construct(
         code="MEM",
         naam="Memoriaal",
     )
@@ -102,7 +102,7 @@ class Grootboekmutatieherkomst(Referentiedatasoort):
     geboekt onder de noemer memoriaal.
     """
 
-    projectadministratie = GrootboekmutatieherkomstReferentiedata(
+    projectadministratie = GrootboekmutatieherkomstReferentiedata.model_construct(
         code="PRO",
         naam="Projectadministratie",
     )
@@ -110,7 +110,7 @@ class Grootboekmutatieherkomst(Referentiedatasoort):
     Een boeking in de project (sub-)administratie
     """
 
-    salarisadministratie = GrootboekmutatieherkomstReferentiedata(
+    salarisadministratie = GrootboekmutatieherkomstReferentiedata.model_construct(
         code="SAL",
         naam="Salarisadministratie",
     )
@@ -118,7 +118,7 @@ class Grootboekmutatieherkomst(Referentiedatasoort):
     Een boeking in de salaris (sub-)administratie
     """
 
-    systeem = GrootboekmutatieherkomstReferentiedata(
+    systeem = GrootboekmutatieherkomstReferentiedata.model_construct(
         code="SYS",
         naam="Systeem",
     )
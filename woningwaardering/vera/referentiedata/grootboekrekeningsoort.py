@@ -7,7 +7,7 @@ class GrootboekrekeningsoortReferentiedata(Referentiedata):
 
 
 class Grootboekrekeningsoort(Referentiedatasoort):
-    rgs_omschrijving_verkort = GrootboekrekeningsoortReferentiedata(
+    rgs_omschrijving_verkort = GrootboekrekeningsoortReferentiedata.model_construct(
         code="RGS Referentiecode",
         naam="RGS Omschrijving (verkort)",
     )
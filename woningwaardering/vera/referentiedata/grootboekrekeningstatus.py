@@ -7,17 +7,17 @@ class GrootboekrekeningstatusReferentiedata(Referentiedata):
 
 
 class Grootboekrekeningstatus(Referentiedatasoort):
-    actief = GrootboekrekeningstatusReferentiedata(
+    actief = GrootboekrekeningstatusReferentiedata.model_construct(
         code="ACT",
         naam="Actief",
     )
 
-    geblokkeerd = GrootboekrekeningstatusReferentiedata(
+    geblokkeerd = GrootboekrekeningstatusReferentiedata.model_construct(
         code="BLK",
         naam="Geblokkeerd",
     )
 
-    historisch = GrootboekrekeningstatusReferentiedata(
+    historisch = GrootboekrekeningstatusReferentiedata.model_construct(
         code="HIS",
         naam="Historisch",
     )
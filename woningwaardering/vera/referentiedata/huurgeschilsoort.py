@@ -7,7 +7,7 @@ class HuurgeschilsoortReferentiedata(Referentiedata):
 
 
 class Huurgeschilsoort(Referentiedatasoort):
-    bezwaarschrift = HuurgeschilsoortReferentiedata(
+    bezwaarschrift = HuurgeschilsoortReferentiedata.model_construct(
         code="BEZ",
         naam="Bezwaarschrift",
     )
@@ -15,7 +15,7 @@ class Huurgeschilsoort(Referentiedatasoort):
     Huurgeschil met als aanleiding een (niet nader gespecificeerd) bezwaarschrift
     """
 
-    inkomen = HuurgeschilsoortReferentiedata(
+    inkomen = HuurgeschilsoortReferentiedata.model_construct(
         code="INK",
         naam="Inkomen",
     )
@@ -23,7 +23,7 @@ class Huurgeschilsoort(Referentiedatasoort):
     Huurgeschil met als aanleiding een dispuut over het inkomen van de huurder
     """
 
-    onderhoud = HuurgeschilsoortReferentiedata(
+    onderhoud = HuurgeschilsoortReferentiedata.model_construct(
         code="OND",
         naam="Onderhoud",
     )
@@ -32,7 +32,7 @@ class Huurgeschilsoort(Referentiedatasoort):
     over kosten die voortvloeien uit uitgevoerd onderhoud
     """
 
-    verzoekschrift = HuurgeschilsoortReferentiedata(
+    verzoekschrift = HuurgeschilsoortReferentiedata.model_construct(
         code="VER",
         naam="Verzoekschrift",
     )
@@ -40,7 +40,7 @@ class Huurgeschilsoort(Referentiedatasoort):
     Huurgeschil met als aanleiding een (niet nader gespecificeerd) verzoekschrift
     """
 
-    woningwaardering = HuurgeschilsoortReferentiedata(
+    woningwaardering = HuurgeschilsoortReferentiedata.model_construct(
         code="WON",
         naam="Woningwaardering",
     )
@@ -7,7 +7,7 @@ class HuurgeschilstatusReferentiedata(Referentiedata):
 
 
 class Huurgeschilstatus(Referentiedatasoort):
-    afgewezen = HuurgeschilstatusReferentiedata(
+    afgewezen = HuurgeschilstatusReferentiedata.model_construct(
         code="AFG",
         naam="Afgewezen",
     )
@@ -15,7 +15,7 @@ class Huurgeschilstatus(Referentiedatasoort):
     Het huurgeschil is afgewezen, en daarmee tevens afgehandeld
     """
 
-    in_behandeling = HuurgeschilstatusReferentiedata(
+    in_behandeling = HuurgeschilstatusReferentiedata.model_construct(
         code="INB",
         naam="In behandeling",
     )
@@ -23,7 +23,7 @@ class Huurgeschilstatus(Referentiedatasoort):
     Het huurgeschil is (nog) in behandeling
     """
 
-    toegekend = HuurgeschilstatusReferentiedata(
+    toegekend = HuurgeschilstatusReferentiedata.model_construct(
         code="TOE",
         naam="Toegekend",
     )
@@ -7,7 +7,7 @@ class HuurklasseReferentiedata(Referentiedata):
 
 
 class Huurklasse(Referentiedatasoort):
-    betaalbaar = HuurklasseReferentiedata(
+    betaalbaar = HuurklasseReferentiedata.model_construct(
         code="BET",
         naam="Betaalbaar",
     )
@@ -16,7 +16,7 @@ class Huurklasse(Referentiedatasoort):
     kwaliteitskortingsgrens en onder de aftoppingsgrens (hoog) ligt.
     """
 
-    boven_huurtoeslaggrens = HuurklasseReferentiedata(
+    boven_huurtoeslaggrens = HuurklasseReferentiedata.model_construct(
         code="BOV",
         naam="Boven huurtoeslaggrens",
     )
@@ -25,7 +25,7 @@ class Huurklasse(Referentiedatasoort):
     (liberalisatiegrens) ligt.
     """
 
-    duur = HuurklasseReferentiedata(
+    duur = HuurklasseReferentiedata.model_construct(
         code="DUU",
         naam="Duur",
     )
@@ -34,7 +34,7 @@ class Huurklasse(Referentiedatasoort):
     (hoog) en onder de huurtoeslaggrens ligt.
     """
 
-    goedkoop = HuurklasseReferentiedata(
+    goedkoop = HuurklasseReferentiedata.model_construct(
         code="GOE",
         naam="Goedkoop",
     )
@@ -7,7 +7,7 @@ class HuuropzeggingstatusReferentiedata(Referentiedata):
 
 
 class Huuropzeggingstatus(Referentiedatasoort):
-    aangemaakt = HuuropzeggingstatusReferentiedata(
+    aangemaakt = HuuropzeggingstatusReferentiedata.model_construct(
         code="AAN",
         naam="Aangemaakt",
     )
@@ -16,7 +16,7 @@ class Huuropzeggingstatus(Referentiedatasoort):
     niet in behandeling genomen.
     """
 
-    afgewezen = HuuropzeggingstatusReferentiedata(
+    afgewezen = HuuropzeggingstatusReferentiedata.model_construct(
         code="AFG",
         naam="Afgewezen",
     )
@@ -24,7 +24,7 @@ class Huuropzeggingstatus(Referentiedatasoort):
     De huuropzegging voldoet niet aan de voorwaarden en is afgewezen.
     """
 
-    geannuleerd = HuuropzeggingstatusReferentiedata(
+    geannuleerd = HuuropzeggingstatusReferentiedata.model_construct(
         code="GEA",
         naam="Geannuleerd",
     )
@@ -32,7 +32,7 @@ class Huuropzeggingstatus(Referentiedatasoort):
     De huuropzegging is geannuleerd, voordat de beoordeling heeft plaatsgevonden.
     """
 
-    goedgekeurd = HuuropzeggingstatusReferentiedata(
+    goedgekeurd = HuuropzeggingstatusReferentiedata.model_construct(
         code="GOE",
         naam="Goedgekeurd",
     )
@@ -40,7 +40,7 @@ class Huuropzeggingstatus(Referentiedatasoort):
     De huuropzegging voldoet aan de voorwaarden en is goedgekeurd.
     """
 
-    in_behandeling = HuuropzeggingstatusReferentiedata(
+    in_behandeling = HuuropzeggingstatusReferentiedata.model_construct(
         code="INB",
         naam="In behandeling",
     )
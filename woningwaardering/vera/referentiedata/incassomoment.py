@@ -7,7 +7,7 @@ class IncassomomentReferentiedata(Referentiedata):
 
 
 class Incassomoment(Referentiedatasoort):
-    incassomoment_1e_dag_van_de_maand = IncassomomentReferentiedata(
+    incassomoment_1e_dag_van_de_maand = IncassomomentReferentiedata.model_construct(
         code="001",
         naam="1e dag van de maand",
     )
@@ -15,7 +15,7 @@ class Incassomoment(Referentiedatasoort):
     1e dag van de maand
     """
 
-    incassomoment_2e_dag_van_de_maand = IncassomomentReferentiedata(
+    incassomoment_2e_dag_van_de_maand = IncassomomentReferentiedata.model_construct(
         code="002",
         naam="2e dag van de maand",
     )
@@ -23,7 +23,7 @@ class Incassomoment(Referentiedatasoort):
     2e dag van de maand
     """
 
-    incassomoment_3e_dag_van_de_maand = IncassomomentReferentiedata(
+    incassomoment_3e_dag_van_de_maand = IncassomomentReferentiedata.model_construct(
         code="003",
         naam="3e dag van de maand",
     )
@@ -31,7 +31,7 @@ class Incassomoment(Referentiedatasoort):
     3e dag van de maand
     """
 
-    incassomoment_4e_dag_van_de_maand = IncassomomentReferentiedata(
+    incassomoment_4e_dag_van_de_maand = IncassomomentReferentiedata.model_construct(
         code="004",
         naam="4e dag van de maand",
     )
@@ -39,7 +39,7 @@ class Incassomoment(Referentiedatasoort):
     4e dag van de maand
     """
 
-    incassomoment_5e_dag_van_de_maand = IncassomomentReferentiedata(
+    incassomoment_5e_dag_van_de_maand = IncassomomentReferentiedata.model_construct(
         code="005",
         naam="5e dag van de maand",
     )
@@ -47,7 +47,7 @@ class Incassomoment(Referentiedatasoort):
     5e dag van de maand
     """
 
-    incassomoment_6e_dag_van_de_maand = IncassomomentReferentiedata(
+    incassomoment_6e_dag_van_de_maand = IncassomomentReferentiedata.model_construct(
         code="006",
         naam="6e dag van de maand",
     )
@@ -55,7 +55,7 @@ class Incassomoment(Referentiedatasoort):
     6e dag van de maand
     """
 
-    incassomoment_7e_dag_van_de_maand = IncassomomentReferentiedata(
+    incassomoment_7e_dag_van_de_maand = IncassomomentReferentiedata.model_construct(
         code="007",
         naam="7e dag van de maand",
     )
@@ -63,7 +63,7 @@ class Incassomoment(Referentiedatasoort):
     7e dag van de maand
     """
 
-    incassomoment_8e_dag_van_de_maand = IncassomomentReferentiedata(
+    incassomoment_8e_dag_van_de_maand = IncassomomentReferentiedata.model_construct(
         code="008",
         naam="8e dag van de maand",
     )
@@ -71,7 +71,7 @@ class Incassomoment(Referentiedatasoort):
     8e dag van de maand
     """
 
-    incassomoment_9e_dag_van_de_maand = IncassomomentReferentiedata(
+    incassomoment_9e_dag_van_de_maand = IncassomomentReferentiedata.model_construct(
         code="009",
         naam="9e dag van de maand",
     )
@@ -79,7 +79,7 @@ class Incassomoment(Referentiedatasoort):
     9e dag van de maand
     """
 
-    incassomoment_10e_dag_van_de_maand = IncassomomentReferentiedata(
+    incassomoment_10e_dag_van_de_maand = IncassomomentReferentiedata.model_construct(
         code="010",
         naam="10e dag van de maand",
     )
@@ -87,7 +87,7 @@ class Incassomoment(Referentiedatasoort):
     10e dag van de maand
     """
 
-    incassomoment_11e_dag_van_de_maand = IncassomomentReferentiedata(
+    incassomoment_11e_dag_van_de_maand = IncassomomentReferentiedata.model_construct(
         code="011",
         naam="11e dag van de maand",
     )
@@ -95,7 +95,7 @@ class Incassomoment(Referentiedatasoort):
     11e dag van de maand
     """
 
-    incassomoment_12e_dag_van_de_maand = IncassomomentReferentiedata(
+    incassomoment_12e_dag_van_de_maand = IncassomomentReferentiedata.model_construct(
         code="012",
         naam="12e dag van de maand",
     )
@@ -103,7 +103,7 @@ class Incassomoment(Referentiedatasoort):
     12e dag van de maand
     """
 
-    incassomoment_13e_dag_van_de_maand = IncassomomentReferentiedata(
+    incassomoment_13e_dag_van_de_maand = IncassomomentReferentiedata.model_construct(
         code="013",
         naam="13e dag van de maand",
     )
@@ -111,7 +111,7 @@ class Incassomoment(Referentiedatasoort):
     13e dag van de maand
     """
 
-    incassomoment_14e_dag_van_de_maand = IncassomomentReferentiedata(
+    incassomoment_14e_dag_van_de_maand = IncassomomentReferentiedata.model_construct(
         code="014",
         naam="14e dag van de maand",
     )
@@ -119,7 +119,7 @@ class Incassomoment(Referentiedatasoort):
     14e dag van de maand
     """
 
-    incassomoment_15e_dag_van_de_maand = IncassomomentReferentiedata(
+    incassomoment_15e_dag_van_de_maand = IncassomomentReferentiedata.model_construct(
         code="015",
         naam="15e dag van de maand",
     )
@@ -127,7 +127,7 @@ class Incassomoment(Referentiedatasoort):
     15e dag van de maand
     """
 
-    incassomoment_16e_dag_van_de_maand = IncassomomentReferentiedata(
+    incassomoment_16e_dag_van_de_maand = IncassomomentReferentiedata.model_construct(
         code="016",
         naam="16e dag van de maand",
     )
@@ -135,7 +135,7 @@ class Incassomoment(Referentiedatasoort):
     16e dag van de maand
     """
 
-    incassomoment_17e_dag_van_de_maand = IncassomomentReferentiedata(
+    incassomoment_17e_dag_van_de_maand = IncassomomentReferentiedata.model_construct(
         code="017",
         naam="17e dag van de maand",
     )
@@ -143,7 +143,7 @@ class Incassomoment(Referentiedatasoort):
     17e dag van de maand
     """
 
-    incassomoment_18e_dag_van_de_maand = IncassomomentReferentiedata(
+    incassomoment_18e_dag_van_de_maand = IncassomomentReferentiedata.model_construct(
         code="018",
         naam="18e dag van de maand",
     )
@@ -151,7 +151,7 @@ class Incassomoment(Referentiedatasoort):
     18e dag van de maand
     """
 
-    incassomoment_19e_dag_van_de_maand = IncassomomentReferentiedata(
+    incassomoment_19e_dag_van_de_maand = IncassomomentReferentiedata.model_construct(
         code="019",
         naam="19e dag van de maand",
     )
@@ -159,7 +159,7 @@ class Incassomoment(Referentiedatasoort):
     19e dag van de maand
     """
 
-    incassomoment_20e_dag_van_de_maand = IncassomomentReferentiedata(
+    incassomoment_20e_dag_van_de_maand = IncassomomentReferentiedata.model_construct(
         code="020",
         naam="20e dag van de maand",
     )
@@ -167,7 +167,7 @@ class Incassomoment(Referentiedatasoort):
     20e dag van de maand
     """
 
-    incassomoment_21e_dag_van_de_maand = IncassomomentReferentiedata(
+    incassomoment_21e_dag_van_de_maand = IncassomomentReferentiedata.model_construct(
         code="021",
         naam="21e dag van de maand",
     )
@@ -175,7 +175,7 @@ class Incassomoment(Referentiedatasoort):
     21e dag van de maand
     """
 
-    incassomoment_22e_dag_van_de_maand = IncassomomentReferentiedata(
+    incassomoment_22e_dag_van_de_maand = IncassomomentReferentiedata.model_construct(
         code="022",
         naam="22e dag van de maand",
     )
@@ -183,7 +183,7 @@ class Incassomoment(Referentiedatasoort):
     22e dag van de maand
     """
 
-    incassomoment_23e_dag_van_de_maand = IncassomomentReferentiedata(
+    incassomoment_23e_dag_van_de_maand = IncassomomentReferentiedata.model_construct(
         code="023",
         naam="23e dag van de maand",
     )
@@ -191,7 +191,7 @@ class Incassomoment(Referentiedatasoort):
     23e dag van de maand
     """
 
-    incassomoment_24e_dag_van_de_maand = IncassomomentReferentiedata(
+    incassomoment_24e_dag_van_de_maand = IncassomomentReferentiedata.model_construct(
         code="024",
         naam="24e dag van de maand",
     )
@@ -199,7 +199,7 @@ class Incassomoment(Referentiedatasoort):
     24e dag van de maand
     """
 
-    incassomoment_25e_dag_van_de_maand = IncassomomentReferentiedata(
+    incassomoment_25e_dag_van_de_maand = IncassomomentReferentiedata.model_construct(
         code="025",
         naam="25e dag van de maand",
     )
@@ -207,7 +207,7 @@ class Incassomoment(Referentiedatasoort):
     25e dag van de maand
     """
 
-    incassomoment_26e_dag_van_de_maand = IncassomomentReferentiedata(
+    incassomoment_26e_dag_van_de_maand = IncassomomentReferentiedata.model_construct(
         code="026",
         naam="26e dag van de maand",
     )
@@ -215,7 +215,7 @@ class Incassomoment(Referentiedatasoort):
     26e dag van de maand
     """
 
-    incassomoment_27e_dag_van_de_maand = IncassomomentReferentiedata(
+    incassomoment_27e_dag_van_de_maand = IncassomomentReferentiedata.model_construct(
         code="027",
         naam="27e dag van de maand",
     )
@@ -223,7 +223,7 @@ class Incassomoment(Referentiedatasoort):
     27e dag van de maand
     """
 
-    incassomoment_28e_dag_van_de_maand = IncassomomentReferentiedata(
+    incassomoment_28e_dag_van_de_maand = IncassomomentReferentiedata.model_construct(
         code="028",
         naam="28e dag van de maand",
     )
@@ -231,7 +231,7 @@ class Incassomoment(Referentiedatasoort):
     28e dag van de maand
     """
 
-    incassomoment_29e_dag_van_de_maand = IncassomomentReferentiedata(
+    incassomoment_29e_dag_van_de_maand = IncassomomentReferentiedata.model_construct(
         code="029",
         naam="29e dag van de maand",
     )
@@ -239,7 +239,7 @@ class Incassomoment(Referentiedatasoort):
     29e dag van de maand
     """
 
-    incassomoment_30e_dag_van_de_maand = IncassomomentReferentiedata(
+    incassomoment_30e_dag_van_de_maand = IncassomomentReferentiedata.model_construct(
         code="030",
         naam="30e dag van de maand",
     )
@@ -247,7 +247,7 @@ class Incassomoment(Referentiedatasoort):
     30e dag van de maand
     """
 
-    incassomoment_31e_dag_van_de_maand = IncassomomentReferentiedata(
+    incassomoment_31e_dag_van_de_maand = IncassomomentReferentiedata.model_construct(
         code="031",
         naam="31e dag van de maand",
     )
@@ -255,7 +255,7 @@ class Incassomoment(Referentiedatasoort):
     31e dag van de maand
     """
 
-    laatste_dag = IncassomomentReferentiedata(
+    laatste_dag = IncassomomentReferentiedata.model_construct(
         code="LAA",
         naam="Laatste dag",
     )
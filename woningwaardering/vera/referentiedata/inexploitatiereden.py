@@ -7,7 +7,7 @@ class InexploitatieredenReferentiedata(Referentiedata):
 
 
 class Inexploitatiereden(Referentiedatasoort):
-    aankoop = InexploitatieredenReferentiedata(
+    aankoop = InexploitatieredenReferentiedata.model_construct(
         code="AAN",
         naam="Aankoop",
     )
@@ -15,7 +15,7 @@ class Inexploitatiereden(Referentiedatasoort):
     De eenheid is in exploitatie genomen nadat deze is aangekocht
     """
 
-    administratief = InexploitatieredenReferentiedata(
+    administratief = InexploitatieredenReferentiedata.model_construct(
         code="ADM",
         naam="Administratief",
     )
@@ -24,7 +24,7 @@ class Inexploitatiereden(Referentiedatasoort):
     de eenheid (bijvoorbeeld een andere corporatie)
     """
 
-    hernieuwbouw = InexploitatieredenReferentiedata(
+    hernieuwbouw = InexploitatieredenReferentiedata.model_construct(
         code="HER",
         naam="Hernieuwbouw",
     )
@@ -32,7 +32,7 @@ class Inexploitatiereden(Referentiedatasoort):
     De eenheid is (weer) in exploitatie genomen nadat deze is vernieuwbouwd
     """
 
-    nieuwbouw = InexploitatieredenReferentiedata(
+    nieuwbouw = InexploitatieredenReferentiedata.model_construct(
         code="NIE",
         naam="Nieuwbouw",
     )
@@ -40,7 +40,7 @@ class Inexploitatiereden(Referentiedatasoort):
     De eenheid is in exploitatie genomen nadat deze is opgeleverd uit nieuwbouw
     """
 
-    planmatig_onderhoud = InexploitatieredenReferentiedata(
+    planmatig_onderhoud = InexploitatieredenReferentiedata.model_construct(
         code="PLA",
         naam="Planmatig onderhoud",
     )
@@ -49,7 +49,7 @@ class Inexploitatiereden(Referentiedatasoort):
     plaatsgevonden
     """
 
-    renovatie = InexploitatieredenReferentiedata(
+    renovatie = InexploitatieredenReferentiedata.model_construct(
         code="REN",
         naam="Renovatie",
     )
@@ -57,7 +57,7 @@ class Inexploitatiereden(Referentiedatasoort):
     De eenheid is (weer) in exploitatie genomen nadat deze is gerenoveerd
     """
 
-    splitsing = InexploitatieredenReferentiedata(
+    splitsing = InexploitatieredenReferentiedata.model_construct(
         code="SPL",
         naam="Splitsing",
     )
@@ -65,7 +65,7 @@ class Inexploitatiereden(Referentiedatasoort):
     De eenheid is ontstaan door splitsing van een andere eenheid
     """
 
-    transformatie = InexploitatieredenReferentiedata(
+    transformatie = InexploitatieredenReferentiedata.model_construct(
         code="TRA",
         naam="Transformatie",
     )
@@ -74,7 +74,7 @@ class Inexploitatiereden(Referentiedatasoort):
     met) een niet-woonfunctie naar een woonfunctie
     """
 
-    teruggekocht = InexploitatieredenReferentiedata(
+    teruggekocht = InexploitatieredenReferentiedata.model_construct(
         code="VOV",
         naam="Teruggekocht",
     )
@@ -83,7 +83,7 @@ class Inexploitatiereden(Referentiedatasoort):
     terugkoopplicht (VoV)
     """
 
-    uitruil = InexploitatieredenReferentiedata(
+    uitruil = InexploitatieredenReferentiedata.model_construct(
         code="UIT",
         naam="Uitruil",
     )
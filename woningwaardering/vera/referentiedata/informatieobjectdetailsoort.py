@@ -7,7 +7,7 @@ class InformatieobjectdetailsoortReferentiedata(Referentiedata):
 
 
 class Informatieobjectdetailsoort(Referentiedatasoort):
-    advertentietekst = InformatieobjectdetailsoortReferentiedata(
+    advertentietekst = InformatieobjectdetailsoortReferentiedata.model_construct(
         code="ADT",
         naam="Advertentietekst",
     )
@@ -15,67 +15,67 @@ class Informatieobjectdetailsoort(Referentiedatasoort):
     Advertentietekst met (HTML) of zonder opmaak (Text).
     """
 
-    advies = InformatieobjectdetailsoortReferentiedata(
+    advies = InformatieobjectdetailsoortReferentiedata.model_construct(
         code="ADV",
         naam="Advies",
     )
 
-    agenda = InformatieobjectdetailsoortReferentiedata(
+    agenda = InformatieobjectdetailsoortReferentiedata.model_construct(
         code="AGE",
         naam="Agenda",
     )
 
-    dag = InformatieobjectdetailsoortReferentiedata(
+    dag = InformatieobjectdetailsoortReferentiedata.model_construct(
         code="DAG",
         naam="Dag",
     )
 
-    evaluatie = InformatieobjectdetailsoortReferentiedata(
+    evaluatie = InformatieobjectdetailsoortReferentiedata.model_construct(
         code="EVA",
         naam="Evaluatie",
     )
 
-    inspectie = InformatieobjectdetailsoortReferentiedata(
+    inspectie = InformatieobjectdetailsoortReferentiedata.model_construct(
         code="INS",
         naam="Inspectie",
     )
 
-    jaar = InformatieobjectdetailsoortReferentiedata(
+    jaar = InformatieobjectdetailsoortReferentiedata.model_construct(
         code="JAA",
         naam="Jaar",
     )
 
-    kwartaal = InformatieobjectdetailsoortReferentiedata(
+    kwartaal = InformatieobjectdetailsoortReferentiedata.model_construct(
         code="KWA",
         naam="Kwartaal",
     )
 
-    maand = InformatieobjectdetailsoortReferentiedata(
+    maand = InformatieobjectdetailsoortReferentiedata.model_construct(
         code="MAA",
         naam="Maand",
     )
 
-    notulen = InformatieobjectdetailsoortReferentiedata(
+    notulen = InformatieobjectdetailsoortReferentiedata.model_construct(
         code="NOT",
         naam="Notulen",
     )
 
-    onderhoud = InformatieobjectdetailsoortReferentiedata(
+    onderhoud = InformatieobjectdetailsoortReferentiedata.model_construct(
         code="OND",
         naam="Onderhoud",
     )
 
-    programma = InformatieobjectdetailsoortReferentiedata(
+    programma = InformatieobjectdetailsoortReferentiedata.model_construct(
         code="PRG",
         naam="Programma",
     )
 
-    project = InformatieobjectdetailsoortReferentiedata(
+    project = InformatieobjectdetailsoortReferentiedata.model_construct(
         code="PRJ",
         naam="Project",
     )
 
-    week = InformatieobjectdetailsoortReferentiedata(
+    week = InformatieobjectdetailsoortReferentiedata.model_construct(
         code="WEE",
         naam="Week",
     )
@@ -7,12 +7,12 @@ class InformatieobjectsoortReferentiedata(Referentiedata):
 
 
 class Informatieobjectsoort(Referentiedatasoort):
-    brochure = InformatieobjectsoortReferentiedata(
+    brochure = InformatieobjectsoortReferentiedata.model_construct(
         code="BRO",
         naam="Brochure",
     )
 
-    document = InformatieobjectsoortReferentiedata(
+    document = InformatieobjectsoortReferentiedata.model_construct(
         code="DOC",
         naam="Document",
     )
@@ -20,7 +20,7 @@ class Informatieobjectsoort(Referentiedatasoort):
     Text bestand met (HTML) of zonder opmaak (Text)
     """
 
-    foto = InformatieobjectsoortReferentiedata(
+    foto = InformatieobjectsoortReferentiedata.model_construct(
         code="FOT",
         naam="Foto",
     )
@@ -28,12 +28,12 @@ class Informatieobjectsoort(Referentiedatasoort):
     Foto, Image, Plaatje, Afbeelding
     """
 
-    kopie = InformatieobjectsoortReferentiedata(
+    kopie = InformatieobjectsoortReferentiedata.model_construct(
         code="KOP",
         naam="Kopie",
     )
 
-    notitie = InformatieobjectsoortReferentiedata(
+    notitie = InformatieobjectsoortReferentiedata.model_construct(
         code="NOT",
         naam="Notitie",
     )
@@ -41,32 +41,32 @@ class Informatieobjectsoort(Referentiedatasoort):
     Het informatieobject is een notitie- of memo (tekst)
     """
 
-    overeenkomst = InformatieobjectsoortReferentiedata(
+    overeenkomst = InformatieobjectsoortReferentiedata.model_construct(
         code="OVE",
         naam="Overeenkomst",
     )
 
-    plattegrond = InformatieobjectsoortReferentiedata(
+    plattegrond = InformatieobjectsoortReferentiedata.model_construct(
         code="PLA",
         naam="Plattegrond",
     )
 
-    plan = InformatieobjectsoortReferentiedata(
+    plan = InformatieobjectsoortReferentiedata.model_construct(
         code="PLN",
         naam="Plan",
     )
 
-    rapport = InformatieobjectsoortReferentiedata(
+    rapport = InformatieobjectsoortReferentiedata.model_construct(
         code="RAP",
         naam="Rapport",
     )
 
-    verslag = InformatieobjectsoortReferentiedata(
+    verslag = InformatieobjectsoortReferentiedata.model_construct(
         code="VER",
         naam="Verslag",
     )
 
-    video = InformatieobjectsoortReferentiedata(
+    video = InformatieobjectsoortReferentiedata.model_construct(
         code="VID",
         naam="Video",
     )
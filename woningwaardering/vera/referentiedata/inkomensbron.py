@@ -7,22 +7,22 @@ class InkomensbronReferentiedata(Referentiedata):
 
 
 class Inkomensbron(Referentiedatasoort):
-    anders = InkomensbronReferentiedata(
+    anders = InkomensbronReferentiedata.model_construct(
         code="AND",
         naam="Anders",
     )
 
-    arbeid = InkomensbronReferentiedata(
+    arbeid = InkomensbronReferentiedata.model_construct(
         code="ARB",
         naam="Arbeid",
     )
 
-    sociale_uitkering = InkomensbronReferentiedata(
+    sociale_uitkering = InkomensbronReferentiedata.model_construct(
         code="SOC",
         naam="Sociale uitkering",
     )
 
-    studiefinanciering = InkomensbronReferentiedata(
+    studiefinanciering = InkomensbronReferentiedata.model_construct(
         code="STU",
         naam="Studiefinanciering",
     )
@@ -7,7 +7,7 @@ class InkomenssoortReferentiedata(Referentiedata):
 
 
 class Inkomenssoort(Referentiedatasoort):
-    bruto_jaarinkomen = InkomenssoortReferentiedata(
+    bruto_jaarinkomen = InkomenssoortReferentiedata.model_construct(
         code="BRU",
         naam="Bruto jaarinkomen",
     )
@@ -16,7 +16,7 @@ class Inkomenssoort(Referentiedatasoort):
     actuele inkomen of een zelf opgegeven inkomen.
     """
 
-    netto_jaarinkomen = InkomenssoortReferentiedata(
+    netto_jaarinkomen = InkomenssoortReferentiedata.model_construct(
         code="NET",
         naam="Netto jaarinkomen",
     )
@@ -7,32 +7,34 @@ class InkomensverklaringsoortReferentiedata(Referentiedata):
 
 
 class Inkomensverklaringsoort(Referentiedatasoort):
-    ib60 = InkomensverklaringsoortReferentiedata(
+    ib60 = InkomensverklaringsoortReferentiedata.model_construct(
         code="IB6",
         naam="IB60",
     )
 
-    inkomensverklaring_belastingdienst = InkomensverklaringsoortReferentiedata(
-        code="IBD",
-        naam="Inkomensverklaring belastingdienst",
+    inkomensverklaring_belastingdienst = (
+        InkomensverklaringsoortReferentiedata.model_construct(
+            code="IBD",
+            naam="Inkomensverklaring belastingdienst",
+        )
     )
 
-    ibri = InkomensverklaringsoortReferentiedata(
+    ibri = InkomensverklaringsoortReferentiedata.model_construct(
         code="IBR",
         naam="IBRI",
     )
 
-    jaaropgave = InkomensverklaringsoortReferentiedata(
+    jaaropgave = InkomensverklaringsoortReferentiedata.model_construct(
         code="JAA",
         naam="Jaaropgave",
     )
 
-    loonstrook = InkomensverklaringsoortReferentiedata(
+    loonstrook = InkomensverklaringsoortReferentiedata.model_construct(
         code="LOO",
         naam="Loonstrook",
     )
 
-    uitkeringsspecificatie = InkomensverklaringsoortReferentiedata(
+    uitkeringsspecificatie = InkomensverklaringsoortReferentiedata.model_construct(
         code="UIT",
         naam="Uitkeringsspecificatie",
     )
@@ -7,7 +7,7 @@ class InkoopfactuurstatusReferentiedata(Referentiedata):
 
 
 class Inkoopfactuurstatus(Referentiedatasoort):
-    afgewezen = InkoopfactuurstatusReferentiedata(
+    afgewezen = InkoopfactuurstatusReferentiedata.model_construct(
         code="AFG",
         naam="Afgewezen",
     )
@@ -15,7 +15,7 @@ class Inkoopfactuurstatus(Referentiedatasoort):
     Inkoopfactuur is afgewezen.
     """
 
-    afgehandeld = InkoopfactuurstatusReferentiedata(
+    afgehandeld = InkoopfactuurstatusReferentiedata.model_construct(
         code="AFH",
         naam="Afgehandeld",
     )
@@ -23,7 +23,7 @@ class Inkoopfactuurstatus(Referentiedatasoort):
     Inkoopfactuur is afgehandeld.
     """
 
-    afgekeurd = InkoopfactuurstatusReferentiedata(
+    afgekeurd = InkoopfactuurstatusReferentiedata.model_construct(
         code="AGK",
         naam="Afgekeurd",
     )
@@ -31,7 +31,7 @@ class Inkoopfactuurstatus(Referentiedatasoort):
     Inkoopfactuur is afgekeurd.
     """
 
-    aangeboden_ter_betaling = InkoopfactuurstatusReferentiedata(
+    aangeboden_ter_betaling = InkoopfactuurstatusReferentiedata.model_construct(
         code="ATB",
         naam="Aangeboden ter betaling",
     )
@@ -39,7 +39,7 @@ class Inkoopfactuurstatus(Referentiedatasoort):
     Inkoopfactuur is aangeboden ter betaling.
     """
 
-    aangeboden_ter_goedkeuring = InkoopfactuurstatusReferentiedata(
+    aangeboden_ter_goedkeuring = InkoopfactuurstatusReferentiedata.model_construct(
         code="ATG",
         naam="Aangeboden ter goedkeuring",
     )
@@ -47,7 +47,7 @@ class Inkoopfactuurstatus(Referentiedatasoort):
     Inkoopfactuur is aangeboden ter goedkeuring.
     """
 
-    betaald = InkoopfactuurstatusReferentiedata(
+    betaald = InkoopfactuurstatusReferentiedata.model_construct(
         code="BET",
         naam="Betaald",
     )
@@ -55,7 +55,7 @@ class Inkoopfactuurstatus(Referentiedatasoort):
     Inkoopfactuur is betaald.
     """
 
-    geblokkeerd = InkoopfactuurstatusReferentiedata(
+    geblokkeerd = InkoopfactuurstatusReferentiedata.model_construct(
         code="BLK",
         naam="Geblokkeerd",
     )
@@ -63,7 +63,7 @@ class Inkoopfactuurstatus(Referentiedatasoort):
     Inkoopfactuur is geblokkeerd.
     """
 
-    goedgekeurd = InkoopfactuurstatusReferentiedata(
+    goedgekeurd = InkoopfactuurstatusReferentiedata.model_construct(
         code="GDK",
         naam="Goedgekeurd",
     )
@@ -71,7 +71,7 @@ class Inkoopfactuurstatus(Referentiedatasoort):
     Inkoopfactuur is goedgekeurd.
     """
 
-    historisch = InkoopfactuurstatusReferentiedata(
+    historisch = InkoopfactuurstatusReferentiedata.model_construct(
         code="HIS",
         naam="Historisch",
     )
@@ -79,7 +79,7 @@ class Inkoopfactuurstatus(Referentiedatasoort):
     Inkoopfactuur is gearchiveerd/historisch.
     """
 
-    in_behandeling = InkoopfactuurstatusReferentiedata(
+    in_behandeling = InkoopfactuurstatusReferentiedata.model_construct(
         code="IBH",
         naam="In behandeling",
     )
@@ -87,7 +87,7 @@ class Inkoopfactuurstatus(Referentiedatasoort):
     Inkoopfactuur is in behandeling.
     """
 
-    geregistreerd = InkoopfactuurstatusReferentiedata(
+    geregistreerd = InkoopfactuurstatusReferentiedata.model_construct(
         code="REG",
         naam="Geregistreerd",
     )
@@ -95,7 +95,7 @@ class Inkoopfactuurstatus(Referentiedatasoort):
     Inkoopfactuur is geregistreerd.
     """
 
-    wacht_op_creditfactuur = InkoopfactuurstatusReferentiedata(
+    wacht_op_creditfactuur = InkoopfactuurstatusReferentiedata.model_construct(
         code="WOC",
         naam="Wacht op creditfactuur",
     )
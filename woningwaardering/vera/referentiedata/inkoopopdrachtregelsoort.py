@@ -7,7 +7,7 @@ class InkoopopdrachtregelsoortReferentiedata(Referentiedata):
 
 
 class Inkoopopdrachtregelsoort(Referentiedatasoort):
-    initieel = InkoopopdrachtregelsoortReferentiedata(
+    initieel = InkoopopdrachtregelsoortReferentiedata.model_construct(
         code="INI",
         naam="Initieel",
     )
@@ -15,7 +15,7 @@ class Inkoopopdrachtregelsoort(Referentiedatasoort):
     De inkoopopdrachtregel betreft 'standaard' overeengekomen werkzaamheden
     """
 
-    meerwerk = InkoopopdrachtregelsoortReferentiedata(
+    meerwerk = InkoopopdrachtregelsoortReferentiedata.model_construct(
         code="MEE",
         naam="Meerwerk",
     )
@@ -23,7 +23,7 @@ class Inkoopopdrachtregelsoort(Referentiedatasoort):
     De inkoopopdrachtregel betreft meerwerk t.o.v. de initiële inkoopopdracht
     """
 
-    minderwerk = InkoopopdrachtregelsoortReferentiedata(
+    minderwerk = InkoopopdrachtregelsoortReferentiedata.model_construct(
         code="MIN",
         naam="Minderwerk",
     )
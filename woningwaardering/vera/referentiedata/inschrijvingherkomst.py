@@ -7,7 +7,7 @@ class InschrijvingherkomstReferentiedata(Referentiedata):
 
 
 class Inschrijvingherkomst(Referentiedatasoort):
-    heropend = InschrijvingherkomstReferentiedata(
+    heropend = InschrijvingherkomstReferentiedata.model_construct(
         code="HER",
         naam="Heropend",
     )
@@ -16,7 +16,7 @@ class Inschrijvingherkomst(Referentiedatasoort):
     inschrijving.
     """
 
-    medewerker = InschrijvingherkomstReferentiedata(
+    medewerker = InschrijvingherkomstReferentiedata.model_construct(
         code="MED",
         naam="Medewerker",
     )
@@ -24,7 +24,7 @@ class Inschrijvingherkomst(Referentiedatasoort):
     De inschrijving is aangemaakt door een medewerker.
     """
 
-    migratie = InschrijvingherkomstReferentiedata(
+    migratie = InschrijvingherkomstReferentiedata.model_construct(
         code="MIG",
         naam="Migratie",
     )
@@ -32,7 +32,7 @@ class Inschrijvingherkomst(Referentiedatasoort):
     De inschrijving is aangemaakt tijdens een migratie van gegevens.
     """
 
-    gesplitst = InschrijvingherkomstReferentiedata(
+    gesplitst = InschrijvingherkomstReferentiedata.model_construct(
         code="SPL",
         naam="Gesplitst",
     )
@@ -41,7 +41,7 @@ class Inschrijvingherkomst(Referentiedatasoort):
     inschrijving waarbij de hoofd- en medeaanvrager een eigen inschrijving krijgen.
     """
 
-    urgentie = InschrijvingherkomstReferentiedata(
+    urgentie = InschrijvingherkomstReferentiedata.model_construct(
         code="URG",
         naam="Urgentie",
     )
@@ -49,7 +49,7 @@ class Inschrijvingherkomst(Referentiedatasoort):
     De inschrijving is aangemaakt naar aanleiding van het toekennen van een urgentie.
     """
 
-    woningzoekende = InschrijvingherkomstReferentiedata(
+    woningzoekende = InschrijvingherkomstReferentiedata.model_construct(
         code="WOO",
         naam="Woningzoekende",
     )
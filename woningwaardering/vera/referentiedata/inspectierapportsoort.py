@@ -7,7 +7,7 @@ class InspectierapportsoortReferentiedata(Referentiedata):
 
 
 class Inspectierapportsoort(Referentiedatasoort):
-    eindinspectierapport = InspectierapportsoortReferentiedata(
+    eindinspectierapport = InspectierapportsoortReferentiedata.model_construct(
         code="EIN",
         naam="Eindinspectierapport",
     )
@@ -15,7 +15,7 @@ class Inspectierapportsoort(Referentiedatasoort):
     Rapport naar aanleiding van een eindinspectie
     """
 
-    reparatieinspectierapport = InspectierapportsoortReferentiedata(
+    reparatieinspectierapport = InspectierapportsoortReferentiedata.model_construct(
         code="REP",
         naam="Reparatieinspectierapport",
     )
@@ -23,7 +23,7 @@ class Inspectierapportsoort(Referentiedatasoort):
     Inspectierapport naar aanleiding van een onduidelijk reparatieverzoek
     """
 
-    steekproefinspectierapport = InspectierapportsoortReferentiedata(
+    steekproefinspectierapport = InspectierapportsoortReferentiedata.model_construct(
         code="STE",
         naam="Steekproefinspectierapport",
     )
@@ -32,7 +32,7 @@ class Inspectierapportsoort(Referentiedatasoort):
     inspecteur/opzichter.
     """
 
-    voorinspectierapport = InspectierapportsoortReferentiedata(
+    voorinspectierapport = InspectierapportsoortReferentiedata.model_construct(
         code="VOO",
         naam="Voorinspectierapport",
     )
@@ -7,27 +7,27 @@ class InspectierapportstatusReferentiedata(Referentiedata):
 
 
 class Inspectierapportstatus(Referentiedatasoort):
-    concept = InspectierapportstatusReferentiedata(
+    concept = InspectierapportstatusReferentiedata.model_construct(
         code="CON",
         naam="Concept",
     )
 
-    definitief = InspectierapportstatusReferentiedata(
+    definitief = InspectierapportstatusReferentiedata.model_construct(
         code="DEF",
         naam="Definitief",
     )
 
-    getekend = InspectierapportstatusReferentiedata(
+    getekend = InspectierapportstatusReferentiedata.model_construct(
         code="GET",
         naam="Getekend",
     )
 
-    ter_review = InspectierapportstatusReferentiedata(
+    ter_review = InspectierapportstatusReferentiedata.model_construct(
         code="REV",
         naam="Ter review",
     )
 
-    vervallen = InspectierapportstatusReferentiedata(
+    vervallen = InspectierapportstatusReferentiedata.model_construct(
         code="VAL",
         naam="Vervallen",
     )
@@ -7,7 +7,7 @@ class InstallatiesoortReferentiedata(Referentiedata):
 
 
 class Installatiesoort(Referentiedatasoort):
-    inbouw_afzuiginstallatie = InstallatiesoortReferentiedata(
+    inbouw_afzuiginstallatie = InstallatiesoortReferentiedata.model_construct(
         code="IAF",
         naam="Inbouw afzuiginstallatie",
     )
@@ -18,7 +18,7 @@ class Installatiesoort(Referentiedatasoort):
     kookinstallatie zijn, als een in het aanrecht geïntegreerd afzuigsysteem.
     """
 
-    inbouw_kookplaat_inductie = InstallatiesoortReferentiedata(
+    inbouw_kookplaat_inductie = InstallatiesoortReferentiedata.model_construct(
         code="IKI",
         naam="Inbouw kookplaat inductie",
     )
@@ -29,7 +29,7 @@ class Installatiesoort(Referentiedatasoort):
     energie-efficiëntie in vergelijking met traditionele kookplaten.
     """
 
-    inbouw_kookplaat_keramisch = InstallatiesoortReferentiedata(
+    inbouw_kookplaat_keramisch = InstallatiesoortReferentiedata.model_construct(
         code="IKK",
         naam="Inbouw kookplaat keramisch",
     )
@@ -40,7 +40,7 @@ class Installatiesoort(Referentiedatasoort):
     schoon te maken is, maar trager opwarmt dan inductie.
     """
 
-    inbouw_kookplaat_gas = InstallatiesoortReferentiedata(
+    inbouw_kookplaat_gas = InstallatiesoortReferentiedata.model_construct(
         code="IKG",
         naam="Inbouw kookplaat gas",
     )
@@ -51,7 +51,7 @@ class Installatiesoort(Referentiedatasoort):
     kookgerei, maar vereist gasaanvoer en ventilatie.
     """
 
-    inbouw_koelkast = InstallatiesoortReferentiedata(
+    inbouw_koelkast = InstallatiesoortReferentiedata.model_construct(
         code="IKO",
         naam="Inbouw koelkast",
     )
@@ -62,7 +62,7 @@ class Installatiesoort(Referentiedatasoort):
     uitstraling in de keuken.
     """
 
-    inbouw_vrieskast = InstallatiesoortReferentiedata(
+    inbouw_vrieskast = InstallatiesoortReferentiedata.model_construct(
         code="IVR",
         naam="Inbouw vrieskast",
     )
@@ -73,7 +73,7 @@ class Installatiesoort(Referentiedatasoort):
     uniforme uitstraling in de keuken.
     """
 
-    inbouw_oven_elektrisch = InstallatiesoortReferentiedata(
+    inbouw_oven_elektrisch = InstallatiesoortReferentiedata.model_construct(
         code="IOE",
         naam="Inbouw oven elektrisch",
     )
@@ -84,7 +84,7 @@ class Installatiesoort(Referentiedatasoort):
     programma's voor diverse kookmethoden.
     """
 
-    inbouw_oven_gas = InstallatiesoortReferentiedata(
+    inbouw_oven_gas = InstallatiesoortReferentiedata.model_construct(
         code="IOG",
         naam="Inbouw oven gas",
     )
@@ -95,7 +95,7 @@ class Installatiesoort(Referentiedatasoort):
     vereist gasaanvoer.
     """
 
-    inbouw_magnetron = InstallatiesoortReferentiedata(
+    inbouw_magnetron = InstallatiesoortReferentiedata.model_construct(
         code="IMA",
         naam="Inbouw magnetron",
     )
@@ -106,7 +106,7 @@ class Installatiesoort(Referentiedatasoort):
     uitstraling in de keuken.
     """
 
-    inbouw_vaatwasmachine = InstallatiesoortReferentiedata(
+    inbouw_vaatwasmachine = InstallatiesoortReferentiedata.model_construct(
         code="IVA",
         naam="Inbouw vaatwasmachine",
     )
@@ -117,15 +117,17 @@ class Installatiesoort(Referentiedatasoort):
     uitstraling van de keuken.
     """
 
-    extra_keukenkastruimte_boven_het_minimum = InstallatiesoortReferentiedata(
-        code="EKA",
-        naam="Extra keukenkastruimte boven het minimum",
+    extra_keukenkastruimte_boven_het_minimum = (
+        InstallatiesoortReferentiedata.model_construct(
+            code="EKA",
+            naam="Extra keukenkastruimte boven het minimum",
+        )
     )
     """
     per 60 cm breedte, met een minimum van 60 cm hoogte
     """
 
-    eenhandsmengkraan = InstallatiesoortReferentiedata(
+    eenhandsmengkraan = InstallatiesoortReferentiedata.model_construct(
         code="EHM",
         naam="Éénhandsmengkraan",
     )
@@ -136,7 +138,7 @@ class Installatiesoort(Referentiedatasoort):
     elke keuken of badkamer.
     """
 
-    thermostatische_mengkraan = InstallatiesoortReferentiedata(
+    thermostatische_mengkraan = InstallatiesoortReferentiedata.model_construct(
         code="TME",
         naam="Thermostatische mengkraan",
     )
@@ -147,7 +149,7 @@ class Installatiesoort(Referentiedatasoort):
     of keuken.
     """
 
-    kokend_waterfunctie = InstallatiesoortReferentiedata(
+    kokend_waterfunctie = InstallatiesoortReferentiedata.model_construct(
         code="KWA",
         naam="Kokend waterfunctie",
     )
@@ -158,7 +160,7 @@ class Installatiesoort(Referentiedatasoort):
     apart of in aanvulling op de kraan
     """
 
-    staand_toilet = InstallatiesoortReferentiedata(
+    staand_toilet = InstallatiesoortReferentiedata.model_construct(
         code="STO",
         naam="Staand Toilet",
     )
@@ -171,7 +173,7 @@ class Installatiesoort(Referentiedatasoort):
     niet in aanmerking voor waardering.
     """
 
-    hangend_toilet = InstallatiesoortReferentiedata(
+    hangend_toilet = InstallatiesoortReferentiedata.model_construct(
         code="HTO",
         naam="Hangend toilet",
     )
@@ -184,7 +186,7 @@ class Installatiesoort(Referentiedatasoort):
     toiletruimten en badkamers komen niet in aanmerking voor waardering.
     """
 
-    wastafel = InstallatiesoortReferentiedata(
+    wastafel = InstallatiesoortReferentiedata.model_construct(
         code="WAS",
         naam="Wastafel",
     )
@@ -200,7 +202,7 @@ class Installatiesoort(Referentiedatasoort):
     keer per vertrek of overige ruimte, m.u.v. de badkamer.
     """
 
-    meerpersoonswastafel = InstallatiesoortReferentiedata(
+    meerpersoonswastafel = InstallatiesoortReferentiedata.model_construct(
         code="MPW",
         naam="Meerpersoonswastafel",
     )
@@ -214,7 +216,7 @@ class Installatiesoort(Referentiedatasoort):
     afzonderlijk gewaardeerd.
     """
 
-    douche = InstallatiesoortReferentiedata(
+    douche = InstallatiesoortReferentiedata.model_construct(
         code="DOU",
         naam="Douche",
     )
@@ -231,7 +233,7 @@ class Installatiesoort(Referentiedatasoort):
     douchecabine ingenomen oppervlakte.
     """
 
-    bad = InstallatiesoortReferentiedata(
+    bad = InstallatiesoortReferentiedata.model_construct(
         code="BAD",
         naam="Bad",
     )
@@ -245,7 +247,7 @@ class Installatiesoort(Referentiedatasoort):
     douchegarnituur niet afzonderlijk geteld.
     """
 
-    bad_en_douche = InstallatiesoortReferentiedata(
+    bad_en_douche = InstallatiesoortReferentiedata.model_construct(
         code="BDO",
         naam="Bad en douche",
     )
@@ -254,7 +256,7 @@ class Installatiesoort(Referentiedatasoort):
     aangebracht, geldt een afwijkende waardering.
     """
 
-    bubbelfunctie_van_het_bad = InstallatiesoortReferentiedata(
+    bubbelfunctie_van_het_bad = InstallatiesoortReferentiedata.model_construct(
         code="BUB",
         naam="Bubbelfunctie van het bad",
     )
@@ -265,7 +267,7 @@ class Installatiesoort(Referentiedatasoort):
     bieden.
     """
 
-    douchewand = InstallatiesoortReferentiedata(
+    douchewand = InstallatiesoortReferentiedata.model_construct(
         code="DOW",
         naam="Douchewand",
     )
@@ -278,7 +280,7 @@ class Installatiesoort(Referentiedatasoort):
     worden) niet.
     """
 
-    handdoekenradiator = InstallatiesoortReferentiedata(
+    handdoekenradiator = InstallatiesoortReferentiedata.model_construct(
         code="HRA",
         naam="Handdoekenradiator",
     )
@@ -289,9 +291,11 @@ class Installatiesoort(Referentiedatasoort):
     voor een aangename temperatuur.
     """
 
-    ingebouwd_kastje_met_in_of_opgebouwde_wastafel = InstallatiesoortReferentiedata(
-        code="IKW",
-        naam="Ingebouwd kastje met in- of opgebouwde wastafel",
+    ingebouwd_kastje_met_in_of_opgebouwde_wastafel = (
+        InstallatiesoortReferentiedata.model_construct(
+            code="IKW",
+            naam="Ingebouwd kastje met in- of opgebouwde wastafel",
+        )
     )
     """
     Een ingebouwd kastje met wastafel is een geïntegreerde opberg- en wastafeloplossing
@@ -299,7 +303,7 @@ class Installatiesoort(Referentiedatasoort):
     een gestroomlijnde uitstraling en praktische opslag in badkamers of keukens.
     """
 
-    kastruimte = InstallatiesoortReferentiedata(
+    kastruimte = InstallatiesoortReferentiedata.model_construct(
         code="KAS",
         naam="Kastruimte",
     )
@@ -307,7 +311,7 @@ class Installatiesoort(Referentiedatasoort):
     Kastruimte met een minimale breedte van 40cm, en minimale hoogte van 40cm.
     """
 
-    stopcontact_bij_wastafel = InstallatiesoortReferentiedata(
+    stopcontact_bij_wastafel = InstallatiesoortReferentiedata.model_construct(
         code="STW",
         naam="Stopcontact bij wastafel",
     )
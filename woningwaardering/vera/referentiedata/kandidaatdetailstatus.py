@@ -10,7 +10,7 @@ class KandidaatdetailstatusReferentiedata(Referentiedata):
 
 
 class Kandidaatdetailstatus(Referentiedatasoort):
-    aanbieding = KandidaatdetailstatusReferentiedata(
+    aanbieding = KandidaatdetailstatusReferentiedata.model_construct(
         code="AAN",
         naam="Aanbieding",
         parent=Kandidaatstatus.aangeboden,
@@ -19,7 +19,7 @@ class Kandidaatdetailstatus(Referentiedatasoort):
     Kandidaat krijgt aanbieding.
     """
 
-    bezichtiging = KandidaatdetailstatusReferentiedata(
+    bezichtiging = KandidaatdetailstatusReferentiedata.model_construct(
         code="BEZ",
         naam="Bezichtiging",
         parent=Kandidaatstatus.aangeboden,
@@ -28,7 +28,7 @@ class Kandidaatdetailstatus(Referentiedatasoort):
     Kandidaat mag bezichtigen.
     """
 
-    documentcontrole = KandidaatdetailstatusReferentiedata(
+    documentcontrole = KandidaatdetailstatusReferentiedata.model_construct(
         code="DOC",
         naam="Documentcontrole",
         parent=Kandidaatstatus.aangeboden,
@@ -37,7 +37,7 @@ class Kandidaatdetailstatus(Referentiedatasoort):
     Kandidaat moet documenten laten controleren.
     """
 
-    geen_belangstelling_meer = KandidaatdetailstatusReferentiedata(
+    geen_belangstelling_meer = KandidaatdetailstatusReferentiedata.model_construct(
         code="GEE",
         naam="Geen belangstelling meer",
     )
@@ -45,7 +45,7 @@ class Kandidaatdetailstatus(Referentiedatasoort):
     Kandidaat geeft aan geen belangstelling (meer) te hebben.
     """
 
-    geinteresseerd = KandidaatdetailstatusReferentiedata(
+    geinteresseerd = KandidaatdetailstatusReferentiedata.model_construct(
         code="INT",
         naam="Geïnteresseerd",
     )
@@ -53,7 +53,7 @@ class Kandidaatdetailstatus(Referentiedatasoort):
     Kandidaat is geïnteresseerd.
     """
 
-    niet_gereageerd = KandidaatdetailstatusReferentiedata(
+    niet_gereageerd = KandidaatdetailstatusReferentiedata.model_construct(
         code="NRE",
         naam="Niet gereageerd",
         parent=Kandidaatstatus.geweigerd,
@@ -62,7 +62,7 @@ class Kandidaatdetailstatus(Referentiedatasoort):
     Kandidaat heeft te laat of niet gereageerd.
     """
 
-    ongeschikt = KandidaatdetailstatusReferentiedata(
+    ongeschikt = KandidaatdetailstatusReferentiedata.model_construct(
         code="ONG",
         naam="Ongeschikt",
         parent=Kandidaatstatus.afgewezen,
@@ -71,7 +71,7 @@ class Kandidaatdetailstatus(Referentiedatasoort):
     Kandidaat niet geschikt voor omgeving.
     """
 
-    gegevens_onjuist = KandidaatdetailstatusReferentiedata(
+    gegevens_onjuist = KandidaatdetailstatusReferentiedata.model_construct(
         code="ONJ",
         naam="Gegevens onjuist",
         parent=Kandidaatstatus.afgewezen,
@@ -80,7 +80,7 @@ class Kandidaatdetailstatus(Referentiedatasoort):
     Kandidaat komt niet in aanmerking na controle gegevens.
     """
 
-    overeenkomst_getekend = KandidaatdetailstatusReferentiedata(
+    overeenkomst_getekend = KandidaatdetailstatusReferentiedata.model_construct(
         code="OVE",
         naam="Overeenkomst getekend",
         parent=Kandidaatstatus.aangeboden,
@@ -89,7 +89,7 @@ class Kandidaatdetailstatus(Referentiedatasoort):
     Kandidaat heeft huur- of koopovereenkomst getekend.
     """
 
-    geparkeerd = KandidaatdetailstatusReferentiedata(
+    geparkeerd = KandidaatdetailstatusReferentiedata.model_construct(
         code="PAR",
         naam="Geparkeerd",
     )
@@ -97,7 +97,7 @@ class Kandidaatdetailstatus(Referentiedatasoort):
     Kandidaat wil tijdelijk geen aanbiedingen ontvangen naar aanleiding van de reactie.
     """
 
-    peilen_belangstelling = KandidaatdetailstatusReferentiedata(
+    peilen_belangstelling = KandidaatdetailstatusReferentiedata.model_construct(
         code="PEI",
         naam="Peilen belangstelling",
         parent=Kandidaatstatus.aangeboden,
@@ -106,7 +106,7 @@ class Kandidaatdetailstatus(Referentiedatasoort):
     Kandidaat wordt gevraagd of deze nog steeds belangstelling heeft.
     """
 
-    weigering_aanbieding = KandidaatdetailstatusReferentiedata(
+    weigering_aanbieding = KandidaatdetailstatusReferentiedata.model_construct(
         code="WEI",
         naam="Weigering aanbieding",
         parent=Kandidaatstatus.geweigerd,
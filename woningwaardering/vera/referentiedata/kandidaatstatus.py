@@ -7,7 +7,7 @@ class KandidaatstatusReferentiedata(Referentiedata):
 
 
 class Kandidaatstatus(Referentiedatasoort):
-    aangeboden = KandidaatstatusReferentiedata(
+    aangeboden = KandidaatstatusReferentiedata.model_construct(
         code="AAN",
         naam="Aangeboden",
     )
@@ -15,7 +15,7 @@ class Kandidaatstatus(Referentiedatasoort):
     Kandidaat zit  in aanbiedingsproces.
     """
 
-    afgewezen = KandidaatstatusReferentiedata(
+    afgewezen = KandidaatstatusReferentiedata.model_construct(
         code="AFG",
         naam="Afgewezen",
     )
@@ -23,7 +23,7 @@ class Kandidaatstatus(Referentiedatasoort):
     Kandidaat is afgewezen door de aanbieder, corporatie, medebewoners etc.
     """
 
-    geweigerd = KandidaatstatusReferentiedata(
+    geweigerd = KandidaatstatusReferentiedata.model_construct(
         code="GEW",
         naam="Geweigerd",
     )
@@ -31,7 +31,7 @@ class Kandidaatstatus(Referentiedatasoort):
     Kandidaat heeft de aanbieiding geweigerd.
     """
 
-    potentiele_kandidaat = KandidaatstatusReferentiedata(
+    potentiele_kandidaat = KandidaatstatusReferentiedata.model_construct(
         code="POT",
         naam="Potentiele kandidaat",
     )
@@ -39,7 +39,7 @@ class Kandidaatstatus(Referentiedatasoort):
     Kandidaat voldoet aan de spelregels van de publicatie.
     """
 
-    gereageerd = KandidaatstatusReferentiedata(
+    gereageerd = KandidaatstatusReferentiedata.model_construct(
         code="REA",
         naam="Gereageerd",
     )
@@ -47,7 +47,7 @@ class Kandidaatstatus(Referentiedatasoort):
     Kandidaat heeft gereageerd op de publicatie.
     """
 
-    geselecteerd = KandidaatstatusReferentiedata(
+    geselecteerd = KandidaatstatusReferentiedata.model_construct(
         code="SEL",
         naam="Geselecteerd",
     )
@@ -55,7 +55,7 @@ class Kandidaatstatus(Referentiedatasoort):
     Kandidaat staat op vrijgegeven kandidatenlijst.
     """
 
-    toegewezen = KandidaatstatusReferentiedata(
+    toegewezen = KandidaatstatusReferentiedata.model_construct(
         code="TOE",
         naam="Toegewezen",
     )
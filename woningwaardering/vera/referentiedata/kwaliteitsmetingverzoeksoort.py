@@ -7,15 +7,17 @@ class KwaliteitsmetingverzoeksoortReferentiedata(Referentiedata):
 
 
 class Kwaliteitsmetingverzoeksoort(Referentiedatasoort):
-    algemene_dienstverlening = KwaliteitsmetingverzoeksoortReferentiedata(
-        code="ALG",
-        naam="Algemene dienstverlening",
+    algemene_dienstverlening = (
+        KwaliteitsmetingverzoeksoortReferentiedata.model_construct(
+            code="ALG",
+            naam="Algemene dienstverlening",
+        )
     )
     """
     Kwaliteitsmetingverzoek betreffende algemene dienstverlening
     """
 
-    nieuwe_huurders = KwaliteitsmetingverzoeksoortReferentiedata(
+    nieuwe_huurders = KwaliteitsmetingverzoeksoortReferentiedata.model_construct(
         code="HUN",
         naam="Nieuwe huurders",
     )
@@ -23,7 +25,7 @@ class Kwaliteitsmetingverzoeksoort(Referentiedatasoort):
     Kwaliteitsmetingverzoek betreffende nieuwe huurders
     """
 
-    vertrokken_huurders = KwaliteitsmetingverzoeksoortReferentiedata(
+    vertrokken_huurders = KwaliteitsmetingverzoeksoortReferentiedata.model_construct(
         code="HUV",
         naam="Vertrokken huurders",
     )
@@ -31,7 +33,7 @@ class Kwaliteitsmetingverzoeksoort(Referentiedatasoort):
     Kwaliteitsmetingverzoek betreffende vertrokken huurders
     """
 
-    onderhoud = KwaliteitsmetingverzoeksoortReferentiedata(
+    onderhoud = KwaliteitsmetingverzoeksoortReferentiedata.model_construct(
         code="OND",
         naam="Onderhoud",
     )
@@ -39,7 +41,7 @@ class Kwaliteitsmetingverzoeksoort(Referentiedatasoort):
     Kwaliteitsmetingverzoek betreffende onderhoud
     """
 
-    overig = KwaliteitsmetingverzoeksoortReferentiedata(
+    overig = KwaliteitsmetingverzoeksoortReferentiedata.model_construct(
         code="OVR",
         naam="Overig",
     )
@@ -47,7 +49,7 @@ class Kwaliteitsmetingverzoeksoort(Referentiedatasoort):
     Kwaliteitsmetingverzoek betreffende overige onderwerpen
     """
 
-    reparaties = KwaliteitsmetingverzoeksoortReferentiedata(
+    reparaties = KwaliteitsmetingverzoeksoortReferentiedata.model_construct(
         code="REP",
         naam="Reparaties",
     )
@@ -55,7 +57,7 @@ class Kwaliteitsmetingverzoeksoort(Referentiedatasoort):
     Kwaliteitsmetingverzoek betreffende reparaties
     """
 
-    woonomgeving = KwaliteitsmetingverzoeksoortReferentiedata(
+    woonomgeving = KwaliteitsmetingverzoeksoortReferentiedata.model_construct(
         code="WOO",
         naam="Woonomgeving",
     )
@@ -7,22 +7,22 @@ class KwaliteitsniveauReferentiedata(Referentiedata):
 
 
 class Kwaliteitsniveau(Referentiedatasoort):
-    eenvoudig = KwaliteitsniveauReferentiedata(
+    eenvoudig = KwaliteitsniveauReferentiedata.model_construct(
         code="EEN",
         naam="Eenvoudig",
     )
 
-    hoogwaardig = KwaliteitsniveauReferentiedata(
+    hoogwaardig = KwaliteitsniveauReferentiedata.model_construct(
         code="HOO",
         naam="Hoogwaardig",
     )
 
-    luxe = KwaliteitsniveauReferentiedata(
+    luxe = KwaliteitsniveauReferentiedata.model_construct(
         code="LUX",
         naam="Luxe",
     )
 
-    standaard = KwaliteitsniveauReferentiedata(
+    standaard = KwaliteitsniveauReferentiedata.model_construct(
         code="STA",
         naam="Standaard",
     )
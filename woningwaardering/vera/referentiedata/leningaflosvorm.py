@@ -7,7 +7,7 @@ class LeningaflosvormReferentiedata(Referentiedata):
 
 
 class Leningaflosvorm(Referentiedatasoort):
-    annuitair = LeningaflosvormReferentiedata(
+    annuitair = LeningaflosvormReferentiedata.model_construct(
         code="ANN",
         naam="Annuitair",
     )
@@ -16,12 +16,12 @@ class Leningaflosvorm(Referentiedatasoort):
     aflossing.
     """
 
-    fixe = LeningaflosvormReferentiedata(
+    fixe = LeningaflosvormReferentiedata.model_construct(
         code="FIX",
         naam="Fixe",
     )
 
-    lineair = LeningaflosvormReferentiedata(
+    lineair = LeningaflosvormReferentiedata.model_construct(
         code="LIN",
         naam="Lineair",
     )
@@ -7,17 +7,17 @@ class LeningdetailsoortReferentiedata(Referentiedata):
 
 
 class Leningdetailsoort(Referentiedatasoort):
-    collegiaal = LeningdetailsoortReferentiedata(
+    collegiaal = LeningdetailsoortReferentiedata.model_construct(
         code="COL",
         naam="Collegiaal",
     )
 
-    converteerbaar = LeningdetailsoortReferentiedata(
+    converteerbaar = LeningdetailsoortReferentiedata.model_construct(
         code="CON",
         naam="Converteerbaar",
     )
 
-    extendible = LeningdetailsoortReferentiedata(
+    extendible = LeningdetailsoortReferentiedata.model_construct(
         code="EXT",
         naam="Extendible",
     )
@@ -25,12 +25,12 @@ class Leningdetailsoort(Referentiedatasoort):
     De financier (geldverstrekker) kan de lening verlengen.
     """
 
-    hypothecaire_lening = LeningdetailsoortReferentiedata(
+    hypothecaire_lening = LeningdetailsoortReferentiedata.model_construct(
         code="HYP",
         naam="Hypothecaire lening",
     )
 
-    intern = LeningdetailsoortReferentiedata(
+    intern = LeningdetailsoortReferentiedata.model_construct(
         code="INT",
         naam="Intern",
     )
@@ -39,7 +39,7 @@ class Leningdetailsoort(Referentiedatasoort):
     en een dochtermaatschappij.
     """
 
-    obligatielening = LeningdetailsoortReferentiedata(
+    obligatielening = LeningdetailsoortReferentiedata.model_construct(
         code="OBL",
         naam="Obligatielening",
     )
@@ -7,12 +7,12 @@ class LeningsoortReferentiedata(Referentiedata):
 
 
 class Leningsoort(Referentiedatasoort):
-    kredietfaciliteit = LeningsoortReferentiedata(
+    kredietfaciliteit = LeningsoortReferentiedata.model_construct(
         code="KRE",
         naam="Kredietfaciliteit",
     )
 
-    lening = LeningsoortReferentiedata(
+    lening = LeningsoortReferentiedata.model_construct(
         code="LEN",
         naam="Lening",
     )
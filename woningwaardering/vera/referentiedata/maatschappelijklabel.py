@@ -7,7 +7,7 @@ class MaatschappelijklabelReferentiedata(Referentiedata):
 
 
 class Maatschappelijklabel(Referentiedatasoort):
-    daeb = MaatschappelijklabelReferentiedata(
+    daeb = MaatschappelijklabelReferentiedata.model_construct(
         code="DAE",
         naam="DAEB",
     )
@@ -19,16 +19,18 @@ class Maatschappelijklabel(Referentiedatasoort):
     als DAEB verantwoord worden.
     """
 
-    geconsolideerde_niet_daeb_verbinding = MaatschappelijklabelReferentiedata(
-        code="GNDV",
-        naam="Geconsolideerde NIET-DAEB verbinding",
+    geconsolideerde_niet_daeb_verbinding = (
+        MaatschappelijklabelReferentiedata.model_construct(
+            code="GNDV",
+            naam="Geconsolideerde NIET-DAEB verbinding",
+        )
     )
     """
     Als attribuut van de klasse FinancieelBedrijf: Geeft aan of het bedrijf een
     consolidatiebedrijf is, waarbinnen NIET-DAEB activiteiten worden verricht.
     """
 
-    niet_daeb = MaatschappelijklabelReferentiedata(
+    niet_daeb = MaatschappelijklabelReferentiedata.model_construct(
         code="NDA",
         naam="NIET-DAEB",
     )
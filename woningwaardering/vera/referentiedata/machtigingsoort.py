@@ -7,12 +7,12 @@ class MachtigingsoortReferentiedata(Referentiedata):
 
 
 class Machtigingsoort(Referentiedatasoort):
-    doorlopend = MachtigingsoortReferentiedata(
+    doorlopend = MachtigingsoortReferentiedata.model_construct(
         code="DOO",
         naam="Doorlopend",
     )
 
-    eenmalig = MachtigingsoortReferentiedata(
+    eenmalig = MachtigingsoortReferentiedata.model_construct(
         code="EEN",
         naam="Eenmalig",
     )
@@ -10,1204 +10,1204 @@ class MateriaaldetailsoortReferentiedata(Referentiedata):
 
 
 class Materiaaldetailsoort(Referentiedatasoort):
-    ntb = MateriaaldetailsoortReferentiedata(
+    ntb = MateriaaldetailsoortReferentiedata.model_construct(
         code="NTB",
         naam="Ntb",
     )
 
-    generiek = MateriaaldetailsoortReferentiedata(
+    generiek = MateriaaldetailsoortReferentiedata.model_construct(
         code="GEN",
         naam="Generiek",
     )
 
-    gasbeton = MateriaaldetailsoortReferentiedata(
+    gasbeton = MateriaaldetailsoortReferentiedata.model_construct(
         code="GAS",
         naam="Gasbeton",
         parent=Materiaalsoort.beton,
     )
 
-    bimsbeton = MateriaaldetailsoortReferentiedata(
+    bimsbeton = MateriaaldetailsoortReferentiedata.model_construct(
         code="BIM",
         naam="Bimsbeton",
         parent=Materiaalsoort.beton,
     )
 
-    isolatiebeton = MateriaaldetailsoortReferentiedata(
+    isolatiebeton = MateriaaldetailsoortReferentiedata.model_construct(
         code="ISO",
         naam="Isolatiebeton",
         parent=Materiaalsoort.beton,
     )
 
-    lichtbeton = MateriaaldetailsoortReferentiedata(
+    lichtbeton = MateriaaldetailsoortReferentiedata.model_construct(
         code="LIC",
         naam="Lichtbeton",
         parent=Materiaalsoort.beton,
     )
 
-    slakkenbeton = MateriaaldetailsoortReferentiedata(
+    slakkenbeton = MateriaaldetailsoortReferentiedata.model_construct(
         code="SLA",
         naam="Slakkenbeton",
         parent=Materiaalsoort.beton,
     )
 
-    voorgespannen = MateriaaldetailsoortReferentiedata(
+    voorgespannen = MateriaaldetailsoortReferentiedata.model_construct(
         code="VOO",
         naam="Voorgespannen",
         parent=Materiaalsoort.beton,
     )
 
-    cellenbeton = MateriaaldetailsoortReferentiedata(
+    cellenbeton = MateriaaldetailsoortReferentiedata.model_construct(
         code="CEL",
         naam="Cellenbeton",
         parent=Materiaalsoort.beton,
     )
 
-    gewapend = MateriaaldetailsoortReferentiedata(
+    gewapend = MateriaaldetailsoortReferentiedata.model_construct(
         code="GEW",
         naam="Gewapend",
     )
 
-    grindbeton = MateriaaldetailsoortReferentiedata(
+    grindbeton = MateriaaldetailsoortReferentiedata.model_construct(
         code="GBE",
         naam="Grindbeton",
         parent=Materiaalsoort.beton,
     )
 
-    schuimbeton = MateriaaldetailsoortReferentiedata(
+    schuimbeton = MateriaaldetailsoortReferentiedata.model_construct(
         code="SBE",
         naam="Schuimbeton",
         parent=Materiaalsoort.beton,
     )
 
-    spuitbeton = MateriaaldetailsoortReferentiedata(
+    spuitbeton = MateriaaldetailsoortReferentiedata.model_construct(
         code="SBT",
         naam="Spuitbeton",
         parent=Materiaalsoort.beton,
     )
 
-    staalvezelbeton = MateriaaldetailsoortReferentiedata(
+    staalvezelbeton = MateriaaldetailsoortReferentiedata.model_construct(
         code="SVE",
         naam="Staalvezelbeton",
         parent=Materiaalsoort.beton,
     )
 
-    asfalt = MateriaaldetailsoortReferentiedata(
+    asfalt = MateriaaldetailsoortReferentiedata.model_construct(
         code="ASF",
         naam="Asfalt",
         parent=Materiaalsoort.bitumen,
     )
 
-    teer = MateriaaldetailsoortReferentiedata(
+    teer = MateriaaldetailsoortReferentiedata.model_construct(
         code="TEE",
         naam="Teer",
         parent=Materiaalsoort.bitumen,
     )
 
-    asbestcement = MateriaaldetailsoortReferentiedata(
+    asbestcement = MateriaaldetailsoortReferentiedata.model_construct(
         code="ACE",
         naam="Asbestcement",
         parent=Materiaalsoort.bitumen,
     )
 
-    cementstuc = MateriaaldetailsoortReferentiedata(
+    cementstuc = MateriaaldetailsoortReferentiedata.model_construct(
         code="CEM",
         naam="Cementstuc",
         parent=Materiaalsoort.cement,
     )
 
-    grout = MateriaaldetailsoortReferentiedata(
+    grout = MateriaaldetailsoortReferentiedata.model_construct(
         code="GRO",
         naam="Grout",
         parent=Materiaalsoort.cement,
     )
 
-    metselspecie = MateriaaldetailsoortReferentiedata(
+    metselspecie = MateriaaldetailsoortReferentiedata.model_construct(
         code="MET",
         naam="Metselspecie",
         parent=Materiaalsoort.cement,
     )
 
-    mortel = MateriaaldetailsoortReferentiedata(
+    mortel = MateriaaldetailsoortReferentiedata.model_construct(
         code="MOR",
         naam="Mortel",
         parent=Materiaalsoort.cement,
     )
 
-    terrazzo = MateriaaldetailsoortReferentiedata(
+    terrazzo = MateriaaldetailsoortReferentiedata.model_construct(
         code="TER",
         naam="Terrazzo",
         parent=Materiaalsoort.cement,
     )
 
-    vezelcement = MateriaaldetailsoortReferentiedata(
+    vezelcement = MateriaaldetailsoortReferentiedata.model_construct(
         code="VEZ",
         naam="Vezelcement",
         parent=Materiaalsoort.cement,
     )
 
-    houtvezelcement = MateriaaldetailsoortReferentiedata(
+    houtvezelcement = MateriaaldetailsoortReferentiedata.model_construct(
         code="HVC",
         naam="Houtvezelcement",
         parent=Materiaalsoort.cement,
     )
 
-    houtwolcement = MateriaaldetailsoortReferentiedata(
+    houtwolcement = MateriaaldetailsoortReferentiedata.model_construct(
         code="HWC",
         naam="Houtwolcement",
         parent=Materiaalsoort.cement,
     )
 
-    spuitmortel = MateriaaldetailsoortReferentiedata(
+    spuitmortel = MateriaaldetailsoortReferentiedata.model_construct(
         code="SMO",
         naam="Spuitmortel",
         parent=Materiaalsoort.cement,
     )
 
-    zandcement = MateriaaldetailsoortReferentiedata(
+    zandcement = MateriaaldetailsoortReferentiedata.model_construct(
         code="ZCE",
         naam="Zandcement",
         parent=Materiaalsoort.cement,
     )
 
-    zandcement_vezel = MateriaaldetailsoortReferentiedata(
+    zandcement_vezel = MateriaaldetailsoortReferentiedata.model_construct(
         code="ZCV",
         naam="Zandcement-Vezel",
         parent=Materiaalsoort.cement,
     )
 
-    anhydriet = MateriaaldetailsoortReferentiedata(
+    anhydriet = MateriaaldetailsoortReferentiedata.model_construct(
         code="ANH",
         naam="Anhydriet",
         parent=Materiaalsoort.gips,
     )
 
-    gipskarton = MateriaaldetailsoortReferentiedata(
+    gipskarton = MateriaaldetailsoortReferentiedata.model_construct(
         code="GIP",
         naam="Gipskarton",
         parent=Materiaalsoort.gips,
     )
 
-    stuc = MateriaaldetailsoortReferentiedata(
+    stuc = MateriaaldetailsoortReferentiedata.model_construct(
         code="STU",
         naam="Stuc",
         parent=Materiaalsoort.gips,
     )
 
-    spuitstuc = MateriaaldetailsoortReferentiedata(
+    spuitstuc = MateriaaldetailsoortReferentiedata.model_construct(
         code="SST",
         naam="Spuitstuc",
         parent=Materiaalsoort.gips,
     )
 
-    cellulairglas = MateriaaldetailsoortReferentiedata(
+    cellulairglas = MateriaaldetailsoortReferentiedata.model_construct(
         code="CGL",
         naam="Cellulairglas",
         parent=Materiaalsoort.gips,
     )
 
-    gehard = MateriaaldetailsoortReferentiedata(
+    gehard = MateriaaldetailsoortReferentiedata.model_construct(
         code="GEH",
         naam="Gehard",
         parent=Materiaalsoort.glas,
     )
 
-    helder = MateriaaldetailsoortReferentiedata(
+    helder = MateriaaldetailsoortReferentiedata.model_construct(
         code="HEL",
         naam="Helder",
         parent=Materiaalsoort.glas,
     )
 
-    opaal = MateriaaldetailsoortReferentiedata(
+    opaal = MateriaaldetailsoortReferentiedata.model_construct(
         code="OPA",
         naam="Opaal",
         parent=Materiaalsoort.glas,
     )
 
-    spiegelend = MateriaaldetailsoortReferentiedata(
+    spiegelend = MateriaaldetailsoortReferentiedata.model_construct(
         code="SPI",
         naam="Spiegelend",
         parent=Materiaalsoort.glas,
     )
 
-    kwartsglas = MateriaaldetailsoortReferentiedata(
+    kwartsglas = MateriaaldetailsoortReferentiedata.model_construct(
         code="KWA",
         naam="Kwartsglas",
         parent=Materiaalsoort.glas,
     )
 
-    bimszand = MateriaaldetailsoortReferentiedata(
+    bimszand = MateriaaldetailsoortReferentiedata.model_construct(
         code="BZA",
         naam="Bimszand",
         parent=Materiaalsoort.glas,
     )
 
-    grind = MateriaaldetailsoortReferentiedata(
+    grind = MateriaaldetailsoortReferentiedata.model_construct(
         code="GRI",
         naam="Grind",
         parent=Materiaalsoort.grondstof,
     )
 
-    aarde = MateriaaldetailsoortReferentiedata(
+    aarde = MateriaaldetailsoortReferentiedata.model_construct(
         code="AAR",
         naam="Aarde",
         parent=Materiaalsoort.grondstof,
     )
 
-    klei = MateriaaldetailsoortReferentiedata(
+    klei = MateriaaldetailsoortReferentiedata.model_construct(
         code="KLE",
         naam="Klei",
         parent=Materiaalsoort.grondstof,
     )
 
-    lucht = MateriaaldetailsoortReferentiedata(
+    lucht = MateriaaldetailsoortReferentiedata.model_construct(
         code="LUC",
         naam="Lucht",
         parent=Materiaalsoort.grondstof,
     )
 
-    split = MateriaaldetailsoortReferentiedata(
+    split = MateriaaldetailsoortReferentiedata.model_construct(
         code="SPL",
         naam="Split",
         parent=Materiaalsoort.grondstof,
     )
 
-    turf = MateriaaldetailsoortReferentiedata(
+    turf = MateriaaldetailsoortReferentiedata.model_construct(
         code="TUR",
         naam="Turf",
         parent=Materiaalsoort.grondstof,
     )
 
-    water = MateriaaldetailsoortReferentiedata(
+    water = MateriaaldetailsoortReferentiedata.model_construct(
         code="WAT",
         naam="Water",
         parent=Materiaalsoort.grondstof,
     )
 
-    kalk = MateriaaldetailsoortReferentiedata(
+    kalk = MateriaaldetailsoortReferentiedata.model_construct(
         code="KAL",
         naam="Kalk",
         parent=Materiaalsoort.grondstof,
     )
 
-    leem = MateriaaldetailsoortReferentiedata(
+    leem = MateriaaldetailsoortReferentiedata.model_construct(
         code="LEE",
         naam="Leem",
         parent=Materiaalsoort.grondstof,
     )
 
-    silt = MateriaaldetailsoortReferentiedata(
+    silt = MateriaaldetailsoortReferentiedata.model_construct(
         code="SIL",
         naam="Silt",
         parent=Materiaalsoort.grondstof,
     )
 
-    zand = MateriaaldetailsoortReferentiedata(
+    zand = MateriaaldetailsoortReferentiedata.model_construct(
         code="ZAN",
         naam="Zand",
         parent=Materiaalsoort.grondstof,
     )
 
-    hardboard = MateriaaldetailsoortReferentiedata(
+    hardboard = MateriaaldetailsoortReferentiedata.model_construct(
         code="HBO",
         naam="Hardboard",
         parent=Materiaalsoort.grondstof,
     )
 
-    hardhout = MateriaaldetailsoortReferentiedata(
+    hardhout = MateriaaldetailsoortReferentiedata.model_construct(
         code="HHO",
         naam="Hardhout",
         parent=Materiaalsoort.hout,
     )
 
-    houtspaan = MateriaaldetailsoortReferentiedata(
+    houtspaan = MateriaaldetailsoortReferentiedata.model_construct(
         code="HSP",
         naam="Houtspaan",
         parent=Materiaalsoort.hout,
     )
 
-    accoya = MateriaaldetailsoortReferentiedata(
+    accoya = MateriaaldetailsoortReferentiedata.model_construct(
         code="ACC",
         naam="Accoya",
         parent=Materiaalsoort.hout,
     )
 
-    azobe = MateriaaldetailsoortReferentiedata(
+    azobe = MateriaaldetailsoortReferentiedata.model_construct(
         code="AZO",
         naam="Azobe",
         parent=Materiaalsoort.hout,
     )
 
-    balsa = MateriaaldetailsoortReferentiedata(
+    balsa = MateriaaldetailsoortReferentiedata.model_construct(
         code="BAL",
         naam="Balsa",
         parent=Materiaalsoort.hout,
     )
 
-    bangkirai = MateriaaldetailsoortReferentiedata(
+    bangkirai = MateriaaldetailsoortReferentiedata.model_construct(
         code="BAN",
         naam="Bangkirai",
         parent=Materiaalsoort.hout,
     )
 
-    berken = MateriaaldetailsoortReferentiedata(
+    berken = MateriaaldetailsoortReferentiedata.model_construct(
         code="BER",
         naam="Berken",
         parent=Materiaalsoort.hout,
     )
 
-    beuken = MateriaaldetailsoortReferentiedata(
+    beuken = MateriaaldetailsoortReferentiedata.model_construct(
         code="BEU",
         naam="Beuken",
         parent=Materiaalsoort.hout,
     )
 
-    bilinga = MateriaaldetailsoortReferentiedata(
+    bilinga = MateriaaldetailsoortReferentiedata.model_construct(
         code="BIL",
         naam="Bilinga",
         parent=Materiaalsoort.hout,
     )
 
-    board = MateriaaldetailsoortReferentiedata(
+    board = MateriaaldetailsoortReferentiedata.model_construct(
         code="BOA",
         naam="Board",
         parent=Materiaalsoort.hout,
     )
 
-    clt = MateriaaldetailsoortReferentiedata(
+    clt = MateriaaldetailsoortReferentiedata.model_construct(
         code="CLT",
         naam="Clt",
         parent=Materiaalsoort.hout,
     )
 
-    douglas = MateriaaldetailsoortReferentiedata(
+    douglas = MateriaaldetailsoortReferentiedata.model_construct(
         code="DOU",
         naam="Douglas",
         parent=Materiaalsoort.hout,
     )
 
-    ebben = MateriaaldetailsoortReferentiedata(
+    ebben = MateriaaldetailsoortReferentiedata.model_construct(
         code="EBB",
         naam="Ebben",
         parent=Materiaalsoort.hout,
     )
 
-    eiken = MateriaaldetailsoortReferentiedata(
+    eiken = MateriaaldetailsoortReferentiedata.model_construct(
         code="EIK",
         naam="Eiken",
         parent=Materiaalsoort.hout,
     )
 
-    esdoorn = MateriaaldetailsoortReferentiedata(
+    esdoorn = MateriaaldetailsoortReferentiedata.model_construct(
         code="ESD",
         naam="Esdoorn",
         parent=Materiaalsoort.hout,
     )
 
-    essen = MateriaaldetailsoortReferentiedata(
+    essen = MateriaaldetailsoortReferentiedata.model_construct(
         code="ESS",
         naam="Essen",
         parent=Materiaalsoort.hout,
     )
 
-    gemodificeerd = MateriaaldetailsoortReferentiedata(
+    gemodificeerd = MateriaaldetailsoortReferentiedata.model_construct(
         code="GEM",
         naam="Gemodificeerd",
         parent=Materiaalsoort.hout,
     )
 
-    grenen = MateriaaldetailsoortReferentiedata(
+    grenen = MateriaaldetailsoortReferentiedata.model_construct(
         code="GRE",
         naam="Grenen",
         parent=Materiaalsoort.hout,
     )
 
-    houtvezel = MateriaaldetailsoortReferentiedata(
+    houtvezel = MateriaaldetailsoortReferentiedata.model_construct(
         code="HVE",
         naam="Houtvezel",
         parent=Materiaalsoort.hout,
     )
 
-    houtwol = MateriaaldetailsoortReferentiedata(
+    houtwol = MateriaaldetailsoortReferentiedata.model_construct(
         code="HWO",
         naam="Houtwol",
         parent=Materiaalsoort.hout,
     )
 
-    kersen = MateriaaldetailsoortReferentiedata(
+    kersen = MateriaaldetailsoortReferentiedata.model_construct(
         code="KER",
         naam="Kersen",
         parent=Materiaalsoort.hout,
     )
 
-    lariks = MateriaaldetailsoortReferentiedata(
+    lariks = MateriaaldetailsoortReferentiedata.model_construct(
         code="LAR",
         naam="Lariks",
         parent=Materiaalsoort.hout,
     )
 
-    mahonie = MateriaaldetailsoortReferentiedata(
+    mahonie = MateriaaldetailsoortReferentiedata.model_construct(
         code="MAH",
         naam="Mahonie",
         parent=Materiaalsoort.hout,
     )
 
-    masonite = MateriaaldetailsoortReferentiedata(
+    masonite = MateriaaldetailsoortReferentiedata.model_construct(
         code="MAS",
         naam="Masonite",
         parent=Materiaalsoort.hout,
     )
 
-    mdf = MateriaaldetailsoortReferentiedata(
+    mdf = MateriaaldetailsoortReferentiedata.model_construct(
         code="MDF",
         naam="Mdf",
         parent=Materiaalsoort.hout,
     )
 
-    multiplex = MateriaaldetailsoortReferentiedata(
+    multiplex = MateriaaldetailsoortReferentiedata.model_construct(
         code="MUL",
         naam="Multiplex",
         parent=Materiaalsoort.hout,
     )
 
-    noten = MateriaaldetailsoortReferentiedata(
+    noten = MateriaaldetailsoortReferentiedata.model_construct(
         code="NOT",
         naam="Noten",
         parent=Materiaalsoort.hout,
     )
 
-    okoume = MateriaaldetailsoortReferentiedata(
+    okoume = MateriaaldetailsoortReferentiedata.model_construct(
         code="OKO",
         naam="Okoume",
         parent=Materiaalsoort.hout,
     )
 
-    osb = MateriaaldetailsoortReferentiedata(
+    osb = MateriaaldetailsoortReferentiedata.model_construct(
         code="OSB",
         naam="Osb",
         parent=Materiaalsoort.hout,
     )
 
-    populieren = MateriaaldetailsoortReferentiedata(
+    populieren = MateriaaldetailsoortReferentiedata.model_construct(
         code="POP",
         naam="Populieren",
         parent=Materiaalsoort.hout,
     )
 
-    spaanplaat = MateriaaldetailsoortReferentiedata(
+    spaanplaat = MateriaaldetailsoortReferentiedata.model_construct(
         code="SPA",
         naam="Spaanplaat",
         parent=Materiaalsoort.hout,
     )
 
-    triplex = MateriaaldetailsoortReferentiedata(
+    triplex = MateriaaldetailsoortReferentiedata.model_construct(
         code="TRI",
         naam="Triplex",
         parent=Materiaalsoort.hout,
     )
 
-    vuren = MateriaaldetailsoortReferentiedata(
+    vuren = MateriaaldetailsoortReferentiedata.model_construct(
         code="VUR",
         naam="Vuren",
         parent=Materiaalsoort.hout,
     )
 
-    wenge = MateriaaldetailsoortReferentiedata(
+    wenge = MateriaaldetailsoortReferentiedata.model_construct(
         code="WEN",
         naam="Wenge",
         parent=Materiaalsoort.hout,
     )
 
-    ceder = MateriaaldetailsoortReferentiedata(
+    ceder = MateriaaldetailsoortReferentiedata.model_construct(
         code="CED",
         naam="Ceder",
         parent=Materiaalsoort.hout,
     )
 
-    zaagsel = MateriaaldetailsoortReferentiedata(
+    zaagsel = MateriaaldetailsoortReferentiedata.model_construct(
         code="ZAA",
         naam="Zaagsel",
         parent=Materiaalsoort.hout,
     )
 
-    meranti = MateriaaldetailsoortReferentiedata(
+    meranti = MateriaaldetailsoortReferentiedata.model_construct(
         code="MER",
         naam="Meranti",
         parent=Materiaalsoort.hout,
     )
 
-    merbau = MateriaaldetailsoortReferentiedata(
+    merbau = MateriaaldetailsoortReferentiedata.model_construct(
         code="MBA",
         naam="Merbau",
         parent=Materiaalsoort.hout,
     )
 
-    zachtboard = MateriaaldetailsoortReferentiedata(
+    zachtboard = MateriaaldetailsoortReferentiedata.model_construct(
         code="ZBO",
         naam="Zachtboard",
         parent=Materiaalsoort.hout,
     )
 
-    zachthout = MateriaaldetailsoortReferentiedata(
+    zachthout = MateriaaldetailsoortReferentiedata.model_construct(
         code="ZHO",
         naam="Zachthout",
         parent=Materiaalsoort.hout,
     )
 
-    geexpandeerd_perliet = MateriaaldetailsoortReferentiedata(
+    geexpandeerd_perliet = MateriaaldetailsoortReferentiedata.model_construct(
         code="GEP",
         naam="Geexpandeerd-Perliet",
         parent=Materiaalsoort.hout,
     )
 
-    hardschuim = MateriaaldetailsoortReferentiedata(
+    hardschuim = MateriaaldetailsoortReferentiedata.model_construct(
         code="HSC",
         naam="Hardschuim",
         parent=Materiaalsoort.isolatie,
     )
 
-    eps = MateriaaldetailsoortReferentiedata(
+    eps = MateriaaldetailsoortReferentiedata.model_construct(
         code="EPS",
         naam="Eps",
         parent=Materiaalsoort.isolatie,
     )
 
-    fenolhars = MateriaaldetailsoortReferentiedata(
+    fenolhars = MateriaaldetailsoortReferentiedata.model_construct(
         code="FEN",
         naam="Fenolhars",
         parent=Materiaalsoort.isolatie,
     )
 
-    glaswol = MateriaaldetailsoortReferentiedata(
+    glaswol = MateriaaldetailsoortReferentiedata.model_construct(
         code="GLA",
         naam="Glaswol",
         parent=Materiaalsoort.isolatie,
     )
 
-    resolschuim = MateriaaldetailsoortReferentiedata(
+    resolschuim = MateriaaldetailsoortReferentiedata.model_construct(
         code="RES",
         naam="Resolschuim",
         parent=Materiaalsoort.isolatie,
     )
 
-    pir = MateriaaldetailsoortReferentiedata(
+    pir = MateriaaldetailsoortReferentiedata.model_construct(
         code="PIR",
         naam="Pir",
         parent=Materiaalsoort.isolatie,
     )
 
-    pur = MateriaaldetailsoortReferentiedata(
+    pur = MateriaaldetailsoortReferentiedata.model_construct(
         code="PUR",
         naam="Pur",
         parent=Materiaalsoort.isolatie,
     )
 
-    mineralewol = MateriaaldetailsoortReferentiedata(
+    mineralewol = MateriaaldetailsoortReferentiedata.model_construct(
         code="MNE",
         naam="Mineralewol",
         parent=Materiaalsoort.isolatie,
     )
 
-    steenwol = MateriaaldetailsoortReferentiedata(
+    steenwol = MateriaaldetailsoortReferentiedata.model_construct(
         code="STE",
         naam="Steenwol",
         parent=Materiaalsoort.isolatie,
     )
 
-    xps = MateriaaldetailsoortReferentiedata(
+    xps = MateriaaldetailsoortReferentiedata.model_construct(
         code="XPS",
         naam="Xps",
         parent=Materiaalsoort.isolatie,
     )
 
-    mineraal = MateriaaldetailsoortReferentiedata(
+    mineraal = MateriaaldetailsoortReferentiedata.model_construct(
         code="MIN",
         naam="Mineraal",
         parent=Materiaalsoort.isolatie,
     )
 
-    siliperliet = MateriaaldetailsoortReferentiedata(
+    siliperliet = MateriaaldetailsoortReferentiedata.model_construct(
         code="SLI",
         naam="Siliperliet",
         parent=Materiaalsoort.isolatie,
     )
 
-    solperlite = MateriaaldetailsoortReferentiedata(
+    solperlite = MateriaaldetailsoortReferentiedata.model_construct(
         code="SOL",
         naam="Solperlite",
         parent=Materiaalsoort.isolatie,
     )
 
-    hard_kunststof = MateriaaldetailsoortReferentiedata(
+    hard_kunststof = MateriaaldetailsoortReferentiedata.model_construct(
         code="HKU",
         naam="Hard-Kunststof",
         parent=Materiaalsoort.isolatie,
     )
 
-    loodvervanger = MateriaaldetailsoortReferentiedata(
+    loodvervanger = MateriaaldetailsoortReferentiedata.model_construct(
         code="LVE",
         naam="Loodvervanger",
         parent=Materiaalsoort.kunststof,
     )
 
-    abs = MateriaaldetailsoortReferentiedata(
+    abs = MateriaaldetailsoortReferentiedata.model_construct(
         code="ABS",
         naam="Abs",
         parent=Materiaalsoort.kunststof,
     )
 
-    aeryl = MateriaaldetailsoortReferentiedata(
+    aeryl = MateriaaldetailsoortReferentiedata.model_construct(
         code="AER",
         naam="Aeryl",
         parent=Materiaalsoort.kunststof,
     )
 
-    dpc = MateriaaldetailsoortReferentiedata(
+    dpc = MateriaaldetailsoortReferentiedata.model_construct(
         code="DPC",
         naam="Dpc",
         parent=Materiaalsoort.kunststof,
     )
 
-    elastomere_foam = MateriaaldetailsoortReferentiedata(
+    elastomere_foam = MateriaaldetailsoortReferentiedata.model_construct(
         code="ELA",
         naam="Elastomere-Foam",
         parent=Materiaalsoort.kunststof,
     )
 
-    ep = MateriaaldetailsoortReferentiedata(
+    ep = MateriaaldetailsoortReferentiedata.model_construct(
         code="EP",
         naam="Ep",
         parent=Materiaalsoort.kunststof,
     )
 
-    epoxyhars = MateriaaldetailsoortReferentiedata(
+    epoxyhars = MateriaaldetailsoortReferentiedata.model_construct(
         code="EPO",
         naam="Epoxyhars",
         parent=Materiaalsoort.kunststof,
     )
 
-    hdpe = MateriaaldetailsoortReferentiedata(
+    hdpe = MateriaaldetailsoortReferentiedata.model_construct(
         code="HDP",
         naam="Hdpe",
         parent=Materiaalsoort.kunststof,
     )
 
-    hmpe = MateriaaldetailsoortReferentiedata(
+    hmpe = MateriaaldetailsoortReferentiedata.model_construct(
         code="HMP",
         naam="Hmpe",
         parent=Materiaalsoort.kunststof,
     )
 
-    hpl = MateriaaldetailsoortReferentiedata(
+    hpl = MateriaaldetailsoortReferentiedata.model_construct(
         code="HPL",
         naam="Hpl",
         parent=Materiaalsoort.kunststof,
     )
 
-    ldpe = MateriaaldetailsoortReferentiedata(
+    ldpe = MateriaaldetailsoortReferentiedata.model_construct(
         code="LDP",
         naam="Ldpe",
         parent=Materiaalsoort.kunststof,
     )
 
-    pe = MateriaaldetailsoortReferentiedata(
+    pe = MateriaaldetailsoortReferentiedata.model_construct(
         code="PE",
         naam="Pe",
         parent=Materiaalsoort.kunststof,
     )
 
-    pmma = MateriaaldetailsoortReferentiedata(
+    pmma = MateriaaldetailsoortReferentiedata.model_construct(
         code="PMM",
         naam="Pmma",
         parent=Materiaalsoort.kunststof,
     )
 
-    pvac = MateriaaldetailsoortReferentiedata(
+    pvac = MateriaaldetailsoortReferentiedata.model_construct(
         code="PVA",
         naam="Pvac",
         parent=Materiaalsoort.kunststof,
     )
 
-    pa = MateriaaldetailsoortReferentiedata(
+    pa = MateriaaldetailsoortReferentiedata.model_construct(
         code="PA",
         naam="Pa",
         parent=Materiaalsoort.kunststof,
     )
 
-    pc = MateriaaldetailsoortReferentiedata(
+    pc = MateriaaldetailsoortReferentiedata.model_construct(
         code="PC",
         naam="Pc",
         parent=Materiaalsoort.kunststof,
     )
 
-    pctfe = MateriaaldetailsoortReferentiedata(
+    pctfe = MateriaaldetailsoortReferentiedata.model_construct(
         code="PCT",
         naam="Pctfe",
         parent=Materiaalsoort.kunststof,
     )
 
-    plexiglas = MateriaaldetailsoortReferentiedata(
+    plexiglas = MateriaaldetailsoortReferentiedata.model_construct(
         code="PLE",
         naam="Plexiglas",
         parent=Materiaalsoort.kunststof,
     )
 
-    polyesterhars = MateriaaldetailsoortReferentiedata(
+    polyesterhars = MateriaaldetailsoortReferentiedata.model_construct(
         code="PLY",
         naam="Polyesterhars",
         parent=Materiaalsoort.kunststof,
     )
 
-    pp = MateriaaldetailsoortReferentiedata(
+    pp = MateriaaldetailsoortReferentiedata.model_construct(
         code="PP",
         naam="Pp",
         parent=Materiaalsoort.kunststof,
     )
 
-    ps = MateriaaldetailsoortReferentiedata(
+    ps = MateriaaldetailsoortReferentiedata.model_construct(
         code="PS",
         naam="Ps",
         parent=Materiaalsoort.kunststof,
     )
 
-    ptfe = MateriaaldetailsoortReferentiedata(
+    ptfe = MateriaaldetailsoortReferentiedata.model_construct(
         code="PTF",
         naam="Ptfe",
         parent=Materiaalsoort.kunststof,
     )
 
-    pu = MateriaaldetailsoortReferentiedata(
+    pu = MateriaaldetailsoortReferentiedata.model_construct(
         code="PU",
         naam="Pu",
         parent=Materiaalsoort.kunststof,
     )
 
-    pvc = MateriaaldetailsoortReferentiedata(
+    pvc = MateriaaldetailsoortReferentiedata.model_construct(
         code="PVC",
         naam="Pvc",
         parent=Materiaalsoort.kunststof,
     )
 
-    polyester = MateriaaldetailsoortReferentiedata(
+    polyester = MateriaaldetailsoortReferentiedata.model_construct(
         code="POL",
         naam="Polyester",
         parent=Materiaalsoort.kunststof,
     )
 
-    silicagel = MateriaaldetailsoortReferentiedata(
+    silicagel = MateriaaldetailsoortReferentiedata.model_construct(
         code="SLG",
         naam="Silicagel",
         parent=Materiaalsoort.kunststof,
     )
 
-    siliconen = MateriaaldetailsoortReferentiedata(
+    siliconen = MateriaaldetailsoortReferentiedata.model_construct(
         code="SLC",
         naam="Siliconen",
         parent=Materiaalsoort.kunststof,
     )
 
-    zacht_kunststof = MateriaaldetailsoortReferentiedata(
+    zacht_kunststof = MateriaaldetailsoortReferentiedata.model_construct(
         code="ZKU",
         naam="Zacht-Kunststof",
         parent=Materiaalsoort.kunststof,
     )
 
-    lood = MateriaaldetailsoortReferentiedata(
+    lood = MateriaaldetailsoortReferentiedata.model_construct(
         code="LOO",
         naam="Lood",
         parent=Materiaalsoort.kunststof,
     )
 
-    platina = MateriaaldetailsoortReferentiedata(
+    platina = MateriaaldetailsoortReferentiedata.model_construct(
         code="PLA",
         naam="Platina",
         parent=Materiaalsoort.metaal,
     )
 
-    aluminium = MateriaaldetailsoortReferentiedata(
+    aluminium = MateriaaldetailsoortReferentiedata.model_construct(
         code="ALU",
         naam="Aluminium",
         parent=Materiaalsoort.metaal,
     )
 
-    brons = MateriaaldetailsoortReferentiedata(
+    brons = MateriaaldetailsoortReferentiedata.model_construct(
         code="BRO",
         naam="Brons",
         parent=Materiaalsoort.metaal,
     )
 
-    chroom = MateriaaldetailsoortReferentiedata(
+    chroom = MateriaaldetailsoortReferentiedata.model_construct(
         code="CHR",
         naam="Chroom",
         parent=Materiaalsoort.metaal,
     )
 
-    gietijzer = MateriaaldetailsoortReferentiedata(
+    gietijzer = MateriaaldetailsoortReferentiedata.model_construct(
         code="GIE",
         naam="Gietijzer",
         parent=Materiaalsoort.metaal,
     )
 
-    goud = MateriaaldetailsoortReferentiedata(
+    goud = MateriaaldetailsoortReferentiedata.model_construct(
         code="GOU",
         naam="Goud",
         parent=Materiaalsoort.metaal,
     )
 
-    ijzer = MateriaaldetailsoortReferentiedata(
+    ijzer = MateriaaldetailsoortReferentiedata.model_construct(
         code="IJZ",
         naam="Ijzer",
         parent=Materiaalsoort.metaal,
     )
 
-    koper = MateriaaldetailsoortReferentiedata(
+    koper = MateriaaldetailsoortReferentiedata.model_construct(
         code="KOP",
         naam="Koper",
         parent=Materiaalsoort.metaal,
     )
 
-    messing = MateriaaldetailsoortReferentiedata(
+    messing = MateriaaldetailsoortReferentiedata.model_construct(
         code="MES",
         naam="Messing",
         parent=Materiaalsoort.metaal,
     )
 
-    rvs = MateriaaldetailsoortReferentiedata(
+    rvs = MateriaaldetailsoortReferentiedata.model_construct(
         code="RVS",
         naam="Rvs",
         parent=Materiaalsoort.metaal,
     )
 
-    tin = MateriaaldetailsoortReferentiedata(
+    tin = MateriaaldetailsoortReferentiedata.model_construct(
         code="TIN",
         naam="Tin",
         parent=Materiaalsoort.metaal,
     )
 
-    titanium = MateriaaldetailsoortReferentiedata(
+    titanium = MateriaaldetailsoortReferentiedata.model_construct(
         code="TIT",
         naam="Titanium",
         parent=Materiaalsoort.metaal,
     )
 
-    zilver = MateriaaldetailsoortReferentiedata(
+    zilver = MateriaaldetailsoortReferentiedata.model_construct(
         code="ZIL",
         naam="Zilver",
         parent=Materiaalsoort.metaal,
     )
 
-    zink = MateriaaldetailsoortReferentiedata(
+    zink = MateriaaldetailsoortReferentiedata.model_construct(
         code="ZIN",
         naam="Zink",
         parent=Materiaalsoort.metaal,
     )
 
-    soldeersel = MateriaaldetailsoortReferentiedata(
+    soldeersel = MateriaaldetailsoortReferentiedata.model_construct(
         code="SDE",
         naam="Soldeersel",
         parent=Materiaalsoort.metaal,
     )
 
-    staal = MateriaaldetailsoortReferentiedata(
+    staal = MateriaaldetailsoortReferentiedata.model_construct(
         code="STA",
         naam="Staal",
         parent=Materiaalsoort.metaal,
     )
 
-    asbest = MateriaaldetailsoortReferentiedata(
+    asbest = MateriaaldetailsoortReferentiedata.model_construct(
         code="ASB",
         naam="Asbest",
         parent=Materiaalsoort.metaal,
     )
 
-    graniet = MateriaaldetailsoortReferentiedata(
+    graniet = MateriaaldetailsoortReferentiedata.model_construct(
         code="GRA",
         naam="Graniet",
         parent=Materiaalsoort.natuursteen,
     )
 
-    gravel = MateriaaldetailsoortReferentiedata(
+    gravel = MateriaaldetailsoortReferentiedata.model_construct(
         code="GVE",
         naam="Gravel",
         parent=Materiaalsoort.natuursteen,
     )
 
-    hardsteen = MateriaaldetailsoortReferentiedata(
+    hardsteen = MateriaaldetailsoortReferentiedata.model_construct(
         code="HST",
         naam="Hardsteen",
         parent=Materiaalsoort.natuursteen,
     )
 
-    kwartsiet = MateriaaldetailsoortReferentiedata(
+    kwartsiet = MateriaaldetailsoortReferentiedata.model_construct(
         code="KSI",
         naam="Kwartsiet",
         parent=Materiaalsoort.natuursteen,
     )
 
-    poreus_gesteente = MateriaaldetailsoortReferentiedata(
+    poreus_gesteente = MateriaaldetailsoortReferentiedata.model_construct(
         code="PGE",
         naam="Poreus-Gesteente",
         parent=Materiaalsoort.natuursteen,
     )
 
-    basalt = MateriaaldetailsoortReferentiedata(
+    basalt = MateriaaldetailsoortReferentiedata.model_construct(
         code="BAS",
         naam="Basalt",
         parent=Materiaalsoort.natuursteen,
     )
 
-    gneiss = MateriaaldetailsoortReferentiedata(
+    gneiss = MateriaaldetailsoortReferentiedata.model_construct(
         code="GNE",
         naam="Gneiss",
         parent=Materiaalsoort.natuursteen,
     )
 
-    kristallijn_gesteente = MateriaaldetailsoortReferentiedata(
+    kristallijn_gesteente = MateriaaldetailsoortReferentiedata.model_construct(
         code="KRI",
         naam="Kristallijn-Gesteente",
         parent=Materiaalsoort.natuursteen,
     )
 
-    lei = MateriaaldetailsoortReferentiedata(
+    lei = MateriaaldetailsoortReferentiedata.model_construct(
         code="LEI",
         naam="Lei",
         parent=Materiaalsoort.natuursteen,
     )
 
-    marmer = MateriaaldetailsoortReferentiedata(
+    marmer = MateriaaldetailsoortReferentiedata.model_construct(
         code="MAR",
         naam="Marmer",
         parent=Materiaalsoort.natuursteen,
     )
 
-    puimsteen = MateriaaldetailsoortReferentiedata(
+    puimsteen = MateriaaldetailsoortReferentiedata.model_construct(
         code="PUI",
         naam="Puimsteen",
         parent=Materiaalsoort.natuursteen,
     )
 
-    sedimentgesteente = MateriaaldetailsoortReferentiedata(
+    sedimentgesteente = MateriaaldetailsoortReferentiedata.model_construct(
         code="SED",
         naam="Sedimentgesteente",
         parent=Materiaalsoort.natuursteen,
     )
 
-    trachiet = MateriaaldetailsoortReferentiedata(
+    trachiet = MateriaaldetailsoortReferentiedata.model_construct(
         code="TRA",
         naam="Trachiet",
         parent=Materiaalsoort.natuursteen,
     )
 
-    zandsteen = MateriaaldetailsoortReferentiedata(
+    zandsteen = MateriaaldetailsoortReferentiedata.model_construct(
         code="ZST",
         naam="Zandsteen",
         parent=Materiaalsoort.natuursteen,
     )
 
-    leer = MateriaaldetailsoortReferentiedata(
+    leer = MateriaaldetailsoortReferentiedata.model_construct(
         code="LER",
         naam="Leer",
         parent=Materiaalsoort.ntb,
     )
 
-    plantaardige_vezel = MateriaaldetailsoortReferentiedata(
+    plantaardige_vezel = MateriaaldetailsoortReferentiedata.model_construct(
         code="PTA",
         naam="Plantaardige-Vezel",
         parent=Materiaalsoort.organisch,
     )
 
-    bamboe = MateriaaldetailsoortReferentiedata(
+    bamboe = MateriaaldetailsoortReferentiedata.model_construct(
         code="BAM",
         naam="Bamboe",
         parent=Materiaalsoort.organisch,
     )
 
-    hennep = MateriaaldetailsoortReferentiedata(
+    hennep = MateriaaldetailsoortReferentiedata.model_construct(
         code="HEN",
         naam="Hennep",
         parent=Materiaalsoort.organisch,
     )
 
-    jute = MateriaaldetailsoortReferentiedata(
+    jute = MateriaaldetailsoortReferentiedata.model_construct(
         code="JUT",
         naam="Jute",
         parent=Materiaalsoort.organisch,
     )
 
-    katoen = MateriaaldetailsoortReferentiedata(
+    katoen = MateriaaldetailsoortReferentiedata.model_construct(
         code="KAT",
         naam="Katoen",
         parent=Materiaalsoort.organisch,
     )
 
-    kurk = MateriaaldetailsoortReferentiedata(
+    kurk = MateriaaldetailsoortReferentiedata.model_construct(
         code="KUR",
         naam="Kurk",
         parent=Materiaalsoort.organisch,
     )
 
-    mais = MateriaaldetailsoortReferentiedata(
+    mais = MateriaaldetailsoortReferentiedata.model_construct(
         code="MAI",
         naam="Mais",
         parent=Materiaalsoort.organisch,
     )
 
-    papier = MateriaaldetailsoortReferentiedata(
+    papier = MateriaaldetailsoortReferentiedata.model_construct(
         code="PAP",
         naam="Papier",
         parent=Materiaalsoort.organisch,
     )
 
-    riet = MateriaaldetailsoortReferentiedata(
+    riet = MateriaaldetailsoortReferentiedata.model_construct(
         code="RIE",
         naam="Riet",
         parent=Materiaalsoort.organisch,
     )
 
-    stro = MateriaaldetailsoortReferentiedata(
+    stro = MateriaaldetailsoortReferentiedata.model_construct(
         code="STR",
         naam="Stro",
         parent=Materiaalsoort.organisch,
     )
 
-    vegetatie = MateriaaldetailsoortReferentiedata(
+    vegetatie = MateriaaldetailsoortReferentiedata.model_construct(
         code="VEG",
         naam="Vegetatie",
         parent=Materiaalsoort.organisch,
     )
 
-    vilt = MateriaaldetailsoortReferentiedata(
+    vilt = MateriaaldetailsoortReferentiedata.model_construct(
         code="VIL",
         naam="Vilt",
         parent=Materiaalsoort.organisch,
     )
 
-    vlas = MateriaaldetailsoortReferentiedata(
+    vlas = MateriaaldetailsoortReferentiedata.model_construct(
         code="VLA",
         naam="Vlas",
         parent=Materiaalsoort.organisch,
     )
 
-    wol = MateriaaldetailsoortReferentiedata(
+    wol = MateriaaldetailsoortReferentiedata.model_construct(
         code="WOL",
         naam="Wol",
         parent=Materiaalsoort.organisch,
     )
 
-    hard_rubber = MateriaaldetailsoortReferentiedata(
+    hard_rubber = MateriaaldetailsoortReferentiedata.model_construct(
         code="HRU",
         naam="Hard-Rubber",
         parent=Materiaalsoort.organisch,
     )
 
-    polysulfide = MateriaaldetailsoortReferentiedata(
+    polysulfide = MateriaaldetailsoortReferentiedata.model_construct(
         code="PLS",
         naam="Polysulfide",
         parent=Materiaalsoort.rubber,
     )
 
-    schuimrubber = MateriaaldetailsoortReferentiedata(
+    schuimrubber = MateriaaldetailsoortReferentiedata.model_construct(
         code="SRU",
         naam="Schuimrubber",
         parent=Materiaalsoort.rubber,
     )
 
-    butyl = MateriaaldetailsoortReferentiedata(
+    butyl = MateriaaldetailsoortReferentiedata.model_construct(
         code="BUT",
         naam="Butyl",
         parent=Materiaalsoort.rubber,
     )
 
-    epdm = MateriaaldetailsoortReferentiedata(
+    epdm = MateriaaldetailsoortReferentiedata.model_construct(
         code="EPD",
         naam="Epdm",
         parent=Materiaalsoort.rubber,
     )
 
-    linoleum = MateriaaldetailsoortReferentiedata(
+    linoleum = MateriaaldetailsoortReferentiedata.model_construct(
         code="LIN",
         naam="Linoleum",
         parent=Materiaalsoort.rubber,
     )
 
-    natuurrubber = MateriaaldetailsoortReferentiedata(
+    natuurrubber = MateriaaldetailsoortReferentiedata.model_construct(
         code="NAT",
         naam="Natuurrubber",
         parent=Materiaalsoort.rubber,
     )
 
-    neopreen = MateriaaldetailsoortReferentiedata(
+    neopreen = MateriaaldetailsoortReferentiedata.model_construct(
         code="NEO",
         naam="Neopreen",
         parent=Materiaalsoort.rubber,
     )
 
-    tpve = MateriaaldetailsoortReferentiedata(
+    tpve = MateriaaldetailsoortReferentiedata.model_construct(
         code="TPV",
         naam="Tpve",
         parent=Materiaalsoort.rubber,
     )
 
-    element = MateriaaldetailsoortReferentiedata(
+    element = MateriaaldetailsoortReferentiedata.model_construct(
         code="ELE",
         naam="Element",
         parent=Materiaalsoort.rubber,
     )
 
-    product = MateriaaldetailsoortReferentiedata(
+    product = MateriaaldetailsoortReferentiedata.model_construct(
         code="PRO",
         naam="Product",
         parent=Materiaalsoort.samengesteld,
     )
 
-    geexpandeerde_klei = MateriaaldetailsoortReferentiedata(
+    geexpandeerde_klei = MateriaaldetailsoortReferentiedata.model_construct(
         code="GEK",
         naam="Geexpandeerde-Klei",
         parent=Materiaalsoort.samengesteld,
     )
 
-    kalksteen = MateriaaldetailsoortReferentiedata(
+    kalksteen = MateriaaldetailsoortReferentiedata.model_construct(
         code="KST",
         naam="Kalksteen",
         parent=Materiaalsoort.steenachtig,
     )
 
-    kalkzandsteen = MateriaaldetailsoortReferentiedata(
+    kalkzandsteen = MateriaaldetailsoortReferentiedata.model_construct(
         code="KZS",
         naam="Kalkzandsteen",
         parent=Materiaalsoort.steenachtig,
     )
 
-    keramisch = MateriaaldetailsoortReferentiedata(
+    keramisch = MateriaaldetailsoortReferentiedata.model_construct(
         code="KRA",
         naam="Keramisch",
         parent=Materiaalsoort.steenachtig,
     )
 
-    porisosteen = MateriaaldetailsoortReferentiedata(
+    porisosteen = MateriaaldetailsoortReferentiedata.model_construct(
         code="PRI",
         naam="Porisosteen",
         parent=Materiaalsoort.steenachtig,
     )
 
-    porselein = MateriaaldetailsoortReferentiedata(
+    porselein = MateriaaldetailsoortReferentiedata.model_construct(
         code="PSE",
         naam="Porselein",
         parent=Materiaalsoort.steenachtig,
     )
 
-    baksteen = MateriaaldetailsoortReferentiedata(
+    baksteen = MateriaaldetailsoortReferentiedata.model_construct(
         code="BAK",
         naam="Baksteen",
         parent=Materiaalsoort.steenachtig,
     )
 
-    calciumsilicaat = MateriaaldetailsoortReferentiedata(
+    calciumsilicaat = MateriaaldetailsoortReferentiedata.model_construct(
         code="CAL",
         naam="Calciumsilicaat",
         parent=Materiaalsoort.steenachtig,
     )
 
-    kunststeen = MateriaaldetailsoortReferentiedata(
+    kunststeen = MateriaaldetailsoortReferentiedata.model_construct(
         code="KUN",
         naam="Kunststeen",
         parent=Materiaalsoort.steenachtig,
@@ -7,82 +7,82 @@ class MateriaalsoortReferentiedata(Referentiedata):
 
 
 class Materiaalsoort(Referentiedatasoort):
-    beton = MateriaalsoortReferentiedata(
+    beton = MateriaalsoortReferentiedata.model_construct(
         code="BET",
         naam="Beton",
     )
 
-    bitumen = MateriaalsoortReferentiedata(
+    bitumen = MateriaalsoortReferentiedata.model_construct(
         code="BIT",
         naam="Bitumen",
     )
 
-    cement = MateriaalsoortReferentiedata(
+    cement = MateriaalsoortReferentiedata.model_construct(
         code="CEM",
         naam="Cement",
     )
 
-    gips = MateriaalsoortReferentiedata(
+    gips = MateriaalsoortReferentiedata.model_construct(
         code="GIP",
         naam="Gips",
     )
 
-    glas = MateriaalsoortReferentiedata(
+    glas = MateriaalsoortReferentiedata.model_construct(
         code="GLA",
         naam="Glas",
     )
 
-    grondstof = MateriaalsoortReferentiedata(
+    grondstof = MateriaalsoortReferentiedata.model_construct(
         code="GRO",
         naam="Grondstof",
     )
 
-    hout = MateriaalsoortReferentiedata(
+    hout = MateriaalsoortReferentiedata.model_construct(
         code="HOU",
         naam="Hout",
     )
 
-    isolatie = MateriaalsoortReferentiedata(
+    isolatie = MateriaalsoortReferentiedata.model_construct(
         code="ISO",
         naam="Isolatie",
     )
 
-    kunststof = MateriaalsoortReferentiedata(
+    kunststof = MateriaalsoortReferentiedata.model_construct(
         code="KUN",
         naam="Kunststof",
     )
 
-    metaal = MateriaalsoortReferentiedata(
+    metaal = MateriaalsoortReferentiedata.model_construct(
         code="MET",
         naam="Metaal",
     )
 
-    natuursteen = MateriaalsoortReferentiedata(
+    natuursteen = MateriaalsoortReferentiedata.model_construct(
         code="NAT",
         naam="Natuursteen",
     )
 
-    ntb = MateriaalsoortReferentiedata(
+    ntb = MateriaalsoortReferentiedata.model_construct(
         code="NTB",
         naam="Ntb",
     )
 
-    organisch = MateriaalsoortReferentiedata(
+    organisch = MateriaalsoortReferentiedata.model_construct(
         code="ORG",
         naam="Organisch",
     )
 
-    rubber = MateriaalsoortReferentiedata(
+    rubber = MateriaalsoortReferentiedata.model_construct(
         code="RUB",
         naam="Rubber",
     )
 
-    samengesteld = MateriaalsoortReferentiedata(
+    samengesteld = MateriaalsoortReferentiedata.model_construct(
         code="SAM",
         naam="Samengesteld",
     )
 
-    steenachtig = MateriaalsoortReferentiedata(
+    steenachtig = MateriaalsoortReferentiedata.model_construct(
         code="STE",
         naam="Steenachtig",
     )
@@ -7,9 +7,11 @@ class MedewerkerbudgetsoortReferentiedata(Referentiedata):
 
 
 class Medewerkerbudgetsoort(Referentiedatasoort):
-    individueel_loopbaanontwikkelingsbudget = MedewerkerbudgetsoortReferentiedata(
-        code="IND",
-        naam="Individueel loopbaanontwikkelingsbudget",
+    individueel_loopbaanontwikkelingsbudget = (
+        MedewerkerbudgetsoortReferentiedata.model_construct(
+            code="IND",
+            naam="Individueel loopbaanontwikkelingsbudget",
+        )
     )
     """
     Het individueel loopbaanontwikkelingsbudget (ILOB) is een recht dat werknemers
@@ -18,7 +20,7 @@ class Medewerkerbudgetsoort(Referentiedatasoort):
     hun loopbaanontwikkeling.
     """
 
-    functiegebonden_scholing = MedewerkerbudgetsoortReferentiedata(
+    functiegebonden_scholing = MedewerkerbudgetsoortReferentiedata.model_construct(
         code="FUN",
         naam="Functiegebonden scholing",
     )
@@ -28,7 +30,7 @@ class Medewerkerbudgetsoort(Referentiedatasoort):
     en in de toekomst
     """
 
-    informeel_leren = MedewerkerbudgetsoortReferentiedata(
+    informeel_leren = MedewerkerbudgetsoortReferentiedata.model_construct(
         code="INF",
         naam="Informeel leren",
     )
@@ -7,17 +7,17 @@ class MedewerkerrolReferentiedata(Referentiedata):
 
 
 class Medewerkerrol(Referentiedatasoort):
-    bhv_er = MedewerkerrolReferentiedata(
+    bhv_er = MedewerkerrolReferentiedata.model_construct(
         code="BHV",
         naam="BHV-er",
     )
 
-    scrummaster = MedewerkerrolReferentiedata(
+    scrummaster = MedewerkerrolReferentiedata.model_construct(
         code="SCR",
         naam="Scrummaster",
     )
 
-    vertrouwenspersoon = MedewerkerrolReferentiedata(
+    vertrouwenspersoon = MedewerkerrolReferentiedata.model_construct(
         code="VER",
         naam="Vertrouwenspersoon",
     )
@@ -7,19 +7,21 @@ class MedewerkersoortReferentiedata(Referentiedata):
 
 
 class Medewerkersoort(Referentiedatasoort):
-    in_dienst = MedewerkersoortReferentiedata(
+    in_dienst = MedewerkersoortReferentiedata.model_construct(
         code="DIE",
         naam="In dienst",
     )
 
-    meewerkende_partner = MedewerkersoortReferentiedata(
+    meewerkende_partner = MedewerkersoortReferentiedata.model_construct(
         code="FAM",
         naam="Meewerkende partner",
     )
 
-    inhuur_zzp_en_of_payroll_en_of_detachering = MedewerkersoortReferentiedata(
-        code="INH",
-        naam="Inhuur: zzp / payroll / detachering",
+    inhuur_zzp_en_of_payroll_en_of_detachering = (
+        MedewerkersoortReferentiedata.model_construct(
+            code="INH",
+            naam="Inhuur: zzp / payroll / detachering",
+        )
     )
     """
     Een inhuurkracht is een werknemer die tijdelijk wordt ingehuurd door een organisatie
@@ -29,12 +31,12 @@ class Medewerkersoort(Referentiedatasoort):
     detacheringsbureau.
     """
 
-    oproepkracht = MedewerkersoortReferentiedata(
+    oproepkracht = MedewerkersoortReferentiedata.model_construct(
         code="OPR",
         naam="Oproepkracht",
     )
 
-    stagair = MedewerkersoortReferentiedata(
+    stagair = MedewerkersoortReferentiedata.model_construct(
         code="STA",
         naam="Stagair",
     )
@@ -45,7 +47,7 @@ class Medewerkersoort(Referentiedatasoort):
     werkervaring op te doen en hun vaardigheden in de praktijk te ontwikkelen.
     """
 
-    trainee = MedewerkersoortReferentiedata(
+    trainee = MedewerkersoortReferentiedata.model_construct(
         code="TRA",
         naam="Trainee",
     )
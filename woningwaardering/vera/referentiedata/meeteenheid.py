@@ -7,7 +7,7 @@ class MeeteenheidReferentiedata(Referentiedata):
 
 
 class Meeteenheid(Referentiedatasoort):
-    centimeter = MeeteenheidReferentiedata(
+    centimeter = MeeteenheidReferentiedata.model_construct(
         code="CM",
         naam="Centimeter",
     )
@@ -15,12 +15,12 @@ class Meeteenheid(Referentiedatasoort):
     Aantal uitgedrukt in centimeters
     """
 
-    omvang_personeelsbestand = MeeteenheidReferentiedata(
+    omvang_personeelsbestand = MeeteenheidReferentiedata.model_construct(
         code="FTE",
         naam="Omvang personeelsbestand",
     )
 
-    gram = MeeteenheidReferentiedata(
+    gram = MeeteenheidReferentiedata.model_construct(
         code="GRM",
         naam="Gram",
     )
@@ -28,27 +28,27 @@ class Meeteenheid(Referentiedatasoort):
     Aantal uitgedrukt in gram
     """
 
-    kilogram = MeeteenheidReferentiedata(
+    kilogram = MeeteenheidReferentiedata.model_construct(
         code="KGR",
         naam="Kilogram",
     )
 
-    liter = MeeteenheidReferentiedata(
+    liter = MeeteenheidReferentiedata.model_construct(
         code="LTR",
         naam="Liter",
     )
 
-    vierkante_meter_m2 = MeeteenheidReferentiedata(
+    vierkante_meter_m2 = MeeteenheidReferentiedata.model_construct(
         code="M2",
         naam="Vierkante meter, m2",
     )
 
-    kubieke_meter_m3 = MeeteenheidReferentiedata(
+    kubieke_meter_m3 = MeeteenheidReferentiedata.model_construct(
         code="M3",
         naam="Kubieke meter, m3",
     )
 
-    millimeter = MeeteenheidReferentiedata(
+    millimeter = MeeteenheidReferentiedata.model_construct(
         code="MIL",
         naam="Millimeter",
     )
@@ -56,7 +56,7 @@ class Meeteenheid(Referentiedatasoort):
     Aantal uitgedrukt in millimeters
     """
 
-    minuten = MeeteenheidReferentiedata(
+    minuten = MeeteenheidReferentiedata.model_construct(
         code="MIN",
         naam="Minuten",
     )
@@ -64,12 +64,12 @@ class Meeteenheid(Referentiedatasoort):
     Aantal uitgedrukt in minuten, bijvoorbeeld 15 minuten reistijd
     """
 
-    meter = MeeteenheidReferentiedata(
+    meter = MeeteenheidReferentiedata.model_construct(
         code="MTR",
         naam="Meter",
     )
 
-    stuks = MeeteenheidReferentiedata(
+    stuks = MeeteenheidReferentiedata.model_construct(
         code="STU",
         naam="Stuks",
     )
@@ -77,7 +77,7 @@ class Meeteenheid(Referentiedatasoort):
     Aantal uitgedrukt per stuk, bijvoorbeeld 2 stuks deurklink, 10 stuks schroeven, etc.
     """
 
-    uren = MeeteenheidReferentiedata(
+    uren = MeeteenheidReferentiedata.model_construct(
         code="UUR",
         naam="Uren",
     )
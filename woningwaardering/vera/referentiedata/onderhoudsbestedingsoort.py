@@ -7,7 +7,7 @@ class OnderhoudsbestedingsoortReferentiedata(Referentiedata):
 
 
 class Onderhoudsbestedingsoort(Referentiedatasoort):
-    materiaal = OnderhoudsbestedingsoortReferentiedata(
+    materiaal = OnderhoudsbestedingsoortReferentiedata.model_construct(
         code="MAT",
         naam="Materiaal",
     )
@@ -16,7 +16,7 @@ class Onderhoudsbestedingsoort(Referentiedatasoort):
     verbruikte materiaal door te belasten
     """
 
-    onderbroken_tijd = OnderhoudsbestedingsoortReferentiedata(
+    onderbroken_tijd = OnderhoudsbestedingsoortReferentiedata.model_construct(
         code="OND",
         naam="Onderbroken tijd",
     )
@@ -25,7 +25,7 @@ class Onderhoudsbestedingsoort(Referentiedatasoort):
     voor het ophalen van materiaal) kan deze bestedingssoort gebruikt worden.
     """
 
-    overige_kosten = OnderhoudsbestedingsoortReferentiedata(
+    overige_kosten = OnderhoudsbestedingsoortReferentiedata.model_construct(
         code="OVE",
         naam="Overige kosten",
     )
@@ -33,7 +33,7 @@ class Onderhoudsbestedingsoort(Referentiedatasoort):
     Overige bestedingen die niet onder één van de andere bestedingssoorten vallen
     """
 
-    pakbonkosten = OnderhoudsbestedingsoortReferentiedata(
+    pakbonkosten = OnderhoudsbestedingsoortReferentiedata.model_construct(
         code="PAK",
         naam="Pakbonkosten",
     )
@@ -41,7 +41,7 @@ class Onderhoudsbestedingsoort(Referentiedatasoort):
     Pakbonkosten
     """
 
-    reistijd = OnderhoudsbestedingsoortReferentiedata(
+    reistijd = OnderhoudsbestedingsoortReferentiedata.model_construct(
         code="REI",
         naam="Reistijd",
     )
@@ -49,7 +49,7 @@ class Onderhoudsbestedingsoort(Referentiedatasoort):
     Reistijd van de uitvoerende
     """
 
-    uitwerktijd = OnderhoudsbestedingsoortReferentiedata(
+    uitwerktijd = OnderhoudsbestedingsoortReferentiedata.model_construct(
         code="UIT",
         naam="Uitwerktijd",
     )
@@ -59,7 +59,7 @@ class Onderhoudsbestedingsoort(Referentiedatasoort):
     de uitvoerende beschikbaar is voor een vervolgtaak
     """
 
-    vaste_taakprijs = OnderhoudsbestedingsoortReferentiedata(
+    vaste_taakprijs = OnderhoudsbestedingsoortReferentiedata.model_construct(
         code="VAS",
         naam="Vaste taakprijs",
     )
@@ -69,7 +69,7 @@ class Onderhoudsbestedingsoort(Referentiedatasoort):
     deze soort om de verschillende taakprijzen op te voeren.
     """
 
-    werktijd = OnderhoudsbestedingsoortReferentiedata(
+    werktijd = OnderhoudsbestedingsoortReferentiedata.model_construct(
         code="WER",
         naam="Werktijd",
     )
@@ -7,27 +7,27 @@ class OnderhoudslabelReferentiedata(Referentiedata):
 
 
 class Onderhoudslabel(Referentiedatasoort):
-    basis_onderhoud = OnderhoudslabelReferentiedata(
+    basis_onderhoud = OnderhoudslabelReferentiedata.model_construct(
         code="BAS",
         naam="Basis onderhoud",
     )
 
-    geen_onderhoud = OnderhoudslabelReferentiedata(
+    geen_onderhoud = OnderhoudslabelReferentiedata.model_construct(
         code="GEE",
         naam="Geen onderhoud",
     )
 
-    monument_onderhoud = OnderhoudslabelReferentiedata(
+    monument_onderhoud = OnderhoudslabelReferentiedata.model_construct(
         code="MON",
         naam="Monument onderhoud",
     )
 
-    volledig_onderhoud = OnderhoudslabelReferentiedata(
+    volledig_onderhoud = OnderhoudslabelReferentiedata.model_construct(
         code="VOL",
         naam="Volledig onderhoud",
     )
 
-    wind_en_waterdicht_houden = OnderhoudslabelReferentiedata(
+    wind_en_waterdicht_houden = OnderhoudslabelReferentiedata.model_construct(
         code="WIN",
         naam="Wind en waterdicht houden",
     )
@@ -7,7 +7,7 @@ class OnderhoudsoortReferentiedata(Referentiedata):
 
 
 class Onderhoudsoort(Referentiedatasoort):
-    inspectie = OnderhoudsoortReferentiedata(
+    inspectie = OnderhoudsoortReferentiedata.model_construct(
         code="INS",
         naam="Inspectie",
     )
@@ -18,7 +18,7 @@ class Onderhoudsoort(Referentiedatasoort):
     naar aanleiding van een verhuurmutatie.
     """
 
-    mutatie = OnderhoudsoortReferentiedata(
+    mutatie = OnderhoudsoortReferentiedata.model_construct(
         code="MUT",
         naam="Mutatie",
     )
@@ -27,7 +27,7 @@ class Onderhoudsoort(Referentiedatasoort):
     verhuurmutatie.
     """
 
-    planmatig = OnderhoudsoortReferentiedata(
+    planmatig = OnderhoudsoortReferentiedata.model_construct(
         code="PLN",
         naam="Planmatig",
     )
@@ -36,7 +36,7 @@ class Onderhoudsoort(Referentiedatasoort):
     goedgekeurd MJO-budget
     """
 
-    projectmatig = OnderhoudsoortReferentiedata(
+    projectmatig = OnderhoudsoortReferentiedata.model_construct(
         code="PRJ",
         naam="Projectmatig",
     )
@@ -45,7 +45,7 @@ class Onderhoudsoort(Referentiedatasoort):
     investeringsproject zoals verduurzaming, renovatie, etc.
     """
 
-    reparatie = OnderhoudsoortReferentiedata(
+    reparatie = OnderhoudsoortReferentiedata.model_construct(
         code="REP",
         naam="Reparatie",
     )
@@ -54,7 +54,7 @@ class Onderhoudsoort(Referentiedatasoort):
     geconstateerd defect
     """
 
-    wmo_aanpassing = OnderhoudsoortReferentiedata(
+    wmo_aanpassing = OnderhoudsoortReferentiedata.model_construct(
         code="WMO",
         naam="WMO Aanpassing",
     )
@@ -63,7 +63,7 @@ class Onderhoudsoort(Referentiedatasoort):
     invaliditeit aanbrengen van WMO-aanpassing)
     """
 
-    woningverbetering = OnderhoudsoortReferentiedata(
+    woningverbetering = OnderhoudsoortReferentiedata.model_construct(
         code="WOV",
         naam="Woningverbetering",
     )
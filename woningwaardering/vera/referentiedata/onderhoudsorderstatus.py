@@ -7,7 +7,7 @@ class OnderhoudsorderstatusReferentiedata(Referentiedata):
 
 
 class Onderhoudsorderstatus(Referentiedatasoort):
-    afgehandeld = OnderhoudsorderstatusReferentiedata(
+    afgehandeld = OnderhoudsorderstatusReferentiedata.model_construct(
         code="AFG",
         naam="Afgehandeld",
     )
@@ -15,7 +15,7 @@ class Onderhoudsorderstatus(Referentiedatasoort):
     De order is volledig technisch en financieel afgehandeld
     """
 
-    financieel_afwikkelen = OnderhoudsorderstatusReferentiedata(
+    financieel_afwikkelen = OnderhoudsorderstatusReferentiedata.model_construct(
         code="FIN",
         naam="Financieel afwikkelen",
     )
@@ -25,7 +25,7 @@ class Onderhoudsorderstatus(Referentiedatasoort):
     de onderhoudsorder
     """
 
-    geannuleerd = OnderhoudsorderstatusReferentiedata(
+    geannuleerd = OnderhoudsorderstatusReferentiedata.model_construct(
         code="GEA",
         naam="Geannuleerd",
     )
@@ -33,7 +33,7 @@ class Onderhoudsorderstatus(Referentiedatasoort):
     De order is geannuleerd
     """
 
-    order_gegund = OnderhoudsorderstatusReferentiedata(
+    order_gegund = OnderhoudsorderstatusReferentiedata.model_construct(
         code="GUN",
         naam="Order gegund",
     )
@@ -41,7 +41,7 @@ class Onderhoudsorderstatus(Referentiedatasoort):
     De order is verstrekt aan de uitvoerende partij
     """
 
-    in_behandeling = OnderhoudsorderstatusReferentiedata(
+    in_behandeling = OnderhoudsorderstatusReferentiedata.model_construct(
         code="INB",
         naam="In behandeling",
     )
@@ -52,7 +52,7 @@ class Onderhoudsorderstatus(Referentiedatasoort):
     uitvoerende partij (geen differentiatie tussen gegeund, gepland, etc)
     """
 
-    offertetraject = OnderhoudsorderstatusReferentiedata(
+    offertetraject = OnderhoudsorderstatusReferentiedata.model_construct(
         code="OFF",
         naam="Offertetraject",
     )
@@ -61,7 +61,7 @@ class Onderhoudsorderstatus(Referentiedatasoort):
     wordt met de uitvoering van de werkzaamheden.
     """
 
-    order_gepland = OnderhoudsorderstatusReferentiedata(
+    order_gepland = OnderhoudsorderstatusReferentiedata.model_construct(
         code="PLN",
         naam="Order gepland",
     )
@@ -69,7 +69,7 @@ class Onderhoudsorderstatus(Referentiedatasoort):
     De order is gepland door de uitvoerende partij
     """
 
-    geregistreerd = OnderhoudsorderstatusReferentiedata(
+    geregistreerd = OnderhoudsorderstatusReferentiedata.model_construct(
         code="REG",
         naam="Geregistreerd",
     )
@@ -77,7 +77,7 @@ class Onderhoudsorderstatus(Referentiedatasoort):
     De onderhoudsorder is slechts geregistreerd/vastgelegd
     """
 
-    order_in_steekproef = OnderhoudsorderstatusReferentiedata(
+    order_in_steekproef = OnderhoudsorderstatusReferentiedata.model_construct(
         code="STE",
         naam="Order in steekproef",
     )
@@ -86,7 +86,7 @@ class Onderhoudsorderstatus(Referentiedatasoort):
     worden beoordeeld door de corporatie
     """
 
-    technisch_gereed = OnderhoudsorderstatusReferentiedata(
+    technisch_gereed = OnderhoudsorderstatusReferentiedata.model_construct(
         code="TEC",
         naam="Technisch gereed",
     )
@@ -94,7 +94,7 @@ class Onderhoudsorderstatus(Referentiedatasoort):
     De order is technisch gereed en de uitvoering kan inhoudelijk beoordeeld worden
     """
 
-    wacht_op_goedkeuring = OnderhoudsorderstatusReferentiedata(
+    wacht_op_goedkeuring = OnderhoudsorderstatusReferentiedata.model_construct(
         code="WOG",
         naam="Wacht op goedkeuring",
     )
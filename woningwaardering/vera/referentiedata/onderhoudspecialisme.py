@@ -7,7 +7,7 @@ class OnderhoudspecialismeReferentiedata(Referentiedata):
 
 
 class Onderhoudspecialisme(Referentiedatasoort):
-    specialist_alarminstallaties = OnderhoudspecialismeReferentiedata(
+    specialist_alarminstallaties = OnderhoudspecialismeReferentiedata.model_construct(
         code="ALA",
         naam="Specialist Alarminstallaties",
     )
@@ -16,7 +16,7 @@ class Onderhoudspecialisme(Referentiedatasoort):
     alarminstallaties en andere beveiligingsystemen
     """
 
-    specialist_asbestsanering = OnderhoudspecialismeReferentiedata(
+    specialist_asbestsanering = OnderhoudspecialismeReferentiedata.model_construct(
         code="ASB",
         naam="Specialist Asbestsanering",
     )
@@ -24,7 +24,7 @@ class Onderhoudspecialisme(Referentiedatasoort):
     Inventarisatie en sanering van asbest
     """
 
-    specialist_bliksemgeleider = OnderhoudspecialismeReferentiedata(
+    specialist_bliksemgeleider = OnderhoudspecialismeReferentiedata.model_construct(
         code="BLI",
         naam="Specialist Bliksemgeleider",
     )
@@ -33,7 +33,7 @@ class Onderhoudspecialisme(Referentiedatasoort):
     vooralsnog gebruik maken van competentiecode OVE - Overige
     """
 
-    specialist_blusmiddelen = OnderhoudspecialismeReferentiedata(
+    specialist_blusmiddelen = OnderhoudspecialismeReferentiedata.model_construct(
         code="BLU",
         naam="Specialist Blusmiddelen",
     )
@@ -42,16 +42,18 @@ class Onderhoudspecialisme(Referentiedatasoort):
     vooralsnog gebruik maken van competentiecode OVE - Overige
     """
 
-    specialist_brandmeldinstallatie = OnderhoudspecialismeReferentiedata(
-        code="BRA",
-        naam="Specialist Brandmeldinstallatie",
+    specialist_brandmeldinstallatie = (
+        OnderhoudspecialismeReferentiedata.model_construct(
+            code="BRA",
+            naam="Specialist Brandmeldinstallatie",
+        )
     )
     """
     Binnen Ketenstandaard is hier op dit moment geen specifieke codering voor,
     vooralsnog gebruik maken van competentiecode OVE - Overige
     """
 
-    cv_installateur = OnderhoudspecialismeReferentiedata(
+    cv_installateur = OnderhoudspecialismeReferentiedata.model_construct(
         code="CVI",
         naam="CV Installateur",
     )
@@ -60,7 +62,7 @@ class Onderhoudspecialisme(Referentiedatasoort):
     vooralsnog gebruik maken van competentiecode OVE - Overige
     """
 
-    dakdekker = OnderhoudspecialismeReferentiedata(
+    dakdekker = OnderhoudspecialismeReferentiedata.model_construct(
         code="DAK",
         naam="Dakdekker",
     )
@@ -71,7 +73,7 @@ class Onderhoudspecialisme(Referentiedatasoort):
     weersinvloeden
     """
 
-    specialist_domotica = OnderhoudspecialismeReferentiedata(
+    specialist_domotica = OnderhoudspecialismeReferentiedata.model_construct(
         code="DOM",
         naam="Specialist Domotica",
     )
@@ -79,7 +81,7 @@ class Onderhoudspecialisme(Referentiedatasoort):
     Specialist op het gebied van installatie en onderhoud van domotica-systemen
     """
 
-    elektricien_allrounder = OnderhoudspecialismeReferentiedata(
+    elektricien_allrounder = OnderhoudspecialismeReferentiedata.model_construct(
         code="ELA",
         naam="Elektriciën allrounder",
     )
@@ -88,7 +90,7 @@ class Onderhoudspecialisme(Referentiedatasoort):
     Ketenstandaard: competentiecode ELE - Electra
     """
 
-    elektricien = OnderhoudspecialismeReferentiedata(
+    elektricien = OnderhoudspecialismeReferentiedata.model_construct(
         code="ELE",
         naam="Elektriciën",
     )
@@ -96,16 +98,18 @@ class Onderhoudspecialisme(Referentiedatasoort):
     Een volwaardige elektriciënRelatie met Ketenstandaard: competentiecode ELE - Electra
     """
 
-    specialist_elektrische_toegangsdeuren = OnderhoudspecialismeReferentiedata(
-        code="ELT",
-        naam="Specialist Elektrische Toegangsdeuren",
+    specialist_elektrische_toegangsdeuren = (
+        OnderhoudspecialismeReferentiedata.model_construct(
+            code="ELT",
+            naam="Specialist Elektrische Toegangsdeuren",
+        )
     )
     """
     Binnen Ketenstandaard is hier op dit moment geen specifieke codering voor,
     vooralsnog gebruik maken van competentiecode OVE - Overige
     """
 
-    specialist_geiser = OnderhoudspecialismeReferentiedata(
+    specialist_geiser = OnderhoudspecialismeReferentiedata.model_construct(
         code="GEI",
         naam="Specialist Geiser",
     )
@@ -114,7 +118,7 @@ class Onderhoudspecialisme(Referentiedatasoort):
     vooralsnog gebruik maken van competentiecode OVE - Overige
     """
 
-    glaszetter = OnderhoudspecialismeReferentiedata(
+    glaszetter = OnderhoudspecialismeReferentiedata.model_construct(
         code="GLA",
         naam="Glaszetter",
     )
@@ -123,7 +127,7 @@ class Onderhoudspecialisme(Referentiedatasoort):
     vooralsnog gebruik maken van competentiecode OVE - Overige
     """
 
-    hovenier = OnderhoudspecialismeReferentiedata(
+    hovenier = OnderhoudspecialismeReferentiedata.model_construct(
         code="HOV",
         naam="Hovenier",
     )
@@ -132,7 +136,7 @@ class Onderhoudspecialisme(Referentiedatasoort):
     vooralsnog gebruik maken van competentiecode OVE - Overige
     """
 
-    specialist_hydrofoor = OnderhoudspecialismeReferentiedata(
+    specialist_hydrofoor = OnderhoudspecialismeReferentiedata.model_construct(
         code="HYD",
         naam="Specialist Hydrofoor",
     )
@@ -141,7 +145,7 @@ class Onderhoudspecialisme(Referentiedatasoort):
     vooralsnog gebruik maken van competentiecode OVE - Overige
     """
 
-    inspecteur = OnderhoudspecialismeReferentiedata(
+    inspecteur = OnderhoudspecialismeReferentiedata.model_construct(
         code="INS",
         naam="Inspecteur",
     )
@@ -152,7 +156,7 @@ class Onderhoudspecialisme(Referentiedatasoort):
     codering voor beschikbaar
     """
 
-    specialist_lift = OnderhoudspecialismeReferentiedata(
+    specialist_lift = OnderhoudspecialismeReferentiedata.model_construct(
         code="LIF",
         naam="Specialist Lift",
     )
@@ -161,7 +165,7 @@ class Onderhoudspecialisme(Referentiedatasoort):
     vooralsnog gebruik maken van competentiecode OVE - Overige
     """
 
-    loodgieter_allrounder = OnderhoudspecialismeReferentiedata(
+    loodgieter_allrounder = OnderhoudspecialismeReferentiedata.model_construct(
         code="LOA",
         naam="Loodgieter allrounder",
     )
@@ -170,7 +174,7 @@ class Onderhoudspecialisme(Referentiedatasoort):
     Ketenstandaard: competentiecode LOO  - Loodgieter
     """
 
-    loodgieter = OnderhoudspecialismeReferentiedata(
+    loodgieter = OnderhoudspecialismeReferentiedata.model_construct(
         code="LOO",
         naam="Loodgieter",
     )
@@ -179,7 +183,7 @@ class Onderhoudspecialisme(Referentiedatasoort):
     Loodgieter
     """
 
-    ongediertebestrijder = OnderhoudspecialismeReferentiedata(
+    ongediertebestrijder = OnderhoudspecialismeReferentiedata.model_construct(
         code="ONG",
         naam="Ongediertebestrijder",
     )
@@ -188,7 +192,7 @@ class Onderhoudspecialisme(Referentiedatasoort):
     vooralsnog gebruik maken van competentiecode OVE - Overige
     """
 
-    ontstopper = OnderhoudspecialismeReferentiedata(
+    ontstopper = OnderhoudspecialismeReferentiedata.model_construct(
         code="ONT",
         naam="Ontstopper",
     )
@@ -197,7 +201,7 @@ class Onderhoudspecialisme(Referentiedatasoort):
     vooralsnog gebruik maken van competentiecode OVE - Overige
     """
 
-    overig = OnderhoudspecialismeReferentiedata(
+    overig = OnderhoudspecialismeReferentiedata.model_construct(
         code="OVE",
         naam="Overig",
     )
@@ -205,7 +209,7 @@ class Onderhoudspecialisme(Referentiedatasoort):
     Overige specialismen die niet onder één van de andere onderhoudspecialismen vallen
     """
 
-    schilder = OnderhoudspecialismeReferentiedata(
+    schilder = OnderhoudspecialismeReferentiedata.model_construct(
         code="SCH",
         naam="Schilder",
     )
@@ -213,7 +217,7 @@ class Onderhoudspecialisme(Referentiedatasoort):
     Een volwaardige schilder
     """
 
-    schoonmaker = OnderhoudspecialismeReferentiedata(
+    schoonmaker = OnderhoudspecialismeReferentiedata.model_construct(
         code="SCM",
         naam="Schoonmaker",
     )
@@ -222,7 +226,7 @@ class Onderhoudspecialisme(Referentiedatasoort):
     dakgoot schoonmaken en graffiti verwijderen
     """
 
-    stucadoor = OnderhoudspecialismeReferentiedata(
+    stucadoor = OnderhoudspecialismeReferentiedata.model_construct(
         code="STU",
         naam="Stucadoor",
     )
@@ -230,7 +234,7 @@ class Onderhoudspecialisme(Referentiedatasoort):
     Een volwaardige stucadoor. Relatie met Ketenstandaard: competentiecode STU - Stucen
     """
 
-    timmerman_allrounder = OnderhoudspecialismeReferentiedata(
+    timmerman_allrounder = OnderhoudspecialismeReferentiedata.model_construct(
         code="TAL",
         naam="Timmerman allrounder",
     )
@@ -239,7 +243,7 @@ class Onderhoudspecialisme(Referentiedatasoort):
     Ketenstandaard: competentiecode TIM - Timmerman
     """
 
-    tegelzetter = OnderhoudspecialismeReferentiedata(
+    tegelzetter = OnderhoudspecialismeReferentiedata.model_construct(
         code="TEG",
         naam="Tegelzetter",
     )
@@ -248,7 +252,7 @@ class Onderhoudspecialisme(Referentiedatasoort):
     vooralsnog gebruik maken van competentiecode OVE - Overige
     """
 
-    timmerman = OnderhoudspecialismeReferentiedata(
+    timmerman = OnderhoudspecialismeReferentiedata.model_construct(
         code="TIM",
         naam="Timmerman",
     )
@@ -256,7 +260,7 @@ class Onderhoudspecialisme(Referentiedatasoort):
     Een volwaardige timmermanRelatie met Ketenstandaard: competentiecode TIM - Timmerman
     """
 
-    specialist_vochtwering = OnderhoudspecialismeReferentiedata(
+    specialist_vochtwering = OnderhoudspecialismeReferentiedata.model_construct(
         code="VOC",
         naam="Specialist Vochtwering",
     )
@@ -264,7 +268,7 @@ class Onderhoudspecialisme(Referentiedatasoort):
     Specialist voor schimmel en vocht bestrijding
     """
 
-    specialist_witgoed = OnderhoudspecialismeReferentiedata(
+    specialist_witgoed = OnderhoudspecialismeReferentiedata.model_construct(
         code="WIT",
         naam="Specialist Witgoed",
     )
@@ -273,7 +277,7 @@ class Onderhoudspecialisme(Referentiedatasoort):
     vooralsnog gebruik maken van competentiecode OVE - Overige
     """
 
-    specialist_mv_en_of_wtw = OnderhoudspecialismeReferentiedata(
+    specialist_mv_en_of_wtw = OnderhoudspecialismeReferentiedata.model_construct(
         code="WTW",
         naam="Specialist MV/WTW",
     )
@@ -282,7 +286,7 @@ class Onderhoudspecialisme(Referentiedatasoort):
     vooralsnog gebruik maken van competentiecode OVE - Overige
     """
 
-    specialist_zonnepanelen = OnderhoudspecialismeReferentiedata(
+    specialist_zonnepanelen = OnderhoudspecialismeReferentiedata.model_construct(
         code="ZON",
         naam="Specialist Zonnepanelen",
     )
@@ -291,7 +295,7 @@ class Onderhoudspecialisme(Referentiedatasoort):
     vooralsnog gebruik maken van competentiecode OVE - Overige
     """
 
-    specialist_zonwering = OnderhoudspecialismeReferentiedata(
+    specialist_zonwering = OnderhoudspecialismeReferentiedata.model_construct(
         code="ZWE",
         naam="Specialist Zonwering",
     )
@@ -10,7 +10,7 @@ class OnderhoudstaakdetailstatusReferentiedata(Referentiedata):
 
 
 class Onderhoudstaakdetailstatus(Referentiedatasoort):
-    klant_niet_aanwezig = OnderhoudstaakdetailstatusReferentiedata(
+    klant_niet_aanwezig = OnderhoudstaakdetailstatusReferentiedata.model_construct(
         code="AFW",
         naam="Klant niet aanwezig",
         parent=Onderhoudstaakstatus.onderbroken,
@@ -19,25 +19,29 @@ class Onderhoudstaakdetailstatus(Referentiedatasoort):
     De taak is onderbroken omdat de klant niet aanwezig is
     """
 
-    niet_de_juiste_discipline = OnderhoudstaakdetailstatusReferentiedata(
-        code="DIS",
-        naam="Niet de juiste discipline",
-        parent=Onderhoudstaakstatus.onderbroken,
+    niet_de_juiste_discipline = (
+        OnderhoudstaakdetailstatusReferentiedata.model_construct(
+            code="DIS",
+            naam="Niet de juiste discipline",
+            parent=Onderhoudstaakstatus.onderbroken,
+        )
     )
     """
     De taak is onderbroken omdat de vakman niet de juiste discipline heeft
     """
 
-    inspectie_en_of_beoordeling_vereist = OnderhoudstaakdetailstatusReferentiedata(
-        code="INS",
-        naam="Inspectie/beoordeling vereist",
-        parent=Onderhoudstaakstatus.onderbroken,
+    inspectie_en_of_beoordeling_vereist = (
+        OnderhoudstaakdetailstatusReferentiedata.model_construct(
+            code="INS",
+            naam="Inspectie/beoordeling vereist",
+            parent=Onderhoudstaakstatus.onderbroken,
+        )
     )
     """
     De taak is onderbroken omdat inspectie/beoordeling door inspecteur noodzakelijk is
     """
 
-    materiaal_bestellen = OnderhoudstaakdetailstatusReferentiedata(
+    materiaal_bestellen = OnderhoudstaakdetailstatusReferentiedata.model_construct(
         code="MAT",
         naam="Materiaal bestellen",
         parent=Onderhoudstaakstatus.onderbroken,
@@ -46,7 +50,7 @@ class Onderhoudstaakdetailstatus(Referentiedatasoort):
     De taak is onderbroken omdat materiaal besteld moet worden
     """
 
-    offerte_benodigd = OnderhoudstaakdetailstatusReferentiedata(
+    offerte_benodigd = OnderhoudstaakdetailstatusReferentiedata.model_construct(
         code="OFF",
         naam="Offerte benodigd",
         parent=Onderhoudstaakstatus.onderbroken,
@@ -55,7 +59,7 @@ class Onderhoudstaakdetailstatus(Referentiedatasoort):
     De taak is onderbroken omdat een offerte nodig is
     """
 
-    onvoldoende_tijd = OnderhoudstaakdetailstatusReferentiedata(
+    onvoldoende_tijd = OnderhoudstaakdetailstatusReferentiedata.model_construct(
         code="ONV",
         naam="Onvoldoende tijd",
         parent=Onderhoudstaakstatus.onderbroken,
@@ -7,7 +7,7 @@ class OnderhoudstaakstatusReferentiedata(Referentiedata):
 
 
 class Onderhoudstaakstatus(Referentiedatasoort):
-    concept_en_of_aangemaakt = OnderhoudstaakstatusReferentiedata(
+    concept_en_of_aangemaakt = OnderhoudstaakstatusReferentiedata.model_construct(
         code="CON",
         naam="Concept  / aangemaakt",
     )
@@ -15,7 +15,7 @@ class Onderhoudstaakstatus(Referentiedatasoort):
     De taak in concept / aangemaakt
     """
 
-    gepland = OnderhoudstaakstatusReferentiedata(
+    gepland = OnderhoudstaakstatusReferentiedata.model_construct(
         code="GEP",
         naam="Gepland",
     )
@@ -23,7 +23,7 @@ class Onderhoudstaakstatus(Referentiedatasoort):
     Voor de taak is een afspraak gepland
     """
 
-    gereed = OnderhoudstaakstatusReferentiedata(
+    gereed = OnderhoudstaakstatusReferentiedata.model_construct(
         code="GER",
         naam="Gereed",
     )
@@ -31,7 +31,7 @@ class Onderhoudstaakstatus(Referentiedatasoort):
     De taak is gereed gemeld door de vakman
     """
 
-    gesloten = OnderhoudstaakstatusReferentiedata(
+    gesloten = OnderhoudstaakstatusReferentiedata.model_construct(
         code="GES",
         naam="Gesloten",
     )
@@ -39,7 +39,7 @@ class Onderhoudstaakstatus(Referentiedatasoort):
     De taak is administratief afgesloten
     """
 
-    onderbroken = OnderhoudstaakstatusReferentiedata(
+    onderbroken = OnderhoudstaakstatusReferentiedata.model_construct(
         code="OND",
         naam="Onderbroken",
     )
@@ -49,7 +49,7 @@ class Onderhoudstaakstatus(Referentiedatasoort):
     materiaal besteld moet worden
     """
 
-    gepauzeerd = OnderhoudstaakstatusReferentiedata(
+    gepauzeerd = OnderhoudstaakstatusReferentiedata.model_construct(
         code="PAU",
         naam="Gepauzeerd",
     )
@@ -58,7 +58,7 @@ class Onderhoudstaakstatus(Referentiedatasoort):
     voor een lunchbreak
     """
 
-    onderweg = OnderhoudstaakstatusReferentiedata(
+    onderweg = OnderhoudstaakstatusReferentiedata.model_construct(
         code="REI",
         naam="Onderweg",
     )
@@ -66,7 +66,7 @@ class Onderhoudstaakstatus(Referentiedatasoort):
     De vakman is onderweg naar de onderhoudslocatie voor de uitvoering van de taak
     """
 
-    in_uitvoering = OnderhoudstaakstatusReferentiedata(
+    in_uitvoering = OnderhoudstaakstatusReferentiedata.model_construct(
         code="UIT",
         naam="In uitvoering",
     )
@@ -74,7 +74,7 @@ class Onderhoudstaakstatus(Referentiedatasoort):
     De vakman is bezig met de uitvoering van de taak.
     """
 
-    uitwerktijd = OnderhoudstaakstatusReferentiedata(
+    uitwerktijd = OnderhoudstaakstatusReferentiedata.model_construct(
         code="UWT",
         naam="Uitwerktijd",
     )
@@ -7,7 +7,7 @@ class OnderhoudsverzoekstatusReferentiedata(Referentiedata):
 
 
 class Onderhoudsverzoekstatus(Referentiedatasoort):
-    afgehandeld = OnderhoudsverzoekstatusReferentiedata(
+    afgehandeld = OnderhoudsverzoekstatusReferentiedata.model_construct(
         code="AFG",
         naam="Afgehandeld",
     )
@@ -15,7 +15,7 @@ class Onderhoudsverzoekstatus(Referentiedatasoort):
     Het onderhoudsverzoek is volledig afgehandeld
     """
 
-    ter_beoordeling = OnderhoudsverzoekstatusReferentiedata(
+    ter_beoordeling = OnderhoudsverzoekstatusReferentiedata.model_construct(
         code="BEO",
         naam="Ter beoordeling",
     )
@@ -25,7 +25,7 @@ class Onderhoudsverzoekstatus(Referentiedatasoort):
     Onderhouden eenheden)
     """
 
-    financieel_afwikkelen = OnderhoudsverzoekstatusReferentiedata(
+    financieel_afwikkelen = OnderhoudsverzoekstatusReferentiedata.model_construct(
         code="FIN",
         naam="Financieel afwikkelen",
     )
@@ -34,7 +34,7 @@ class Onderhoudsverzoekstatus(Referentiedatasoort):
     in rekening gebracht worden bij huurders of derden (bijv. verzekering)
     """
 
-    geannuleerd = OnderhoudsverzoekstatusReferentiedata(
+    geannuleerd = OnderhoudsverzoekstatusReferentiedata.model_construct(
         code="GEA",
         naam="Geannuleerd",
     )
@@ -43,7 +43,7 @@ class Onderhoudsverzoekstatus(Referentiedatasoort):
     uitgevoerd.
     """
 
-    in_behandeling = OnderhoudsverzoekstatusReferentiedata(
+    in_behandeling = OnderhoudsverzoekstatusReferentiedata.model_construct(
         code="INB",
         naam="In behandeling",
     )
@@ -52,7 +52,7 @@ class Onderhoudsverzoekstatus(Referentiedatasoort):
     afgerond
     """
 
-    geregistreerd = OnderhoudsverzoekstatusReferentiedata(
+    geregistreerd = OnderhoudsverzoekstatusReferentiedata.model_construct(
         code="REG",
         naam="Geregistreerd",
     )
@@ -60,7 +60,7 @@ class Onderhoudsverzoekstatus(Referentiedatasoort):
     Het onderzhoudsverzoek is geregistreerd maar nog niet in behandeling genomen.
     """
 
-    technisch_gereed = OnderhoudsverzoekstatusReferentiedata(
+    technisch_gereed = OnderhoudsverzoekstatusReferentiedata.model_construct(
         code="TEC",
         naam="Technisch gereed",
     )
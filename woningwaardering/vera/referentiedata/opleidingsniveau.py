@@ -7,7 +7,7 @@ class OpleidingsniveauReferentiedata(Referentiedata):
 
 
 class Opleidingsniveau(Referentiedatasoort):
-    hbo_associate_degree = OpleidingsniveauReferentiedata(
+    hbo_associate_degree = OpleidingsniveauReferentiedata.model_construct(
         code="HAD",
         naam="HBO Associate degree",
     )
@@ -15,12 +15,12 @@ class Opleidingsniveau(Referentiedatasoort):
     Centraal Register Opleidingen Hoger Onderwijs (CROHO)
     """
 
-    havo = OpleidingsniveauReferentiedata(
+    havo = OpleidingsniveauReferentiedata.model_construct(
         code="HAV",
         naam="HAVO",
     )
 
-    hbo_bachelor = OpleidingsniveauReferentiedata(
+    hbo_bachelor = OpleidingsniveauReferentiedata.model_construct(
         code="HBA",
         naam="HBO Bachelor",
     )
@@ -28,7 +28,7 @@ class Opleidingsniveau(Referentiedatasoort):
     Centraal Register Opleidingen Hoger Onderwijs (CROHO)
     """
 
-    hoger_beroepsonderwijs = OpleidingsniveauReferentiedata(
+    hoger_beroepsonderwijs = OpleidingsniveauReferentiedata.model_construct(
         code="HBO",
         naam="Hoger beroepsonderwijs",
     )
@@ -36,7 +36,7 @@ class Opleidingsniveau(Referentiedatasoort):
     Centraal Register Opleidingen Hoger Onderwijs (CROHO)
     """
 
-    hbo_master = OpleidingsniveauReferentiedata(
+    hbo_master = OpleidingsniveauReferentiedata.model_construct(
         code="HMA",
         naam="HBO Master",
     )
@@ -44,7 +44,7 @@ class Opleidingsniveau(Referentiedatasoort):
     Centraal Register Opleidingen Hoger Onderwijs (CROHO)
     """
 
-    hbo_postinitiele_master = OpleidingsniveauReferentiedata(
+    hbo_postinitiele_master = OpleidingsniveauReferentiedata.model_construct(
         code="HPM",
         naam="HBO Postinitiële master",
     )
@@ -52,12 +52,12 @@ class Opleidingsniveau(Referentiedatasoort):
     Centraal Register Opleidingen Hoger Onderwijs (CROHO)
     """
 
-    middelbaar_beroeps_onderwijs = OpleidingsniveauReferentiedata(
+    middelbaar_beroeps_onderwijs = OpleidingsniveauReferentiedata.model_construct(
         code="MBO",
         naam="Middelbaar beroeps onderwijs",
     )
 
-    postdoc = OpleidingsniveauReferentiedata(
+    postdoc = OpleidingsniveauReferentiedata.model_construct(
         code="POD",
         naam="PostDoc",
     )
@@ -65,7 +65,7 @@ class Opleidingsniveau(Referentiedatasoort):
     Gepromoveerd onderzoeker
     """
 
-    promovendus = OpleidingsniveauReferentiedata(
+    promovendus = OpleidingsniveauReferentiedata.model_construct(
         code="PRO",
         naam="Promovendus",
     )
@@ -75,17 +75,21 @@ class Opleidingsniveau(Referentiedatasoort):
     VERA 4.0 wordt code PRO vervangen door code PHD
     """
 
-    voorbereidend_middelbaar_beroeps_onderwijs = OpleidingsniveauReferentiedata(
-        code="VMB",
-        naam="Voorbereidend middelbaar beroeps onderwijs",
+    voorbereidend_middelbaar_beroeps_onderwijs = (
+        OpleidingsniveauReferentiedata.model_construct(
+            code="VMB",
+            naam="Voorbereidend middelbaar beroeps onderwijs",
+        )
     )
 
-    voorbereidend_wetenschappelijk_onderwijs = OpleidingsniveauReferentiedata(
-        code="VWO",
-        naam="Voorbereidend wetenschappelijk onderwijs",
+    voorbereidend_wetenschappelijk_onderwijs = (
+        OpleidingsniveauReferentiedata.model_construct(
+            code="VWO",
+            naam="Voorbereidend wetenschappelijk onderwijs",
+        )
     )
 
-    wo_bachelor = OpleidingsniveauReferentiedata(
+    wo_bachelor = OpleidingsniveauReferentiedata.model_construct(
         code="WBA",
         naam="WO Bachelor",
     )
@@ -93,7 +97,7 @@ class Opleidingsniveau(Referentiedatasoort):
     Centraal Register Opleidingen Hoger Onderwijs (CROHO)
     """
 
-    wo_master = OpleidingsniveauReferentiedata(
+    wo_master = OpleidingsniveauReferentiedata.model_construct(
         code="WMA",
         naam="WO Master",
     )
@@ -101,7 +105,7 @@ class Opleidingsniveau(Referentiedatasoort):
     Centraal Register Opleidingen Hoger Onderwijs (CROHO)
     """
 
-    wo_postinitiele_master = OpleidingsniveauReferentiedata(
+    wo_postinitiele_master = OpleidingsniveauReferentiedata.model_construct(
         code="WPM",
         naam="WO Postinitiële master",
     )
@@ -7,7 +7,7 @@ class OppervlaktesoortReferentiedata(Referentiedata):
 
 
 class Oppervlaktesoort(Referentiedatasoort):
-    bruto_vloeroppervlakte = OppervlaktesoortReferentiedata(
+    bruto_vloeroppervlakte = OppervlaktesoortReferentiedata.model_construct(
         code="BVO",
         naam="Bruto vloeroppervlakte",
     )
@@ -16,7 +16,7 @@ class Oppervlaktesoort(Referentiedatasoort):
     gemeten conform NEN 2580.
     """
 
-    functioneel_nuttig_oppervlakte = OppervlaktesoortReferentiedata(
+    functioneel_nuttig_oppervlakte = OppervlaktesoortReferentiedata.model_construct(
         code="FNO",
         naam="Functioneel nuttig oppervlakte",
     )
@@ -25,7 +25,7 @@ class Oppervlaktesoort(Referentiedatasoort):
     meters, gemeten conform NEN 2580.
     """
 
-    gebruiksoppervlakte = OppervlaktesoortReferentiedata(
+    gebruiksoppervlakte = OppervlaktesoortReferentiedata.model_construct(
         code="GBO",
         naam="Gebruiksoppervlakte",
     )
@@ -34,7 +34,7 @@ class Oppervlaktesoort(Referentiedatasoort):
     gemeten conform NEN 2580.
     """
 
-    gerealiseerd_nuttig_oppervlakte = OppervlaktesoortReferentiedata(
+    gerealiseerd_nuttig_oppervlakte = OppervlaktesoortReferentiedata.model_construct(
         code="GNO",
         naam="Gerealiseerd nuttig oppervlakte",
     )
@@ -43,15 +43,17 @@ class Oppervlaktesoort(Referentiedatasoort):
     vierkante meters, gemeten conform NEN 2580.
     """
 
-    gebruiksoppervlakte_thermische_zone = OppervlaktesoortReferentiedata(
-        code="GTZ",
-        naam="Gebruiksoppervlakte thermische zone",
+    gebruiksoppervlakte_thermische_zone = (
+        OppervlaktesoortReferentiedata.model_construct(
+            code="GTZ",
+            naam="Gebruiksoppervlakte thermische zone",
+        )
     )
     """
     Gebruiksoppervlakte van de thermische zone, afgebakend volgens NTA 8800
     """
 
-    netto_vloeroppervlakte = OppervlaktesoortReferentiedata(
+    netto_vloeroppervlakte = OppervlaktesoortReferentiedata.model_construct(
         code="NVO",
         naam="Netto vloeroppervlakte",
     )
@@ -60,7 +62,7 @@ class Oppervlaktesoort(Referentiedatasoort):
     meters, gemeten conform NEN 2580.
     """
 
-    verhuurbare_vloeroppervlakte = OppervlaktesoortReferentiedata(
+    verhuurbare_vloeroppervlakte = OppervlaktesoortReferentiedata.model_construct(
         code="VVO",
         naam="Verhuurbare vloeroppervlakte",
     )
@@ -69,7 +71,7 @@ class Oppervlaktesoort(Referentiedatasoort):
     meters, gemeten conform NEN 2580.
     """
 
-    de_woon_of_werk_oppervlakte = OppervlaktesoortReferentiedata(
+    de_woon_of_werk_oppervlakte = OppervlaktesoortReferentiedata.model_construct(
         code="WOW",
         naam="De woon of werk oppervlakte",
     )
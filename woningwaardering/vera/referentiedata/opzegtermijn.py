@@ -7,7 +7,7 @@ class OpzegtermijnReferentiedata(Referentiedata):
 
 
 class Opzegtermijn(Referentiedatasoort):
-    opzegtermijn_12_maanden = OpzegtermijnReferentiedata(
+    opzegtermijn_12_maanden = OpzegtermijnReferentiedata.model_construct(
         code="12M",
         naam="12 maanden",
     )
@@ -15,7 +15,7 @@ class Opzegtermijn(Referentiedatasoort):
     Voor de overeenkomst geldt een opzegtermijn van 12 maanden.
     """
 
-    opzegtermijn_14_dagen = OpzegtermijnReferentiedata(
+    opzegtermijn_14_dagen = OpzegtermijnReferentiedata.model_construct(
         code="14D",
         naam="14 dagen",
     )
@@ -23,7 +23,7 @@ class Opzegtermijn(Referentiedatasoort):
     Voor de overeenkomst geldt een opzegtermijn van 14 dagen.
     """
 
-    opzegtermijn_1_maand = OpzegtermijnReferentiedata(
+    opzegtermijn_1_maand = OpzegtermijnReferentiedata.model_construct(
         code="1M",
         naam="1 maand",
     )
@@ -31,7 +31,7 @@ class Opzegtermijn(Referentiedatasoort):
     Voor de overeenkomst geldt een opzegtermijn van 1 maand.
     """
 
-    opzegtermijn_2_maanden = OpzegtermijnReferentiedata(
+    opzegtermijn_2_maanden = OpzegtermijnReferentiedata.model_construct(
         code="2M",
         naam="2 maanden",
     )
@@ -39,7 +39,7 @@ class Opzegtermijn(Referentiedatasoort):
     Voor de overeenkomst geldt een opzegtermijn van 2 maanden.
     """
 
-    opzegtermijn_3_maanden = OpzegtermijnReferentiedata(
+    opzegtermijn_3_maanden = OpzegtermijnReferentiedata.model_construct(
         code="3M",
         naam="3 maanden",
     )
@@ -47,7 +47,7 @@ class Opzegtermijn(Referentiedatasoort):
     Voor de overeenkomst geldt een opzegtermijn van 3 maanden.
     """
 
-    opzegtermijn_4_weken = OpzegtermijnReferentiedata(
+    opzegtermijn_4_weken = OpzegtermijnReferentiedata.model_construct(
         code="4W",
         naam="4 weken",
     )
@@ -55,7 +55,7 @@ class Opzegtermijn(Referentiedatasoort):
     Voor de overeenkomst geldt een opzegtermijn van 4 weken.
     """
 
-    opzegtermijn_6_maanden = OpzegtermijnReferentiedata(
+    opzegtermijn_6_maanden = OpzegtermijnReferentiedata.model_construct(
         code="6M",
         naam="6 maanden",
     )
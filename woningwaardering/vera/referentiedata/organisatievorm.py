@@ -7,7 +7,7 @@ class OrganisatievormReferentiedata(Referentiedata):
 
 
 class Organisatievorm(Referentiedatasoort):
-    buitenlandse_rechtsvorm = OrganisatievormReferentiedata(
+    buitenlandse_rechtsvorm = OrganisatievormReferentiedata.model_construct(
         code="BUI",
         naam="Buitenlandse rechtsvorm",
     )
@@ -16,7 +16,7 @@ class Organisatievorm(Referentiedatasoort):
     """
 
     besloten_vennootschap_met_beperkte_aansprakelijkheid = (
-        OrganisatievormReferentiedata(
+        OrganisatievormReferentiedata.model_construct(
             code="BV",
             naam="Besloten vennootschap met beperkte aansprakelijkheid",
         )
@@ -26,7 +26,7 @@ class Organisatievorm(Referentiedatasoort):
     5,a)
     """
 
-    cooperatie = OrganisatievormReferentiedata(
+    cooperatie = OrganisatievormReferentiedata.model_construct(
         code="COO",
         naam="Coöperatie",
     )
@@ -34,7 +34,7 @@ class Organisatievorm(Referentiedatasoort):
     Coöperatie  (Handelsregisterwet: art 5,a)
     """
 
-    commanditaire_vennootschap = OrganisatievormReferentiedata(
+    commanditaire_vennootschap = OrganisatievormReferentiedata.model_construct(
         code="CV",
         naam="Commanditaire vennootschap",
     )
@@ -42,15 +42,17 @@ class Organisatievorm(Referentiedatasoort):
     Commanditaire vennootschap (cv)  (Handelsregisterwet: art 5,a)
     """
 
-    europees_economisch_samenwerkingsverband = OrganisatievormReferentiedata(
-        code="EES",
-        naam="Europees Economisch Samenwerkingsverband",
+    europees_economisch_samenwerkingsverband = (
+        OrganisatievormReferentiedata.model_construct(
+            code="EES",
+            naam="Europees Economisch Samenwerkingsverband",
+        )
     )
     """
     Europees Economisch Samenwerkingsverband  (Handelsregisterwet: art 5,c)
     """
 
-    eenmanszaak = OrganisatievormReferentiedata(
+    eenmanszaak = OrganisatievormReferentiedata.model_construct(
         code="EZ",
         naam="Eenmanszaak",
     )
@@ -58,7 +60,7 @@ class Organisatievorm(Referentiedatasoort):
     Eenmanszaak  (Handelsregisterwet: art 5,b)
     """
 
-    kerkgenootschap = OrganisatievormReferentiedata(
+    kerkgenootschap = OrganisatievormReferentiedata.model_construct(
         code="KERK",
         naam="Kerkgenootschap",
     )
@@ -66,7 +68,7 @@ class Organisatievorm(Referentiedatasoort):
     Kerkgenootschap (Handelsregisterwet: art 1, e)
     """
 
-    maatschap = OrganisatievormReferentiedata(
+    maatschap = OrganisatievormReferentiedata.model_construct(
         code="MTS",
         naam="Maatschap",
     )
@@ -74,7 +76,7 @@ class Organisatievorm(Referentiedatasoort):
     Maatschap  (Handelsregisterwet: art 5,a)
     """
 
-    naamloze_vennootschap = OrganisatievormReferentiedata(
+    naamloze_vennootschap = OrganisatievormReferentiedata.model_construct(
         code="NV",
         naam="Naamloze vennootschap",
     )
@@ -82,7 +84,7 @@ class Organisatievorm(Referentiedatasoort):
     Naamloze vennootschap (NV) (Handelsregisterwet: art 5,a)
     """
 
-    overige_rechtsvorm = OrganisatievormReferentiedata(
+    overige_rechtsvorm = OrganisatievormReferentiedata.model_construct(
         code="OVE",
         naam="Overige rechtsvorm",
     )
@@ -90,7 +92,7 @@ class Organisatievorm(Referentiedatasoort):
     Conform  (Handelsregisterwet: art 5,e)
     """
 
-    onderlinge_waarborgmaatschappij = OrganisatievormReferentiedata(
+    onderlinge_waarborgmaatschappij = OrganisatievormReferentiedata.model_construct(
         code="OW",
         naam="Onderlinge waarborgmaatschappij",
     )
@@ -98,7 +100,7 @@ class Organisatievorm(Referentiedatasoort):
     Onderlinge waarborgmaatschappij  (Handelsregisterwet: art 5,a)
     """
 
-    publiekrechterlijke_rechtspersoon = OrganisatievormReferentiedata(
+    publiekrechterlijke_rechtspersoon = OrganisatievormReferentiedata.model_construct(
         code="PUB",
         naam="Publiekrechterlijke rechtspersoon",
     )
@@ -106,7 +108,7 @@ class Organisatievorm(Referentiedatasoort):
     Publiekrechterlijke rechtspersoon (Handelsregisterwet: art 1, d)
     """
 
-    rederij = OrganisatievormReferentiedata(
+    rederij = OrganisatievormReferentiedata.model_construct(
         code="RED",
         naam="Rederij",
     )
@@ -114,7 +116,7 @@ class Organisatievorm(Referentiedatasoort):
     Rederij  (Handelsregisterwet: art 5,a)
     """
 
-    europese_cooperatieve_vennootschap = OrganisatievormReferentiedata(
+    europese_cooperatieve_vennootschap = OrganisatievormReferentiedata.model_construct(
         code="SCE",
         naam="Europese coöperatieve vennootschap",
     )
@@ -122,7 +124,7 @@ class Organisatievorm(Referentiedatasoort):
     Europese coöperatieve vennootschap (SCE) (Handelsregisterwet: art 5,c)
     """
 
-    europese_naamloze_vennootschap = OrganisatievormReferentiedata(
+    europese_naamloze_vennootschap = OrganisatievormReferentiedata.model_construct(
         code="SE",
         naam="Europese naamloze vennootschap",
     )
@@ -130,7 +132,7 @@ class Organisatievorm(Referentiedatasoort):
     Europese naamloze vennootschap (SE)  (Handelsregisterwet: art 5,c)
     """
 
-    stichting = OrganisatievormReferentiedata(
+    stichting = OrganisatievormReferentiedata.model_construct(
         code="STI",
         naam="Stichting",
     )
@@ -138,7 +140,7 @@ class Organisatievorm(Referentiedatasoort):
     Stichting (Handelsregisterwet: art 5,a)
     """
 
-    vereniging = OrganisatievormReferentiedata(
+    vereniging = OrganisatievormReferentiedata.model_construct(
         code="VER",
         naam="Vereniging",
     )
@@ -146,7 +148,7 @@ class Organisatievorm(Referentiedatasoort):
     Vereniging  (Handelsregisterwet: art 5,a)
     """
 
-    vennootschap_onder_firma = OrganisatievormReferentiedata(
+    vennootschap_onder_firma = OrganisatievormReferentiedata.model_construct(
         code="VOF",
         naam="Vennootschap onder firma",
     )
@@ -154,7 +156,7 @@ class Organisatievorm(Referentiedatasoort):
     Vennootschap onder firma (vof) (Handelsregisterwet: art 5,a)
     """
 
-    vereniging_van_eigenaars = OrganisatievormReferentiedata(
+    vereniging_van_eigenaars = OrganisatievormReferentiedata.model_construct(
         code="VVE",
         naam="Vereniging van eigenaars",
     )
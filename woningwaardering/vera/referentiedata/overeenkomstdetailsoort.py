@@ -10,7 +10,7 @@ class OvereenkomstdetailsoortReferentiedata(Referentiedata):
 
 
 class Overeenkomstdetailsoort(Referentiedatasoort):
-    bepaalde_tijd = OvereenkomstdetailsoortReferentiedata(
+    bepaalde_tijd = OvereenkomstdetailsoortReferentiedata.model_construct(
         code="BEP",
         naam="Bepaalde tijd",
         parent=Overeenkomstsoort.arbeid,
@@ -19,7 +19,7 @@ class Overeenkomstdetailsoort(Referentiedatasoort):
     Arbeidsovereenkomst voor bepaalde tijd.
     """
 
-    bedrijfsonroerendgoed = OvereenkomstdetailsoortReferentiedata(
+    bedrijfsonroerendgoed = OvereenkomstdetailsoortReferentiedata.model_construct(
         code="BOG",
         naam="Bedrijfsonroerendgoed",
         parent=Overeenkomstsoort.huurovereenkomst,
@@ -28,7 +28,7 @@ class Overeenkomstdetailsoort(Referentiedatasoort):
     Verhuur van vastgoed voor zakelijke doeleinden.
     """
 
-    campuscontract = OvereenkomstdetailsoortReferentiedata(
+    campuscontract = OvereenkomstdetailsoortReferentiedata.model_construct(
         code="CAM",
         naam="Campuscontract",
         parent=Overeenkomstsoort.huurovereenkomst,
@@ -39,7 +39,7 @@ class Overeenkomstdetailsoort(Referentiedatasoort):
     ook de overeenkomst.
     """
 
-    flexcontract = OvereenkomstdetailsoortReferentiedata(
+    flexcontract = OvereenkomstdetailsoortReferentiedata.model_construct(
         code="FLE",
         naam="Flexcontract",
         parent=Overeenkomstsoort.huurovereenkomst,
@@ -50,7 +50,7 @@ class Overeenkomstdetailsoort(Referentiedatasoort):
     7:271 lid 4 BW).
     """
 
-    jongerencontract = OvereenkomstdetailsoortReferentiedata(
+    jongerencontract = OvereenkomstdetailsoortReferentiedata.model_construct(
         code="JON",
         naam="Jongerencontract",
         parent=Overeenkomstsoort.huurovereenkomst,
@@ -60,7 +60,7 @@ class Overeenkomstdetailsoort(Referentiedatasoort):
     een geschikte woning voor jongeren.
     """
 
-    koopgarant = OvereenkomstdetailsoortReferentiedata(
+    koopgarant = OvereenkomstdetailsoortReferentiedata.model_construct(
         code="KGA",
         naam="Koopgarant",
         parent=Overeenkomstsoort.koopovereenkomst,
@@ -71,7 +71,7 @@ class Overeenkomstdetailsoort(Referentiedatasoort):
     gewenst.
     """
 
-    mge_constructie = OvereenkomstdetailsoortReferentiedata(
+    mge_constructie = OvereenkomstdetailsoortReferentiedata.model_construct(
         code="MGE",
         naam="MGE constructie",
         parent=Overeenkomstsoort.koopovereenkomst,
@@ -80,7 +80,7 @@ class Overeenkomstdetailsoort(Referentiedatasoort):
     Verkoop met Maatschappelijk Gebonden Eigendom.
     """
 
-    nieuwsbrief = OvereenkomstdetailsoortReferentiedata(
+    nieuwsbrief = OvereenkomstdetailsoortReferentiedata.model_construct(
         code="NIE",
         naam="Nieuwsbrief",
         parent=Overeenkomstsoort.serviceovereenkomst,
@@ -89,7 +89,7 @@ class Overeenkomstdetailsoort(Referentiedatasoort):
     Nieuwsbrief voor marketing doeleinden.
     """
 
-    nul_uren_contract = OvereenkomstdetailsoortReferentiedata(
+    nul_uren_contract = OvereenkomstdetailsoortReferentiedata.model_construct(
         code="NUL",
         naam="Nul-uren contract",
         parent=Overeenkomstsoort.arbeid,
@@ -98,7 +98,7 @@ class Overeenkomstdetailsoort(Referentiedatasoort):
     Nul-uren arbeidsovereenkomst
     """
 
-    onbepaalde_tijd = OvereenkomstdetailsoortReferentiedata(
+    onbepaalde_tijd = OvereenkomstdetailsoortReferentiedata.model_construct(
         code="OBE",
         naam="Onbepaalde tijd",
         parent=Overeenkomstsoort.arbeid,
@@ -107,7 +107,7 @@ class Overeenkomstdetailsoort(Referentiedatasoort):
     Arbeidsovereenkomst voor onbepaalde tijd
     """
 
-    onbepaalde_tijd_contract = OvereenkomstdetailsoortReferentiedata(
+    onbepaalde_tijd_contract = OvereenkomstdetailsoortReferentiedata.model_construct(
         code="ONB",
         naam="Onbepaalde tijd contract",
         parent=Overeenkomstsoort.huurovereenkomst,
@@ -116,7 +116,7 @@ class Overeenkomstdetailsoort(Referentiedatasoort):
     Regulier huurcontract zonder einddatum.
     """
 
-    persoonlijke_woonkrant = OvereenkomstdetailsoortReferentiedata(
+    persoonlijke_woonkrant = OvereenkomstdetailsoortReferentiedata.model_construct(
         code="PER",
         naam="Persoonlijke woonkrant",
         parent=Overeenkomstsoort.serviceovereenkomst,
@@ -125,7 +125,7 @@ class Overeenkomstdetailsoort(Referentiedatasoort):
     Nieuwsbrief met gepersonificeerd aanbod. (Digizine)
     """
 
-    nieuwbouwinformatie = OvereenkomstdetailsoortReferentiedata(
+    nieuwbouwinformatie = OvereenkomstdetailsoortReferentiedata.model_construct(
         code="PRO",
         naam="Nieuwbouwinformatie",
         parent=Overeenkomstsoort.serviceovereenkomst,
@@ -135,7 +135,7 @@ class Overeenkomstdetailsoort(Referentiedatasoort):
     ontwikkelingen.
     """
 
-    shortstay = OvereenkomstdetailsoortReferentiedata(
+    shortstay = OvereenkomstdetailsoortReferentiedata.model_construct(
         code="SHS",
         naam="ShortStay",
         parent=Overeenkomstsoort.huurovereenkomst,
@@ -145,7 +145,7 @@ class Overeenkomstdetailsoort(Referentiedatasoort):
     tenminste zeven nachten en maximaal zes maanden
     """
 
-    tijdelijk_contract = OvereenkomstdetailsoortReferentiedata(
+    tijdelijk_contract = OvereenkomstdetailsoortReferentiedata.model_construct(
         code="TIJ",
         naam="Tijdelijk contract",
         parent=Overeenkomstsoort.huurovereenkomst,
@@ -154,7 +154,7 @@ class Overeenkomstdetailsoort(Referentiedatasoort):
     Huurcontract voor bepaalde tijd.
     """
 
-    te_woon_en_of_vrije_keuze = OvereenkomstdetailsoortReferentiedata(
+    te_woon_en_of_vrije_keuze = OvereenkomstdetailsoortReferentiedata.model_construct(
         code="TWO",
         naam="Te Woon / Vrije keuze",
     )
@@ -162,7 +162,7 @@ class Overeenkomstdetailsoort(Referentiedatasoort):
     De woning is zowel te huur als te koop.
     """
 
-    is_onderdeel_uitpondproject = OvereenkomstdetailsoortReferentiedata(
+    is_onderdeel_uitpondproject = OvereenkomstdetailsoortReferentiedata.model_construct(
         code="UIT",
         naam="Is onderdeel uitpondproject",
         parent=Overeenkomstsoort.koopovereenkomst,
@@ -171,20 +171,24 @@ class Overeenkomstdetailsoort(Referentiedatasoort):
     Verkoop van voormalige huurwoning aan de voormalige huurder of een nieuwe eigenaar.
     """
 
-    inhuurovereenkomst_plaatsvervangend = OvereenkomstdetailsoortReferentiedata(
-        code="INP",
-        naam="Inhuurovereenkomst plaatsvervangend",
-        parent=Overeenkomstsoort.arbeid,
+    inhuurovereenkomst_plaatsvervangend = (
+        OvereenkomstdetailsoortReferentiedata.model_construct(
+            code="INP",
+            naam="Inhuurovereenkomst plaatsvervangend",
+            parent=Overeenkomstsoort.arbeid,
+        )
     )
     """
     Een inhuurovereenkomst plaatsvervangend is een contract waarbij een werknemer
     tijdelijk wordt ingehuurd om de taken van een afwezige medewerker over te nemen.
     """
 
-    inhuurovereenkomst_boven_formatie = OvereenkomstdetailsoortReferentiedata(
-        code="INB",
-        naam="Inhuurovereenkomst boven formatie",
-        parent=Overeenkomstsoort.arbeid,
+    inhuurovereenkomst_boven_formatie = (
+        OvereenkomstdetailsoortReferentiedata.model_construct(
+            code="INB",
+            naam="Inhuurovereenkomst boven formatie",
+            parent=Overeenkomstsoort.arbeid,
+        )
     )
     """
     Een inhuurovereenkomst boven formatie is een contract waarbij een werknemer
@@ -192,10 +196,12 @@ class Overeenkomstdetailsoort(Referentiedatasoort):
     personeelsformatie.
     """
 
-    inhuurovereenkomst_structureel = OvereenkomstdetailsoortReferentiedata(
-        code="INS",
-        naam="Inhuurovereenkomst structureel",
-        parent=Overeenkomstsoort.arbeid,
+    inhuurovereenkomst_structureel = (
+        OvereenkomstdetailsoortReferentiedata.model_construct(
+            code="INS",
+            naam="Inhuurovereenkomst structureel",
+            parent=Overeenkomstsoort.arbeid,
+        )
     )
     """
     Een overeenkomst waarin de rechten en plichten van een externe kracht, zoals een
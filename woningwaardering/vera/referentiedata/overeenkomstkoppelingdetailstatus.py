@@ -10,38 +10,46 @@ class OvereenkomstkoppelingdetailstatusReferentiedata(Referentiedata):
 
 
 class Overeenkomstkoppelingdetailstatus(Referentiedatasoort):
-    afgewezen_door_woningzoekende = OvereenkomstkoppelingdetailstatusReferentiedata(
-        code="AFG",
-        naam="Afgewezen door woningzoekende",
-        parent=Overeenkomstkoppelingstatus.afgewezen,
+    afgewezen_door_woningzoekende = (
+        OvereenkomstkoppelingdetailstatusReferentiedata.model_construct(
+            code="AFG",
+            naam="Afgewezen door woningzoekende",
+            parent=Overeenkomstkoppelingstatus.afgewezen,
+        )
     )
     """
     Woningzoekende heeft het verzoek tot koppelen afgewezen.
     """
 
-    bevestigingstermijn_is_verstreken = OvereenkomstkoppelingdetailstatusReferentiedata(
-        code="BEV",
-        naam="Bevestigingstermijn is verstreken",
-        parent=Overeenkomstkoppelingstatus.afgewezen,
+    bevestigingstermijn_is_verstreken = (
+        OvereenkomstkoppelingdetailstatusReferentiedata.model_construct(
+            code="BEV",
+            naam="Bevestigingstermijn is verstreken",
+            parent=Overeenkomstkoppelingstatus.afgewezen,
+        )
     )
     """
     Koppeling is afgewezen omdat de bevestigingstermijn is verstreken.
     """
 
-    geboortedatum_komt_niet_overeen = OvereenkomstkoppelingdetailstatusReferentiedata(
-        code="GEB",
-        naam="Geboortedatum komt niet overeen",
-        parent=Overeenkomstkoppelingstatus.afgewezen,
+    geboortedatum_komt_niet_overeen = (
+        OvereenkomstkoppelingdetailstatusReferentiedata.model_construct(
+            code="GEB",
+            naam="Geboortedatum komt niet overeen",
+            parent=Overeenkomstkoppelingstatus.afgewezen,
+        )
     )
     """
     Koppeling is afgewezen omdat de geboortedatum van de woningzoekende in beide
     inschrijvingen niet overeenkomt.
     """
 
-    naamgegevens_komen_niet_overeen = OvereenkomstkoppelingdetailstatusReferentiedata(
-        code="NAA",
-        naam="Naamgegevens komen niet overeen",
-        parent=Overeenkomstkoppelingstatus.afgewezen,
+    naamgegevens_komen_niet_overeen = (
+        OvereenkomstkoppelingdetailstatusReferentiedata.model_construct(
+            code="NAA",
+            naam="Naamgegevens komen niet overeen",
+            parent=Overeenkomstkoppelingstatus.afgewezen,
+        )
     )
     """
     Koppeling is afgewezen omdat de naamgegevens van de woningzoekende in beide
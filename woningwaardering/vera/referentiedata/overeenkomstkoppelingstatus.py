@@ -7,7 +7,7 @@ class OvereenkomstkoppelingstatusReferentiedata(Referentiedata):
 
 
 class Overeenkomstkoppelingstatus(Referentiedatasoort):
-    aangevraagd = OvereenkomstkoppelingstatusReferentiedata(
+    aangevraagd = OvereenkomstkoppelingstatusReferentiedata.model_construct(
         code="AAN",
         naam="Aangevraagd",
     )
@@ -15,7 +15,7 @@ class Overeenkomstkoppelingstatus(Referentiedatasoort):
     Het koppelen van de overeenkomsten is aangevraagd
     """
 
-    afgewezen = OvereenkomstkoppelingstatusReferentiedata(
+    afgewezen = OvereenkomstkoppelingstatusReferentiedata.model_construct(
         code="AFG",
         naam="Afgewezen",
     )
@@ -23,7 +23,7 @@ class Overeenkomstkoppelingstatus(Referentiedatasoort):
     Het koppelen van de overeenkomsten is afgewezen
     """
 
-    gekoppeld = OvereenkomstkoppelingstatusReferentiedata(
+    gekoppeld = OvereenkomstkoppelingstatusReferentiedata.model_construct(
         code="GEK",
         naam="Gekoppeld",
     )
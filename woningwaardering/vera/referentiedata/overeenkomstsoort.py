@@ -7,7 +7,7 @@ class OvereenkomstsoortReferentiedata(Referentiedata):
 
 
 class Overeenkomstsoort(Referentiedatasoort):
-    arbeid = OvereenkomstsoortReferentiedata(
+    arbeid = OvereenkomstsoortReferentiedata.model_construct(
         code="ARB",
         naam="Arbeid",
     )
@@ -15,7 +15,7 @@ class Overeenkomstsoort(Referentiedatasoort):
     Arbeidsovereenkomst
     """
 
-    betalerovereenkomst = OvereenkomstsoortReferentiedata(
+    betalerovereenkomst = OvereenkomstsoortReferentiedata.model_construct(
         code="BET",
         naam="Betalerovereenkomst",
     )
@@ -24,7 +24,7 @@ class Overeenkomstsoort(Referentiedatasoort):
     andere (huur-)overeenkomst
     """
 
-    huurovereenkomst = OvereenkomstsoortReferentiedata(
+    huurovereenkomst = OvereenkomstsoortReferentiedata.model_construct(
         code="HUU",
         naam="Huurovereenkomst",
     )
@@ -32,7 +32,7 @@ class Overeenkomstsoort(Referentiedatasoort):
     Overeenkomst met betrekking tot het huren van roerend of onroerend goed.
     """
 
-    inhuur = OvereenkomstsoortReferentiedata(
+    inhuur = OvereenkomstsoortReferentiedata.model_construct(
         code="INH",
         naam="Inhuur",
     )
@@ -40,7 +40,7 @@ class Overeenkomstsoort(Referentiedatasoort):
     Inhuurovereenkomst
     """
 
-    inschrijving = OvereenkomstsoortReferentiedata(
+    inschrijving = OvereenkomstsoortReferentiedata.model_construct(
         code="INS",
         naam="Inschrijving",
     )
@@ -49,7 +49,7 @@ class Overeenkomstsoort(Referentiedatasoort):
     woonruimteverdeel gebied.
     """
 
-    koopovereenkomst = OvereenkomstsoortReferentiedata(
+    koopovereenkomst = OvereenkomstsoortReferentiedata.model_construct(
         code="KOO",
         naam="Koopovereenkomst",
     )
@@ -57,7 +57,7 @@ class Overeenkomstsoort(Referentiedatasoort):
     Overeenkomst met betrekking tot het kopen van roerend of onroerend goed.
     """
 
-    lease = OvereenkomstsoortReferentiedata(
+    lease = OvereenkomstsoortReferentiedata.model_construct(
         code="LEA",
         naam="Lease",
     )
@@ -65,7 +65,7 @@ class Overeenkomstsoort(Referentiedatasoort):
     Leaseovereenkomst
     """
 
-    onderhoudsovereenkomst = OvereenkomstsoortReferentiedata(
+    onderhoudsovereenkomst = OvereenkomstsoortReferentiedata.model_construct(
         code="OND",
         naam="Onderhoudsovereenkomst",
     )
@@ -74,7 +74,7 @@ class Overeenkomstsoort(Referentiedatasoort):
     goed.
     """
 
-    serviceovereenkomst = OvereenkomstsoortReferentiedata(
+    serviceovereenkomst = OvereenkomstsoortReferentiedata.model_construct(
         code="SER",
         naam="Serviceovereenkomst",
     )
@@ -7,7 +7,7 @@ class OvereenkomststatusReferentiedata(Referentiedata):
 
 
 class Overeenkomststatus(Referentiedatasoort):
-    beeindigd = OvereenkomststatusReferentiedata(
+    beeindigd = OvereenkomststatusReferentiedata.model_construct(
         code="BEE",
         naam="Beeindigd",
     )
@@ -15,7 +15,7 @@ class Overeenkomststatus(Referentiedatasoort):
     De einddatum van de overeenkomst is verstreken en deze is daadwerkelijk beeindigd.
     """
 
-    geannuleerd = OvereenkomststatusReferentiedata(
+    geannuleerd = OvereenkomststatusReferentiedata.model_construct(
         code="GEA",
         naam="Geannuleerd",
     )
@@ -26,7 +26,7 @@ class Overeenkomststatus(Referentiedatasoort):
     opgezegd, ontbonden of vernietigd moeten worden.
     """
 
-    goedgekeurd = OvereenkomststatusReferentiedata(
+    goedgekeurd = OvereenkomststatusReferentiedata.model_construct(
         code="GOE",
         naam="Goedgekeurd",
     )
@@ -35,7 +35,7 @@ class Overeenkomststatus(Referentiedatasoort):
     de huurder.
     """
 
-    lopend = OvereenkomststatusReferentiedata(
+    lopend = OvereenkomststatusReferentiedata.model_construct(
         code="LOP",
         naam="Lopend",
     )
@@ -44,7 +44,7 @@ class Overeenkomststatus(Referentiedatasoort):
     specifieke voorwaarden van de overeenkomst
     """
 
-    ontbonden = OvereenkomststatusReferentiedata(
+    ontbonden = OvereenkomststatusReferentiedata.model_construct(
         code="ONT",
         naam="Ontbonden",
     )
@@ -53,7 +53,7 @@ class Overeenkomststatus(Referentiedatasoort):
     natuurlijke weg is beëindigd. Ontbonden vanwege contractbreuk, -fraude.
     """
 
-    opgezegd = OvereenkomststatusReferentiedata(
+    opgezegd = OvereenkomststatusReferentiedata.model_construct(
         code="OPG",
         naam="Opgezegd",
     )
@@ -62,7 +62,7 @@ class Overeenkomststatus(Referentiedatasoort):
     vastgelegd.
     """
 
-    vernietigd = OvereenkomststatusReferentiedata(
+    vernietigd = OvereenkomststatusReferentiedata.model_construct(
         code="VER",
         naam="Vernietigd",
     )
@@ -72,7 +72,7 @@ class Overeenkomststatus(Referentiedatasoort):
     nietig verklaard vanwege handelsonbevoegdheid of –onbekwaamheid.
     """
 
-    voorlopig = OvereenkomststatusReferentiedata(
+    voorlopig = OvereenkomststatusReferentiedata.model_construct(
         code="VOO",
         naam="Voorlopig",
     )
@@ -82,7 +82,7 @@ class Overeenkomststatus(Referentiedatasoort):
     bijvoorbeeld nog bewijsstukken aangeleverd worden.
     """
 
-    voorlopig_opgezegd = OvereenkomststatusReferentiedata(
+    voorlopig_opgezegd = OvereenkomststatusReferentiedata.model_construct(
         code="VOP",
         naam="Voorlopig opgezegd",
     )
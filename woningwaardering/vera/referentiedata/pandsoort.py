@@ -7,7 +7,7 @@ class PandsoortReferentiedata(Referentiedata):
 
 
 class Pandsoort(Referentiedatasoort):
-    eengezinswoning = PandsoortReferentiedata(
+    eengezinswoning = PandsoortReferentiedata.model_construct(
         code="EGW",
         naam="Eengezinswoning",
     )
@@ -16,7 +16,7 @@ class Pandsoort(Referentiedatasoort):
     bewoond te worden.
     """
 
-    meergezinswoning = PandsoortReferentiedata(
+    meergezinswoning = PandsoortReferentiedata.model_construct(
         code="MGW",
         naam="Meergezinswoning",
     )
@@ -7,7 +7,7 @@ class PassendheiddetailsoortReferentiedata(Referentiedata):
 
 
 class Passendheiddetailsoort(Referentiedatasoort):
-    bijzondere_gezinssituatie = PassendheiddetailsoortReferentiedata(
+    bijzondere_gezinssituatie = PassendheiddetailsoortReferentiedata.model_construct(
         code="BIJ",
         naam="Bijzondere gezinssituatie",
     )
@@ -17,7 +17,7 @@ class Passendheiddetailsoort(Referentiedatasoort):
     een zeer groot gezin of een bijzondere gezinssamenstelling.
     """
 
-    herstructurering = PassendheiddetailsoortReferentiedata(
+    herstructurering = PassendheiddetailsoortReferentiedata.model_construct(
         code="HER",
         naam="Herstructurering",
     )
@@ -25,7 +25,7 @@ class Passendheiddetailsoort(Referentiedatasoort):
     Niet-passende toewijzing, noodzakelijk geacht i.v.m. herstructurering
     """
 
-    herhuisvesting = PassendheiddetailsoortReferentiedata(
+    herhuisvesting = PassendheiddetailsoortReferentiedata.model_construct(
         code="HHV",
         naam="Herhuisvesting",
     )
@@ -7,7 +7,7 @@ class PassendheidssoortReferentiedata(Referentiedata):
 
 
 class Passendheidssoort(Referentiedatasoort):
-    niet_passend = PassendheidssoortReferentiedata(
+    niet_passend = PassendheidssoortReferentiedata.model_construct(
         code="NIE",
         naam="Niet passend",
     )
@@ -17,16 +17,18 @@ class Passendheidssoort(Referentiedatasoort):
     verantwoorden kan passendheiddetailsoort worden gebruikt.
     """
 
-    passendheidtoets_niet_van_toepassing = PassendheidssoortReferentiedata(
-        code="NVT",
-        naam="Passendheidtoets niet van toepassing",
+    passendheidtoets_niet_van_toepassing = (
+        PassendheidssoortReferentiedata.model_construct(
+            code="NVT",
+            naam="Passendheidtoets niet van toepassing",
+        )
     )
     """
     De toewijzing valt buiten de regels van de passendheidstoets volgens de Woningwet,
     bijvoorbeeld omdat de woning niet tot de betaalbare woningvoorraad behoort
     """
 
-    passend = PassendheidssoortReferentiedata(
+    passend = PassendheidssoortReferentiedata.model_construct(
         code="PAS",
         naam="Passend",
     )
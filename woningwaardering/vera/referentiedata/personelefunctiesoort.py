@@ -7,7 +7,7 @@ class PersonelefunctiesoortReferentiedata(Referentiedata):
 
 
 class Personelefunctiesoort(Referentiedatasoort):
-    leidinggevende_functie = PersonelefunctiesoortReferentiedata(
+    leidinggevende_functie = PersonelefunctiesoortReferentiedata.model_construct(
         code="LEI",
         naam="Leidinggevende functie",
     )
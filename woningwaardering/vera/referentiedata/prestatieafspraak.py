@@ -7,7 +7,7 @@ class PrestatieafspraakReferentiedata(Referentiedata):
 
 
 class Prestatieafspraak(Referentiedatasoort):
-    huurverhoging_t_b_v_investering = PrestatieafspraakReferentiedata(
+    huurverhoging_t_b_v_investering = PrestatieafspraakReferentiedata.model_construct(
         code="HUU",
         naam="Huurverhoging t.b.v. investering",
     )
@@ -7,12 +7,12 @@ class PrijsaanpassingsoortReferentiedata(Referentiedata):
 
 
 class Prijsaanpassingsoort(Referentiedatasoort):
-    korting = PrijsaanpassingsoortReferentiedata(
+    korting = PrijsaanpassingsoortReferentiedata.model_construct(
         code="KOR",
         naam="Korting",
     )
 
-    toeslag = PrijsaanpassingsoortReferentiedata(
+    toeslag = PrijsaanpassingsoortReferentiedata.model_construct(
         code="TOE",
         naam="Toeslag",
     )
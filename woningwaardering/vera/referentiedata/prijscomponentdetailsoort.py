@@ -10,13 +10,13 @@ class PrijscomponentdetailsoortReferentiedata(Referentiedata):
 
 
 class Prijscomponentdetailsoort(Referentiedatasoort):
-    administratiekosten = PrijscomponentdetailsoortReferentiedata(
+    administratiekosten = PrijscomponentdetailsoortReferentiedata.model_construct(
         code="AKO",
         naam="Administratiekosten",
         parent=Prijscomponentsoort.eenmalig,
     )
 
-    alarm_bewaking = PrijscomponentdetailsoortReferentiedata(
+    alarm_bewaking = PrijscomponentdetailsoortReferentiedata.model_construct(
         code="ALA",
         naam="Alarm bewaking",
         parent=Prijscomponentsoort.service,
@@ -25,16 +25,18 @@ class Prijscomponentdetailsoort(Referentiedatasoort):
     Maandelijkse kosten voor het alarm en de bewaking van de woning
     """
 
-    servicekosten_bedrijfsruimten = PrijscomponentdetailsoortReferentiedata(
-        code="BED",
-        naam="Servicekosten bedrijfsruimten",
-        parent=Prijscomponentsoort.service,
+    servicekosten_bedrijfsruimten = (
+        PrijscomponentdetailsoortReferentiedata.model_construct(
+            code="BED",
+            naam="Servicekosten bedrijfsruimten",
+            parent=Prijscomponentsoort.service,
+        )
     )
     """
     Maandelijkse kosten voor services m.b.t. bedrijfsruimten
     """
 
-    beheerders = PrijscomponentdetailsoortReferentiedata(
+    beheerders = PrijscomponentdetailsoortReferentiedata.model_construct(
         code="BEH",
         naam="Beheerder(s)",
         parent=Prijscomponentsoort.service,
@@ -43,16 +45,18 @@ class Prijscomponentdetailsoort(Referentiedatasoort):
     Maandelijkse kosten voor de beheerder(s) van de eenheid en/of het complex
     """
 
-    borg = PrijscomponentdetailsoortReferentiedata(
+    borg = PrijscomponentdetailsoortReferentiedata.model_construct(
         code="BOR",
         naam="Borg",
         parent=Prijscomponentsoort.eenmalig,
     )
 
-    dienst_en_recreatieruimten = PrijscomponentdetailsoortReferentiedata(
-        code="DIE",
-        naam="Dienst- en recreatieruimten",
-        parent=Prijscomponentsoort.service,
+    dienst_en_recreatieruimten = (
+        PrijscomponentdetailsoortReferentiedata.model_construct(
+            code="DIE",
+            naam="Dienst- en recreatieruimten",
+            parent=Prijscomponentsoort.service,
+        )
     )
     """
     De maandelijkse kosten voor reparaties en groot onderhoud aan dienstruimten en
@@ -61,13 +65,13 @@ class Prijscomponentdetailsoort(Referentiedatasoort):
     ruimten of onderhoud aan de tuin.
     """
 
-    electriciteit = PrijscomponentdetailsoortReferentiedata(
+    electriciteit = PrijscomponentdetailsoortReferentiedata.model_construct(
         code="ELE",
         naam="Electriciteit",
         parent=Prijscomponentsoort.verbruik,
     )
 
-    elektrische_installaties = PrijscomponentdetailsoortReferentiedata(
+    elektrische_installaties = PrijscomponentdetailsoortReferentiedata.model_construct(
         code="ELI",
         naam="Elektrische installaties",
         parent=Prijscomponentsoort.service,
@@ -76,7 +80,7 @@ class Prijscomponentdetailsoort(Referentiedatasoort):
     Maandelijkse kosten voor het gebruik van elektrische installaties
     """
 
-    elektra_oplaadpunt = PrijscomponentdetailsoortReferentiedata(
+    elektra_oplaadpunt = PrijscomponentdetailsoortReferentiedata.model_construct(
         code="ELO",
         naam="Elektra oplaadpunt",
         parent=Prijscomponentsoort.service,
@@ -86,10 +90,12 @@ class Prijscomponentdetailsoort(Referentiedatasoort):
     apparaten dan een elektrische auto (b.v. scootmobiel)
     """
 
-    energie_voor_gemeenschappelijke_ruimten = PrijscomponentdetailsoortReferentiedata(
-        code="ENE",
-        naam="Energie voor gemeenschappelijke ruimten",
-        parent=Prijscomponentsoort.service,
+    energie_voor_gemeenschappelijke_ruimten = (
+        PrijscomponentdetailsoortReferentiedata.model_construct(
+            code="ENE",
+            naam="Energie voor gemeenschappelijke ruimten",
+            parent=Prijscomponentsoort.service,
+        )
     )
     """
     Dit zijn bijvoorbeeld de maandelijkse kosten voor elektriciteit voor bijvoorbeeld:
@@ -97,23 +103,25 @@ class Prijscomponentdetailsoort(Referentiedatasoort):
     ruimten.
     """
 
-    energieprestatievergoeding = PrijscomponentdetailsoortReferentiedata(
-        code="EPV",
-        naam="Energieprestatievergoeding",
-        parent=Prijscomponentsoort.verbruik,
+    energieprestatievergoeding = (
+        PrijscomponentdetailsoortReferentiedata.model_construct(
+            code="EPV",
+            naam="Energieprestatievergoeding",
+            parent=Prijscomponentsoort.verbruik,
+        )
     )
     """
     Een vergoeding die verhuurder aan huurder mag vragen voor een huurwoning die zelf
     energie opwekt
     """
 
-    gas = PrijscomponentdetailsoortReferentiedata(
+    gas = PrijscomponentdetailsoortReferentiedata.model_construct(
         code="GAS",
         naam="Gas",
         parent=Prijscomponentsoort.verbruik,
     )
 
-    reparatie_gem_ruimten = PrijscomponentdetailsoortReferentiedata(
+    reparatie_gem_ruimten = PrijscomponentdetailsoortReferentiedata.model_construct(
         code="GEM",
         naam="Reparatie gem. ruimten",
         parent=Prijscomponentsoort.service,
@@ -122,7 +130,7 @@ class Prijscomponentdetailsoort(Referentiedatasoort):
     Maandelijkse kosten voor het repareren van defecten aan gemeenschappelijke ruimten
     """
 
-    gladheidsbestrijding = PrijscomponentdetailsoortReferentiedata(
+    gladheidsbestrijding = PrijscomponentdetailsoortReferentiedata.model_construct(
         code="GHB",
         naam="Gladheidsbestrijding",
         parent=Prijscomponentsoort.service,
@@ -131,7 +139,7 @@ class Prijscomponentdetailsoort(Referentiedatasoort):
     Maandelijkse kosten voor het bestrijden van gladheid rondom de eenheid
     """
 
-    glasbewassing = PrijscomponentdetailsoortReferentiedata(
+    glasbewassing = PrijscomponentdetailsoortReferentiedata.model_construct(
         code="GLB",
         naam="Glasbewassing",
         parent=Prijscomponentsoort.service,
@@ -140,7 +148,7 @@ class Prijscomponentdetailsoort(Referentiedatasoort):
     Maandelijkse kosten voor het wassen van glas van ramen en deuren van de eenheid
     """
 
-    glasfonds = PrijscomponentdetailsoortReferentiedata(
+    glasfonds = PrijscomponentdetailsoortReferentiedata.model_construct(
         code="GLF",
         naam="Glasfonds",
         parent=Prijscomponentsoort.service,
@@ -149,7 +157,7 @@ class Prijscomponentdetailsoort(Referentiedatasoort):
     Maandelijkse kosten voor de voorziening voor repareren van glasschade
     """
 
-    groenvoorziening = PrijscomponentdetailsoortReferentiedata(
+    groenvoorziening = PrijscomponentdetailsoortReferentiedata.model_construct(
         code="GRO",
         naam="Groenvoorziening",
         parent=Prijscomponentsoort.service,
@@ -158,7 +166,7 @@ class Prijscomponentdetailsoort(Referentiedatasoort):
     Maandelijkse kosten voor het onderhouden van de groenvoorziening rondom de eenheid
     """
 
-    huismeester = PrijscomponentdetailsoortReferentiedata(
+    huismeester = PrijscomponentdetailsoortReferentiedata.model_construct(
         code="HUI",
         naam="Huismeester",
         parent=Prijscomponentsoort.service,
@@ -168,7 +176,7 @@ class Prijscomponentdetailsoort(Referentiedatasoort):
     of conciërge levert.
     """
 
-    huisvuil = PrijscomponentdetailsoortReferentiedata(
+    huisvuil = PrijscomponentdetailsoortReferentiedata.model_construct(
         code="HUV",
         naam="Huisvuil",
         parent=Prijscomponentsoort.service,
@@ -177,7 +185,7 @@ class Prijscomponentdetailsoort(Referentiedatasoort):
     Maandelijkse kosten voor het verwerken van huisvuil
     """
 
-    individuele_garage = PrijscomponentdetailsoortReferentiedata(
+    individuele_garage = PrijscomponentdetailsoortReferentiedata.model_construct(
         code="IGA",
         naam="Individuele garage",
         parent=Prijscomponentsoort.parkeren,
@@ -186,7 +194,7 @@ class Prijscomponentdetailsoort(Referentiedatasoort):
     Inpandige parkeerplek individueel
     """
 
-    installaties = PrijscomponentdetailsoortReferentiedata(
+    installaties = PrijscomponentdetailsoortReferentiedata.model_construct(
         code="INS",
         naam="Installaties",
         parent=Prijscomponentsoort.service,
@@ -196,7 +204,7 @@ class Prijscomponentdetailsoort(Referentiedatasoort):
     installaties
     """
 
-    inventaris = PrijscomponentdetailsoortReferentiedata(
+    inventaris = PrijscomponentdetailsoortReferentiedata.model_construct(
         code="INV",
         naam="Inventaris",
         parent=Prijscomponentsoort.service,
@@ -205,7 +213,7 @@ class Prijscomponentdetailsoort(Referentiedatasoort):
     Maandelijkse kosten voor het gebruik van inventaris
     """
 
-    kale_huur = PrijscomponentdetailsoortReferentiedata(
+    kale_huur = PrijscomponentdetailsoortReferentiedata.model_construct(
         code="KAL",
         naam="Kale huur",
         parent=Prijscomponentsoort.netto_huur,
@@ -214,7 +222,7 @@ class Prijscomponentdetailsoort(Referentiedatasoort):
     Basisbedrag voor het gebruik van de woning
     """
 
-    laadpaal = PrijscomponentdetailsoortReferentiedata(
+    laadpaal = PrijscomponentdetailsoortReferentiedata.model_construct(
         code="LAA",
         naam="Laadpaal",
         parent=Prijscomponentsoort.service,
@@ -223,7 +231,7 @@ class Prijscomponentdetailsoort(Referentiedatasoort):
     Maandelijkse kosten voor het gebruik van een laadpaal voor elektrische auto
     """
 
-    liftkosten = PrijscomponentdetailsoortReferentiedata(
+    liftkosten = PrijscomponentdetailsoortReferentiedata.model_construct(
         code="LIF",
         naam="Liftkosten",
         parent=Prijscomponentsoort.service,
@@ -232,7 +240,7 @@ class Prijscomponentdetailsoort(Referentiedatasoort):
     Maandelijkse kosten voor het gebruik van de lift(en)
     """
 
-    linnenpakket = PrijscomponentdetailsoortReferentiedata(
+    linnenpakket = PrijscomponentdetailsoortReferentiedata.model_construct(
         code="LIN",
         naam="Linnenpakket",
         parent=Prijscomponentsoort.service,
@@ -241,7 +249,7 @@ class Prijscomponentdetailsoort(Referentiedatasoort):
     Maandelijkse kosten voor het gebruik van linnen
     """
 
-    matiging_huurtoeslag = PrijscomponentdetailsoortReferentiedata(
+    matiging_huurtoeslag = PrijscomponentdetailsoortReferentiedata.model_construct(
         code="MAT",
         naam="Matiging huurtoeslag",
         parent=Prijscomponentsoort.huuraanpassing,
@@ -252,7 +260,7 @@ class Prijscomponentdetailsoort(Referentiedatasoort):
     voor het uitwisselen van historische data
     """
 
-    mechanische_ventilatie = PrijscomponentdetailsoortReferentiedata(
+    mechanische_ventilatie = PrijscomponentdetailsoortReferentiedata.model_construct(
         code="MVE",
         naam="Mechanische ventilatie",
         parent=Prijscomponentsoort.service,
@@ -261,13 +269,13 @@ class Prijscomponentdetailsoort(Referentiedatasoort):
     Maandelijkse kosten voor het gebruik van de mechanische ventilatie
     """
 
-    overnamekosten = PrijscomponentdetailsoortReferentiedata(
+    overnamekosten = PrijscomponentdetailsoortReferentiedata.model_construct(
         code="OKO",
         naam="Overnamekosten",
         parent=Prijscomponentsoort.eenmalig,
     )
 
-    onderhoudsabonnement = PrijscomponentdetailsoortReferentiedata(
+    onderhoudsabonnement = PrijscomponentdetailsoortReferentiedata.model_construct(
         code="OND",
         naam="Onderhoudsabonnement",
         parent=Prijscomponentsoort.service,
@@ -278,10 +286,12 @@ class Prijscomponentdetailsoort(Referentiedatasoort):
     afsluit, dan regelt de corporatie het klein onderhoud voor de huurder.
     """
 
-    overige_netto_huur_component = PrijscomponentdetailsoortReferentiedata(
-        code="ONH",
-        naam="Overige netto huur component",
-        parent=Prijscomponentsoort.netto_huur,
+    overige_netto_huur_component = (
+        PrijscomponentdetailsoortReferentiedata.model_construct(
+            code="ONH",
+            naam="Overige netto huur component",
+            parent=Prijscomponentsoort.netto_huur,
+        )
     )
     """
     Een overige netto huur component wordt bijvoorbeeld gebruikt om de extra huur na het
@@ -289,17 +299,19 @@ class Prijscomponentdetailsoort(Referentiedatasoort):
     kale huur.
     """
 
-    overige_kosten_gem_ruimten = PrijscomponentdetailsoortReferentiedata(
-        code="OVE",
-        naam="Overige kosten gem. ruimten",
-        parent=Prijscomponentsoort.service,
+    overige_kosten_gem_ruimten = (
+        PrijscomponentdetailsoortReferentiedata.model_construct(
+            code="OVE",
+            naam="Overige kosten gem. ruimten",
+            parent=Prijscomponentsoort.service,
+        )
     )
     """
     Maandelijkse kosten voor overige kosten voor gemeenschappelijke ruimten (naast
     schoonmaak, energie en reparatie)
     """
 
-    parkeerplaats_buiten = PrijscomponentdetailsoortReferentiedata(
+    parkeerplaats_buiten = PrijscomponentdetailsoortReferentiedata.model_construct(
         code="PBU",
         naam="Parkeerplaats buiten",
         parent=Prijscomponentsoort.parkeren,
@@ -308,7 +320,7 @@ class Prijscomponentdetailsoort(Referentiedatasoort):
     Uitpandige parkeerplek
     """
 
-    parkeergarage = PrijscomponentdetailsoortReferentiedata(
+    parkeergarage = PrijscomponentdetailsoortReferentiedata.model_construct(
         code="PGA",
         naam="Parkeergarage",
         parent=Prijscomponentsoort.parkeren,
@@ -317,7 +329,7 @@ class Prijscomponentdetailsoort(Referentiedatasoort):
     Inpandige parkeerplek collectief
     """
 
-    rioolfonds = PrijscomponentdetailsoortReferentiedata(
+    rioolfonds = PrijscomponentdetailsoortReferentiedata.model_construct(
         code="RIO",
         naam="Rioolfonds",
         parent=Prijscomponentsoort.service,
@@ -327,7 +339,7 @@ class Prijscomponentdetailsoort(Referentiedatasoort):
     riool
     """
 
-    schoonmaak_eenheid = PrijscomponentdetailsoortReferentiedata(
+    schoonmaak_eenheid = PrijscomponentdetailsoortReferentiedata.model_construct(
         code="SCE",
         naam="Schoonmaak eenheid",
         parent=Prijscomponentsoort.service,
@@ -336,17 +348,19 @@ class Prijscomponentdetailsoort(Referentiedatasoort):
     Maandelijkse kosten voor schoonmaak van de eenheid
     """
 
-    schoonmaak_van_gemeenschappelijke_ruimten = PrijscomponentdetailsoortReferentiedata(
-        code="SCH",
-        naam="Schoonmaak van gemeenschappelijke ruimten",
-        parent=Prijscomponentsoort.service,
+    schoonmaak_van_gemeenschappelijke_ruimten = (
+        PrijscomponentdetailsoortReferentiedata.model_construct(
+            code="SCH",
+            naam="Schoonmaak van gemeenschappelijke ruimten",
+            parent=Prijscomponentsoort.service,
+        )
     )
     """
     De maandelijkse schoonmaakkosten voor de lift en andere gemeenschappelijke ruimten,
     zoals een galerij, trappenhuis of recreatieruimte
     """
 
-    signaallevering_o_a_cai = PrijscomponentdetailsoortReferentiedata(
+    signaallevering_o_a_cai = PrijscomponentdetailsoortReferentiedata.model_construct(
         code="SIG",
         naam="Signaallevering (o.a. CAI)",
         parent=Prijscomponentsoort.service,
@@ -355,7 +369,7 @@ class Prijscomponentdetailsoort(Referentiedatasoort):
     Maandelijkse kosten voor signaallevering (o.a. CAI)
     """
 
-    schoorsteenvegen = PrijscomponentdetailsoortReferentiedata(
+    schoorsteenvegen = PrijscomponentdetailsoortReferentiedata.model_construct(
         code="STV",
         naam="Schoorsteenvegen",
         parent=Prijscomponentsoort.service,
@@ -364,7 +378,7 @@ class Prijscomponentdetailsoort(Referentiedatasoort):
     Maandelijkse kosten voor het vegen van de schoorsteen
     """
 
-    verenigingskosten = PrijscomponentdetailsoortReferentiedata(
+    verenigingskosten = PrijscomponentdetailsoortReferentiedata.model_construct(
         code="VER",
         naam="Verenigingskosten",
         parent=Prijscomponentsoort.service,
@@ -373,7 +387,7 @@ class Prijscomponentdetailsoort(Referentiedatasoort):
     Maandelijkse kosten voor lidmaatschap van  verenigingen
     """
 
-    volkstuin = PrijscomponentdetailsoortReferentiedata(
+    volkstuin = PrijscomponentdetailsoortReferentiedata.model_construct(
         code="VOL",
         naam="Volkstuin",
         parent=Prijscomponentsoort.service,
@@ -382,7 +396,7 @@ class Prijscomponentdetailsoort(Referentiedatasoort):
     Maandelijkse kosten voor het gebruik van een volkstuin
     """
 
-    vve_kosten = PrijscomponentdetailsoortReferentiedata(
+    vve_kosten = PrijscomponentdetailsoortReferentiedata.model_construct(
         code="VVE",
         naam="VVE kosten",
         parent=Prijscomponentsoort.service,
@@ -391,7 +405,7 @@ class Prijscomponentdetailsoort(Referentiedatasoort):
     Maandelijkse kosten voor VVE-lidmaatschap
     """
 
-    verzekeringskosten = PrijscomponentdetailsoortReferentiedata(
+    verzekeringskosten = PrijscomponentdetailsoortReferentiedata.model_construct(
         code="VZE",
         naam="Verzekeringskosten",
         parent=Prijscomponentsoort.service,
@@ -400,7 +414,7 @@ class Prijscomponentdetailsoort(Referentiedatasoort):
     Maandelijkse kosten voor verzekeringen
     """
 
-    warmte_installaties = PrijscomponentdetailsoortReferentiedata(
+    warmte_installaties = PrijscomponentdetailsoortReferentiedata.model_construct(
         code="WAI",
         naam="Warmte-installaties",
         parent=Prijscomponentsoort.service,
@@ -410,7 +424,7 @@ class Prijscomponentdetailsoort(Referentiedatasoort):
     vertrekken van de eenheid
     """
 
-    warmte = PrijscomponentdetailsoortReferentiedata(
+    warmte = PrijscomponentdetailsoortReferentiedata.model_construct(
         code="WAR",
         naam="Warmte",
         parent=Prijscomponentsoort.verbruik,
@@ -419,13 +433,13 @@ class Prijscomponentdetailsoort(Referentiedatasoort):
     Centrale verwarming, Stadsverwarming, etc.
     """
 
-    water = PrijscomponentdetailsoortReferentiedata(
+    water = PrijscomponentdetailsoortReferentiedata.model_construct(
         code="WAT",
         naam="Water",
         parent=Prijscomponentsoort.verbruik,
     )
 
-    witgoed = PrijscomponentdetailsoortReferentiedata(
+    witgoed = PrijscomponentdetailsoortReferentiedata.model_construct(
         code="WIT",
         naam="Witgoed",
         parent=Prijscomponentsoort.service,
@@ -434,7 +448,7 @@ class Prijscomponentdetailsoort(Referentiedatasoort):
     Maandelijkse kosten voor het gebruik van witgoed (bijvoorbeeld wasmachine of droger)
     """
 
-    warmwaterinstallaties = PrijscomponentdetailsoortReferentiedata(
+    warmwaterinstallaties = PrijscomponentdetailsoortReferentiedata.model_construct(
         code="WWI",
         naam="Warmwaterinstallaties",
         parent=Prijscomponentsoort.service,
@@ -443,7 +457,7 @@ class Prijscomponentdetailsoort(Referentiedatasoort):
     Maandelijkse kosten voor het gebruik van installaties voor warm water
     """
 
-    zonnepanelen = PrijscomponentdetailsoortReferentiedata(
+    zonnepanelen = PrijscomponentdetailsoortReferentiedata.model_construct(
         code="ZON",
         naam="Zonnepanelen",
         parent=Prijscomponentsoort.service,
@@ -452,7 +466,7 @@ class Prijscomponentdetailsoort(Referentiedatasoort):
     Maandelijkse kosten voor het gebruik van zonnepanelen
     """
 
-    zonwering = PrijscomponentdetailsoortReferentiedata(
+    zonwering = PrijscomponentdetailsoortReferentiedata.model_construct(
         code="ZWE",
         naam="Zonwering",
         parent=Prijscomponentsoort.service,
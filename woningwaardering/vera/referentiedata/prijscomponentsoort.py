@@ -7,7 +7,7 @@ class PrijscomponentsoortReferentiedata(Referentiedata):
 
 
 class Prijscomponentsoort(Referentiedatasoort):
-    dienstencomponent = PrijscomponentsoortReferentiedata(
+    dienstencomponent = PrijscomponentsoortReferentiedata.model_construct(
         code="DIE",
         naam="Dienstencomponent",
     )
@@ -16,7 +16,7 @@ class Prijscomponentsoort(Referentiedatasoort):
     recreatieruimten'. Die laatste is een (subsidiabele) Servicekosten component.
     """
 
-    eenmalig = PrijscomponentsoortReferentiedata(
+    eenmalig = PrijscomponentsoortReferentiedata.model_construct(
         code="EEN",
         naam="Eenmalig",
     )
@@ -24,7 +24,7 @@ class Prijscomponentsoort(Referentiedatasoort):
     Eenmalige kosten, bijv. administratiekosten afsluiten huurovereenkomst
     """
 
-    huuraanpassing = PrijscomponentsoortReferentiedata(
+    huuraanpassing = PrijscomponentsoortReferentiedata.model_construct(
         code="HUA",
         naam="Huuraanpassing",
     )
@@ -32,7 +32,7 @@ class Prijscomponentsoort(Referentiedatasoort):
     Aanpassingen zoals, korting, compensatie, opslag, etc.
     """
 
-    aankoopprijs = PrijscomponentsoortReferentiedata(
+    aankoopprijs = PrijscomponentsoortReferentiedata.model_construct(
         code="KOO",
         naam="Aankoopprijs",
     )
@@ -40,7 +40,7 @@ class Prijscomponentsoort(Referentiedatasoort):
     Prijs van de aankoop
     """
 
-    netto_huur = PrijscomponentsoortReferentiedata(
+    netto_huur = PrijscomponentsoortReferentiedata.model_construct(
         code="NET",
         naam="Netto Huur",
     )
@@ -49,7 +49,7 @@ class Prijscomponentsoort(Referentiedatasoort):
     prijscomponentdetailsoorten) die tot de netto huur wordt gerekend.
     """
 
-    parkeren = PrijscomponentsoortReferentiedata(
+    parkeren = PrijscomponentsoortReferentiedata.model_construct(
         code="PAR",
         naam="Parkeren",
     )
@@ -60,7 +60,7 @@ class Prijscomponentsoort(Referentiedatasoort):
     Netto Huur in combinatie met een prijscomponentdetailsoort.
     """
 
-    service = PrijscomponentsoortReferentiedata(
+    service = PrijscomponentsoortReferentiedata.model_construct(
         code="SER",
         naam="Service",
     )
@@ -68,12 +68,12 @@ class Prijscomponentsoort(Referentiedatasoort):
     Aanvullende kosten zoals: huismeester, glasfonds, rioolreiniging, etc.
     """
 
-    starterslening = PrijscomponentsoortReferentiedata(
+    starterslening = PrijscomponentsoortReferentiedata.model_construct(
         code="STA",
         naam="Starterslening",
     )
 
-    verbruik = PrijscomponentsoortReferentiedata(
+    verbruik = PrijscomponentsoortReferentiedata.model_construct(
         code="VER",
         naam="Verbruik",
     )
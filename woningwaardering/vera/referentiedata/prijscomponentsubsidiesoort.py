@@ -7,18 +7,22 @@ class PrijscomponentsubsidiesoortReferentiedata(Referentiedata):
 
 
 class Prijscomponentsubsidiesoort(Referentiedatasoort):
-    niet_subsidiabel_prijscomponent = PrijscomponentsubsidiesoortReferentiedata(
-        code="NSU",
-        naam="Niet subsidiabel prijscomponent",
+    niet_subsidiabel_prijscomponent = (
+        PrijscomponentsubsidiesoortReferentiedata.model_construct(
+            code="NSU",
+            naam="Niet subsidiabel prijscomponent",
+        )
     )
     """
     Het prijscomponent komt NIET in aanmerking voor subsidie omdat deze niet opgenomen
     is in de Wet op de huurtoeslag
     """
 
-    subsidiabel_prijscomponent = PrijscomponentsubsidiesoortReferentiedata(
-        code="SUB",
-        naam="Subsidiabel prijscomponent",
+    subsidiabel_prijscomponent = (
+        PrijscomponentsubsidiesoortReferentiedata.model_construct(
+            code="SUB",
+            naam="Subsidiabel prijscomponent",
+        )
     )
     """
     Het prijscomponent komt in aanmerking voor subsidie en valt binnen de Wet op de
@@ -8,7 +8,7 @@ class PrijscomponentwijzigingsredenReferentiedata(Referentiedata):
 
 class Prijscomponentwijzigingsreden(Referentiedatasoort):
     jaarlijkse_huuraanpassing_inkomensafhankelijk = (
-        PrijscomponentwijzigingsredenReferentiedata(
+        PrijscomponentwijzigingsredenReferentiedata.model_construct(
             code="INK",
             naam="Jaarlijkse huuraanpassing -inkomensafhankelijk",
         )
@@ -18,7 +18,7 @@ class Prijscomponentwijzigingsreden(Referentiedatasoort):
     """
 
     jaarlijkse_huuraanpassing_niet_inkomensafhankelijk = (
-        PrijscomponentwijzigingsredenReferentiedata(
+        PrijscomponentwijzigingsredenReferentiedata.model_construct(
             code="JAA",
             naam="Jaarlijkse huuraanpassing -niet inkomensafhankelijk",
         )
@@ -27,7 +27,7 @@ class Prijscomponentwijzigingsreden(Referentiedatasoort):
     Jaarlijkse huuraanpassing - zonder inkomensafhankelijke huurverhoging
     """
 
-    nieuwe_verhuring = PrijscomponentwijzigingsredenReferentiedata(
+    nieuwe_verhuring = PrijscomponentwijzigingsredenReferentiedata.model_construct(
         code="MUT",
         naam="Nieuwe verhuring",
     )
@@ -35,7 +35,7 @@ class Prijscomponentwijzigingsreden(Referentiedatasoort):
     Nieuwe verhuring, inclusief de eerste verhuring van een eenheid
     """
 
-    nieuw_component = PrijscomponentwijzigingsredenReferentiedata(
+    nieuw_component = PrijscomponentwijzigingsredenReferentiedata.model_construct(
         code="NIE",
         naam="Nieuw component",
     )
@@ -43,9 +43,11 @@ class Prijscomponentwijzigingsreden(Referentiedatasoort):
     Nieuw prijscomponent bij een eenheid of een overeenkomst
     """
 
-    renovatie_of_woningverbetering = PrijscomponentwijzigingsredenReferentiedata(
-        code="REN",
-        naam="Renovatie of woningverbetering",
+    renovatie_of_woningverbetering = (
+        PrijscomponentwijzigingsredenReferentiedata.model_construct(
+            code="REN",
+            naam="Renovatie of woningverbetering",
+        )
     )
     """
     Huuraanpassing als gevolg van een renovatie of woningverbetering
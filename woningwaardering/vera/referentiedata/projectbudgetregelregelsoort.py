@@ -7,7 +7,7 @@ class ProjectbudgetregelregelsoortReferentiedata(Referentiedata):
 
 
 class Projectbudgetregelregelsoort(Referentiedatasoort):
-    kostendetailregel = ProjectbudgetregelregelsoortReferentiedata(
+    kostendetailregel = ProjectbudgetregelregelsoortReferentiedata.model_construct(
         code="KDT",
         naam="Kostendetailregel",
     )
@@ -15,7 +15,7 @@ class Projectbudgetregelregelsoort(Referentiedatasoort):
     Projectbudgetregel is een kostenregel binnen de stichtingskosten hiërarchie
     """
 
-    opbrengstendetailregel = ProjectbudgetregelregelsoortReferentiedata(
+    opbrengstendetailregel = ProjectbudgetregelregelsoortReferentiedata.model_construct(
         code="ODT",
         naam="Opbrengstendetailregel",
     )
@@ -23,7 +23,7 @@ class Projectbudgetregelregelsoort(Referentiedatasoort):
     Projectbudgetregel is een opbrengstenregel binnen de stichtingskosten hiërarchie
     """
 
-    subtotaalregel = ProjectbudgetregelregelsoortReferentiedata(
+    subtotaalregel = ProjectbudgetregelregelsoortReferentiedata.model_construct(
         code="STR",
         naam="Subtotaalregel",
     )
@@ -7,7 +7,7 @@ class ProjectbudgetregelsoortReferentiedata(Referentiedata):
 
 
 class Projectbudgetregelsoort(Referentiedatasoort):
-    budget = ProjectbudgetregelsoortReferentiedata(
+    budget = ProjectbudgetregelsoortReferentiedata.model_construct(
         code="BUD",
         naam="Budget",
     )
@@ -15,7 +15,7 @@ class Projectbudgetregelsoort(Referentiedatasoort):
     Projectbudgetregel betreft een budgetbedrag
     """
 
-    prognose = ProjectbudgetregelsoortReferentiedata(
+    prognose = ProjectbudgetregelsoortReferentiedata.model_construct(
         code="PRO",
         naam="Prognose",
     )
@@ -7,7 +7,7 @@ class ProjectbudgetregelstatusReferentiedata(Referentiedata):
 
 
 class Projectbudgetregelstatus(Referentiedatasoort):
-    aangevraagd = ProjectbudgetregelstatusReferentiedata(
+    aangevraagd = ProjectbudgetregelstatusReferentiedata.model_construct(
         code="AAN",
         naam="Aangevraagd",
     )
@@ -16,7 +16,7 @@ class Projectbudgetregelstatus(Referentiedatasoort):
     prognosebedrag
     """
 
-    bijgesteld = ProjectbudgetregelstatusReferentiedata(
+    bijgesteld = ProjectbudgetregelstatusReferentiedata.model_construct(
         code="BIJ",
         naam="Bijgesteld",
     )
@@ -25,7 +25,7 @@ class Projectbudgetregelstatus(Referentiedatasoort):
     prognosebedrag
     """
 
-    goedgekeurd = ProjectbudgetregelstatusReferentiedata(
+    goedgekeurd = ProjectbudgetregelstatusReferentiedata.model_construct(
         code="GOE",
         naam="Goedgekeurd",
     )
@@ -34,7 +34,7 @@ class Projectbudgetregelstatus(Referentiedatasoort):
     prognosebedrag
     """
 
-    vrijgegeven = ProjectbudgetregelstatusReferentiedata(
+    vrijgegeven = ProjectbudgetregelstatusReferentiedata.model_construct(
         code="VRI",
         naam="Vrijgegeven",
     )
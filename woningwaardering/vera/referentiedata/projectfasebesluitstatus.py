@@ -7,7 +7,7 @@ class ProjectfasebesluitstatusReferentiedata(Referentiedata):
 
 
 class Projectfasebesluitstatus(Referentiedatasoort):
-    afgewezen = ProjectfasebesluitstatusReferentiedata(
+    afgewezen = ProjectfasebesluitstatusReferentiedata.model_construct(
         code="AFG",
         naam="Afgewezen",
     )
@@ -15,7 +15,7 @@ class Projectfasebesluitstatus(Referentiedatasoort):
     Projectfasebesluit (-versie) is afgewezen
     """
 
-    aangeboden_ter_goedkeuring = ProjectfasebesluitstatusReferentiedata(
+    aangeboden_ter_goedkeuring = ProjectfasebesluitstatusReferentiedata.model_construct(
         code="ATG",
         naam="Aangeboden ter goedkeuring",
     )
@@ -23,7 +23,7 @@ class Projectfasebesluitstatus(Referentiedatasoort):
     Projectfasebesluit wacht op goedkeuring, is in behandeling
     """
 
-    concept = ProjectfasebesluitstatusReferentiedata(
+    concept = ProjectfasebesluitstatusReferentiedata.model_construct(
         code="CON",
         naam="Concept",
     )
@@ -31,7 +31,7 @@ class Projectfasebesluitstatus(Referentiedatasoort):
     Projectfasebesluit(-versie) in concept
     """
 
-    definitief = ProjectfasebesluitstatusReferentiedata(
+    definitief = ProjectfasebesluitstatusReferentiedata.model_construct(
         code="DEF",
         naam="Definitief",
     )
@@ -39,7 +39,7 @@ class Projectfasebesluitstatus(Referentiedatasoort):
     Projectfasebesluit definitief maar nog niet ter goedkeuring aangeboden
     """
 
-    goedgekeurd = ProjectfasebesluitstatusReferentiedata(
+    goedgekeurd = ProjectfasebesluitstatusReferentiedata.model_construct(
         code="GOE",
         naam="Goedgekeurd",
     )
@@ -7,7 +7,7 @@ class ProjectsoortReferentiedata(Referentiedata):
 
 
 class Projectsoort(Referentiedatasoort):
-    grondexploitatie = ProjectsoortReferentiedata(
+    grondexploitatie = ProjectsoortReferentiedata.model_construct(
         code="GRX",
         naam="Grondexploitatie",
     )
@@ -22,7 +22,7 @@ class Projectsoort(Referentiedatasoort):
     stellen. (Bron: vrij naar Wikipedia)
     """
 
-    modulaire_bouw = ProjectsoortReferentiedata(
+    modulaire_bouw = ProjectsoortReferentiedata.model_construct(
         code="MOD",
         naam="Modulaire bouw",
     )
@@ -33,7 +33,7 @@ class Projectsoort(Referentiedatasoort):
     geïnstalleerd en aangesloten (Bron: Portakabin)
     """
 
-    nieuwbouw = ProjectsoortReferentiedata(
+    nieuwbouw = ProjectsoortReferentiedata.model_construct(
         code="NIU",
         naam="Nieuwbouw",
     )
@@ -43,7 +43,7 @@ class Projectsoort(Referentiedatasoort):
     eenheden zijn gesloopt
     """
 
-    renovatie_bewoond = ProjectsoortReferentiedata(
+    renovatie_bewoond = ProjectsoortReferentiedata.model_construct(
         code="REB",
         naam="Renovatie bewoond",
     )
@@ -58,7 +58,7 @@ class Projectsoort(Referentiedatasoort):
     bestaande situatie niet het geval was (Bron: SBR-Wonen).
     """
 
-    renovatie_onbewoond = ProjectsoortReferentiedata(
+    renovatie_onbewoond = ProjectsoortReferentiedata.model_construct(
         code="REO",
         naam="Renovatie onbewoond",
     )
@@ -73,7 +73,7 @@ class Projectsoort(Referentiedatasoort):
     bestaande situatie niet het geval was (Bron: SBR-Wonen).
     """
 
-    sloop_en_nieuwbouw = ProjectsoortReferentiedata(
+    sloop_en_nieuwbouw = ProjectsoortReferentiedata.model_construct(
         code="SLN",
         naam="Sloop- en Nieuwbouw",
     )
@@ -83,7 +83,7 @@ class Projectsoort(Referentiedatasoort):
     nieuwbouw op het(/de)zelde perce(e)l(en)
     """
 
-    sloop = ProjectsoortReferentiedata(
+    sloop = ProjectsoortReferentiedata.model_construct(
         code="SLO",
         naam="Sloop",
     )
@@ -92,7 +92,7 @@ class Projectsoort(Referentiedatasoort):
     zonder dat daar nieuwbouw op het(/de)zelde perce(e)l(en) tegenover staat
     """
 
-    transformatie = ProjectsoortReferentiedata(
+    transformatie = ProjectsoortReferentiedata.model_construct(
         code="TRA",
         naam="Transformatie",
     )
@@ -7,7 +7,7 @@ class ProjectstatusReferentiedata(Referentiedata):
 
 
 class Projectstatus(Referentiedatasoort):
-    actief = ProjectstatusReferentiedata(
+    actief = ProjectstatusReferentiedata.model_construct(
         code="ACT",
         naam="Actief",
     )
@@ -15,7 +15,7 @@ class Projectstatus(Referentiedatasoort):
     Het project is actief, en bevindt zich in een van de projectfasen
     """
 
-    afgerond = ProjectstatusReferentiedata(
+    afgerond = ProjectstatusReferentiedata.model_construct(
         code="AFG",
         naam="Afgerond",
     )
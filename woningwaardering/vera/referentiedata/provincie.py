@@ -7,57 +7,57 @@ class ProvincieReferentiedata(Referentiedata):
 
 
 class Provincie(Referentiedatasoort):
-    drenthe = ProvincieReferentiedata(
+    drenthe = ProvincieReferentiedata.model_construct(
         code="DR",
         naam="Drenthe",
     )
 
-    flevoland = ProvincieReferentiedata(
+    flevoland = ProvincieReferentiedata.model_construct(
         code="FL",
         naam="Flevoland",
     )
 
-    fryslan = ProvincieReferentiedata(
+    fryslan = ProvincieReferentiedata.model_construct(
         code="FR",
         naam="Fryslân",
     )
 
-    gelderland = ProvincieReferentiedata(
+    gelderland = ProvincieReferentiedata.model_construct(
         code="GE",
         naam="Gelderland",
     )
 
-    groningen = ProvincieReferentiedata(
+    groningen = ProvincieReferentiedata.model_construct(
         code="GR",
         naam="Groningen",
     )
 
-    limburg = ProvincieReferentiedata(
+    limburg = ProvincieReferentiedata.model_construct(
         code="LI",
         naam="Limburg",
     )
 
-    noord_brabant = ProvincieReferentiedata(
+    noord_brabant = ProvincieReferentiedata.model_construct(
         code="NB",
         naam="Noord-Brabant",
     )
 
-    noord_holland = ProvincieReferentiedata(
+    noord_holland = ProvincieReferentiedata.model_construct(
         code="NH",
         naam="Noord-Holland",
     )
 
-    overijssel = ProvincieReferentiedata(
+    overijssel = ProvincieReferentiedata.model_construct(
         code="OV",
         naam="Overijssel",
     )
 
-    utrecht = ProvincieReferentiedata(
+    utrecht = ProvincieReferentiedata.model_construct(
         code="UT",
         naam="Utrecht",
     )
 
-    zeeland = ProvincieReferentiedata(
+    zeeland = ProvincieReferentiedata.model_construct(
         code="ZE",
         naam="Zeeland",
     )
@@ -66,7 +66,7 @@ class Provincie(Referentiedatasoort):
     standaard.
     """
 
-    zuid_holland = ProvincieReferentiedata(
+    zuid_holland = ProvincieReferentiedata.model_construct(
         code="ZH",
         naam="Zuid-Holland",
     )
@@ -10,7 +10,7 @@ class PublicatiedetailmodelReferentiedata(Referentiedata):
 
 
 class Publicatiedetailmodel(Referentiedatasoort):
-    leefstijl = PublicatiedetailmodelReferentiedata(
+    leefstijl = PublicatiedetailmodelReferentiedata.model_construct(
         code="LEE",
         naam="Leefstijl",
         parent=Publicatiemodel.aanbodmodel,
@@ -19,7 +19,7 @@ class Publicatiedetailmodel(Referentiedatasoort):
     Eenheden in kwetsbare buurten waarbij leefstijl een belangrijke factor speelt.
     """
 
-    loting = PublicatiedetailmodelReferentiedata(
+    loting = PublicatiedetailmodelReferentiedata.model_construct(
         code="LOT",
         naam="Loting",
         parent=Publicatiemodel.aanbodmodel,
@@ -28,7 +28,7 @@ class Publicatiedetailmodel(Referentiedatasoort):
     Binnen het aanbodmodel wordt geloot nadat eerst een selectie heeft plaatsgevonden.
     """
 
-    omklapcontract = PublicatiedetailmodelReferentiedata(
+    omklapcontract = PublicatiedetailmodelReferentiedata.model_construct(
         code="OMK",
         naam="Omklapcontract",
         parent=Publicatiemodel.distributiemodel,
@@ -40,7 +40,7 @@ class Publicatiedetailmodel(Referentiedatasoort):
     omgeklapt, d.w.z. komt het op zijn eigen naam te staan.
     """
 
-    snelzoek = PublicatiedetailmodelReferentiedata(
+    snelzoek = PublicatiedetailmodelReferentiedata.model_construct(
         code="SNE",
         naam="Snelzoek",
         parent=Publicatiemodel.lotingmodel,
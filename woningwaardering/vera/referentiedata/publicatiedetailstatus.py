@@ -10,16 +10,18 @@ class PublicatiedetailstatusReferentiedata(Referentiedata):
 
 
 class Publicatiedetailstatus(Referentiedatasoort):
-    woning_krijgt_andere_bestemming = PublicatiedetailstatusReferentiedata(
-        code="BES",
-        naam="Woning krijgt andere bestemming",
-        parent=Publicatiestatus.ingetrokken,
+    woning_krijgt_andere_bestemming = (
+        PublicatiedetailstatusReferentiedata.model_construct(
+            code="BES",
+            naam="Woning krijgt andere bestemming",
+            parent=Publicatiestatus.ingetrokken,
+        )
     )
     """
     Woning krijgt andere bestemming.
     """
 
-    geen_toewijzing = PublicatiedetailstatusReferentiedata(
+    geen_toewijzing = PublicatiedetailstatusReferentiedata.model_construct(
         code="GTW",
         naam="Geen toewijzing",
         parent=Publicatiestatus.afgerond,
@@ -28,16 +30,18 @@ class Publicatiedetailstatus(Referentiedatasoort):
     Geen toewijzing
     """
 
-    woning_wordt_handmatig_bemiddeld = PublicatiedetailstatusReferentiedata(
-        code="HAN",
-        naam="Woning wordt handmatig bemiddeld",
-        parent=Publicatiestatus.ingetrokken,
+    woning_wordt_handmatig_bemiddeld = (
+        PublicatiedetailstatusReferentiedata.model_construct(
+            code="HAN",
+            naam="Woning wordt handmatig bemiddeld",
+            parent=Publicatiestatus.ingetrokken,
+        )
     )
     """
     Woning wordt handmatig bemiddeld.
     """
 
-    verhuurd_onder_voorbehoud = PublicatiedetailstatusReferentiedata(
+    verhuurd_onder_voorbehoud = PublicatiedetailstatusReferentiedata.model_construct(
         code="HUU",
         naam="Verhuurd onder voorbehoud",
         parent=Publicatiestatus.gepubliceerd,
@@ -46,7 +50,7 @@ class Publicatiedetailstatus(Referentiedatasoort):
     Verhuurd onder voorbehoud
     """
 
-    huuropzegging_is_ingetrokken = PublicatiedetailstatusReferentiedata(
+    huuropzegging_is_ingetrokken = PublicatiedetailstatusReferentiedata.model_construct(
         code="ING",
         naam="Huuropzegging is ingetrokken",
         parent=Publicatiestatus.ingetrokken,
@@ -55,7 +59,7 @@ class Publicatiedetailstatus(Referentiedatasoort):
     Huuropzegging is ingetrokken.
     """
 
-    verkocht_onder_voorbehoud = PublicatiedetailstatusReferentiedata(
+    verkocht_onder_voorbehoud = PublicatiedetailstatusReferentiedata.model_construct(
         code="KOO",
         naam="Verkocht onder voorbehoud",
         parent=Publicatiestatus.gepubliceerd,
@@ -64,7 +68,7 @@ class Publicatiedetailstatus(Referentiedatasoort):
     Verkocht onder voorbehoud
     """
 
-    onder_bod = PublicatiedetailstatusReferentiedata(
+    onder_bod = PublicatiedetailstatusReferentiedata.model_construct(
         code="OND",
         naam="Onder bod",
         parent=Publicatiestatus.gepubliceerd,
@@ -73,16 +77,18 @@ class Publicatiedetailstatus(Referentiedatasoort):
     Onder bod
     """
 
-    publicatie_met_onjuiste_gegevens = PublicatiedetailstatusReferentiedata(
-        code="ONJ",
-        naam="Publicatie met onjuiste gegevens",
-        parent=Publicatiestatus.ingetrokken,
+    publicatie_met_onjuiste_gegevens = (
+        PublicatiedetailstatusReferentiedata.model_construct(
+            code="ONJ",
+            naam="Publicatie met onjuiste gegevens",
+            parent=Publicatiestatus.ingetrokken,
+        )
     )
     """
     Publicatie met onjuiste gegevens.
     """
 
-    onder_optie = PublicatiedetailstatusReferentiedata(
+    onder_optie = PublicatiedetailstatusReferentiedata.model_construct(
         code="OOP",
         naam="Onder optie",
         parent=Publicatiestatus.gepubliceerd,
@@ -91,7 +97,7 @@ class Publicatiedetailstatus(Referentiedatasoort):
     Onder optie
     """
 
-    woning_wordt_gerenoveerd = PublicatiedetailstatusReferentiedata(
+    woning_wordt_gerenoveerd = PublicatiedetailstatusReferentiedata.model_construct(
         code="REN",
         naam="Woning wordt gerenoveerd",
         parent=Publicatiestatus.ingetrokken,
@@ -100,7 +106,7 @@ class Publicatiedetailstatus(Referentiedatasoort):
     Woning wordt gerenoveerd.
     """
 
-    toegewezen = PublicatiedetailstatusReferentiedata(
+    toegewezen = PublicatiedetailstatusReferentiedata.model_construct(
         code="TOE",
         naam="Toegewezen",
         parent=Publicatiestatus.afgerond,
@@ -109,7 +115,7 @@ class Publicatiedetailstatus(Referentiedatasoort):
     Toegewezen
     """
 
-    woning_gaat_uit_exploitatie = PublicatiedetailstatusReferentiedata(
+    woning_gaat_uit_exploitatie = PublicatiedetailstatusReferentiedata.model_construct(
         code="UIT",
         naam="Woning gaat uit exploitatie",
         parent=Publicatiestatus.ingetrokken,
@@ -10,7 +10,7 @@ class PublicatieintakevormReferentiedata(Referentiedata):
 
 
 class Publicatieintakevorm(Referentiedatasoort):
-    cooptatie = PublicatieintakevormReferentiedata(
+    cooptatie = PublicatieintakevormReferentiedata.model_construct(
         code="COO",
         naam="Coöptatie",
         parent=Publicatiemodel.aanbodmodel,
@@ -19,7 +19,7 @@ class Publicatieintakevorm(Referentiedatasoort):
     Medebewoners bepalen welke woningzoekende de eenheid krijgt.
     """
 
-    intakegesprek = PublicatieintakevormReferentiedata(
+    intakegesprek = PublicatieintakevormReferentiedata.model_construct(
         code="INT",
         naam="Intakegesprek",
         parent=Publicatiemodel.aanbodmodel,
@@ -28,7 +28,7 @@ class Publicatieintakevorm(Referentiedatasoort):
     Er vindt een intake gesprek plaats met de eigenaar van de woning.
     """
 
-    motivatie = PublicatieintakevormReferentiedata(
+    motivatie = PublicatieintakevormReferentiedata.model_construct(
         code="MOT",
         naam="Motivatie",
         parent=Publicatiemodel.aanbodmodel,
@@ -38,7 +38,7 @@ class Publicatieintakevorm(Referentiedatasoort):
     -gesprek.
     """
 
-    sociale_spelregels = PublicatieintakevormReferentiedata(
+    sociale_spelregels = PublicatieintakevormReferentiedata.model_construct(
         code="SOC",
         naam="Sociale spelregels",
         parent=Publicatiemodel.aanbodmodel,
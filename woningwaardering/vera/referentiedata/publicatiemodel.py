@@ -7,7 +7,7 @@ class PublicatiemodelReferentiedata(Referentiedata):
 
 
 class Publicatiemodel(Referentiedatasoort):
-    aanbodmodel = PublicatiemodelReferentiedata(
+    aanbodmodel = PublicatiemodelReferentiedata.model_construct(
         code="AAN",
         naam="Aanbodmodel",
     )
@@ -17,7 +17,7 @@ class Publicatiemodel(Referentiedatasoort):
     krijgt de woningzoekende met de hoogste positie de eenheid aangeboden.
     """
 
-    distributiemodel = PublicatiemodelReferentiedata(
+    distributiemodel = PublicatiemodelReferentiedata.model_construct(
         code="DIS",
         naam="Distributiemodel",
     )
@@ -27,7 +27,7 @@ class Publicatiemodel(Referentiedatasoort):
     rechtspersoon zijn, die namens een woningzoekende acteert.)
     """
 
-    eerste_reageerder = PublicatiemodelReferentiedata(
+    eerste_reageerder = PublicatiemodelReferentiedata.model_construct(
         code="EER",
         naam="Eerste reageerder",
     )
@@ -36,7 +36,7 @@ class Publicatiemodel(Referentiedatasoort):
     staat bovenaan de lijst.
     """
 
-    lotingmodel = PublicatiemodelReferentiedata(
+    lotingmodel = PublicatiemodelReferentiedata.model_construct(
         code="LOT",
         naam="Lotingmodel",
     )
@@ -45,7 +45,7 @@ class Publicatiemodel(Referentiedatasoort):
     zijn van 'gewogen' loting of andere combinaties van spelregels.
     """
 
-    optiemodel = PublicatiemodelReferentiedata(
+    optiemodel = PublicatiemodelReferentiedata.model_construct(
         code="OPT",
         naam="Optiemodel",
     )
@@ -55,7 +55,7 @@ class Publicatiemodel(Referentiedatasoort):
     positie de eenheid aangeboden.
     """
 
-    vrijesectormodel = PublicatiemodelReferentiedata(
+    vrijesectormodel = PublicatiemodelReferentiedata.model_construct(
         code="VRI",
         naam="Vrijesectormodel",
     )
@@ -65,7 +65,7 @@ class Publicatiemodel(Referentiedatasoort):
     kunnen overigens wel degelijk eisen gesteld worden (bijv. minimaal inkomen.)
     """
 
-    woningruilmodel = PublicatiemodelReferentiedata(
+    woningruilmodel = PublicatiemodelReferentiedata.model_construct(
         code="WON",
         naam="Woningruilmodel",
     )
@@ -7,7 +7,7 @@ class PublicatiestatusReferentiedata(Referentiedata):
 
 
 class Publicatiestatus(Referentiedatasoort):
-    in_aanbieding = PublicatiestatusReferentiedata(
+    in_aanbieding = PublicatiestatusReferentiedata.model_construct(
         code="AAN",
         naam="In aanbieding",
     )
@@ -15,7 +15,7 @@ class Publicatiestatus(Referentiedatasoort):
     Het gepubliceerde vastgoed is in aanbieding.
     """
 
-    afgerond = PublicatiestatusReferentiedata(
+    afgerond = PublicatiestatusReferentiedata.model_construct(
         code="AFG",
         naam="Afgerond",
     )
@@ -23,7 +23,7 @@ class Publicatiestatus(Referentiedatasoort):
     De publicatie van het vastgoed is afgerond.
     """
 
-    gepubliceerd = PublicatiestatusReferentiedata(
+    gepubliceerd = PublicatiestatusReferentiedata.model_construct(
         code="GEP",
         naam="Gepubliceerd",
     )
@@ -31,7 +31,7 @@ class Publicatiestatus(Referentiedatasoort):
     Het beschikbaar vastgoed is gepubliceerd.
     """
 
-    gereed_voor_publicatie = PublicatiestatusReferentiedata(
+    gereed_voor_publicatie = PublicatiestatusReferentiedata.model_construct(
         code="GER",
         naam="Gereed voor publicatie",
     )
@@ -39,7 +39,7 @@ class Publicatiestatus(Referentiedatasoort):
     De publicatie van beschikbaar vastgoed is gereed voor publicatie.
     """
 
-    ingetrokken = PublicatiestatusReferentiedata(
+    ingetrokken = PublicatiestatusReferentiedata.model_construct(
         code="ING",
         naam="Ingetrokken",
     )
@@ -47,7 +47,7 @@ class Publicatiestatus(Referentiedatasoort):
     De publicatie van het vastgoed is ingetrokken.
     """
 
-    in_voorbereiding = PublicatiestatusReferentiedata(
+    in_voorbereiding = PublicatiestatusReferentiedata.model_construct(
         code="VOO",
         naam="In voorbereiding",
     )
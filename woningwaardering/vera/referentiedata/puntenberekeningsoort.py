@@ -7,12 +7,14 @@ class PuntenberekeningsoortReferentiedata(Referentiedata):
 
 
 class Puntenberekeningsoort(Referentiedatasoort):
-    intrekken_gebeurtenis_of_sanctie = PuntenberekeningsoortReferentiedata(
-        code="INT",
-        naam="Intrekken gebeurtenis of sanctie",
+    intrekken_gebeurtenis_of_sanctie = (
+        PuntenberekeningsoortReferentiedata.model_construct(
+            code="INT",
+            naam="Intrekken gebeurtenis of sanctie",
+        )
     )
 
-    intrekken_toewijzing = PuntenberekeningsoortReferentiedata(
+    intrekken_toewijzing = PuntenberekeningsoortReferentiedata.model_construct(
         code="ITO",
         naam="Intrekken toewijzing",
     )
@@ -20,17 +22,17 @@ class Puntenberekeningsoort(Referentiedatasoort):
     Intrekken toewijzing van de eenheid.
     """
 
-    koppelen_inschrijving = PuntenberekeningsoortReferentiedata(
+    koppelen_inschrijving = PuntenberekeningsoortReferentiedata.model_construct(
         code="KOP",
         naam="Koppelen inschrijving",
     )
 
-    maandelijkse_herberekening = PuntenberekeningsoortReferentiedata(
+    maandelijkse_herberekening = PuntenberekeningsoortReferentiedata.model_construct(
         code="MAA",
         naam="Maandelijkse herberekening",
     )
 
-    nieuwe_inschrijving = PuntenberekeningsoortReferentiedata(
+    nieuwe_inschrijving = PuntenberekeningsoortReferentiedata.model_construct(
         code="NIE",
         naam="Nieuwe inschrijving",
     )
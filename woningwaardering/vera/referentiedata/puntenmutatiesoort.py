@@ -7,7 +7,7 @@ class PuntenmutatiesoortReferentiedata(Referentiedata):
 
 
 class Puntenmutatiesoort(Referentiedatasoort):
-    intrekken_toewijzing = PuntenmutatiesoortReferentiedata(
+    intrekken_toewijzing = PuntenmutatiesoortReferentiedata.model_construct(
         code="ITO",
         naam="Intrekken toewijzing",
     )
@@ -15,7 +15,7 @@ class Puntenmutatiesoort(Referentiedatasoort):
     Intrekken toewijzing van de eenheid.
     """
 
-    puntenafbouw_situatiepunten = PuntenmutatiesoortReferentiedata(
+    puntenafbouw_situatiepunten = PuntenmutatiesoortReferentiedata.model_construct(
         code="PAS",
         naam="Puntenafbouw situatiepunten",
     )
@@ -23,7 +23,7 @@ class Puntenmutatiesoort(Referentiedatasoort):
     Puntenafbouw situatiepunten
     """
 
-    puntenafbouw_startpunten = PuntenmutatiesoortReferentiedata(
+    puntenafbouw_startpunten = PuntenmutatiesoortReferentiedata.model_construct(
         code="PAT",
         naam="Puntenafbouw startpunten",
     )
@@ -31,7 +31,7 @@ class Puntenmutatiesoort(Referentiedatasoort):
     Puntenafbouw startpunten
     """
 
-    puntenafbouw_zoekpunten = PuntenmutatiesoortReferentiedata(
+    puntenafbouw_zoekpunten = PuntenmutatiesoortReferentiedata.model_construct(
         code="PAZ",
         naam="Puntenafbouw zoekpunten",
     )
@@ -39,7 +39,7 @@ class Puntenmutatiesoort(Referentiedatasoort):
     Puntenafbouw zoekpunten
     """
 
-    puntenopbouw_situatiepunten = PuntenmutatiesoortReferentiedata(
+    puntenopbouw_situatiepunten = PuntenmutatiesoortReferentiedata.model_construct(
         code="PSI",
         naam="Puntenopbouw situatiepunten",
     )
@@ -47,7 +47,7 @@ class Puntenmutatiesoort(Referentiedatasoort):
     Puntenopbouw situatiepunten
     """
 
-    puntenopbouw_startpunten = PuntenmutatiesoortReferentiedata(
+    puntenopbouw_startpunten = PuntenmutatiesoortReferentiedata.model_construct(
         code="PST",
         naam="Puntenopbouw startpunten",
     )
@@ -55,7 +55,7 @@ class Puntenmutatiesoort(Referentiedatasoort):
     Puntenopbouw startpunten
     """
 
-    puntenopbouw_zoekpunten = PuntenmutatiesoortReferentiedata(
+    puntenopbouw_zoekpunten = PuntenmutatiesoortReferentiedata.model_construct(
         code="PZO",
         naam="Puntenopbouw zoekpunten",
     )
@@ -63,7 +63,7 @@ class Puntenmutatiesoort(Referentiedatasoort):
     Puntenopbouw zoekpunten
     """
 
-    milde_sanctie = PuntenmutatiesoortReferentiedata(
+    milde_sanctie = PuntenmutatiesoortReferentiedata.model_construct(
         code="SMI",
         naam="Milde sanctie",
     )
@@ -71,7 +71,7 @@ class Puntenmutatiesoort(Referentiedatasoort):
     Milde sanctie
     """
 
-    no_show_sanctie = PuntenmutatiesoortReferentiedata(
+    no_show_sanctie = PuntenmutatiesoortReferentiedata.model_construct(
         code="SNS",
         naam="No-show sanctie",
     )
@@ -79,7 +79,7 @@ class Puntenmutatiesoort(Referentiedatasoort):
     No-show sanctie
     """
 
-    zware_sanctie = PuntenmutatiesoortReferentiedata(
+    zware_sanctie = PuntenmutatiesoortReferentiedata.model_construct(
         code="SZW",
         naam="Zware sanctie",
     )
@@ -87,7 +87,7 @@ class Puntenmutatiesoort(Referentiedatasoort):
     Zware sanctie
     """
 
-    terugdraaien_milde_sanctie = PuntenmutatiesoortReferentiedata(
+    terugdraaien_milde_sanctie = PuntenmutatiesoortReferentiedata.model_construct(
         code="TSM",
         naam="Terugdraaien milde sanctie",
     )
@@ -95,7 +95,7 @@ class Puntenmutatiesoort(Referentiedatasoort):
     Terugdraaien milde sanctie
     """
 
-    terugdraaien_no_show_sanctie = PuntenmutatiesoortReferentiedata(
+    terugdraaien_no_show_sanctie = PuntenmutatiesoortReferentiedata.model_construct(
         code="TSN",
         naam="Terugdraaien no-show sanctie",
     )
@@ -103,7 +103,7 @@ class Puntenmutatiesoort(Referentiedatasoort):
     Terugdraaien no-show sanctie
     """
 
-    terugdraaien_zware_sanctie = PuntenmutatiesoortReferentiedata(
+    terugdraaien_zware_sanctie = PuntenmutatiesoortReferentiedata.model_construct(
         code="TSZ",
         naam="Terugdraaien zware sanctie",
     )
@@ -7,7 +7,7 @@ class ReclamatiesoortReferentiedata(Referentiedata):
 
 
 class Reclamatiesoort(Referentiedatasoort):
-    bezwaar = ReclamatiesoortReferentiedata(
+    bezwaar = ReclamatiesoortReferentiedata.model_construct(
         code="BEZ",
         naam="Bezwaar",
     )
@@ -16,7 +16,7 @@ class Reclamatiesoort(Referentiedatasoort):
     woonruimteverdeelproces.
     """
 
-    klacht = ReclamatiesoortReferentiedata(
+    klacht = ReclamatiesoortReferentiedata.model_construct(
         code="KLA",
         naam="Klacht",
     )
@@ -7,7 +7,7 @@ class ReclamatiestatusReferentiedata(Referentiedata):
 
 
 class Reclamatiestatus(Referentiedatasoort):
-    afgewezen = ReclamatiestatusReferentiedata(
+    afgewezen = ReclamatiestatusReferentiedata.model_construct(
         code="AFG",
         naam="Afgewezen",
     )
@@ -15,7 +15,7 @@ class Reclamatiestatus(Referentiedatasoort):
     De reclamatie is afgewezen door commissie.
     """
 
-    in_beroep = ReclamatiestatusReferentiedata(
+    in_beroep = ReclamatiestatusReferentiedata.model_construct(
         code="BER",
         naam="In beroep",
     )
@@ -23,7 +23,7 @@ class Reclamatiestatus(Referentiedatasoort):
     De reclamatie is in beroep gegaan door de woningzoekende.
     """
 
-    in_behandeling = ReclamatiestatusReferentiedata(
+    in_behandeling = ReclamatiestatusReferentiedata.model_construct(
         code="INB",
         naam="In behandeling",
     )
@@ -31,7 +31,7 @@ class Reclamatiestatus(Referentiedatasoort):
     De reclamatie is in behandeling genomen door de commissie.
     """
 
-    ingediend = ReclamatiestatusReferentiedata(
+    ingediend = ReclamatiestatusReferentiedata.model_construct(
         code="ING",
         naam="Ingediend",
     )
@@ -39,7 +39,7 @@ class Reclamatiestatus(Referentiedatasoort):
     De reclamatie is ingediend door de woningzoekende.
     """
 
-    toegekend = ReclamatiestatusReferentiedata(
+    toegekend = ReclamatiestatusReferentiedata.model_construct(
         code="TOE",
         naam="Toegekend",
     )
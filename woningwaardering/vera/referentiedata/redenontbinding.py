@@ -7,7 +7,7 @@ class RedenontbindingReferentiedata(Referentiedata):
 
 
 class Redenontbinding(Referentiedatasoort):
-    niet_betaald = RedenontbindingReferentiedata(
+    niet_betaald = RedenontbindingReferentiedata.model_construct(
         code="BET",
         naam="Niet betaald",
     )
@@ -15,7 +15,7 @@ class Redenontbinding(Referentiedatasoort):
     Het verschuldigde bedrag van de overeenkomst is niet voldaan.
     """
 
-    wanprestatie = RedenontbindingReferentiedata(
+    wanprestatie = RedenontbindingReferentiedata.model_construct(
         code="WAN",
         naam="Wanprestatie",
     )
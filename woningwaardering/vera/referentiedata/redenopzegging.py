@@ -7,7 +7,7 @@ class RedenopzeggingReferentiedata(Referentiedata):
 
 
 class Redenopzegging(Referentiedatasoort):
-    woning_geaccepteerd = RedenopzeggingReferentiedata(
+    woning_geaccepteerd = RedenopzeggingReferentiedata.model_construct(
         code="ACC",
         naam="Woning geaccepteerd",
     )
@@ -15,7 +15,7 @@ class Redenopzegging(Referentiedatasoort):
     De overeenkomst is opgezegd in verband met het accepteren van een (andere) woning.
     """
 
-    op_verzoek_corporatie = RedenopzeggingReferentiedata(
+    op_verzoek_corporatie = RedenopzeggingReferentiedata.model_construct(
         code="COR",
         naam="Op verzoek corporatie",
     )
@@ -23,7 +23,7 @@ class Redenopzegging(Referentiedatasoort):
     De overeenkomst is beeindigd door de woningcorporatie of vastgoedeigenaar.
     """
 
-    inschrijfkosten_niet_betaald = RedenopzeggingReferentiedata(
+    inschrijfkosten_niet_betaald = RedenopzeggingReferentiedata.model_construct(
         code="INB",
         naam="Inschrijfkosten niet betaald",
     )
@@ -31,7 +31,7 @@ class Redenopzegging(Referentiedatasoort):
     Inschrijfkosten niet betaald
     """
 
-    opzegging_woonconsument = RedenopzeggingReferentiedata(
+    opzegging_woonconsument = RedenopzeggingReferentiedata.model_construct(
         code="OPZ",
         naam="Opzegging woonconsument",
     )
@@ -40,7 +40,7 @@ class Redenopzegging(Referentiedatasoort):
     woonconsument.
     """
 
-    overleden = RedenopzeggingReferentiedata(
+    overleden = RedenopzeggingReferentiedata.model_construct(
         code="OVE",
         naam="Overleden",
     )
@@ -48,7 +48,7 @@ class Redenopzegging(Referentiedatasoort):
     De contractant is overleden.
     """
 
-    samengevoegd = RedenopzeggingReferentiedata(
+    samengevoegd = RedenopzeggingReferentiedata.model_construct(
         code="SAM",
         naam="Samengevoegd",
     )
@@ -57,7 +57,7 @@ class Redenopzegging(Referentiedatasoort):
     overeenkomst voor dezelfde contractant.
     """
 
-    niet_verlengd = RedenopzeggingReferentiedata(
+    niet_verlengd = RedenopzeggingReferentiedata.model_construct(
         code="VER",
         naam="Niet verlengd",
     )
@@ -7,7 +7,7 @@ class RedenvernietigingReferentiedata(Referentiedata):
 
 
 class Redenvernietiging(Referentiedatasoort):
-    bedreiging = RedenvernietigingReferentiedata(
+    bedreiging = RedenvernietigingReferentiedata.model_construct(
         code="DRE",
         naam="Bedreiging",
     )
@@ -15,7 +15,7 @@ class Redenvernietiging(Referentiedatasoort):
     De overeenkomst is nietig aangezien deze tot stand is gekomen onder bedreiging.
     """
 
-    bedrog = RedenvernietigingReferentiedata(
+    bedrog = RedenvernietigingReferentiedata.model_construct(
         code="DRO",
         naam="Bedrog",
     )
@@ -23,7 +23,7 @@ class Redenvernietiging(Referentiedatasoort):
     De overeenkomst is nietig aangezien deze tot stand is gekomen  door bedrog.
     """
 
-    dwaling = RedenvernietigingReferentiedata(
+    dwaling = RedenvernietigingReferentiedata.model_construct(
         code="DWA",
         naam="Dwaling",
     )
@@ -32,7 +32,7 @@ class Redenvernietiging(Referentiedatasoort):
     dwaling.
     """
 
-    misbruik = RedenvernietigingReferentiedata(
+    misbruik = RedenvernietigingReferentiedata.model_construct(
         code="MIS",
         naam="Misbruik",
     )
@@ -7,7 +7,7 @@ class RegiesoortReferentiedata(Referentiedata):
 
 
 class Regiesoort(Referentiedatasoort):
-    bouwteam = RegiesoortReferentiedata(
+    bouwteam = RegiesoortReferentiedata.model_construct(
         code="BOU",
         naam="Bouwteam",
     )
@@ -21,7 +21,7 @@ class Regiesoort(Referentiedatasoort):
     een realisatiefase.
     """
 
-    traditioneel = RegiesoortReferentiedata(
+    traditioneel = RegiesoortReferentiedata.model_construct(
         code="TRA",
         naam="Traditioneel",
     )
@@ -33,7 +33,7 @@ class Regiesoort(Referentiedatasoort):
     https://www.igg.nl/diensten/bouworganisatievormen/)
     """
 
-    turnkey = RegiesoortReferentiedata(
+    turnkey = RegiesoortReferentiedata.model_construct(
         code="TUR",
         naam="Turnkey",
     )
@@ -7,17 +7,17 @@ class RelatieadressoortReferentiedata(Referentiedata):
 
 
 class Relatieadressoort(Referentiedatasoort):
-    bezoekadres = RelatieadressoortReferentiedata(
+    bezoekadres = RelatieadressoortReferentiedata.model_construct(
         code="BEZ",
         naam="Bezoekadres",
     )
 
-    factuuradres = RelatieadressoortReferentiedata(
+    factuuradres = RelatieadressoortReferentiedata.model_construct(
         code="FAC",
         naam="Factuuradres",
     )
 
-    leveringsadres = RelatieadressoortReferentiedata(
+    leveringsadres = RelatieadressoortReferentiedata.model_construct(
         code="LEV",
         naam="Leveringsadres",
     )
@@ -25,12 +25,12 @@ class Relatieadressoort(Referentiedatasoort):
     Het adres waar eventuele goederen afgeleverd of bezorgd dienen te worden.
     """
 
-    postadres = RelatieadressoortReferentiedata(
+    postadres = RelatieadressoortReferentiedata.model_construct(
         code="POS",
         naam="Postadres",
     )
 
-    woonadres = RelatieadressoortReferentiedata(
+    woonadres = RelatieadressoortReferentiedata.model_construct(
         code="WOO",
         naam="Woonadres",
     )
@@ -10,7 +10,7 @@ class RelatiedetailsoortReferentiedata(Referentiedata):
 
 
 class Relatiedetailsoort(Referentiedatasoort):
-    huishouden = RelatiedetailsoortReferentiedata(
+    huishouden = RelatiedetailsoortReferentiedata.model_construct(
         code="HUI",
         naam="Huishouden",
         parent=Relatiesoort.relatiegroep,
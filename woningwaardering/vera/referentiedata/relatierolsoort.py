@@ -7,7 +7,7 @@ class RelatierolsoortReferentiedata(Referentiedata):
 
 
 class Relatierolsoort(Referentiedatasoort):
-    aankopende_makelaar = RelatierolsoortReferentiedata(
+    aankopende_makelaar = RelatierolsoortReferentiedata.model_construct(
         code="AMA",
         naam="Aankopende makelaar",
     )
@@ -15,7 +15,7 @@ class Relatierolsoort(Referentiedatasoort):
     Makelaar die namens de aankopende partij optreedt
     """
 
-    ambulante_begeleider = RelatierolsoortReferentiedata(
+    ambulante_begeleider = RelatierolsoortReferentiedata.model_construct(
         code="AMB",
         naam="Ambulante begeleider",
     )
@@ -24,7 +24,7 @@ class Relatierolsoort(Referentiedatasoort):
     veel mogelijk zelfstandig te functioneren.
     """
 
-    assetmanager = RelatierolsoortReferentiedata(
+    assetmanager = RelatierolsoortReferentiedata.model_construct(
         code="ASS",
         naam="Assetmanager",
     )
@@ -32,7 +32,7 @@ class Relatierolsoort(Referentiedatasoort):
     De assetmanager voor het betreffende vastgoed
     """
 
-    behandelaar = RelatierolsoortReferentiedata(
+    behandelaar = RelatierolsoortReferentiedata.model_construct(
         code="BED",
         naam="Behandelaar",
     )
@@ -41,7 +41,7 @@ class Relatierolsoort(Referentiedatasoort):
     medewerker van de corporatie maar kan ook een externe behandelaar zijn
     """
 
-    beheerder = RelatierolsoortReferentiedata(
+    beheerder = RelatierolsoortReferentiedata.model_construct(
         code="BEH",
         naam="Beheerder",
     )
@@ -49,7 +49,7 @@ class Relatierolsoort(Referentiedatasoort):
     De beheerder van een eenheid of cluster
     """
 
-    betaler = RelatierolsoortReferentiedata(
+    betaler = RelatierolsoortReferentiedata.model_construct(
         code="BET",
         naam="Betaler",
     )
@@ -60,7 +60,7 @@ class Relatierolsoort(Referentiedatasoort):
     betaalt).
     """
 
-    bewoner = RelatierolsoortReferentiedata(
+    bewoner = RelatierolsoortReferentiedata.model_construct(
         code="BEW",
         naam="Bewoner",
     )
@@ -70,7 +70,7 @@ class Relatierolsoort(Referentiedatasoort):
     Gebruiker.
     """
 
-    bestuurslid = RelatierolsoortReferentiedata(
+    bestuurslid = RelatierolsoortReferentiedata.model_construct(
         code="BSL",
         naam="Bestuurslid",
     )
@@ -81,7 +81,7 @@ class Relatierolsoort(Referentiedatasoort):
     afzonderlijke relatierolsoorten beschikbaar
     """
 
-    budgetcoach = RelatierolsoortReferentiedata(
+    budgetcoach = RelatierolsoortReferentiedata.model_construct(
         code="BUD",
         naam="Budgetcoach",
     )
@@ -92,7 +92,7 @@ class Relatierolsoort(Referentiedatasoort):
     voor de vaste lasten worden uitgevoerd door budgetcoach.
     """
 
-    bewindvoerder = RelatierolsoortReferentiedata(
+    bewindvoerder = RelatierolsoortReferentiedata.model_construct(
         code="BWI",
         naam="Bewindvoerder",
     )
@@ -103,7 +103,7 @@ class Relatierolsoort(Referentiedatasoort):
     (namens een huurder betaalt, maar vanaf een eigen bankrekening)
     """
 
-    wooncooperatie_lid = RelatierolsoortReferentiedata(
+    wooncooperatie_lid = RelatierolsoortReferentiedata.model_construct(
         code="COL",
         naam="Wooncoöperatie-lid",
     )
@@ -113,7 +113,7 @@ class Relatierolsoort(Referentiedatasoort):
     beschikbaar zijn: Bestuurslid, Voorzitter, Penningmeester, Secretaris.
     """
 
-    wooncooperatie = RelatierolsoortReferentiedata(
+    wooncooperatie = RelatierolsoortReferentiedata.model_construct(
         code="COO",
         naam="Wooncoöperatie",
     )
@@ -129,7 +129,7 @@ class Relatierolsoort(Referentiedatasoort):
     met de relatierolsoort Wooncoöperatie-lid
     """
 
-    contactpersoon = RelatierolsoortReferentiedata(
+    contactpersoon = RelatierolsoortReferentiedata.model_construct(
         code="CPE",
         naam="Contactpersoon",
     )
@@ -138,7 +138,7 @@ class Relatierolsoort(Referentiedatasoort):
     clusters vertegenwoordigt
     """
 
-    deurwaarder = RelatierolsoortReferentiedata(
+    deurwaarder = RelatierolsoortReferentiedata.model_construct(
         code="DEU",
         naam="Deurwaarder",
     )
@@ -147,7 +147,7 @@ class Relatierolsoort(Referentiedatasoort):
     huurschuld en wordt extern geincasseerd door deurwaarder Karelse)
     """
 
-    eigenaar = RelatierolsoortReferentiedata(
+    eigenaar = RelatierolsoortReferentiedata.model_construct(
         code="EIG",
         naam="Eigenaar",
     )
@@ -159,7 +159,7 @@ class Relatierolsoort(Referentiedatasoort):
     heeft de eigenaar tevens de rol van verkoper.
     """
 
-    erfpachter = RelatierolsoortReferentiedata(
+    erfpachter = RelatierolsoortReferentiedata.model_construct(
         code="ERF",
         naam="Erfpachter",
     )
@@ -170,7 +170,7 @@ class Relatierolsoort(Referentiedatasoort):
     (CORA)
     """
 
-    fiatteur = RelatierolsoortReferentiedata(
+    fiatteur = RelatierolsoortReferentiedata.model_construct(
         code="FIA",
         naam="Fiatteur",
     )
@@ -179,7 +179,7 @@ class Relatierolsoort(Referentiedatasoort):
     activiteit
     """
 
-    garantiegever = RelatierolsoortReferentiedata(
+    garantiegever = RelatierolsoortReferentiedata.model_construct(
         code="GAR",
         naam="Garantiegever",
     )
@@ -187,7 +187,7 @@ class Relatierolsoort(Referentiedatasoort):
     De garantiegever bij een lening
     """
 
-    gebruiker = RelatierolsoortReferentiedata(
+    gebruiker = RelatierolsoortReferentiedata.model_construct(
         code="GEB",
         naam="Gebruiker",
     )
@@ -197,7 +197,7 @@ class Relatierolsoort(Referentiedatasoort):
     dan ook ook Huurder worden gebruikt. Zie ook Bewoner.
     """
 
-    geldnemer = RelatierolsoortReferentiedata(
+    geldnemer = RelatierolsoortReferentiedata.model_construct(
         code="GEL",
         naam="Geldnemer",
     )
@@ -205,7 +205,7 @@ class Relatierolsoort(Referentiedatasoort):
     De geldnemer van de lening
     """
 
-    huismeester = RelatierolsoortReferentiedata(
+    huismeester = RelatierolsoortReferentiedata.model_construct(
         code="HME",
         naam="Huismeester",
     )
@@ -213,7 +213,7 @@ class Relatierolsoort(Referentiedatasoort):
     De huismeester voor het betreffende vastgoed
     """
 
-    huurder = RelatierolsoortReferentiedata(
+    huurder = RelatierolsoortReferentiedata.model_construct(
         code="HUU",
         naam="Huurder",
     )
@@ -224,7 +224,7 @@ class Relatierolsoort(Referentiedatasoort):
     huurder een netto huur betaald (CORA). Synoniem aan het begrip Hoofdhuurder
     """
 
-    inspecteur = RelatierolsoortReferentiedata(
+    inspecteur = RelatierolsoortReferentiedata.model_construct(
         code="INS",
         naam="Inspecteur",
     )
@@ -232,7 +232,7 @@ class Relatierolsoort(Referentiedatasoort):
     Medewerker die de inspectie uitvoert
     """
 
-    koper = RelatierolsoortReferentiedata(
+    koper = RelatierolsoortReferentiedata.model_construct(
         code="KOP",
         naam="Koper",
     )
@@ -246,7 +246,7 @@ class Relatierolsoort(Referentiedatasoort):
     moment van verkoop
     """
 
-    leverancier = RelatierolsoortReferentiedata(
+    leverancier = RelatierolsoortReferentiedata.model_construct(
         code="LEV",
         naam="Leverancier",
     )
@@ -255,7 +255,7 @@ class Relatierolsoort(Referentiedatasoort):
     leveren of heeft geleverd aan de woningcorporatie (CORA)
     """
 
-    medebewoner = RelatierolsoortReferentiedata(
+    medebewoner = RelatierolsoortReferentiedata.model_construct(
         code="MBW",
         naam="Medebewoner",
     )
@@ -264,7 +264,7 @@ class Relatierolsoort(Referentiedatasoort):
     (willen) vormen.
     """
 
-    medehuurder = RelatierolsoortReferentiedata(
+    medehuurder = RelatierolsoortReferentiedata.model_construct(
         code="MDH",
         naam="Medehuurder",
     )
@@ -272,7 +272,7 @@ class Relatierolsoort(Referentiedatasoort):
     Op de huurovereenkomst vermelde medehuurder
     """
 
-    medewerker = RelatierolsoortReferentiedata(
+    medewerker = RelatierolsoortReferentiedata.model_construct(
         code="MDW",
         naam="Medewerker",
     )
@@ -280,7 +280,7 @@ class Relatierolsoort(Referentiedatasoort):
     Werknemers ingehuurd of in vaste dienst van een woningcorporatie (CORA)
     """
 
-    mede_aanvrager = RelatierolsoortReferentiedata(
+    mede_aanvrager = RelatierolsoortReferentiedata.model_construct(
         code="MED",
         naam="Mede aanvrager",
     )
@@ -289,7 +289,7 @@ class Relatierolsoort(Referentiedatasoort):
     woning (of ander vastgoed)zoekt.
     """
 
-    melder = RelatierolsoortReferentiedata(
+    melder = RelatierolsoortReferentiedata.model_construct(
         code="MEL",
         naam="Melder",
     )
@@ -297,7 +297,7 @@ class Relatierolsoort(Referentiedatasoort):
     De melder van een verzoek of incident. Vaak de initiator van een (werk-)proces.
     """
 
-    notaris = RelatierolsoortReferentiedata(
+    notaris = RelatierolsoortReferentiedata.model_construct(
         code="NOT",
         naam="Notaris",
     )
@@ -305,7 +305,7 @@ class Relatierolsoort(Referentiedatasoort):
     Notaris die een koop-/verkooptransactie formeel bekrachtigt
     """
 
-    opdrachtgever = RelatierolsoortReferentiedata(
+    opdrachtgever = RelatierolsoortReferentiedata.model_construct(
         code="OPD",
         naam="Opdrachtgever",
     )
@@ -313,7 +313,7 @@ class Relatierolsoort(Referentiedatasoort):
     Opdrachtgevende partij
     """
 
-    opdrachtnemer = RelatierolsoortReferentiedata(
+    opdrachtnemer = RelatierolsoortReferentiedata.model_construct(
         code="OPN",
         naam="Opdrachtnemer",
     )
@@ -321,7 +321,7 @@ class Relatierolsoort(Referentiedatasoort):
     Opdrachtnemende partij
     """
 
-    opzichter = RelatierolsoortReferentiedata(
+    opzichter = RelatierolsoortReferentiedata.model_construct(
         code="OPZ",
         naam="Opzichter",
     )
@@ -329,12 +329,12 @@ class Relatierolsoort(Referentiedatasoort):
     De opzichter voor het betreffende vastgoed
     """
 
-    onderwijsinstelling = RelatierolsoortReferentiedata(
+    onderwijsinstelling = RelatierolsoortReferentiedata.model_construct(
         code="OWI",
         naam="Onderwijsinstelling",
     )
 
-    penningmeester = RelatierolsoortReferentiedata(
+    penningmeester = RelatierolsoortReferentiedata.model_construct(
         code="PEN",
         naam="Penningmeester",
     )
@@ -343,7 +343,7 @@ class Relatierolsoort(Referentiedatasoort):
     bewonersvereniging, en daarin de rol van Penningmeester heeft
     """
 
-    prospect = RelatierolsoortReferentiedata(
+    prospect = RelatierolsoortReferentiedata.model_construct(
         code="PRO",
         naam="Prospect",
     )
@@ -353,7 +353,7 @@ class Relatierolsoort(Referentiedatasoort):
     te zijn.
     """
 
-    secretaris = RelatierolsoortReferentiedata(
+    secretaris = RelatierolsoortReferentiedata.model_construct(
         code="SEC",
         naam="Secretaris",
     )
@@ -362,7 +362,7 @@ class Relatierolsoort(Referentiedatasoort):
     bewonersvereniging, en daarin de rol van Secretaris heeft
     """
 
-    verkoper = RelatierolsoortReferentiedata(
+    verkoper = RelatierolsoortReferentiedata.model_construct(
         code="VER",
         naam="Verkoper",
     )
@@ -370,7 +370,7 @@ class Relatierolsoort(Referentiedatasoort):
     Verkopende partij
     """
 
-    verkopende_makelaar = RelatierolsoortReferentiedata(
+    verkopende_makelaar = RelatierolsoortReferentiedata.model_construct(
         code="VMA",
         naam="Verkopende makelaar",
     )
@@ -378,7 +378,7 @@ class Relatierolsoort(Referentiedatasoort):
     Makelaar die namens de verkopende partij optreedt
     """
 
-    voorzitter = RelatierolsoortReferentiedata(
+    voorzitter = RelatierolsoortReferentiedata.model_construct(
         code="VOO",
         naam="Voorzitter",
     )
@@ -387,7 +387,7 @@ class Relatierolsoort(Referentiedatasoort):
     bewonersvereniging, en daarin de rol van Voorzitter heeft
     """
 
-    vereniging_van_eigenaren = RelatierolsoortReferentiedata(
+    vereniging_van_eigenaren = RelatierolsoortReferentiedata.model_construct(
         code="VVE",
         naam="Vereniging van Eigenaren",
     )
@@ -400,7 +400,7 @@ class Relatierolsoort(Referentiedatasoort):
     VvE-lid
     """
 
-    vve_lid = RelatierolsoortReferentiedata(
+    vve_lid = RelatierolsoortReferentiedata.model_construct(
         code="VVL",
         naam="VvE-lid",
     )
@@ -412,7 +412,7 @@ class Relatierolsoort(Referentiedatasoort):
     Bestuurslid, Voorzitter, Penningmeester, Secretaris.
     """
 
-    woningzoekende = RelatierolsoortReferentiedata(
+    woningzoekende = RelatierolsoortReferentiedata.model_construct(
         code="WON",
         naam="Woningzoekende",
     )
@@ -424,7 +424,7 @@ class Relatierolsoort(Referentiedatasoort):
     de inschrijving, is sprake van een klantrelatie. Synoniem aan Hoofdaanvrager
     """
 
-    woonconsulent = RelatierolsoortReferentiedata(
+    woonconsulent = RelatierolsoortReferentiedata.model_construct(
         code="WOO",
         naam="Woonconsulent",
     )
@@ -432,7 +432,7 @@ class Relatierolsoort(Referentiedatasoort):
     De woonconsulent voor het betreffende vastgoed
     """
 
-    zekerheidsnemer = RelatierolsoortReferentiedata(
+    zekerheidsnemer = RelatierolsoortReferentiedata.model_construct(
         code="ZEK",
         naam="Zekerheidsnemer",
     )
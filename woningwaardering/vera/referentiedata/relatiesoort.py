@@ -7,7 +7,7 @@ class RelatiesoortReferentiedata(Referentiedata):
 
 
 class Relatiesoort(Referentiedatasoort):
-    relatiegroep = RelatiesoortReferentiedata(
+    relatiegroep = RelatiesoortReferentiedata.model_construct(
         code="GRO",
         naam="Relatiegroep",
     )
@@ -15,7 +15,7 @@ class Relatiesoort(Referentiedatasoort):
     Een verzameling relaties (bijvoorbeeld een huishouden)
     """
 
-    natuurlijke_persoon = RelatiesoortReferentiedata(
+    natuurlijke_persoon = RelatiesoortReferentiedata.model_construct(
         code="NAT",
         naam="Natuurlijke persoon",
     )
@@ -24,7 +24,7 @@ class Relatiesoort(Referentiedatasoort):
     plichten heeft.
     """
 
-    rechtspersoon = RelatiesoortReferentiedata(
+    rechtspersoon = RelatiesoortReferentiedata.model_construct(
         code="REC",
         naam="Rechtspersoon",
     )
@@ -7,7 +7,7 @@ class RelatiestatusReferentiedata(Referentiedata):
 
 
 class Relatiestatus(Referentiedatasoort):
-    actief = RelatiestatusReferentiedata(
+    actief = RelatiestatusReferentiedata.model_construct(
         code="ACT",
         naam="Actief",
     )
@@ -15,7 +15,7 @@ class Relatiestatus(Referentiedatasoort):
     De relatie is een actieve relatie
     """
 
-    inactief = RelatiestatusReferentiedata(
+    inactief = RelatiestatusReferentiedata.model_construct(
         code="INA",
         naam="Inactief",
     )
@@ -23,7 +23,7 @@ class Relatiestatus(Referentiedatasoort):
     De relatie is niet (meer) actief
     """
 
-    slapend = RelatiestatusReferentiedata(
+    slapend = RelatiestatusReferentiedata.model_construct(
         code="SLA",
         naam="Slapend",
     )
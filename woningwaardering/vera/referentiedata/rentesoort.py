@@ -7,12 +7,12 @@ class RentesoortReferentiedata(Referentiedata):
 
 
 class Rentesoort(Referentiedatasoort):
-    variabel = RentesoortReferentiedata(
+    variabel = RentesoortReferentiedata.model_construct(
         code="VAR",
         naam="Variabel",
     )
 
-    vast = RentesoortReferentiedata(
+    vast = RentesoortReferentiedata.model_construct(
         code="VST",
         naam="Vast",
     )
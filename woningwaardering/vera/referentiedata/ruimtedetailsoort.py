@@ -10,7 +10,7 @@ class RuimtedetailsoortReferentiedata(Referentiedata):
 
 
 class Ruimtedetailsoort(Referentiedatasoort):
-    atrium_en_of_patio = RuimtedetailsoortReferentiedata(
+    atrium_en_of_patio = RuimtedetailsoortReferentiedata.model_construct(
         code="ATR",
         naam="Atrium / Patio",
         parent=Ruimtesoort.buitenruimte,
@@ -19,7 +19,7 @@ class Ruimtedetailsoort(Referentiedatasoort):
     Niet overdekt atrium of patio
     """
 
-    achtertuin = RuimtedetailsoortReferentiedata(
+    achtertuin = RuimtedetailsoortReferentiedata.model_construct(
         code="ATU",
         naam="Achtertuin",
         parent=Ruimtesoort.buitenruimte,
@@ -29,7 +29,7 @@ class Ruimtedetailsoort(Referentiedatasoort):
     gebruikt worden voor de woningwaardering indien deze duiding van tuin bekend is.
     """
 
-    badkamer = RuimtedetailsoortReferentiedata(
+    badkamer = RuimtedetailsoortReferentiedata.model_construct(
         code="BAD",
         naam="Badkamer",
         parent=Ruimtesoort.vertrek,
@@ -48,7 +48,7 @@ class Ruimtedetailsoort(Referentiedatasoort):
     wordt gezien.
     """
 
-    balkon = RuimtedetailsoortReferentiedata(
+    balkon = RuimtedetailsoortReferentiedata.model_construct(
         code="BAL",
         naam="Balkon",
         parent=Ruimtesoort.buitenruimte,
@@ -57,7 +57,7 @@ class Ruimtedetailsoort(Referentiedatasoort):
     Een balkon.
     """
 
-    badkamer_met_toilet = RuimtedetailsoortReferentiedata(
+    badkamer_met_toilet = RuimtedetailsoortReferentiedata.model_construct(
         code="BAT",
         naam="Badkamer met toilet",
         parent=Ruimtesoort.vertrek,
@@ -66,7 +66,7 @@ class Ruimtedetailsoort(Referentiedatasoort):
     Gecombineerde badkamer/toilet
     """
 
-    berging = RuimtedetailsoortReferentiedata(
+    berging = RuimtedetailsoortReferentiedata.model_construct(
         code="BER",
         naam="Berging",
         parent=Ruimtesoort.overige_ruimten,
@@ -75,7 +75,7 @@ class Ruimtedetailsoort(Referentiedatasoort):
     Berging voor eigen gebruik, overige ruimte
     """
 
-    bijkeuken = RuimtedetailsoortReferentiedata(
+    bijkeuken = RuimtedetailsoortReferentiedata.model_construct(
         code="BIJ",
         naam="Bijkeuken",
         parent=Ruimtesoort.overige_ruimten,
@@ -86,7 +86,7 @@ class Ruimtedetailsoort(Referentiedatasoort):
     maar ook voor het opbergen en bewaren van (etens)voorraden en schoonmaakspullen.
     """
 
-    dakterras = RuimtedetailsoortReferentiedata(
+    dakterras = RuimtedetailsoortReferentiedata.model_construct(
         code="DAK",
         naam="Dakterras",
         parent=Ruimtesoort.buitenruimte,
@@ -95,7 +95,7 @@ class Ruimtedetailsoort(Referentiedatasoort):
     Een dakterras.
     """
 
-    gemeenschappelijk_dakterras = RuimtedetailsoortReferentiedata(
+    gemeenschappelijk_dakterras = RuimtedetailsoortReferentiedata.model_construct(
         code="GAK",
         naam="Gemeenschappelijk dakterras",
         parent=Ruimtesoort.buitenruimte,
@@ -104,7 +104,7 @@ class Ruimtedetailsoort(Referentiedatasoort):
     Buitenruimte: een gemeenschappelijk dakterras
     """
 
-    doucheruimte = RuimtedetailsoortReferentiedata(
+    doucheruimte = RuimtedetailsoortReferentiedata.model_construct(
         code="DOU",
         naam="Doucheruimte",
         parent=Ruimtesoort.vertrek,
@@ -113,7 +113,7 @@ class Ruimtedetailsoort(Referentiedatasoort):
     Vertrek: sanitaire ruimte met een douche.
     """
 
-    gang = RuimtedetailsoortReferentiedata(
+    gang = RuimtedetailsoortReferentiedata.model_construct(
         code="GAN",
         naam="Gang",
         parent=Ruimtesoort.verkeersruimte,
@@ -125,7 +125,7 @@ class Ruimtedetailsoort(Referentiedatasoort):
     """
 
     gemeenschappelijke_parkeerruimte_niet_specifieke_plek = (
-        RuimtedetailsoortReferentiedata(
+        RuimtedetailsoortReferentiedata.model_construct(
             code="GPN",
             naam="Gemeenschappelijke parkeerruimte niet specifieke plek",
             parent=Ruimtesoort.buitenruimte,
@@ -136,23 +136,25 @@ class Ruimtedetailsoort(Referentiedatasoort):
     zonder privé plek. Al dan niet evenveel parkeerplekken als eenheden.
     """
 
-    gemeenschappelijke_parkeerruimte_specifieke_plek = RuimtedetailsoortReferentiedata(
-        code="GPS",
-        naam="Gemeenschappelijke parkeerruimte specifieke plek",
-        parent=Ruimtesoort.buitenruimte,
+    gemeenschappelijke_parkeerruimte_specifieke_plek = (
+        RuimtedetailsoortReferentiedata.model_construct(
+            code="GPS",
+            naam="Gemeenschappelijke parkeerruimte specifieke plek",
+            parent=Ruimtesoort.buitenruimte,
+        )
     )
     """
     Buitenruimte: een afsluitbare gemeenschappelijke parkeerruimte, zonder dak, met
     privé plek.
     """
 
-    gemeenschappelijke_tuin = RuimtedetailsoortReferentiedata(
+    gemeenschappelijke_tuin = RuimtedetailsoortReferentiedata.model_construct(
         code="GTU",
         naam="Gemeenschappelijke tuin",
         parent=Ruimtesoort.gemeenschappelijke_ruimten_en_voorzieningen,
     )
 
-    hal = RuimtedetailsoortReferentiedata(
+    hal = RuimtedetailsoortReferentiedata.model_construct(
         code="HAL",
         naam="Hal",
         parent=Ruimtesoort.verkeersruimte,
@@ -161,7 +163,7 @@ class Ruimtedetailsoort(Referentiedatasoort):
     Verkeersruimte bijv. entree, Hal, overloop, speelhal etc.
     """
 
-    kelder = RuimtedetailsoortReferentiedata(
+    kelder = RuimtedetailsoortReferentiedata.model_construct(
         code="KEL",
         naam="Kelder",
         parent=Ruimtesoort.overige_ruimten,
@@ -171,7 +173,7 @@ class Ruimtedetailsoort(Referentiedatasoort):
     is gelegen.
     """
 
-    keuken = RuimtedetailsoortReferentiedata(
+    keuken = RuimtedetailsoortReferentiedata.model_construct(
         code="KEU",
         naam="Keuken",
         parent=Ruimtesoort.vertrek,
@@ -180,7 +182,7 @@ class Ruimtedetailsoort(Referentiedatasoort):
     Vertrek of plaats in een gebouw waarin mensen hun voedsel bereiden of laten bereiden
     """
 
-    overige_ruimte = RuimtedetailsoortReferentiedata(
+    overige_ruimte = RuimtedetailsoortReferentiedata.model_construct(
         code="OBR",
         naam="Overige ruimte",
         parent=Ruimtesoort.buitenruimte,
@@ -190,20 +192,24 @@ class Ruimtedetailsoort(Referentiedatasoort):
     platje.
     """
 
-    overige_gemeenschappelijke_ruimte_of_voorziening = RuimtedetailsoortReferentiedata(
-        code="OGR",
-        naam="Overige gemeenschappelijke ruimte of voorziening",
-        parent=Ruimtesoort.gemeenschappelijke_ruimten_en_voorzieningen,
+    overige_gemeenschappelijke_ruimte_of_voorziening = (
+        RuimtedetailsoortReferentiedata.model_construct(
+            code="OGR",
+            naam="Overige gemeenschappelijke ruimte of voorziening",
+            parent=Ruimtesoort.gemeenschappelijke_ruimten_en_voorzieningen,
+        )
     )
     """
     Gemeenschappelijke ruimte of voorziening die niet nader is gespecifeerd als
     ruimtedetailsoort. Bijvoorbeeld gemeenschappelijke hobbyruimte, wasruimte.
     """
 
-    open_parkeergarage_niet_specifieke_plek = RuimtedetailsoortReferentiedata(
-        code="OPN",
-        naam="Open parkeergarage niet specifieke plek",
-        parent=Ruimtesoort.buitenruimte,
+    open_parkeergarage_niet_specifieke_plek = (
+        RuimtedetailsoortReferentiedata.model_construct(
+            code="OPN",
+            naam="Open parkeergarage niet specifieke plek",
+            parent=Ruimtesoort.buitenruimte,
+        )
     )
     """
     Buitenruimte: een tot het complex behorende open parkeergarage (een open ruimte, dus
@@ -211,10 +217,12 @@ class Ruimtedetailsoort(Referentiedatasoort):
     zonder een specifiek toegewezen parkeerplaats.
     """
 
-    open_parkeergarage_specifieke_plek = RuimtedetailsoortReferentiedata(
-        code="OPS",
-        naam="Open parkeergarage specifieke plek",
-        parent=Ruimtesoort.buitenruimte,
+    open_parkeergarage_specifieke_plek = (
+        RuimtedetailsoortReferentiedata.model_construct(
+            code="OPS",
+            naam="Open parkeergarage specifieke plek",
+            parent=Ruimtesoort.buitenruimte,
+        )
     )
     """
     Buitenruimte: een tot het complex behorende open parkeergarage (een open ruimte, dus
@@ -222,7 +230,7 @@ class Ruimtedetailsoort(Referentiedatasoort):
     voor elke woning een specifiek toegewezen parkeerplaats.
     """
 
-    overig_vertrek = RuimtedetailsoortReferentiedata(
+    overig_vertrek = RuimtedetailsoortReferentiedata.model_construct(
         code="OVT",
         naam="Overig vertrek",
         parent=Ruimtesoort.vertrek,
@@ -232,7 +240,7 @@ class Ruimtedetailsoort(Referentiedatasoort):
     hobbykamer, studeerkamer etc.
     """
 
-    parkeerplaats = RuimtedetailsoortReferentiedata(
+    parkeerplaats = RuimtedetailsoortReferentiedata.model_construct(
         code="PAR",
         naam="Parkeerplaats",
         parent=Ruimtesoort.buitenruimte,
@@ -241,10 +249,12 @@ class Ruimtedetailsoort(Referentiedatasoort):
     Eigen parkeerplaats of oprit bij de woning
     """
 
-    parkeergarage_niet_specifieke_plek = RuimtedetailsoortReferentiedata(
-        code="PNS",
-        naam="Parkeergarage niet specifieke plek",
-        parent=Ruimtesoort.overige_ruimten,
+    parkeergarage_niet_specifieke_plek = (
+        RuimtedetailsoortReferentiedata.model_construct(
+            code="PNS",
+            naam="Parkeergarage niet specifieke plek",
+            parent=Ruimtesoort.overige_ruimten,
+        )
     )
     """
     Overige ruimte: een gesloten parkeergarage met voor elke woning een, al dan niet
@@ -252,7 +262,7 @@ class Ruimtedetailsoort(Referentiedatasoort):
     dag kunnen parkeren).
     """
 
-    parkeergarage_specifieke_plek = RuimtedetailsoortReferentiedata(
+    parkeergarage_specifieke_plek = RuimtedetailsoortReferentiedata.model_construct(
         code="PSP",
         naam="Parkeergarage specifieke plek",
         parent=Ruimtesoort.overige_ruimten,
@@ -263,7 +273,7 @@ class Ruimtedetailsoort(Referentiedatasoort):
     parkeerplaats.
     """
 
-    recreatieruimte = RuimtedetailsoortReferentiedata(
+    recreatieruimte = RuimtedetailsoortReferentiedata.model_construct(
         code="REC",
         naam="Recreatieruimte",
         parent=Ruimtesoort.gemeenschappelijke_ruimten_en_voorzieningen,
@@ -273,7 +283,7 @@ class Ruimtedetailsoort(Referentiedatasoort):
     binnen een zorginstelling.
     """
 
-    tuin_rondom = RuimtedetailsoortReferentiedata(
+    tuin_rondom = RuimtedetailsoortReferentiedata.model_construct(
         code="RON",
         naam="Tuin Rondom",
         parent=Ruimtesoort.buitenruimte,
@@ -283,7 +293,7 @@ class Ruimtedetailsoort(Referentiedatasoort):
     de woningwaardering indien deze duiding van tuin bekend is.
     """
 
-    schuur = RuimtedetailsoortReferentiedata(
+    schuur = RuimtedetailsoortReferentiedata.model_construct(
         code="SCH",
         naam="Schuur",
         parent=Ruimtesoort.overige_ruimten,
@@ -294,7 +304,7 @@ class Ruimtedetailsoort(Referentiedatasoort):
     is.
     """
 
-    serre = RuimtedetailsoortReferentiedata(
+    serre = RuimtedetailsoortReferentiedata.model_construct(
         code="SER",
         naam="Serre",
         parent=Ruimtesoort.vertrek,
@@ -303,7 +313,7 @@ class Ruimtedetailsoort(Referentiedatasoort):
     Vertrek: glazen veranda verbonden aan een woning.
     """
 
-    slaapkamer = RuimtedetailsoortReferentiedata(
+    slaapkamer = RuimtedetailsoortReferentiedata.model_construct(
         code="SLA",
         naam="Slaapkamer",
         parent=Ruimtesoort.vertrek,
@@ -312,7 +322,7 @@ class Ruimtedetailsoort(Referentiedatasoort):
     Vertrek: ruimte in een woning waarin men kan slapen.
     """
 
-    terras = RuimtedetailsoortReferentiedata(
+    terras = RuimtedetailsoortReferentiedata.model_construct(
         code="TER",
         naam="Terras",
         parent=Ruimtesoort.buitenruimte,
@@ -322,7 +332,7 @@ class Ruimtedetailsoort(Referentiedatasoort):
     gebruikt om op te zitten, te eten, te drinken of andere activiteiten te doen.
     """
 
-    toiletruimte = RuimtedetailsoortReferentiedata(
+    toiletruimte = RuimtedetailsoortReferentiedata.model_construct(
         code="TOI",
         naam="Toiletruimte",
         parent=Ruimtesoort.overige_ruimten,
@@ -331,7 +341,7 @@ class Ruimtedetailsoort(Referentiedatasoort):
     Overige ruimte: Sanitaire ruimte met een toilet.
     """
 
-    tuin = RuimtedetailsoortReferentiedata(
+    tuin = RuimtedetailsoortReferentiedata.model_construct(
         code="TUI",
         naam="Tuin",
         parent=Ruimtesoort.buitenruimte,
@@ -341,7 +351,7 @@ class Ruimtedetailsoort(Referentiedatasoort):
     deze algemenere duiding van tuin gebruikt worden.
     """
 
-    tussenkamer = RuimtedetailsoortReferentiedata(
+    tussenkamer = RuimtedetailsoortReferentiedata.model_construct(
         code="TUS",
         naam="Tussenkamer",
         parent=Ruimtesoort.vertrek,
@@ -350,7 +360,7 @@ class Ruimtedetailsoort(Referentiedatasoort):
     Vertrek: ruimte gelegen tussen en verbonden met twee andere kamers.
     """
 
-    vliering = RuimtedetailsoortReferentiedata(
+    vliering = RuimtedetailsoortReferentiedata.model_construct(
         code="VLI",
         naam="Vliering",
         parent=Ruimtesoort.overige_ruimten,
@@ -361,7 +371,7 @@ class Ruimtedetailsoort(Referentiedatasoort):
     rechtop te kunnen staan.
     """
 
-    voortuin = RuimtedetailsoortReferentiedata(
+    voortuin = RuimtedetailsoortReferentiedata.model_construct(
         code="VTU",
         naam="Voortuin",
         parent=Ruimtesoort.buitenruimte,
@@ -372,7 +382,7 @@ class Ruimtedetailsoort(Referentiedatasoort):
     indien deze duiding van tuin bekend is.
     """
 
-    wasruimte = RuimtedetailsoortReferentiedata(
+    wasruimte = RuimtedetailsoortReferentiedata.model_construct(
         code="WAS",
         naam="Wasruimte",
         parent=Ruimtesoort.overige_ruimten,
@@ -382,7 +392,7 @@ class Ruimtedetailsoort(Referentiedatasoort):
     gebruik.
     """
 
-    woonkamer_en_of_keuken = RuimtedetailsoortReferentiedata(
+    woonkamer_en_of_keuken = RuimtedetailsoortReferentiedata.model_construct(
         code="WOK",
         naam="Woonkamer/keuken",
         parent=Ruimtesoort.vertrek,
@@ -391,7 +401,7 @@ class Ruimtedetailsoort(Referentiedatasoort):
     Vertrek: ruimte met een gecombineerde functie van keuken en woonkamer
     """
 
-    woonkamer = RuimtedetailsoortReferentiedata(
+    woonkamer = RuimtedetailsoortReferentiedata.model_construct(
         code="WOO",
         naam="Woonkamer",
         parent=Ruimtesoort.vertrek,
@@ -402,7 +412,7 @@ class Ruimtedetailsoort(Referentiedatasoort):
     zover het niet gaat om een appartement in een flat.
     """
 
-    woon_en_of_slaapkamer = RuimtedetailsoortReferentiedata(
+    woon_en_of_slaapkamer = RuimtedetailsoortReferentiedata.model_construct(
         code="WSL",
         naam="Woon-/slaapkamer",
         parent=Ruimtesoort.vertrek,
@@ -411,7 +421,7 @@ class Ruimtedetailsoort(Referentiedatasoort):
     Vertrek: ruimte met een gecombineerde functie van woonkamer en slaapkamer.
     """
 
-    zijtuin = RuimtedetailsoortReferentiedata(
+    zijtuin = RuimtedetailsoortReferentiedata.model_construct(
         code="ZIJ",
         naam="Zijtuin",
         parent=Ruimtesoort.buitenruimte,
@@ -421,7 +431,7 @@ class Ruimtedetailsoort(Referentiedatasoort):
     worden voor de woningwaardering indien deze duiding van tuin bekend is.
     """
 
-    loggia = RuimtedetailsoortReferentiedata(
+    loggia = RuimtedetailsoortReferentiedata.model_construct(
         code="LOG",
         naam="Loggia",
         parent=Ruimtesoort.buitenruimte,
@@ -430,7 +440,7 @@ class Ruimtedetailsoort(Referentiedatasoort):
     Buitenruimte: een inpandig balkon.
     """
 
-    zolder = RuimtedetailsoortReferentiedata(
+    zolder = RuimtedetailsoortReferentiedata.model_construct(
         code="ZOL",
         naam="Zolder",
         parent=Ruimtesoort.overige_ruimten,
@@ -446,7 +456,7 @@ class Ruimtedetailsoort(Referentiedatasoort):
     advertentietekst worden gemeld.
     """
 
-    overloop = RuimtedetailsoortReferentiedata(
+    overloop = RuimtedetailsoortReferentiedata.model_construct(
         code="OVL",
         naam="Overloop",
         parent=Ruimtesoort.verkeersruimte,
@@ -455,7 +465,7 @@ class Ruimtedetailsoort(Referentiedatasoort):
     Verkeersruimte: (UITBREIDING) Gang op een bovenverdieping.
     """
 
-    entree = RuimtedetailsoortReferentiedata(
+    entree = RuimtedetailsoortReferentiedata.model_construct(
         code="ENT",
         naam="Entree",
         parent=Ruimtesoort.verkeersruimte,
@@ -464,7 +474,7 @@ class Ruimtedetailsoort(Referentiedatasoort):
     Verkeersruimte: (UITBREIDING) Ingang van een gebouw.
     """
 
-    kast = RuimtedetailsoortReferentiedata(
+    kast = RuimtedetailsoortReferentiedata.model_construct(
         code="KAS",
         naam="Kast",
         parent=Ruimtesoort.overige_ruimten,
@@ -473,7 +483,7 @@ class Ruimtedetailsoort(Referentiedatasoort):
     Overige ruimte: (UITBREIDING)
     """
 
-    trappenhuis = RuimtedetailsoortReferentiedata(
+    trappenhuis = RuimtedetailsoortReferentiedata.model_construct(
         code="TRH",
         naam="Trappenhuis",
         parent=Ruimtesoort.verkeersruimte,
@@ -482,7 +492,7 @@ class Ruimtedetailsoort(Referentiedatasoort):
     Verkeersruimte: (UITBREIDING) Verkeersruimte waarin een trap ligt
     """
 
-    carport = RuimtedetailsoortReferentiedata(
+    carport = RuimtedetailsoortReferentiedata.model_construct(
         code="CAR",
         naam="Carport",
         parent=Ruimtesoort.parkeergelegenheid,
@@ -495,7 +505,7 @@ class Ruimtedetailsoort(Referentiedatasoort):
     die in de plint (begane grond) van een appartementencomplex.
     """
 
-    garage_inpandig = RuimtedetailsoortReferentiedata(
+    garage_inpandig = RuimtedetailsoortReferentiedata.model_construct(
         code="GAI",
         naam="Garage inpandig",
         parent=Ruimtesoort.parkeergelegenheid,
@@ -508,7 +518,7 @@ class Ruimtedetailsoort(Referentiedatasoort):
     opent.
     """
 
-    garage_uitpandig = RuimtedetailsoortReferentiedata(
+    garage_uitpandig = RuimtedetailsoortReferentiedata.model_construct(
         code="GAU",
         naam="Garage uitpandig",
         parent=Ruimtesoort.parkeergelegenheid,
@@ -522,7 +532,7 @@ class Ruimtedetailsoort(Referentiedatasoort):
     opent.
     """
 
-    garagebox = RuimtedetailsoortReferentiedata(
+    garagebox = RuimtedetailsoortReferentiedata.model_construct(
         code="GAR",
         naam="Garagebox",
         parent=Ruimtesoort.parkeergelegenheid,
@@ -538,7 +548,7 @@ class Ruimtedetailsoort(Referentiedatasoort):
     appartementencomplex zit.
     """
 
-    parkeergarage = RuimtedetailsoortReferentiedata(
+    parkeergarage = RuimtedetailsoortReferentiedata.model_construct(
         code="PAG",
         naam="Parkeergarage",
         parent=Ruimtesoort.parkeergelegenheid,
@@ -549,7 +559,7 @@ class Ruimtedetailsoort(Referentiedatasoort):
     bovengronds als ondergronds (parkeerkelder) zijn.
     """
 
-    parkeerterrein = RuimtedetailsoortReferentiedata(
+    parkeerterrein = RuimtedetailsoortReferentiedata.model_construct(
         code="PAT",
         naam="Parkeerterrein",
         parent=Ruimtesoort.parkeergelegenheid,
@@ -559,7 +569,7 @@ class Ruimtedetailsoort(Referentiedatasoort):
     is ingericht voor het parkeren van voertuigen.
     """
 
-    parkeervak_auto_binnen = RuimtedetailsoortReferentiedata(
+    parkeervak_auto_binnen = RuimtedetailsoortReferentiedata.model_construct(
         code="VAI",
         naam="Parkeervak auto (binnen)",
         parent=Ruimtesoort.parkeergelegenheid,
@@ -572,10 +582,12 @@ class Ruimtedetailsoort(Referentiedatasoort):
     meer dan twee wielen, zoals auto's.
     """
 
-    parkeervak_auto_buiten_niet_overdekt = RuimtedetailsoortReferentiedata(
-        code="VAU",
-        naam="Parkeervak auto (buiten, niet overdekt)",
-        parent=Ruimtesoort.parkeergelegenheid,
+    parkeervak_auto_buiten_niet_overdekt = (
+        RuimtedetailsoortReferentiedata.model_construct(
+            code="VAU",
+            naam="Parkeervak auto (buiten, niet overdekt)",
+            parent=Ruimtesoort.parkeergelegenheid,
+        )
     )
     """
     (UITBREIDING) Een parkeervak auto (buiten, niet overdekt) is een specifieke,
@@ -585,7 +597,7 @@ class Ruimtedetailsoort(Referentiedatasoort):
     meer dan twee wielen, zoals auto's.
     """
 
-    parkeervak_motorfiets_binnen = RuimtedetailsoortReferentiedata(
+    parkeervak_motorfiets_binnen = RuimtedetailsoortReferentiedata.model_construct(
         code="VMI",
         naam="Parkeervak motorfiets (binnen)",
         parent=Ruimtesoort.parkeergelegenheid,
@@ -599,10 +611,12 @@ class Ruimtedetailsoort(Referentiedatasoort):
     parkeerplaatsen voor auto's.
     """
 
-    parkeervak_motorfiets_buiten_niet_overdekt = RuimtedetailsoortReferentiedata(
-        code="VMU",
-        naam="Parkeervak motorfiets (buiten, niet overdekt)",
-        parent=Ruimtesoort.parkeergelegenheid,
+    parkeervak_motorfiets_buiten_niet_overdekt = (
+        RuimtedetailsoortReferentiedata.model_construct(
+            code="VMU",
+            naam="Parkeervak motorfiets (buiten, niet overdekt)",
+            parent=Ruimtesoort.parkeergelegenheid,
+        )
     )
     """
     (UITBREIDING) Een parkeervak motorfiets (buiten, niet overdekt) is een specifieke,
@@ -613,7 +627,7 @@ class Ruimtedetailsoort(Referentiedatasoort):
     gewone parkeerplaatsen voor auto's.
     """
 
-    parkeervak_scootmobiel_binnen = RuimtedetailsoortReferentiedata(
+    parkeervak_scootmobiel_binnen = RuimtedetailsoortReferentiedata.model_construct(
         code="VSI",
         naam="Parkeervak scootmobiel (binnen)",
         parent=Ruimtesoort.parkeergelegenheid,
@@ -626,7 +640,7 @@ class Ruimtedetailsoort(Referentiedatasoort):
     bijvoorbeeld dus niet voor elektrische fietsen.
     """
 
-    parkeervak_scootmobiel_buiten = RuimtedetailsoortReferentiedata(
+    parkeervak_scootmobiel_buiten = RuimtedetailsoortReferentiedata.model_construct(
         code="VSU",
         naam="Parkeervak scootmobiel (buiten)",
         parent=Ruimtesoort.parkeergelegenheid,
@@ -639,7 +653,7 @@ class Ruimtedetailsoort(Referentiedatasoort):
     bijvoorbeeld dus niet voor elektrische fietsen.
     """
 
-    stalling_extern = RuimtedetailsoortReferentiedata(
+    stalling_extern = RuimtedetailsoortReferentiedata.model_construct(
         code="STE",
         naam="Stalling extern",
         parent=Ruimtesoort.parkeergelegenheid,
@@ -650,7 +664,7 @@ class Ruimtedetailsoort(Referentiedatasoort):
     of scootmobielen.
     """
 
-    stalling_intern = RuimtedetailsoortReferentiedata(
+    stalling_intern = RuimtedetailsoortReferentiedata.model_construct(
         code="STI",
         naam="Stalling intern",
         parent=Ruimtesoort.parkeergelegenheid,
@@ -7,42 +7,42 @@ class RuimteliggingReferentiedata(Referentiedata):
 
 
 class Ruimteligging(Referentiedatasoort):
-    noord = RuimteliggingReferentiedata(
+    noord = RuimteliggingReferentiedata.model_construct(
         code="NOO",
         naam="Noord",
     )
 
-    noordoost = RuimteliggingReferentiedata(
+    noordoost = RuimteliggingReferentiedata.model_construct(
         code="NOS",
         naam="Noordoost",
     )
 
-    noordwest = RuimteliggingReferentiedata(
+    noordwest = RuimteliggingReferentiedata.model_construct(
         code="NWE",
         naam="Noordwest",
     )
 
-    oost = RuimteliggingReferentiedata(
+    oost = RuimteliggingReferentiedata.model_construct(
         code="OOS",
         naam="Oost",
     )
 
-    west = RuimteliggingReferentiedata(
+    west = RuimteliggingReferentiedata.model_construct(
         code="WES",
         naam="West",
     )
 
-    zuidoost = RuimteliggingReferentiedata(
+    zuidoost = RuimteliggingReferentiedata.model_construct(
         code="ZOO",
         naam="Zuidoost",
     )
 
-    zuid = RuimteliggingReferentiedata(
+    zuid = RuimteliggingReferentiedata.model_construct(
         code="ZUI",
         naam="Zuid",
     )
 
-    zuidwest = RuimteliggingReferentiedata(
+    zuidwest = RuimteliggingReferentiedata.model_construct(
         code="ZWE",
         naam="Zuidwest",
     )
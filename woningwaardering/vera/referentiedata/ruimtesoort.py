@@ -7,7 +7,7 @@ class RuimtesoortReferentiedata(Referentiedata):
 
 
 class Ruimtesoort(Referentiedatasoort):
-    buitenruimte = RuimtesoortReferentiedata(
+    buitenruimte = RuimtesoortReferentiedata.model_construct(
         code="BTR",
         naam="Buitenruimte",
     )
@@ -16,16 +16,18 @@ class Ruimtesoort(Referentiedatasoort):
     buitenruimte wordt gezien. Nader te specificeren met ruimtedetailsoort.
     """
 
-    gemeenschappelijke_ruimten_en_voorzieningen = RuimtesoortReferentiedata(
-        code="GEM",
-        naam="Gemeenschappelijke ruimten en voorzieningen",
+    gemeenschappelijke_ruimten_en_voorzieningen = (
+        RuimtesoortReferentiedata.model_construct(
+            code="GEM",
+            naam="Gemeenschappelijke ruimten en voorzieningen",
+        )
     )
     """
     Een gemeenschappelijk ruimte of voorziening is een ruimte die volgens de
     woningwaardering als gemeenschappelijke ruimte of voorziening wordt gezien
     """
 
-    overige_ruimten = RuimtesoortReferentiedata(
+    overige_ruimten = RuimtesoortReferentiedata.model_construct(
         code="OVR",
         naam="Overige ruimten",
     )
@@ -34,7 +36,7 @@ class Ruimtesoort(Referentiedatasoort):
     de woningwaardering. Nader te specificeren met ruimtedetailsoort.
     """
 
-    vertrek = RuimtesoortReferentiedata(
+    vertrek = RuimtesoortReferentiedata.model_construct(
         code="VTK",
         naam="Vertrek",
     )
@@ -43,7 +45,7 @@ class Ruimtesoort(Referentiedatasoort):
     (Beleidsboek waarderingsstelsel zelfstandige woonruimte)
     """
 
-    verkeersruimte = RuimtesoortReferentiedata(
+    verkeersruimte = RuimtesoortReferentiedata.model_construct(
         code="VRK",
         naam="Verkeersruimte",
     )
@@ -52,7 +54,7 @@ class Ruimtesoort(Referentiedatasoort):
     vertrekken.
     """
 
-    parkeergelegenheid = RuimtesoortReferentiedata(
+    parkeergelegenheid = RuimtesoortReferentiedata.model_construct(
         code="PAR",
         naam="Parkeergelegenheid",
     )
@@ -7,7 +7,7 @@ class SanctiesoortReferentiedata(Referentiedata):
 
 
 class Sanctiesoort(Referentiedatasoort):
-    milde_sanctie = SanctiesoortReferentiedata(
+    milde_sanctie = SanctiesoortReferentiedata.model_construct(
         code="MIL",
         naam="Milde sanctie",
     )
@@ -15,7 +15,7 @@ class Sanctiesoort(Referentiedatasoort):
     Milde sanctie
     """
 
-    no_show_sanctie = SanctiesoortReferentiedata(
+    no_show_sanctie = SanctiesoortReferentiedata.model_construct(
         code="NOS",
         naam="No-show sanctie",
     )
@@ -23,7 +23,7 @@ class Sanctiesoort(Referentiedatasoort):
     No-show sanctie, , verlies van alle zoek-, situatie en zoekpunten
     """
 
-    zware_sanctie = SanctiesoortReferentiedata(
+    zware_sanctie = SanctiesoortReferentiedata.model_construct(
         code="ZWA",
         naam="Zware sanctie",
     )
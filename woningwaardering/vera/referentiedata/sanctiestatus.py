@@ -7,7 +7,7 @@ class SanctiestatusReferentiedata(Referentiedata):
 
 
 class Sanctiestatus(Referentiedatasoort):
-    aangemaakt = SanctiestatusReferentiedata(
+    aangemaakt = SanctiestatusReferentiedata.model_construct(
         code="AAN",
         naam="Aangemaakt",
     )
@@ -15,7 +15,7 @@ class Sanctiestatus(Referentiedatasoort):
     Aangemaakt
     """
 
-    definitief = SanctiestatusReferentiedata(
+    definitief = SanctiestatusReferentiedata.model_construct(
         code="DEF",
         naam="Definitief",
     )
@@ -23,7 +23,7 @@ class Sanctiestatus(Referentiedatasoort):
     Definitief (na 1e van de volgende kalendermaand)
     """
 
-    ingetrokken = SanctiestatusReferentiedata(
+    ingetrokken = SanctiestatusReferentiedata.model_construct(
         code="ING",
         naam="Ingetrokken",
     )
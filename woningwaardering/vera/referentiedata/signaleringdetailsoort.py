@@ -10,13 +10,13 @@ class SignaleringdetailsoortReferentiedata(Referentiedata):
 
 
 class Signaleringdetailsoort(Referentiedatasoort):
-    agressie = SignaleringdetailsoortReferentiedata(
+    agressie = SignaleringdetailsoortReferentiedata.model_construct(
         code="AGS",
         naam="Agressie",
         parent=Signaleringsoort.agressie,
     )
 
-    ambulante_begeleiding = SignaleringdetailsoortReferentiedata(
+    ambulante_begeleiding = SignaleringdetailsoortReferentiedata.model_construct(
         code="AMB",
         naam="Ambulante begeleiding",
     )
@@ -25,67 +25,67 @@ class Signaleringdetailsoort(Referentiedatasoort):
     blijven functioneren.
     """
 
-    betalingsachterstand = SignaleringdetailsoortReferentiedata(
+    betalingsachterstand = SignaleringdetailsoortReferentiedata.model_construct(
         code="BET",
         naam="Betalingsachterstand",
         parent=Signaleringsoort.huurschuld,
     )
 
-    bewindvoerder = SignaleringdetailsoortReferentiedata(
+    bewindvoerder = SignaleringdetailsoortReferentiedata.model_construct(
         code="BEW",
         naam="Bewindvoerder",
         parent=Signaleringsoort.huurschuld,
     )
 
-    brandstichting = SignaleringdetailsoortReferentiedata(
+    brandstichting = SignaleringdetailsoortReferentiedata.model_construct(
         code="BRA",
         naam="Brandstichting",
         parent=Signaleringsoort.agressie,
     )
 
-    deurwaarder = SignaleringdetailsoortReferentiedata(
+    deurwaarder = SignaleringdetailsoortReferentiedata.model_construct(
         code="DEU",
         naam="Deurwaarder",
         parent=Signaleringsoort.huurschuld,
     )
 
-    drugshandel = SignaleringdetailsoortReferentiedata(
+    drugshandel = SignaleringdetailsoortReferentiedata.model_construct(
         code="DRU",
         naam="Drugshandel",
         parent=Signaleringsoort.oneigenlijk_gebruik_woning,
     )
 
-    geluidsoverlast = SignaleringdetailsoortReferentiedata(
+    geluidsoverlast = SignaleringdetailsoortReferentiedata.model_construct(
         code="GEL",
         naam="Geluidsoverlast",
         parent=Signaleringsoort.overlast,
     )
 
-    hennepkwekerij = SignaleringdetailsoortReferentiedata(
+    hennepkwekerij = SignaleringdetailsoortReferentiedata.model_construct(
         code="HEN",
         naam="Hennepkwekerij",
         parent=Signaleringsoort.oneigenlijk_gebruik_woning,
     )
 
-    mutatieschade = SignaleringdetailsoortReferentiedata(
+    mutatieschade = SignaleringdetailsoortReferentiedata.model_construct(
         code="MUT",
         naam="Mutatieschade",
         parent=Signaleringsoort.huurschuld,
     )
 
-    onderverhuur = SignaleringdetailsoortReferentiedata(
+    onderverhuur = SignaleringdetailsoortReferentiedata.model_construct(
         code="OND",
         naam="Onderverhuur",
         parent=Signaleringsoort.oneigenlijk_gebruik_woning,
     )
 
-    prostitutie = SignaleringdetailsoortReferentiedata(
+    prostitutie = SignaleringdetailsoortReferentiedata.model_construct(
         code="PRO",
         naam="Prostitutie",
         parent=Signaleringsoort.oneigenlijk_gebruik_woning,
     )
 
-    vervuiling = SignaleringdetailsoortReferentiedata(
+    vervuiling = SignaleringdetailsoortReferentiedata.model_construct(
         code="VER",
         naam="Vervuiling",
         parent=Signaleringsoort.oneigenlijk_gebruik_woning,
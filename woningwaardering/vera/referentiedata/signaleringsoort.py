@@ -7,22 +7,22 @@ class SignaleringsoortReferentiedata(Referentiedata):
 
 
 class Signaleringsoort(Referentiedatasoort):
-    agressie = SignaleringsoortReferentiedata(
+    agressie = SignaleringsoortReferentiedata.model_construct(
         code="AGR",
         naam="Agressie",
     )
 
-    oneigenlijk_gebruik_woning = SignaleringsoortReferentiedata(
+    oneigenlijk_gebruik_woning = SignaleringsoortReferentiedata.model_construct(
         code="ONE",
         naam="Oneigenlijk gebruik woning",
     )
 
-    overlast = SignaleringsoortReferentiedata(
+    overlast = SignaleringsoortReferentiedata.model_construct(
         code="OVE",
         naam="Overlast",
     )
 
-    huurschuld = SignaleringsoortReferentiedata(
+    huurschuld = SignaleringsoortReferentiedata.model_construct(
         code="SCH",
         naam="Huurschuld",
     )
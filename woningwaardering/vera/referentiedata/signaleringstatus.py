@@ -7,17 +7,17 @@ class SignaleringstatusReferentiedata(Referentiedata):
 
 
 class Signaleringstatus(Referentiedatasoort):
-    actief = SignaleringstatusReferentiedata(
+    actief = SignaleringstatusReferentiedata.model_construct(
         code="ACT",
         naam="Actief",
     )
 
-    passief = SignaleringstatusReferentiedata(
+    passief = SignaleringstatusReferentiedata.model_construct(
         code="PAS",
         naam="Passief",
     )
 
-    vervallen = SignaleringstatusReferentiedata(
+    vervallen = SignaleringstatusReferentiedata.model_construct(
         code="VER",
         naam="Vervallen",
     )
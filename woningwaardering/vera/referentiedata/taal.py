@@ -7,32 +7,32 @@ class TaalReferentiedata(Referentiedata):
 
 
 class Taal(Referentiedatasoort):
-    duits = TaalReferentiedata(
+    duits = TaalReferentiedata.model_construct(
         code="DUI",
         naam="Duits",
     )
 
-    engels = TaalReferentiedata(
+    engels = TaalReferentiedata.model_construct(
         code="ENG",
         naam="Engels",
     )
 
-    frans = TaalReferentiedata(
+    frans = TaalReferentiedata.model_construct(
         code="FRA",
         naam="Frans",
     )
 
-    nederlands = TaalReferentiedata(
+    nederlands = TaalReferentiedata.model_construct(
         code="NLD",
         naam="Nederlands",
     )
 
-    spaans = TaalReferentiedata(
+    spaans = TaalReferentiedata.model_construct(
         code="SPA",
         naam="Spaans",
     )
 
-    turks = TaalReferentiedata(
+    turks = TaalReferentiedata.model_construct(
         code="TUR",
         naam="Turks",
     )
@@ -10,7 +10,7 @@ class TijdsbestedingdetailsoortReferentiedata(Referentiedata):
 
 
 class Tijdsbestedingdetailsoort(Referentiedatasoort):
-    verlof_regulier = TijdsbestedingdetailsoortReferentiedata(
+    verlof_regulier = TijdsbestedingdetailsoortReferentiedata.model_construct(
         code="VER",
         naam="Verlof (regulier)",
         parent=Tijdsbestedingsoort.afwezig,
@@ -19,7 +19,7 @@ class Tijdsbestedingdetailsoort(Referentiedatasoort):
     Regulier verlof
     """
 
-    ziek = TijdsbestedingdetailsoortReferentiedata(
+    ziek = TijdsbestedingdetailsoortReferentiedata.model_construct(
         code="ZIE",
         naam="Ziek",
         parent=Tijdsbestedingsoort.afwezig,
@@ -28,7 +28,7 @@ class Tijdsbestedingdetailsoort(Referentiedatasoort):
     Afwezig wegens ziekte
     """
 
-    bijzonder_verlof = TijdsbestedingdetailsoortReferentiedata(
+    bijzonder_verlof = TijdsbestedingdetailsoortReferentiedata.model_construct(
         code="BIJ",
         naam="Bijzonder verlof",
         parent=Tijdsbestedingsoort.afwezig,
@@ -38,7 +38,7 @@ class Tijdsbestedingdetailsoort(Referentiedatasoort):
     huwelijk en tandartsbezoek.
     """
 
-    onbetaald_verlof = TijdsbestedingdetailsoortReferentiedata(
+    onbetaald_verlof = TijdsbestedingdetailsoortReferentiedata.model_construct(
         code="ONB",
         naam="Onbetaald verlof",
         parent=Tijdsbestedingsoort.afwezig,
@@ -47,7 +47,7 @@ class Tijdsbestedingdetailsoort(Referentiedatasoort):
     Onbetaald verlof
     """
 
-    zwangerschapsverlof = TijdsbestedingdetailsoortReferentiedata(
+    zwangerschapsverlof = TijdsbestedingdetailsoortReferentiedata.model_construct(
         code="ZWA",
         naam="Zwangerschapsverlof",
         parent=Tijdsbestedingsoort.afwezig,
@@ -56,7 +56,7 @@ class Tijdsbestedingdetailsoort(Referentiedatasoort):
     Zwangersschapsverlof of bevallingsverlof
     """
 
-    ouderschapsverlof = TijdsbestedingdetailsoortReferentiedata(
+    ouderschapsverlof = TijdsbestedingdetailsoortReferentiedata.model_construct(
         code="OUD",
         naam="Ouderschapsverlof",
         parent=Tijdsbestedingsoort.afwezig,
@@ -65,7 +65,7 @@ class Tijdsbestedingdetailsoort(Referentiedatasoort):
     Ouderschapsverlof
     """
 
-    zorgverlof = TijdsbestedingdetailsoortReferentiedata(
+    zorgverlof = TijdsbestedingdetailsoortReferentiedata.model_construct(
         code="ZOR",
         naam="Zorgverlof",
         parent=Tijdsbestedingsoort.afwezig,
@@ -74,7 +74,7 @@ class Tijdsbestedingdetailsoort(Referentiedatasoort):
     Zorgverlof kortdurend of langdurend
     """
 
-    calamiteitenverlof = TijdsbestedingdetailsoortReferentiedata(
+    calamiteitenverlof = TijdsbestedingdetailsoortReferentiedata.model_construct(
         code="CAL",
         naam="Calamiteitenverlof",
         parent=Tijdsbestedingsoort.afwezig,
@@ -83,13 +83,13 @@ class Tijdsbestedingdetailsoort(Referentiedatasoort):
     Calamiteitenverlof of kort verzuimverlof
     """
 
-    non_actief = TijdsbestedingdetailsoortReferentiedata(
+    non_actief = TijdsbestedingdetailsoortReferentiedata.model_construct(
         code="NON",
         naam="Non-actief",
         parent=Tijdsbestedingsoort.afwezig,
     )
 
-    adoptieverlof = TijdsbestedingdetailsoortReferentiedata(
+    adoptieverlof = TijdsbestedingdetailsoortReferentiedata.model_construct(
         code="ADO",
         naam="Adoptieverlof",
         parent=Tijdsbestedingsoort.afwezig,
@@ -98,7 +98,7 @@ class Tijdsbestedingdetailsoort(Referentiedatasoort):
     Adoptie of pleegzorgverlof
     """
 
-    geschorst = TijdsbestedingdetailsoortReferentiedata(
+    geschorst = TijdsbestedingdetailsoortReferentiedata.model_construct(
         code="GES",
         naam="Geschorst",
         parent=Tijdsbestedingsoort.afwezig,
@@ -7,17 +7,17 @@ class TijdsbestedingsoortReferentiedata(Referentiedata):
 
 
 class Tijdsbestedingsoort(Referentiedatasoort):
-    declarabel = TijdsbestedingsoortReferentiedata(
+    declarabel = TijdsbestedingsoortReferentiedata.model_construct(
         code="DEC",
         naam="Declarabel",
     )
 
-    niet_declarabel = TijdsbestedingsoortReferentiedata(
+    niet_declarabel = TijdsbestedingsoortReferentiedata.model_construct(
         code="NDE",
         naam="Niet declarabel",
     )
 
-    afwezig = TijdsbestedingsoortReferentiedata(
+    afwezig = TijdsbestedingsoortReferentiedata.model_construct(
         code="AFW",
         naam="Afwezig",
     )
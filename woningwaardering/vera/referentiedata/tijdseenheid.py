@@ -7,7 +7,7 @@ class TijdseenheidReferentiedata(Referentiedata):
 
 
 class Tijdseenheid(Referentiedatasoort):
-    uren = TijdseenheidReferentiedata(
+    uren = TijdseenheidReferentiedata.model_construct(
         code="UUR",
         naam="Uren",
     )
@@ -15,7 +15,7 @@ class Tijdseenheid(Referentiedatasoort):
     Registratie van de duur in uren
     """
 
-    minuten = TijdseenheidReferentiedata(
+    minuten = TijdseenheidReferentiedata.model_construct(
         code="MIN",
         naam="Minuten",
     )
@@ -7,7 +7,7 @@ class ToegankelijkheidslabelReferentiedata(Referentiedata):
 
 
 class Toegankelijkheidslabel(Referentiedatasoort):
-    gelijkvloerse_woning = ToegankelijkheidslabelReferentiedata(
+    gelijkvloerse_woning = ToegankelijkheidslabelReferentiedata.model_construct(
         code="GEL",
         naam="Gelijkvloerse woning",
     )
@@ -21,7 +21,7 @@ class Toegankelijkheidslabel(Referentiedatasoort):
     ook extern toegankelijk moet zijn voor minder validen.
     """
 
-    rollatorwoning = ToegankelijkheidslabelReferentiedata(
+    rollatorwoning = ToegankelijkheidslabelReferentiedata.model_construct(
         code="ROA",
         naam="Rollatorwoning",
     )
@@ -32,7 +32,7 @@ class Toegankelijkheidslabel(Referentiedatasoort):
     bijvoorbeeld drempels aanwezig kunnen zijn.
     """
 
-    rolstoelwoning = ToegankelijkheidslabelReferentiedata(
+    rolstoelwoning = ToegankelijkheidslabelReferentiedata.model_construct(
         code="ROL",
         naam="Rolstoelwoning",
     )
@@ -43,7 +43,7 @@ class Toegankelijkheidslabel(Referentiedatasoort):
     Rollatorwoning, maar is niet per definitie ook een 'extra ruime rolstoelwoning'.
     """
 
-    extra_ruime_rolstoelwoning = ToegankelijkheidslabelReferentiedata(
+    extra_ruime_rolstoelwoning = ToegankelijkheidslabelReferentiedata.model_construct(
         code="RUI",
         naam="Extra ruime rolstoelwoning",
     )
@@ -54,7 +54,9 @@ class Toegankelijkheidslabel(Referentiedatasoort):
     definitie ook aan het label Rolstoelwoning.
     """
 
-    woning_zonder_bijzondere_toegankelijkheid = ToegankelijkheidslabelReferentiedata(
-        code="ZON",
-        naam="Woning zonder bijzondere toegankelijkheid",
+    woning_zonder_bijzondere_toegankelijkheid = (
+        ToegankelijkheidslabelReferentiedata.model_construct(
+            code="ZON",
+            naam="Woning zonder bijzondere toegankelijkheid",
+        )
     )
@@ -7,7 +7,7 @@ class UitexploitatieredenReferentiedata(Referentiedata):
 
 
 class Uitexploitatiereden(Referentiedatasoort):
-    administratief = UitexploitatieredenReferentiedata(
+    administratief = UitexploitatieredenReferentiedata.model_construct(
         code="ADM",
         naam="Administratief",
     )
@@ -15,7 +15,7 @@ class Uitexploitatiereden(Referentiedatasoort):
     De exploitatie van de eenheid van een andere eigenaar is beëindigd
     """
 
-    planmatig_onderhoud = UitexploitatieredenReferentiedata(
+    planmatig_onderhoud = UitexploitatieredenReferentiedata.model_construct(
         code="PLA",
         naam="Planmatig onderhoud",
     )
@@ -24,7 +24,7 @@ class Uitexploitatiereden(Referentiedatasoort):
     plaatsvindt
     """
 
-    renovatie = UitexploitatieredenReferentiedata(
+    renovatie = UitexploitatieredenReferentiedata.model_construct(
         code="REN",
         naam="Renovatie",
     )
@@ -32,7 +32,7 @@ class Uitexploitatiereden(Referentiedatasoort):
     De eenheid is (tijdelijk) uit exploitatie genomen omdat deze wordt gerenoveerd
     """
 
-    samengevoegd = UitexploitatieredenReferentiedata(
+    samengevoegd = UitexploitatieredenReferentiedata.model_construct(
         code="SAM",
         naam="Samengevoegd",
     )
@@ -41,7 +41,7 @@ class Uitexploitatiereden(Referentiedatasoort):
     eenheid
     """
 
-    sloop = UitexploitatieredenReferentiedata(
+    sloop = UitexploitatieredenReferentiedata.model_construct(
         code="SLO",
         naam="Sloop",
     )
@@ -49,7 +49,7 @@ class Uitexploitatiereden(Referentiedatasoort):
     De eenheid is uit exploitatie genomen in afwachting van sloop
     """
 
-    transformatie = UitexploitatieredenReferentiedata(
+    transformatie = UitexploitatieredenReferentiedata.model_construct(
         code="TRA",
         naam="Transformatie",
     )
@@ -58,7 +58,7 @@ class Uitexploitatiereden(Referentiedatasoort):
     sanering
     """
 
-    uitruil = UitexploitatieredenReferentiedata(
+    uitruil = UitexploitatieredenReferentiedata.model_construct(
         code="UIT",
         naam="Uitruil",
     )
@@ -67,7 +67,7 @@ class Uitexploitatiereden(Referentiedatasoort):
     vastgoedeigenaar
     """
 
-    verkoop_aan_belegger = UitexploitatieredenReferentiedata(
+    verkoop_aan_belegger = UitexploitatieredenReferentiedata.model_construct(
         code="VAB",
         naam="Verkoop aan belegger",
     )
@@ -76,7 +76,7 @@ class Uitexploitatiereden(Referentiedatasoort):
     belegger
     """
 
-    verkoop_aan_huurder = UitexploitatieredenReferentiedata(
+    verkoop_aan_huurder = UitexploitatieredenReferentiedata.model_construct(
         code="VAH",
         naam="Verkoop aan huurder",
     )
@@ -85,16 +85,18 @@ class Uitexploitatiereden(Referentiedatasoort):
     (voormalig) huurder
     """
 
-    verkoop_aan_overige_natuurlijke_persoon = UitexploitatieredenReferentiedata(
-        code="VAO",
-        naam="Verkoop aan overige natuurlijke persoon",
+    verkoop_aan_overige_natuurlijke_persoon = (
+        UitexploitatieredenReferentiedata.model_construct(
+            code="VAO",
+            naam="Verkoop aan overige natuurlijke persoon",
+        )
     )
     """
     De eenheid is niet meer in exploitatie omdat deze permanent is verkocht aan een
     overig natuurlijke persoon
     """
 
-    vernieuwbouw = UitexploitatieredenReferentiedata(
+    vernieuwbouw = UitexploitatieredenReferentiedata.model_construct(
         code="VEN",
         naam="Vernieuwbouw",
     )
@@ -102,7 +104,7 @@ class Uitexploitatiereden(Referentiedatasoort):
     De eenheid is (tijdelijk) uit exploitatie genomen omdat deze wordt verniewbouwd
     """
 
-    verkoop_onder_voorwaarden = UitexploitatieredenReferentiedata(
+    verkoop_onder_voorwaarden = UitexploitatieredenReferentiedata.model_construct(
         code="VOV",
         naam="Verkoop onder Voorwaarden",
     )
@@ -7,7 +7,7 @@ class UitvoerendesoortReferentiedata(Referentiedata):
 
 
 class Uitvoerendesoort(Referentiedatasoort):
-    leverancier = UitvoerendesoortReferentiedata(
+    leverancier = UitvoerendesoortReferentiedata.model_construct(
         code="LEV",
         naam="Leverancier",
     )
@@ -15,7 +15,7 @@ class Uitvoerendesoort(Referentiedatasoort):
     Uitvoering vindt plaats door een externe partij
     """
 
-    vakgroep = UitvoerendesoortReferentiedata(
+    vakgroep = UitvoerendesoortReferentiedata.model_construct(
         code="VAK",
         naam="Vakgroep",
     )
@@ -7,7 +7,7 @@ class VacaturesoortReferentiedata(Referentiedata):
 
 
 class Vacaturesoort(Referentiedatasoort):
-    tijdelijke_inhuur = VacaturesoortReferentiedata(
+    tijdelijke_inhuur = VacaturesoortReferentiedata.model_construct(
         code="TIJ",
         naam="Tijdelijke inhuur",
     )
@@ -15,7 +15,7 @@ class Vacaturesoort(Referentiedatasoort):
     Tijdelijke inhuur
     """
 
-    vaste_dienst = VacaturesoortReferentiedata(
+    vaste_dienst = VacaturesoortReferentiedata.model_construct(
         code="VAS",
         naam="Vaste dienst",
     )
@@ -7,7 +7,7 @@ class VerantwoordingconsolidatieReferentiedata(Referentiedata):
 
 
 class Verantwoordingconsolidatie(Referentiedatasoort):
-    geconsolideerd = VerantwoordingconsolidatieReferentiedata(
+    geconsolideerd = VerantwoordingconsolidatieReferentiedata.model_construct(
         code="CON",
         naam="Geconsolideerd",
     )
@@ -16,7 +16,7 @@ class Verantwoordingconsolidatie(Referentiedatasoort):
     geconsolideerd
     """
 
-    enkelvoudig = VerantwoordingconsolidatieReferentiedata(
+    enkelvoudig = VerantwoordingconsolidatieReferentiedata.model_construct(
         code="ENK",
         naam="Enkelvoudig",
     )
@@ -7,7 +7,7 @@ class VerantwoordingregimeReferentiedata(Referentiedata):
 
 
 class Verantwoordingregime(Referentiedatasoort):
-    administratieve_scheiding = VerantwoordingregimeReferentiedata(
+    administratieve_scheiding = VerantwoordingregimeReferentiedata.model_construct(
         code="ADM",
         naam="Administratieve scheiding",
     )
@@ -16,7 +16,7 @@ class Verantwoordingregime(Referentiedatasoort):
     gescheiden
     """
 
-    hybride = VerantwoordingregimeReferentiedata(
+    hybride = VerantwoordingregimeReferentiedata.model_construct(
         code="HYB",
         naam="Hybride",
     )
@@ -25,7 +25,7 @@ class Verantwoordingregime(Referentiedatasoort):
     dochtervennootschap, terwijl ook niet-DAEB bezit achterblijft in de TI.
     """
 
-    juridische_scheiding = VerantwoordingregimeReferentiedata(
+    juridische_scheiding = VerantwoordingregimeReferentiedata.model_construct(
         code="JUR",
         naam="Juridische scheiding",
     )
@@ -34,7 +34,7 @@ class Verantwoordingregime(Referentiedatasoort):
     entiteiten ondergebracht, elk met een eigen financiële administratie
     """
 
-    verlicht_regime = VerantwoordingregimeReferentiedata(
+    verlicht_regime = VerantwoordingregimeReferentiedata.model_construct(
         code="VER",
         naam="Verlicht regime",
     )
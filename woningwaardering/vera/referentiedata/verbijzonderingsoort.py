@@ -7,7 +7,7 @@ class VerbijzonderingsoortReferentiedata(Referentiedata):
 
 
 class Verbijzonderingsoort(Referentiedatasoort):
-    cluster = VerbijzonderingsoortReferentiedata(
+    cluster = VerbijzonderingsoortReferentiedata.model_construct(
         code="CLS",
         naam="Cluster",
     )
@@ -16,7 +16,7 @@ class Verbijzonderingsoort(Referentiedatasoort):
     verbijzonderen
     """
 
-    soort_huurdebiteur = VerbijzonderingsoortReferentiedata(
+    soort_huurdebiteur = VerbijzonderingsoortReferentiedata.model_construct(
         code="DEB",
         naam="Soort huurdebiteur",
     )
@@ -25,7 +25,7 @@ class Verbijzonderingsoort(Referentiedatasoort):
     kunnen verbijzonderen
     """
 
-    dimensie = VerbijzonderingsoortReferentiedata(
+    dimensie = VerbijzonderingsoortReferentiedata.model_construct(
         code="DIM",
         naam="Dimensie",
     )
@@ -35,7 +35,7 @@ class Verbijzonderingsoort(Referentiedatasoort):
     dimensie nader te duiden (dimensiesoort)
     """
 
-    divisie = VerbijzonderingsoortReferentiedata(
+    divisie = VerbijzonderingsoortReferentiedata.model_construct(
         code="DIV",
         naam="Divisie",
     )
@@ -44,7 +44,7 @@ class Verbijzonderingsoort(Referentiedatasoort):
     verbijzonderen.
     """
 
-    kostenplaats = VerbijzonderingsoortReferentiedata(
+    kostenplaats = VerbijzonderingsoortReferentiedata.model_construct(
         code="KPL",
         naam="Kostenplaats",
     )
@@ -53,7 +53,7 @@ class Verbijzonderingsoort(Referentiedatasoort):
     verbijzonderen. Vaak is een kostenplaats een afdeling
     """
 
-    kostensoort = VerbijzonderingsoortReferentiedata(
+    kostensoort = VerbijzonderingsoortReferentiedata.model_construct(
         code="KST",
         naam="Kostensoort",
     )
@@ -62,7 +62,7 @@ class Verbijzonderingsoort(Referentiedatasoort):
     verbijzonderen
     """
 
-    soort_leverancier = VerbijzonderingsoortReferentiedata(
+    soort_leverancier = VerbijzonderingsoortReferentiedata.model_construct(
         code="LEV",
         naam="Soort leverancier",
     )
@@ -71,7 +71,7 @@ class Verbijzonderingsoort(Referentiedatasoort):
     kunnen verbijzonderen
     """
 
-    maatschappelijk_label = VerbijzonderingsoortReferentiedata(
+    maatschappelijk_label = VerbijzonderingsoortReferentiedata.model_construct(
         code="MAA",
         naam="Maatschappelijk label",
     )
@@ -80,7 +80,7 @@ class Verbijzonderingsoort(Referentiedatasoort):
     (DAEB/niet-DAEB) om een financieel feit nader te kunnen te kunnen verbijzonderen
     """
 
-    medewerker = VerbijzonderingsoortReferentiedata(
+    medewerker = VerbijzonderingsoortReferentiedata.model_construct(
         code="MED",
         naam="Medewerker",
     )
@@ -89,7 +89,7 @@ class Verbijzonderingsoort(Referentiedatasoort):
     verbijzonderen
     """
 
-    project = VerbijzonderingsoortReferentiedata(
+    project = VerbijzonderingsoortReferentiedata.model_construct(
         code="PRO",
         naam="Project",
     )
@@ -98,7 +98,7 @@ class Verbijzonderingsoort(Referentiedatasoort):
     verbijzonderen
     """
 
-    vastgoedeenheid = VerbijzonderingsoortReferentiedata(
+    vastgoedeenheid = VerbijzonderingsoortReferentiedata.model_construct(
         code="VGE",
         naam="Vastgoedeenheid",
     )
@@ -7,17 +7,17 @@ class VerbijzonderingstatusReferentiedata(Referentiedata):
 
 
 class Verbijzonderingstatus(Referentiedatasoort):
-    actief = VerbijzonderingstatusReferentiedata(
+    actief = VerbijzonderingstatusReferentiedata.model_construct(
         code="ACT",
         naam="Actief",
     )
 
-    geblokkeerd = VerbijzonderingstatusReferentiedata(
+    geblokkeerd = VerbijzonderingstatusReferentiedata.model_construct(
         code="BLK",
         naam="Geblokkeerd",
     )
 
-    historisch = VerbijzonderingstatusReferentiedata(
+    historisch = VerbijzonderingstatusReferentiedata.model_construct(
         code="HIS",
         naam="Historisch",
     )
@@ -7,7 +7,7 @@ class VerrekeningsoortReferentiedata(Referentiedata):
 
 
 class Verrekeningsoort(Referentiedatasoort):
-    te_activeren = VerrekeningsoortReferentiedata(
+    te_activeren = VerrekeningsoortReferentiedata.model_construct(
         code="ACT",
         naam="Te activeren",
     )
@@ -15,7 +15,7 @@ class Verrekeningsoort(Referentiedatasoort):
     Bij de verrekening wordt (een deel van) het bedrag geactiveerd
     """
 
-    te_verhalen = VerrekeningsoortReferentiedata(
+    te_verhalen = VerrekeningsoortReferentiedata.model_construct(
         code="VER",
         naam="Te verhalen",
     )
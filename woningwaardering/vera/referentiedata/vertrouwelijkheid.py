@@ -7,7 +7,7 @@ class VertrouwelijkheidReferentiedata(Referentiedata):
 
 
 class Vertrouwelijkheid(Referentiedatasoort):
-    geheim = VertrouwelijkheidReferentiedata(
+    geheim = VertrouwelijkheidReferentiedata.model_construct(
         code="GEH",
         naam="Geheim",
     )
@@ -16,7 +16,7 @@ class Vertrouwelijkheid(Referentiedatasoort):
     strafrechtelijke informatie)
     """
 
-    intern = VertrouwelijkheidReferentiedata(
+    intern = VertrouwelijkheidReferentiedata.model_construct(
         code="INT",
         naam="Intern",
     )
@@ -24,7 +24,7 @@ class Vertrouwelijkheid(Referentiedatasoort):
     Informatie is toegankelijk voor alle medewerkers van de organisatie (bv: intranet)
     """
 
-    openbaar = VertrouwelijkheidReferentiedata(
+    openbaar = VertrouwelijkheidReferentiedata.model_construct(
         code="OPE",
         naam="Openbaar",
     )
@@ -32,7 +32,7 @@ class Vertrouwelijkheid(Referentiedatasoort):
     Informatie mag door iedereen worden ingezien (bv: algemene informatie op de website)
     """
 
-    vertrouwelijk = VertrouwelijkheidReferentiedata(
+    vertrouwelijk = VertrouwelijkheidReferentiedata.model_construct(
         code="VER",
         naam="Vertrouwelijk",
     )
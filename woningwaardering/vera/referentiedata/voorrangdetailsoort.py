@@ -10,7 +10,7 @@ class VoorrangdetailsoortReferentiedata(Referentiedata):
 
 
 class Voorrangdetailsoort(Referentiedatasoort):
-    beroep = VoorrangdetailsoortReferentiedata(
+    beroep = VoorrangdetailsoortReferentiedata.model_construct(
         code="BER",
         naam="Beroep",
         parent=Voorrangsoort.urgentie,
@@ -19,7 +19,7 @@ class Voorrangdetailsoort(Referentiedatasoort):
     Ugrentie wegens een bijzonder beroep in de regio onderwijs, zorg of politie
     """
 
-    dakloos = VoorrangdetailsoortReferentiedata(
+    dakloos = VoorrangdetailsoortReferentiedata.model_construct(
         code="DAK",
         naam="(Bijna) dakloos",
         parent=Voorrangsoort.urgentie,
@@ -28,7 +28,7 @@ class Voorrangdetailsoort(Referentiedatasoort):
     dakloos / calamiteit /brand onbewoonbaar / uitzetting / terugkeer uit buitenland
     """
 
-    gedupeerd = VoorrangdetailsoortReferentiedata(
+    gedupeerd = VoorrangdetailsoortReferentiedata.model_construct(
         code="DUP",
         naam="Gedupeerd",
         parent=Voorrangsoort.urgentie,
@@ -37,7 +37,7 @@ class Voorrangdetailsoort(Referentiedatasoort):
     Urgentie wegens dupering van woningzoekende bij woningaanbieding
     """
 
-    economisch = VoorrangdetailsoortReferentiedata(
+    economisch = VoorrangdetailsoortReferentiedata.model_construct(
         code="ECO",
         naam="Economisch",
         parent=Voorrangsoort.binding,
@@ -46,7 +46,7 @@ class Voorrangdetailsoort(Referentiedatasoort):
     Economische binding
     """
 
-    ex_gedetineerd = VoorrangdetailsoortReferentiedata(
+    ex_gedetineerd = VoorrangdetailsoortReferentiedata.model_construct(
         code="EXD",
         naam="ex-gedetineerd",
         parent=Voorrangsoort.urgentie,
@@ -55,7 +55,7 @@ class Voorrangdetailsoort(Referentiedatasoort):
     Urgentie wegens het vrijkomen uit detentie
     """
 
-    financieel = VoorrangdetailsoortReferentiedata(
+    financieel = VoorrangdetailsoortReferentiedata.model_construct(
         code="FIN",
         naam="Financieel",
         parent=Voorrangsoort.urgentie,
@@ -64,7 +64,7 @@ class Voorrangdetailsoort(Referentiedatasoort):
     Urgentie wegens financiele problemen
     """
 
-    gelijkvloers = VoorrangdetailsoortReferentiedata(
+    gelijkvloers = VoorrangdetailsoortReferentiedata.model_construct(
         code="GEL",
         naam="Gelijkvloers",
         parent=Voorrangsoort.indicatie,
@@ -73,16 +73,18 @@ class Voorrangdetailsoort(Referentiedatasoort):
     Indicatie voor een gelijkvloerse woning
     """
 
-    geweld_bedreiging_en_of_overlast = VoorrangdetailsoortReferentiedata(
-        code="GEW",
-        naam="Geweld bedreiging / overlast",
-        parent=Voorrangsoort.urgentie,
+    geweld_bedreiging_en_of_overlast = (
+        VoorrangdetailsoortReferentiedata.model_construct(
+            code="GEW",
+            naam="Geweld bedreiging / overlast",
+            parent=Voorrangsoort.urgentie,
+        )
     )
     """
     Urgentie wegens overlast uit de omgeving of bedreiging.
     """
 
-    herhuisvesting = VoorrangdetailsoortReferentiedata(
+    herhuisvesting = VoorrangdetailsoortReferentiedata.model_construct(
         code="HUI",
         naam="Herhuisvesting",
         parent=Voorrangsoort.urgentie,
@@ -91,7 +93,7 @@ class Voorrangdetailsoort(Referentiedatasoort):
     Urgentie wegens (langdurige) renovatie, nieuwbouw of sloop
     """
 
-    kern = VoorrangdetailsoortReferentiedata(
+    kern = VoorrangdetailsoortReferentiedata.model_construct(
         code="KRN",
         naam="Kern",
         parent=Voorrangsoort.binding,
@@ -100,7 +102,7 @@ class Voorrangdetailsoort(Referentiedatasoort):
     Kernbinding
     """
 
-    maatschappelijk = VoorrangdetailsoortReferentiedata(
+    maatschappelijk = VoorrangdetailsoortReferentiedata.model_construct(
         code="MAA",
         naam="Maatschappelijk",
         parent=Voorrangsoort.binding,
@@ -109,7 +111,7 @@ class Voorrangdetailsoort(Referentiedatasoort):
     Maatschappelijke binding
     """
 
-    mantelzorg = VoorrangdetailsoortReferentiedata(
+    mantelzorg = VoorrangdetailsoortReferentiedata.model_construct(
         code="MAN",
         naam="Mantelzorg",
         parent=Voorrangsoort.urgentie,
@@ -118,7 +120,7 @@ class Voorrangdetailsoort(Referentiedatasoort):
     Urgentie wegens het ontvangen of geven van mantelzorg
     """
 
-    medisch = VoorrangdetailsoortReferentiedata(
+    medisch = VoorrangdetailsoortReferentiedata.model_construct(
         code="MED",
         naam="Medisch",
         parent=Voorrangsoort.urgentie,
@@ -127,7 +129,7 @@ class Voorrangdetailsoort(Referentiedatasoort):
     Urgentie voor een aangepaste woning op medische gronden
     """
 
-    regio = VoorrangdetailsoortReferentiedata(
+    regio = VoorrangdetailsoortReferentiedata.model_construct(
         code="REG",
         naam="Regio",
         parent=Voorrangsoort.binding,
@@ -136,7 +138,7 @@ class Voorrangdetailsoort(Referentiedatasoort):
     Regionale of regio binding
     """
 
-    relationeel = VoorrangdetailsoortReferentiedata(
+    relationeel = VoorrangdetailsoortReferentiedata.model_construct(
         code="REL",
         naam="Relationeel",
         parent=Voorrangsoort.urgentie,
@@ -145,7 +147,7 @@ class Voorrangdetailsoort(Referentiedatasoort):
     Echtscheiding / verbroken relatie / gezinsproblemen /zwangerschap
     """
 
-    rollatorgeschikt = VoorrangdetailsoortReferentiedata(
+    rollatorgeschikt = VoorrangdetailsoortReferentiedata.model_construct(
         code="ROL",
         naam="Rollatorgeschikt",
         parent=Voorrangsoort.indicatie,
@@ -154,7 +156,7 @@ class Voorrangdetailsoort(Referentiedatasoort):
     Indicatie voor een rollatorgeschikte woning
     """
 
-    rolstoelgeschikt = VoorrangdetailsoortReferentiedata(
+    rolstoelgeschikt = VoorrangdetailsoortReferentiedata.model_construct(
         code="RST",
         naam="Rolstoelgeschikt",
         parent=Voorrangsoort.indicatie,
@@ -163,7 +165,7 @@ class Voorrangdetailsoort(Referentiedatasoort):
     Indicatie voor een rolstoelgeschikte woning
     """
 
-    servicewoning = VoorrangdetailsoortReferentiedata(
+    servicewoning = VoorrangdetailsoortReferentiedata.model_construct(
         code="SER",
         naam="Servicewoning",
         parent=Voorrangsoort.indicatie,
@@ -172,7 +174,7 @@ class Voorrangdetailsoort(Referentiedatasoort):
     Woningen bij een zorginstelling of verpleegcentrum.
     """
 
-    sociaal = VoorrangdetailsoortReferentiedata(
+    sociaal = VoorrangdetailsoortReferentiedata.model_construct(
         code="SOC",
         naam="Sociaal",
         parent=Voorrangsoort.urgentie,
@@ -182,7 +184,7 @@ class Voorrangdetailsoort(Referentiedatasoort):
     gezinsleden.
     """
 
-    statushouder = VoorrangdetailsoortReferentiedata(
+    statushouder = VoorrangdetailsoortReferentiedata.model_construct(
         code="STA",
         naam="Statushouder",
         parent=Voorrangsoort.urgentie,
@@ -191,10 +193,12 @@ class Voorrangdetailsoort(Referentiedatasoort):
     Urgentie wegens het verkrijgen van een verblijfsstatus
     """
 
-    uitstroom_maatschappelijke_instelling = VoorrangdetailsoortReferentiedata(
-        code="UIT",
-        naam="uitstroom maatschappelijke instelling",
-        parent=Voorrangsoort.urgentie,
+    uitstroom_maatschappelijke_instelling = (
+        VoorrangdetailsoortReferentiedata.model_construct(
+            code="UIT",
+            naam="uitstroom maatschappelijke instelling",
+            parent=Voorrangsoort.urgentie,
+        )
     )
     """
     Urgentie wegens het uitstromen bij een maatschappelijke instelling
@@ -7,7 +7,7 @@ class VoorrangsoortReferentiedata(Referentiedata):
 
 
 class Voorrangsoort(Referentiedatasoort):
-    binding = VoorrangsoortReferentiedata(
+    binding = VoorrangsoortReferentiedata.model_construct(
         code="BIN",
         naam="Binding",
     )
@@ -17,7 +17,7 @@ class Voorrangsoort(Referentiedatasoort):
     werken, lokaal voor mensen die in de gemeente wonen.
     """
 
-    groep = VoorrangsoortReferentiedata(
+    groep = VoorrangsoortReferentiedata.model_construct(
         code="GRO",
         naam="Groep",
     )
@@ -26,7 +26,7 @@ class Voorrangsoort(Referentiedatasoort):
     binding, urgentie of indicatie van toepassing is.
     """
 
-    indicatie = VoorrangsoortReferentiedata(
+    indicatie = VoorrangsoortReferentiedata.model_construct(
         code="IND",
         naam="Indicatie",
     )
@@ -34,7 +34,7 @@ class Voorrangsoort(Referentiedatasoort):
     Er is voorrang voor woningzoekenden met een (medische) indicatie.
     """
 
-    urgentie = VoorrangsoortReferentiedata(
+    urgentie = VoorrangsoortReferentiedata.model_construct(
         code="URG",
         naam="Urgentie",
     )
@@ -7,9 +7,11 @@ class VoorzieningsoortReferentiedata(Referentiedata):
 
 
 class Voorzieningsoort(Referentiedatasoort):
-    aanbelfunctie_met_video_en_audioverbinding = VoorzieningsoortReferentiedata(
-        code="ABF",
-        naam="Aanbelfunctie met video- en audioverbinding",
+    aanbelfunctie_met_video_en_audioverbinding = (
+        VoorzieningsoortReferentiedata.model_construct(
+            code="ABF",
+            naam="Aanbelfunctie met video- en audioverbinding",
+        )
     )
     """
     Een aanbelfunctie met video- en audioverbinding waarbij de voordeur automatisch kan
@@ -21,7 +23,7 @@ class Voorzieningsoort(Referentiedatasoort):
     geeft tot het complex waarvan de woning onderdeel uitmaakt.
     """
 
-    inbouw_afzuiginstallatie = VoorzieningsoortReferentiedata(
+    inbouw_afzuiginstallatie = VoorzieningsoortReferentiedata.model_construct(
         code="IAF",
         naam="Inbouw afzuiginstallatie",
     )
@@ -32,7 +34,7 @@ class Voorzieningsoort(Referentiedatasoort):
     kookinstallatie zijn, als een in het aanrecht geïntegreerd afzuigsysteem.
     """
 
-    inbouw_kookplaat_inductie = VoorzieningsoortReferentiedata(
+    inbouw_kookplaat_inductie = VoorzieningsoortReferentiedata.model_construct(
         code="IKI",
         naam="Inbouw kookplaat inductie",
     )
@@ -43,7 +45,7 @@ class Voorzieningsoort(Referentiedatasoort):
     energie-efficiëntie in vergelijking met traditionele kookplaten.
     """
 
-    inbouw_kookplaat_keramisch = VoorzieningsoortReferentiedata(
+    inbouw_kookplaat_keramisch = VoorzieningsoortReferentiedata.model_construct(
         code="IKK",
         naam="Inbouw kookplaat keramisch",
     )
@@ -54,7 +56,7 @@ class Voorzieningsoort(Referentiedatasoort):
     schoon te maken is, maar trager opwarmt dan inductie.
     """
 
-    inbouw_kookplaat_gas = VoorzieningsoortReferentiedata(
+    inbouw_kookplaat_gas = VoorzieningsoortReferentiedata.model_construct(
         code="IKG",
         naam="Inbouw kookplaat gas",
     )
@@ -65,7 +67,7 @@ class Voorzieningsoort(Referentiedatasoort):
     kookgerei, maar vereist gasaanvoer en ventilatie.
     """
 
-    inbouw_koelkast = VoorzieningsoortReferentiedata(
+    inbouw_koelkast = VoorzieningsoortReferentiedata.model_construct(
         code="IKO",
         naam="Inbouw koelkast",
     )
@@ -76,7 +78,7 @@ class Voorzieningsoort(Referentiedatasoort):
     uitstraling in de keuken.
     """
 
-    inbouw_vrieskast = VoorzieningsoortReferentiedata(
+    inbouw_vrieskast = VoorzieningsoortReferentiedata.model_construct(
         code="IVR",
         naam="Inbouw vrieskast",
     )
@@ -87,7 +89,7 @@ class Voorzieningsoort(Referentiedatasoort):
     uniforme uitstraling in de keuken.
     """
 
-    inbouw_oven_elektrisch = VoorzieningsoortReferentiedata(
+    inbouw_oven_elektrisch = VoorzieningsoortReferentiedata.model_construct(
         code="IOE",
         naam="Inbouw oven elektrisch",
     )
@@ -98,7 +100,7 @@ class Voorzieningsoort(Referentiedatasoort):
     programma's voor diverse kookmethoden.
     """
 
-    inbouw_oven_gas = VoorzieningsoortReferentiedata(
+    inbouw_oven_gas = VoorzieningsoortReferentiedata.model_construct(
         code="IOG",
         naam="Inbouw oven gas",
     )
@@ -109,7 +111,7 @@ class Voorzieningsoort(Referentiedatasoort):
     vereist gasaanvoer.
     """
 
-    inbouw_magnetron = VoorzieningsoortReferentiedata(
+    inbouw_magnetron = VoorzieningsoortReferentiedata.model_construct(
         code="IMA",
         naam="Inbouw magnetron",
     )
@@ -120,7 +122,7 @@ class Voorzieningsoort(Referentiedatasoort):
     uitstraling in de keuken.
     """
 
-    inbouw_vaatwasmachine = VoorzieningsoortReferentiedata(
+    inbouw_vaatwasmachine = VoorzieningsoortReferentiedata.model_construct(
         code="IVA",
         naam="Inbouw vaatwasmachine",
     )
@@ -131,15 +133,17 @@ class Voorzieningsoort(Referentiedatasoort):
     uitstraling van de keuken.
     """
 
-    extra_keukenkastruimte_boven_het_minimum = VoorzieningsoortReferentiedata(
-        code="EKA",
-        naam="Extra keukenkastruimte boven het minimum",
+    extra_keukenkastruimte_boven_het_minimum = (
+        VoorzieningsoortReferentiedata.model_construct(
+            code="EKA",
+            naam="Extra keukenkastruimte boven het minimum",
+        )
     )
     """
     per 60 cm breedte, met een minimum van 60 cm hoogte
     """
 
-    eenhandsmengkraan = VoorzieningsoortReferentiedata(
+    eenhandsmengkraan = VoorzieningsoortReferentiedata.model_construct(
         code="EHM",
         naam="Éénhandsmengkraan",
     )
@@ -150,7 +154,7 @@ class Voorzieningsoort(Referentiedatasoort):
     elke keuken of badkamer.
     """
 
-    thermostatische_mengkraan = VoorzieningsoortReferentiedata(
+    thermostatische_mengkraan = VoorzieningsoortReferentiedata.model_construct(
         code="TME",
         naam="Thermostatische mengkraan",
     )
@@ -161,7 +165,7 @@ class Voorzieningsoort(Referentiedatasoort):
     of keuken.
     """
 
-    kokend_waterfunctie = VoorzieningsoortReferentiedata(
+    kokend_waterfunctie = VoorzieningsoortReferentiedata.model_construct(
         code="KWA",
         naam="Kokend waterfunctie",
     )
@@ -172,7 +176,7 @@ class Voorzieningsoort(Referentiedatasoort):
     apart of in aanvulling op de kraan
     """
 
-    staand_toilet = VoorzieningsoortReferentiedata(
+    staand_toilet = VoorzieningsoortReferentiedata.model_construct(
         code="STO",
         naam="Staand Toilet",
     )
@@ -185,7 +189,7 @@ class Voorzieningsoort(Referentiedatasoort):
     niet in aanmerking voor waardering.
     """
 
-    hangend_toilet = VoorzieningsoortReferentiedata(
+    hangend_toilet = VoorzieningsoortReferentiedata.model_construct(
         code="HTO",
         naam="Hangend toilet",
     )
@@ -198,7 +202,7 @@ class Voorzieningsoort(Referentiedatasoort):
     toiletruimten en badkamers komen niet in aanmerking voor waardering.
     """
 
-    wastafel = VoorzieningsoortReferentiedata(
+    wastafel = VoorzieningsoortReferentiedata.model_construct(
         code="WAS",
         naam="Wastafel",
     )
@@ -214,7 +218,7 @@ class Voorzieningsoort(Referentiedatasoort):
     keer per vertrek of overige ruimte, m.u.v. de badkamer.
     """
 
-    meerpersoonswastafel = VoorzieningsoortReferentiedata(
+    meerpersoonswastafel = VoorzieningsoortReferentiedata.model_construct(
         code="MPW",
         naam="Meerpersoonswastafel",
     )
@@ -228,7 +232,7 @@ class Voorzieningsoort(Referentiedatasoort):
     afzonderlijk gewaardeerd.
     """
 
-    douche = VoorzieningsoortReferentiedata(
+    douche = VoorzieningsoortReferentiedata.model_construct(
         code="DOU",
         naam="Douche",
     )
@@ -245,7 +249,7 @@ class Voorzieningsoort(Referentiedatasoort):
     douchecabine ingenomen oppervlakte.
     """
 
-    bad = VoorzieningsoortReferentiedata(
+    bad = VoorzieningsoortReferentiedata.model_construct(
         code="BAD",
         naam="Bad",
     )
@@ -259,7 +263,7 @@ class Voorzieningsoort(Referentiedatasoort):
     douchegarnituur niet afzonderlijk geteld.
     """
 
-    bad_en_douche = VoorzieningsoortReferentiedata(
+    bad_en_douche = VoorzieningsoortReferentiedata.model_construct(
         code="BDO",
         naam="Bad en douche",
     )
@@ -268,7 +272,7 @@ class Voorzieningsoort(Referentiedatasoort):
     aangebracht, geldt een afwijkende waardering.
     """
 
-    bubbelfunctie_van_het_bad = VoorzieningsoortReferentiedata(
+    bubbelfunctie_van_het_bad = VoorzieningsoortReferentiedata.model_construct(
         code="BUB",
         naam="Bubbelfunctie van het bad",
     )
@@ -279,7 +283,7 @@ class Voorzieningsoort(Referentiedatasoort):
     bieden.
     """
 
-    douchewand = VoorzieningsoortReferentiedata(
+    douchewand = VoorzieningsoortReferentiedata.model_construct(
         code="DOW",
         naam="Douchewand",
     )
@@ -292,7 +296,7 @@ class Voorzieningsoort(Referentiedatasoort):
     worden) niet.
     """
 
-    handdoekenradiator = VoorzieningsoortReferentiedata(
+    handdoekenradiator = VoorzieningsoortReferentiedata.model_construct(
         code="HRA",
         naam="Handdoekenradiator",
     )
@@ -303,9 +307,11 @@ class Voorzieningsoort(Referentiedatasoort):
     voor een aangename temperatuur.
     """
 
-    ingebouwd_kastje_met_in_of_opgebouwde_wastafel = VoorzieningsoortReferentiedata(
-        code="IKW",
-        naam="Ingebouwd kastje met in- of opgebouwde wastafel",
+    ingebouwd_kastje_met_in_of_opgebouwde_wastafel = (
+        VoorzieningsoortReferentiedata.model_construct(
+            code="IKW",
+            naam="Ingebouwd kastje met in- of opgebouwde wastafel",
+        )
     )
     """
     Een ingebouwd kastje met wastafel is een geïntegreerde opberg- en wastafeloplossing
@@ -313,7 +319,7 @@ class Voorzieningsoort(Referentiedatasoort):
     een gestroomlijnde uitstraling en praktische opslag in badkamers of keukens.
     """
 
-    kastruimte = VoorzieningsoortReferentiedata(
+    kastruimte = VoorzieningsoortReferentiedata.model_construct(
         code="KAS",
         naam="Kastruimte",
     )
@@ -321,7 +327,7 @@ class Voorzieningsoort(Referentiedatasoort):
     Kastruimte met een minimale breedte van 40cm, en minimale hoogte van 40cm.
     """
 
-    stopcontact_bij_wastafel = VoorzieningsoortReferentiedata(
+    stopcontact_bij_wastafel = VoorzieningsoortReferentiedata.model_construct(
         code="STW",
         naam="Stopcontact bij wastafel",
     )
@@ -7,7 +7,7 @@ class VragenlijstregelherkomstReferentiedata(Referentiedata):
 
 
 class Vragenlijstregelherkomst(Referentiedatasoort):
-    aedes_benchmark = VragenlijstregelherkomstReferentiedata(
+    aedes_benchmark = VragenlijstregelherkomstReferentiedata.model_construct(
         code="AED",
         naam="Aedes-benchmark",
     )
@@ -15,7 +15,7 @@ class Vragenlijstregelherkomst(Referentiedatasoort):
     De herkomst van de vraag is van de Aedes benchmark.
     """
 
-    kwh_keurmerk = VragenlijstregelherkomstReferentiedata(
+    kwh_keurmerk = VragenlijstregelherkomstReferentiedata.model_construct(
         code="KWH",
         naam="KWH Keurmerk",
     )
@@ -23,7 +23,7 @@ class Vragenlijstregelherkomst(Referentiedatasoort):
     De herkomst van de vraag is van KWH in het kader van het eigen keurmerk.
     """
 
-    eigen_vraag = VragenlijstregelherkomstReferentiedata(
+    eigen_vraag = VragenlijstregelherkomstReferentiedata.model_construct(
         code="EIG",
         naam="Eigen vraag",
     )
@@ -7,7 +7,7 @@ class VragenlijstregelonderwerpsoortReferentiedata(Referentiedata):
 
 
 class Vragenlijstregelonderwerpsoort(Referentiedatasoort):
-    aanbod = VragenlijstregelonderwerpsoortReferentiedata(
+    aanbod = VragenlijstregelonderwerpsoortReferentiedata.model_construct(
         code="AAN",
         naam="Aanbod",
     )
@@ -15,7 +15,7 @@ class Vragenlijstregelonderwerpsoort(Referentiedatasoort):
     Vraag behoort bij onderwerp: aanbod
     """
 
-    afrekening = VragenlijstregelonderwerpsoortReferentiedata(
+    afrekening = VragenlijstregelonderwerpsoortReferentiedata.model_construct(
         code="AFR",
         naam="Afrekening",
     )
@@ -23,7 +23,7 @@ class Vragenlijstregelonderwerpsoort(Referentiedatasoort):
     Vraag behoort bij onderwerp: afrekening
     """
 
-    afspraak = VragenlijstregelonderwerpsoortReferentiedata(
+    afspraak = VragenlijstregelonderwerpsoortReferentiedata.model_construct(
         code="AFS",
         naam="Afspraak",
     )
@@ -31,7 +31,7 @@ class Vragenlijstregelonderwerpsoort(Referentiedatasoort):
     Vraag behoort bij onderwerp: afspraak
     """
 
-    algemene_ruimte = VragenlijstregelonderwerpsoortReferentiedata(
+    algemene_ruimte = VragenlijstregelonderwerpsoortReferentiedata.model_construct(
         code="ALG",
         naam="Algemene ruimte",
     )
@@ -39,7 +39,7 @@ class Vragenlijstregelonderwerpsoort(Referentiedatasoort):
     Vraag behoort bij onderwerp: algemene ruimte
     """
 
-    behulpzaamheid = VragenlijstregelonderwerpsoortReferentiedata(
+    behulpzaamheid = VragenlijstregelonderwerpsoortReferentiedata.model_construct(
         code="BEH",
         naam="Behulpzaamheid",
     )
@@ -47,15 +47,17 @@ class Vragenlijstregelonderwerpsoort(Referentiedatasoort):
     Vraag behoort bij onderwerp: behulpzaamheid
     """
 
-    behulpzaamheid_aannemer = VragenlijstregelonderwerpsoortReferentiedata(
-        code="BEA",
-        naam="Behulpzaamheid aannemer",
+    behulpzaamheid_aannemer = (
+        VragenlijstregelonderwerpsoortReferentiedata.model_construct(
+            code="BEA",
+            naam="Behulpzaamheid aannemer",
+        )
     )
     """
     Vraag behoort bij onderwerp: behulpzaamheid aannemer
     """
 
-    bel = VragenlijstregelonderwerpsoortReferentiedata(
+    bel = VragenlijstregelonderwerpsoortReferentiedata.model_construct(
         code="BEL",
         naam="BEL",
     )
@@ -63,7 +65,7 @@ class Vragenlijstregelonderwerpsoort(Referentiedatasoort):
     Vraag behoort bij onderwerp: belofte
     """
 
-    besluit = VragenlijstregelonderwerpsoortReferentiedata(
+    besluit = VragenlijstregelonderwerpsoortReferentiedata.model_construct(
         code="BES",
         naam="Besluit",
     )
@@ -71,7 +73,7 @@ class Vragenlijstregelonderwerpsoort(Referentiedatasoort):
     Vraag behoort bij onderwerp: besluit
     """
 
-    buurt = VragenlijstregelonderwerpsoortReferentiedata(
+    buurt = VragenlijstregelonderwerpsoortReferentiedata.model_construct(
         code="BUU",
         naam="Buurt",
     )
@@ -79,7 +81,7 @@ class Vragenlijstregelonderwerpsoort(Referentiedatasoort):
     Vraag behoort bij onderwerp: buurt
     """
 
-    buurt_motivatie = VragenlijstregelonderwerpsoortReferentiedata(
+    buurt_motivatie = VragenlijstregelonderwerpsoortReferentiedata.model_construct(
         code="BUM",
         naam="Buurt motivatie",
     )
@@ -87,7 +89,7 @@ class Vragenlijstregelonderwerpsoort(Referentiedatasoort):
     Vraag behoort bij onderwerp: buurt motivatie
     """
 
-    customereffortscore = VragenlijstregelonderwerpsoortReferentiedata(
+    customereffortscore = VragenlijstregelonderwerpsoortReferentiedata.model_construct(
         code="CES",
         naam="CustomerEffortScore",
     )
@@ -95,7 +97,7 @@ class Vragenlijstregelonderwerpsoort(Referentiedatasoort):
     Vraag behoort bij onderwerp: Customer Effort Score
     """
 
-    contact = VragenlijstregelonderwerpsoortReferentiedata(
+    contact = VragenlijstregelonderwerpsoortReferentiedata.model_construct(
         code="CON",
         naam="Contact",
     )
@@ -103,7 +105,7 @@ class Vragenlijstregelonderwerpsoort(Referentiedatasoort):
     Vraag behoort bij contact: aanbod
     """
 
-    deskundigheid = VragenlijstregelonderwerpsoortReferentiedata(
+    deskundigheid = VragenlijstregelonderwerpsoortReferentiedata.model_construct(
         code="DES",
         naam="Deskundigheid",
     )
@@ -111,7 +113,7 @@ class Vragenlijstregelonderwerpsoort(Referentiedatasoort):
     Vraag behoort bij onderwerp: deskundigheid
     """
 
-    dienstverlening = VragenlijstregelonderwerpsoortReferentiedata(
+    dienstverlening = VragenlijstregelonderwerpsoortReferentiedata.model_construct(
         code="DIE",
         naam="Dienstverlening",
     )
@@ -119,7 +121,7 @@ class Vragenlijstregelonderwerpsoort(Referentiedatasoort):
     Vraag behoort bij onderwerp: dienstverlening
     """
 
-    duidelijkheid = VragenlijstregelonderwerpsoortReferentiedata(
+    duidelijkheid = VragenlijstregelonderwerpsoortReferentiedata.model_construct(
         code="DUI",
         naam="Duidelijkheid",
     )
@@ -127,7 +129,7 @@ class Vragenlijstregelonderwerpsoort(Referentiedatasoort):
     Vraag behoort bij onderwerp: duidelijkheid
     """
 
-    eindopname = VragenlijstregelonderwerpsoortReferentiedata(
+    eindopname = VragenlijstregelonderwerpsoortReferentiedata.model_construct(
         code="EIN",
         naam="Eindopname",
     )
@@ -135,7 +137,7 @@ class Vragenlijstregelonderwerpsoort(Referentiedatasoort):
     Vraag behoort bij onderwerp: eindopname
     """
 
-    gemak = VragenlijstregelonderwerpsoortReferentiedata(
+    gemak = VragenlijstregelonderwerpsoortReferentiedata.model_construct(
         code="GEM",
         naam="Gemak",
     )
@@ -143,7 +145,7 @@ class Vragenlijstregelonderwerpsoort(Referentiedatasoort):
     Vraag behoort bij onderwerp: gemak
     """
 
-    informatie = VragenlijstregelonderwerpsoortReferentiedata(
+    informatie = VragenlijstregelonderwerpsoortReferentiedata.model_construct(
         code="INF",
         naam="Informatie",
     )
@@ -151,7 +153,7 @@ class Vragenlijstregelonderwerpsoort(Referentiedatasoort):
     Vraag behoort bij onderwerp: informatie
     """
 
-    medewerker = VragenlijstregelonderwerpsoortReferentiedata(
+    medewerker = VragenlijstregelonderwerpsoortReferentiedata.model_construct(
         code="MED",
         naam="Medewerker",
     )
@@ -159,7 +161,7 @@ class Vragenlijstregelonderwerpsoort(Referentiedatasoort):
     Vraag behoort bij onderwerp: medewerker
     """
 
-    monteur = VragenlijstregelonderwerpsoortReferentiedata(
+    monteur = VragenlijstregelonderwerpsoortReferentiedata.model_construct(
         code="MON",
         naam="Monteur",
     )
@@ -167,7 +169,7 @@ class Vragenlijstregelonderwerpsoort(Referentiedatasoort):
     Vraag behoort bij onderwerp: monteur
     """
 
-    netheid = VragenlijstregelonderwerpsoortReferentiedata(
+    netheid = VragenlijstregelonderwerpsoortReferentiedata.model_construct(
         code="NET",
         naam="Netheid",
     )
@@ -175,7 +177,7 @@ class Vragenlijstregelonderwerpsoort(Referentiedatasoort):
     Vraag behoort bij onderwerp: netheid
     """
 
-    oplevering = VragenlijstregelonderwerpsoortReferentiedata(
+    oplevering = VragenlijstregelonderwerpsoortReferentiedata.model_construct(
         code="OLE",
         naam="Oplevering",
     )
@@ -183,7 +185,7 @@ class Vragenlijstregelonderwerpsoort(Referentiedatasoort):
     Vraag behoort bij onderwerp: oplevering
     """
 
-    oplossing = VragenlijstregelonderwerpsoortReferentiedata(
+    oplossing = VragenlijstregelonderwerpsoortReferentiedata.model_construct(
         code="OPL",
         naam="Oplossing",
     )
@@ -191,7 +193,7 @@ class Vragenlijstregelonderwerpsoort(Referentiedatasoort):
     Vraag behoort bij onderwerp: oplossing
     """
 
-    resultaat = VragenlijstregelonderwerpsoortReferentiedata(
+    resultaat = VragenlijstregelonderwerpsoortReferentiedata.model_construct(
         code="RES",
         naam="Resultaat",
     )
@@ -199,7 +201,7 @@ class Vragenlijstregelonderwerpsoort(Referentiedatasoort):
     Vraag behoort bij onderwerp: resultaat
     """
 
-    snelheid = VragenlijstregelonderwerpsoortReferentiedata(
+    snelheid = VragenlijstregelonderwerpsoortReferentiedata.model_construct(
         code="SNE",
         naam="Snelheid",
     )
@@ -207,7 +209,7 @@ class Vragenlijstregelonderwerpsoort(Referentiedatasoort):
     Vraag behoort bij onderwerp: snelheid
     """
 
-    staat = VragenlijstregelonderwerpsoortReferentiedata(
+    staat = VragenlijstregelonderwerpsoortReferentiedata.model_construct(
         code="STA",
         naam="Staat",
     )
@@ -215,7 +217,7 @@ class Vragenlijstregelonderwerpsoort(Referentiedatasoort):
     Vraag behoort bij onderwerp: staat
     """
 
-    termijn = VragenlijstregelonderwerpsoortReferentiedata(
+    termijn = VragenlijstregelonderwerpsoortReferentiedata.model_construct(
         code="TER",
         naam="Termijn",
     )
@@ -223,7 +225,7 @@ class Vragenlijstregelonderwerpsoort(Referentiedatasoort):
     Vraag behoort bij onderwerp: termijn
     """
 
-    tijdstip = VragenlijstregelonderwerpsoortReferentiedata(
+    tijdstip = VragenlijstregelonderwerpsoortReferentiedata.model_construct(
         code="TIJ",
         naam="Tijdstip",
     )
@@ -231,7 +233,7 @@ class Vragenlijstregelonderwerpsoort(Referentiedatasoort):
     Vraag behoort bij onderwerp: tijdstip
     """
 
-    uitleg = VragenlijstregelonderwerpsoortReferentiedata(
+    uitleg = VragenlijstregelonderwerpsoortReferentiedata.model_construct(
         code="UIT",
         naam="Uitleg",
     )
@@ -239,7 +241,7 @@ class Vragenlijstregelonderwerpsoort(Referentiedatasoort):
     Vraag behoort bij onderwerp: uitleg
     """
 
-    verloop = VragenlijstregelonderwerpsoortReferentiedata(
+    verloop = VragenlijstregelonderwerpsoortReferentiedata.model_construct(
         code="VER",
         naam="Verloop",
     )
@@ -247,7 +249,7 @@ class Vragenlijstregelonderwerpsoort(Referentiedatasoort):
     Vraag behoort bij onderwerp: verloop
     """
 
-    vooropname = VragenlijstregelonderwerpsoortReferentiedata(
+    vooropname = VragenlijstregelonderwerpsoortReferentiedata.model_construct(
         code="VOO",
         naam="Vooropname",
     )
@@ -255,7 +257,7 @@ class Vragenlijstregelonderwerpsoort(Referentiedatasoort):
     Vraag behoort bij onderwerp: vooropname
     """
 
-    website = VragenlijstregelonderwerpsoortReferentiedata(
+    website = VragenlijstregelonderwerpsoortReferentiedata.model_construct(
         code="WEB",
         naam="Website",
     )
@@ -263,7 +265,7 @@ class Vragenlijstregelonderwerpsoort(Referentiedatasoort):
     Vraag behoort bij onderwerp: website
     """
 
-    weten = VragenlijstregelonderwerpsoortReferentiedata(
+    weten = VragenlijstregelonderwerpsoortReferentiedata.model_construct(
         code="WET",
         naam="Weten",
     )
@@ -271,7 +273,7 @@ class Vragenlijstregelonderwerpsoort(Referentiedatasoort):
     Vraag behoort bij onderwerp: weten
     """
 
-    weten_aannemer = VragenlijstregelonderwerpsoortReferentiedata(
+    weten_aannemer = VragenlijstregelonderwerpsoortReferentiedata.model_construct(
         code="WEA",
         naam="Weten aannemer",
     )
@@ -279,7 +281,7 @@ class Vragenlijstregelonderwerpsoort(Referentiedatasoort):
     Vraag behoort bij onderwerp: weten aannemer
     """
 
-    woning = VragenlijstregelonderwerpsoortReferentiedata(
+    woning = VragenlijstregelonderwerpsoortReferentiedata.model_construct(
         code="WON",
         naam="Woning",
     )
@@ -287,7 +289,7 @@ class Vragenlijstregelonderwerpsoort(Referentiedatasoort):
     Vraag behoort bij onderwerp: woning
     """
 
-    woning_motivatie = VragenlijstregelonderwerpsoortReferentiedata(
+    woning_motivatie = VragenlijstregelonderwerpsoortReferentiedata.model_construct(
         code="WOM",
         naam="Woning motivatie",
     )
@@ -7,7 +7,7 @@ class WoningwaarderingstelselReferentiedata(Referentiedata):
 
 
 class Woningwaarderingstelsel(Referentiedatasoort):
-    onzelfstandige_woonruimten = WoningwaarderingstelselReferentiedata(
+    onzelfstandige_woonruimten = WoningwaarderingstelselReferentiedata.model_construct(
         code="ONZ",
         naam="Onzelfstandige woonruimten",
     )
@@ -16,7 +16,7 @@ class Woningwaarderingstelsel(Referentiedatasoort):
     onzelfstandig woonruimten
     """
 
-    standplaatsen = WoningwaarderingstelselReferentiedata(
+    standplaatsen = WoningwaarderingstelselReferentiedata.model_construct(
         code="STA",
         naam="Standplaatsen",
     )
@@ -25,7 +25,7 @@ class Woningwaarderingstelsel(Referentiedatasoort):
     standplaatsen
     """
 
-    woonwagens = WoningwaarderingstelselReferentiedata(
+    woonwagens = WoningwaarderingstelselReferentiedata.model_construct(
         code="WOO",
         naam="Woonwagens",
     )
@@ -34,7 +34,7 @@ class Woningwaarderingstelsel(Referentiedatasoort):
     woonwagens
     """
 
-    zelfstandige_woonruimten = WoningwaarderingstelselReferentiedata(
+    zelfstandige_woonruimten = WoningwaarderingstelselReferentiedata.model_construct(
         code="ZEL",
         naam="Zelfstandige woonruimten",
     )
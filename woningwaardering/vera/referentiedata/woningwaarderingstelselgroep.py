@@ -10,10 +10,12 @@ class WoningwaarderingstelselgroepReferentiedata(Referentiedata):
 
 
 class Woningwaarderingstelselgroep(Referentiedatasoort):
-    bijzondere_voorzieningen = WoningwaarderingstelselgroepReferentiedata(
-        code="BIJ",
-        naam="Bijzondere voorzieningen",
-        parent=Woningwaarderingstelsel.zelfstandige_woonruimten,
+    bijzondere_voorzieningen = (
+        WoningwaarderingstelselgroepReferentiedata.model_construct(
+            code="BIJ",
+            naam="Bijzondere voorzieningen",
+            parent=Woningwaarderingstelsel.zelfstandige_woonruimten,
+        )
     )
     """
     De groep criteria die betrekking heeft op de aanwezigheid van bijzondere
@@ -21,7 +23,7 @@ class Woningwaarderingstelselgroep(Referentiedatasoort):
     Waarderingsstelsel zelfstandige woonruimte)
     """
 
-    beschermd_monument_bmo = WoningwaarderingstelselgroepReferentiedata(
+    beschermd_monument_bmo = WoningwaarderingstelselgroepReferentiedata.model_construct(
         code="BMO",
         naam="Beschermd monument",
         parent=Woningwaarderingstelsel.onzelfstandige_woonruimten,
@@ -31,7 +33,7 @@ class Woningwaarderingstelselgroep(Referentiedatasoort):
     van een rijksmonument (Beleidsboek Waarderingsstelsel onzelfstandige woonruimte)
     """
 
-    beschermd_monument_bmz = WoningwaarderingstelselgroepReferentiedata(
+    beschermd_monument_bmz = WoningwaarderingstelselgroepReferentiedata.model_construct(
         code="BMZ",
         naam="Beschermd monument",
         parent=Woningwaarderingstelsel.zelfstandige_woonruimten,
@@ -41,7 +43,7 @@ class Woningwaarderingstelselgroep(Referentiedatasoort):
     van een rijksmonument (Beleidsboek Waarderingsstelsel zelfstandige woonruimte)
     """
 
-    berging = WoningwaarderingstelselgroepReferentiedata(
+    berging = WoningwaarderingstelselgroepReferentiedata.model_construct(
         code="BWN",
         naam="Berging",
         parent=Woningwaarderingstelsel.woonwagens,
@@ -51,7 +53,7 @@ class Woningwaarderingstelselgroep(Referentiedatasoort):
     van een berging (Puntentelling: woonwagen/standplaats: Huurcommissie)
     """
 
-    energieprestatie = WoningwaarderingstelselgroepReferentiedata(
+    energieprestatie = WoningwaarderingstelselgroepReferentiedata.model_construct(
         code="ENE",
         naam="Energieprestatie",
     )
@@ -61,7 +63,7 @@ class Woningwaarderingstelselgroep(Referentiedatasoort):
     """
 
     extra_punten_woonoppervlakte_standplaats = (
-        WoningwaarderingstelselgroepReferentiedata(
+        WoningwaarderingstelselgroepReferentiedata.model_construct(
             code="EOS",
             naam="Extra punten woonoppervlakte standplaats",
             parent=Woningwaarderingstelsel.standplaatsen,
@@ -72,9 +74,11 @@ class Woningwaarderingstelselgroep(Referentiedatasoort):
     meer dan 200m2 bedraagt (Puntentelling: woonwagen/standplaats: Huurcommissie)
     """
 
-    woonvoorzieningen_voor_gehandicapten = WoningwaarderingstelselgroepReferentiedata(
-        code="GEH",
-        naam="Woonvoorzieningen voor gehandicapten",
+    woonvoorzieningen_voor_gehandicapten = (
+        WoningwaarderingstelselgroepReferentiedata.model_construct(
+            code="GEH",
+            naam="Woonvoorzieningen voor gehandicapten",
+        )
     )
     """
     De groep criteria die betrekking heeft op ingrepen die zijn gedaan ten behoeve van
@@ -82,7 +86,7 @@ class Woningwaarderingstelselgroep(Referentiedatasoort):
     """
 
     voorzieningen_gehandicapten_standplaats = (
-        WoningwaarderingstelselgroepReferentiedata(
+        WoningwaarderingstelselgroepReferentiedata.model_construct(
             code="GST",
             naam="Voorzieningen gehandicapten standplaats",
             parent=Woningwaarderingstelsel.standplaatsen,
@@ -95,7 +99,7 @@ class Woningwaarderingstelselgroep(Referentiedatasoort):
     """
 
     voorzieningen_gehandicapten_niet_standaardwoonwagen = (
-        WoningwaarderingstelselgroepReferentiedata(
+        WoningwaarderingstelselgroepReferentiedata.model_construct(
             code="GWN",
             naam="Voorzieningen gehandicapten niet-standaardwoonwagen",
             parent=Woningwaarderingstelsel.woonwagens,
@@ -108,7 +112,7 @@ class Woningwaarderingstelselgroep(Referentiedatasoort):
     """
 
     voorzieningen_gehandicapten_standaardwoonwagen = (
-        WoningwaarderingstelselgroepReferentiedata(
+        WoningwaarderingstelselgroepReferentiedata.model_construct(
             code="GWS",
             naam="Voorzieningen gehandicapten standaardwoonwagen",
             parent=Woningwaarderingstelsel.woonwagens,
@@ -120,7 +124,7 @@ class Woningwaarderingstelselgroep(Referentiedatasoort):
     woonwagen/standplaats: Huurcommissie)
     """
 
-    keuken = WoningwaarderingstelselgroepReferentiedata(
+    keuken = WoningwaarderingstelselgroepReferentiedata.model_construct(
         code="KEU",
         naam="Keuken",
     )
@@ -129,7 +133,7 @@ class Woningwaarderingstelselgroep(Referentiedatasoort):
     zelfstandige woonruimte)
     """
 
-    kookgelegenheid = WoningwaarderingstelselgroepReferentiedata(
+    kookgelegenheid = WoningwaarderingstelselgroepReferentiedata.model_construct(
         code="KOO",
         naam="Kookgelegenheid",
         parent=Woningwaarderingstelsel.onzelfstandige_woonruimten,
@@ -140,7 +144,7 @@ class Woningwaarderingstelselgroep(Referentiedatasoort):
     """
 
     extra_kwaliteit_keuken_en_sanitair_standplaats = (
-        WoningwaarderingstelselgroepReferentiedata(
+        WoningwaarderingstelselgroepReferentiedata.model_construct(
             code="KST",
             naam="Extra kwaliteit keuken en sanitair standplaats",
             parent=Woningwaarderingstelsel.standplaatsen,
@@ -151,7 +155,7 @@ class Woningwaarderingstelselgroep(Referentiedatasoort):
     sanitair  (Puntentelling: woonwagen/standplaats: Huurcommissie)
     """
 
-    kwaliteitsfactoren = WoningwaarderingstelselgroepReferentiedata(
+    kwaliteitsfactoren = WoningwaarderingstelselgroepReferentiedata.model_construct(
         code="KWA",
         naam="Kwaliteitsfactoren",
         parent=Woningwaarderingstelsel.onzelfstandige_woonruimten,
@@ -162,7 +166,7 @@ class Woningwaarderingstelselgroep(Referentiedatasoort):
     """
 
     keuken_en_sanitair_niet_standaardwoonwagen = (
-        WoningwaarderingstelselgroepReferentiedata(
+        WoningwaarderingstelselgroepReferentiedata.model_construct(
             code="KWN",
             naam="Keuken en sanitair niet-standaardwoonwagen",
             parent=Woningwaarderingstelsel.woonwagens,
@@ -174,7 +178,7 @@ class Woningwaarderingstelselgroep(Referentiedatasoort):
     """
 
     extra_kwaliteit_keuken_en_sanitair_standaardwoonwagen = (
-        WoningwaarderingstelselgroepReferentiedata(
+        WoningwaarderingstelselgroepReferentiedata.model_construct(
             code="KWS",
             naam="Extra kwaliteit keuken en sanitair standaardwoonwagen",
             parent=Woningwaarderingstelsel.woonwagens,
@@ -185,19 +189,23 @@ class Woningwaarderingstelselgroep(Referentiedatasoort):
     keuken en sanitair  (Puntentelling: woonwagen/standplaats: Huurcommissie)
     """
 
-    minpunten_woonomgeving_standplaats = WoningwaarderingstelselgroepReferentiedata(
-        code="MWS",
-        naam="Minpunten woonomgeving standplaats",
-        parent=Woningwaarderingstelsel.standplaatsen,
+    minpunten_woonomgeving_standplaats = (
+        WoningwaarderingstelselgroepReferentiedata.model_construct(
+            code="MWS",
+            naam="Minpunten woonomgeving standplaats",
+            parent=Woningwaarderingstelsel.standplaatsen,
+        )
     )
     """
     Standplaats: De groep criteria die betrekking heeft op hinderlijke situaties in de
     woonomgeving (Puntentelling: woonwagen/standplaats: Huurcommissie)
     """
 
-    oppervlakte_van_overige_ruimten = WoningwaarderingstelselgroepReferentiedata(
-        code="OOZ",
-        naam="Oppervlakte van overige ruimten",
+    oppervlakte_van_overige_ruimten = (
+        WoningwaarderingstelselgroepReferentiedata.model_construct(
+            code="OOZ",
+            naam="Oppervlakte van overige ruimten",
+        )
     )
     """
     Tot deze ruimten worden gerekend: bijkeukens, bergingen, wasruimten, schuren,
@@ -205,10 +213,12 @@ class Woningwaarderingstelselgroep(Referentiedatasoort):
     woonruimte)
     """
 
-    oppervlakte_onzelfstandige_woonruimte = WoningwaarderingstelselgroepReferentiedata(
-        code="OPO",
-        naam="Oppervlakte onzelfstandige woonruimte",
-        parent=Woningwaarderingstelsel.onzelfstandige_woonruimten,
+    oppervlakte_onzelfstandige_woonruimte = (
+        WoningwaarderingstelselgroepReferentiedata.model_construct(
+            code="OPO",
+            naam="Oppervlakte onzelfstandige woonruimte",
+            parent=Woningwaarderingstelsel.onzelfstandige_woonruimten,
+        )
     )
     """
     De groep criteria die betrekking heeft op de oppervlakte van kamers en keukens, en
@@ -216,46 +226,54 @@ class Woningwaarderingstelselgroep(Referentiedatasoort):
     Waarderingsstelsel onzelfstandige woonruimte)
     """
 
-    oppervlakte_standplaats = WoningwaarderingstelselgroepReferentiedata(
-        code="OST",
-        naam="Oppervlakte standplaats",
-        parent=Woningwaarderingstelsel.standplaatsen,
+    oppervlakte_standplaats = (
+        WoningwaarderingstelselgroepReferentiedata.model_construct(
+            code="OST",
+            naam="Oppervlakte standplaats",
+            parent=Woningwaarderingstelsel.standplaatsen,
+        )
     )
     """
     Standplaats: De groep criteria die betrekking heeft op de oppervlakte
     (Puntentelling: woonwagen/standplaats: Huurcommissie)
     """
 
-    oppervlakte_van_vertrekken = WoningwaarderingstelselgroepReferentiedata(
-        code="OVZ",
-        naam="Oppervlakte van vertrekken",
+    oppervlakte_van_vertrekken = (
+        WoningwaarderingstelselgroepReferentiedata.model_construct(
+            code="OVZ",
+            naam="Oppervlakte van vertrekken",
+        )
     )
     """
     Onder vertrekken worden verstaan: woonkamer, andere kamers, keuken, badkamer en
     doucheruimte (Beleidsboek Waarderingsstelsel zelfstandige woonruimte)
     """
 
-    oppervlakte_niet_standaardwoonwagen = WoningwaarderingstelselgroepReferentiedata(
-        code="OWN",
-        naam="Oppervlakte niet-standaardwoonwagen",
-        parent=Woningwaarderingstelsel.woonwagens,
+    oppervlakte_niet_standaardwoonwagen = (
+        WoningwaarderingstelselgroepReferentiedata.model_construct(
+            code="OWN",
+            naam="Oppervlakte niet-standaardwoonwagen",
+            parent=Woningwaarderingstelsel.woonwagens,
+        )
     )
     """
     Niet-standaardwoonwagen: De groep criteria die betrekking heeft op de oppervlakte
     (Puntentelling: woonwagen/standplaats: Huurcommissie)
     """
 
-    oppervlakte_standaardwoonwagen = WoningwaarderingstelselgroepReferentiedata(
-        code="OWS",
-        naam="Oppervlakte standaardwoonwagen",
-        parent=Woningwaarderingstelsel.woonwagens,
+    oppervlakte_standaardwoonwagen = (
+        WoningwaarderingstelselgroepReferentiedata.model_construct(
+            code="OWS",
+            naam="Oppervlakte standaardwoonwagen",
+            parent=Woningwaarderingstelsel.woonwagens,
+        )
     )
     """
     Standaardwoonwagen: De groep criteria die betrekking heeft op de oppervlakte
     (Puntentelling: woonwagen/standplaats: Huurcommissie)
     """
 
-    prive_buitenruimten = WoningwaarderingstelselgroepReferentiedata(
+    prive_buitenruimten = WoningwaarderingstelselgroepReferentiedata.model_construct(
         code="PRI",
         naam="Privé-buitenruimten",
         parent=Woningwaarderingstelsel.zelfstandige_woonruimten,
@@ -268,7 +286,7 @@ class Woningwaarderingstelselgroep(Referentiedatasoort):
     woonruimte)
     """
 
-    renovatie = WoningwaarderingstelselgroepReferentiedata(
+    renovatie = WoningwaarderingstelselgroepReferentiedata.model_construct(
         code="REN",
         naam="Renovatie",
         parent=Woningwaarderingstelsel.zelfstandige_woonruimten,
@@ -278,7 +296,7 @@ class Woningwaarderingstelselgroep(Referentiedatasoort):
     Waarderingsstelsel zelfstandige woonruimte)
     """
 
-    sanitair = WoningwaarderingstelselgroepReferentiedata(
+    sanitair = WoningwaarderingstelselgroepReferentiedata.model_construct(
         code="SAN",
         naam="Sanitair",
     )
@@ -287,7 +305,7 @@ class Woningwaarderingstelselgroep(Referentiedatasoort):
     Waarderingsstelsel zelfstandige woonruimte)
     """
 
-    toilet = WoningwaarderingstelselgroepReferentiedata(
+    toilet = WoningwaarderingstelselgroepReferentiedata.model_construct(
         code="TOI",
         naam="Toilet",
         parent=Woningwaarderingstelsel.onzelfstandige_woonruimten,
@@ -297,17 +315,19 @@ class Woningwaarderingstelselgroep(Referentiedatasoort):
     onzelfstandige woonruimte)
     """
 
-    verwarmingsmogelijkheden = WoningwaarderingstelselgroepReferentiedata(
-        code="VON",
-        naam="Verwarmingsmogelijkheden",
-        parent=Woningwaarderingstelsel.onzelfstandige_woonruimten,
+    verwarmingsmogelijkheden = (
+        WoningwaarderingstelselgroepReferentiedata.model_construct(
+            code="VON",
+            naam="Verwarmingsmogelijkheden",
+            parent=Woningwaarderingstelsel.onzelfstandige_woonruimten,
+        )
     )
     """
     De groep criteria die betrekking heeft op de verwarmingsmogelijkheden (Beleidsboek
     Waarderingsstelsel onzelfstandige woonruimte)
     """
 
-    verwarming_standplaats = WoningwaarderingstelselgroepReferentiedata(
+    verwarming_standplaats = WoningwaarderingstelselgroepReferentiedata.model_construct(
         code="VST",
         naam="Verwarming standplaats",
         parent=Woningwaarderingstelsel.standplaatsen,
@@ -317,27 +337,31 @@ class Woningwaarderingstelselgroep(Referentiedatasoort):
     woonwagen/standplaats: Huurcommissie)
     """
 
-    verwarming_niet_standaardwoonwagen = WoningwaarderingstelselgroepReferentiedata(
-        code="VWN",
-        naam="Verwarming niet-standaardwoonwagen",
-        parent=Woningwaarderingstelsel.woonwagens,
+    verwarming_niet_standaardwoonwagen = (
+        WoningwaarderingstelselgroepReferentiedata.model_construct(
+            code="VWN",
+            naam="Verwarming niet-standaardwoonwagen",
+            parent=Woningwaarderingstelsel.woonwagens,
+        )
     )
     """
     Niet-standaardwoonwagen: De groep criteria die betrekking heeft op de verwarming
     (Puntentelling: woonwagen/standplaats: Huurcommissie)
     """
 
-    verwarming_standaardwoonwagen = WoningwaarderingstelselgroepReferentiedata(
-        code="VWS",
-        naam="Verwarming standaardwoonwagen",
-        parent=Woningwaarderingstelsel.woonwagens,
+    verwarming_standaardwoonwagen = (
+        WoningwaarderingstelselgroepReferentiedata.model_construct(
+            code="VWS",
+            naam="Verwarming standaardwoonwagen",
+            parent=Woningwaarderingstelsel.woonwagens,
+        )
     )
     """
     Standaardwoonwagen: De groep criteria die betrekking heeft op de verwarming
     (Puntentelling: woonwagen/standplaats: Huurcommissie)
     """
 
-    verwarming = WoningwaarderingstelselgroepReferentiedata(
+    verwarming = WoningwaarderingstelselgroepReferentiedata.model_construct(
         code="VZE",
         naam="Verwarming",
         parent=Woningwaarderingstelsel.zelfstandige_woonruimten,
@@ -349,7 +373,7 @@ class Woningwaarderingstelselgroep(Referentiedatasoort):
     zelfstandige woonruimte)
     """
 
-    wasgelegenheid = WoningwaarderingstelselgroepReferentiedata(
+    wasgelegenheid = WoningwaarderingstelselgroepReferentiedata.model_construct(
         code="WAS",
         naam="Wasgelegenheid",
         parent=Woningwaarderingstelsel.onzelfstandige_woonruimten,
@@ -359,28 +383,34 @@ class Woningwaarderingstelselgroep(Referentiedatasoort):
     Waarderingsstelsel onzelfstandige woonruimte)
     """
 
-    punten_voor_de_woz_waarde = WoningwaarderingstelselgroepReferentiedata(
-        code="WOZ",
-        naam="Punten voor de WOZ-waarde",
+    punten_voor_de_woz_waarde = (
+        WoningwaarderingstelselgroepReferentiedata.model_construct(
+            code="WOZ",
+            naam="Punten voor de WOZ-waarde",
+        )
     )
     """
     De groep criteria die betrekking heeft op de vastgestelde WOZ-waarde (Beleidsboek
     Waarderingsstelsel zelfstandige woonruimte)
     """
 
-    woonomgeving_standplaats = WoningwaarderingstelselgroepReferentiedata(
-        code="WST",
-        naam="Woonomgeving standplaats",
-        parent=Woningwaarderingstelsel.standplaatsen,
+    woonomgeving_standplaats = (
+        WoningwaarderingstelselgroepReferentiedata.model_construct(
+            code="WST",
+            naam="Woonomgeving standplaats",
+            parent=Woningwaarderingstelsel.standplaatsen,
+        )
     )
     """
     Standplaats: De groep criteria die betrekking heeft op de woonomgeving
     (Puntentelling: woonwagen/standplaats: Huurcommissie)
     """
 
-    verkoeling_en_verwarming = WoningwaarderingstelselgroepReferentiedata(
-        code="VKV",
-        naam="Verkoeling en verwarming",
+    verkoeling_en_verwarming = (
+        WoningwaarderingstelselgroepReferentiedata.model_construct(
+            code="VKV",
+            naam="Verkoeling en verwarming",
+        )
     )
     """
     Waardering van verwarmde vertrekken, overige ruimten en verkeersruimten, inclusief
@@ -388,7 +418,7 @@ class Woningwaarderingstelselgroep(Referentiedatasoort):
     vastgestelde eisen aan koelsystemen en verwarming.
     """
 
-    buitenruimten = WoningwaarderingstelselgroepReferentiedata(
+    buitenruimten = WoningwaarderingstelselgroepReferentiedata.model_construct(
         code="BUI",
         naam="Buitenruimten",
     )
@@ -397,9 +427,11 @@ class Woningwaarderingstelselgroep(Referentiedatasoort):
     woningen zonder buitenruimte.
     """
 
-    gemeenschappelijke_parkeerruimten = WoningwaarderingstelselgroepReferentiedata(
-        code="GPA",
-        naam="Gemeenschappelijke parkeerruimten",
+    gemeenschappelijke_parkeerruimten = (
+        WoningwaarderingstelselgroepReferentiedata.model_construct(
+            code="GPA",
+            naam="Gemeenschappelijke parkeerruimten",
+        )
     )
     """
     Waardering van parkeerplekken in een gemeenschappelijke ruimte die exclusief
@@ -407,10 +439,12 @@ class Woningwaarderingstelselgroep(Referentiedatasoort):
     afhankelijk van type en aanwezigheid van laadpaal.
     """
 
-    prijsopslag_monumenten_en_nieuwbouw = WoningwaarderingstelselgroepReferentiedata(
-        code="PMN",
-        naam="Prijsopslag monumenten en nieuwbouw",
-        parent=Woningwaarderingstelsel.zelfstandige_woonruimten,
+    prijsopslag_monumenten_en_nieuwbouw = (
+        WoningwaarderingstelselgroepReferentiedata.model_construct(
+            code="PMN",
+            naam="Prijsopslag monumenten en nieuwbouw",
+            parent=Woningwaarderingstelsel.zelfstandige_woonruimten,
+        )
     )
     """
     Prijsopslagen voor monumenten en nieuwbouw, waarbij extra percentages worden
@@ -420,7 +454,7 @@ class Woningwaarderingstelselgroep(Referentiedatasoort):
     """
 
     gemeenschappelijke_vertrekken_overige_ruimten_en_voorzieningen = (
-        WoningwaarderingstelselgroepReferentiedata(
+        WoningwaarderingstelselgroepReferentiedata.model_construct(
             code="GVR",
             naam="Gemeenschappelijke vertrekken, overige ruimten en voorzieningen",
             parent=Woningwaarderingstelsel.zelfstandige_woonruimten,
@@ -434,7 +468,7 @@ class Woningwaarderingstelselgroep(Referentiedatasoort):
     """
 
     gemeenschappelijke_binnenruimten_gedeeld_met_meerdere_adressen = (
-        WoningwaarderingstelselgroepReferentiedata(
+        WoningwaarderingstelselgroepReferentiedata.model_construct(
             code="GBA",
             naam="Gemeenschappelijke binnenruimten gedeeld met meerdere adressen",
             parent=Woningwaarderingstelsel.onzelfstandige_woonruimten,
@@ -445,7 +479,7 @@ class Woningwaarderingstelselgroep(Referentiedatasoort):
     """
 
     bijzondere_voorzieningen_zorgwoning_en_aanbelfunctie = (
-        WoningwaarderingstelselgroepReferentiedata(
+        WoningwaarderingstelselgroepReferentiedata.model_construct(
             code="BIA",
             naam="Bijzondere voorzieningen: zorgwoning en aanbelfunctie",
             parent=Woningwaarderingstelsel.zelfstandige_woonruimten,
@@ -456,16 +490,18 @@ class Woningwaarderingstelselgroep(Referentiedatasoort):
     aanbelfunctie met video- en audioverbinding
     """
 
-    bijzondere_voorzieningen_zorgwoning = WoningwaarderingstelselgroepReferentiedata(
-        code="BIZ",
-        naam="Bijzondere voorzieningen: zorgwoning",
-        parent=Woningwaarderingstelsel.onzelfstandige_woonruimten,
+    bijzondere_voorzieningen_zorgwoning = (
+        WoningwaarderingstelselgroepReferentiedata.model_construct(
+            code="BIZ",
+            naam="Bijzondere voorzieningen: zorgwoning",
+            parent=Woningwaarderingstelsel.onzelfstandige_woonruimten,
+        )
     )
     """
     Waardering van bijzondere voorzieningen in een zorgwoning
     """
 
-    aftrekpunten = WoningwaarderingstelselgroepReferentiedata(
+    aftrekpunten = WoningwaarderingstelselgroepReferentiedata.model_construct(
         code="AFT",
         naam="Aftrekpunten",
         parent=Woningwaarderingstelsel.onzelfstandige_woonruimten,
@@ -474,7 +510,7 @@ class Woningwaarderingstelselgroep(Referentiedatasoort):
     Aftrekpunten waardering onzelfstandige woonruimten
     """
 
-    prijsopslag_monumenten = WoningwaarderingstelselgroepReferentiedata(
+    prijsopslag_monumenten = WoningwaarderingstelselgroepReferentiedata.model_construct(
         code="PMO",
         naam="Prijsopslag monumenten",
         parent=Woningwaarderingstelsel.onzelfstandige_woonruimten,
@@ -7,7 +7,7 @@ class WoonsituatiesoortReferentiedata(Referentiedata):
 
 
 class Woonsituatiesoort(Referentiedatasoort):
-    doorstromer = WoonsituatiesoortReferentiedata(
+    doorstromer = WoonsituatiesoortReferentiedata.model_construct(
         code="DOO",
         naam="Doorstromer",
     )
@@ -15,7 +15,7 @@ class Woonsituatiesoort(Referentiedatasoort):
     Een doorstromer is een woningzoekende die een zelfstandige woning achterlaat.
     """
 
-    starter = WoonsituatiesoortReferentiedata(
+    starter = WoonsituatiesoortReferentiedata.model_construct(
         code="STA",
         naam="Starter",
     )
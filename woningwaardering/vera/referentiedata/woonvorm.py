@@ -7,7 +7,7 @@ class WoonvormReferentiedata(Referentiedata):
 
 
 class Woonvorm(Referentiedatasoort):
-    adl_clusterwoning = WoonvormReferentiedata(
+    adl_clusterwoning = WoonvormReferentiedata.model_construct(
         code="ADL",
         naam="ADL-clusterwoning",
     )
@@ -17,12 +17,12 @@ class Woonvorm(Referentiedatasoort):
     levensverrichtingen (ADL) in en om de woning
     """
 
-    begeleid_wonen = WoonvormReferentiedata(
+    begeleid_wonen = WoonvormReferentiedata.model_construct(
         code="BEG",
         naam="Begeleid wonen",
     )
 
-    geclusterde_woonvorm = WoonvormReferentiedata(
+    geclusterde_woonvorm = WoonvormReferentiedata.model_construct(
         code="GEC",
         naam="Geclusterde woonvorm",
     )
@@ -34,7 +34,7 @@ class Woonvorm(Referentiedatasoort):
     voldoen aan de uitgangspunten voor nultredenwoningen.
     """
 
-    groepswonen = WoonvormReferentiedata(
+    groepswonen = WoonvormReferentiedata.model_construct(
         code="GRO",
         naam="Groepswonen",
     )
@@ -46,7 +46,7 @@ class Woonvorm(Referentiedatasoort):
     leeftijd, etc. Ook wel geclusterd wonen genoemd.
     """
 
-    grote_woonvorm = WoonvormReferentiedata(
+    grote_woonvorm = WoonvormReferentiedata.model_construct(
         code="GRW",
         naam="Grote woonvorm",
     )
@@ -55,7 +55,7 @@ class Woonvorm(Referentiedatasoort):
     bij elkaar. Deze mensen wonen zo zelfstandig mogelijk.
     """
 
-    hat_eenheid = WoonvormReferentiedata(
+    hat_eenheid = WoonvormReferentiedata.model_construct(
         code="HAT",
         naam="HAT-eenheid",
     )
@@ -63,7 +63,7 @@ class Woonvorm(Referentiedatasoort):
     eenheden voor 1 of twee persoonshuishoudens met gezamelijke keuken, badkamer etc.
     """
 
-    kleine_woonvorm = WoonvormReferentiedata(
+    kleine_woonvorm = WoonvormReferentiedata.model_construct(
         code="KLE",
         naam="Kleine woonvorm",
     )
@@ -71,7 +71,7 @@ class Woonvorm(Referentiedatasoort):
     gezinsvervangende tehuizen voor lichamelijk gehandicapten
     """
 
-    seniorenwoning_met_zorg = WoonvormReferentiedata(
+    seniorenwoning_met_zorg = WoonvormReferentiedata.model_construct(
         code="SEN",
         naam="Seniorenwoning met zorg",
     )
@@ -81,7 +81,7 @@ class Woonvorm(Referentiedatasoort):
     allerlei voorzieningen dichtbij.
     """
 
-    thomashuis = WoonvormReferentiedata(
+    thomashuis = WoonvormReferentiedata.model_construct(
         code="THO",
         naam="Thomashuis",
     )
@@ -90,7 +90,7 @@ class Woonvorm(Referentiedatasoort):
     verstandelijke beperking
     """
 
-    zorggeschikte_woning = WoonvormReferentiedata(
+    zorggeschikte_woning = WoonvormReferentiedata.model_construct(
         code="ZWO",
         naam="Zorggeschikte woning",
     )
@@ -7,27 +7,27 @@ class ZaakobjectsoortReferentiedata(Referentiedata):
 
 
 class Zaakobjectsoort(Referentiedatasoort):
-    cluster = ZaakobjectsoortReferentiedata(
+    cluster = ZaakobjectsoortReferentiedata.model_construct(
         code="CLU",
         naam="Cluster",
     )
 
-    collectief_object = ZaakobjectsoortReferentiedata(
+    collectief_object = ZaakobjectsoortReferentiedata.model_construct(
         code="COL",
         naam="Collectief object",
     )
 
-    eenheid = ZaakobjectsoortReferentiedata(
+    eenheid = ZaakobjectsoortReferentiedata.model_construct(
         code="EEN",
         naam="Eenheid",
     )
 
-    onderhoudsverzoek = ZaakobjectsoortReferentiedata(
+    onderhoudsverzoek = ZaakobjectsoortReferentiedata.model_construct(
         code="OND",
         naam="Onderhoudsverzoek",
     )
 
-    overeenkomst = ZaakobjectsoortReferentiedata(
+    overeenkomst = ZaakobjectsoortReferentiedata.model_construct(
         code="OVE",
         naam="Overeenkomst",
     )
@@ -7,12 +7,12 @@ class ZaakrolReferentiedata(Referentiedata):
 
 
 class Zaakrol(Referentiedatasoort):
-    adviseur = ZaakrolReferentiedata(
+    adviseur = ZaakrolReferentiedata.model_construct(
         code="ADV",
         naam="Adviseur",
     )
 
-    behandelaar = ZaakrolReferentiedata(
+    behandelaar = ZaakrolReferentiedata.model_construct(
         code="BEH",
         naam="Behandelaar",
     )
@@ -20,7 +20,7 @@ class Zaakrol(Referentiedatasoort):
     De medewerker die de zaak in behandeling heeft
     """
 
-    beklaagde = ZaakrolReferentiedata(
+    beklaagde = ZaakrolReferentiedata.model_construct(
         code="BEK",
         naam="Beklaagde",
     )
@@ -28,27 +28,27 @@ class Zaakrol(Referentiedatasoort):
     De betrokkene binnen de zaak waarover geklaagd wordt bij een (sociale) klacht
     """
 
-    belanghebbende = ZaakrolReferentiedata(
+    belanghebbende = ZaakrolReferentiedata.model_construct(
         code="BEL",
         naam="Belanghebbende",
     )
 
-    beslisser = ZaakrolReferentiedata(
+    beslisser = ZaakrolReferentiedata.model_construct(
         code="BES",
         naam="Beslisser",
     )
 
-    initiator = ZaakrolReferentiedata(
+    initiator = ZaakrolReferentiedata.model_construct(
         code="INI",
         naam="Initiator",
     )
 
-    klantcontacter = ZaakrolReferentiedata(
+    klantcontacter = ZaakrolReferentiedata.model_construct(
         code="KLA",
         naam="Klantcontacter",
     )
 
-    klager = ZaakrolReferentiedata(
+    klager = ZaakrolReferentiedata.model_construct(
         code="KLG",
         naam="Klager",
     )
@@ -56,7 +56,7 @@ class Zaakrol(Referentiedatasoort):
     De betrokkene binnen de zaak die een klacht heeft ingediend
     """
 
-    melder = ZaakrolReferentiedata(
+    melder = ZaakrolReferentiedata.model_construct(
         code="MEL",
         naam="Melder",
     )
@@ -64,7 +64,7 @@ class Zaakrol(Referentiedatasoort):
     De melder van de zaak
     """
 
-    overige_betrokkene = ZaakrolReferentiedata(
+    overige_betrokkene = ZaakrolReferentiedata.model_construct(
         code="OVE",
         naam="Overige betrokkene",
     )
@@ -73,7 +73,7 @@ class Zaakrol(Referentiedatasoort):
     gemeente, sociale dienst, etc.
     """
 
-    zaakcoordinator = ZaakrolReferentiedata(
+    zaakcoordinator = ZaakrolReferentiedata.model_construct(
         code="ZAA",
         naam="Zaakcoördinator",
     )
@@ -7,7 +7,7 @@ class ZaakstatussoortReferentiedata(Referentiedata):
 
 
 class Zaakstatussoort(Referentiedatasoort):
-    aangemaakt = ZaakstatussoortReferentiedata(
+    aangemaakt = ZaakstatussoortReferentiedata.model_construct(
         code="AAN",
         naam="Aangemaakt",
     )
@@ -15,7 +15,7 @@ class Zaakstatussoort(Referentiedatasoort):
     De zaak is aangemaakt/geregistreerd maar nog niet toegewezen ter afhandeling
     """
 
-    afgerond = ZaakstatussoortReferentiedata(
+    afgerond = ZaakstatussoortReferentiedata.model_construct(
         code="AFG",
         naam="Afgerond",
     )
@@ -23,7 +23,7 @@ class Zaakstatussoort(Referentiedatasoort):
     De zaak is inhoudelijk afgerond, maar nog niet definitief gesloten
     """
 
-    geannuleerd = ZaakstatussoortReferentiedata(
+    geannuleerd = ZaakstatussoortReferentiedata.model_construct(
         code="GEA",
         naam="Geannuleerd",
     )
@@ -31,7 +31,7 @@ class Zaakstatussoort(Referentiedatasoort):
     De afhandeling van de zaak geannuleerd
     """
 
-    gesloten = ZaakstatussoortReferentiedata(
+    gesloten = ZaakstatussoortReferentiedata.model_construct(
         code="GES",
         naam="Gesloten",
     )
@@ -39,7 +39,7 @@ class Zaakstatussoort(Referentiedatasoort):
     De zaak is afgerond en gesloten
     """
 
-    in_behandeling = ZaakstatussoortReferentiedata(
+    in_behandeling = ZaakstatussoortReferentiedata.model_construct(
         code="INB",
         naam="In behandeling",
     )
@@ -48,7 +48,7 @@ class Zaakstatussoort(Referentiedatasoort):
     zijn nog geen stappen in de uitvoering gezet
     """
 
-    in_uitvoering = ZaakstatussoortReferentiedata(
+    in_uitvoering = ZaakstatussoortReferentiedata.model_construct(
         code="INU",
         naam="In uitvoering",
     )
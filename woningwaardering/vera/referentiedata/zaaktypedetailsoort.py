@@ -10,7 +10,7 @@ class ZaaktypedetailsoortReferentiedata(Referentiedata):
 
 
 class Zaaktypedetailsoort(Referentiedatasoort):
-    agressie_en_of_bedreiging = ZaaktypedetailsoortReferentiedata(
+    agressie_en_of_bedreiging = ZaaktypedetailsoortReferentiedata.model_construct(
         code="AGR",
         naam="Agressie/bedreiging",
         parent=Zaaktypesoort.sociale_melding,
@@ -19,7 +19,7 @@ class Zaaktypedetailsoort(Referentiedatasoort):
     Sociale melding over agressie/bedreiging
     """
 
-    bedrijfsmatig_gebruik_woning = ZaaktypedetailsoortReferentiedata(
+    bedrijfsmatig_gebruik_woning = ZaaktypedetailsoortReferentiedata.model_construct(
         code="BED",
         naam="Bedrijfsmatig gebruik woning",
         parent=Zaaktypesoort.sociale_melding,
@@ -28,7 +28,7 @@ class Zaaktypedetailsoort(Referentiedatasoort):
     Sociale melding over Bedrijfsmatig gebruik woning
     """
 
-    huisdieren = ZaaktypedetailsoortReferentiedata(
+    huisdieren = ZaaktypedetailsoortReferentiedata.model_construct(
         code="DIE",
         naam="Huisdieren",
         parent=Zaaktypesoort.sociale_melding,
@@ -37,7 +37,7 @@ class Zaaktypedetailsoort(Referentiedatasoort):
     Overlast door huisdieren
     """
 
-    dealen_en_of_drugspanden = ZaaktypedetailsoortReferentiedata(
+    dealen_en_of_drugspanden = ZaaktypedetailsoortReferentiedata.model_construct(
         code="DRU",
         naam="Dealen/drugspanden",
         parent=Zaaktypesoort.sociale_melding,
@@ -46,7 +46,7 @@ class Zaaktypedetailsoort(Referentiedatasoort):
     Sociale melding over Dealen/drugspanden
     """
 
-    geluidsoverlast = ZaaktypedetailsoortReferentiedata(
+    geluidsoverlast = ZaaktypedetailsoortReferentiedata.model_construct(
         code="GEL",
         naam="Geluidsoverlast",
         parent=Zaaktypesoort.sociale_melding,
@@ -55,7 +55,7 @@ class Zaaktypedetailsoort(Referentiedatasoort):
     Sociale melding over Geluidsoverlast
     """
 
-    omgevingsoverlast = ZaaktypedetailsoortReferentiedata(
+    omgevingsoverlast = ZaaktypedetailsoortReferentiedata.model_construct(
         code="HAN",
         naam="Omgevingsoverlast",
         parent=Zaaktypesoort.sociale_melding,
@@ -64,7 +64,7 @@ class Zaaktypedetailsoort(Referentiedatasoort):
     Sociale melding over Omgevingsoverlast
     """
 
-    hennepkwekerij = ZaaktypedetailsoortReferentiedata(
+    hennepkwekerij = ZaaktypedetailsoortReferentiedata.model_construct(
         code="HEN",
         naam="Hennepkwekerij",
         parent=Zaaktypesoort.sociale_melding,
@@ -73,16 +73,18 @@ class Zaaktypedetailsoort(Referentiedatasoort):
     Sociale melding over Hennepkwekerij
     """
 
-    oneigenlijk_gebruik_gemeenschappelijke_ruimte = ZaaktypedetailsoortReferentiedata(
-        code="KLI",
-        naam="Oneigenlijk gebruik gemeenschappelijke ruimte",
-        parent=Zaaktypesoort.sociale_melding,
+    oneigenlijk_gebruik_gemeenschappelijke_ruimte = (
+        ZaaktypedetailsoortReferentiedata.model_construct(
+            code="KLI",
+            naam="Oneigenlijk gebruik gemeenschappelijke ruimte",
+            parent=Zaaktypesoort.sociale_melding,
+        )
     )
     """
     Sociale melding over Oneigenlijk gebruik gemeenschappelijke ruimte
     """
 
-    ongedierte = ZaaktypedetailsoortReferentiedata(
+    ongedierte = ZaaktypedetailsoortReferentiedata.model_construct(
         code="ONG",
         naam="Ongedierte",
         parent=Zaaktypesoort.sociale_melding,
@@ -91,7 +93,7 @@ class Zaaktypedetailsoort(Referentiedatasoort):
     Sociale melding over Ongedierte
     """
 
-    onrechtmatige_bewoning = ZaaktypedetailsoortReferentiedata(
+    onrechtmatige_bewoning = ZaaktypedetailsoortReferentiedata.model_construct(
         code="ONR",
         naam="Onrechtmatige bewoning",
         parent=Zaaktypesoort.sociale_melding,
@@ -100,16 +102,18 @@ class Zaaktypedetailsoort(Referentiedatasoort):
     Sociale melding over Onrechtmatige bewoning
     """
 
-    onveiligheid_gemeenschappelijke_ruimte = ZaaktypedetailsoortReferentiedata(
-        code="ONV",
-        naam="Onveiligheid gemeenschappelijke ruimte",
-        parent=Zaaktypesoort.sociale_melding,
+    onveiligheid_gemeenschappelijke_ruimte = (
+        ZaaktypedetailsoortReferentiedata.model_construct(
+            code="ONV",
+            naam="Onveiligheid gemeenschappelijke ruimte",
+            parent=Zaaktypesoort.sociale_melding,
+        )
     )
     """
     Sociale melding over Onveiligheid gemeenschappelijke ruimte
     """
 
-    overige = ZaaktypedetailsoortReferentiedata(
+    overige = ZaaktypedetailsoortReferentiedata.model_construct(
         code="OVE",
         naam="Overige",
         parent=Zaaktypesoort.sociale_melding,
@@ -118,7 +122,7 @@ class Zaaktypedetailsoort(Referentiedatasoort):
     Sociale melding over Overige
     """
 
-    psychische_problematiek = ZaaktypedetailsoortReferentiedata(
+    psychische_problematiek = ZaaktypedetailsoortReferentiedata.model_construct(
         code="PSY",
         naam="Psychische problematiek",
         parent=Zaaktypesoort.sociale_melding,
@@ -127,7 +131,7 @@ class Zaaktypedetailsoort(Referentiedatasoort):
     Sociale melding over Psychische problematiek
     """
 
-    burenruzie = ZaaktypedetailsoortReferentiedata(
+    burenruzie = ZaaktypedetailsoortReferentiedata.model_construct(
         code="RUZ",
         naam="Burenruzie",
         parent=Zaaktypesoort.sociale_melding,
@@ -136,7 +140,7 @@ class Zaaktypedetailsoort(Referentiedatasoort):
     Sociale melding over Burenruzie
     """
 
-    stankoverlast = ZaaktypedetailsoortReferentiedata(
+    stankoverlast = ZaaktypedetailsoortReferentiedata.model_construct(
         code="STA",
         naam="Stankoverlast",
         parent=Zaaktypesoort.sociale_melding,
@@ -145,7 +149,7 @@ class Zaaktypedetailsoort(Referentiedatasoort):
     Sociale melding over Stankoverlast
     """
 
-    vandalisme = ZaaktypedetailsoortReferentiedata(
+    vandalisme = ZaaktypedetailsoortReferentiedata.model_construct(
         code="VAN",
         naam="Vandalisme",
         parent=Zaaktypesoort.sociale_melding,
@@ -154,7 +158,7 @@ class Zaaktypedetailsoort(Referentiedatasoort):
     Sociale melding over Vandalisme
     """
 
-    verslavingsproblematiek = ZaaktypedetailsoortReferentiedata(
+    verslavingsproblematiek = ZaaktypedetailsoortReferentiedata.model_construct(
         code="VER",
         naam="Verslavingsproblematiek",
         parent=Zaaktypesoort.sociale_melding,
@@ -163,7 +167,7 @@ class Zaaktypedetailsoort(Referentiedatasoort):
     Sociale melding over Verslavingsproblematiek
     """
 
-    vervuiling = ZaaktypedetailsoortReferentiedata(
+    vervuiling = ZaaktypedetailsoortReferentiedata.model_construct(
         code="VUI",
         naam="Vervuiling",
         parent=Zaaktypesoort.sociale_melding,
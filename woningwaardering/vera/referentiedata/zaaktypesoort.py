@@ -7,7 +7,7 @@ class ZaaktypesoortReferentiedata(Referentiedata):
 
 
 class Zaaktypesoort(Referentiedatasoort):
-    leefbaarheid = ZaaktypesoortReferentiedata(
+    leefbaarheid = ZaaktypesoortReferentiedata.model_construct(
         code="LEE",
         naam="Leefbaarheid",
     )
@@ -15,7 +15,7 @@ class Zaaktypesoort(Referentiedatasoort):
     Op initiatief van de corporatie verbeteren van de buurt
     """
 
-    omgevingsoverlast = ZaaktypesoortReferentiedata(
+    omgevingsoverlast = ZaaktypesoortReferentiedata.model_construct(
         code="OMG",
         naam="Omgevingsoverlast",
     )
@@ -23,7 +23,7 @@ class Zaaktypesoort(Referentiedatasoort):
     Overlast in de omgeving
     """
 
-    klacht_over_organisatie = ZaaktypesoortReferentiedata(
+    klacht_over_organisatie = ZaaktypesoortReferentiedata.model_construct(
         code="ORG",
         naam="Klacht over organisatie",
     )
@@ -31,7 +31,7 @@ class Zaaktypesoort(Referentiedatasoort):
     Klachten over de corporatie als organisatie
     """
 
-    sociale_melding = ZaaktypesoortReferentiedata(
+    sociale_melding = ZaaktypesoortReferentiedata.model_construct(
         code="SOC",
         naam="Sociale melding",
     )
@@ -39,7 +39,7 @@ class Zaaktypesoort(Referentiedatasoort):
     Overige sociale gerelateerde meldingen
     """
 
-    woonfraude = ZaaktypesoortReferentiedata(
+    woonfraude = ZaaktypesoortReferentiedata.model_construct(
         code="WOO",
         naam="Woonfraude",
     )
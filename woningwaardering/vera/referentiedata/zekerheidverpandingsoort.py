@@ -7,16 +7,18 @@ class ZekerheidverpandingsoortReferentiedata(Referentiedata):
 
 
 class Zekerheidverpandingsoort(Referentiedatasoort):
-    hypotheek_en_pandrecht_huurpenningen = ZekerheidverpandingsoortReferentiedata(
-        code="HPH",
-        naam="Hypotheek en pandrecht huurpenningen",
+    hypotheek_en_pandrecht_huurpenningen = (
+        ZekerheidverpandingsoortReferentiedata.model_construct(
+            code="HPH",
+            naam="Hypotheek en pandrecht huurpenningen",
+        )
     )
     """
     Hypotheek en pandrecht huurpenningen
     """
 
     hypotheek_en_positieve_verkaring_pandrecht_huurpenningen = (
-        ZekerheidverpandingsoortReferentiedata(
+        ZekerheidverpandingsoortReferentiedata.model_construct(
             code="HPO",
             naam="Hypotheek en positieve verkaring pandrecht huurpenningen",
         )
@@ -25,7 +27,7 @@ class Zekerheidverpandingsoort(Referentiedatasoort):
     Hypotheek en positieve verkaring pandrecht huurpenningen
     """
 
-    hypotheek = ZekerheidverpandingsoortReferentiedata(
+    hypotheek = ZekerheidverpandingsoortReferentiedata.model_construct(
         code="HYP",
         naam="Hypotheek",
     )
@@ -33,7 +35,7 @@ class Zekerheidverpandingsoort(Referentiedatasoort):
     Hypotheek
     """
 
-    overig = ZekerheidverpandingsoortReferentiedata(
+    overig = ZekerheidverpandingsoortReferentiedata.model_construct(
         code="OVE",
         naam="Overig",
     )
@@ -41,7 +43,7 @@ class Zekerheidverpandingsoort(Referentiedatasoort):
     Overig, bijvoorbeeld vastgelegd in onderhandse akte
     """
 
-    pandrecht_huurpenningen = ZekerheidverpandingsoortReferentiedata(
+    pandrecht_huurpenningen = ZekerheidverpandingsoortReferentiedata.model_construct(
         code="PHU",
         naam="Pandrecht huurpenningen",
     )
@@ -49,7 +51,7 @@ class Zekerheidverpandingsoort(Referentiedatasoort):
     Pandrecht huurpenningen
     """
 
-    positieve_verklaring = ZekerheidverpandingsoortReferentiedata(
+    positieve_verklaring = ZekerheidverpandingsoortReferentiedata.model_construct(
         code="POV",
         naam="Positieve verklaring",
     )
@@ -58,7 +60,7 @@ class Zekerheidverpandingsoort(Referentiedatasoort):
     """
 
     pandrecht_huurpenningen_en_positieve_verklaring_hypotheek = (
-        ZekerheidverpandingsoortReferentiedata(
+        ZekerheidverpandingsoortReferentiedata.model_construct(
             code="PPO",
             naam="Pandrecht huurpenningen en positieve verklaring hypotheek",
         )
@@ -5,6 +5,9 @@ from woningwaardering.vera.bvg.generated import Referentiedata
 
 class ReferentiedatasoortMeta(type):
     _referentiedata: ClassVar[Dict[str, Referentiedata]]
+    _referentiedata_per_code: ClassVar[Dict[str, Referentiedata]]
+    _kinderen_per_parent_code: ClassVar[Dict[str, tuple[Referentiedata, ...]]]
+    _codes: ClassVar[frozenset[str]]
 
     def __iter__(cls) -> Iterator[Referentiedata]:
         return iter(cls._referentiedata.values())
@@ -21,10 +24,94 @@ class ReferentiedatasoortMeta(type):
         cls_instance = super().__new__(cls, name, bases, class_dict)
         setattr(cls_instance, "_referentiedata", referentiedata_attrs)
 
+        referentiedata_per_code: Dict[str, Referentiedata] = {}
+        kinderen_per_parent_code: Dict[str, list[Referentiedata]] = {}
         for attr_name, referentiedata_instance in referentiedata_attrs.items():
             referentiedata_instance._name = attr_name
+            if referentiedata_instance.code is not None:
+                # bij een dubbele code blijft de eerste waarde vindbaar
+                referentiedata_per_code.setdefault(
+                    referentiedata_instance.code, referentiedata_instance
+                )
+            parent = referentiedata_instance.parent
+            if parent is not None and parent.code is not None:
+                kinderen_per_parent_code.setdefault(parent.code, []).append(
+                    referentiedata_instance
+                )
+
+        setattr(cls_instance, "_referentiedata_per_code", referentiedata_per_code)
+        setattr(
+            cls_instance,
+            "_kinderen_per_parent_code",
+            {
+                code: tuple(kinderen)
+                for code, kinderen in kinderen_per_parent_code.items()
+            },
+        )
+        setattr(cls_instance, "_codes", frozenset(referentiedata_per_code))
         return cls_instance
 
+    @property
+    def codes(cls) -> frozenset[str]:
+        """De codes van alle waarden van deze referentiedatasoort."""
+        return cls._codes
+
+    def van_code(cls, code: str | None) -> Referentiedata | None:
+        """
+        Zoekt een waarde van deze referentiedatasoort op code op.
+
+        Args:
+            code (str | None): De code van de referentiedata.
+
+        Returns:
+            Referentiedata | None: De waarde met deze code, of None als de code niet
+                voorkomt.
+        """
+        if code is None:
+            return None
+        return cls._referentiedata_per_code.get(code)
+
+    def kinderen(cls, parent: Referentiedata) -> tuple[Referentiedata, ...]:
+        """
+        Geeft de waarden van deze referentiedatasoort met de gegeven parent.
+
+        Bijvoorbeeld `Ruimtedetailsoort.kinderen(Ruimtesoort.buitenruimte)` voor alle
+        detailsoorten van buitenruimten.
+
+        Args:
+            parent (Referentiedata): De bovenliggende referentiedata.
+
+        Returns:
+            tuple[Referentiedata, ...]: De waarden met deze parent.
+        """
+        if parent.code is None:
+            return ()
+        return cls._kinderen_per_parent_code.get(parent.code, ())
+
+    def codegroep(cls, *referentiedata: Referentiedata) -> frozenset[str]:
+        """
+        Maakt een groep codes voor een snelle controle op lidmaatschap.
+
+        Gebruik dit voor vaste groepen op moduleniveau, zodat een regel met
+        `referentiedata.code in GROEP` kan controleren in plaats van met een lineaire
+        vergelijking tegen een lijst Referentiedata.
+
+        Args:
+            *referentiedata (Referentiedata): Waarden van deze referentiedatasoort.
+
+        Returns:
+            frozenset[str]: De codes van de waarden.
+
+        Raises:
+            ValueError: Als een waarde geen waarde van deze referentiedatasoort is.
+        """
+        onbekend = [str(item) for item in referentiedata if item.code not in cls._codes]
+        if onbekend:
+            raise ValueError(
+                f"Niet alle waarden horen bij {cls.__name__}: {', '.join(onbekend)}"
+            )
+        return frozenset(item.code for item in referentiedata if item.code is not None)
+
 
 class Referentiedatasoort(metaclass=ReferentiedatasoortMeta):
     pass
@@ -0,0 +1,51 @@
+from .begrenzing import (
+    OpzoekingOvergeslagen,
+    Stroomonderbreker,
+    Tijdsbudget,
+    TijdsbudgetVerstreken,
+    get_tijdsbudget,
+    tijdsbudget,
+)
+from .monumenten_cache import (
+    MonumentenCache,
+    get_monumenten_cache,
+    stel_monumenten_cache_in,
+)
+from .resolvers import (
+    ExtractMonumentenResolver,
+    ExtractWoonplaatsResolver,
+    KadasterWoonplaatsResolver,
+    MonumentenApiResolver,
+    MonumentenResolver,
+    WoonplaatsResolver,
+    get_monumenten_resolver,
+    get_woonplaats_resolver,
+    stel_monumenten_resolver_in,
+    stel_woonplaats_resolver_in,
+)
+from .verrijking import Verrijking, Verrijkingsrapport, verrijk_eenheden
+
+__all__ = [
+    "ExtractMonumentenResolver",
+    "ExtractWoonplaatsResolver",
+    "KadasterWoonplaatsResolver",
+    "MonumentenApiResolver",
+    "MonumentenCache",
+    "MonumentenResolver",
+    "OpzoekingOvergeslagen",
+    "Stroomonderbreker",
+    "Tijdsbudget",
+    "TijdsbudgetVerstreken",
+    "Verrijking",
+    "Verrijkingsrapport",
+    "WoonplaatsResolver",
+    "get_monumenten_cache",
+    "get_monumenten_resolver",
+    "get_tijdsbudget",
+    "get_woonplaats_resolver",
+    "stel_monumenten_cache_in",
+    "stel_monumenten_resolver_in",
+    "stel_woonplaats_resolver_in",
+    "tijdsbudget",
+    "verrijk_eenheden",
+]
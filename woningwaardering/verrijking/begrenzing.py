@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import timedelta
+from typing import Iterator
+
+from loguru import logger
+
+
+class OpzoekingOvergeslagen(Exception):
+    """Een externe opzoeking is overgeslagen, bijvoorbeeld omdat de stroomonderbreker open is."""
+
+
+class TijdsbudgetVerstreken(OpzoekingOvergeslagen):
+    """Een externe opzoeking is overgeslagen of afgebroken omdat het tijdsbudget op is."""
+
+
+class Tijdsbudget:
+    """Een deadline voor de externe opzoekingen van één eenheid.
+
+    Parameters:
+        budget (timedelta): De maximale tijd die aan externe opzoekingen mag worden besteed.
+    """
+
+    def __init__(self, budget: timedelta) -> None:
+        self.budget = budget
+        self._deadline = time.monotonic() + budget.total_seconds()
+
+    def resterend(self) -> float:
+        """Geeft het resterende budget in seconden terug, minimaal 0."""
+        return max(self._deadline - time.monotonic(), 0.0)
+
+    def is_verstreken(self) -> bool:
+        """Geeft True terug als het budget op is."""
+        return self.resterend() <= 0
+
+
+_tijdsbudget: ContextVar[Tijdsbudget | None] = ContextVar("tijdsbudget", default=None)
+
+
+def get_tijdsbudget() -> Tijdsbudget | None:
+    """
+    Geeft het tijdsbudget terug dat in de huidige context geldt.
+
+    Returns:
+        Tijdsbudget | None: Het tijdsbudget, of None als er geen budget geldt.
+    """
+    return _tijdsbudget.get()
+
+
+@contextmanager
+def tijdsbudget(
+    budget: timedelta | Tijdsbudget | None,
+) -> Iterator[Tijdsbudget | None]:
+    """
+    Stelt een tijdsbudget in voor de externe opzoekingen binnen het with-blok.
+
+    Args:
+        budget (timedelta | Tijdsbudget | None): Het budget, of None voor geen budget.
+            Een bestaand Tijdsbudget wordt met zijn lopende deadline hergebruikt.
+
+    Yields:
+        Tijdsbudget | None: Het ingestelde tijdsbudget.
+    """
+    huidig = Tijdsbudget(budget) if isinstance(budget, timedelta) else budget
+    token = _tijdsbudget.set(huidig)
+    try:
+        yield huidig
+    finally:
+        _tijdsbudget.reset(token)
+
+
+def begrens_timeout(timeout: float) -> float:
+    """
+    Begrenst een timeout tot het resterende tijdsbudget in de huidige context.
+
+    Args:
+        timeout (float): De timeout in seconden.
+
+    Returns:
+        float: De kleinste van de timeout en het resterende tijdsbudget.
+    """
+    huidig = _tijdsbudget.get()
+    if huidig is None:
+        return timeout
+    return min(timeout, huidig.resterend())
+
+
+class Stroomonderbreker:
+    """Stroomonderbreker (circuit breaker) voor een externe bron.
+
+    Na `max_fouten` opeenvolgende fouten gaat de stroomonderbreker open en worden
+    opzoekingen bij de bron overgeslagen. Na `hersteltijd` wordt één nieuwe poging
+    toegelaten; slaagt die, dan sluit de stroomonderbreker weer.
+
+    Parameters:
+        naam (str): De naam van de bron, voor in waarschuwingen.
+        max_fouten (int, optional): Het aantal opeenvolgende fouten waarna de
+            stroomonderbreker open gaat. Standaard is 5.
+        hersteltijd (timedelta, optional): De tijd waarna een nieuwe poging wordt
+            toegelaten. Standaard is 60 seconden.
+    """
+
+    def __init__(
+        self,
+        naam: str,
+        max_fouten: int = 5,
+        hersteltijd: timedelta = timedelta(seconds=60),
+    ) -> None:
+        if max_fouten < 1:
+            raise ValueError("max_fouten moet minimaal 1 zijn")
+
+        self.naam = naam
+        self.max_fouten = max_fouten
+        self.hersteltijd = hersteltijd
+        self._opeenvolgende_fouten = 0
+        self._geopend_op: float | None = None
+        self._proefpoging_bezig = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        """True als opzoekingen bij de bron op dit moment worden overgeslagen."""
+        with self._lock:
+            return self._geopend_op is not None and (
+                self._proefpoging_bezig
+                or time.monotonic() - self._geopend_op
+                < self.hersteltijd.total_seconds()
+            )
+
+    def laat_toe(self) -> bool:
+        """
+        Bepaalt of een opzoeking bij de bron mag worden uitgevoerd.
+
+        Returns:
+            bool: False als de stroomonderbreker open is.
+        """
+        with self._lock:
+            if self._geopend_op is None:
+                return True
+            if (
+                self._proefpoging_bezig
+                or time.monotonic() - self._geopend_op
+                < self.hersteltijd.total_seconds()
+            ):
+                return False
+            self._proefpoging_bezig = True
+            return True
+
+    def registreer_succes(self) -> None:
+        """Registreert een geslaagde opzoeking; de stroomonderbreker sluit."""
+        with self._lock:
+            if self._geopend_op is not None:
+                logger.info(f"Stroomonderbreker voor {self.naam} is weer gesloten")
+            self._opeenvolgende_fouten = 0
+            self._geopend_op = None
+            self._proefpoging_bezig = False
+
+    def registreer_fout(self) -> None:
+        """Registreert een mislukte opzoeking."""
+        with self._lock:
+            self._opeenvolgende_fouten += 1
+            if self._proefpoging_bezig or self._opeenvolgende_fouten >= self.max_fouten:
+                if self._geopend_op is None or self._proefpoging_bezig:
+                    logger.warning(
+                        f"Stroomonderbreker voor {self.naam} is open na {self._opeenvolgende_fouten} opeenvolgende fouten"
+                    )
+                self._geopend_op = time.monotonic()
+                self._proefpoging_bezig = False
+
+    def registreer_afgebroken(self) -> None:
+        """
+        Registreert een opzoeking die is afgebroken omdat het tijdsbudget op was.
+
+        Dit telt niet als fout van de bron; een lopende proefpoging wordt vrijgegeven.
+        """
+        with self._lock:
+            self._proefpoging_bezig = False
+
+    def herstel(self) -> None:
+        """Sluit de stroomonderbreker en zet het aantal fouten terug op 0."""
+        with self._lock:
+            self._opeenvolgende_fouten = 0
+            self._geopend_op = None
+            self._proefpoging_bezig = False
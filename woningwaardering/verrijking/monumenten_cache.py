@@ -0,0 +1,266 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import Callable, Iterable
+
+from loguru import logger
+
+from woningwaardering.vera.referentiedata.eenheidmonument import (
+    EenheidmonumentReferentiedata,
+)
+
+InvalidatieHook = Callable[[str | None], None]
+
+
+class MonumentenCache:
+    """Cache van monumentale statussen per BAG verblijfsobject id.
+
+    De cache houdt de statussen in het geheugen bij en schrijft ze optioneel weg
+    naar een lokaal SQLite-bestand, zodat opeenvolgende runs de monumenten-API's
+    alleen hoeven te raadplegen voor nieuwe of verlopen BAG ids. Ook een leeg
+    resultaat (geen monumentale status) wordt gecachet.
+
+    Parameters:
+        pad (str | Path | None, optional): Het pad naar het SQLite-bestand.
+            Zonder pad wordt alleen in het geheugen gecachet.
+        ttl (timedelta, optional): De geldigheidsduur van een gecachete status.
+            Standaard is 30 dagen.
+        ttl_negatief (timedelta | None, optional): De geldigheidsduur van een
+            gecachet leeg resultaat. Standaard gelijk aan `ttl`.
+    """
+
+    def __init__(
+        self,
+        pad: str | Path | None = None,
+        ttl: timedelta = timedelta(days=30),
+        ttl_negatief: timedelta | None = None,
+    ) -> None:
+        self.pad = Path(pad) if pad is not None else None
+        self.ttl = ttl
+        self.ttl_negatief = ttl if ttl_negatief is None else ttl_negatief
+        self._geheugen: dict[str, tuple[float, tuple[tuple[str, str], ...]]] = {}
+        self._invalidatie_hooks: list[InvalidatieHook] = []
+        self._lock = threading.RLock()
+        self._verbinding: sqlite3.Connection | None = None
+
+        if self.pad is not None:
+            self.pad.parent.mkdir(parents=True, exist_ok=True)
+            self._verbinding = sqlite3.connect(str(self.pad), check_same_thread=False)
+            self._verbinding.execute(
+                "CREATE TABLE IF NOT EXISTS monumenten ("
+                "bag_identificatie TEXT PRIMARY KEY, "
+                "monumenten TEXT NOT NULL, "
+                "opgehaald REAL NOT NULL)"
+            )
+            self._verbinding.commit()
+
+    def _is_verlopen(
+        self, opgehaald: float, monumenten: tuple[tuple[str, str], ...]
+    ) -> bool:
+        ttl = self.ttl if monumenten else self.ttl_negatief
+        return time.time() - opgehaald > ttl.total_seconds()
+
+    def _lees(
+        self, bag_identificatie: str
+    ) -> tuple[float, tuple[tuple[str, str], ...]] | None:
+        regel = self._geheugen.get(bag_identificatie)
+        if regel is not None or self._verbinding is None:
+            return regel
+
+        rij = self._verbinding.execute(
+            "SELECT monumenten, opgehaald FROM monumenten WHERE bag_identificatie = ?",
+            (bag_identificatie,),
+        ).fetchone()
+        if rij is None:
+            return None
+
+        regel = (
+            rij[1],
+            tuple((code, naam) for code, naam in json.loads(rij[0])),
+        )
+        self._geheugen[bag_identificatie] = regel
+        return regel
+
+    def get(self, bag_identificatie: str) -> list[EenheidmonumentReferentiedata] | None:
+        """
+        Haalt de gecachete monumentale statussen op voor een BAG verblijfsobject id.
+
+        Args:
+            bag_identificatie (str): Het BAG verblijfsobject id.
+
+        Returns:
+            list[EenheidmonumentReferentiedata] | None: De gecachete statussen (een lege lijst
+                als bekend is dat er geen monumentale status is), of None als het id niet
+                of niet meer geldig in de cache staat.
+        """
+        with self._lock:
+            regel = self._lees(bag_identificatie)
+            if regel is None:
+                return None
+            opgehaald, monumenten = regel
+            if self._is_verlopen(opgehaald, monumenten):
+                logger.debug(
+                    f"Monumentale statussen voor bag_identificatie {bag_identificatie} zijn verlopen in de cache"
+                )
+                return None
+
+        return [
+            EenheidmonumentReferentiedata(code=code, naam=naam)
+            for code, naam in monumenten
+        ]
+
+    def set(
+        self,
+        bag_identificatie: str,
+        monumenten: Iterable[EenheidmonumentReferentiedata],
+    ) -> None:
+        """
+        Slaat de monumentale statussen op voor een BAG verblijfsobject id.
+
+        Args:
+            bag_identificatie (str): Het BAG verblijfsobject id.
+            monumenten (Iterable[EenheidmonumentReferentiedata]): De statussen. Een lege
+                iterable wordt opgeslagen als negatief resultaat.
+        """
+        regel = (
+            time.time(),
+            tuple(
+                (monument.code or "", monument.naam or "") for monument in monumenten
+            ),
+        )
+        with self._lock:
+            self._geheugen[bag_identificatie] = regel
+            if self._verbinding is not None:
+                self._verbinding.execute(
+                    "INSERT OR REPLACE INTO monumenten VALUES (?, ?, ?)",
+                    (bag_identificatie, json.dumps(regel[1]), regel[0]),
+                )
+                self._verbinding.commit()
+
+    def ontbrekend(self, bag_identificaties: Iterable[str]) -> list[str]:
+        """
+        Geeft de BAG verblijfsobject ids terug die niet, of niet meer geldig, in de cache staan.
+
+        Hiermee kan een batch vooraf bepalen voor welke ids de statussen opgehaald moeten worden.
+
+        Args:
+            bag_identificaties (Iterable[str]): De BAG verblijfsobject ids.
+
+        Returns:
+            list[str]: De unieke ids die opgehaald moeten worden, in volgorde van voorkomen.
+        """
+        with self._lock:
+            return [
+                bag_identificatie
+                for bag_identificatie in dict.fromkeys(bag_identificaties)
+                if (regel := self._lees(bag_identificatie)) is None
+                or self._is_verlopen(*regel)
+            ]
+
+    def registreer_invalidatie_hook(self, hook: InvalidatieHook) -> None:
+        """
+        Registreert een functie die wordt aangeroepen bij het invalideren van de cache.
+
+        Args:
+            hook (Callable[[str | None], None]): Wordt aangeroepen met het geïnvalideerde
+                BAG verblijfsobject id, of met None als de hele cache is geïnvalideerd.
+        """
+        self._invalidatie_hooks.append(hook)
+
+    def invalideer(self, bag_identificatie: str | None = None) -> None:
+        """
+        Verwijdert de statussen van één BAG verblijfsobject id, of van alle ids, uit de cache.
+
+        Args:
+            bag_identificatie (str | None, optional): Het te invalideren id.
+                Zonder id wordt de hele cache geleegd.
+        """
+        with self._lock:
+            if bag_identificatie is None:
+                self._geheugen.clear()
+                if self._verbinding is not None:
+                    self._verbinding.execute("DELETE FROM monumenten")
+            else:
+                self._geheugen.pop(bag_identificatie, None)
+                if self._verbinding is not None:
+                    self._verbinding.execute(
+                        "DELETE FROM monumenten WHERE bag_identificatie = ?",
+                        (bag_identificatie,),
+                    )
+            if self._verbinding is not None:
+                self._verbinding.commit()
+
+        for hook in self._invalidatie_hooks:
+            hook(bag_identificatie)
+
+    def verwijder_verlopen(self) -> int:
+        """
+        Verwijdert alle verlopen statussen uit de cache.
+
+        Returns:
+            int: Het aantal verwijderde BAG verblijfsobject ids.
+        """
+        with self._lock:
+            if self._verbinding is not None:
+                for (
+                    bag_identificatie,
+                    monumenten,
+                    opgehaald,
+                ) in self._verbinding.execute(
+                    "SELECT bag_identificatie, monumenten, opgehaald FROM monumenten"
+                ).fetchall():
+                    self._geheugen.setdefault(
+                        bag_identificatie,
+                        (
+                            opgehaald,
+                            tuple(
+                                (code, naam) for code, naam in json.loads(monumenten)
+                            ),
+                        ),
+                    )
+            verlopen = [
+                bag_identificatie
+                for bag_identificatie, regel in self._geheugen.items()
+                if self._is_verlopen(*regel)
+            ]
+
+        for bag_identificatie in verlopen:
+            self.invalideer(bag_identificatie)
+
+        return len(verlopen)
+
+    def sluit(self) -> None:
+        """Sluit de verbinding met het SQLite-bestand."""
+        with self._lock:
+            if self._verbinding is not None:
+                self._verbinding.close()
+                self._verbinding = None
+
+
+_monumenten_cache: MonumentenCache | None = MonumentenCache()
+
+
+def get_monumenten_cache() -> MonumentenCache | None:
+    """
+    Geeft de monumentencache terug die standaard gebruikt wordt bij het ophalen van monumentale statussen.
+
+    Returns:
+        MonumentenCache | None: De standaard cache, of None als caching is uitgeschakeld.
+    """
+    return _monumenten_cache
+
+
+def stel_monumenten_cache_in(cache: MonumentenCache | None) -> None:
+    """
+    Stelt de monumentencache in die standaard gebruikt wordt bij het ophalen van monumentale statussen.
+
+    Args:
+        cache (MonumentenCache | None): De te gebruiken cache, of None om caching uit te schakelen.
+    """
+    global _monumenten_cache
+    _monumenten_cache = cache
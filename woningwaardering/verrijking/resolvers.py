@@ -0,0 +1,515 @@
+from __future__ import annotations
+
+import asyncio
+import csv
+import re
+import warnings
+from abc import ABC, abstractmethod
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+from typing import Any
+
+import requests
+from loguru import logger
+
+from woningwaardering.vera.bvg.generated import EenhedenWoonplaats
+from woningwaardering.vera.referentiedata import Eenheidmonument
+from woningwaardering.vera.referentiedata.eenheidmonument import (
+    EenheidmonumentReferentiedata,
+)
+from woningwaardering.verrijking.begrenzing import (
+    OpzoekingOvergeslagen,
+    Stroomonderbreker,
+    TijdsbudgetVerstreken,
+    begrens_timeout,
+)
+
+KADASTER_SPARQL_ENDPOINT = "https://data.kkg.kadaster.nl/service/sparql"
+
+WOONPLAATS_QUERY_TEMPLATE = """
+prefix sor: <https://data.kkg.kadaster.nl/sor/model/def/>
+prefix nen3610: <https://data.kkg.kadaster.nl/nen3610/model/def/>
+prefix skos: <http://www.w3.org/2004/02/skos/core#>
+
+select ?identificatie ?naam
+where {{
+  values ?postcode {{ "{postcode}" }}
+  values ?huisnummer {{ {huisnummer} }}
+  values ?huisnummertoevoeging {{ "{huisnummertoevoeging}" }}
+  values ?huisletter {{ "{huisletter}" }}
+
+  ?adres a sor:Nummeraanduiding;
+         sor:postcode ?postcode;
+         sor:ligtAan/sor:ligtIn ?woonplaats;
+         sor:huisnummer ?adresHuisnummer.
+
+  ?woonplaats sor:geregistreerdMet/nen3610:identificatie ?identificatie;
+              skos:prefLabel ?naam.
+
+  optional
+  {{
+    ?adres sor:huisnummer ?adresHuisnummer.
+  }}
+  optional
+  {{
+    ?adres sor:huisnummertoevoeging ?adresHuisnummertoevoeging.
+  }}
+  optional
+  {{
+    ?adres sor:huisletter ?adresHuisletter.
+  }}
+  FILTER(
+    (!BOUND(?adresHuisnummer) && ?huisnummer = "") ||
+    (?adresHuisnummer = ?huisnummer)
+  )
+  FILTER(
+    (!BOUND(?adresHuisletter) && ?huisletter = "") ||
+    (lcase(?adresHuisletter) = lcase(?huisletter))
+  )
+  FILTER(
+    (!BOUND(?adresHuisnummertoevoeging) && ?huisnummertoevoeging = "") ||
+    (lcase(?adresHuisnummertoevoeging) = lcase(?huisnummertoevoeging))
+  )
+}}
+"""
+
+_POSTCODE_PATROON = re.compile(r"^([1-9][0-9]{3})([A-Z]{2})$")
+
+
+class WoonplaatsResolver(ABC):
+    """Zoekt de woonplaats van een nummeraanduiding op."""
+
+    @abstractmethod
+    def zoek_woonplaats(
+        self,
+        postcode: str,
+        huisnummer: int,
+        huisletter: str = "",
+        huisnummertoevoeging: str = "",
+    ) -> EenhedenWoonplaats | None:
+        """
+        Zoekt de woonplaats op voor een nummeraanduiding.
+
+        Args:
+            postcode (str): De postcode zonder spaties.
+            huisnummer (int): Het huisnummer.
+            huisletter (str, optional): De huisletter.
+            huisnummertoevoeging (str, optional): De huisnummertoevoeging.
+
+        Returns:
+            EenhedenWoonplaats | None: De woonplaats, of None als deze niet gevonden kan worden.
+
+        Raises:
+            OpzoekingOvergeslagen: Als de opzoeking is overgeslagen, bijvoorbeeld omdat
+                het tijdsbudget op is of de stroomonderbreker open is.
+        """
+        pass  # pragma: no cover
+
+
+class MonumentenResolver(ABC):
+    """Zoekt de monumentale statussen van BAG verblijfsobjecten op."""
+
+    def is_beschikbaar(self) -> bool:
+        """Geeft True terug als de resolver gebruikt kan worden."""
+        return True
+
+    @abstractmethod
+    def zoek_monumenten(
+        self, bag_identificaties: list[str]
+    ) -> dict[str, list[EenheidmonumentReferentiedata]]:
+        """
+        Zoekt de monumentale statussen op voor een lijst BAG verblijfsobject ids.
+
+        Args:
+            bag_identificaties (list[str]): De BAG verblijfsobject ids.
+
+        Returns:
+            dict[str, list[EenheidmonumentReferentiedata]]: De statussen per id.
+                Een id zonder monumentale status krijgt een lege lijst of ontbreekt.
+
+
+        Raises:
+            OpzoekingOvergeslagen: Als de opzoeking is overgeslagen, bijvoorbeeld omdat
+                het tijdsbudget op is of de stroomonderbreker open is.
+        """
+        pass  # pragma: no cover
+
+
+class KadasterWoonplaatsResolver(WoonplaatsResolver):
+    """Zoekt woonplaatsen op via het SPARQL-endpoint van het Kadaster.
+
+    De timeout per request wordt begrensd door het tijdsbudget dat in de huidige
+    context geldt; een timeout door het tijdsbudget telt niet als fout van het
+    endpoint. Na herhaalde fouten gaat de stroomonderbreker open en worden
+    woonplaatsen tijdelijk niet meer opgehaald.
+
+    Parameters:
+        endpoint (str, optional): De url van het SPARQL-endpoint.
+        timeout (float, optional): De timeout in seconden per request. Standaard is 5.
+        stroomonderbreker (Stroomonderbreker | None, optional): De stroomonderbreker
+            voor het endpoint. Standaard opent deze na 5 opeenvolgende fouten.
+    """
+
+    def __init__(
+        self,
+        endpoint: str = KADASTER_SPARQL_ENDPOINT,
+        timeout: float = 5,
+        stroomonderbreker: Stroomonderbreker | None = None,
+    ) -> None:
+        self.endpoint = endpoint
+        self.timeout = timeout
+        self.stroomonderbreker = stroomonderbreker or Stroomonderbreker(
+            "het Kadaster SPARQL-endpoint"
+        )
+
+    def zoek_woonplaats(
+        self,
+        postcode: str,
+        huisnummer: int,
+        huisletter: str = "",
+        huisnummertoevoeging: str = "",
+    ) -> EenhedenWoonplaats | None:
+        query = WOONPLAATS_QUERY_TEMPLATE.format(
+            postcode=postcode,
+            huisnummer=huisnummer,
+            huisletter=huisletter,
+            huisnummertoevoeging=huisnummertoevoeging,
+        )
+        request_data = {"query": query, "format": "json"}
+
+        timeout = begrens_timeout(self.timeout)
+        if timeout <= 0:
+            raise TijdsbudgetVerstreken("Tijdsbudget is verstreken")
+
+        if not self.stroomonderbreker.laat_toe():
+            raise OpzoekingOvergeslagen(
+                f"Stroomonderbreker voor {self.stroomonderbreker.naam} is open"
+            )
+
+        try:
+            response = requests.post(self.endpoint, data=request_data, timeout=timeout)
+            response.raise_for_status()
+            result = response.json()
+        except requests.RequestException as e:
+            if isinstance(e, requests.Timeout) and timeout < self.timeout:
+                self.stroomonderbreker.registreer_afgebroken()
+                raise TijdsbudgetVerstreken("Tijdsbudget is verstreken") from e
+            self.stroomonderbreker.registreer_fout()
+            warnings.warn(f"Fout bij het ophalen van woonplaatsdata: {e}", UserWarning)
+            return None
+
+        self.stroomonderbreker.registreer_succes()
+
+        if isinstance(result, list) and len(result) == 1:
+            return EenhedenWoonplaats(
+                code=result[0]["identificatie"], naam=result[0]["naam"]
+            )
+        return None
+
+
+class MonumentenApiResolver(MonumentenResolver):
+    """Zoekt monumentale statussen op via de API's van het Kadaster en Cultureel Erfgoed.
+
+    Hiervoor is de optionele package `monumenten` nodig. De timeout wordt begrensd
+    door het tijdsbudget dat in de huidige context geldt; een timeout door het
+    tijdsbudget telt niet als fout van de API's. Na herhaalde fouten gaat de
+    stroomonderbreker open en is de resolver tijdelijk niet beschikbaar.
+
+    Parameters:
+        timeout (float, optional): De timeout in seconden per opzoeking. Standaard is 30.
+        stroomonderbreker (Stroomonderbreker | None, optional): De stroomonderbreker
+            voor de API's. Standaard opent deze na 5 opeenvolgende fouten.
+    """
+
+    def __init__(
+        self,
+        timeout: float = 30,
+        stroomonderbreker: Stroomonderbreker | None = None,
+    ) -> None:
+        self.timeout = timeout
+        self.stroomonderbreker = stroomonderbreker or Stroomonderbreker(
+            "de monumenten-API's"
+        )
+
+    def is_beschikbaar(self) -> bool:
+        try:
+            import monumenten  # noqa: F401
+        except ImportError:
+            warnings.warn(
+                "Package 'monumenten' is niet geïnstalleerd. Monumentale status wordt niet automatisch bijgewerkt. "
+                "Installeer met: pip install woningwaardering[monumenten]",
+                UserWarning,
+            )
+            return False
+
+        if self.stroomonderbreker.is_open:
+            warnings.warn(
+                f"Stroomonderbreker voor {self.stroomonderbreker.naam} is open. Monumentale status wordt niet automatisch bijgewerkt.",
+                UserWarning,
+            )
+            return False
+
+        return True
+
+    def zoek_monumenten(
+        self, bag_identificaties: list[str]
+    ) -> dict[str, list[EenheidmonumentReferentiedata]]:
+        from monumenten import MonumentenClient
+
+        timeout = begrens_timeout(self.timeout)
+        if timeout <= 0:
+            raise TijdsbudgetVerstreken("Tijdsbudget is verstreken")
+
+        if not self.stroomonderbreker.laat_toe():
+            raise OpzoekingOvergeslagen(
+                f"Stroomonderbreker voor {self.stroomonderbreker.naam} is open"
+            )
+
+        async def _get_monuments() -> Any:
+            async with MonumentenClient() as client:
+                return await asyncio.wait_for(
+                    client.process_from_list(
+                        bag_identificaties,
+                        to_vera=True,
+                    ),
+                    timeout=timeout,
+                )
+
+        # Voer de async context manager uit in een synchrone context
+        try:
+            resultaat = asyncio.run(_get_monuments())
+        except (asyncio.TimeoutError, TimeoutError) as e:
+            if timeout < self.timeout:
+                self.stroomonderbreker.registreer_afgebroken()
+                raise TijdsbudgetVerstreken("Tijdsbudget is verstreken") from e
+            self.stroomonderbreker.registreer_fout()
+            raise
+        except Exception:
+            self.stroomonderbreker.registreer_fout()
+            raise
+
+        self.stroomonderbreker.registreer_succes()
+
+        return {
+            bag_identificatie: [
+                EenheidmonumentReferentiedata(
+                    code=monument["code"], naam=monument["naam"]
+                )
+                for monument in monumenten or []
+            ]
+            for bag_identificatie, monumenten in resultaat.items()
+        }
+
+
+def _postcode_huisnummer_sleutel(postcode: str, huisnummer: int) -> int | None:
+    match = _POSTCODE_PATROON.match(postcode.replace(" ", "").upper())
+    if match is None or not 0 < huisnummer < 100_000:
+        return None
+    cijfers, letters = match.groups()
+    return (
+        (int(cijfers) * 26 + ord(letters[0]) - 65) * 26 + ord(letters[1]) - 65
+    ) * 100_000 + huisnummer
+
+
+def _zoek_index(sleutels: array[int], sleutel: int) -> int | None:
+    positie = bisect_left(sleutels, sleutel)
+    if positie < len(sleutels) and sleutels[positie] == sleutel:
+        return positie
+    return None
+
+
+class ExtractWoonplaatsResolver(WoonplaatsResolver):
+    """Zoekt woonplaatsen op in een lokaal extract van de BAG.
+
+    Het extract is een CSV-bestand met de kolommen `postcode`, `huisnummer`,
+    `woonplaatscode` en `woonplaatsnaam`. Postcode en huisnummer worden samengevoegd
+    tot een integer-sleutel in een gesorteerde array, zodat een opzoeking een
+    binaire zoekactie is zonder netwerkverkeer. Huisletter en huisnummertoevoeging
+    zijn niet nodig om de woonplaats te bepalen en worden genegeerd.
+
+    Parameters:
+        pad (str | Path): Het pad naar het CSV-bestand.
+    """
+
+    def __init__(self, pad: str | Path) -> None:
+        self.pad = Path(pad)
+        woonplaatsen: dict[tuple[str, str], int] = {}
+        regels: list[tuple[int, int]] = []
+
+        with open(self.pad, newline="", encoding="utf-8") as bestand:
+            lezer = csv.DictReader(bestand)
+            for rij in lezer:
+                sleutel = (
+                    _postcode_huisnummer_sleutel(
+                        rij["postcode"], int(rij["huisnummer"])
+                    )
+                    if rij["huisnummer"].isdecimal()
+                    else None
+                )
+                if sleutel is None:
+                    logger.warning(
+                        f"Ongeldige nummeraanduiding in {self.pad} op regel {lezer.line_num}: {rij['postcode']} {rij['huisnummer']}"
+                    )
+                    continue
+                woonplaats = (rij["woonplaatscode"], rij["woonplaatsnaam"])
+                regels.append(
+                    (sleutel, woonplaatsen.setdefault(woonplaats, len(woonplaatsen)))
+                )
+
+        regels.sort()
+        self._sleutels = array("q")
+        self._woonplaats_indexen = array("I")
+        for sleutel, woonplaats_index in regels:
+            if self._sleutels and self._sleutels[-1] == sleutel:
+                continue
+            self._sleutels.append(sleutel)
+            self._woonplaats_indexen.append(woonplaats_index)
+
+        self._woonplaatsen = list(woonplaatsen)
+        logger.info(
+            f"{len(self._sleutels)} nummeraanduidingen in {len(self._woonplaatsen)} woonplaatsen geladen uit {self.pad}"
+        )
+
+    def __len__(self) -> int:
+        return len(self._sleutels)
+
+    def zoek_woonplaats(
+        self,
+        postcode: str,
+        huisnummer: int,
+        huisletter: str = "",
+        huisnummertoevoeging: str = "",
+    ) -> EenhedenWoonplaats | None:
+        sleutel = _postcode_huisnummer_sleutel(postcode, huisnummer)
+        if sleutel is None:
+            return None
+
+        positie = _zoek_index(self._sleutels, sleutel)
+        if positie is None:
+            return None
+
+        code, naam = self._woonplaatsen[self._woonplaats_indexen[positie]]
+        return EenhedenWoonplaats(code=code, naam=naam)
+
+
+class ExtractMonumentenResolver(MonumentenResolver):
+    """Zoekt monumentale statussen op in een lokaal extract.
+
+    Het extract is een CSV-bestand met de kolommen `bag_identificatie` en `code`,
+    en optioneel `naam`, met één regel per monumentale status. Een BAG
+    verblijfsobject id dat niet in het extract voorkomt, heeft geen monumentale
+    status. De statussen worden per id opgeslagen als bitmasker in een gesorteerde
+    array, zodat een opzoeking een binaire zoekactie is zonder netwerkverkeer.
+
+    Parameters:
+        pad (str | Path): Het pad naar het CSV-bestand.
+    """
+
+    def __init__(self, pad: str | Path) -> None:
+        self.pad = Path(pad)
+        bekende_monumenten = {monument.code: monument for monument in Eenheidmonument}
+        self._monumenten: list[EenheidmonumentReferentiedata] = []
+        bits: dict[str, int] = {}
+        maskers: dict[int, int] = {}
+
+        with open(self.pad, newline="", encoding="utf-8") as bestand:
+            lezer = csv.DictReader(bestand)
+            for rij in lezer:
+                if not rij["bag_identificatie"].isdecimal():
+                    logger.warning(
+                        f"Ongeldig BAG verblijfsobject id in {self.pad} op regel {lezer.line_num}: {rij['bag_identificatie']}"
+                    )
+                    continue
+                code = rij["code"]
+                if code not in bits:
+                    if len(bits) == 32:
+                        raise ValueError(
+                            f"Het extract {self.pad} bevat meer dan 32 verschillende monumentcodes."
+                        )
+                    bits[code] = len(bits)
+                    bekend = bekende_monumenten.get(code)
+                    self._monumenten.append(
+                        EenheidmonumentReferentiedata(
+                            code=code,
+                            naam=rij.get("naam")
+                            or (bekend.naam if bekend is not None else None),
+                        )
+                    )
+                bag_identificatie = int(rij["bag_identificatie"])
+                maskers[bag_identificatie] = maskers.get(bag_identificatie, 0) | (
+                    1 << bits[code]
+                )
+
+        self._sleutels = array("q", sorted(maskers))
+        self._maskers = array("I", (maskers[sleutel] for sleutel in self._sleutels))
+        logger.info(
+            f"Monumentale statussen van {len(self._sleutels)} verblijfsobjecten geladen uit {self.pad}"
+        )
+
+    def __len__(self) -> int:
+        return len(self._sleutels)
+
+    def zoek_monumenten(
+        self, bag_identificaties: list[str]
+    ) -> dict[str, list[EenheidmonumentReferentiedata]]:
+        resultaat: dict[str, list[EenheidmonumentReferentiedata]] = {}
+        for bag_identificatie in bag_identificaties:
+            positie = (
+                _zoek_index(self._sleutels, int(bag_identificatie))
+                if bag_identificatie.isdigit()
+                else None
+            )
+            masker = self._maskers[positie] if positie is not None else 0
+            resultaat[bag_identificatie] = [
+                monument
+                for bit, monument in enumerate(self._monumenten)
+                if masker & (1 << bit)
+            ]
+        return resultaat
+
+
+_woonplaats_resolver: WoonplaatsResolver = KadasterWoonplaatsResolver()
+_monumenten_resolver: MonumentenResolver = MonumentenApiResolver()
+
+
+def get_woonplaats_resolver() -> WoonplaatsResolver:
+    """
+    Geeft de resolver terug die standaard gebruikt wordt om woonplaatsen op te zoeken.
+
+    Returns:
+        WoonplaatsResolver: De standaard woonplaatsresolver.
+    """
+    return _woonplaats_resolver
+
+
+def stel_woonplaats_resolver_in(resolver: WoonplaatsResolver) -> None:
+    """
+    Stelt de resolver in die standaard gebruikt wordt om woonplaatsen op te zoeken.
+
+    Args:
+        resolver (WoonplaatsResolver): De te gebruiken resolver.
+    """
+    global _woonplaats_resolver
+    _woonplaats_resolver = resolver
+
+
+def get_monumenten_resolver() -> MonumentenResolver:
+    """
+    Geeft de resolver terug die standaard gebruikt wordt om monumentale statussen op te zoeken.
+
+    Returns:
+        MonumentenResolver: De standaard monumentenresolver.
+    """
+    return _monumenten_resolver
+
+
+def stel_monumenten_resolver_in(resolver: MonumentenResolver) -> None:
+    """
+    Stelt de resolver in die standaard gebruikt wordt om monumentale statussen op te zoeken.
+
+    Args:
+        resolver (MonumentenResolver): De te gebruiken resolver.
+    """
+    global _monumenten_resolver
+    _monumenten_resolver = resolver
@@ -0,0 +1,363 @@
+from __future__ import annotations
+
+import contextvars
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Iterable
+
+from loguru import logger
+
+from woningwaardering.stelsels import utils
+from woningwaardering.vera.bvg.generated import EenhedenEenheid, EenhedenEenheidadres
+from woningwaardering.vera.referentiedata import Woningwaarderingstelsel
+from woningwaardering.vera.referentiedata.eenheidmonument import (
+    EenheidmonumentReferentiedata,
+)
+from woningwaardering.verrijking.begrenzing import (
+    OpzoekingOvergeslagen,
+    Tijdsbudget,
+    TijdsbudgetVerstreken,
+    tijdsbudget,
+)
+from woningwaardering.verrijking.monumenten_cache import (
+    MonumentenCache,
+    get_monumenten_cache,
+)
+from woningwaardering.verrijking.resolvers import (
+    MonumentenResolver,
+    WoonplaatsResolver,
+    get_monumenten_resolver,
+    get_woonplaats_resolver,
+)
+
+
+class Verrijkingsrapport:
+    """Rapport van de gegevens die bij het verrijken van een eenheid zijn aangevuld.
+
+    Parameters:
+        eenheid_id (str | None): Het id van de verrijkte eenheid.
+
+    Attributes:
+        aangevuld (list[str]): De attributen van de eenheid die zijn aangevuld.
+        fouten (list[str]): De fouten die zijn opgetreden bij het aanvullen.
+    """
+
+    def __init__(self, eenheid_id: str | None) -> None:
+        self.eenheid_id = eenheid_id
+        self.aangevuld: list[str] = []
+        self.fouten: list[str] = []
+
+    def __repr__(self) -> str:
+        return f"Verrijkingsrapport(eenheid_id={self.eenheid_id!r}, aangevuld={self.aangevuld!r}, fouten={self.fouten!r})"
+
+
+def _bag_identificatie(eenheid: EenhedenEenheid) -> str | None:
+    if eenheid.adresseerbaar_object_basisregistratie is None:
+        return None
+    return eenheid.adresseerbaar_object_basisregistratie.bag_identificatie
+
+
+class Verrijking:
+    """Vult eenheden vóór de waardering aan met gegevens uit externe bronnen.
+
+    De stelselgroepen doen zelf geen netwerkverzoeken. Ontbrekende monumentale
+    statussen en woonplaatsen worden eenmalig per eenheid opgehaald door deze
+    verrijkingsstap, zodat de waardering zelf alleen nog rekent.
+
+    Parameters:
+        monumenten (bool, optional): Of ontbrekende monumentale statussen worden opgehaald.
+        woonplaatsen (bool, optional): Of ontbrekende woonplaatsen worden opgehaald.
+            Woonplaatsen worden alleen gebruikt voor onzelfstandige woonruimten.
+        monumenten_resolver (MonumentenResolver | None, optional): De resolver voor monumentale
+            statussen. Standaard wordt de resolver van `get_monumenten_resolver` gebruikt.
+        woonplaats_resolver (WoonplaatsResolver | None, optional): De resolver voor woonplaatsen.
+            Standaard wordt de resolver van `get_woonplaats_resolver` gebruikt.
+        cache (MonumentenCache | None, optional): De monumentencache.
+            Standaard wordt de cache van `get_monumenten_cache` gebruikt.
+        batchgrootte (int, optional): Het maximale aantal BAG ids per opzoeking van monumentale statussen.
+        max_workers (int, optional): Het maximale aantal gelijktijdige opzoekingen van woonplaatsen.
+        tijdsbudget (timedelta | None, optional): De maximale tijd voor de externe opzoekingen van
+            één eenheid. Het budget van een eenheid gaat in bij haar eerste opzoeking; een opzoeking
+            van monumentale statussen geldt daarbij voor alle eenheden in de batch. Opzoekingen na
+            het verstrijken van het budget worden overgeslagen en vermeld in de rapporten.
+            Standaard is er geen budget.
+    """
+
+    TIJDSBUDGET_VERSTREKEN = "tijdsbudget verstreken"
+
+    def __init__(
+        self,
+        monumenten: bool = True,
+        woonplaatsen: bool = True,
+        monumenten_resolver: MonumentenResolver | None = None,
+        woonplaats_resolver: WoonplaatsResolver | None = None,
+        cache: MonumentenCache | None = None,
+        batchgrootte: int = 500,
+        max_workers: int = 8,
+        tijdsbudget: timedelta | None = None,
+    ) -> None:
+        if batchgrootte < 1:
+            raise ValueError("batchgrootte moet minimaal 1 zijn")
+        if max_workers < 1:
+            raise ValueError("max_workers moet minimaal 1 zijn")
+
+        self.monumenten = monumenten
+        self.woonplaatsen = woonplaatsen
+        self.monumenten_resolver = monumenten_resolver
+        self.woonplaats_resolver = woonplaats_resolver
+        self.cache = cache
+        self.batchgrootte = batchgrootte
+        self.max_workers = max_workers
+        self.tijdsbudget = tijdsbudget
+
+    def verrijk(self, eenheid: EenhedenEenheid) -> Verrijkingsrapport:
+        """Verrijkt één eenheid.
+
+        Parameters:
+            eenheid (EenhedenEenheid): De te verrijken eenheid.
+
+        Returns:
+            Verrijkingsrapport: Wat er voor de eenheid is aangevuld.
+        """
+        return self.verrijk_batch([eenheid])[0]
+
+    def verrijk_batch(
+        self, eenheden: Iterable[EenhedenEenheid]
+    ) -> list[Verrijkingsrapport]:
+        """Verrijkt een batch eenheden.
+
+        Monumentale statussen worden per batch van maximaal `batchgrootte` BAG ids
+        opgezocht, waarbij ids die al in de cache staan worden overgeslagen.
+        Woonplaatsen worden gelijktijdig opgezocht met maximaal `max_workers` threads.
+
+        Parameters:
+            eenheden (Iterable[EenhedenEenheid]): De te verrijken eenheden.
+
+        Returns:
+            list[Verrijkingsrapport]: Per eenheid, in dezelfde volgorde, wat er is aangevuld.
+        """
+        eenheden = list(eenheden)
+        rapporten = [Verrijkingsrapport(eenheid.id) for eenheid in eenheden]
+        budgetten: list[Tijdsbudget | None] = [None] * len(eenheden)
+
+        if self.monumenten:
+            self._verrijk_monumenten(eenheden, rapporten, budgetten)
+
+        if self.woonplaatsen:
+            self._verrijk_woonplaatsen(eenheden, rapporten, budgetten)
+
+        overgeslagen = sum(
+            1
+            for rapport in rapporten
+            for fout in rapport.fouten
+            if fout.endswith(self.TIJDSBUDGET_VERSTREKEN)
+        )
+        if overgeslagen:
+            warnings.warn(
+                f"Tijdsbudget van {self.tijdsbudget} is verstreken: {overgeslagen} opzoekingen zijn overgeslagen.",
+                UserWarning,
+            )
+
+        for rapport in rapporten:
+            if rapport.aangevuld:
+                logger.debug(
+                    f"Eenheid ({rapport.eenheid_id}): verrijkt met {', '.join(rapport.aangevuld)}"
+                )
+
+        return rapporten
+
+    def _start_budget(self) -> Tijdsbudget | None:
+        return Tijdsbudget(self.tijdsbudget) if self.tijdsbudget is not None else None
+
+    def _verrijk_monumenten(
+        self,
+        eenheden: list[EenhedenEenheid],
+        rapporten: list[Verrijkingsrapport],
+        budgetten: list[Tijdsbudget | None],
+    ) -> None:
+        te_verrijken = [
+            (index, eenheid, rapport)
+            for index, (eenheid, rapport) in enumerate(zip(eenheden, rapporten))
+            if eenheid.monumenten is None
+        ]
+        if not te_verrijken:
+            return
+
+        cache = self.cache if self.cache is not None else get_monumenten_cache()
+        resolver = (
+            self.monumenten_resolver
+            if self.monumenten_resolver is not None
+            else get_monumenten_resolver()
+        )
+
+        gevonden: dict[str, list[EenheidmonumentReferentiedata]] = {}
+        fouten: dict[str, str] = {}
+
+        indices: dict[str, list[int]] = {}
+        for index, eenheid, _ in te_verrijken:
+            bag_identificatie = _bag_identificatie(eenheid)
+            if bag_identificatie is not None:
+                indices.setdefault(bag_identificatie, []).append(index)
+        if cache is not None:
+            ontbrekend = cache.ontbrekend(list(indices))
+        else:
+            ontbrekend = list(indices)
+
+        if ontbrekend and resolver.is_beschikbaar():
+            for start in range(0, len(ontbrekend), self.batchgrootte):
+                batch = ontbrekend[start : start + self.batchgrootte]
+
+                # de opzoeking van een batch start het budget van de eenheden erin
+                budget = self._start_budget()
+                for bag_identificatie in batch:
+                    for index in indices[bag_identificatie]:
+                        if budgetten[index] is None:
+                            budgetten[index] = budget
+
+                if budget is not None and budget.is_verstreken():
+                    fouten.update(
+                        (bag_identificatie, self.TIJDSBUDGET_VERSTREKEN)
+                        for bag_identificatie in batch
+                    )
+                    continue
+
+                logger.debug(
+                    f"Monumentale statussen worden opgehaald voor {len(batch)} bag_identificaties"
+                )
+                try:
+                    with tijdsbudget(budget):
+                        resultaten = resolver.zoek_monumenten(batch)
+                except TijdsbudgetVerstreken:
+                    fouten.update(
+                        (bag_identificatie, self.TIJDSBUDGET_VERSTREKEN)
+                        for bag_identificatie in batch
+                    )
+                    continue
+                except Exception as e:
+                    warnings.warn(
+                        f"Monumentale statussen konden niet worden opgehaald m.b.v. API: {e}",
+                        UserWarning,
+                    )
+                    fouten.update(
+                        (bag_identificatie, str(e)) for bag_identificatie in batch
+                    )
+                    continue
+
+                for bag_identificatie in batch:
+                    gevonden[bag_identificatie] = resultaten.get(bag_identificatie, [])
+                    if cache is not None:
+                        cache.set(bag_identificatie, gevonden[bag_identificatie])
+
+        for _, eenheid, rapport in te_verrijken:
+            bag_identificatie = _bag_identificatie(eenheid)
+            if bag_identificatie is None:
+                logger.warning(
+                    f"Eenheid ({eenheid.id}): Geen bag_identificatie gevonden"
+                )
+                continue
+
+            if bag_identificatie in fouten:
+                rapport.fouten.append(f"monumenten: {fouten[bag_identificatie]}")
+                continue
+
+            monumenten = gevonden.get(bag_identificatie)
+            if monumenten is None and cache is not None:
+                monumenten = cache.get(bag_identificatie)
+            if monumenten is None:
+                continue
+
+            eenheid.monumenten = list(monumenten)
+            rapport.aangevuld.append("monumenten")
+
+    def _verrijk_woonplaatsen(
+        self,
+        eenheden: list[EenhedenEenheid],
+        rapporten: list[Verrijkingsrapport],
+        budgetten: list[Tijdsbudget | None],
+    ) -> None:
+        te_verrijken = [
+            (eenheid.id, eenheid.adres, rapport, budgetten[index])
+            for index, (eenheid, rapport) in enumerate(zip(eenheden, rapporten))
+            if eenheid.woningwaarderingstelsel
+            != Woningwaarderingstelsel.zelfstandige_woonruimten
+            and isinstance(eenheid.adres, EenhedenEenheidadres)
+            and (
+                eenheid.adres.woonplaats is None
+                or eenheid.adres.woonplaats.naam is None
+            )
+            and eenheid.adres.postcode
+            and eenheid.adres.huisnummer
+        ]
+        if not te_verrijken:
+            return
+
+        resolver = (
+            self.woonplaats_resolver
+            if self.woonplaats_resolver is not None
+            else get_woonplaats_resolver()
+        )
+
+        def verrijk_woonplaats(
+            eenheid_id: str | None,
+            adres: EenhedenEenheidadres,
+            rapport: Verrijkingsrapport,
+            budget: Tijdsbudget | None,
+        ) -> None:
+            if budget is None:
+                budget = self._start_budget()
+            if budget is not None and budget.is_verstreken():
+                rapport.fouten.append(f"woonplaats: {self.TIJDSBUDGET_VERSTREKEN}")
+                return
+            try:
+                with tijdsbudget(budget):
+                    woonplaats = utils.get_woonplaats(adres, resolver=resolver)
+            except TijdsbudgetVerstreken:
+                rapport.fouten.append(f"woonplaats: {self.TIJDSBUDGET_VERSTREKEN}")
+                return
+            except (OpzoekingOvergeslagen, ValueError) as e:
+                warnings.warn(
+                    f"Eenheid ({eenheid_id}): Woonplaats kon niet worden opgehaald: {e}",
+                    UserWarning,
+                )
+                rapport.fouten.append(f"woonplaats: {e}")
+                return
+            if woonplaats is not None:
+                rapport.aangevuld.append("woonplaats")
+
+        if len(te_verrijken) == 1 or self.max_workers == 1:
+            for eenheid_id, adres, rapport, budget in te_verrijken:
+                verrijk_woonplaats(eenheid_id, adres, rapport, budget)
+            return
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for future in [
+                executor.submit(
+                    contextvars.copy_context().run,
+                    verrijk_woonplaats,
+                    eenheid_id,
+                    adres,
+                    rapport,
+                    budget,
+                )
+                for eenheid_id, adres, rapport, budget in te_verrijken
+            ]:
+                future.result()
+
+
+def verrijk_eenheden(
+    eenheden: Iterable[EenhedenEenheid],
+    verrijking: Verrijking | None = None,
+) -> list[Verrijkingsrapport]:
+    """
+    Verrijkt eenheden met ontbrekende monumentale statussen en woonplaatsen.
+
+    Args:
+        eenheden (Iterable[EenhedenEenheid]): De te verrijken eenheden.
+        verrijking (Verrijking | None, optional): De te gebruiken verrijking.
+            Standaard wordt een verrijking met de standaardinstellingen gebruikt.
+
+    Returns:
+        list[Verrijkingsrapport]: Per eenheid wat er is aangevuld.
+    """
+    return (verrijking or Verrijking()).verrijk_batch(eenheden)